@@ -0,0 +1,182 @@
+#benchmark of the solver engines on the corpora in benchmarks/corpora. Run it by
+#"python benchmarks/benchmark.py --output results.json" and compare later runs with "--baseline results.json",
+#the exit status is 1 if an engine got slower than the threshold on a corpus or solved a sudoku wrong,
+#or if importing sudokuSolver takes longer than the import-budget
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+__REPOSITORY__ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, __REPOSITORY__)
+
+import sudokuCli
+import sudokuSolver
+
+__CORPORA__ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+#number of solutions of each sudoku of a corpus
+__SOLUTIONS__ = {"easy": 1, "hard": 1, "seventeen": 1, "unsolveable": 0, "multiple": 2}
+
+
+def main(argv : list = None) -> int:
+    """runs the benchmark
+
+    Args:
+        argv list(str) : are the arguments without the program name or None to take sys.argv
+
+    Returns:
+        int : is the exit status
+    """
+    parser = argparse.ArgumentParser(description="benchmark of the solver engines")
+    parser.add_argument("--engines", default="cnf,bitmask,dlx", help="comma-separated engines of solveSudoku (default cnf,bitmask,dlx)")
+    parser.add_argument("--corpora", default=",".join(__SOLUTIONS__), help="comma-separated corpora (default all)")
+    parser.add_argument("--repeat", type=int, default=1, help="how often each sudoku is solved, the fastest time counts (default 1)")
+    parser.add_argument("--output", help="file to write the results to as JSON")
+    parser.add_argument("--baseline", help="JSON-file of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown of p50 or sudokus/s counted as regression (default 0.2)")
+    parser.add_argument("--importBudget", type=float, default=0.05, help="seconds importing sudokuSolver may take at most (default 0.05)")
+    arguments = parser.parse_args(argv)
+
+    results = {
+        "python": platform.python_version(),
+        "importSeconds": __measureImport__(),
+        "engines": dict()
+    }
+    wrong = 0
+    for engine in arguments.engines.split(","):
+        results["engines"][engine] = dict()
+        for corpus in arguments.corpora.split(","):
+            result = __runCorpus__(engine, corpus, arguments.repeat)
+            results["engines"][engine][corpus] = result
+            wrong += result["wrong"]
+            print(engine.ljust(8) + corpus.ljust(12) + str(result["sudokus"]).rjust(5) + " sudokus"
+                  + "  p50 " + __formatSeconds__(result["p50"]) + "  p95 " + __formatSeconds__(result["p95"]) + "  p99 " + __formatSeconds__(result["p99"])
+                  + "  " + format(result["sudokusPerSecond"], ".1f").rjust(8) + " sudokus/s"
+                  + "  peak " + format(result["peakBytes"] / 1024, ".0f").rjust(6) + " KiB"
+                  + ("  nodes " + str(result["decisions"]) if result["decisions"] is not None else "")
+                  + ("  WRONG " + str(result["wrong"]) if result["wrong"] > 0 else ""))
+    print("import sudokuSolver: " + __formatSeconds__(results["importSeconds"]))
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+    regressions = list()
+    if results["importSeconds"] > arguments.importBudget:
+        regressions.append("import sudokuSolver: " + __formatSeconds__(results["importSeconds"]) + " over the budget of " + __formatSeconds__(arguments.importBudget).strip())
+    if arguments.baseline is not None:
+        with open(arguments.baseline, "r") as file:
+            regressions += __compare__(json.load(file), results, arguments.threshold)
+    for regression in regressions:
+        print("REGRESSION " + regression)
+    return 1 if wrong > 0 or len(regressions) > 0 else 0
+
+def __runCorpus__(engine : str, corpus : str, repeat : int) -> dict:
+    """solves the sudokus of a corpus
+
+    Args:
+        engine str : is the engine of solveSudoku
+        corpus str : is the name of the corpus
+        repeat int : is how often each sudoku is solved
+
+    Returns:
+        dict : are the latencies, the speed, the peak memory, the search-statistics and the number of wrong results
+    """
+    with open(os.path.join(__CORPORA__, corpus + ".txt"), "r") as file:
+        sudokus = [sudokuCli.__parseLine__(line.strip()) for line in file if not line.startswith("#") and len(line.strip()) > 0]
+
+    #first solve is not measured, it builds the shared structures of the engine
+    sudokuSolver.solveSudoku(sudokus[0], engine)
+    latencies = list()
+    wrong = 0
+    for sudoku in sudokus:
+        best = None
+        for _ in range(0, repeat):
+            start = time.perf_counter()
+            solution = sudokuSolver.solveSudoku(sudoku, engine)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        latencies.append(best)
+        if (len(solution) > 0) != (__SOLUTIONS__.get(corpus, 1) > 0) or (len(solution) > 0 and not sudokuSolver.isValidSolution(sudoku, solution)):
+            wrong += 1
+
+    #memory and search-nodes are measured in a separate run, since tracing slows down solving
+    stats = sudokuSolver.SolveStats() if engine == "cnf" else None
+    tracemalloc.start()
+    for sudoku in sudokus:
+        sudokuSolver.solveSudoku(sudoku, engine, stats=stats)
+    peakBytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "sudokus": len(sudokus),
+        "p50": __percentile__(latencies, 50),
+        "p95": __percentile__(latencies, 95),
+        "p99": __percentile__(latencies, 99),
+        "sudokusPerSecond": len(latencies) / sum(latencies) if sum(latencies) > 0 else 0.0,
+        "peakBytes": peakBytes,
+        #search-statistics are only collected by the cnf-engine
+        "decisions": stats.decisions if stats is not None else None,
+        "backtracks": stats.backtracks if stats is not None else None,
+        "propagations": stats.propagations if stats is not None else None,
+        "wrong": wrong
+    }
+
+def __percentile__(values : list, percent : float) -> float:
+    """gets a percentile by the nearest-rank method
+
+    Args:
+        values list(float) : are the sorted values
+        percent float : is the percentile
+
+    Returns:
+        float : is the smallest value, which is at least as big as percent percent of the values
+    """
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+def __measureImport__() -> float:
+    """measures the time for importing sudokuSolver in a new interpreter, without the start of the interpreter itself
+
+    Returns:
+        float : are the seconds
+    """
+    code = "import time; start = time.perf_counter(); import sudokuSolver; print(time.perf_counter() - start)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=__REPOSITORY__, capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+def __compare__(baseline : dict, results : dict, threshold : float) -> list:
+    """compares the results with the results of an earlier run
+
+    Args:
+        baseline dict : are the earlier results
+        results dict : are the current results
+        threshold float : is the relative slowdown counted as regression
+
+    Returns:
+        list(str) : are the descriptions of the regressions
+    """
+    regressions = list()
+    if results["importSeconds"] > baseline["importSeconds"] * (1 + threshold):
+        regressions.append("import sudokuSolver: " + __formatSeconds__(baseline["importSeconds"]) + " -> " + __formatSeconds__(results["importSeconds"]))
+    for engine, corpora in results["engines"].items():
+        for corpus, result in corpora.items():
+            old = baseline["engines"].get(engine, dict()).get(corpus)
+            if old is None:
+                continue
+            if result["p50"] > old["p50"] * (1 + threshold):
+                regressions.append(engine + " " + corpus + " p50: " + __formatSeconds__(old["p50"]) + " -> " + __formatSeconds__(result["p50"]))
+            if result["sudokusPerSecond"] * (1 + threshold) < old["sudokusPerSecond"]:
+                regressions.append(engine + " " + corpus + " sudokus/s: " + format(old["sudokusPerSecond"], ".1f") + " -> " + format(result["sudokusPerSecond"], ".1f"))
+    return regressions
+
+def __formatSeconds__(seconds : float) -> str:
+    return format(seconds * 1000, ".2f").rjust(8) + "ms"
+
+if __name__ == '__main__':
+    sys.exit(main())
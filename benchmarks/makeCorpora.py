@@ -0,0 +1,99 @@
+#writes the sudoku-corpora of the benchmarks into benchmarks/corpora, one sudoku per line (see sudokuCli).
+#The generated sudokus depend only on the seeds, so running it again writes the same files
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudokuGenerator
+import sudokuSolver
+
+#well-known hard sudokus (AI Escargot, Easter Monster, Platinum Blonde, Golden Nugget, Inkala 2012, ...)
+__HARD__ = [
+    "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+    "100000002090400050006000700050903000000070000000850040700000600030009080002000001",
+    "000000012000000003002300400001800005060070800000009000008500000900040500470006000",
+    "000000039000001005003050800008090006070002000100400000009080050020000600400700000",
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    "000000000000003085001020000000507000004000100090000000500000073002010000000040009",
+    "120400300300010050006000100700090000040603000003002000500080700007000005000000098",
+    "400000805030000000000700000020000060000080400000010000000603070500200000104000000",
+    "520006000000000701300000000000400800600000050000000000041800000000030020008700000",
+    "600000803040700000000000000000504070300200000106000000020000050000080600000010000",
+    "480300000000000071020000000705000060000200800000000000001076000300000400000050000",
+    "000014000030000200070000000000900030601000000000000080200000104000050600000708000",
+]
+
+#sudokus with 17 set fields, the fewest a sudoku with exactly one solution can have
+__SEVENTEEN__ = [
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+    "000000010400000000020000000000050604008000300001090000300400200050100000000807000",
+    "000000012000035000000600070700000300000400800100000000000120000080000040050000600",
+    "000000012003600000000007000410020000000500300700000600280000040000300500000000000",
+    "000000012008030000000000040120500000000004700060000000507000300000620000000100000",
+    "000000012040050000000009000070600400000100000000000050000087500601000300200000000",
+    "000000012050400000000000030700600400001000000000080000920000800000510700000003000",
+    "000000012300000060000040000900000500000001070020000000000350400001400800060000000",
+    "000000012400090000000000050070200000600000400000108000018000000000030700502000000",
+    "000000012500008000000700000600120000700000450000030000030000800000500700020000000",
+    "000000012700060000000000050080200000600000400000109000019000000000030800502000000",
+    "000000013000030080070000000000206000030000900000010000600500204000400700100000000",
+    "000000013000200000000000080000760200008000400010000000200000750600340000000008000",
+    "000000013000500070000802000000400900107000000000000200890000050040000600000010000",
+    "000000013000700060000508000000400800106000000000000200740000050020000400000010000",
+]
+
+
+def main() -> None:
+    """writes the corpora easy, hard, seventeen, unsolveable and multiple
+
+    Returns:
+        None
+    """
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+    easy = [__toLine__(sudoku) for sudoku in sudokuGenerator.generatePuzzles(200, clues=36, seed=1)]
+
+    #a set field with a wrong number, which is not used in its row, collum and block
+    generator = random.Random(2)
+    unsolveable = list()
+    for sudoku in sudokuGenerator.generatePuzzles(50, seed=3):
+        solution = sudokuSolver.solveSudoku(sudoku)
+        row, col = generator.choice([(row, col) for row in range(0, 9) for col in range(0, 9) if sudoku[row][col] == 0])
+        used = set(sudoku[row]) | {line[col] for line in sudoku} | {sudoku[r][c] for r in range(row - row % 3, row - row % 3 + 3) for c in range(col - col % 3, col - col % 3 + 3)}
+        wrong = [n for n in range(1, 10) if n not in used and n != solution[row][col]]
+        if len(wrong) > 0:
+            sudoku[row][col] = generator.choice(wrong)
+            unsolveable.append(__toLine__(sudoku))
+
+    #fields removed until there is a second solution
+    multiple = list()
+    for sudoku in sudokuGenerator.generatePuzzles(50, seed=4):
+        fields = [(row, col) for row in range(0, 9) for col in range(0, 9) if sudoku[row][col] != 0]
+        generator.shuffle(fields)
+        for row, col in fields:
+            sudoku[row][col] = 0
+            if sudokuSolver.countSolutions(sudoku, 2, "dlx") > 1:
+                break
+        multiple.append(__toLine__(sudoku))
+
+    corpora = {"easy": easy, "hard": __HARD__, "seventeen": __SEVENTEEN__, "unsolveable": unsolveable, "multiple": multiple}
+    for name, lines in corpora.items():
+        with open(os.path.join(directory, name + ".txt"), "w") as file:
+            file.write("#" + name + " sudokus of the benchmarks, written by benchmarks/makeCorpora.py\n")
+            file.writelines(line + "\n" for line in lines)
+
+def __toLine__(sudoku : list) -> str:
+    """gets the line of a sudoku
+
+    Args:
+        sudoku list(list(int)) : is the sudoku
+
+    Returns:
+        str : is the line
+    """
+    return "".join(str(n) for row in sudoku for n in row)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+#asyncio-interface of the solver. The sudokus are solved in a bounded pool of worker processes, so the event loop is
+#not blocked. Each solve in progress owns a slot of a shared array of cancel-flags, which the cnf-engine of its worker
+#checks before each assumption (see sudokuSolver.solveSudoku), so cancelling the asyncio-task also stops the search
+
+import asyncio
+import collections
+import concurrent.futures
+import multiprocessing
+import threading
+
+import sudokuPool
+import sudokuSolver
+
+#pool of solveAsync and solveManyAsync, it is started on their first call by __getSharedPool__
+__sharedPool__ = None
+#cancel-flags of the worker process, set by __initWorker__
+__cancelFlags__ = None
+
+
+class AsyncSolverPool:
+    """pool of worker processes solving sudokus for asyncio-tasks, call close() when done.
+    At most maxPending sudokus are solved or queued at once, further solves wait until one of them is done.
+    Concurrent solves of the same sudoku with the same arguments share one solve in a worker.
+    The pool is bound to the event loop using it, it can be used by another event loop only when no solve is in progress
+    """
+
+    def __init__(self, workers : int = None, maxPending : int = None):
+        """starts the worker processes
+
+        Args:
+            workers int : is the number of worker processes or None for one per cpu
+            maxPending int : is the number of sudokus solved or queued at once or None for 4 per worker
+        """
+        self.workers = workers if workers is not None else multiprocessing.cpu_count()
+        self.maxPending = maxPending if maxPending is not None else 4 * self.workers
+        #cancel-flag of each slot, a slot is owned by one solve from its submission until its worker is done
+        self.__cancelFlags__ = multiprocessing.RawArray("b", self.maxPending)
+        self.__freeSlots__ = list(range(0, self.maxPending))
+        #guards __freeSlots__, which get given back by the threads of the executor
+        self.__lock__ = threading.Lock()
+        self.__packedCnf__ = sudokuPool.__packCnf__(sudokuSolver.__getGeneralCnf__())
+        self.__executor__ = self.__startExecutor__()
+        self.__loop__ = None
+        self.__semaphore__ = None
+        #shared solves by their key as lists [task, number of waiting callers]
+        self.__pending__ = dict()
+
+    def __startExecutor__(self) -> concurrent.futures.ProcessPoolExecutor:
+        """starts the worker processes
+
+        Returns:
+            concurrent.futures.ProcessPoolExecutor : is the executor of the workers
+        """
+        return concurrent.futures.ProcessPoolExecutor(self.workers, initializer=__initWorker__, initargs=(self.__cancelFlags__, self.__packedCnf__))
+
+    def __bindLoop__(self) -> None:
+        """binds the pool to the running event loop, the semaphore of asyncio can only be used by one event loop
+
+        Returns:
+            None
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self.__loop__:
+            return
+        if len(self.__pending__) > 0:
+            raise RuntimeError("pool is in use by another event loop")
+        with self.__lock__:
+            self.__semaphore__ = asyncio.Semaphore(len(self.__freeSlots__))
+            self.__loop__ = loop
+
+    def close(self) -> None:
+        """stops all workers, solves in progress are cancelled
+
+        Returns:
+            None
+        """
+        for slot in range(0, self.maxPending):
+            self.__cancelFlags__[slot] = 1
+        self.__executor__.shutdown(wait=True, cancel_futures=True)
+
+    async def solve(self, sudoku : list, engine : str = "cnf", timeout : float = None, maxNodes : int = None) -> list:
+        """solves a sudoku in a worker
+
+        Args:
+            sudoku list(list(int)) : is the sudoku (see sudokuSolver.solveSudoku)
+            engine str : is the engine to use (see sudokuSolver.solveSudoku), only the search of the cnf-engine is stopped
+                when the solve gets cancelled, the other engines finish their search in the worker
+            timeout float : is the wall-clock time in seconds after which the cnf-engine gives up or None
+            maxNodes int : is the number of assumptions after which the cnf-engine gives up or None
+
+        Returns:
+            list(list(int)) : is the solution, an empty list or None if the cnf-engine gave up (see sudokuSolver.solveSudoku)
+        """
+        self.__bindLoop__()
+        sudoku = sudokuSolver.__toRows__(sudoku)
+        key = (engine, timeout, maxNodes, tuple(n for row in sudoku for n in row))
+        shared = self.__pending__.get(key)
+        if shared is None:
+            shared = [asyncio.ensure_future(self.__solveInWorker__(sudoku, engine, timeout, maxNodes)), 0]
+            self.__pending__[key] = shared
+
+            def forget(task : asyncio.Task) -> None:
+                """removes a finished shared solve, so later calls solve again
+
+                Args:
+                    task asyncio.Task : is the finished solve
+
+                Returns:
+                    None
+                """
+                if self.__pending__.get(key) is shared:
+                    del self.__pending__[key]
+
+            shared[0].add_done_callback(forget)
+
+        shared[1] += 1
+        try:
+            #the shared solve is only cancelled when all its callers are cancelled
+            return await asyncio.shield(shared[0])
+        except asyncio.CancelledError:
+            shared[1] -= 1
+            if shared[1] == 0:
+                #later calls must not wait for the cancelled solve
+                if self.__pending__.get(key) is shared:
+                    del self.__pending__[key]
+                shared[0].cancel()
+            raise
+
+    async def __solveInWorker__(self, sudoku : list, engine : str, timeout : float, maxNodes : int) -> list:
+        """waits for a free slot and solves a sudoku in a worker
+
+        Args:
+            sudoku list(list(int)) : is the sudoku
+            engine str : is the engine to use
+            timeout float : is the wall-clock time in seconds after which the cnf-engine gives up or None
+            maxNodes int : is the number of assumptions after which the cnf-engine gives up or None
+
+        Returns:
+            list(list(int)) : is the solution (see solve)
+        """
+        await self.__semaphore__.acquire()
+        with self.__lock__:
+            slot = self.__freeSlots__.pop()
+        self.__cancelFlags__[slot] = 0
+
+        def release(future : concurrent.futures.Future) -> None:
+            """gives the slot back when the worker is done, a cancelled solve keeps it until its search stopped
+
+            Args:
+                future concurrent.futures.Future : is the finished solve
+
+            Returns:
+                None
+            """
+            with self.__lock__:
+                self.__freeSlots__.append(slot)
+                loop, semaphore = self.__loop__, self.__semaphore__
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                #event loop is closed, the semaphore of the next one counts the slot already
+                pass
+
+        executor = self.__executor__
+        try:
+            try:
+                future = executor.submit(__solveTask__, slot, sudoku, engine, timeout, maxNodes)
+            except concurrent.futures.process.BrokenProcessPool:
+                executor = self.__restart__(executor)
+                future = executor.submit(__solveTask__, slot, sudoku, engine, timeout, maxNodes)
+        except BaseException:
+            release(None)
+            raise
+        future.add_done_callback(release)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            #stops the search of the worker if it already started, a finished worker gave its slot back already
+            if not future.done():
+                self.__cancelFlags__[slot] = 1
+            raise
+        except concurrent.futures.process.BrokenProcessPool:
+            #a worker crashed, the next solves get new workers
+            self.__restart__(executor)
+            raise
+
+    def __restart__(self, broken : concurrent.futures.ProcessPoolExecutor) -> concurrent.futures.ProcessPoolExecutor:
+        """replaces the executor after a worker crashed, if it was not replaced already
+
+        Args:
+            broken concurrent.futures.ProcessPoolExecutor : is the executor with the crashed worker
+
+        Returns:
+            concurrent.futures.ProcessPoolExecutor : is the new executor
+        """
+        if self.__executor__ is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.__executor__ = self.__startExecutor__()
+        return self.__executor__
+
+    async def solveMany(self, sudokus, engine : str = "cnf", timeout : float = None, maxNodes : int = None) -> list:
+        """solves many sudokus in the workers, not more than maxPending of them are read ahead
+
+        Args:
+            sudokus iterable(list(list(int))) : are the sudokus to solve (see sudokuSolver.solveSudoku)
+            engine str : is the engine to use (see solve)
+            timeout float : is the wall-clock time in seconds after which the cnf-engine gives up on a sudoku or None
+            maxNodes int : is the number of assumptions after which the cnf-engine gives up on a sudoku or None
+
+        Returns:
+            list(list(list(int))) : are the solutions in the order of the sudokus (see solve)
+        """
+        solutions = list()
+        window = collections.deque()
+        try:
+            for sudoku in sudokus:
+                if len(window) >= self.maxPending:
+                    solutions.append(await window.popleft())
+                window.append(asyncio.ensure_future(self.solve(sudoku, engine, timeout, maxNodes)))
+            while len(window) > 0:
+                solutions.append(await window.popleft())
+        finally:
+            #cancelled or failed, the remaining solves are stopped
+            for task in window:
+                task.cancel()
+        return solutions
+
+async def solveAsync(sudoku : list, engine : str = "cnf", timeout : float = None, maxNodes : int = None, pool : AsyncSolverPool = None) -> list:
+    """solves a sudoku in a worker process without blocking the event loop, cancelling the awaiting task stops the search
+
+    Args:
+        sudoku list(list(int)) : is the sudoku (see sudokuSolver.solveSudoku)
+        engine str : is the engine to use (see AsyncSolverPool.solve)
+        timeout float : is the wall-clock time in seconds after which the cnf-engine gives up or None
+        maxNodes int : is the number of assumptions after which the cnf-engine gives up or None
+        pool AsyncSolverPool : is the pool to use or None for a pool shared by all callers, which has one worker per cpu
+
+    Returns:
+        list(list(int)) : is the solution, an empty list or None if the cnf-engine gave up (see sudokuSolver.solveSudoku)
+    """
+    return await (pool or __getSharedPool__()).solve(sudoku, engine, timeout, maxNodes)
+
+async def solveManyAsync(sudokus, engine : str = "cnf", timeout : float = None, maxNodes : int = None, pool : AsyncSolverPool = None) -> list:
+    """solves many sudokus in worker processes without blocking the event loop
+
+    Args:
+        sudokus iterable(list(list(int))) : are the sudokus to solve (see sudokuSolver.solveSudoku)
+        engine str : is the engine to use (see AsyncSolverPool.solve)
+        timeout float : is the wall-clock time in seconds after which the cnf-engine gives up on a sudoku or None
+        maxNodes int : is the number of assumptions after which the cnf-engine gives up on a sudoku or None
+        pool AsyncSolverPool : is the pool to use or None for the pool shared by all callers (see solveAsync)
+
+    Returns:
+        list(list(list(int))) : are the solutions in the order of the sudokus (see solveAsync)
+    """
+    return await (pool or __getSharedPool__()).solveMany(sudokus, engine, timeout, maxNodes)
+
+def __getSharedPool__() -> AsyncSolverPool:
+    """gets the pool shared by solveAsync and solveManyAsync, it is started on the first call
+
+    Returns:
+        AsyncSolverPool : is the shared pool
+    """
+    global __sharedPool__
+    if __sharedPool__ is None:
+        __sharedPool__ = AsyncSolverPool()
+    return __sharedPool__
+
+class __SlotFlag__:
+    """cancel-token of sudokuSolver.solveSudoku reading the cancel-flag of a slot in a worker process"""
+
+    def __init__(self, slot : int):
+        self.slot = slot
+
+    def is_set(self) -> bool:
+        return __cancelFlags__[self.slot] != 0
+
+def __initWorker__(cancelFlags, packedCnf : bytes) -> None:
+    """initializes a worker process
+
+    Args:
+        cancelFlags multiprocessing.RawArray : are the cancel-flags of the slots
+        packedCnf bytes : is the general sudoku-cnf packed by sudokuPool.__packCnf__
+
+    Returns:
+        None
+    """
+    global __cancelFlags__
+    __cancelFlags__ = cancelFlags
+    sudokuSolver.sudokuGeneral = sudokuPool.__unpackCnf__(packedCnf)
+
+def __solveTask__(slot : int, sudoku : list, engine : str, timeout : float, maxNodes : int) -> list:
+    """solves a sudoku in a worker process
+
+    Args:
+        slot int : is the slot of the solve, its cancel-flag stops the search of the cnf-engine
+        sudoku list(list(int)) : is the sudoku
+        engine str : is the engine to use
+        timeout float : is the wall-clock time in seconds after which the cnf-engine gives up or None
+        maxNodes int : is the number of assumptions after which the cnf-engine gives up or None
+
+    Returns:
+        list(list(int)) : is the solution (see sudokuSolver.solveSudoku)
+    """
+    if __cancelFlags__[slot] != 0:
+        return None
+    if engine != "cnf":
+        return sudokuSolver.solveSudoku(sudoku, engine, timeout=timeout, maxNodes=maxNodes)
+    return sudokuSolver.solveSudoku(sudoku, engine, timeout=timeout, maxNodes=maxNodes, cancel=__SlotFlag__(slot))
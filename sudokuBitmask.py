@@ -0,0 +1,166 @@
+#solver engine keeping the possible numbers of each field as bitmask, bit n - 1 of a mask is set if number n is possible.
+#After each allocation naked and hidden singles are propagated. It is selected by solveSudoku(sudoku, engine="bitmask")
+
+import math
+
+#tables of each block-size, see __getTables__
+__tables__ = dict()
+
+
+def solveSudokuBitmask(sudoku : list) -> list:
+    """solve sudoku with backtracking over candidate bitmasks
+
+    Args:
+        sudoku list(list(int)) : is a 2-dimensional array containing N lists with N integers, representing each sudoku-field. N is the square of the block-size, e.g. 9, 16 or 25. If an int is 0, field is not set
+
+    Returns:
+        list(list(int)) : returns a solved sudoku game or an empty list (if its not solveable)
+    """
+    size = len(sudoku)
+    for solution in __searchBitmask__(sudoku):
+        return [solution[row * size: row * size + size] for row in range(0, size)]
+    return []
+
+def __getTables__(boxSize : int) -> tuple:
+    """gets the lookup-tables of a block-size, they are built only once
+
+    Args:
+        boxSize int : is the block-size
+
+    Returns:
+        tuple(list(int), list(list(int)), list(list(int))) : is the number of set bits for each mask (or None if there are
+        too many masks for a table), the indices of the other fields in the row, collum and block of each field and
+        the field-indices of each row, collum and block
+    """
+    tables = __tables__.get(boxSize)
+    if tables is None:
+        size = boxSize * boxSize
+        blockOfField = [(field // (size * boxSize)) * boxSize + (field % size) // boxSize for field in range(0, size * size)]
+        bitCount = [bin(mask).count("1") for mask in range(0, 1 << size)] if size <= 16 else None
+        units = [[row * size + col for col in range(0, size)] for row in range(0, size)]
+        units += [[row * size + col for row in range(0, size)] for col in range(0, size)]
+        units += [[field for field in range(0, size * size) if blockOfField[field] == block] for block in range(0, size)]
+        peers = [sorted({peer for unit in units if field in unit for peer in unit} - {field}) for field in range(0, size * size)]
+        tables = __tables__.setdefault(boxSize, (bitCount, peers, units))
+    return tables
+
+def __propagate__(candidates : list, fields : list, queue : list, peers : list, units : list) -> bool:
+    """sets the fields of queue and everything following from them by naked singles (a field with one candidate left)
+    and hidden singles (a number with one field left in a row, collum or block)
+
+    Args:
+        candidates list(int) : is the candidate-bitmask of each field, a set field has the bit of its number
+        fields list(int) : is the number of each field or 0 if it is not set
+        queue list(tuple(int, int)) : are the fields to set with the bitmasks of their numbers, it gets emptied
+        peers list(list(int)) : are the indices of the other fields in the row, collum and block of each field
+        units list(list(int)) : are the field-indices of each row, collum and block
+
+    Returns:
+        bool : is False if a field or a number has no possibility left (conflict) and True otherwise
+    """
+    while True:
+        #naked singles
+        while len(queue) > 0:
+            field, bit = queue.pop()
+            if bit & (bit - 1) or not candidates[field] & bit:
+                #two numbers for one field or number not possible anymore
+                return False
+            if fields[field] != 0:
+                continue
+            fields[field] = bit.bit_length()
+            candidates[field] = bit
+            for peer in peers[field]:
+                mask = candidates[peer]
+                if mask & bit:
+                    mask ^= bit
+                    if mask == 0:
+                        #no number left or number used twice
+                        return False
+                    candidates[peer] = mask
+                    if mask & (mask - 1) == 0:
+                        queue.append((peer, mask))
+
+        #hidden singles
+        for unit in units:
+            once = 0
+            twice = 0
+            for field in unit:
+                mask = candidates[field]
+                twice |= once & mask
+                once |= mask
+            if once != candidates[-1]:
+                #a number has no field left in the unit
+                return False
+            hidden = once & ~twice
+            if hidden:
+                for field in unit:
+                    if candidates[field] & hidden and fields[field] == 0:
+                        queue.append((field, candidates[field] & hidden))
+        if len(queue) == 0:
+            return True
+
+def __searchBitmask__(sudoku : list):
+    """searches all solutions of a sudoku, propagating naked and hidden singles after each allocation
+    and always allocating the unset field with the least possible numbers remaining next
+
+    Args:
+        sudoku list(list(int)) : is the given sudoku (see solveSudokuBitmask)
+
+    Yields:
+        list(int) : is each solution as N * N fields in row-major order
+    """
+    size = len(sudoku)
+    boxSize = math.isqrt(size)
+    if size == 0 or boxSize * boxSize != size or any(len(row) != size for row in sudoku):
+        raise ValueError("sudoku is not a square of N rows with N fields, N being a square number")
+    bitCount, peers, units = __getTables__(boxSize)
+    allNumbers = (1 << size) - 1
+
+    #the last entry of candidates holds all numbers for the check of the hidden singles
+    candidates = [allNumbers] * (size * size + 1)
+    fields = [0] * (size * size)
+
+    #read in given sudoku
+    queue = list()
+    for row in range(0, size):
+        for col in range(0, size):
+            n = sudoku[row][col]
+            if n != 0:
+                if not 0 < n <= size:
+                    raise ValueError("field is not between 0 and " + str(size) + ": " + str(n))
+                queue.append((row * size + col, 1 << (n - 1)))
+
+    #states still to search as tuples of candidates, fields and the allocations to propagate, each state owns its lists
+    stack = [(candidates, fields, queue)]
+    while len(stack) > 0:
+        candidates, fields, queue = stack.pop()
+        if not __propagate__(candidates, fields, queue, peers, units):
+            #you made a wrong assumption
+            continue
+
+        #get field with the least possible numbers remaining
+        bestField = -1
+        bestCount = size + 1
+        for field in range(0, size * size):
+            if fields[field] == 0:
+                mask = candidates[field]
+                count = bitCount[mask] if bitCount is not None else bin(mask).count("1")
+                if count < bestCount:
+                    bestField = field
+                    bestCount = count
+                    if count == 2:
+                        break
+        if bestField < 0:
+            yield fields
+            continue
+
+        #try the lowest number first, the last state pushed gets the lists of this state
+        bits = list()
+        mask = candidates[bestField]
+        while mask:
+            bit = mask & -mask
+            bits.append(bit)
+            mask ^= bit
+        for bit in reversed(bits[1:]):
+            stack.append((candidates.copy(), fields.copy(), [(bestField, bit)]))
+        stack.append((candidates, fields, [(bestField, bits[0])]))
@@ -0,0 +1,267 @@
+#cache of solutions in front of sudokuSolver.solveSudoku. Sudokus are looked up in a canonical form, so a sudoku
+#transformed by the symmetries of sudokus (relabeling the numbers, permuting the rows of a band or the collums of a stack,
+#permuting the bands or the stacks and transposing) hits the solution cached for the original one
+
+import collections
+import dbm
+import itertools
+import math
+import sqlite3
+
+import sudokuSolver
+
+#characters of the numbers in the keys and solutions of the cache
+__DIGITS__ = "0123456789abcdefghijklmnopqrstuvwxyz"
+#if the invariants leave more orderings of the rows and collums than this, the first one is taken instead of the smallest
+#canonical form. Such sudokus (e.g. nearly empty ones) then only hit the cache for some of their transformations
+__MAX_ORDERINGS__ = 64
+
+
+class SolutionCache:
+    """cache of solutions with LRU-eviction and an optional on-disk store, solutions of not solveable sudokus are cached too.
+    Solutions of sudokus with more than one solution are cached too, so a transformed one gets the transformed solution of the first one
+
+    Attributes:
+        hits int : is the number of sudokus found in the memory or in the store
+        misses int : is the number of sudokus which were solved
+    """
+
+    def __init__(self, maxSize : int = 4096, store = None, engine : str = "cnf"):
+        """creates an empty cache
+
+        Args:
+            maxSize int : is the number of solutions kept in memory, the least recently used one is evicted first
+            store SqliteStore|DbmStore : is the on-disk store (or any object with get(key) and store[key] = solution) or None
+            engine str : is the engine solving the sudokus not cached yet (see sudokuSolver.solveSudoku)
+        """
+        self.maxSize = maxSize
+        self.store = store
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        #solutions in canonical form by the canonical sudoku, the least recently used one first
+        self.__solutions__ = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__solutions__)
+
+    def solve(self, sudoku : list) -> list:
+        """solve sudoku or get its solution from the cache
+
+        Args:
+            sudoku list(list(int)) : is the sudoku (see sudokuSolver.solveSudoku)
+
+        Returns:
+            list(list(int)) : returns a solved sudoku game or an empty list (if its not solveable)
+        """
+        sudoku = sudokuSolver.__toRows__(sudoku)
+        boxSize = sudokuSolver.__boxSizeOf__(sudoku)
+        key, transform = __canonicalForm__(sudoku, boxSize)
+        solution = self.__solutions__.get(key)
+        if solution is not None:
+            self.__solutions__.move_to_end(key)
+            self.hits += 1
+        else:
+            if self.store is not None:
+                solution = self.store.get(key)
+                if isinstance(solution, bytes):
+                    solution = solution.decode("ascii")
+            if solution is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                size = len(sudoku)
+                canonical = [[__DIGITS__.index(key[row * size + col]) for col in range(0, size)] for row in range(0, size)]
+                solved = sudokuSolver.solveSudoku(canonical, self.engine)
+                solution = "".join(__DIGITS__[n] for row in solved for n in row)
+                if self.store is not None:
+                    self.store[key] = solution
+            self.__solutions__[key] = solution
+            if len(self.__solutions__) > self.maxSize:
+                self.__solutions__.popitem(last=False)
+        if solution == "":
+            return []
+        return __fromCanonicalForm__([__DIGITS__.index(n) for n in solution], transform)
+
+    def close(self) -> None:
+        """closes the store
+
+        Returns:
+            None
+        """
+        if self.store is not None:
+            self.store.close()
+
+class SqliteStore:
+    """on-disk store of a SolutionCache in a sqlite-database"""
+
+    def __init__(self, path : str):
+        """opens or creates the database
+
+        Args:
+            path str : is the path of the database-file
+        """
+        self.__connection__ = sqlite3.connect(path)
+        self.__connection__.execute("CREATE TABLE IF NOT EXISTS solutions (sudoku TEXT PRIMARY KEY, solution TEXT NOT NULL)")
+        self.__connection__.commit()
+
+    def get(self, key : str) -> str:
+        row = self.__connection__.execute("SELECT solution FROM solutions WHERE sudoku = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def __setitem__(self, key : str, solution : str) -> None:
+        self.__connection__.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?)", (key, solution))
+        self.__connection__.commit()
+
+    def close(self) -> None:
+        self.__connection__.close()
+
+class DbmStore:
+    """on-disk store of a SolutionCache in a dbm-database"""
+
+    def __init__(self, path : str):
+        """opens or creates the database
+
+        Args:
+            path str : is the path of the database-file
+        """
+        self.__database__ = dbm.open(path, "c")
+
+    def get(self, key : str) -> str:
+        solution = self.__database__.get(key)
+        return solution.decode("ascii") if solution is not None else None
+
+    def __setitem__(self, key : str, solution : str) -> None:
+        self.__database__[key] = solution
+
+    def close(self) -> None:
+        self.__database__.close()
+
+def __canonicalForm__(sudoku : list, boxSize : int) -> tuple:
+    """gets the canonical form of a sudoku. The rows and collums are ordered by invariants of the symmetries,
+    of the remaining orderings the one with the smallest sudoku after relabeling the numbers in order of their
+    first occurrence is taken
+
+    Args:
+        sudoku list(list(int)) : is the sudoku
+        boxSize int : is its block-size
+
+    Returns:
+        tuple(str, tuple) : is the canonical sudoku with each field as character of __DIGITS__ in row-major order and the
+        transformation (transposed, rowOrder, colOrder, relabel) for __fromCanonicalForm__
+    """
+    size = boxSize * boxSize
+    transposed = [list(col) for col in zip(*sudoku)]
+    frequency = [0] * (size + 1)
+    for row in sudoku:
+        for n in row:
+            frequency[n] += 1
+    frequency[0] = 0
+
+    best = None
+    bestTransform = None
+    for isTransposed, grid in ((False, sudoku), (True, transposed)):
+        cols = transposed if not isTransposed else sudoku
+        rowOrders = __lineOrders__(grid, cols, frequency, boxSize)
+        colOrders = __lineOrders__(cols, grid, frequency, boxSize)
+        if len(rowOrders) * len(colOrders) > __MAX_ORDERINGS__:
+            rowOrders = rowOrders[:1]
+            colOrders = colOrders[:1]
+        for rowOrder in rowOrders:
+            for colOrder in colOrders:
+                relabel = [0] * (size + 1)
+                nextNumber = 1
+                fields = list()
+                for row in rowOrder:
+                    line = grid[row]
+                    for col in colOrder:
+                        n = line[col]
+                        if n != 0 and relabel[n] == 0:
+                            relabel[n] = nextNumber
+                            nextNumber += 1
+                        fields.append(relabel[n])
+                if best is None or fields < best:
+                    best = fields
+                    bestTransform = (isTransposed, rowOrder, colOrder, relabel)
+    return "".join(__DIGITS__[n] for n in best), bestTransform
+
+def __lineOrders__(lines : list, crossLines : list, frequency : list, boxSize : int) -> list:
+    """gets the orderings of the rows (or collums) of a sudoku, which keep its bands (or stacks) together and are
+    sorted by invariants of the symmetries, lines with equal invariants can be in any order
+
+    Args:
+        lines list(list(int)) : are the rows (or the collums) of the sudoku
+        crossLines list(list(int)) : are the collums (or the rows) of the sudoku
+        frequency list(int) : is how often each number is set in the sudoku
+        boxSize int : is the block-size
+
+    Returns:
+        list(tuple(int)) : are the orderings as indices of lines, only the first one if there are more than __MAX_ORDERINGS__
+    """
+    crossCounts = [sum(1 for n in line if n != 0) for line in crossLines]
+    keys = list()
+    for line in lines:
+        setFields = [index for index in range(0, len(line)) if line[index] != 0]
+        keys.append((
+            len(setFields),
+            sorted(sum(1 for index in setFields if index // boxSize == box) for box in range(0, boxSize)),
+            sorted((crossCounts[index], frequency[line[index]]) for index in setFields)
+        ))
+
+    #group equal lines of each band and equal bands
+    bandGroups = list()
+    lineOptions = dict()
+    numberOfOrders = 1
+    for band in range(0, boxSize):
+        bandLines = sorted(range(band * boxSize, band * boxSize + boxSize), key=lambda line: keys[line])
+        groups = [list(group) for _, group in itertools.groupby(bandLines, key=lambda line: keys[line])]
+        for group in groups:
+            numberOfOrders *= math.factorial(len(group))
+        lineOptions[band] = groups
+        bandGroups.append((sorted(keys[line] for line in bandLines), band))
+    bandGroups.sort()
+    bands = [[band for _, band in group] for _, group in itertools.groupby(bandGroups, key=lambda bandGroup: bandGroup[0])]
+    for group in bands:
+        numberOfOrders *= math.factorial(len(group))
+
+    if numberOfOrders > __MAX_ORDERINGS__:
+        return [tuple(line for group in bands for band in group for lineGroup in lineOptions[band] for line in lineGroup)]
+    orders = list()
+    for bandOrder in itertools.product(*[itertools.permutations(group) for group in bands]):
+        bandOrder = [band for group in bandOrder for band in group]
+        lineOrders = [itertools.product(*[itertools.permutations(group) for group in lineOptions[band]]) for band in bandOrder]
+        for lineOrder in itertools.product(*[list(options) for options in lineOrders]):
+            orders.append(tuple(line for bandLines in lineOrder for group in bandLines for line in group))
+    return orders
+
+def __fromCanonicalForm__(solution : list, transform : tuple) -> list:
+    """transforms the solution of a canonical sudoku back to the solution of the original sudoku
+
+    Args:
+        solution list(int) : is the solution of the canonical sudoku in row-major order
+        transform tuple : is the transformation of the original sudoku (see __canonicalForm__)
+
+    Returns:
+        list(list(int)) : is the solution of the original sudoku
+    """
+    isTransposed, rowOrder, colOrder, relabel = transform
+    size = len(rowOrder)
+    #numbers not set in the original sudoku are given the remaining labels in order
+    inverse = [0] * (size + 1)
+    unused = list()
+    for n in range(1, size + 1):
+        if relabel[n] != 0:
+            inverse[relabel[n]] = n
+        else:
+            unused.append(n)
+    for label in range(size + 1 - len(unused), size + 1):
+        inverse[label] = unused[label - (size + 1 - len(unused))]
+
+    original = [[0] * size for _ in range(0, size)]
+    for row in range(0, size):
+        line = original[rowOrder[row]]
+        for col in range(0, size):
+            line[colOrder[col]] = inverse[solution[row * size + col]]
+    if isTransposed:
+        original = [list(col) for col in zip(*original)]
+    return original
@@ -0,0 +1,118 @@
+#command-line interface, run it by "python -m sudokuSolver solve puzzles.txt" or "python sudokuCli.py solve puzzles.txt".
+#Each line contains one sudoku as N * N characters in row-major order (e.g. 81 for 9x9), "0" or "." for unset fields
+#and the numbers above 9 as letters ("a" for 10, ...). Lines are read and solutions are written one by one,
+#so files of any size can be solved with bounded memory
+
+import argparse
+import collections
+import math
+import os
+import sys
+import time
+
+import sudokuSolver
+
+#characters of the numbers in the lines
+__DIGITS__ = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def main(argv : list = None) -> int:
+    """runs the command-line interface
+
+    Args:
+        argv list(str) : are the arguments without the program name or None to take sys.argv
+
+    Returns:
+        int : is the exit status, 0 if every line was a valid sudoku
+    """
+    parser = argparse.ArgumentParser(prog="python -m sudokuSolver", description="solves sudokus given one per line")
+    commands = parser.add_subparsers(dest="command", required=True)
+    solveParser = commands.add_parser("solve", help="solve the sudokus of files (or stdin) and write one solution per line, all fields 0 if a sudoku is not solveable")
+    solveParser.add_argument("files", nargs="*", default=["-"], help="files containing one sudoku per line, - for stdin (default)")
+    solveParser.add_argument("--engine", default="cnf", choices=["cnf", "bitmask", "dlx", "external"], help="engine of solveSudoku (default cnf)")
+    solveParser.add_argument("--workers", type=int, default=None, help="number of processes solving in parallel (default: solve in this process)")
+    solveParser.add_argument("--stats", action="store_true", help="write the number of sudokus and the solving speed to stderr at the end")
+    arguments = parser.parse_args(argv)
+
+    #counts of the read and the solved sudokus, the skipped lines and the not solveable sudokus
+    counts = {"sudokus": 0, "solved": 0, "unsolveable": 0, "skipped": 0}
+    #line lengths of the sudokus read and not written yet
+    lengths = collections.deque()
+    start = time.perf_counter()
+    try:
+        sudokus = __readSudokus__(arguments.files, counts, lengths)
+        for solution in sudokuSolver.solveMany(sudokus, arguments.engine, arguments.workers):
+            length = lengths.popleft()
+            if len(solution) > 0:
+                counts["solved"] += 1
+                sys.stdout.write("".join(__DIGITS__[n] for row in solution for n in row) + "\n")
+            else:
+                counts["unsolveable"] += 1
+                sys.stdout.write("0" * length + "\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        #output was closed early (e.g. by head), do not write the remaining buffer at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except OSError as error:
+        sys.stderr.write(str(error) + "\n")
+        return 1
+
+    if arguments.stats:
+        seconds = time.perf_counter() - start
+        sys.stderr.write("sudokus: " + str(counts["sudokus"]) + ", solved: " + str(counts["solved"]) + ", unsolveable: " + str(counts["unsolveable"]) + ", skipped lines: " + str(counts["skipped"]) + "\n")
+        sys.stderr.write("time: " + format(seconds, ".3f") + "s, " + format(counts["sudokus"] / seconds if seconds > 0 else 0.0, ".1f") + " sudokus/s\n")
+    return 1 if counts["skipped"] > 0 else 0
+
+def __readSudokus__(files : list, counts : dict, lengths : collections.deque):
+    """reads the sudokus of files lazily, invalid lines are reported to stderr and skipped
+
+    Args:
+        files list(str) : are the paths of the files, - for stdin
+        counts dict(str, int) : are the counts of main, "sudokus" and "skipped" are increased
+        lengths collections.deque(int) : gets the line length of each yielded sudoku appended
+
+    Yields:
+        list(list(int)) : is each sudoku
+    """
+    for path in files:
+        stream = sys.stdin if path == "-" else open(path, "r")
+        try:
+            for lineNumber, line in enumerate(stream, 1):
+                line = line.strip()
+                if len(line) == 0 or line.startswith("#"):
+                    continue
+                sudoku = __parseLine__(line)
+                if sudoku is None:
+                    counts["skipped"] += 1
+                    sys.stderr.write(path + ":" + str(lineNumber) + ": not a sudoku: " + line[:100] + "\n")
+                    continue
+                counts["sudokus"] += 1
+                lengths.append(len(line))
+                yield sudoku
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+def __parseLine__(line : str) -> list:
+    """parses one line (see module)
+
+    Args:
+        line str : is the line without whitespace around
+
+    Returns:
+        list(list(int)) : is the sudoku or None if the line is not a sudoku
+    """
+    size = math.isqrt(len(line))
+    if size * size != len(line) or math.isqrt(size) ** 2 != size or size < 4:
+        return None
+    fields = list()
+    for char in line.lower():
+        n = 0 if char == "." else __DIGITS__.find(char)
+        if not 0 <= n <= size:
+            return None
+        fields.append(n)
+    return [fields[row * size: row * size + size] for row in range(0, size)]
+
+if __name__ == '__main__':
+    sys.exit(main())
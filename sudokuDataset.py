@@ -0,0 +1,242 @@
+#binary format for many sudokus. A file starts with a header of 16 bytes: "SUDK", the version (1), the block-size,
+#the packing (0: one byte per field, 1: two fields per byte, the first one in the high nibble), one unused byte
+#and the number of sudokus as 64-bit little-endian integer. The sudokus follow as records of N * N fields in row-major order
+#(81 bytes or 41 bytes for 9x9), unset fields and not solveable solutions are 0
+
+import mmap
+import multiprocessing
+import struct
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import sudokuSolver
+
+__HEADER__ = struct.Struct("<4sBBBxQ")
+__MAGIC__ = b"SUDK"
+__VERSION__ = 1
+__PACKINGS__ = ("bytes", "nibbles")
+
+
+class DatasetReader:
+    """reader of a binary sudoku-file, the file is memory-mapped and the sudokus are not copied when read.
+    Use it as context-manager or call close() when done. Its sudokus (memoryviews and arrays of asNumpy) still referenced then
+    stay valid, the file is unmapped when the last of them is freed
+
+    Attributes:
+        boxSize int : is the block-size of the sudokus
+        packing str : is "bytes" or "nibbles"
+    """
+
+    def __init__(self, path : str):
+        """opens the file
+
+        Args:
+            path str : is the path of the file
+        """
+        with open(path, "rb") as file:
+            self.__map__ = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.__map__) < __HEADER__.size:
+            self.__map__.close()
+            raise ValueError("not a sudoku-file: " + path)
+        magic, version, self.boxSize, packing, self.__count__ = __HEADER__.unpack_from(self.__map__)
+        if magic != __MAGIC__ or version != __VERSION__ or packing >= len(__PACKINGS__):
+            self.__map__.close()
+            raise ValueError("not a sudoku-file of version " + str(__VERSION__) + ": " + path)
+        self.packing = __PACKINGS__[packing]
+        size = self.boxSize * self.boxSize
+        self.__recordSize__ = size * size if self.packing == "bytes" else (size * size + 1) // 2
+        if len(self.__map__) < __HEADER__.size + self.__count__ * self.__recordSize__:
+            self.__map__.close()
+            raise ValueError("sudoku-file is truncated: " + path)
+        self.__view__ = memoryview(self.__map__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__count__
+
+    def __getitem__(self, index : int):
+        """gets a sudoku
+
+        Args:
+            index int : is the index of the sudoku
+
+        Returns:
+            memoryview|bytes : are the N * N fields of the sudoku in row-major order, a memoryview into the file
+            or bytes if the file is nibble-packed. They can be given to sudokuSolver.solveSudoku directly
+        """
+        if index < 0:
+            index += self.__count__
+        if not 0 <= index < self.__count__:
+            raise IndexError("sudoku-index out of range: " + str(index))
+        start = __HEADER__.size + index * self.__recordSize__
+        record = self.__view__[start: start + self.__recordSize__]
+        if self.packing == "bytes":
+            return record
+        size = self.boxSize * self.boxSize
+        fields = bytearray(2 * self.__recordSize__)
+        fields[0::2] = bytes(byte >> 4 for byte in record)
+        fields[1::2] = bytes(byte & 15 for byte in record)
+        return bytes(fields[:size * size])
+
+    def __iter__(self):
+        for index in range(0, self.__count__):
+            yield self[index]
+
+    def asNumpy(self):
+        """gets all sudokus as numpy-array of shape (sudokus, N, N), it is a view into the file if the file is not nibble-packed
+
+        Returns:
+            numpy.ndarray : are the sudokus as uint8-array
+        """
+        if numpy is None:
+            raise ImportError("asNumpy needs numpy")
+        size = self.boxSize * self.boxSize
+        records = numpy.frombuffer(self.__map__, dtype=numpy.uint8, count=self.__count__ * self.__recordSize__, offset=__HEADER__.size)
+        records = records.reshape(self.__count__, self.__recordSize__)
+        if self.packing == "nibbles":
+            records = numpy.stack((records >> 4, records & 15), axis=2).reshape(self.__count__, 2 * self.__recordSize__)[:, :size * size]
+        return records.reshape(self.__count__, size, size)
+
+    def close(self) -> None:
+        """closes the file, it stays mapped as long as sudokus read from it are referenced
+
+        Returns:
+            None
+        """
+        self.__view__.release()
+        try:
+            self.__map__.close()
+        except BufferError:
+            #records or arrays of asNumpy are still referenced, the mmap is closed when it is freed after them
+            pass
+
+class DatasetWriter:
+    """writer of a binary sudoku-file, use it as context-manager or call close() when done, which writes the number of sudokus"""
+
+    def __init__(self, path : str, boxSize : int = 3, packing : str = "bytes"):
+        """creates the file
+
+        Args:
+            path str : is the path of the file
+            boxSize int : is the block-size of the sudokus
+            packing str : is "bytes" for one byte per field or "nibbles" for two fields per byte (only for block-sizes up to 3)
+        """
+        if packing not in __PACKINGS__:
+            raise ValueError("unknown packing: " + str(packing))
+        if packing == "nibbles" and boxSize * boxSize > 15:
+            raise ValueError("numbers of block-size " + str(boxSize) + " do not fit into nibbles")
+        self.boxSize = boxSize
+        self.packing = packing
+        self.count = 0
+        self.__file__ = open(path, "wb")
+        self.__file__.write(self.__header__())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __header__(self) -> bytes:
+        return __HEADER__.pack(__MAGIC__, __VERSION__, self.boxSize, __PACKINGS__.index(self.packing), self.count)
+
+    def write(self, sudoku) -> None:
+        """appends a sudoku or a solution
+
+        Args:
+            sudoku list(list(int)) : is the sudoku (or N * N fields in row-major order, see sudokuSolver.solveSudoku),
+            an empty list (a not solveable solution) is written as unset sudoku
+
+        Returns:
+            None
+        """
+        size = self.boxSize * self.boxSize
+        if len(sudoku) == 0:
+            fields = bytes(size * size)
+        else:
+            fields = bytes(n for row in sudokuSolver.__toRows__(sudoku) for n in row)
+            if len(fields) != size * size:
+                raise ValueError("sudoku has not " + str(size * size) + " fields")
+        if self.packing == "nibbles":
+            if len(fields) % 2 == 1:
+                fields += b"\0"
+            fields = bytes((fields[index] << 4) | fields[index + 1] for index in range(0, len(fields), 2))
+        self.__file__.write(fields)
+        self.count += 1
+
+    def close(self) -> None:
+        """writes the number of sudokus into the header and closes the file
+
+        Returns:
+            None
+        """
+        self.__file__.seek(0)
+        self.__file__.write(self.__header__())
+        self.__file__.close()
+
+def solveDataset(inputPath : str, outputPath : str, engine : str = "cnf", workers : int = None, packing : str = None, chunkSize : int = 256) -> int:
+    """solves the sudokus of a binary sudoku-file and writes their solutions into another one
+
+    Args:
+        inputPath str : is the path of the sudokus
+        outputPath str : is the path for the solutions
+        engine str : is the engine to use (see sudokuSolver.solveSudoku)
+        workers int : is the number of processes solving in parallel or None to solve in this process. Each worker maps
+            the file itself and only gets ranges of indices, so the sudokus are not copied to the workers
+        packing str : is the packing of the solutions (see DatasetWriter) or None for the packing of the sudokus
+        chunkSize int : is the number of sudokus of a range given to a worker at once
+
+    Returns:
+        int : is the number of solved sudokus
+    """
+    solved = 0
+    with DatasetReader(inputPath) as reader, DatasetWriter(outputPath, reader.boxSize, packing or reader.packing) as writer:
+        if workers is None or workers <= 1:
+            for sudoku in reader:
+                solution = sudokuSolver.solveSudoku(sudoku, engine)
+                writer.write(solution)
+                solved += len(solution) > 0
+            return solved
+
+        ranges = ((start, min(start + chunkSize, len(reader)), engine) for start in range(0, len(reader), chunkSize))
+        with multiprocessing.Pool(workers, initializer=__initWorker__, initargs=(inputPath,)) as pool:
+            for solutions in pool.imap(__solveRange__, ranges):
+                for solution in solutions:
+                    writer.write(solution)
+                    solved += len(solution) > 0
+    return solved
+
+#reader of the worker processes of solveDataset, opened by __initWorker__
+__workerReader__ = None
+
+def __initWorker__(path : str) -> None:
+    """maps the sudoku-file in a worker process of solveDataset
+
+    Args:
+        path str : is the path of the sudokus
+
+    Returns:
+        None
+    """
+    global __workerReader__
+    __workerReader__ = DatasetReader(path)
+
+def __solveRange__(task : tuple) -> list:
+    """solves a range of the sudokus in a worker process of solveDataset
+
+    Args:
+        task tuple(int, int, str) : is the index of the first sudoku, the index after the last one and the engine
+
+    Returns:
+        list(list(list(int))) : are the solutions (see sudokuSolver.solveSudoku)
+    """
+    start, stop, engine = task
+    return [sudokuSolver.solveSudoku(__workerReader__[index], engine) for index in range(start, stop)]
@@ -0,0 +1,78 @@
+#export of the sudoku-cnf in DIMACS-format for other SAT-solvers and import of their models.
+#The numbering of the variables is the one of sudokuSolver: variable N * N * row + N * col + n is true if field (row, col)
+#is set to n, the auxiliary variables of bigger sudokus follow after N * N * N
+
+import sudokuSolver
+
+
+def toDimacs(sudoku : list, stream) -> int:
+    """writes the general sudoku-cnf and a unit-clause for each set field of a sudoku in DIMACS-format.
+    The clauses are written one by one, so stream can be a file or a pipe
+
+    Args:
+        sudoku list(list(int)) : is the sudoku (see sudokuSolver.solveSudoku)
+        stream io.TextIOBase : is the stream to write to
+
+    Returns:
+        int : is the number of written clauses
+    """
+    sudoku = sudokuSolver.__toRows__(sudoku)
+    boxSize = sudokuSolver.__boxSizeOf__(sudoku)
+    size = boxSize * boxSize
+    index = sudokuSolver.__getGeneralCnfIndex__(boxSize)
+    units = [[sudokuSolver.__variable__(row, col, sudoku[row][col], size)] for row in range(0, size) for col in range(0, size) if sudoku[row][col] != 0]
+
+    stream.write("c sudoku with block-size " + str(boxSize) + ": variable " + str(size * size) + " * row + " + str(size) + " * col + n is true if field (row, col) is set to n\n")
+    stream.write("p cnf " + str(index.numberOfVariables) + " " + str(len(index.cnf) + len(units)) + "\n")
+    stream.writelines(" ".join(map(str, clause)) + " 0\n" for clause in index.cnf)
+    stream.writelines(str(unit[0]) + " 0\n" for unit in units)
+    return len(index.cnf) + len(units)
+
+def fromDimacsModel(model, boxSize : int = 3) -> list:
+    """reads the solution of a sudoku from the model of a SAT-solver
+
+    Args:
+        model str|iterable(str)|iterable(int) : is the output of the SAT-solver (lines like "s SATISFIABLE" and "v 1 -2 ... 0"
+        of the SAT-competition format or "SAT" followed by the literals like the result-file of minisat) or the literals as ints
+        boxSize int : is the block-size
+
+    Returns:
+        list(list(int)) : is the solved sudoku or an empty list if the SAT-solver found the cnf unsatisfiable
+    """
+    size = boxSize * boxSize
+    if isinstance(model, str):
+        model = model.splitlines()
+    fields = [0] * (size * size)
+
+    def setLiteral(lit : int) -> None:
+        """sets the field of a true variable
+
+        Args:
+            lit int : is the literal of the model
+
+        Returns:
+            None
+        """
+        if 0 < lit <= size * size * size:
+            row, col, n = sudokuSolver.__fieldOfVariable__(lit, size)
+            fields[row * size + col] = n
+
+    for line in model:
+        if isinstance(line, int):
+            setLiteral(line)
+            continue
+        words = line.split()
+        if len(words) == 0 or words[0] in ("c", "SAT", "SATISFIABLE"):
+            continue
+        if words[0] == "s":
+            if words[1:] != ["SATISFIABLE"]:
+                return []
+            continue
+        if words[0] in ("UNSAT", "UNSATISFIABLE"):
+            return []
+        for word in words[1:] if words[0] == "v" else words:
+            setLiteral(int(word))
+
+    if 0 in fields:
+        raise ValueError("model does not set every field")
+    return [fields[row * size: row * size + size] for row in range(0, size)]
@@ -0,0 +1,279 @@
+#solver engine solving sudoku as exact-cover problem with dancing links (Knuth's algorithm X).
+#It is selected by solveSudoku(sudoku, engine="dlx")
+#
+#Each row of the matrix allocates a number n to a field (row, col) and covers 4 of the 4 * N² columns:
+#the field, number n in the row, number n in the collum and number n in the block
+
+import math
+
+#matrices by block-size, which are not used by a running search, see __acquireMatrix__
+__matrixPool__ = dict()
+
+
+def solveSudokuDlx(sudoku : list) -> list:
+    """solve sudoku with dancing links
+
+    Args:
+        sudoku list(list(int)) : is a 2-dimensional array containing N lists with N integers, representing each sudoku-field. N is the square of the block-size, e.g. 9, 16 or 25. If an int is 0, field is not set
+
+    Returns:
+        list(list(int)) : returns a solved sudoku game or an empty list (if its not solveable)
+    """
+    size = len(sudoku)
+    search = __searchDlx__(sudoku)
+    for solution in search:
+        search.close()
+        return [solution[row * size: row * size + size] for row in range(0, size)]
+    return []
+
+class __ExactCoverMatrix__:
+    """sparse exact-cover matrix of the sudokus of one block-size as doubly linked lists in arrays.
+    Node 0 is the root, nodes 1 to 4 * N² are the column-headers and the following nodes belong to the matrix-rows.
+    Covering and uncovering changes the links, but uncovering in reverse order restores them completely,
+    so the matrix is built only once and reused by later searches
+
+    Attributes:
+        size int : is the number of rows, collums and numbers of the sudoku
+        left, right, up, down list(int) : are the neighbour-nodes of each node
+        column list(int) : is the column-header of each node
+        count list(int) : is the number of uncovered matrix-rows in each column
+        rowOfNode list(int) : is the matrix-row of each node, matrix-row (row * N + col) * N + n - 1 sets field (row, col) to n
+        firstNode list(int) : is the first node of each matrix-row
+    """
+
+    def __init__(self, boxSize : int):
+        """builds the matrix
+
+        Args:
+            boxSize int : is the block-size
+        """
+        self.size = size = boxSize * boxSize
+        numberOfColumns = 4 * size * size
+        self.left = [column - 1 for column in range(0, numberOfColumns + 1)]
+        self.right = [column + 1 for column in range(0, numberOfColumns + 1)]
+        self.left[0] = numberOfColumns
+        self.right[numberOfColumns] = 0
+        self.up = list(range(0, numberOfColumns + 1))
+        self.down = list(range(0, numberOfColumns + 1))
+        self.column = list(range(0, numberOfColumns + 1))
+        self.count = [0] * (numberOfColumns + 1)
+        self.rowOfNode = [-1] * (numberOfColumns + 1)
+        self.firstNode = list()
+
+        for row in range(0, size):
+            for col in range(0, size):
+                block = (row // boxSize) * boxSize + col // boxSize
+                for n in range(0, size):
+                    columns = [
+                        1 + row * size + col,
+                        1 + size * size + row * size + n,
+                        1 + 2 * size * size + col * size + n,
+                        1 + 3 * size * size + block * size + n
+                    ]
+                    first = len(self.column)
+                    self.firstNode.append(first)
+                    for offset, header in enumerate(columns):
+                        node = first + offset
+                        #append node at the bottom of its column
+                        self.up.append(self.up[header])
+                        self.down.append(header)
+                        self.down[self.up[header]] = node
+                        self.up[header] = node
+                        #link node into its matrix-row
+                        self.left.append(first + (offset - 1) % 4)
+                        self.right.append(first + (offset + 1) % 4)
+                        self.column.append(header)
+                        self.rowOfNode.append(len(self.firstNode) - 1)
+                        self.count[header] += 1
+
+    def cover(self, header : int) -> None:
+        """removes a column and all matrix-rows covering it
+
+        Args:
+            header int : is the column-header
+
+        Returns:
+            None
+        """
+        left, right, up, down, column, count = self.left, self.right, self.up, self.down, self.column, self.count
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                count[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, header : int) -> None:
+        """reverses cover(header)
+
+        Args:
+            header int : is the column-header
+
+        Returns:
+            None
+        """
+        left, right, up, down, column, count = self.left, self.right, self.up, self.down, self.column, self.count
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                count[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+def __acquireMatrix__(boxSize : int) -> __ExactCoverMatrix__:
+    """gets the exact-cover matrix for one search, it is built only once and reused by later searches
+
+    Args:
+        boxSize int : is the block-size
+
+    Returns:
+        __ExactCoverMatrix__ : is the matrix with all columns uncovered, which needs to be given back with __releaseMatrix__
+    """
+    try:
+        return __matrixPool__.setdefault(boxSize, list()).pop()
+    except IndexError:
+        return __ExactCoverMatrix__(boxSize)
+
+def __releaseMatrix__(boxSize : int, matrix : __ExactCoverMatrix__) -> None:
+    """gives back the matrix of __acquireMatrix__ after all its columns are uncovered again
+
+    Args:
+        boxSize int : is the block-size
+        matrix __ExactCoverMatrix__ : is the matrix
+
+    Returns:
+        None
+    """
+    __matrixPool__[boxSize].append(matrix)
+
+def __searchDlx__(sudoku : list):
+    """searches all solutions of a sudoku, always covering the column with the least matrix-rows remaining next.
+    The matrix is restored when the search is finished or closed
+
+    Args:
+        sudoku list(list(int)) : is the given sudoku (see solveSudokuDlx)
+
+    Yields:
+        list(int) : is each solution as N * N fields in row-major order
+    """
+    size = len(sudoku)
+    boxSize = math.isqrt(size)
+    if size == 0 or boxSize * boxSize != size or any(len(row) != size for row in sudoku):
+        raise ValueError("sudoku is not a square of N rows with N fields, N being a square number")
+    matrix = __acquireMatrix__(boxSize)
+    right, down, column, count = matrix.right, matrix.down, matrix.column, matrix.count
+    rowOfNode, firstNode = matrix.rowOfNode, matrix.firstNode
+    cover, uncover = matrix.cover, matrix.uncover
+
+    fields = [0] * (size * size)
+    #columns covered by the given sudoku in order
+    givenColumns = list()
+    #node of the tried matrix-row of each depth
+    chosen = list()
+    #covered column of each depth
+    columns = list()
+
+    def restore() -> None:
+        """uncovers everything in reverse order
+
+        Returns:
+            None
+        """
+        while len(chosen) > 0:
+            node = chosen.pop()
+            j = matrix.left[node]
+            while j != node:
+                uncover(column[j])
+                j = matrix.left[j]
+            uncover(columns.pop())
+        while len(givenColumns) > 0:
+            uncover(givenColumns.pop())
+
+    try:
+        #read in given sudoku by covering the columns of its matrix-rows
+        solvable = True
+        for field in range(0, size * size):
+            n = sudoku[field // size][field % size]
+            if n == 0:
+                continue
+            if not 0 < n <= size:
+                raise ValueError("field is not between 0 and " + str(size) + ": " + str(n))
+            fields[field] = n
+            node = firstNode[field * size + n - 1]
+            for j in (node, right[node], right[right[node]], right[right[right[node]]]):
+                header = column[j]
+                if right[matrix.left[header]] != header:
+                    #column is already covered -> number is used twice
+                    solvable = False
+                    break
+                cover(header)
+                givenColumns.append(header)
+            if not solvable:
+                break
+
+        choose = solvable
+        while solvable:
+            if choose:
+                if right[0] == 0:
+                    #all columns are covered
+                    yield fields.copy()
+                    choose = False
+                    if len(chosen) == 0:
+                        break
+                    continue
+
+                #get column with the least matrix-rows remaining
+                header = right[0]
+                best = header
+                while header != 0:
+                    if count[header] < count[best]:
+                        best = header
+                        if count[best] <= 1:
+                            break
+                    header = right[header]
+                cover(best)
+                columns.append(best)
+                node = down[best]
+            else:
+                #take back the matrix-row of this depth and try the next one
+                if len(chosen) == 0:
+                    break
+                node = chosen.pop()
+                fields[rowOfNode[node] // size] = 0
+                j = matrix.left[node]
+                while j != node:
+                    uncover(column[j])
+                    j = matrix.left[j]
+                node = down[node]
+
+            header = columns[-1]
+            if node == header:
+                #no matrix-row remaining -> you made a wrong assumption
+                uncover(columns.pop())
+                choose = False
+                continue
+
+            #cover the other columns of the matrix-row
+            chosen.append(node)
+            fields[rowOfNode[node] // size] = rowOfNode[node] % size + 1
+            j = right[node]
+            while j != node:
+                cover(column[j])
+                j = right[j]
+            choose = True
+    except GeneratorExit:
+        restore()
+        __releaseMatrix__(boxSize, matrix)
+        raise
+    restore()
+    __releaseMatrix__(boxSize, matrix)
@@ -0,0 +1,120 @@
+#solver engine sending the sudoku-cnf to an installed SAT-solver (kissat, cadical, minisat or any solver of the
+#SAT-competition format) through pipes. It is selected by solveSudoku(sudoku, engine="external")
+
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+
+import sudokuDimacs
+import sudokuSolver
+
+#SAT-solvers searched on PATH in this order
+__SOLVERS__ = ("kissat", "cadical", "minisat")
+#seconds after which a SAT-solver is killed if no timeout is given, so a hanging SAT-solver does not block forever
+__DEFAULT_TIMEOUT__ = 300.0
+
+
+def findSatSolver() -> str:
+    """searches an installed SAT-solver
+
+    Returns:
+        str : is the path of the first SAT-solver of __SOLVERS__ found on PATH or None
+    """
+    for name in __SOLVERS__:
+        path = shutil.which(name)
+        if path is not None:
+            return path
+    return None
+
+def solveSudokuExternal(sudoku : list, solver : str = None, timeout : float = __DEFAULT_TIMEOUT__, fallback : str = "cnf") -> list:
+    """solve sudoku with an external SAT-solver, the DIMACS-cnf is written to its stdin while it runs
+
+    Args:
+        sudoku list(list(int)) : is the sudoku (see sudokuSolver.solveSudoku)
+        solver str : is the name or the path of the SAT-solver or None to search one with findSatSolver. minisat is called
+            with a result-file, any other solver needs to read DIMACS from stdin and write "s ..." and "v ..." lines to stdout
+        timeout float : is the wall-clock time in seconds after which the SAT-solver is killed (by default __DEFAULT_TIMEOUT__) or None to wait forever
+        fallback str : is the engine of sudokuSolver.solveSudoku used if no SAT-solver is installed
+
+    Returns:
+        list(list(int)) : returns a solved sudoku game or an empty list (if its not solveable)
+    """
+    sudoku = sudokuSolver.__toRows__(sudoku)
+    boxSize = sudokuSolver.__boxSizeOf__(sudoku)
+    path = findSatSolver() if solver is None else shutil.which(solver)
+    if path is None:
+        if solver is not None:
+            raise FileNotFoundError("SAT-solver not found: " + solver)
+        return sudokuSolver.solveSudoku(sudoku, fallback)
+
+    resultFile = None
+    if os.path.basename(path).startswith("minisat"):
+        #minisat writes the model only into a result-file
+        descriptor, resultFile = tempfile.mkstemp(suffix=".sat")
+        os.close(descriptor)
+        arguments = [path, "-verb=0", "/dev/stdin", resultFile]
+    else:
+        arguments = [path]
+
+    try:
+        #own process-group, so a timeout also kills processes started by the SAT-solver (e.g. by a wrapper-script)
+        process = subprocess.Popen(arguments, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, start_new_session=(os.name == "posix"))
+        output = list()
+
+        def write() -> None:
+            """writes the cnf to the SAT-solver
+
+            Returns:
+                None
+            """
+            try:
+                sudokuDimacs.toDimacs(sudoku, process.stdin)
+                process.stdin.close()
+            except (BrokenPipeError, OSError, ValueError):
+                #SAT-solver stopped reading (or got killed)
+                pass
+
+        def read() -> None:
+            """reads the output of the SAT-solver
+
+            Returns:
+                None
+            """
+            output.append(process.stdout.read())
+
+        threads = [threading.Thread(target=write, daemon=True), threading.Thread(target=read, daemon=True)]
+        for thread in threads:
+            thread.start()
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+            process.wait()
+            raise TimeoutError("SAT-solver did not finish within " + str(timeout) + "s")
+        finally:
+            for thread in threads:
+                thread.join()
+            process.stdout.close()
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+
+        if resultFile is not None:
+            with open(resultFile, "r") as file:
+                output = [file.read()]
+        elif len(output) == 0:
+            #reader-thread failed
+            raise RuntimeError("output of SAT-solver " + path + " could not be read")
+        if process.returncode not in (10, 20) and "s " not in output[0] and not output[0].startswith(("SAT", "UNSAT")):
+            raise RuntimeError("SAT-solver " + path + " failed with exit status " + str(process.returncode))
+        return sudokuDimacs.fromDimacsModel(output[0], boxSize)
+    finally:
+        if resultFile is not None:
+            os.remove(resultFile)
@@ -1,10535 +1,10536 @@
 #import of this file into sudokuSolver.py allows sudokuSolver to start solving given sudoku immediately,
 #instead of needing to create this list beforehand
+#each literal is a signed integer: variable 81*row + 9*col + n is true if field (row, col) is set to n
 
 sudokuGeneral = [
-    [(False, '00-8'), (False, '00-9')],
-    [(False, '00-7'), (False, '00-9')],
-    [(False, '00-7'), (False, '00-8')],
-    [(False, '00-6'), (False, '00-9')],
-    [(False, '00-6'), (False, '00-8')],
-    [(False, '00-6'), (False, '00-7')],
-    [(False, '00-5'), (False, '00-9')],
-    [(False, '00-5'), (False, '00-8')],
-    [(False, '00-5'), (False, '00-7')],
-    [(False, '00-5'), (False, '00-6')],
-    [(False, '00-4'), (False, '00-9')],
-    [(False, '00-4'), (False, '00-8')],
-    [(False, '00-4'), (False, '00-7')],
-    [(False, '00-4'), (False, '00-6')],
-    [(False, '00-4'), (False, '00-5')],
-    [(False, '00-3'), (False, '00-9')],
-    [(False, '00-3'), (False, '00-8')],
-    [(False, '00-3'), (False, '00-7')],
-    [(False, '00-3'), (False, '00-6')],
-    [(False, '00-3'), (False, '00-5')],
-    [(False, '00-3'), (False, '00-4')],
-    [(False, '00-2'), (False, '00-9')],
-    [(False, '00-2'), (False, '00-8')],
-    [(False, '00-2'), (False, '00-7')],
-    [(False, '00-2'), (False, '00-6')],
-    [(False, '00-2'), (False, '00-5')],
-    [(False, '00-2'), (False, '00-4')],
-    [(False, '00-2'), (False, '00-3')],
-    [(False, '00-1'), (False, '00-9')],
-    [(False, '00-1'), (False, '00-8')],
-    [(False, '00-1'), (False, '00-7')],
-    [(False, '00-1'), (False, '00-6')],
-    [(False, '00-1'), (False, '00-5')],
-    [(False, '00-1'), (False, '00-4')],
-    [(False, '00-1'), (False, '00-3')],
-    [(False, '00-1'), (False, '00-2')],
-    [(True, '00-1'), (True, '00-2'), (True, '00-3'), (True, '00-4'), (True, '00-5'), (True, '00-6'), (True, '00-7'), (True, '00-8'), (True, '00-9')],
-    [(False, '01-8'), (False, '01-9')],
-    [(False, '01-7'), (False, '01-9')],
-    [(False, '01-7'), (False, '01-8')],
-    [(False, '01-6'), (False, '01-9')],
-    [(False, '01-6'), (False, '01-8')],
-    [(False, '01-6'), (False, '01-7')],
-    [(False, '01-5'), (False, '01-9')],
-    [(False, '01-5'), (False, '01-8')],
-    [(False, '01-5'), (False, '01-7')],
-    [(False, '01-5'), (False, '01-6')],
-    [(False, '01-4'), (False, '01-9')],
-    [(False, '01-4'), (False, '01-8')],
-    [(False, '01-4'), (False, '01-7')],
-    [(False, '01-4'), (False, '01-6')],
-    [(False, '01-4'), (False, '01-5')],
-    [(False, '01-3'), (False, '01-9')],
-    [(False, '01-3'), (False, '01-8')],
-    [(False, '01-3'), (False, '01-7')],
-    [(False, '01-3'), (False, '01-6')],
-    [(False, '01-3'), (False, '01-5')],
-    [(False, '01-3'), (False, '01-4')],
-    [(False, '01-2'), (False, '01-9')],
-    [(False, '01-2'), (False, '01-8')],
-    [(False, '01-2'), (False, '01-7')],
-    [(False, '01-2'), (False, '01-6')],
-    [(False, '01-2'), (False, '01-5')],
-    [(False, '01-2'), (False, '01-4')],
-    [(False, '01-2'), (False, '01-3')],
-    [(False, '01-1'), (False, '01-9')],
-    [(False, '01-1'), (False, '01-8')],
-    [(False, '01-1'), (False, '01-7')],
-    [(False, '01-1'), (False, '01-6')],
-    [(False, '01-1'), (False, '01-5')],
-    [(False, '01-1'), (False, '01-4')],
-    [(False, '01-1'), (False, '01-3')],
-    [(False, '01-1'), (False, '01-2')],
-    [(True, '01-1'), (True, '01-2'), (True, '01-3'), (True, '01-4'), (True, '01-5'), (True, '01-6'), (True, '01-7'), (True, '01-8'), (True, '01-9')],
-    [(False, '02-8'), (False, '02-9')],
-    [(False, '02-7'), (False, '02-9')],
-    [(False, '02-7'), (False, '02-8')],
-    [(False, '02-6'), (False, '02-9')],
-    [(False, '02-6'), (False, '02-8')],
-    [(False, '02-6'), (False, '02-7')],
-    [(False, '02-5'), (False, '02-9')],
-    [(False, '02-5'), (False, '02-8')],
-    [(False, '02-5'), (False, '02-7')],
-    [(False, '02-5'), (False, '02-6')],
-    [(False, '02-4'), (False, '02-9')],
-    [(False, '02-4'), (False, '02-8')],
-    [(False, '02-4'), (False, '02-7')],
-    [(False, '02-4'), (False, '02-6')],
-    [(False, '02-4'), (False, '02-5')],
-    [(False, '02-3'), (False, '02-9')],
-    [(False, '02-3'), (False, '02-8')],
-    [(False, '02-3'), (False, '02-7')],
-    [(False, '02-3'), (False, '02-6')],
-    [(False, '02-3'), (False, '02-5')],
-    [(False, '02-3'), (False, '02-4')],
-    [(False, '02-2'), (False, '02-9')],
-    [(False, '02-2'), (False, '02-8')],
-    [(False, '02-2'), (False, '02-7')],
-    [(False, '02-2'), (False, '02-6')],
-    [(False, '02-2'), (False, '02-5')],
-    [(False, '02-2'), (False, '02-4')],
-    [(False, '02-2'), (False, '02-3')],
-    [(False, '02-1'), (False, '02-9')],
-    [(False, '02-1'), (False, '02-8')],
-    [(False, '02-1'), (False, '02-7')],
-    [(False, '02-1'), (False, '02-6')],
-    [(False, '02-1'), (False, '02-5')],
-    [(False, '02-1'), (False, '02-4')],
-    [(False, '02-1'), (False, '02-3')],
-    [(False, '02-1'), (False, '02-2')],
-    [(True, '02-1'), (True, '02-2'), (True, '02-3'), (True, '02-4'), (True, '02-5'), (True, '02-6'), (True, '02-7'), (True, '02-8'), (True, '02-9')],
-    [(False, '03-8'), (False, '03-9')],
-    [(False, '03-7'), (False, '03-9')],
-    [(False, '03-7'), (False, '03-8')],
-    [(False, '03-6'), (False, '03-9')],
-    [(False, '03-6'), (False, '03-8')],
-    [(False, '03-6'), (False, '03-7')],
-    [(False, '03-5'), (False, '03-9')],
-    [(False, '03-5'), (False, '03-8')],
-    [(False, '03-5'), (False, '03-7')],
-    [(False, '03-5'), (False, '03-6')],
-    [(False, '03-4'), (False, '03-9')],
-    [(False, '03-4'), (False, '03-8')],
-    [(False, '03-4'), (False, '03-7')],
-    [(False, '03-4'), (False, '03-6')],
-    [(False, '03-4'), (False, '03-5')],
-    [(False, '03-3'), (False, '03-9')],
-    [(False, '03-3'), (False, '03-8')],
-    [(False, '03-3'), (False, '03-7')],
-    [(False, '03-3'), (False, '03-6')],
-    [(False, '03-3'), (False, '03-5')],
-    [(False, '03-3'), (False, '03-4')],
-    [(False, '03-2'), (False, '03-9')],
-    [(False, '03-2'), (False, '03-8')],
-    [(False, '03-2'), (False, '03-7')],
-    [(False, '03-2'), (False, '03-6')],
-    [(False, '03-2'), (False, '03-5')],
-    [(False, '03-2'), (False, '03-4')],
-    [(False, '03-2'), (False, '03-3')],
-    [(False, '03-1'), (False, '03-9')],
-    [(False, '03-1'), (False, '03-8')],
-    [(False, '03-1'), (False, '03-7')],
-    [(False, '03-1'), (False, '03-6')],
-    [(False, '03-1'), (False, '03-5')],
-    [(False, '03-1'), (False, '03-4')],
-    [(False, '03-1'), (False, '03-3')],
-    [(False, '03-1'), (False, '03-2')],
-    [(True, '03-1'), (True, '03-2'), (True, '03-3'), (True, '03-4'), (True, '03-5'), (True, '03-6'), (True, '03-7'), (True, '03-8'), (True, '03-9')],
-    [(False, '04-8'), (False, '04-9')],
-    [(False, '04-7'), (False, '04-9')],
-    [(False, '04-7'), (False, '04-8')],
-    [(False, '04-6'), (False, '04-9')],
-    [(False, '04-6'), (False, '04-8')],
-    [(False, '04-6'), (False, '04-7')],
-    [(False, '04-5'), (False, '04-9')],
-    [(False, '04-5'), (False, '04-8')],
-    [(False, '04-5'), (False, '04-7')],
-    [(False, '04-5'), (False, '04-6')],
-    [(False, '04-4'), (False, '04-9')],
-    [(False, '04-4'), (False, '04-8')],
-    [(False, '04-4'), (False, '04-7')],
-    [(False, '04-4'), (False, '04-6')],
-    [(False, '04-4'), (False, '04-5')],
-    [(False, '04-3'), (False, '04-9')],
-    [(False, '04-3'), (False, '04-8')],
-    [(False, '04-3'), (False, '04-7')],
-    [(False, '04-3'), (False, '04-6')],
-    [(False, '04-3'), (False, '04-5')],
-    [(False, '04-3'), (False, '04-4')],
-    [(False, '04-2'), (False, '04-9')],
-    [(False, '04-2'), (False, '04-8')],
-    [(False, '04-2'), (False, '04-7')],
-    [(False, '04-2'), (False, '04-6')],
-    [(False, '04-2'), (False, '04-5')],
-    [(False, '04-2'), (False, '04-4')],
-    [(False, '04-2'), (False, '04-3')],
-    [(False, '04-1'), (False, '04-9')],
-    [(False, '04-1'), (False, '04-8')],
-    [(False, '04-1'), (False, '04-7')],
-    [(False, '04-1'), (False, '04-6')],
-    [(False, '04-1'), (False, '04-5')],
-    [(False, '04-1'), (False, '04-4')],
-    [(False, '04-1'), (False, '04-3')],
-    [(False, '04-1'), (False, '04-2')],
-    [(True, '04-1'), (True, '04-2'), (True, '04-3'), (True, '04-4'), (True, '04-5'), (True, '04-6'), (True, '04-7'), (True, '04-8'), (True, '04-9')],
-    [(False, '05-8'), (False, '05-9')],
-    [(False, '05-7'), (False, '05-9')],
-    [(False, '05-7'), (False, '05-8')],
-    [(False, '05-6'), (False, '05-9')],
-    [(False, '05-6'), (False, '05-8')],
-    [(False, '05-6'), (False, '05-7')],
-    [(False, '05-5'), (False, '05-9')],
-    [(False, '05-5'), (False, '05-8')],
-    [(False, '05-5'), (False, '05-7')],
-    [(False, '05-5'), (False, '05-6')],
-    [(False, '05-4'), (False, '05-9')],
-    [(False, '05-4'), (False, '05-8')],
-    [(False, '05-4'), (False, '05-7')],
-    [(False, '05-4'), (False, '05-6')],
-    [(False, '05-4'), (False, '05-5')],
-    [(False, '05-3'), (False, '05-9')],
-    [(False, '05-3'), (False, '05-8')],
-    [(False, '05-3'), (False, '05-7')],
-    [(False, '05-3'), (False, '05-6')],
-    [(False, '05-3'), (False, '05-5')],
-    [(False, '05-3'), (False, '05-4')],
-    [(False, '05-2'), (False, '05-9')],
-    [(False, '05-2'), (False, '05-8')],
-    [(False, '05-2'), (False, '05-7')],
-    [(False, '05-2'), (False, '05-6')],
-    [(False, '05-2'), (False, '05-5')],
-    [(False, '05-2'), (False, '05-4')],
-    [(False, '05-2'), (False, '05-3')],
-    [(False, '05-1'), (False, '05-9')],
-    [(False, '05-1'), (False, '05-8')],
-    [(False, '05-1'), (False, '05-7')],
-    [(False, '05-1'), (False, '05-6')],
-    [(False, '05-1'), (False, '05-5')],
-    [(False, '05-1'), (False, '05-4')],
-    [(False, '05-1'), (False, '05-3')],
-    [(False, '05-1'), (False, '05-2')],
-    [(True, '05-1'), (True, '05-2'), (True, '05-3'), (True, '05-4'), (True, '05-5'), (True, '05-6'), (True, '05-7'), (True, '05-8'), (True, '05-9')],
-    [(False, '06-8'), (False, '06-9')],
-    [(False, '06-7'), (False, '06-9')],
-    [(False, '06-7'), (False, '06-8')],
-    [(False, '06-6'), (False, '06-9')],
-    [(False, '06-6'), (False, '06-8')],
-    [(False, '06-6'), (False, '06-7')],
-    [(False, '06-5'), (False, '06-9')],
-    [(False, '06-5'), (False, '06-8')],
-    [(False, '06-5'), (False, '06-7')],
-    [(False, '06-5'), (False, '06-6')],
-    [(False, '06-4'), (False, '06-9')],
-    [(False, '06-4'), (False, '06-8')],
-    [(False, '06-4'), (False, '06-7')],
-    [(False, '06-4'), (False, '06-6')],
-    [(False, '06-4'), (False, '06-5')],
-    [(False, '06-3'), (False, '06-9')],
-    [(False, '06-3'), (False, '06-8')],
-    [(False, '06-3'), (False, '06-7')],
-    [(False, '06-3'), (False, '06-6')],
-    [(False, '06-3'), (False, '06-5')],
-    [(False, '06-3'), (False, '06-4')],
-    [(False, '06-2'), (False, '06-9')],
-    [(False, '06-2'), (False, '06-8')],
-    [(False, '06-2'), (False, '06-7')],
-    [(False, '06-2'), (False, '06-6')],
-    [(False, '06-2'), (False, '06-5')],
-    [(False, '06-2'), (False, '06-4')],
-    [(False, '06-2'), (False, '06-3')],
-    [(False, '06-1'), (False, '06-9')],
-    [(False, '06-1'), (False, '06-8')],
-    [(False, '06-1'), (False, '06-7')],
-    [(False, '06-1'), (False, '06-6')],
-    [(False, '06-1'), (False, '06-5')],
-    [(False, '06-1'), (False, '06-4')],
-    [(False, '06-1'), (False, '06-3')],
-    [(False, '06-1'), (False, '06-2')],
-    [(True, '06-1'), (True, '06-2'), (True, '06-3'), (True, '06-4'), (True, '06-5'), (True, '06-6'), (True, '06-7'), (True, '06-8'), (True, '06-9')],
-    [(False, '07-8'), (False, '07-9')],
-    [(False, '07-7'), (False, '07-9')],
-    [(False, '07-7'), (False, '07-8')],
-    [(False, '07-6'), (False, '07-9')],
-    [(False, '07-6'), (False, '07-8')],
-    [(False, '07-6'), (False, '07-7')],
-    [(False, '07-5'), (False, '07-9')],
-    [(False, '07-5'), (False, '07-8')],
-    [(False, '07-5'), (False, '07-7')],
-    [(False, '07-5'), (False, '07-6')],
-    [(False, '07-4'), (False, '07-9')],
-    [(False, '07-4'), (False, '07-8')],
-    [(False, '07-4'), (False, '07-7')],
-    [(False, '07-4'), (False, '07-6')],
-    [(False, '07-4'), (False, '07-5')],
-    [(False, '07-3'), (False, '07-9')],
-    [(False, '07-3'), (False, '07-8')],
-    [(False, '07-3'), (False, '07-7')],
-    [(False, '07-3'), (False, '07-6')],
-    [(False, '07-3'), (False, '07-5')],
-    [(False, '07-3'), (False, '07-4')],
-    [(False, '07-2'), (False, '07-9')],
-    [(False, '07-2'), (False, '07-8')],
-    [(False, '07-2'), (False, '07-7')],
-    [(False, '07-2'), (False, '07-6')],
-    [(False, '07-2'), (False, '07-5')],
-    [(False, '07-2'), (False, '07-4')],
-    [(False, '07-2'), (False, '07-3')],
-    [(False, '07-1'), (False, '07-9')],
-    [(False, '07-1'), (False, '07-8')],
-    [(False, '07-1'), (False, '07-7')],
-    [(False, '07-1'), (False, '07-6')],
-    [(False, '07-1'), (False, '07-5')],
-    [(False, '07-1'), (False, '07-4')],
-    [(False, '07-1'), (False, '07-3')],
-    [(False, '07-1'), (False, '07-2')],
-    [(True, '07-1'), (True, '07-2'), (True, '07-3'), (True, '07-4'), (True, '07-5'), (True, '07-6'), (True, '07-7'), (True, '07-8'), (True, '07-9')],
-    [(False, '08-8'), (False, '08-9')],
-    [(False, '08-7'), (False, '08-9')],
-    [(False, '08-7'), (False, '08-8')],
-    [(False, '08-6'), (False, '08-9')],
-    [(False, '08-6'), (False, '08-8')],
-    [(False, '08-6'), (False, '08-7')],
-    [(False, '08-5'), (False, '08-9')],
-    [(False, '08-5'), (False, '08-8')],
-    [(False, '08-5'), (False, '08-7')],
-    [(False, '08-5'), (False, '08-6')],
-    [(False, '08-4'), (False, '08-9')],
-    [(False, '08-4'), (False, '08-8')],
-    [(False, '08-4'), (False, '08-7')],
-    [(False, '08-4'), (False, '08-6')],
-    [(False, '08-4'), (False, '08-5')],
-    [(False, '08-3'), (False, '08-9')],
-    [(False, '08-3'), (False, '08-8')],
-    [(False, '08-3'), (False, '08-7')],
-    [(False, '08-3'), (False, '08-6')],
-    [(False, '08-3'), (False, '08-5')],
-    [(False, '08-3'), (False, '08-4')],
-    [(False, '08-2'), (False, '08-9')],
-    [(False, '08-2'), (False, '08-8')],
-    [(False, '08-2'), (False, '08-7')],
-    [(False, '08-2'), (False, '08-6')],
-    [(False, '08-2'), (False, '08-5')],
-    [(False, '08-2'), (False, '08-4')],
-    [(False, '08-2'), (False, '08-3')],
-    [(False, '08-1'), (False, '08-9')],
-    [(False, '08-1'), (False, '08-8')],
-    [(False, '08-1'), (False, '08-7')],
-    [(False, '08-1'), (False, '08-6')],
-    [(False, '08-1'), (False, '08-5')],
-    [(False, '08-1'), (False, '08-4')],
-    [(False, '08-1'), (False, '08-3')],
-    [(False, '08-1'), (False, '08-2')],
-    [(True, '08-1'), (True, '08-2'), (True, '08-3'), (True, '08-4'), (True, '08-5'), (True, '08-6'), (True, '08-7'), (True, '08-8'), (True, '08-9')],
-    [(False, '10-8'), (False, '10-9')],
-    [(False, '10-7'), (False, '10-9')],
-    [(False, '10-7'), (False, '10-8')],
-    [(False, '10-6'), (False, '10-9')],
-    [(False, '10-6'), (False, '10-8')],
-    [(False, '10-6'), (False, '10-7')],
-    [(False, '10-5'), (False, '10-9')],
-    [(False, '10-5'), (False, '10-8')],
-    [(False, '10-5'), (False, '10-7')],
-    [(False, '10-5'), (False, '10-6')],
-    [(False, '10-4'), (False, '10-9')],
-    [(False, '10-4'), (False, '10-8')],
-    [(False, '10-4'), (False, '10-7')],
-    [(False, '10-4'), (False, '10-6')],
-    [(False, '10-4'), (False, '10-5')],
-    [(False, '10-3'), (False, '10-9')],
-    [(False, '10-3'), (False, '10-8')],
-    [(False, '10-3'), (False, '10-7')],
-    [(False, '10-3'), (False, '10-6')],
-    [(False, '10-3'), (False, '10-5')],
-    [(False, '10-3'), (False, '10-4')],
-    [(False, '10-2'), (False, '10-9')],
-    [(False, '10-2'), (False, '10-8')],
-    [(False, '10-2'), (False, '10-7')],
-    [(False, '10-2'), (False, '10-6')],
-    [(False, '10-2'), (False, '10-5')],
-    [(False, '10-2'), (False, '10-4')],
-    [(False, '10-2'), (False, '10-3')],
-    [(False, '10-1'), (False, '10-9')],
-    [(False, '10-1'), (False, '10-8')],
-    [(False, '10-1'), (False, '10-7')],
-    [(False, '10-1'), (False, '10-6')],
-    [(False, '10-1'), (False, '10-5')],
-    [(False, '10-1'), (False, '10-4')],
-    [(False, '10-1'), (False, '10-3')],
-    [(False, '10-1'), (False, '10-2')],
-    [(True, '10-1'), (True, '10-2'), (True, '10-3'), (True, '10-4'), (True, '10-5'), (True, '10-6'), (True, '10-7'), (True, '10-8'), (True, '10-9')],
-    [(False, '11-8'), (False, '11-9')],
-    [(False, '11-7'), (False, '11-9')],
-    [(False, '11-7'), (False, '11-8')],
-    [(False, '11-6'), (False, '11-9')],
-    [(False, '11-6'), (False, '11-8')],
-    [(False, '11-6'), (False, '11-7')],
-    [(False, '11-5'), (False, '11-9')],
-    [(False, '11-5'), (False, '11-8')],
-    [(False, '11-5'), (False, '11-7')],
-    [(False, '11-5'), (False, '11-6')],
-    [(False, '11-4'), (False, '11-9')],
-    [(False, '11-4'), (False, '11-8')],
-    [(False, '11-4'), (False, '11-7')],
-    [(False, '11-4'), (False, '11-6')],
-    [(False, '11-4'), (False, '11-5')],
-    [(False, '11-3'), (False, '11-9')],
-    [(False, '11-3'), (False, '11-8')],
-    [(False, '11-3'), (False, '11-7')],
-    [(False, '11-3'), (False, '11-6')],
-    [(False, '11-3'), (False, '11-5')],
-    [(False, '11-3'), (False, '11-4')],
-    [(False, '11-2'), (False, '11-9')],
-    [(False, '11-2'), (False, '11-8')],
-    [(False, '11-2'), (False, '11-7')],
-    [(False, '11-2'), (False, '11-6')],
-    [(False, '11-2'), (False, '11-5')],
-    [(False, '11-2'), (False, '11-4')],
-    [(False, '11-2'), (False, '11-3')],
-    [(False, '11-1'), (False, '11-9')],
-    [(False, '11-1'), (False, '11-8')],
-    [(False, '11-1'), (False, '11-7')],
-    [(False, '11-1'), (False, '11-6')],
-    [(False, '11-1'), (False, '11-5')],
-    [(False, '11-1'), (False, '11-4')],
-    [(False, '11-1'), (False, '11-3')],
-    [(False, '11-1'), (False, '11-2')],
-    [(True, '11-1'), (True, '11-2'), (True, '11-3'), (True, '11-4'), (True, '11-5'), (True, '11-6'), (True, '11-7'), (True, '11-8'), (True, '11-9')],
-    [(False, '12-8'), (False, '12-9')],
-    [(False, '12-7'), (False, '12-9')],
-    [(False, '12-7'), (False, '12-8')],
-    [(False, '12-6'), (False, '12-9')],
-    [(False, '12-6'), (False, '12-8')],
-    [(False, '12-6'), (False, '12-7')],
-    [(False, '12-5'), (False, '12-9')],
-    [(False, '12-5'), (False, '12-8')],
-    [(False, '12-5'), (False, '12-7')],
-    [(False, '12-5'), (False, '12-6')],
-    [(False, '12-4'), (False, '12-9')],
-    [(False, '12-4'), (False, '12-8')],
-    [(False, '12-4'), (False, '12-7')],
-    [(False, '12-4'), (False, '12-6')],
-    [(False, '12-4'), (False, '12-5')],
-    [(False, '12-3'), (False, '12-9')],
-    [(False, '12-3'), (False, '12-8')],
-    [(False, '12-3'), (False, '12-7')],
-    [(False, '12-3'), (False, '12-6')],
-    [(False, '12-3'), (False, '12-5')],
-    [(False, '12-3'), (False, '12-4')],
-    [(False, '12-2'), (False, '12-9')],
-    [(False, '12-2'), (False, '12-8')],
-    [(False, '12-2'), (False, '12-7')],
-    [(False, '12-2'), (False, '12-6')],
-    [(False, '12-2'), (False, '12-5')],
-    [(False, '12-2'), (False, '12-4')],
-    [(False, '12-2'), (False, '12-3')],
-    [(False, '12-1'), (False, '12-9')],
-    [(False, '12-1'), (False, '12-8')],
-    [(False, '12-1'), (False, '12-7')],
-    [(False, '12-1'), (False, '12-6')],
-    [(False, '12-1'), (False, '12-5')],
-    [(False, '12-1'), (False, '12-4')],
-    [(False, '12-1'), (False, '12-3')],
-    [(False, '12-1'), (False, '12-2')],
-    [(True, '12-1'), (True, '12-2'), (True, '12-3'), (True, '12-4'), (True, '12-5'), (True, '12-6'), (True, '12-7'), (True, '12-8'), (True, '12-9')],
-    [(False, '13-8'), (False, '13-9')],
-    [(False, '13-7'), (False, '13-9')],
-    [(False, '13-7'), (False, '13-8')],
-    [(False, '13-6'), (False, '13-9')],
-    [(False, '13-6'), (False, '13-8')],
-    [(False, '13-6'), (False, '13-7')],
-    [(False, '13-5'), (False, '13-9')],
-    [(False, '13-5'), (False, '13-8')],
-    [(False, '13-5'), (False, '13-7')],
-    [(False, '13-5'), (False, '13-6')],
-    [(False, '13-4'), (False, '13-9')],
-    [(False, '13-4'), (False, '13-8')],
-    [(False, '13-4'), (False, '13-7')],
-    [(False, '13-4'), (False, '13-6')],
-    [(False, '13-4'), (False, '13-5')],
-    [(False, '13-3'), (False, '13-9')],
-    [(False, '13-3'), (False, '13-8')],
-    [(False, '13-3'), (False, '13-7')],
-    [(False, '13-3'), (False, '13-6')],
-    [(False, '13-3'), (False, '13-5')],
-    [(False, '13-3'), (False, '13-4')],
-    [(False, '13-2'), (False, '13-9')],
-    [(False, '13-2'), (False, '13-8')],
-    [(False, '13-2'), (False, '13-7')],
-    [(False, '13-2'), (False, '13-6')],
-    [(False, '13-2'), (False, '13-5')],
-    [(False, '13-2'), (False, '13-4')],
-    [(False, '13-2'), (False, '13-3')],
-    [(False, '13-1'), (False, '13-9')],
-    [(False, '13-1'), (False, '13-8')],
-    [(False, '13-1'), (False, '13-7')],
-    [(False, '13-1'), (False, '13-6')],
-    [(False, '13-1'), (False, '13-5')],
-    [(False, '13-1'), (False, '13-4')],
-    [(False, '13-1'), (False, '13-3')],
-    [(False, '13-1'), (False, '13-2')],
-    [(True, '13-1'), (True, '13-2'), (True, '13-3'), (True, '13-4'), (True, '13-5'), (True, '13-6'), (True, '13-7'), (True, '13-8'), (True, '13-9')],
-    [(False, '14-8'), (False, '14-9')],
-    [(False, '14-7'), (False, '14-9')],
-    [(False, '14-7'), (False, '14-8')],
-    [(False, '14-6'), (False, '14-9')],
-    [(False, '14-6'), (False, '14-8')],
-    [(False, '14-6'), (False, '14-7')],
-    [(False, '14-5'), (False, '14-9')],
-    [(False, '14-5'), (False, '14-8')],
-    [(False, '14-5'), (False, '14-7')],
-    [(False, '14-5'), (False, '14-6')],
-    [(False, '14-4'), (False, '14-9')],
-    [(False, '14-4'), (False, '14-8')],
-    [(False, '14-4'), (False, '14-7')],
-    [(False, '14-4'), (False, '14-6')],
-    [(False, '14-4'), (False, '14-5')],
-    [(False, '14-3'), (False, '14-9')],
-    [(False, '14-3'), (False, '14-8')],
-    [(False, '14-3'), (False, '14-7')],
-    [(False, '14-3'), (False, '14-6')],
-    [(False, '14-3'), (False, '14-5')],
-    [(False, '14-3'), (False, '14-4')],
-    [(False, '14-2'), (False, '14-9')],
-    [(False, '14-2'), (False, '14-8')],
-    [(False, '14-2'), (False, '14-7')],
-    [(False, '14-2'), (False, '14-6')],
-    [(False, '14-2'), (False, '14-5')],
-    [(False, '14-2'), (False, '14-4')],
-    [(False, '14-2'), (False, '14-3')],
-    [(False, '14-1'), (False, '14-9')],
-    [(False, '14-1'), (False, '14-8')],
-    [(False, '14-1'), (False, '14-7')],
-    [(False, '14-1'), (False, '14-6')],
-    [(False, '14-1'), (False, '14-5')],
-    [(False, '14-1'), (False, '14-4')],
-    [(False, '14-1'), (False, '14-3')],
-    [(False, '14-1'), (False, '14-2')],
-    [(True, '14-1'), (True, '14-2'), (True, '14-3'), (True, '14-4'), (True, '14-5'), (True, '14-6'), (True, '14-7'), (True, '14-8'), (True, '14-9')],
-    [(False, '15-8'), (False, '15-9')],
-    [(False, '15-7'), (False, '15-9')],
-    [(False, '15-7'), (False, '15-8')],
-    [(False, '15-6'), (False, '15-9')],
-    [(False, '15-6'), (False, '15-8')],
-    [(False, '15-6'), (False, '15-7')],
-    [(False, '15-5'), (False, '15-9')],
-    [(False, '15-5'), (False, '15-8')],
-    [(False, '15-5'), (False, '15-7')],
-    [(False, '15-5'), (False, '15-6')],
-    [(False, '15-4'), (False, '15-9')],
-    [(False, '15-4'), (False, '15-8')],
-    [(False, '15-4'), (False, '15-7')],
-    [(False, '15-4'), (False, '15-6')],
-    [(False, '15-4'), (False, '15-5')],
-    [(False, '15-3'), (False, '15-9')],
-    [(False, '15-3'), (False, '15-8')],
-    [(False, '15-3'), (False, '15-7')],
-    [(False, '15-3'), (False, '15-6')],
-    [(False, '15-3'), (False, '15-5')],
-    [(False, '15-3'), (False, '15-4')],
-    [(False, '15-2'), (False, '15-9')],
-    [(False, '15-2'), (False, '15-8')],
-    [(False, '15-2'), (False, '15-7')],
-    [(False, '15-2'), (False, '15-6')],
-    [(False, '15-2'), (False, '15-5')],
-    [(False, '15-2'), (False, '15-4')],
-    [(False, '15-2'), (False, '15-3')],
-    [(False, '15-1'), (False, '15-9')],
-    [(False, '15-1'), (False, '15-8')],
-    [(False, '15-1'), (False, '15-7')],
-    [(False, '15-1'), (False, '15-6')],
-    [(False, '15-1'), (False, '15-5')],
-    [(False, '15-1'), (False, '15-4')],
-    [(False, '15-1'), (False, '15-3')],
-    [(False, '15-1'), (False, '15-2')],
-    [(True, '15-1'), (True, '15-2'), (True, '15-3'), (True, '15-4'), (True, '15-5'), (True, '15-6'), (True, '15-7'), (True, '15-8'), (True, '15-9')],
-    [(False, '16-8'), (False, '16-9')],
-    [(False, '16-7'), (False, '16-9')],
-    [(False, '16-7'), (False, '16-8')],
-    [(False, '16-6'), (False, '16-9')],
-    [(False, '16-6'), (False, '16-8')],
-    [(False, '16-6'), (False, '16-7')],
-    [(False, '16-5'), (False, '16-9')],
-    [(False, '16-5'), (False, '16-8')],
-    [(False, '16-5'), (False, '16-7')],
-    [(False, '16-5'), (False, '16-6')],
-    [(False, '16-4'), (False, '16-9')],
-    [(False, '16-4'), (False, '16-8')],
-    [(False, '16-4'), (False, '16-7')],
-    [(False, '16-4'), (False, '16-6')],
-    [(False, '16-4'), (False, '16-5')],
-    [(False, '16-3'), (False, '16-9')],
-    [(False, '16-3'), (False, '16-8')],
-    [(False, '16-3'), (False, '16-7')],
-    [(False, '16-3'), (False, '16-6')],
-    [(False, '16-3'), (False, '16-5')],
-    [(False, '16-3'), (False, '16-4')],
-    [(False, '16-2'), (False, '16-9')],
-    [(False, '16-2'), (False, '16-8')],
-    [(False, '16-2'), (False, '16-7')],
-    [(False, '16-2'), (False, '16-6')],
-    [(False, '16-2'), (False, '16-5')],
-    [(False, '16-2'), (False, '16-4')],
-    [(False, '16-2'), (False, '16-3')],
-    [(False, '16-1'), (False, '16-9')],
-    [(False, '16-1'), (False, '16-8')],
-    [(False, '16-1'), (False, '16-7')],
-    [(False, '16-1'), (False, '16-6')],
-    [(False, '16-1'), (False, '16-5')],
-    [(False, '16-1'), (False, '16-4')],
-    [(False, '16-1'), (False, '16-3')],
-    [(False, '16-1'), (False, '16-2')],
-    [(True, '16-1'), (True, '16-2'), (True, '16-3'), (True, '16-4'), (True, '16-5'), (True, '16-6'), (True, '16-7'), (True, '16-8'), (True, '16-9')],
-    [(False, '17-8'), (False, '17-9')],
-    [(False, '17-7'), (False, '17-9')],
-    [(False, '17-7'), (False, '17-8')],
-    [(False, '17-6'), (False, '17-9')],
-    [(False, '17-6'), (False, '17-8')],
-    [(False, '17-6'), (False, '17-7')],
-    [(False, '17-5'), (False, '17-9')],
-    [(False, '17-5'), (False, '17-8')],
-    [(False, '17-5'), (False, '17-7')],
-    [(False, '17-5'), (False, '17-6')],
-    [(False, '17-4'), (False, '17-9')],
-    [(False, '17-4'), (False, '17-8')],
-    [(False, '17-4'), (False, '17-7')],
-    [(False, '17-4'), (False, '17-6')],
-    [(False, '17-4'), (False, '17-5')],
-    [(False, '17-3'), (False, '17-9')],
-    [(False, '17-3'), (False, '17-8')],
-    [(False, '17-3'), (False, '17-7')],
-    [(False, '17-3'), (False, '17-6')],
-    [(False, '17-3'), (False, '17-5')],
-    [(False, '17-3'), (False, '17-4')],
-    [(False, '17-2'), (False, '17-9')],
-    [(False, '17-2'), (False, '17-8')],
-    [(False, '17-2'), (False, '17-7')],
-    [(False, '17-2'), (False, '17-6')],
-    [(False, '17-2'), (False, '17-5')],
-    [(False, '17-2'), (False, '17-4')],
-    [(False, '17-2'), (False, '17-3')],
-    [(False, '17-1'), (False, '17-9')],
-    [(False, '17-1'), (False, '17-8')],
-    [(False, '17-1'), (False, '17-7')],
-    [(False, '17-1'), (False, '17-6')],
-    [(False, '17-1'), (False, '17-5')],
-    [(False, '17-1'), (False, '17-4')],
-    [(False, '17-1'), (False, '17-3')],
-    [(False, '17-1'), (False, '17-2')],
-    [(True, '17-1'), (True, '17-2'), (True, '17-3'), (True, '17-4'), (True, '17-5'), (True, '17-6'), (True, '17-7'), (True, '17-8'), (True, '17-9')],
-    [(False, '18-8'), (False, '18-9')],
-    [(False, '18-7'), (False, '18-9')],
-    [(False, '18-7'), (False, '18-8')],
-    [(False, '18-6'), (False, '18-9')],
-    [(False, '18-6'), (False, '18-8')],
-    [(False, '18-6'), (False, '18-7')],
-    [(False, '18-5'), (False, '18-9')],
-    [(False, '18-5'), (False, '18-8')],
-    [(False, '18-5'), (False, '18-7')],
-    [(False, '18-5'), (False, '18-6')],
-    [(False, '18-4'), (False, '18-9')],
-    [(False, '18-4'), (False, '18-8')],
-    [(False, '18-4'), (False, '18-7')],
-    [(False, '18-4'), (False, '18-6')],
-    [(False, '18-4'), (False, '18-5')],
-    [(False, '18-3'), (False, '18-9')],
-    [(False, '18-3'), (False, '18-8')],
-    [(False, '18-3'), (False, '18-7')],
-    [(False, '18-3'), (False, '18-6')],
-    [(False, '18-3'), (False, '18-5')],
-    [(False, '18-3'), (False, '18-4')],
-    [(False, '18-2'), (False, '18-9')],
-    [(False, '18-2'), (False, '18-8')],
-    [(False, '18-2'), (False, '18-7')],
-    [(False, '18-2'), (False, '18-6')],
-    [(False, '18-2'), (False, '18-5')],
-    [(False, '18-2'), (False, '18-4')],
-    [(False, '18-2'), (False, '18-3')],
-    [(False, '18-1'), (False, '18-9')],
-    [(False, '18-1'), (False, '18-8')],
-    [(False, '18-1'), (False, '18-7')],
-    [(False, '18-1'), (False, '18-6')],
-    [(False, '18-1'), (False, '18-5')],
-    [(False, '18-1'), (False, '18-4')],
-    [(False, '18-1'), (False, '18-3')],
-    [(False, '18-1'), (False, '18-2')],
-    [(True, '18-1'), (True, '18-2'), (True, '18-3'), (True, '18-4'), (True, '18-5'), (True, '18-6'), (True, '18-7'), (True, '18-8'), (True, '18-9')],
-    [(False, '20-8'), (False, '20-9')],
-    [(False, '20-7'), (False, '20-9')],
-    [(False, '20-7'), (False, '20-8')],
-    [(False, '20-6'), (False, '20-9')],
-    [(False, '20-6'), (False, '20-8')],
-    [(False, '20-6'), (False, '20-7')],
-    [(False, '20-5'), (False, '20-9')],
-    [(False, '20-5'), (False, '20-8')],
-    [(False, '20-5'), (False, '20-7')],
-    [(False, '20-5'), (False, '20-6')],
-    [(False, '20-4'), (False, '20-9')],
-    [(False, '20-4'), (False, '20-8')],
-    [(False, '20-4'), (False, '20-7')],
-    [(False, '20-4'), (False, '20-6')],
-    [(False, '20-4'), (False, '20-5')],
-    [(False, '20-3'), (False, '20-9')],
-    [(False, '20-3'), (False, '20-8')],
-    [(False, '20-3'), (False, '20-7')],
-    [(False, '20-3'), (False, '20-6')],
-    [(False, '20-3'), (False, '20-5')],
-    [(False, '20-3'), (False, '20-4')],
-    [(False, '20-2'), (False, '20-9')],
-    [(False, '20-2'), (False, '20-8')],
-    [(False, '20-2'), (False, '20-7')],
-    [(False, '20-2'), (False, '20-6')],
-    [(False, '20-2'), (False, '20-5')],
-    [(False, '20-2'), (False, '20-4')],
-    [(False, '20-2'), (False, '20-3')],
-    [(False, '20-1'), (False, '20-9')],
-    [(False, '20-1'), (False, '20-8')],
-    [(False, '20-1'), (False, '20-7')],
-    [(False, '20-1'), (False, '20-6')],
-    [(False, '20-1'), (False, '20-5')],
-    [(False, '20-1'), (False, '20-4')],
-    [(False, '20-1'), (False, '20-3')],
-    [(False, '20-1'), (False, '20-2')],
-    [(True, '20-1'), (True, '20-2'), (True, '20-3'), (True, '20-4'), (True, '20-5'), (True, '20-6'), (True, '20-7'), (True, '20-8'), (True, '20-9')],
-    [(False, '21-8'), (False, '21-9')],
-    [(False, '21-7'), (False, '21-9')],
-    [(False, '21-7'), (False, '21-8')],
-    [(False, '21-6'), (False, '21-9')],
-    [(False, '21-6'), (False, '21-8')],
-    [(False, '21-6'), (False, '21-7')],
-    [(False, '21-5'), (False, '21-9')],
-    [(False, '21-5'), (False, '21-8')],
-    [(False, '21-5'), (False, '21-7')],
-    [(False, '21-5'), (False, '21-6')],
-    [(False, '21-4'), (False, '21-9')],
-    [(False, '21-4'), (False, '21-8')],
-    [(False, '21-4'), (False, '21-7')],
-    [(False, '21-4'), (False, '21-6')],
-    [(False, '21-4'), (False, '21-5')],
-    [(False, '21-3'), (False, '21-9')],
-    [(False, '21-3'), (False, '21-8')],
-    [(False, '21-3'), (False, '21-7')],
-    [(False, '21-3'), (False, '21-6')],
-    [(False, '21-3'), (False, '21-5')],
-    [(False, '21-3'), (False, '21-4')],
-    [(False, '21-2'), (False, '21-9')],
-    [(False, '21-2'), (False, '21-8')],
-    [(False, '21-2'), (False, '21-7')],
-    [(False, '21-2'), (False, '21-6')],
-    [(False, '21-2'), (False, '21-5')],
-    [(False, '21-2'), (False, '21-4')],
-    [(False, '21-2'), (False, '21-3')],
-    [(False, '21-1'), (False, '21-9')],
-    [(False, '21-1'), (False, '21-8')],
-    [(False, '21-1'), (False, '21-7')],
-    [(False, '21-1'), (False, '21-6')],
-    [(False, '21-1'), (False, '21-5')],
-    [(False, '21-1'), (False, '21-4')],
-    [(False, '21-1'), (False, '21-3')],
-    [(False, '21-1'), (False, '21-2')],
-    [(True, '21-1'), (True, '21-2'), (True, '21-3'), (True, '21-4'), (True, '21-5'), (True, '21-6'), (True, '21-7'), (True, '21-8'), (True, '21-9')],
-    [(False, '22-8'), (False, '22-9')],
-    [(False, '22-7'), (False, '22-9')],
-    [(False, '22-7'), (False, '22-8')],
-    [(False, '22-6'), (False, '22-9')],
-    [(False, '22-6'), (False, '22-8')],
-    [(False, '22-6'), (False, '22-7')],
-    [(False, '22-5'), (False, '22-9')],
-    [(False, '22-5'), (False, '22-8')],
-    [(False, '22-5'), (False, '22-7')],
-    [(False, '22-5'), (False, '22-6')],
-    [(False, '22-4'), (False, '22-9')],
-    [(False, '22-4'), (False, '22-8')],
-    [(False, '22-4'), (False, '22-7')],
-    [(False, '22-4'), (False, '22-6')],
-    [(False, '22-4'), (False, '22-5')],
-    [(False, '22-3'), (False, '22-9')],
-    [(False, '22-3'), (False, '22-8')],
-    [(False, '22-3'), (False, '22-7')],
-    [(False, '22-3'), (False, '22-6')],
-    [(False, '22-3'), (False, '22-5')],
-    [(False, '22-3'), (False, '22-4')],
-    [(False, '22-2'), (False, '22-9')],
-    [(False, '22-2'), (False, '22-8')],
-    [(False, '22-2'), (False, '22-7')],
-    [(False, '22-2'), (False, '22-6')],
-    [(False, '22-2'), (False, '22-5')],
-    [(False, '22-2'), (False, '22-4')],
-    [(False, '22-2'), (False, '22-3')],
-    [(False, '22-1'), (False, '22-9')],
-    [(False, '22-1'), (False, '22-8')],
-    [(False, '22-1'), (False, '22-7')],
-    [(False, '22-1'), (False, '22-6')],
-    [(False, '22-1'), (False, '22-5')],
-    [(False, '22-1'), (False, '22-4')],
-    [(False, '22-1'), (False, '22-3')],
-    [(False, '22-1'), (False, '22-2')],
-    [(True, '22-1'), (True, '22-2'), (True, '22-3'), (True, '22-4'), (True, '22-5'), (True, '22-6'), (True, '22-7'), (True, '22-8'), (True, '22-9')],
-    [(False, '23-8'), (False, '23-9')],
-    [(False, '23-7'), (False, '23-9')],
-    [(False, '23-7'), (False, '23-8')],
-    [(False, '23-6'), (False, '23-9')],
-    [(False, '23-6'), (False, '23-8')],
-    [(False, '23-6'), (False, '23-7')],
-    [(False, '23-5'), (False, '23-9')],
-    [(False, '23-5'), (False, '23-8')],
-    [(False, '23-5'), (False, '23-7')],
-    [(False, '23-5'), (False, '23-6')],
-    [(False, '23-4'), (False, '23-9')],
-    [(False, '23-4'), (False, '23-8')],
-    [(False, '23-4'), (False, '23-7')],
-    [(False, '23-4'), (False, '23-6')],
-    [(False, '23-4'), (False, '23-5')],
-    [(False, '23-3'), (False, '23-9')],
-    [(False, '23-3'), (False, '23-8')],
-    [(False, '23-3'), (False, '23-7')],
-    [(False, '23-3'), (False, '23-6')],
-    [(False, '23-3'), (False, '23-5')],
-    [(False, '23-3'), (False, '23-4')],
-    [(False, '23-2'), (False, '23-9')],
-    [(False, '23-2'), (False, '23-8')],
-    [(False, '23-2'), (False, '23-7')],
-    [(False, '23-2'), (False, '23-6')],
-    [(False, '23-2'), (False, '23-5')],
-    [(False, '23-2'), (False, '23-4')],
-    [(False, '23-2'), (False, '23-3')],
-    [(False, '23-1'), (False, '23-9')],
-    [(False, '23-1'), (False, '23-8')],
-    [(False, '23-1'), (False, '23-7')],
-    [(False, '23-1'), (False, '23-6')],
-    [(False, '23-1'), (False, '23-5')],
-    [(False, '23-1'), (False, '23-4')],
-    [(False, '23-1'), (False, '23-3')],
-    [(False, '23-1'), (False, '23-2')],
-    [(True, '23-1'), (True, '23-2'), (True, '23-3'), (True, '23-4'), (True, '23-5'), (True, '23-6'), (True, '23-7'), (True, '23-8'), (True, '23-9')],
-    [(False, '24-8'), (False, '24-9')],
-    [(False, '24-7'), (False, '24-9')],
-    [(False, '24-7'), (False, '24-8')],
-    [(False, '24-6'), (False, '24-9')],
-    [(False, '24-6'), (False, '24-8')],
-    [(False, '24-6'), (False, '24-7')],
-    [(False, '24-5'), (False, '24-9')],
-    [(False, '24-5'), (False, '24-8')],
-    [(False, '24-5'), (False, '24-7')],
-    [(False, '24-5'), (False, '24-6')],
-    [(False, '24-4'), (False, '24-9')],
-    [(False, '24-4'), (False, '24-8')],
-    [(False, '24-4'), (False, '24-7')],
-    [(False, '24-4'), (False, '24-6')],
-    [(False, '24-4'), (False, '24-5')],
-    [(False, '24-3'), (False, '24-9')],
-    [(False, '24-3'), (False, '24-8')],
-    [(False, '24-3'), (False, '24-7')],
-    [(False, '24-3'), (False, '24-6')],
-    [(False, '24-3'), (False, '24-5')],
-    [(False, '24-3'), (False, '24-4')],
-    [(False, '24-2'), (False, '24-9')],
-    [(False, '24-2'), (False, '24-8')],
-    [(False, '24-2'), (False, '24-7')],
-    [(False, '24-2'), (False, '24-6')],
-    [(False, '24-2'), (False, '24-5')],
-    [(False, '24-2'), (False, '24-4')],
-    [(False, '24-2'), (False, '24-3')],
-    [(False, '24-1'), (False, '24-9')],
-    [(False, '24-1'), (False, '24-8')],
-    [(False, '24-1'), (False, '24-7')],
-    [(False, '24-1'), (False, '24-6')],
-    [(False, '24-1'), (False, '24-5')],
-    [(False, '24-1'), (False, '24-4')],
-    [(False, '24-1'), (False, '24-3')],
-    [(False, '24-1'), (False, '24-2')],
-    [(True, '24-1'), (True, '24-2'), (True, '24-3'), (True, '24-4'), (True, '24-5'), (True, '24-6'), (True, '24-7'), (True, '24-8'), (True, '24-9')],
-    [(False, '25-8'), (False, '25-9')],
-    [(False, '25-7'), (False, '25-9')],
-    [(False, '25-7'), (False, '25-8')],
-    [(False, '25-6'), (False, '25-9')],
-    [(False, '25-6'), (False, '25-8')],
-    [(False, '25-6'), (False, '25-7')],
-    [(False, '25-5'), (False, '25-9')],
-    [(False, '25-5'), (False, '25-8')],
-    [(False, '25-5'), (False, '25-7')],
-    [(False, '25-5'), (False, '25-6')],
-    [(False, '25-4'), (False, '25-9')],
-    [(False, '25-4'), (False, '25-8')],
-    [(False, '25-4'), (False, '25-7')],
-    [(False, '25-4'), (False, '25-6')],
-    [(False, '25-4'), (False, '25-5')],
-    [(False, '25-3'), (False, '25-9')],
-    [(False, '25-3'), (False, '25-8')],
-    [(False, '25-3'), (False, '25-7')],
-    [(False, '25-3'), (False, '25-6')],
-    [(False, '25-3'), (False, '25-5')],
-    [(False, '25-3'), (False, '25-4')],
-    [(False, '25-2'), (False, '25-9')],
-    [(False, '25-2'), (False, '25-8')],
-    [(False, '25-2'), (False, '25-7')],
-    [(False, '25-2'), (False, '25-6')],
-    [(False, '25-2'), (False, '25-5')],
-    [(False, '25-2'), (False, '25-4')],
-    [(False, '25-2'), (False, '25-3')],
-    [(False, '25-1'), (False, '25-9')],
-    [(False, '25-1'), (False, '25-8')],
-    [(False, '25-1'), (False, '25-7')],
-    [(False, '25-1'), (False, '25-6')],
-    [(False, '25-1'), (False, '25-5')],
-    [(False, '25-1'), (False, '25-4')],
-    [(False, '25-1'), (False, '25-3')],
-    [(False, '25-1'), (False, '25-2')],
-    [(True, '25-1'), (True, '25-2'), (True, '25-3'), (True, '25-4'), (True, '25-5'), (True, '25-6'), (True, '25-7'), (True, '25-8'), (True, '25-9')],
-    [(False, '26-8'), (False, '26-9')],
-    [(False, '26-7'), (False, '26-9')],
-    [(False, '26-7'), (False, '26-8')],
-    [(False, '26-6'), (False, '26-9')],
-    [(False, '26-6'), (False, '26-8')],
-    [(False, '26-6'), (False, '26-7')],
-    [(False, '26-5'), (False, '26-9')],
-    [(False, '26-5'), (False, '26-8')],
-    [(False, '26-5'), (False, '26-7')],
-    [(False, '26-5'), (False, '26-6')],
-    [(False, '26-4'), (False, '26-9')],
-    [(False, '26-4'), (False, '26-8')],
-    [(False, '26-4'), (False, '26-7')],
-    [(False, '26-4'), (False, '26-6')],
-    [(False, '26-4'), (False, '26-5')],
-    [(False, '26-3'), (False, '26-9')],
-    [(False, '26-3'), (False, '26-8')],
-    [(False, '26-3'), (False, '26-7')],
-    [(False, '26-3'), (False, '26-6')],
-    [(False, '26-3'), (False, '26-5')],
-    [(False, '26-3'), (False, '26-4')],
-    [(False, '26-2'), (False, '26-9')],
-    [(False, '26-2'), (False, '26-8')],
-    [(False, '26-2'), (False, '26-7')],
-    [(False, '26-2'), (False, '26-6')],
-    [(False, '26-2'), (False, '26-5')],
-    [(False, '26-2'), (False, '26-4')],
-    [(False, '26-2'), (False, '26-3')],
-    [(False, '26-1'), (False, '26-9')],
-    [(False, '26-1'), (False, '26-8')],
-    [(False, '26-1'), (False, '26-7')],
-    [(False, '26-1'), (False, '26-6')],
-    [(False, '26-1'), (False, '26-5')],
-    [(False, '26-1'), (False, '26-4')],
-    [(False, '26-1'), (False, '26-3')],
-    [(False, '26-1'), (False, '26-2')],
-    [(True, '26-1'), (True, '26-2'), (True, '26-3'), (True, '26-4'), (True, '26-5'), (True, '26-6'), (True, '26-7'), (True, '26-8'), (True, '26-9')],
-    [(False, '27-8'), (False, '27-9')],
-    [(False, '27-7'), (False, '27-9')],
-    [(False, '27-7'), (False, '27-8')],
-    [(False, '27-6'), (False, '27-9')],
-    [(False, '27-6'), (False, '27-8')],
-    [(False, '27-6'), (False, '27-7')],
-    [(False, '27-5'), (False, '27-9')],
-    [(False, '27-5'), (False, '27-8')],
-    [(False, '27-5'), (False, '27-7')],
-    [(False, '27-5'), (False, '27-6')],
-    [(False, '27-4'), (False, '27-9')],
-    [(False, '27-4'), (False, '27-8')],
-    [(False, '27-4'), (False, '27-7')],
-    [(False, '27-4'), (False, '27-6')],
-    [(False, '27-4'), (False, '27-5')],
-    [(False, '27-3'), (False, '27-9')],
-    [(False, '27-3'), (False, '27-8')],
-    [(False, '27-3'), (False, '27-7')],
-    [(False, '27-3'), (False, '27-6')],
-    [(False, '27-3'), (False, '27-5')],
-    [(False, '27-3'), (False, '27-4')],
-    [(False, '27-2'), (False, '27-9')],
-    [(False, '27-2'), (False, '27-8')],
-    [(False, '27-2'), (False, '27-7')],
-    [(False, '27-2'), (False, '27-6')],
-    [(False, '27-2'), (False, '27-5')],
-    [(False, '27-2'), (False, '27-4')],
-    [(False, '27-2'), (False, '27-3')],
-    [(False, '27-1'), (False, '27-9')],
-    [(False, '27-1'), (False, '27-8')],
-    [(False, '27-1'), (False, '27-7')],
-    [(False, '27-1'), (False, '27-6')],
-    [(False, '27-1'), (False, '27-5')],
-    [(False, '27-1'), (False, '27-4')],
-    [(False, '27-1'), (False, '27-3')],
-    [(False, '27-1'), (False, '27-2')],
-    [(True, '27-1'), (True, '27-2'), (True, '27-3'), (True, '27-4'), (True, '27-5'), (True, '27-6'), (True, '27-7'), (True, '27-8'), (True, '27-9')],
-    [(False, '28-8'), (False, '28-9')],
-    [(False, '28-7'), (False, '28-9')],
-    [(False, '28-7'), (False, '28-8')],
-    [(False, '28-6'), (False, '28-9')],
-    [(False, '28-6'), (False, '28-8')],
-    [(False, '28-6'), (False, '28-7')],
-    [(False, '28-5'), (False, '28-9')],
-    [(False, '28-5'), (False, '28-8')],
-    [(False, '28-5'), (False, '28-7')],
-    [(False, '28-5'), (False, '28-6')],
-    [(False, '28-4'), (False, '28-9')],
-    [(False, '28-4'), (False, '28-8')],
-    [(False, '28-4'), (False, '28-7')],
-    [(False, '28-4'), (False, '28-6')],
-    [(False, '28-4'), (False, '28-5')],
-    [(False, '28-3'), (False, '28-9')],
-    [(False, '28-3'), (False, '28-8')],
-    [(False, '28-3'), (False, '28-7')],
-    [(False, '28-3'), (False, '28-6')],
-    [(False, '28-3'), (False, '28-5')],
-    [(False, '28-3'), (False, '28-4')],
-    [(False, '28-2'), (False, '28-9')],
-    [(False, '28-2'), (False, '28-8')],
-    [(False, '28-2'), (False, '28-7')],
-    [(False, '28-2'), (False, '28-6')],
-    [(False, '28-2'), (False, '28-5')],
-    [(False, '28-2'), (False, '28-4')],
-    [(False, '28-2'), (False, '28-3')],
-    [(False, '28-1'), (False, '28-9')],
-    [(False, '28-1'), (False, '28-8')],
-    [(False, '28-1'), (False, '28-7')],
-    [(False, '28-1'), (False, '28-6')],
-    [(False, '28-1'), (False, '28-5')],
-    [(False, '28-1'), (False, '28-4')],
-    [(False, '28-1'), (False, '28-3')],
-    [(False, '28-1'), (False, '28-2')],
-    [(True, '28-1'), (True, '28-2'), (True, '28-3'), (True, '28-4'), (True, '28-5'), (True, '28-6'), (True, '28-7'), (True, '28-8'), (True, '28-9')],
-    [(False, '30-8'), (False, '30-9')],
-    [(False, '30-7'), (False, '30-9')],
-    [(False, '30-7'), (False, '30-8')],
-    [(False, '30-6'), (False, '30-9')],
-    [(False, '30-6'), (False, '30-8')],
-    [(False, '30-6'), (False, '30-7')],
-    [(False, '30-5'), (False, '30-9')],
-    [(False, '30-5'), (False, '30-8')],
-    [(False, '30-5'), (False, '30-7')],
-    [(False, '30-5'), (False, '30-6')],
-    [(False, '30-4'), (False, '30-9')],
-    [(False, '30-4'), (False, '30-8')],
-    [(False, '30-4'), (False, '30-7')],
-    [(False, '30-4'), (False, '30-6')],
-    [(False, '30-4'), (False, '30-5')],
-    [(False, '30-3'), (False, '30-9')],
-    [(False, '30-3'), (False, '30-8')],
-    [(False, '30-3'), (False, '30-7')],
-    [(False, '30-3'), (False, '30-6')],
-    [(False, '30-3'), (False, '30-5')],
-    [(False, '30-3'), (False, '30-4')],
-    [(False, '30-2'), (False, '30-9')],
-    [(False, '30-2'), (False, '30-8')],
-    [(False, '30-2'), (False, '30-7')],
-    [(False, '30-2'), (False, '30-6')],
-    [(False, '30-2'), (False, '30-5')],
-    [(False, '30-2'), (False, '30-4')],
-    [(False, '30-2'), (False, '30-3')],
-    [(False, '30-1'), (False, '30-9')],
-    [(False, '30-1'), (False, '30-8')],
-    [(False, '30-1'), (False, '30-7')],
-    [(False, '30-1'), (False, '30-6')],
-    [(False, '30-1'), (False, '30-5')],
-    [(False, '30-1'), (False, '30-4')],
-    [(False, '30-1'), (False, '30-3')],
-    [(False, '30-1'), (False, '30-2')],
-    [(True, '30-1'), (True, '30-2'), (True, '30-3'), (True, '30-4'), (True, '30-5'), (True, '30-6'), (True, '30-7'), (True, '30-8'), (True, '30-9')],
-    [(False, '31-8'), (False, '31-9')],
-    [(False, '31-7'), (False, '31-9')],
-    [(False, '31-7'), (False, '31-8')],
-    [(False, '31-6'), (False, '31-9')],
-    [(False, '31-6'), (False, '31-8')],
-    [(False, '31-6'), (False, '31-7')],
-    [(False, '31-5'), (False, '31-9')],
-    [(False, '31-5'), (False, '31-8')],
-    [(False, '31-5'), (False, '31-7')],
-    [(False, '31-5'), (False, '31-6')],
-    [(False, '31-4'), (False, '31-9')],
-    [(False, '31-4'), (False, '31-8')],
-    [(False, '31-4'), (False, '31-7')],
-    [(False, '31-4'), (False, '31-6')],
-    [(False, '31-4'), (False, '31-5')],
-    [(False, '31-3'), (False, '31-9')],
-    [(False, '31-3'), (False, '31-8')],
-    [(False, '31-3'), (False, '31-7')],
-    [(False, '31-3'), (False, '31-6')],
-    [(False, '31-3'), (False, '31-5')],
-    [(False, '31-3'), (False, '31-4')],
-    [(False, '31-2'), (False, '31-9')],
-    [(False, '31-2'), (False, '31-8')],
-    [(False, '31-2'), (False, '31-7')],
-    [(False, '31-2'), (False, '31-6')],
-    [(False, '31-2'), (False, '31-5')],
-    [(False, '31-2'), (False, '31-4')],
-    [(False, '31-2'), (False, '31-3')],
-    [(False, '31-1'), (False, '31-9')],
-    [(False, '31-1'), (False, '31-8')],
-    [(False, '31-1'), (False, '31-7')],
-    [(False, '31-1'), (False, '31-6')],
-    [(False, '31-1'), (False, '31-5')],
-    [(False, '31-1'), (False, '31-4')],
-    [(False, '31-1'), (False, '31-3')],
-    [(False, '31-1'), (False, '31-2')],
-    [(True, '31-1'), (True, '31-2'), (True, '31-3'), (True, '31-4'), (True, '31-5'), (True, '31-6'), (True, '31-7'), (True, '31-8'), (True, '31-9')],
-    [(False, '32-8'), (False, '32-9')],
-    [(False, '32-7'), (False, '32-9')],
-    [(False, '32-7'), (False, '32-8')],
-    [(False, '32-6'), (False, '32-9')],
-    [(False, '32-6'), (False, '32-8')],
-    [(False, '32-6'), (False, '32-7')],
-    [(False, '32-5'), (False, '32-9')],
-    [(False, '32-5'), (False, '32-8')],
-    [(False, '32-5'), (False, '32-7')],
-    [(False, '32-5'), (False, '32-6')],
-    [(False, '32-4'), (False, '32-9')],
-    [(False, '32-4'), (False, '32-8')],
-    [(False, '32-4'), (False, '32-7')],
-    [(False, '32-4'), (False, '32-6')],
-    [(False, '32-4'), (False, '32-5')],
-    [(False, '32-3'), (False, '32-9')],
-    [(False, '32-3'), (False, '32-8')],
-    [(False, '32-3'), (False, '32-7')],
-    [(False, '32-3'), (False, '32-6')],
-    [(False, '32-3'), (False, '32-5')],
-    [(False, '32-3'), (False, '32-4')],
-    [(False, '32-2'), (False, '32-9')],
-    [(False, '32-2'), (False, '32-8')],
-    [(False, '32-2'), (False, '32-7')],
-    [(False, '32-2'), (False, '32-6')],
-    [(False, '32-2'), (False, '32-5')],
-    [(False, '32-2'), (False, '32-4')],
-    [(False, '32-2'), (False, '32-3')],
-    [(False, '32-1'), (False, '32-9')],
-    [(False, '32-1'), (False, '32-8')],
-    [(False, '32-1'), (False, '32-7')],
-    [(False, '32-1'), (False, '32-6')],
-    [(False, '32-1'), (False, '32-5')],
-    [(False, '32-1'), (False, '32-4')],
-    [(False, '32-1'), (False, '32-3')],
-    [(False, '32-1'), (False, '32-2')],
-    [(True, '32-1'), (True, '32-2'), (True, '32-3'), (True, '32-4'), (True, '32-5'), (True, '32-6'), (True, '32-7'), (True, '32-8'), (True, '32-9')],
-    [(False, '33-8'), (False, '33-9')],
-    [(False, '33-7'), (False, '33-9')],
-    [(False, '33-7'), (False, '33-8')],
-    [(False, '33-6'), (False, '33-9')],
-    [(False, '33-6'), (False, '33-8')],
-    [(False, '33-6'), (False, '33-7')],
-    [(False, '33-5'), (False, '33-9')],
-    [(False, '33-5'), (False, '33-8')],
-    [(False, '33-5'), (False, '33-7')],
-    [(False, '33-5'), (False, '33-6')],
-    [(False, '33-4'), (False, '33-9')],
-    [(False, '33-4'), (False, '33-8')],
-    [(False, '33-4'), (False, '33-7')],
-    [(False, '33-4'), (False, '33-6')],
-    [(False, '33-4'), (False, '33-5')],
-    [(False, '33-3'), (False, '33-9')],
-    [(False, '33-3'), (False, '33-8')],
-    [(False, '33-3'), (False, '33-7')],
-    [(False, '33-3'), (False, '33-6')],
-    [(False, '33-3'), (False, '33-5')],
-    [(False, '33-3'), (False, '33-4')],
-    [(False, '33-2'), (False, '33-9')],
-    [(False, '33-2'), (False, '33-8')],
-    [(False, '33-2'), (False, '33-7')],
-    [(False, '33-2'), (False, '33-6')],
-    [(False, '33-2'), (False, '33-5')],
-    [(False, '33-2'), (False, '33-4')],
-    [(False, '33-2'), (False, '33-3')],
-    [(False, '33-1'), (False, '33-9')],
-    [(False, '33-1'), (False, '33-8')],
-    [(False, '33-1'), (False, '33-7')],
-    [(False, '33-1'), (False, '33-6')],
-    [(False, '33-1'), (False, '33-5')],
-    [(False, '33-1'), (False, '33-4')],
-    [(False, '33-1'), (False, '33-3')],
-    [(False, '33-1'), (False, '33-2')],
-    [(True, '33-1'), (True, '33-2'), (True, '33-3'), (True, '33-4'), (True, '33-5'), (True, '33-6'), (True, '33-7'), (True, '33-8'), (True, '33-9')],
-    [(False, '34-8'), (False, '34-9')],
-    [(False, '34-7'), (False, '34-9')],
-    [(False, '34-7'), (False, '34-8')],
-    [(False, '34-6'), (False, '34-9')],
-    [(False, '34-6'), (False, '34-8')],
-    [(False, '34-6'), (False, '34-7')],
-    [(False, '34-5'), (False, '34-9')],
-    [(False, '34-5'), (False, '34-8')],
-    [(False, '34-5'), (False, '34-7')],
-    [(False, '34-5'), (False, '34-6')],
-    [(False, '34-4'), (False, '34-9')],
-    [(False, '34-4'), (False, '34-8')],
-    [(False, '34-4'), (False, '34-7')],
-    [(False, '34-4'), (False, '34-6')],
-    [(False, '34-4'), (False, '34-5')],
-    [(False, '34-3'), (False, '34-9')],
-    [(False, '34-3'), (False, '34-8')],
-    [(False, '34-3'), (False, '34-7')],
-    [(False, '34-3'), (False, '34-6')],
-    [(False, '34-3'), (False, '34-5')],
-    [(False, '34-3'), (False, '34-4')],
-    [(False, '34-2'), (False, '34-9')],
-    [(False, '34-2'), (False, '34-8')],
-    [(False, '34-2'), (False, '34-7')],
-    [(False, '34-2'), (False, '34-6')],
-    [(False, '34-2'), (False, '34-5')],
-    [(False, '34-2'), (False, '34-4')],
-    [(False, '34-2'), (False, '34-3')],
-    [(False, '34-1'), (False, '34-9')],
-    [(False, '34-1'), (False, '34-8')],
-    [(False, '34-1'), (False, '34-7')],
-    [(False, '34-1'), (False, '34-6')],
-    [(False, '34-1'), (False, '34-5')],
-    [(False, '34-1'), (False, '34-4')],
-    [(False, '34-1'), (False, '34-3')],
-    [(False, '34-1'), (False, '34-2')],
-    [(True, '34-1'), (True, '34-2'), (True, '34-3'), (True, '34-4'), (True, '34-5'), (True, '34-6'), (True, '34-7'), (True, '34-8'), (True, '34-9')],
-    [(False, '35-8'), (False, '35-9')],
-    [(False, '35-7'), (False, '35-9')],
-    [(False, '35-7'), (False, '35-8')],
-    [(False, '35-6'), (False, '35-9')],
-    [(False, '35-6'), (False, '35-8')],
-    [(False, '35-6'), (False, '35-7')],
-    [(False, '35-5'), (False, '35-9')],
-    [(False, '35-5'), (False, '35-8')],
-    [(False, '35-5'), (False, '35-7')],
-    [(False, '35-5'), (False, '35-6')],
-    [(False, '35-4'), (False, '35-9')],
-    [(False, '35-4'), (False, '35-8')],
-    [(False, '35-4'), (False, '35-7')],
-    [(False, '35-4'), (False, '35-6')],
-    [(False, '35-4'), (False, '35-5')],
-    [(False, '35-3'), (False, '35-9')],
-    [(False, '35-3'), (False, '35-8')],
-    [(False, '35-3'), (False, '35-7')],
-    [(False, '35-3'), (False, '35-6')],
-    [(False, '35-3'), (False, '35-5')],
-    [(False, '35-3'), (False, '35-4')],
-    [(False, '35-2'), (False, '35-9')],
-    [(False, '35-2'), (False, '35-8')],
-    [(False, '35-2'), (False, '35-7')],
-    [(False, '35-2'), (False, '35-6')],
-    [(False, '35-2'), (False, '35-5')],
-    [(False, '35-2'), (False, '35-4')],
-    [(False, '35-2'), (False, '35-3')],
-    [(False, '35-1'), (False, '35-9')],
-    [(False, '35-1'), (False, '35-8')],
-    [(False, '35-1'), (False, '35-7')],
-    [(False, '35-1'), (False, '35-6')],
-    [(False, '35-1'), (False, '35-5')],
-    [(False, '35-1'), (False, '35-4')],
-    [(False, '35-1'), (False, '35-3')],
-    [(False, '35-1'), (False, '35-2')],
-    [(True, '35-1'), (True, '35-2'), (True, '35-3'), (True, '35-4'), (True, '35-5'), (True, '35-6'), (True, '35-7'), (True, '35-8'), (True, '35-9')],
-    [(False, '36-8'), (False, '36-9')],
-    [(False, '36-7'), (False, '36-9')],
-    [(False, '36-7'), (False, '36-8')],
-    [(False, '36-6'), (False, '36-9')],
-    [(False, '36-6'), (False, '36-8')],
-    [(False, '36-6'), (False, '36-7')],
-    [(False, '36-5'), (False, '36-9')],
-    [(False, '36-5'), (False, '36-8')],
-    [(False, '36-5'), (False, '36-7')],
-    [(False, '36-5'), (False, '36-6')],
-    [(False, '36-4'), (False, '36-9')],
-    [(False, '36-4'), (False, '36-8')],
-    [(False, '36-4'), (False, '36-7')],
-    [(False, '36-4'), (False, '36-6')],
-    [(False, '36-4'), (False, '36-5')],
-    [(False, '36-3'), (False, '36-9')],
-    [(False, '36-3'), (False, '36-8')],
-    [(False, '36-3'), (False, '36-7')],
-    [(False, '36-3'), (False, '36-6')],
-    [(False, '36-3'), (False, '36-5')],
-    [(False, '36-3'), (False, '36-4')],
-    [(False, '36-2'), (False, '36-9')],
-    [(False, '36-2'), (False, '36-8')],
-    [(False, '36-2'), (False, '36-7')],
-    [(False, '36-2'), (False, '36-6')],
-    [(False, '36-2'), (False, '36-5')],
-    [(False, '36-2'), (False, '36-4')],
-    [(False, '36-2'), (False, '36-3')],
-    [(False, '36-1'), (False, '36-9')],
-    [(False, '36-1'), (False, '36-8')],
-    [(False, '36-1'), (False, '36-7')],
-    [(False, '36-1'), (False, '36-6')],
-    [(False, '36-1'), (False, '36-5')],
-    [(False, '36-1'), (False, '36-4')],
-    [(False, '36-1'), (False, '36-3')],
-    [(False, '36-1'), (False, '36-2')],
-    [(True, '36-1'), (True, '36-2'), (True, '36-3'), (True, '36-4'), (True, '36-5'), (True, '36-6'), (True, '36-7'), (True, '36-8'), (True, '36-9')],
-    [(False, '37-8'), (False, '37-9')],
-    [(False, '37-7'), (False, '37-9')],
-    [(False, '37-7'), (False, '37-8')],
-    [(False, '37-6'), (False, '37-9')],
-    [(False, '37-6'), (False, '37-8')],
-    [(False, '37-6'), (False, '37-7')],
-    [(False, '37-5'), (False, '37-9')],
-    [(False, '37-5'), (False, '37-8')],
-    [(False, '37-5'), (False, '37-7')],
-    [(False, '37-5'), (False, '37-6')],
-    [(False, '37-4'), (False, '37-9')],
-    [(False, '37-4'), (False, '37-8')],
-    [(False, '37-4'), (False, '37-7')],
-    [(False, '37-4'), (False, '37-6')],
-    [(False, '37-4'), (False, '37-5')],
-    [(False, '37-3'), (False, '37-9')],
-    [(False, '37-3'), (False, '37-8')],
-    [(False, '37-3'), (False, '37-7')],
-    [(False, '37-3'), (False, '37-6')],
-    [(False, '37-3'), (False, '37-5')],
-    [(False, '37-3'), (False, '37-4')],
-    [(False, '37-2'), (False, '37-9')],
-    [(False, '37-2'), (False, '37-8')],
-    [(False, '37-2'), (False, '37-7')],
-    [(False, '37-2'), (False, '37-6')],
-    [(False, '37-2'), (False, '37-5')],
-    [(False, '37-2'), (False, '37-4')],
-    [(False, '37-2'), (False, '37-3')],
-    [(False, '37-1'), (False, '37-9')],
-    [(False, '37-1'), (False, '37-8')],
-    [(False, '37-1'), (False, '37-7')],
-    [(False, '37-1'), (False, '37-6')],
-    [(False, '37-1'), (False, '37-5')],
-    [(False, '37-1'), (False, '37-4')],
-    [(False, '37-1'), (False, '37-3')],
-    [(False, '37-1'), (False, '37-2')],
-    [(True, '37-1'), (True, '37-2'), (True, '37-3'), (True, '37-4'), (True, '37-5'), (True, '37-6'), (True, '37-7'), (True, '37-8'), (True, '37-9')],
-    [(False, '38-8'), (False, '38-9')],
-    [(False, '38-7'), (False, '38-9')],
-    [(False, '38-7'), (False, '38-8')],
-    [(False, '38-6'), (False, '38-9')],
-    [(False, '38-6'), (False, '38-8')],
-    [(False, '38-6'), (False, '38-7')],
-    [(False, '38-5'), (False, '38-9')],
-    [(False, '38-5'), (False, '38-8')],
-    [(False, '38-5'), (False, '38-7')],
-    [(False, '38-5'), (False, '38-6')],
-    [(False, '38-4'), (False, '38-9')],
-    [(False, '38-4'), (False, '38-8')],
-    [(False, '38-4'), (False, '38-7')],
-    [(False, '38-4'), (False, '38-6')],
-    [(False, '38-4'), (False, '38-5')],
-    [(False, '38-3'), (False, '38-9')],
-    [(False, '38-3'), (False, '38-8')],
-    [(False, '38-3'), (False, '38-7')],
-    [(False, '38-3'), (False, '38-6')],
-    [(False, '38-3'), (False, '38-5')],
-    [(False, '38-3'), (False, '38-4')],
-    [(False, '38-2'), (False, '38-9')],
-    [(False, '38-2'), (False, '38-8')],
-    [(False, '38-2'), (False, '38-7')],
-    [(False, '38-2'), (False, '38-6')],
-    [(False, '38-2'), (False, '38-5')],
-    [(False, '38-2'), (False, '38-4')],
-    [(False, '38-2'), (False, '38-3')],
-    [(False, '38-1'), (False, '38-9')],
-    [(False, '38-1'), (False, '38-8')],
-    [(False, '38-1'), (False, '38-7')],
-    [(False, '38-1'), (False, '38-6')],
-    [(False, '38-1'), (False, '38-5')],
-    [(False, '38-1'), (False, '38-4')],
-    [(False, '38-1'), (False, '38-3')],
-    [(False, '38-1'), (False, '38-2')],
-    [(True, '38-1'), (True, '38-2'), (True, '38-3'), (True, '38-4'), (True, '38-5'), (True, '38-6'), (True, '38-7'), (True, '38-8'), (True, '38-9')],
-    [(False, '40-8'), (False, '40-9')],
-    [(False, '40-7'), (False, '40-9')],
-    [(False, '40-7'), (False, '40-8')],
-    [(False, '40-6'), (False, '40-9')],
-    [(False, '40-6'), (False, '40-8')],
-    [(False, '40-6'), (False, '40-7')],
-    [(False, '40-5'), (False, '40-9')],
-    [(False, '40-5'), (False, '40-8')],
-    [(False, '40-5'), (False, '40-7')],
-    [(False, '40-5'), (False, '40-6')],
-    [(False, '40-4'), (False, '40-9')],
-    [(False, '40-4'), (False, '40-8')],
-    [(False, '40-4'), (False, '40-7')],
-    [(False, '40-4'), (False, '40-6')],
-    [(False, '40-4'), (False, '40-5')],
-    [(False, '40-3'), (False, '40-9')],
-    [(False, '40-3'), (False, '40-8')],
-    [(False, '40-3'), (False, '40-7')],
-    [(False, '40-3'), (False, '40-6')],
-    [(False, '40-3'), (False, '40-5')],
-    [(False, '40-3'), (False, '40-4')],
-    [(False, '40-2'), (False, '40-9')],
-    [(False, '40-2'), (False, '40-8')],
-    [(False, '40-2'), (False, '40-7')],
-    [(False, '40-2'), (False, '40-6')],
-    [(False, '40-2'), (False, '40-5')],
-    [(False, '40-2'), (False, '40-4')],
-    [(False, '40-2'), (False, '40-3')],
-    [(False, '40-1'), (False, '40-9')],
-    [(False, '40-1'), (False, '40-8')],
-    [(False, '40-1'), (False, '40-7')],
-    [(False, '40-1'), (False, '40-6')],
-    [(False, '40-1'), (False, '40-5')],
-    [(False, '40-1'), (False, '40-4')],
-    [(False, '40-1'), (False, '40-3')],
-    [(False, '40-1'), (False, '40-2')],
-    [(True, '40-1'), (True, '40-2'), (True, '40-3'), (True, '40-4'), (True, '40-5'), (True, '40-6'), (True, '40-7'), (True, '40-8'), (True, '40-9')],
-    [(False, '41-8'), (False, '41-9')],
-    [(False, '41-7'), (False, '41-9')],
-    [(False, '41-7'), (False, '41-8')],
-    [(False, '41-6'), (False, '41-9')],
-    [(False, '41-6'), (False, '41-8')],
-    [(False, '41-6'), (False, '41-7')],
-    [(False, '41-5'), (False, '41-9')],
-    [(False, '41-5'), (False, '41-8')],
-    [(False, '41-5'), (False, '41-7')],
-    [(False, '41-5'), (False, '41-6')],
-    [(False, '41-4'), (False, '41-9')],
-    [(False, '41-4'), (False, '41-8')],
-    [(False, '41-4'), (False, '41-7')],
-    [(False, '41-4'), (False, '41-6')],
-    [(False, '41-4'), (False, '41-5')],
-    [(False, '41-3'), (False, '41-9')],
-    [(False, '41-3'), (False, '41-8')],
-    [(False, '41-3'), (False, '41-7')],
-    [(False, '41-3'), (False, '41-6')],
-    [(False, '41-3'), (False, '41-5')],
-    [(False, '41-3'), (False, '41-4')],
-    [(False, '41-2'), (False, '41-9')],
-    [(False, '41-2'), (False, '41-8')],
-    [(False, '41-2'), (False, '41-7')],
-    [(False, '41-2'), (False, '41-6')],
-    [(False, '41-2'), (False, '41-5')],
-    [(False, '41-2'), (False, '41-4')],
-    [(False, '41-2'), (False, '41-3')],
-    [(False, '41-1'), (False, '41-9')],
-    [(False, '41-1'), (False, '41-8')],
-    [(False, '41-1'), (False, '41-7')],
-    [(False, '41-1'), (False, '41-6')],
-    [(False, '41-1'), (False, '41-5')],
-    [(False, '41-1'), (False, '41-4')],
-    [(False, '41-1'), (False, '41-3')],
-    [(False, '41-1'), (False, '41-2')],
-    [(True, '41-1'), (True, '41-2'), (True, '41-3'), (True, '41-4'), (True, '41-5'), (True, '41-6'), (True, '41-7'), (True, '41-8'), (True, '41-9')],
-    [(False, '42-8'), (False, '42-9')],
-    [(False, '42-7'), (False, '42-9')],
-    [(False, '42-7'), (False, '42-8')],
-    [(False, '42-6'), (False, '42-9')],
-    [(False, '42-6'), (False, '42-8')],
-    [(False, '42-6'), (False, '42-7')],
-    [(False, '42-5'), (False, '42-9')],
-    [(False, '42-5'), (False, '42-8')],
-    [(False, '42-5'), (False, '42-7')],
-    [(False, '42-5'), (False, '42-6')],
-    [(False, '42-4'), (False, '42-9')],
-    [(False, '42-4'), (False, '42-8')],
-    [(False, '42-4'), (False, '42-7')],
-    [(False, '42-4'), (False, '42-6')],
-    [(False, '42-4'), (False, '42-5')],
-    [(False, '42-3'), (False, '42-9')],
-    [(False, '42-3'), (False, '42-8')],
-    [(False, '42-3'), (False, '42-7')],
-    [(False, '42-3'), (False, '42-6')],
-    [(False, '42-3'), (False, '42-5')],
-    [(False, '42-3'), (False, '42-4')],
-    [(False, '42-2'), (False, '42-9')],
-    [(False, '42-2'), (False, '42-8')],
-    [(False, '42-2'), (False, '42-7')],
-    [(False, '42-2'), (False, '42-6')],
-    [(False, '42-2'), (False, '42-5')],
-    [(False, '42-2'), (False, '42-4')],
-    [(False, '42-2'), (False, '42-3')],
-    [(False, '42-1'), (False, '42-9')],
-    [(False, '42-1'), (False, '42-8')],
-    [(False, '42-1'), (False, '42-7')],
-    [(False, '42-1'), (False, '42-6')],
-    [(False, '42-1'), (False, '42-5')],
-    [(False, '42-1'), (False, '42-4')],
-    [(False, '42-1'), (False, '42-3')],
-    [(False, '42-1'), (False, '42-2')],
-    [(True, '42-1'), (True, '42-2'), (True, '42-3'), (True, '42-4'), (True, '42-5'), (True, '42-6'), (True, '42-7'), (True, '42-8'), (True, '42-9')],
-    [(False, '43-8'), (False, '43-9')],
-    [(False, '43-7'), (False, '43-9')],
-    [(False, '43-7'), (False, '43-8')],
-    [(False, '43-6'), (False, '43-9')],
-    [(False, '43-6'), (False, '43-8')],
-    [(False, '43-6'), (False, '43-7')],
-    [(False, '43-5'), (False, '43-9')],
-    [(False, '43-5'), (False, '43-8')],
-    [(False, '43-5'), (False, '43-7')],
-    [(False, '43-5'), (False, '43-6')],
-    [(False, '43-4'), (False, '43-9')],
-    [(False, '43-4'), (False, '43-8')],
-    [(False, '43-4'), (False, '43-7')],
-    [(False, '43-4'), (False, '43-6')],
-    [(False, '43-4'), (False, '43-5')],
-    [(False, '43-3'), (False, '43-9')],
-    [(False, '43-3'), (False, '43-8')],
-    [(False, '43-3'), (False, '43-7')],
-    [(False, '43-3'), (False, '43-6')],
-    [(False, '43-3'), (False, '43-5')],
-    [(False, '43-3'), (False, '43-4')],
-    [(False, '43-2'), (False, '43-9')],
-    [(False, '43-2'), (False, '43-8')],
-    [(False, '43-2'), (False, '43-7')],
-    [(False, '43-2'), (False, '43-6')],
-    [(False, '43-2'), (False, '43-5')],
-    [(False, '43-2'), (False, '43-4')],
-    [(False, '43-2'), (False, '43-3')],
-    [(False, '43-1'), (False, '43-9')],
-    [(False, '43-1'), (False, '43-8')],
-    [(False, '43-1'), (False, '43-7')],
-    [(False, '43-1'), (False, '43-6')],
-    [(False, '43-1'), (False, '43-5')],
-    [(False, '43-1'), (False, '43-4')],
-    [(False, '43-1'), (False, '43-3')],
-    [(False, '43-1'), (False, '43-2')],
-    [(True, '43-1'), (True, '43-2'), (True, '43-3'), (True, '43-4'), (True, '43-5'), (True, '43-6'), (True, '43-7'), (True, '43-8'), (True, '43-9')],
-    [(False, '44-8'), (False, '44-9')],
-    [(False, '44-7'), (False, '44-9')],
-    [(False, '44-7'), (False, '44-8')],
-    [(False, '44-6'), (False, '44-9')],
-    [(False, '44-6'), (False, '44-8')],
-    [(False, '44-6'), (False, '44-7')],
-    [(False, '44-5'), (False, '44-9')],
-    [(False, '44-5'), (False, '44-8')],
-    [(False, '44-5'), (False, '44-7')],
-    [(False, '44-5'), (False, '44-6')],
-    [(False, '44-4'), (False, '44-9')],
-    [(False, '44-4'), (False, '44-8')],
-    [(False, '44-4'), (False, '44-7')],
-    [(False, '44-4'), (False, '44-6')],
-    [(False, '44-4'), (False, '44-5')],
-    [(False, '44-3'), (False, '44-9')],
-    [(False, '44-3'), (False, '44-8')],
-    [(False, '44-3'), (False, '44-7')],
-    [(False, '44-3'), (False, '44-6')],
-    [(False, '44-3'), (False, '44-5')],
-    [(False, '44-3'), (False, '44-4')],
-    [(False, '44-2'), (False, '44-9')],
-    [(False, '44-2'), (False, '44-8')],
-    [(False, '44-2'), (False, '44-7')],
-    [(False, '44-2'), (False, '44-6')],
-    [(False, '44-2'), (False, '44-5')],
-    [(False, '44-2'), (False, '44-4')],
-    [(False, '44-2'), (False, '44-3')],
-    [(False, '44-1'), (False, '44-9')],
-    [(False, '44-1'), (False, '44-8')],
-    [(False, '44-1'), (False, '44-7')],
-    [(False, '44-1'), (False, '44-6')],
-    [(False, '44-1'), (False, '44-5')],
-    [(False, '44-1'), (False, '44-4')],
-    [(False, '44-1'), (False, '44-3')],
-    [(False, '44-1'), (False, '44-2')],
-    [(True, '44-1'), (True, '44-2'), (True, '44-3'), (True, '44-4'), (True, '44-5'), (True, '44-6'), (True, '44-7'), (True, '44-8'), (True, '44-9')],
-    [(False, '45-8'), (False, '45-9')],
-    [(False, '45-7'), (False, '45-9')],
-    [(False, '45-7'), (False, '45-8')],
-    [(False, '45-6'), (False, '45-9')],
-    [(False, '45-6'), (False, '45-8')],
-    [(False, '45-6'), (False, '45-7')],
-    [(False, '45-5'), (False, '45-9')],
-    [(False, '45-5'), (False, '45-8')],
-    [(False, '45-5'), (False, '45-7')],
-    [(False, '45-5'), (False, '45-6')],
-    [(False, '45-4'), (False, '45-9')],
-    [(False, '45-4'), (False, '45-8')],
-    [(False, '45-4'), (False, '45-7')],
-    [(False, '45-4'), (False, '45-6')],
-    [(False, '45-4'), (False, '45-5')],
-    [(False, '45-3'), (False, '45-9')],
-    [(False, '45-3'), (False, '45-8')],
-    [(False, '45-3'), (False, '45-7')],
-    [(False, '45-3'), (False, '45-6')],
-    [(False, '45-3'), (False, '45-5')],
-    [(False, '45-3'), (False, '45-4')],
-    [(False, '45-2'), (False, '45-9')],
-    [(False, '45-2'), (False, '45-8')],
-    [(False, '45-2'), (False, '45-7')],
-    [(False, '45-2'), (False, '45-6')],
-    [(False, '45-2'), (False, '45-5')],
-    [(False, '45-2'), (False, '45-4')],
-    [(False, '45-2'), (False, '45-3')],
-    [(False, '45-1'), (False, '45-9')],
-    [(False, '45-1'), (False, '45-8')],
-    [(False, '45-1'), (False, '45-7')],
-    [(False, '45-1'), (False, '45-6')],
-    [(False, '45-1'), (False, '45-5')],
-    [(False, '45-1'), (False, '45-4')],
-    [(False, '45-1'), (False, '45-3')],
-    [(False, '45-1'), (False, '45-2')],
-    [(True, '45-1'), (True, '45-2'), (True, '45-3'), (True, '45-4'), (True, '45-5'), (True, '45-6'), (True, '45-7'), (True, '45-8'), (True, '45-9')],
-    [(False, '46-8'), (False, '46-9')],
-    [(False, '46-7'), (False, '46-9')],
-    [(False, '46-7'), (False, '46-8')],
-    [(False, '46-6'), (False, '46-9')],
-    [(False, '46-6'), (False, '46-8')],
-    [(False, '46-6'), (False, '46-7')],
-    [(False, '46-5'), (False, '46-9')],
-    [(False, '46-5'), (False, '46-8')],
-    [(False, '46-5'), (False, '46-7')],
-    [(False, '46-5'), (False, '46-6')],
-    [(False, '46-4'), (False, '46-9')],
-    [(False, '46-4'), (False, '46-8')],
-    [(False, '46-4'), (False, '46-7')],
-    [(False, '46-4'), (False, '46-6')],
-    [(False, '46-4'), (False, '46-5')],
-    [(False, '46-3'), (False, '46-9')],
-    [(False, '46-3'), (False, '46-8')],
-    [(False, '46-3'), (False, '46-7')],
-    [(False, '46-3'), (False, '46-6')],
-    [(False, '46-3'), (False, '46-5')],
-    [(False, '46-3'), (False, '46-4')],
-    [(False, '46-2'), (False, '46-9')],
-    [(False, '46-2'), (False, '46-8')],
-    [(False, '46-2'), (False, '46-7')],
-    [(False, '46-2'), (False, '46-6')],
-    [(False, '46-2'), (False, '46-5')],
-    [(False, '46-2'), (False, '46-4')],
-    [(False, '46-2'), (False, '46-3')],
-    [(False, '46-1'), (False, '46-9')],
-    [(False, '46-1'), (False, '46-8')],
-    [(False, '46-1'), (False, '46-7')],
-    [(False, '46-1'), (False, '46-6')],
-    [(False, '46-1'), (False, '46-5')],
-    [(False, '46-1'), (False, '46-4')],
-    [(False, '46-1'), (False, '46-3')],
-    [(False, '46-1'), (False, '46-2')],
-    [(True, '46-1'), (True, '46-2'), (True, '46-3'), (True, '46-4'), (True, '46-5'), (True, '46-6'), (True, '46-7'), (True, '46-8'), (True, '46-9')],
-    [(False, '47-8'), (False, '47-9')],
-    [(False, '47-7'), (False, '47-9')],
-    [(False, '47-7'), (False, '47-8')],
-    [(False, '47-6'), (False, '47-9')],
-    [(False, '47-6'), (False, '47-8')],
-    [(False, '47-6'), (False, '47-7')],
-    [(False, '47-5'), (False, '47-9')],
-    [(False, '47-5'), (False, '47-8')],
-    [(False, '47-5'), (False, '47-7')],
-    [(False, '47-5'), (False, '47-6')],
-    [(False, '47-4'), (False, '47-9')],
-    [(False, '47-4'), (False, '47-8')],
-    [(False, '47-4'), (False, '47-7')],
-    [(False, '47-4'), (False, '47-6')],
-    [(False, '47-4'), (False, '47-5')],
-    [(False, '47-3'), (False, '47-9')],
-    [(False, '47-3'), (False, '47-8')],
-    [(False, '47-3'), (False, '47-7')],
-    [(False, '47-3'), (False, '47-6')],
-    [(False, '47-3'), (False, '47-5')],
-    [(False, '47-3'), (False, '47-4')],
-    [(False, '47-2'), (False, '47-9')],
-    [(False, '47-2'), (False, '47-8')],
-    [(False, '47-2'), (False, '47-7')],
-    [(False, '47-2'), (False, '47-6')],
-    [(False, '47-2'), (False, '47-5')],
-    [(False, '47-2'), (False, '47-4')],
-    [(False, '47-2'), (False, '47-3')],
-    [(False, '47-1'), (False, '47-9')],
-    [(False, '47-1'), (False, '47-8')],
-    [(False, '47-1'), (False, '47-7')],
-    [(False, '47-1'), (False, '47-6')],
-    [(False, '47-1'), (False, '47-5')],
-    [(False, '47-1'), (False, '47-4')],
-    [(False, '47-1'), (False, '47-3')],
-    [(False, '47-1'), (False, '47-2')],
-    [(True, '47-1'), (True, '47-2'), (True, '47-3'), (True, '47-4'), (True, '47-5'), (True, '47-6'), (True, '47-7'), (True, '47-8'), (True, '47-9')],
-    [(False, '48-8'), (False, '48-9')],
-    [(False, '48-7'), (False, '48-9')],
-    [(False, '48-7'), (False, '48-8')],
-    [(False, '48-6'), (False, '48-9')],
-    [(False, '48-6'), (False, '48-8')],
-    [(False, '48-6'), (False, '48-7')],
-    [(False, '48-5'), (False, '48-9')],
-    [(False, '48-5'), (False, '48-8')],
-    [(False, '48-5'), (False, '48-7')],
-    [(False, '48-5'), (False, '48-6')],
-    [(False, '48-4'), (False, '48-9')],
-    [(False, '48-4'), (False, '48-8')],
-    [(False, '48-4'), (False, '48-7')],
-    [(False, '48-4'), (False, '48-6')],
-    [(False, '48-4'), (False, '48-5')],
-    [(False, '48-3'), (False, '48-9')],
-    [(False, '48-3'), (False, '48-8')],
-    [(False, '48-3'), (False, '48-7')],
-    [(False, '48-3'), (False, '48-6')],
-    [(False, '48-3'), (False, '48-5')],
-    [(False, '48-3'), (False, '48-4')],
-    [(False, '48-2'), (False, '48-9')],
-    [(False, '48-2'), (False, '48-8')],
-    [(False, '48-2'), (False, '48-7')],
-    [(False, '48-2'), (False, '48-6')],
-    [(False, '48-2'), (False, '48-5')],
-    [(False, '48-2'), (False, '48-4')],
-    [(False, '48-2'), (False, '48-3')],
-    [(False, '48-1'), (False, '48-9')],
-    [(False, '48-1'), (False, '48-8')],
-    [(False, '48-1'), (False, '48-7')],
-    [(False, '48-1'), (False, '48-6')],
-    [(False, '48-1'), (False, '48-5')],
-    [(False, '48-1'), (False, '48-4')],
-    [(False, '48-1'), (False, '48-3')],
-    [(False, '48-1'), (False, '48-2')],
-    [(True, '48-1'), (True, '48-2'), (True, '48-3'), (True, '48-4'), (True, '48-5'), (True, '48-6'), (True, '48-7'), (True, '48-8'), (True, '48-9')],
-    [(False, '50-8'), (False, '50-9')],
-    [(False, '50-7'), (False, '50-9')],
-    [(False, '50-7'), (False, '50-8')],
-    [(False, '50-6'), (False, '50-9')],
-    [(False, '50-6'), (False, '50-8')],
-    [(False, '50-6'), (False, '50-7')],
-    [(False, '50-5'), (False, '50-9')],
-    [(False, '50-5'), (False, '50-8')],
-    [(False, '50-5'), (False, '50-7')],
-    [(False, '50-5'), (False, '50-6')],
-    [(False, '50-4'), (False, '50-9')],
-    [(False, '50-4'), (False, '50-8')],
-    [(False, '50-4'), (False, '50-7')],
-    [(False, '50-4'), (False, '50-6')],
-    [(False, '50-4'), (False, '50-5')],
-    [(False, '50-3'), (False, '50-9')],
-    [(False, '50-3'), (False, '50-8')],
-    [(False, '50-3'), (False, '50-7')],
-    [(False, '50-3'), (False, '50-6')],
-    [(False, '50-3'), (False, '50-5')],
-    [(False, '50-3'), (False, '50-4')],
-    [(False, '50-2'), (False, '50-9')],
-    [(False, '50-2'), (False, '50-8')],
-    [(False, '50-2'), (False, '50-7')],
-    [(False, '50-2'), (False, '50-6')],
-    [(False, '50-2'), (False, '50-5')],
-    [(False, '50-2'), (False, '50-4')],
-    [(False, '50-2'), (False, '50-3')],
-    [(False, '50-1'), (False, '50-9')],
-    [(False, '50-1'), (False, '50-8')],
-    [(False, '50-1'), (False, '50-7')],
-    [(False, '50-1'), (False, '50-6')],
-    [(False, '50-1'), (False, '50-5')],
-    [(False, '50-1'), (False, '50-4')],
-    [(False, '50-1'), (False, '50-3')],
-    [(False, '50-1'), (False, '50-2')],
-    [(True, '50-1'), (True, '50-2'), (True, '50-3'), (True, '50-4'), (True, '50-5'), (True, '50-6'), (True, '50-7'), (True, '50-8'), (True, '50-9')],
-    [(False, '51-8'), (False, '51-9')],
-    [(False, '51-7'), (False, '51-9')],
-    [(False, '51-7'), (False, '51-8')],
-    [(False, '51-6'), (False, '51-9')],
-    [(False, '51-6'), (False, '51-8')],
-    [(False, '51-6'), (False, '51-7')],
-    [(False, '51-5'), (False, '51-9')],
-    [(False, '51-5'), (False, '51-8')],
-    [(False, '51-5'), (False, '51-7')],
-    [(False, '51-5'), (False, '51-6')],
-    [(False, '51-4'), (False, '51-9')],
-    [(False, '51-4'), (False, '51-8')],
-    [(False, '51-4'), (False, '51-7')],
-    [(False, '51-4'), (False, '51-6')],
-    [(False, '51-4'), (False, '51-5')],
-    [(False, '51-3'), (False, '51-9')],
-    [(False, '51-3'), (False, '51-8')],
-    [(False, '51-3'), (False, '51-7')],
-    [(False, '51-3'), (False, '51-6')],
-    [(False, '51-3'), (False, '51-5')],
-    [(False, '51-3'), (False, '51-4')],
-    [(False, '51-2'), (False, '51-9')],
-    [(False, '51-2'), (False, '51-8')],
-    [(False, '51-2'), (False, '51-7')],
-    [(False, '51-2'), (False, '51-6')],
-    [(False, '51-2'), (False, '51-5')],
-    [(False, '51-2'), (False, '51-4')],
-    [(False, '51-2'), (False, '51-3')],
-    [(False, '51-1'), (False, '51-9')],
-    [(False, '51-1'), (False, '51-8')],
-    [(False, '51-1'), (False, '51-7')],
-    [(False, '51-1'), (False, '51-6')],
-    [(False, '51-1'), (False, '51-5')],
-    [(False, '51-1'), (False, '51-4')],
-    [(False, '51-1'), (False, '51-3')],
-    [(False, '51-1'), (False, '51-2')],
-    [(True, '51-1'), (True, '51-2'), (True, '51-3'), (True, '51-4'), (True, '51-5'), (True, '51-6'), (True, '51-7'), (True, '51-8'), (True, '51-9')],
-    [(False, '52-8'), (False, '52-9')],
-    [(False, '52-7'), (False, '52-9')],
-    [(False, '52-7'), (False, '52-8')],
-    [(False, '52-6'), (False, '52-9')],
-    [(False, '52-6'), (False, '52-8')],
-    [(False, '52-6'), (False, '52-7')],
-    [(False, '52-5'), (False, '52-9')],
-    [(False, '52-5'), (False, '52-8')],
-    [(False, '52-5'), (False, '52-7')],
-    [(False, '52-5'), (False, '52-6')],
-    [(False, '52-4'), (False, '52-9')],
-    [(False, '52-4'), (False, '52-8')],
-    [(False, '52-4'), (False, '52-7')],
-    [(False, '52-4'), (False, '52-6')],
-    [(False, '52-4'), (False, '52-5')],
-    [(False, '52-3'), (False, '52-9')],
-    [(False, '52-3'), (False, '52-8')],
-    [(False, '52-3'), (False, '52-7')],
-    [(False, '52-3'), (False, '52-6')],
-    [(False, '52-3'), (False, '52-5')],
-    [(False, '52-3'), (False, '52-4')],
-    [(False, '52-2'), (False, '52-9')],
-    [(False, '52-2'), (False, '52-8')],
-    [(False, '52-2'), (False, '52-7')],
-    [(False, '52-2'), (False, '52-6')],
-    [(False, '52-2'), (False, '52-5')],
-    [(False, '52-2'), (False, '52-4')],
-    [(False, '52-2'), (False, '52-3')],
-    [(False, '52-1'), (False, '52-9')],
-    [(False, '52-1'), (False, '52-8')],
-    [(False, '52-1'), (False, '52-7')],
-    [(False, '52-1'), (False, '52-6')],
-    [(False, '52-1'), (False, '52-5')],
-    [(False, '52-1'), (False, '52-4')],
-    [(False, '52-1'), (False, '52-3')],
-    [(False, '52-1'), (False, '52-2')],
-    [(True, '52-1'), (True, '52-2'), (True, '52-3'), (True, '52-4'), (True, '52-5'), (True, '52-6'), (True, '52-7'), (True, '52-8'), (True, '52-9')],
-    [(False, '53-8'), (False, '53-9')],
-    [(False, '53-7'), (False, '53-9')],
-    [(False, '53-7'), (False, '53-8')],
-    [(False, '53-6'), (False, '53-9')],
-    [(False, '53-6'), (False, '53-8')],
-    [(False, '53-6'), (False, '53-7')],
-    [(False, '53-5'), (False, '53-9')],
-    [(False, '53-5'), (False, '53-8')],
-    [(False, '53-5'), (False, '53-7')],
-    [(False, '53-5'), (False, '53-6')],
-    [(False, '53-4'), (False, '53-9')],
-    [(False, '53-4'), (False, '53-8')],
-    [(False, '53-4'), (False, '53-7')],
-    [(False, '53-4'), (False, '53-6')],
-    [(False, '53-4'), (False, '53-5')],
-    [(False, '53-3'), (False, '53-9')],
-    [(False, '53-3'), (False, '53-8')],
-    [(False, '53-3'), (False, '53-7')],
-    [(False, '53-3'), (False, '53-6')],
-    [(False, '53-3'), (False, '53-5')],
-    [(False, '53-3'), (False, '53-4')],
-    [(False, '53-2'), (False, '53-9')],
-    [(False, '53-2'), (False, '53-8')],
-    [(False, '53-2'), (False, '53-7')],
-    [(False, '53-2'), (False, '53-6')],
-    [(False, '53-2'), (False, '53-5')],
-    [(False, '53-2'), (False, '53-4')],
-    [(False, '53-2'), (False, '53-3')],
-    [(False, '53-1'), (False, '53-9')],
-    [(False, '53-1'), (False, '53-8')],
-    [(False, '53-1'), (False, '53-7')],
-    [(False, '53-1'), (False, '53-6')],
-    [(False, '53-1'), (False, '53-5')],
-    [(False, '53-1'), (False, '53-4')],
-    [(False, '53-1'), (False, '53-3')],
-    [(False, '53-1'), (False, '53-2')],
-    [(True, '53-1'), (True, '53-2'), (True, '53-3'), (True, '53-4'), (True, '53-5'), (True, '53-6'), (True, '53-7'), (True, '53-8'), (True, '53-9')],
-    [(False, '54-8'), (False, '54-9')],
-    [(False, '54-7'), (False, '54-9')],
-    [(False, '54-7'), (False, '54-8')],
-    [(False, '54-6'), (False, '54-9')],
-    [(False, '54-6'), (False, '54-8')],
-    [(False, '54-6'), (False, '54-7')],
-    [(False, '54-5'), (False, '54-9')],
-    [(False, '54-5'), (False, '54-8')],
-    [(False, '54-5'), (False, '54-7')],
-    [(False, '54-5'), (False, '54-6')],
-    [(False, '54-4'), (False, '54-9')],
-    [(False, '54-4'), (False, '54-8')],
-    [(False, '54-4'), (False, '54-7')],
-    [(False, '54-4'), (False, '54-6')],
-    [(False, '54-4'), (False, '54-5')],
-    [(False, '54-3'), (False, '54-9')],
-    [(False, '54-3'), (False, '54-8')],
-    [(False, '54-3'), (False, '54-7')],
-    [(False, '54-3'), (False, '54-6')],
-    [(False, '54-3'), (False, '54-5')],
-    [(False, '54-3'), (False, '54-4')],
-    [(False, '54-2'), (False, '54-9')],
-    [(False, '54-2'), (False, '54-8')],
-    [(False, '54-2'), (False, '54-7')],
-    [(False, '54-2'), (False, '54-6')],
-    [(False, '54-2'), (False, '54-5')],
-    [(False, '54-2'), (False, '54-4')],
-    [(False, '54-2'), (False, '54-3')],
-    [(False, '54-1'), (False, '54-9')],
-    [(False, '54-1'), (False, '54-8')],
-    [(False, '54-1'), (False, '54-7')],
-    [(False, '54-1'), (False, '54-6')],
-    [(False, '54-1'), (False, '54-5')],
-    [(False, '54-1'), (False, '54-4')],
-    [(False, '54-1'), (False, '54-3')],
-    [(False, '54-1'), (False, '54-2')],
-    [(True, '54-1'), (True, '54-2'), (True, '54-3'), (True, '54-4'), (True, '54-5'), (True, '54-6'), (True, '54-7'), (True, '54-8'), (True, '54-9')],
-    [(False, '55-8'), (False, '55-9')],
-    [(False, '55-7'), (False, '55-9')],
-    [(False, '55-7'), (False, '55-8')],
-    [(False, '55-6'), (False, '55-9')],
-    [(False, '55-6'), (False, '55-8')],
-    [(False, '55-6'), (False, '55-7')],
-    [(False, '55-5'), (False, '55-9')],
-    [(False, '55-5'), (False, '55-8')],
-    [(False, '55-5'), (False, '55-7')],
-    [(False, '55-5'), (False, '55-6')],
-    [(False, '55-4'), (False, '55-9')],
-    [(False, '55-4'), (False, '55-8')],
-    [(False, '55-4'), (False, '55-7')],
-    [(False, '55-4'), (False, '55-6')],
-    [(False, '55-4'), (False, '55-5')],
-    [(False, '55-3'), (False, '55-9')],
-    [(False, '55-3'), (False, '55-8')],
-    [(False, '55-3'), (False, '55-7')],
-    [(False, '55-3'), (False, '55-6')],
-    [(False, '55-3'), (False, '55-5')],
-    [(False, '55-3'), (False, '55-4')],
-    [(False, '55-2'), (False, '55-9')],
-    [(False, '55-2'), (False, '55-8')],
-    [(False, '55-2'), (False, '55-7')],
-    [(False, '55-2'), (False, '55-6')],
-    [(False, '55-2'), (False, '55-5')],
-    [(False, '55-2'), (False, '55-4')],
-    [(False, '55-2'), (False, '55-3')],
-    [(False, '55-1'), (False, '55-9')],
-    [(False, '55-1'), (False, '55-8')],
-    [(False, '55-1'), (False, '55-7')],
-    [(False, '55-1'), (False, '55-6')],
-    [(False, '55-1'), (False, '55-5')],
-    [(False, '55-1'), (False, '55-4')],
-    [(False, '55-1'), (False, '55-3')],
-    [(False, '55-1'), (False, '55-2')],
-    [(True, '55-1'), (True, '55-2'), (True, '55-3'), (True, '55-4'), (True, '55-5'), (True, '55-6'), (True, '55-7'), (True, '55-8'), (True, '55-9')],
-    [(False, '56-8'), (False, '56-9')],
-    [(False, '56-7'), (False, '56-9')],
-    [(False, '56-7'), (False, '56-8')],
-    [(False, '56-6'), (False, '56-9')],
-    [(False, '56-6'), (False, '56-8')],
-    [(False, '56-6'), (False, '56-7')],
-    [(False, '56-5'), (False, '56-9')],
-    [(False, '56-5'), (False, '56-8')],
-    [(False, '56-5'), (False, '56-7')],
-    [(False, '56-5'), (False, '56-6')],
-    [(False, '56-4'), (False, '56-9')],
-    [(False, '56-4'), (False, '56-8')],
-    [(False, '56-4'), (False, '56-7')],
-    [(False, '56-4'), (False, '56-6')],
-    [(False, '56-4'), (False, '56-5')],
-    [(False, '56-3'), (False, '56-9')],
-    [(False, '56-3'), (False, '56-8')],
-    [(False, '56-3'), (False, '56-7')],
-    [(False, '56-3'), (False, '56-6')],
-    [(False, '56-3'), (False, '56-5')],
-    [(False, '56-3'), (False, '56-4')],
-    [(False, '56-2'), (False, '56-9')],
-    [(False, '56-2'), (False, '56-8')],
-    [(False, '56-2'), (False, '56-7')],
-    [(False, '56-2'), (False, '56-6')],
-    [(False, '56-2'), (False, '56-5')],
-    [(False, '56-2'), (False, '56-4')],
-    [(False, '56-2'), (False, '56-3')],
-    [(False, '56-1'), (False, '56-9')],
-    [(False, '56-1'), (False, '56-8')],
-    [(False, '56-1'), (False, '56-7')],
-    [(False, '56-1'), (False, '56-6')],
-    [(False, '56-1'), (False, '56-5')],
-    [(False, '56-1'), (False, '56-4')],
-    [(False, '56-1'), (False, '56-3')],
-    [(False, '56-1'), (False, '56-2')],
-    [(True, '56-1'), (True, '56-2'), (True, '56-3'), (True, '56-4'), (True, '56-5'), (True, '56-6'), (True, '56-7'), (True, '56-8'), (True, '56-9')],
-    [(False, '57-8'), (False, '57-9')],
-    [(False, '57-7'), (False, '57-9')],
-    [(False, '57-7'), (False, '57-8')],
-    [(False, '57-6'), (False, '57-9')],
-    [(False, '57-6'), (False, '57-8')],
-    [(False, '57-6'), (False, '57-7')],
-    [(False, '57-5'), (False, '57-9')],
-    [(False, '57-5'), (False, '57-8')],
-    [(False, '57-5'), (False, '57-7')],
-    [(False, '57-5'), (False, '57-6')],
-    [(False, '57-4'), (False, '57-9')],
-    [(False, '57-4'), (False, '57-8')],
-    [(False, '57-4'), (False, '57-7')],
-    [(False, '57-4'), (False, '57-6')],
-    [(False, '57-4'), (False, '57-5')],
-    [(False, '57-3'), (False, '57-9')],
-    [(False, '57-3'), (False, '57-8')],
-    [(False, '57-3'), (False, '57-7')],
-    [(False, '57-3'), (False, '57-6')],
-    [(False, '57-3'), (False, '57-5')],
-    [(False, '57-3'), (False, '57-4')],
-    [(False, '57-2'), (False, '57-9')],
-    [(False, '57-2'), (False, '57-8')],
-    [(False, '57-2'), (False, '57-7')],
-    [(False, '57-2'), (False, '57-6')],
-    [(False, '57-2'), (False, '57-5')],
-    [(False, '57-2'), (False, '57-4')],
-    [(False, '57-2'), (False, '57-3')],
-    [(False, '57-1'), (False, '57-9')],
-    [(False, '57-1'), (False, '57-8')],
-    [(False, '57-1'), (False, '57-7')],
-    [(False, '57-1'), (False, '57-6')],
-    [(False, '57-1'), (False, '57-5')],
-    [(False, '57-1'), (False, '57-4')],
-    [(False, '57-1'), (False, '57-3')],
-    [(False, '57-1'), (False, '57-2')],
-    [(True, '57-1'), (True, '57-2'), (True, '57-3'), (True, '57-4'), (True, '57-5'), (True, '57-6'), (True, '57-7'), (True, '57-8'), (True, '57-9')],
-    [(False, '58-8'), (False, '58-9')],
-    [(False, '58-7'), (False, '58-9')],
-    [(False, '58-7'), (False, '58-8')],
-    [(False, '58-6'), (False, '58-9')],
-    [(False, '58-6'), (False, '58-8')],
-    [(False, '58-6'), (False, '58-7')],
-    [(False, '58-5'), (False, '58-9')],
-    [(False, '58-5'), (False, '58-8')],
-    [(False, '58-5'), (False, '58-7')],
-    [(False, '58-5'), (False, '58-6')],
-    [(False, '58-4'), (False, '58-9')],
-    [(False, '58-4'), (False, '58-8')],
-    [(False, '58-4'), (False, '58-7')],
-    [(False, '58-4'), (False, '58-6')],
-    [(False, '58-4'), (False, '58-5')],
-    [(False, '58-3'), (False, '58-9')],
-    [(False, '58-3'), (False, '58-8')],
-    [(False, '58-3'), (False, '58-7')],
-    [(False, '58-3'), (False, '58-6')],
-    [(False, '58-3'), (False, '58-5')],
-    [(False, '58-3'), (False, '58-4')],
-    [(False, '58-2'), (False, '58-9')],
-    [(False, '58-2'), (False, '58-8')],
-    [(False, '58-2'), (False, '58-7')],
-    [(False, '58-2'), (False, '58-6')],
-    [(False, '58-2'), (False, '58-5')],
-    [(False, '58-2'), (False, '58-4')],
-    [(False, '58-2'), (False, '58-3')],
-    [(False, '58-1'), (False, '58-9')],
-    [(False, '58-1'), (False, '58-8')],
-    [(False, '58-1'), (False, '58-7')],
-    [(False, '58-1'), (False, '58-6')],
-    [(False, '58-1'), (False, '58-5')],
-    [(False, '58-1'), (False, '58-4')],
-    [(False, '58-1'), (False, '58-3')],
-    [(False, '58-1'), (False, '58-2')],
-    [(True, '58-1'), (True, '58-2'), (True, '58-3'), (True, '58-4'), (True, '58-5'), (True, '58-6'), (True, '58-7'), (True, '58-8'), (True, '58-9')],
-    [(False, '60-8'), (False, '60-9')],
-    [(False, '60-7'), (False, '60-9')],
-    [(False, '60-7'), (False, '60-8')],
-    [(False, '60-6'), (False, '60-9')],
-    [(False, '60-6'), (False, '60-8')],
-    [(False, '60-6'), (False, '60-7')],
-    [(False, '60-5'), (False, '60-9')],
-    [(False, '60-5'), (False, '60-8')],
-    [(False, '60-5'), (False, '60-7')],
-    [(False, '60-5'), (False, '60-6')],
-    [(False, '60-4'), (False, '60-9')],
-    [(False, '60-4'), (False, '60-8')],
-    [(False, '60-4'), (False, '60-7')],
-    [(False, '60-4'), (False, '60-6')],
-    [(False, '60-4'), (False, '60-5')],
-    [(False, '60-3'), (False, '60-9')],
-    [(False, '60-3'), (False, '60-8')],
-    [(False, '60-3'), (False, '60-7')],
-    [(False, '60-3'), (False, '60-6')],
-    [(False, '60-3'), (False, '60-5')],
-    [(False, '60-3'), (False, '60-4')],
-    [(False, '60-2'), (False, '60-9')],
-    [(False, '60-2'), (False, '60-8')],
-    [(False, '60-2'), (False, '60-7')],
-    [(False, '60-2'), (False, '60-6')],
-    [(False, '60-2'), (False, '60-5')],
-    [(False, '60-2'), (False, '60-4')],
-    [(False, '60-2'), (False, '60-3')],
-    [(False, '60-1'), (False, '60-9')],
-    [(False, '60-1'), (False, '60-8')],
-    [(False, '60-1'), (False, '60-7')],
-    [(False, '60-1'), (False, '60-6')],
-    [(False, '60-1'), (False, '60-5')],
-    [(False, '60-1'), (False, '60-4')],
-    [(False, '60-1'), (False, '60-3')],
-    [(False, '60-1'), (False, '60-2')],
-    [(True, '60-1'), (True, '60-2'), (True, '60-3'), (True, '60-4'), (True, '60-5'), (True, '60-6'), (True, '60-7'), (True, '60-8'), (True, '60-9')],
-    [(False, '61-8'), (False, '61-9')],
-    [(False, '61-7'), (False, '61-9')],
-    [(False, '61-7'), (False, '61-8')],
-    [(False, '61-6'), (False, '61-9')],
-    [(False, '61-6'), (False, '61-8')],
-    [(False, '61-6'), (False, '61-7')],
-    [(False, '61-5'), (False, '61-9')],
-    [(False, '61-5'), (False, '61-8')],
-    [(False, '61-5'), (False, '61-7')],
-    [(False, '61-5'), (False, '61-6')],
-    [(False, '61-4'), (False, '61-9')],
-    [(False, '61-4'), (False, '61-8')],
-    [(False, '61-4'), (False, '61-7')],
-    [(False, '61-4'), (False, '61-6')],
-    [(False, '61-4'), (False, '61-5')],
-    [(False, '61-3'), (False, '61-9')],
-    [(False, '61-3'), (False, '61-8')],
-    [(False, '61-3'), (False, '61-7')],
-    [(False, '61-3'), (False, '61-6')],
-    [(False, '61-3'), (False, '61-5')],
-    [(False, '61-3'), (False, '61-4')],
-    [(False, '61-2'), (False, '61-9')],
-    [(False, '61-2'), (False, '61-8')],
-    [(False, '61-2'), (False, '61-7')],
-    [(False, '61-2'), (False, '61-6')],
-    [(False, '61-2'), (False, '61-5')],
-    [(False, '61-2'), (False, '61-4')],
-    [(False, '61-2'), (False, '61-3')],
-    [(False, '61-1'), (False, '61-9')],
-    [(False, '61-1'), (False, '61-8')],
-    [(False, '61-1'), (False, '61-7')],
-    [(False, '61-1'), (False, '61-6')],
-    [(False, '61-1'), (False, '61-5')],
-    [(False, '61-1'), (False, '61-4')],
-    [(False, '61-1'), (False, '61-3')],
-    [(False, '61-1'), (False, '61-2')],
-    [(True, '61-1'), (True, '61-2'), (True, '61-3'), (True, '61-4'), (True, '61-5'), (True, '61-6'), (True, '61-7'), (True, '61-8'), (True, '61-9')],
-    [(False, '62-8'), (False, '62-9')],
-    [(False, '62-7'), (False, '62-9')],
-    [(False, '62-7'), (False, '62-8')],
-    [(False, '62-6'), (False, '62-9')],
-    [(False, '62-6'), (False, '62-8')],
-    [(False, '62-6'), (False, '62-7')],
-    [(False, '62-5'), (False, '62-9')],
-    [(False, '62-5'), (False, '62-8')],
-    [(False, '62-5'), (False, '62-7')],
-    [(False, '62-5'), (False, '62-6')],
-    [(False, '62-4'), (False, '62-9')],
-    [(False, '62-4'), (False, '62-8')],
-    [(False, '62-4'), (False, '62-7')],
-    [(False, '62-4'), (False, '62-6')],
-    [(False, '62-4'), (False, '62-5')],
-    [(False, '62-3'), (False, '62-9')],
-    [(False, '62-3'), (False, '62-8')],
-    [(False, '62-3'), (False, '62-7')],
-    [(False, '62-3'), (False, '62-6')],
-    [(False, '62-3'), (False, '62-5')],
-    [(False, '62-3'), (False, '62-4')],
-    [(False, '62-2'), (False, '62-9')],
-    [(False, '62-2'), (False, '62-8')],
-    [(False, '62-2'), (False, '62-7')],
-    [(False, '62-2'), (False, '62-6')],
-    [(False, '62-2'), (False, '62-5')],
-    [(False, '62-2'), (False, '62-4')],
-    [(False, '62-2'), (False, '62-3')],
-    [(False, '62-1'), (False, '62-9')],
-    [(False, '62-1'), (False, '62-8')],
-    [(False, '62-1'), (False, '62-7')],
-    [(False, '62-1'), (False, '62-6')],
-    [(False, '62-1'), (False, '62-5')],
-    [(False, '62-1'), (False, '62-4')],
-    [(False, '62-1'), (False, '62-3')],
-    [(False, '62-1'), (False, '62-2')],
-    [(True, '62-1'), (True, '62-2'), (True, '62-3'), (True, '62-4'), (True, '62-5'), (True, '62-6'), (True, '62-7'), (True, '62-8'), (True, '62-9')],
-    [(False, '63-8'), (False, '63-9')],
-    [(False, '63-7'), (False, '63-9')],
-    [(False, '63-7'), (False, '63-8')],
-    [(False, '63-6'), (False, '63-9')],
-    [(False, '63-6'), (False, '63-8')],
-    [(False, '63-6'), (False, '63-7')],
-    [(False, '63-5'), (False, '63-9')],
-    [(False, '63-5'), (False, '63-8')],
-    [(False, '63-5'), (False, '63-7')],
-    [(False, '63-5'), (False, '63-6')],
-    [(False, '63-4'), (False, '63-9')],
-    [(False, '63-4'), (False, '63-8')],
-    [(False, '63-4'), (False, '63-7')],
-    [(False, '63-4'), (False, '63-6')],
-    [(False, '63-4'), (False, '63-5')],
-    [(False, '63-3'), (False, '63-9')],
-    [(False, '63-3'), (False, '63-8')],
-    [(False, '63-3'), (False, '63-7')],
-    [(False, '63-3'), (False, '63-6')],
-    [(False, '63-3'), (False, '63-5')],
-    [(False, '63-3'), (False, '63-4')],
-    [(False, '63-2'), (False, '63-9')],
-    [(False, '63-2'), (False, '63-8')],
-    [(False, '63-2'), (False, '63-7')],
-    [(False, '63-2'), (False, '63-6')],
-    [(False, '63-2'), (False, '63-5')],
-    [(False, '63-2'), (False, '63-4')],
-    [(False, '63-2'), (False, '63-3')],
-    [(False, '63-1'), (False, '63-9')],
-    [(False, '63-1'), (False, '63-8')],
-    [(False, '63-1'), (False, '63-7')],
-    [(False, '63-1'), (False, '63-6')],
-    [(False, '63-1'), (False, '63-5')],
-    [(False, '63-1'), (False, '63-4')],
-    [(False, '63-1'), (False, '63-3')],
-    [(False, '63-1'), (False, '63-2')],
-    [(True, '63-1'), (True, '63-2'), (True, '63-3'), (True, '63-4'), (True, '63-5'), (True, '63-6'), (True, '63-7'), (True, '63-8'), (True, '63-9')],
-    [(False, '64-8'), (False, '64-9')],
-    [(False, '64-7'), (False, '64-9')],
-    [(False, '64-7'), (False, '64-8')],
-    [(False, '64-6'), (False, '64-9')],
-    [(False, '64-6'), (False, '64-8')],
-    [(False, '64-6'), (False, '64-7')],
-    [(False, '64-5'), (False, '64-9')],
-    [(False, '64-5'), (False, '64-8')],
-    [(False, '64-5'), (False, '64-7')],
-    [(False, '64-5'), (False, '64-6')],
-    [(False, '64-4'), (False, '64-9')],
-    [(False, '64-4'), (False, '64-8')],
-    [(False, '64-4'), (False, '64-7')],
-    [(False, '64-4'), (False, '64-6')],
-    [(False, '64-4'), (False, '64-5')],
-    [(False, '64-3'), (False, '64-9')],
-    [(False, '64-3'), (False, '64-8')],
-    [(False, '64-3'), (False, '64-7')],
-    [(False, '64-3'), (False, '64-6')],
-    [(False, '64-3'), (False, '64-5')],
-    [(False, '64-3'), (False, '64-4')],
-    [(False, '64-2'), (False, '64-9')],
-    [(False, '64-2'), (False, '64-8')],
-    [(False, '64-2'), (False, '64-7')],
-    [(False, '64-2'), (False, '64-6')],
-    [(False, '64-2'), (False, '64-5')],
-    [(False, '64-2'), (False, '64-4')],
-    [(False, '64-2'), (False, '64-3')],
-    [(False, '64-1'), (False, '64-9')],
-    [(False, '64-1'), (False, '64-8')],
-    [(False, '64-1'), (False, '64-7')],
-    [(False, '64-1'), (False, '64-6')],
-    [(False, '64-1'), (False, '64-5')],
-    [(False, '64-1'), (False, '64-4')],
-    [(False, '64-1'), (False, '64-3')],
-    [(False, '64-1'), (False, '64-2')],
-    [(True, '64-1'), (True, '64-2'), (True, '64-3'), (True, '64-4'), (True, '64-5'), (True, '64-6'), (True, '64-7'), (True, '64-8'), (True, '64-9')],
-    [(False, '65-8'), (False, '65-9')],
-    [(False, '65-7'), (False, '65-9')],
-    [(False, '65-7'), (False, '65-8')],
-    [(False, '65-6'), (False, '65-9')],
-    [(False, '65-6'), (False, '65-8')],
-    [(False, '65-6'), (False, '65-7')],
-    [(False, '65-5'), (False, '65-9')],
-    [(False, '65-5'), (False, '65-8')],
-    [(False, '65-5'), (False, '65-7')],
-    [(False, '65-5'), (False, '65-6')],
-    [(False, '65-4'), (False, '65-9')],
-    [(False, '65-4'), (False, '65-8')],
-    [(False, '65-4'), (False, '65-7')],
-    [(False, '65-4'), (False, '65-6')],
-    [(False, '65-4'), (False, '65-5')],
-    [(False, '65-3'), (False, '65-9')],
-    [(False, '65-3'), (False, '65-8')],
-    [(False, '65-3'), (False, '65-7')],
-    [(False, '65-3'), (False, '65-6')],
-    [(False, '65-3'), (False, '65-5')],
-    [(False, '65-3'), (False, '65-4')],
-    [(False, '65-2'), (False, '65-9')],
-    [(False, '65-2'), (False, '65-8')],
-    [(False, '65-2'), (False, '65-7')],
-    [(False, '65-2'), (False, '65-6')],
-    [(False, '65-2'), (False, '65-5')],
-    [(False, '65-2'), (False, '65-4')],
-    [(False, '65-2'), (False, '65-3')],
-    [(False, '65-1'), (False, '65-9')],
-    [(False, '65-1'), (False, '65-8')],
-    [(False, '65-1'), (False, '65-7')],
-    [(False, '65-1'), (False, '65-6')],
-    [(False, '65-1'), (False, '65-5')],
-    [(False, '65-1'), (False, '65-4')],
-    [(False, '65-1'), (False, '65-3')],
-    [(False, '65-1'), (False, '65-2')],
-    [(True, '65-1'), (True, '65-2'), (True, '65-3'), (True, '65-4'), (True, '65-5'), (True, '65-6'), (True, '65-7'), (True, '65-8'), (True, '65-9')],
-    [(False, '66-8'), (False, '66-9')],
-    [(False, '66-7'), (False, '66-9')],
-    [(False, '66-7'), (False, '66-8')],
-    [(False, '66-6'), (False, '66-9')],
-    [(False, '66-6'), (False, '66-8')],
-    [(False, '66-6'), (False, '66-7')],
-    [(False, '66-5'), (False, '66-9')],
-    [(False, '66-5'), (False, '66-8')],
-    [(False, '66-5'), (False, '66-7')],
-    [(False, '66-5'), (False, '66-6')],
-    [(False, '66-4'), (False, '66-9')],
-    [(False, '66-4'), (False, '66-8')],
-    [(False, '66-4'), (False, '66-7')],
-    [(False, '66-4'), (False, '66-6')],
-    [(False, '66-4'), (False, '66-5')],
-    [(False, '66-3'), (False, '66-9')],
-    [(False, '66-3'), (False, '66-8')],
-    [(False, '66-3'), (False, '66-7')],
-    [(False, '66-3'), (False, '66-6')],
-    [(False, '66-3'), (False, '66-5')],
-    [(False, '66-3'), (False, '66-4')],
-    [(False, '66-2'), (False, '66-9')],
-    [(False, '66-2'), (False, '66-8')],
-    [(False, '66-2'), (False, '66-7')],
-    [(False, '66-2'), (False, '66-6')],
-    [(False, '66-2'), (False, '66-5')],
-    [(False, '66-2'), (False, '66-4')],
-    [(False, '66-2'), (False, '66-3')],
-    [(False, '66-1'), (False, '66-9')],
-    [(False, '66-1'), (False, '66-8')],
-    [(False, '66-1'), (False, '66-7')],
-    [(False, '66-1'), (False, '66-6')],
-    [(False, '66-1'), (False, '66-5')],
-    [(False, '66-1'), (False, '66-4')],
-    [(False, '66-1'), (False, '66-3')],
-    [(False, '66-1'), (False, '66-2')],
-    [(True, '66-1'), (True, '66-2'), (True, '66-3'), (True, '66-4'), (True, '66-5'), (True, '66-6'), (True, '66-7'), (True, '66-8'), (True, '66-9')],
-    [(False, '67-8'), (False, '67-9')],
-    [(False, '67-7'), (False, '67-9')],
-    [(False, '67-7'), (False, '67-8')],
-    [(False, '67-6'), (False, '67-9')],
-    [(False, '67-6'), (False, '67-8')],
-    [(False, '67-6'), (False, '67-7')],
-    [(False, '67-5'), (False, '67-9')],
-    [(False, '67-5'), (False, '67-8')],
-    [(False, '67-5'), (False, '67-7')],
-    [(False, '67-5'), (False, '67-6')],
-    [(False, '67-4'), (False, '67-9')],
-    [(False, '67-4'), (False, '67-8')],
-    [(False, '67-4'), (False, '67-7')],
-    [(False, '67-4'), (False, '67-6')],
-    [(False, '67-4'), (False, '67-5')],
-    [(False, '67-3'), (False, '67-9')],
-    [(False, '67-3'), (False, '67-8')],
-    [(False, '67-3'), (False, '67-7')],
-    [(False, '67-3'), (False, '67-6')],
-    [(False, '67-3'), (False, '67-5')],
-    [(False, '67-3'), (False, '67-4')],
-    [(False, '67-2'), (False, '67-9')],
-    [(False, '67-2'), (False, '67-8')],
-    [(False, '67-2'), (False, '67-7')],
-    [(False, '67-2'), (False, '67-6')],
-    [(False, '67-2'), (False, '67-5')],
-    [(False, '67-2'), (False, '67-4')],
-    [(False, '67-2'), (False, '67-3')],
-    [(False, '67-1'), (False, '67-9')],
-    [(False, '67-1'), (False, '67-8')],
-    [(False, '67-1'), (False, '67-7')],
-    [(False, '67-1'), (False, '67-6')],
-    [(False, '67-1'), (False, '67-5')],
-    [(False, '67-1'), (False, '67-4')],
-    [(False, '67-1'), (False, '67-3')],
-    [(False, '67-1'), (False, '67-2')],
-    [(True, '67-1'), (True, '67-2'), (True, '67-3'), (True, '67-4'), (True, '67-5'), (True, '67-6'), (True, '67-7'), (True, '67-8'), (True, '67-9')],
-    [(False, '68-8'), (False, '68-9')],
-    [(False, '68-7'), (False, '68-9')],
-    [(False, '68-7'), (False, '68-8')],
-    [(False, '68-6'), (False, '68-9')],
-    [(False, '68-6'), (False, '68-8')],
-    [(False, '68-6'), (False, '68-7')],
-    [(False, '68-5'), (False, '68-9')],
-    [(False, '68-5'), (False, '68-8')],
-    [(False, '68-5'), (False, '68-7')],
-    [(False, '68-5'), (False, '68-6')],
-    [(False, '68-4'), (False, '68-9')],
-    [(False, '68-4'), (False, '68-8')],
-    [(False, '68-4'), (False, '68-7')],
-    [(False, '68-4'), (False, '68-6')],
-    [(False, '68-4'), (False, '68-5')],
-    [(False, '68-3'), (False, '68-9')],
-    [(False, '68-3'), (False, '68-8')],
-    [(False, '68-3'), (False, '68-7')],
-    [(False, '68-3'), (False, '68-6')],
-    [(False, '68-3'), (False, '68-5')],
-    [(False, '68-3'), (False, '68-4')],
-    [(False, '68-2'), (False, '68-9')],
-    [(False, '68-2'), (False, '68-8')],
-    [(False, '68-2'), (False, '68-7')],
-    [(False, '68-2'), (False, '68-6')],
-    [(False, '68-2'), (False, '68-5')],
-    [(False, '68-2'), (False, '68-4')],
-    [(False, '68-2'), (False, '68-3')],
-    [(False, '68-1'), (False, '68-9')],
-    [(False, '68-1'), (False, '68-8')],
-    [(False, '68-1'), (False, '68-7')],
-    [(False, '68-1'), (False, '68-6')],
-    [(False, '68-1'), (False, '68-5')],
-    [(False, '68-1'), (False, '68-4')],
-    [(False, '68-1'), (False, '68-3')],
-    [(False, '68-1'), (False, '68-2')],
-    [(True, '68-1'), (True, '68-2'), (True, '68-3'), (True, '68-4'), (True, '68-5'), (True, '68-6'), (True, '68-7'), (True, '68-8'), (True, '68-9')],
-    [(False, '70-8'), (False, '70-9')],
-    [(False, '70-7'), (False, '70-9')],
-    [(False, '70-7'), (False, '70-8')],
-    [(False, '70-6'), (False, '70-9')],
-    [(False, '70-6'), (False, '70-8')],
-    [(False, '70-6'), (False, '70-7')],
-    [(False, '70-5'), (False, '70-9')],
-    [(False, '70-5'), (False, '70-8')],
-    [(False, '70-5'), (False, '70-7')],
-    [(False, '70-5'), (False, '70-6')],
-    [(False, '70-4'), (False, '70-9')],
-    [(False, '70-4'), (False, '70-8')],
-    [(False, '70-4'), (False, '70-7')],
-    [(False, '70-4'), (False, '70-6')],
-    [(False, '70-4'), (False, '70-5')],
-    [(False, '70-3'), (False, '70-9')],
-    [(False, '70-3'), (False, '70-8')],
-    [(False, '70-3'), (False, '70-7')],
-    [(False, '70-3'), (False, '70-6')],
-    [(False, '70-3'), (False, '70-5')],
-    [(False, '70-3'), (False, '70-4')],
-    [(False, '70-2'), (False, '70-9')],
-    [(False, '70-2'), (False, '70-8')],
-    [(False, '70-2'), (False, '70-7')],
-    [(False, '70-2'), (False, '70-6')],
-    [(False, '70-2'), (False, '70-5')],
-    [(False, '70-2'), (False, '70-4')],
-    [(False, '70-2'), (False, '70-3')],
-    [(False, '70-1'), (False, '70-9')],
-    [(False, '70-1'), (False, '70-8')],
-    [(False, '70-1'), (False, '70-7')],
-    [(False, '70-1'), (False, '70-6')],
-    [(False, '70-1'), (False, '70-5')],
-    [(False, '70-1'), (False, '70-4')],
-    [(False, '70-1'), (False, '70-3')],
-    [(False, '70-1'), (False, '70-2')],
-    [(True, '70-1'), (True, '70-2'), (True, '70-3'), (True, '70-4'), (True, '70-5'), (True, '70-6'), (True, '70-7'), (True, '70-8'), (True, '70-9')],
-    [(False, '71-8'), (False, '71-9')],
-    [(False, '71-7'), (False, '71-9')],
-    [(False, '71-7'), (False, '71-8')],
-    [(False, '71-6'), (False, '71-9')],
-    [(False, '71-6'), (False, '71-8')],
-    [(False, '71-6'), (False, '71-7')],
-    [(False, '71-5'), (False, '71-9')],
-    [(False, '71-5'), (False, '71-8')],
-    [(False, '71-5'), (False, '71-7')],
-    [(False, '71-5'), (False, '71-6')],
-    [(False, '71-4'), (False, '71-9')],
-    [(False, '71-4'), (False, '71-8')],
-    [(False, '71-4'), (False, '71-7')],
-    [(False, '71-4'), (False, '71-6')],
-    [(False, '71-4'), (False, '71-5')],
-    [(False, '71-3'), (False, '71-9')],
-    [(False, '71-3'), (False, '71-8')],
-    [(False, '71-3'), (False, '71-7')],
-    [(False, '71-3'), (False, '71-6')],
-    [(False, '71-3'), (False, '71-5')],
-    [(False, '71-3'), (False, '71-4')],
-    [(False, '71-2'), (False, '71-9')],
-    [(False, '71-2'), (False, '71-8')],
-    [(False, '71-2'), (False, '71-7')],
-    [(False, '71-2'), (False, '71-6')],
-    [(False, '71-2'), (False, '71-5')],
-    [(False, '71-2'), (False, '71-4')],
-    [(False, '71-2'), (False, '71-3')],
-    [(False, '71-1'), (False, '71-9')],
-    [(False, '71-1'), (False, '71-8')],
-    [(False, '71-1'), (False, '71-7')],
-    [(False, '71-1'), (False, '71-6')],
-    [(False, '71-1'), (False, '71-5')],
-    [(False, '71-1'), (False, '71-4')],
-    [(False, '71-1'), (False, '71-3')],
-    [(False, '71-1'), (False, '71-2')],
-    [(True, '71-1'), (True, '71-2'), (True, '71-3'), (True, '71-4'), (True, '71-5'), (True, '71-6'), (True, '71-7'), (True, '71-8'), (True, '71-9')],
-    [(False, '72-8'), (False, '72-9')],
-    [(False, '72-7'), (False, '72-9')],
-    [(False, '72-7'), (False, '72-8')],
-    [(False, '72-6'), (False, '72-9')],
-    [(False, '72-6'), (False, '72-8')],
-    [(False, '72-6'), (False, '72-7')],
-    [(False, '72-5'), (False, '72-9')],
-    [(False, '72-5'), (False, '72-8')],
-    [(False, '72-5'), (False, '72-7')],
-    [(False, '72-5'), (False, '72-6')],
-    [(False, '72-4'), (False, '72-9')],
-    [(False, '72-4'), (False, '72-8')],
-    [(False, '72-4'), (False, '72-7')],
-    [(False, '72-4'), (False, '72-6')],
-    [(False, '72-4'), (False, '72-5')],
-    [(False, '72-3'), (False, '72-9')],
-    [(False, '72-3'), (False, '72-8')],
-    [(False, '72-3'), (False, '72-7')],
-    [(False, '72-3'), (False, '72-6')],
-    [(False, '72-3'), (False, '72-5')],
-    [(False, '72-3'), (False, '72-4')],
-    [(False, '72-2'), (False, '72-9')],
-    [(False, '72-2'), (False, '72-8')],
-    [(False, '72-2'), (False, '72-7')],
-    [(False, '72-2'), (False, '72-6')],
-    [(False, '72-2'), (False, '72-5')],
-    [(False, '72-2'), (False, '72-4')],
-    [(False, '72-2'), (False, '72-3')],
-    [(False, '72-1'), (False, '72-9')],
-    [(False, '72-1'), (False, '72-8')],
-    [(False, '72-1'), (False, '72-7')],
-    [(False, '72-1'), (False, '72-6')],
-    [(False, '72-1'), (False, '72-5')],
-    [(False, '72-1'), (False, '72-4')],
-    [(False, '72-1'), (False, '72-3')],
-    [(False, '72-1'), (False, '72-2')],
-    [(True, '72-1'), (True, '72-2'), (True, '72-3'), (True, '72-4'), (True, '72-5'), (True, '72-6'), (True, '72-7'), (True, '72-8'), (True, '72-9')],
-    [(False, '73-8'), (False, '73-9')],
-    [(False, '73-7'), (False, '73-9')],
-    [(False, '73-7'), (False, '73-8')],
-    [(False, '73-6'), (False, '73-9')],
-    [(False, '73-6'), (False, '73-8')],
-    [(False, '73-6'), (False, '73-7')],
-    [(False, '73-5'), (False, '73-9')],
-    [(False, '73-5'), (False, '73-8')],
-    [(False, '73-5'), (False, '73-7')],
-    [(False, '73-5'), (False, '73-6')],
-    [(False, '73-4'), (False, '73-9')],
-    [(False, '73-4'), (False, '73-8')],
-    [(False, '73-4'), (False, '73-7')],
-    [(False, '73-4'), (False, '73-6')],
-    [(False, '73-4'), (False, '73-5')],
-    [(False, '73-3'), (False, '73-9')],
-    [(False, '73-3'), (False, '73-8')],
-    [(False, '73-3'), (False, '73-7')],
-    [(False, '73-3'), (False, '73-6')],
-    [(False, '73-3'), (False, '73-5')],
-    [(False, '73-3'), (False, '73-4')],
-    [(False, '73-2'), (False, '73-9')],
-    [(False, '73-2'), (False, '73-8')],
-    [(False, '73-2'), (False, '73-7')],
-    [(False, '73-2'), (False, '73-6')],
-    [(False, '73-2'), (False, '73-5')],
-    [(False, '73-2'), (False, '73-4')],
-    [(False, '73-2'), (False, '73-3')],
-    [(False, '73-1'), (False, '73-9')],
-    [(False, '73-1'), (False, '73-8')],
-    [(False, '73-1'), (False, '73-7')],
-    [(False, '73-1'), (False, '73-6')],
-    [(False, '73-1'), (False, '73-5')],
-    [(False, '73-1'), (False, '73-4')],
-    [(False, '73-1'), (False, '73-3')],
-    [(False, '73-1'), (False, '73-2')],
-    [(True, '73-1'), (True, '73-2'), (True, '73-3'), (True, '73-4'), (True, '73-5'), (True, '73-6'), (True, '73-7'), (True, '73-8'), (True, '73-9')],
-    [(False, '74-8'), (False, '74-9')],
-    [(False, '74-7'), (False, '74-9')],
-    [(False, '74-7'), (False, '74-8')],
-    [(False, '74-6'), (False, '74-9')],
-    [(False, '74-6'), (False, '74-8')],
-    [(False, '74-6'), (False, '74-7')],
-    [(False, '74-5'), (False, '74-9')],
-    [(False, '74-5'), (False, '74-8')],
-    [(False, '74-5'), (False, '74-7')],
-    [(False, '74-5'), (False, '74-6')],
-    [(False, '74-4'), (False, '74-9')],
-    [(False, '74-4'), (False, '74-8')],
-    [(False, '74-4'), (False, '74-7')],
-    [(False, '74-4'), (False, '74-6')],
-    [(False, '74-4'), (False, '74-5')],
-    [(False, '74-3'), (False, '74-9')],
-    [(False, '74-3'), (False, '74-8')],
-    [(False, '74-3'), (False, '74-7')],
-    [(False, '74-3'), (False, '74-6')],
-    [(False, '74-3'), (False, '74-5')],
-    [(False, '74-3'), (False, '74-4')],
-    [(False, '74-2'), (False, '74-9')],
-    [(False, '74-2'), (False, '74-8')],
-    [(False, '74-2'), (False, '74-7')],
-    [(False, '74-2'), (False, '74-6')],
-    [(False, '74-2'), (False, '74-5')],
-    [(False, '74-2'), (False, '74-4')],
-    [(False, '74-2'), (False, '74-3')],
-    [(False, '74-1'), (False, '74-9')],
-    [(False, '74-1'), (False, '74-8')],
-    [(False, '74-1'), (False, '74-7')],
-    [(False, '74-1'), (False, '74-6')],
-    [(False, '74-1'), (False, '74-5')],
-    [(False, '74-1'), (False, '74-4')],
-    [(False, '74-1'), (False, '74-3')],
-    [(False, '74-1'), (False, '74-2')],
-    [(True, '74-1'), (True, '74-2'), (True, '74-3'), (True, '74-4'), (True, '74-5'), (True, '74-6'), (True, '74-7'), (True, '74-8'), (True, '74-9')],
-    [(False, '75-8'), (False, '75-9')],
-    [(False, '75-7'), (False, '75-9')],
-    [(False, '75-7'), (False, '75-8')],
-    [(False, '75-6'), (False, '75-9')],
-    [(False, '75-6'), (False, '75-8')],
-    [(False, '75-6'), (False, '75-7')],
-    [(False, '75-5'), (False, '75-9')],
-    [(False, '75-5'), (False, '75-8')],
-    [(False, '75-5'), (False, '75-7')],
-    [(False, '75-5'), (False, '75-6')],
-    [(False, '75-4'), (False, '75-9')],
-    [(False, '75-4'), (False, '75-8')],
-    [(False, '75-4'), (False, '75-7')],
-    [(False, '75-4'), (False, '75-6')],
-    [(False, '75-4'), (False, '75-5')],
-    [(False, '75-3'), (False, '75-9')],
-    [(False, '75-3'), (False, '75-8')],
-    [(False, '75-3'), (False, '75-7')],
-    [(False, '75-3'), (False, '75-6')],
-    [(False, '75-3'), (False, '75-5')],
-    [(False, '75-3'), (False, '75-4')],
-    [(False, '75-2'), (False, '75-9')],
-    [(False, '75-2'), (False, '75-8')],
-    [(False, '75-2'), (False, '75-7')],
-    [(False, '75-2'), (False, '75-6')],
-    [(False, '75-2'), (False, '75-5')],
-    [(False, '75-2'), (False, '75-4')],
-    [(False, '75-2'), (False, '75-3')],
-    [(False, '75-1'), (False, '75-9')],
-    [(False, '75-1'), (False, '75-8')],
-    [(False, '75-1'), (False, '75-7')],
-    [(False, '75-1'), (False, '75-6')],
-    [(False, '75-1'), (False, '75-5')],
-    [(False, '75-1'), (False, '75-4')],
-    [(False, '75-1'), (False, '75-3')],
-    [(False, '75-1'), (False, '75-2')],
-    [(True, '75-1'), (True, '75-2'), (True, '75-3'), (True, '75-4'), (True, '75-5'), (True, '75-6'), (True, '75-7'), (True, '75-8'), (True, '75-9')],
-    [(False, '76-8'), (False, '76-9')],
-    [(False, '76-7'), (False, '76-9')],
-    [(False, '76-7'), (False, '76-8')],
-    [(False, '76-6'), (False, '76-9')],
-    [(False, '76-6'), (False, '76-8')],
-    [(False, '76-6'), (False, '76-7')],
-    [(False, '76-5'), (False, '76-9')],
-    [(False, '76-5'), (False, '76-8')],
-    [(False, '76-5'), (False, '76-7')],
-    [(False, '76-5'), (False, '76-6')],
-    [(False, '76-4'), (False, '76-9')],
-    [(False, '76-4'), (False, '76-8')],
-    [(False, '76-4'), (False, '76-7')],
-    [(False, '76-4'), (False, '76-6')],
-    [(False, '76-4'), (False, '76-5')],
-    [(False, '76-3'), (False, '76-9')],
-    [(False, '76-3'), (False, '76-8')],
-    [(False, '76-3'), (False, '76-7')],
-    [(False, '76-3'), (False, '76-6')],
-    [(False, '76-3'), (False, '76-5')],
-    [(False, '76-3'), (False, '76-4')],
-    [(False, '76-2'), (False, '76-9')],
-    [(False, '76-2'), (False, '76-8')],
-    [(False, '76-2'), (False, '76-7')],
-    [(False, '76-2'), (False, '76-6')],
-    [(False, '76-2'), (False, '76-5')],
-    [(False, '76-2'), (False, '76-4')],
-    [(False, '76-2'), (False, '76-3')],
-    [(False, '76-1'), (False, '76-9')],
-    [(False, '76-1'), (False, '76-8')],
-    [(False, '76-1'), (False, '76-7')],
-    [(False, '76-1'), (False, '76-6')],
-    [(False, '76-1'), (False, '76-5')],
-    [(False, '76-1'), (False, '76-4')],
-    [(False, '76-1'), (False, '76-3')],
-    [(False, '76-1'), (False, '76-2')],
-    [(True, '76-1'), (True, '76-2'), (True, '76-3'), (True, '76-4'), (True, '76-5'), (True, '76-6'), (True, '76-7'), (True, '76-8'), (True, '76-9')],
-    [(False, '77-8'), (False, '77-9')],
-    [(False, '77-7'), (False, '77-9')],
-    [(False, '77-7'), (False, '77-8')],
-    [(False, '77-6'), (False, '77-9')],
-    [(False, '77-6'), (False, '77-8')],
-    [(False, '77-6'), (False, '77-7')],
-    [(False, '77-5'), (False, '77-9')],
-    [(False, '77-5'), (False, '77-8')],
-    [(False, '77-5'), (False, '77-7')],
-    [(False, '77-5'), (False, '77-6')],
-    [(False, '77-4'), (False, '77-9')],
-    [(False, '77-4'), (False, '77-8')],
-    [(False, '77-4'), (False, '77-7')],
-    [(False, '77-4'), (False, '77-6')],
-    [(False, '77-4'), (False, '77-5')],
-    [(False, '77-3'), (False, '77-9')],
-    [(False, '77-3'), (False, '77-8')],
-    [(False, '77-3'), (False, '77-7')],
-    [(False, '77-3'), (False, '77-6')],
-    [(False, '77-3'), (False, '77-5')],
-    [(False, '77-3'), (False, '77-4')],
-    [(False, '77-2'), (False, '77-9')],
-    [(False, '77-2'), (False, '77-8')],
-    [(False, '77-2'), (False, '77-7')],
-    [(False, '77-2'), (False, '77-6')],
-    [(False, '77-2'), (False, '77-5')],
-    [(False, '77-2'), (False, '77-4')],
-    [(False, '77-2'), (False, '77-3')],
-    [(False, '77-1'), (False, '77-9')],
-    [(False, '77-1'), (False, '77-8')],
-    [(False, '77-1'), (False, '77-7')],
-    [(False, '77-1'), (False, '77-6')],
-    [(False, '77-1'), (False, '77-5')],
-    [(False, '77-1'), (False, '77-4')],
-    [(False, '77-1'), (False, '77-3')],
-    [(False, '77-1'), (False, '77-2')],
-    [(True, '77-1'), (True, '77-2'), (True, '77-3'), (True, '77-4'), (True, '77-5'), (True, '77-6'), (True, '77-7'), (True, '77-8'), (True, '77-9')],
-    [(False, '78-8'), (False, '78-9')],
-    [(False, '78-7'), (False, '78-9')],
-    [(False, '78-7'), (False, '78-8')],
-    [(False, '78-6'), (False, '78-9')],
-    [(False, '78-6'), (False, '78-8')],
-    [(False, '78-6'), (False, '78-7')],
-    [(False, '78-5'), (False, '78-9')],
-    [(False, '78-5'), (False, '78-8')],
-    [(False, '78-5'), (False, '78-7')],
-    [(False, '78-5'), (False, '78-6')],
-    [(False, '78-4'), (False, '78-9')],
-    [(False, '78-4'), (False, '78-8')],
-    [(False, '78-4'), (False, '78-7')],
-    [(False, '78-4'), (False, '78-6')],
-    [(False, '78-4'), (False, '78-5')],
-    [(False, '78-3'), (False, '78-9')],
-    [(False, '78-3'), (False, '78-8')],
-    [(False, '78-3'), (False, '78-7')],
-    [(False, '78-3'), (False, '78-6')],
-    [(False, '78-3'), (False, '78-5')],
-    [(False, '78-3'), (False, '78-4')],
-    [(False, '78-2'), (False, '78-9')],
-    [(False, '78-2'), (False, '78-8')],
-    [(False, '78-2'), (False, '78-7')],
-    [(False, '78-2'), (False, '78-6')],
-    [(False, '78-2'), (False, '78-5')],
-    [(False, '78-2'), (False, '78-4')],
-    [(False, '78-2'), (False, '78-3')],
-    [(False, '78-1'), (False, '78-9')],
-    [(False, '78-1'), (False, '78-8')],
-    [(False, '78-1'), (False, '78-7')],
-    [(False, '78-1'), (False, '78-6')],
-    [(False, '78-1'), (False, '78-5')],
-    [(False, '78-1'), (False, '78-4')],
-    [(False, '78-1'), (False, '78-3')],
-    [(False, '78-1'), (False, '78-2')],
-    [(True, '78-1'), (True, '78-2'), (True, '78-3'), (True, '78-4'), (True, '78-5'), (True, '78-6'), (True, '78-7'), (True, '78-8'), (True, '78-9')],
-    [(False, '80-8'), (False, '80-9')],
-    [(False, '80-7'), (False, '80-9')],
-    [(False, '80-7'), (False, '80-8')],
-    [(False, '80-6'), (False, '80-9')],
-    [(False, '80-6'), (False, '80-8')],
-    [(False, '80-6'), (False, '80-7')],
-    [(False, '80-5'), (False, '80-9')],
-    [(False, '80-5'), (False, '80-8')],
-    [(False, '80-5'), (False, '80-7')],
-    [(False, '80-5'), (False, '80-6')],
-    [(False, '80-4'), (False, '80-9')],
-    [(False, '80-4'), (False, '80-8')],
-    [(False, '80-4'), (False, '80-7')],
-    [(False, '80-4'), (False, '80-6')],
-    [(False, '80-4'), (False, '80-5')],
-    [(False, '80-3'), (False, '80-9')],
-    [(False, '80-3'), (False, '80-8')],
-    [(False, '80-3'), (False, '80-7')],
-    [(False, '80-3'), (False, '80-6')],
-    [(False, '80-3'), (False, '80-5')],
-    [(False, '80-3'), (False, '80-4')],
-    [(False, '80-2'), (False, '80-9')],
-    [(False, '80-2'), (False, '80-8')],
-    [(False, '80-2'), (False, '80-7')],
-    [(False, '80-2'), (False, '80-6')],
-    [(False, '80-2'), (False, '80-5')],
-    [(False, '80-2'), (False, '80-4')],
-    [(False, '80-2'), (False, '80-3')],
-    [(False, '80-1'), (False, '80-9')],
-    [(False, '80-1'), (False, '80-8')],
-    [(False, '80-1'), (False, '80-7')],
-    [(False, '80-1'), (False, '80-6')],
-    [(False, '80-1'), (False, '80-5')],
-    [(False, '80-1'), (False, '80-4')],
-    [(False, '80-1'), (False, '80-3')],
-    [(False, '80-1'), (False, '80-2')],
-    [(True, '80-1'), (True, '80-2'), (True, '80-3'), (True, '80-4'), (True, '80-5'), (True, '80-6'), (True, '80-7'), (True, '80-8'), (True, '80-9')],
-    [(False, '81-8'), (False, '81-9')],
-    [(False, '81-7'), (False, '81-9')],
-    [(False, '81-7'), (False, '81-8')],
-    [(False, '81-6'), (False, '81-9')],
-    [(False, '81-6'), (False, '81-8')],
-    [(False, '81-6'), (False, '81-7')],
-    [(False, '81-5'), (False, '81-9')],
-    [(False, '81-5'), (False, '81-8')],
-    [(False, '81-5'), (False, '81-7')],
-    [(False, '81-5'), (False, '81-6')],
-    [(False, '81-4'), (False, '81-9')],
-    [(False, '81-4'), (False, '81-8')],
-    [(False, '81-4'), (False, '81-7')],
-    [(False, '81-4'), (False, '81-6')],
-    [(False, '81-4'), (False, '81-5')],
-    [(False, '81-3'), (False, '81-9')],
-    [(False, '81-3'), (False, '81-8')],
-    [(False, '81-3'), (False, '81-7')],
-    [(False, '81-3'), (False, '81-6')],
-    [(False, '81-3'), (False, '81-5')],
-    [(False, '81-3'), (False, '81-4')],
-    [(False, '81-2'), (False, '81-9')],
-    [(False, '81-2'), (False, '81-8')],
-    [(False, '81-2'), (False, '81-7')],
-    [(False, '81-2'), (False, '81-6')],
-    [(False, '81-2'), (False, '81-5')],
-    [(False, '81-2'), (False, '81-4')],
-    [(False, '81-2'), (False, '81-3')],
-    [(False, '81-1'), (False, '81-9')],
-    [(False, '81-1'), (False, '81-8')],
-    [(False, '81-1'), (False, '81-7')],
-    [(False, '81-1'), (False, '81-6')],
-    [(False, '81-1'), (False, '81-5')],
-    [(False, '81-1'), (False, '81-4')],
-    [(False, '81-1'), (False, '81-3')],
-    [(False, '81-1'), (False, '81-2')],
-    [(True, '81-1'), (True, '81-2'), (True, '81-3'), (True, '81-4'), (True, '81-5'), (True, '81-6'), (True, '81-7'), (True, '81-8'), (True, '81-9')],
-    [(False, '82-8'), (False, '82-9')],
-    [(False, '82-7'), (False, '82-9')],
-    [(False, '82-7'), (False, '82-8')],
-    [(False, '82-6'), (False, '82-9')],
-    [(False, '82-6'), (False, '82-8')],
-    [(False, '82-6'), (False, '82-7')],
-    [(False, '82-5'), (False, '82-9')],
-    [(False, '82-5'), (False, '82-8')],
-    [(False, '82-5'), (False, '82-7')],
-    [(False, '82-5'), (False, '82-6')],
-    [(False, '82-4'), (False, '82-9')],
-    [(False, '82-4'), (False, '82-8')],
-    [(False, '82-4'), (False, '82-7')],
-    [(False, '82-4'), (False, '82-6')],
-    [(False, '82-4'), (False, '82-5')],
-    [(False, '82-3'), (False, '82-9')],
-    [(False, '82-3'), (False, '82-8')],
-    [(False, '82-3'), (False, '82-7')],
-    [(False, '82-3'), (False, '82-6')],
-    [(False, '82-3'), (False, '82-5')],
-    [(False, '82-3'), (False, '82-4')],
-    [(False, '82-2'), (False, '82-9')],
-    [(False, '82-2'), (False, '82-8')],
-    [(False, '82-2'), (False, '82-7')],
-    [(False, '82-2'), (False, '82-6')],
-    [(False, '82-2'), (False, '82-5')],
-    [(False, '82-2'), (False, '82-4')],
-    [(False, '82-2'), (False, '82-3')],
-    [(False, '82-1'), (False, '82-9')],
-    [(False, '82-1'), (False, '82-8')],
-    [(False, '82-1'), (False, '82-7')],
-    [(False, '82-1'), (False, '82-6')],
-    [(False, '82-1'), (False, '82-5')],
-    [(False, '82-1'), (False, '82-4')],
-    [(False, '82-1'), (False, '82-3')],
-    [(False, '82-1'), (False, '82-2')],
-    [(True, '82-1'), (True, '82-2'), (True, '82-3'), (True, '82-4'), (True, '82-5'), (True, '82-6'), (True, '82-7'), (True, '82-8'), (True, '82-9')],
-    [(False, '83-8'), (False, '83-9')],
-    [(False, '83-7'), (False, '83-9')],
-    [(False, '83-7'), (False, '83-8')],
-    [(False, '83-6'), (False, '83-9')],
-    [(False, '83-6'), (False, '83-8')],
-    [(False, '83-6'), (False, '83-7')],
-    [(False, '83-5'), (False, '83-9')],
-    [(False, '83-5'), (False, '83-8')],
-    [(False, '83-5'), (False, '83-7')],
-    [(False, '83-5'), (False, '83-6')],
-    [(False, '83-4'), (False, '83-9')],
-    [(False, '83-4'), (False, '83-8')],
-    [(False, '83-4'), (False, '83-7')],
-    [(False, '83-4'), (False, '83-6')],
-    [(False, '83-4'), (False, '83-5')],
-    [(False, '83-3'), (False, '83-9')],
-    [(False, '83-3'), (False, '83-8')],
-    [(False, '83-3'), (False, '83-7')],
-    [(False, '83-3'), (False, '83-6')],
-    [(False, '83-3'), (False, '83-5')],
-    [(False, '83-3'), (False, '83-4')],
-    [(False, '83-2'), (False, '83-9')],
-    [(False, '83-2'), (False, '83-8')],
-    [(False, '83-2'), (False, '83-7')],
-    [(False, '83-2'), (False, '83-6')],
-    [(False, '83-2'), (False, '83-5')],
-    [(False, '83-2'), (False, '83-4')],
-    [(False, '83-2'), (False, '83-3')],
-    [(False, '83-1'), (False, '83-9')],
-    [(False, '83-1'), (False, '83-8')],
-    [(False, '83-1'), (False, '83-7')],
-    [(False, '83-1'), (False, '83-6')],
-    [(False, '83-1'), (False, '83-5')],
-    [(False, '83-1'), (False, '83-4')],
-    [(False, '83-1'), (False, '83-3')],
-    [(False, '83-1'), (False, '83-2')],
-    [(True, '83-1'), (True, '83-2'), (True, '83-3'), (True, '83-4'), (True, '83-5'), (True, '83-6'), (True, '83-7'), (True, '83-8'), (True, '83-9')],
-    [(False, '84-8'), (False, '84-9')],
-    [(False, '84-7'), (False, '84-9')],
-    [(False, '84-7'), (False, '84-8')],
-    [(False, '84-6'), (False, '84-9')],
-    [(False, '84-6'), (False, '84-8')],
-    [(False, '84-6'), (False, '84-7')],
-    [(False, '84-5'), (False, '84-9')],
-    [(False, '84-5'), (False, '84-8')],
-    [(False, '84-5'), (False, '84-7')],
-    [(False, '84-5'), (False, '84-6')],
-    [(False, '84-4'), (False, '84-9')],
-    [(False, '84-4'), (False, '84-8')],
-    [(False, '84-4'), (False, '84-7')],
-    [(False, '84-4'), (False, '84-6')],
-    [(False, '84-4'), (False, '84-5')],
-    [(False, '84-3'), (False, '84-9')],
-    [(False, '84-3'), (False, '84-8')],
-    [(False, '84-3'), (False, '84-7')],
-    [(False, '84-3'), (False, '84-6')],
-    [(False, '84-3'), (False, '84-5')],
-    [(False, '84-3'), (False, '84-4')],
-    [(False, '84-2'), (False, '84-9')],
-    [(False, '84-2'), (False, '84-8')],
-    [(False, '84-2'), (False, '84-7')],
-    [(False, '84-2'), (False, '84-6')],
-    [(False, '84-2'), (False, '84-5')],
-    [(False, '84-2'), (False, '84-4')],
-    [(False, '84-2'), (False, '84-3')],
-    [(False, '84-1'), (False, '84-9')],
-    [(False, '84-1'), (False, '84-8')],
-    [(False, '84-1'), (False, '84-7')],
-    [(False, '84-1'), (False, '84-6')],
-    [(False, '84-1'), (False, '84-5')],
-    [(False, '84-1'), (False, '84-4')],
-    [(False, '84-1'), (False, '84-3')],
-    [(False, '84-1'), (False, '84-2')],
-    [(True, '84-1'), (True, '84-2'), (True, '84-3'), (True, '84-4'), (True, '84-5'), (True, '84-6'), (True, '84-7'), (True, '84-8'), (True, '84-9')],
-    [(False, '85-8'), (False, '85-9')],
-    [(False, '85-7'), (False, '85-9')],
-    [(False, '85-7'), (False, '85-8')],
-    [(False, '85-6'), (False, '85-9')],
-    [(False, '85-6'), (False, '85-8')],
-    [(False, '85-6'), (False, '85-7')],
-    [(False, '85-5'), (False, '85-9')],
-    [(False, '85-5'), (False, '85-8')],
-    [(False, '85-5'), (False, '85-7')],
-    [(False, '85-5'), (False, '85-6')],
-    [(False, '85-4'), (False, '85-9')],
-    [(False, '85-4'), (False, '85-8')],
-    [(False, '85-4'), (False, '85-7')],
-    [(False, '85-4'), (False, '85-6')],
-    [(False, '85-4'), (False, '85-5')],
-    [(False, '85-3'), (False, '85-9')],
-    [(False, '85-3'), (False, '85-8')],
-    [(False, '85-3'), (False, '85-7')],
-    [(False, '85-3'), (False, '85-6')],
-    [(False, '85-3'), (False, '85-5')],
-    [(False, '85-3'), (False, '85-4')],
-    [(False, '85-2'), (False, '85-9')],
-    [(False, '85-2'), (False, '85-8')],
-    [(False, '85-2'), (False, '85-7')],
-    [(False, '85-2'), (False, '85-6')],
-    [(False, '85-2'), (False, '85-5')],
-    [(False, '85-2'), (False, '85-4')],
-    [(False, '85-2'), (False, '85-3')],
-    [(False, '85-1'), (False, '85-9')],
-    [(False, '85-1'), (False, '85-8')],
-    [(False, '85-1'), (False, '85-7')],
-    [(False, '85-1'), (False, '85-6')],
-    [(False, '85-1'), (False, '85-5')],
-    [(False, '85-1'), (False, '85-4')],
-    [(False, '85-1'), (False, '85-3')],
-    [(False, '85-1'), (False, '85-2')],
-    [(True, '85-1'), (True, '85-2'), (True, '85-3'), (True, '85-4'), (True, '85-5'), (True, '85-6'), (True, '85-7'), (True, '85-8'), (True, '85-9')],
-    [(False, '86-8'), (False, '86-9')],
-    [(False, '86-7'), (False, '86-9')],
-    [(False, '86-7'), (False, '86-8')],
-    [(False, '86-6'), (False, '86-9')],
-    [(False, '86-6'), (False, '86-8')],
-    [(False, '86-6'), (False, '86-7')],
-    [(False, '86-5'), (False, '86-9')],
-    [(False, '86-5'), (False, '86-8')],
-    [(False, '86-5'), (False, '86-7')],
-    [(False, '86-5'), (False, '86-6')],
-    [(False, '86-4'), (False, '86-9')],
-    [(False, '86-4'), (False, '86-8')],
-    [(False, '86-4'), (False, '86-7')],
-    [(False, '86-4'), (False, '86-6')],
-    [(False, '86-4'), (False, '86-5')],
-    [(False, '86-3'), (False, '86-9')],
-    [(False, '86-3'), (False, '86-8')],
-    [(False, '86-3'), (False, '86-7')],
-    [(False, '86-3'), (False, '86-6')],
-    [(False, '86-3'), (False, '86-5')],
-    [(False, '86-3'), (False, '86-4')],
-    [(False, '86-2'), (False, '86-9')],
-    [(False, '86-2'), (False, '86-8')],
-    [(False, '86-2'), (False, '86-7')],
-    [(False, '86-2'), (False, '86-6')],
-    [(False, '86-2'), (False, '86-5')],
-    [(False, '86-2'), (False, '86-4')],
-    [(False, '86-2'), (False, '86-3')],
-    [(False, '86-1'), (False, '86-9')],
-    [(False, '86-1'), (False, '86-8')],
-    [(False, '86-1'), (False, '86-7')],
-    [(False, '86-1'), (False, '86-6')],
-    [(False, '86-1'), (False, '86-5')],
-    [(False, '86-1'), (False, '86-4')],
-    [(False, '86-1'), (False, '86-3')],
-    [(False, '86-1'), (False, '86-2')],
-    [(True, '86-1'), (True, '86-2'), (True, '86-3'), (True, '86-4'), (True, '86-5'), (True, '86-6'), (True, '86-7'), (True, '86-8'), (True, '86-9')],
-    [(False, '87-8'), (False, '87-9')],
-    [(False, '87-7'), (False, '87-9')],
-    [(False, '87-7'), (False, '87-8')],
-    [(False, '87-6'), (False, '87-9')],
-    [(False, '87-6'), (False, '87-8')],
-    [(False, '87-6'), (False, '87-7')],
-    [(False, '87-5'), (False, '87-9')],
-    [(False, '87-5'), (False, '87-8')],
-    [(False, '87-5'), (False, '87-7')],
-    [(False, '87-5'), (False, '87-6')],
-    [(False, '87-4'), (False, '87-9')],
-    [(False, '87-4'), (False, '87-8')],
-    [(False, '87-4'), (False, '87-7')],
-    [(False, '87-4'), (False, '87-6')],
-    [(False, '87-4'), (False, '87-5')],
-    [(False, '87-3'), (False, '87-9')],
-    [(False, '87-3'), (False, '87-8')],
-    [(False, '87-3'), (False, '87-7')],
-    [(False, '87-3'), (False, '87-6')],
-    [(False, '87-3'), (False, '87-5')],
-    [(False, '87-3'), (False, '87-4')],
-    [(False, '87-2'), (False, '87-9')],
-    [(False, '87-2'), (False, '87-8')],
-    [(False, '87-2'), (False, '87-7')],
-    [(False, '87-2'), (False, '87-6')],
-    [(False, '87-2'), (False, '87-5')],
-    [(False, '87-2'), (False, '87-4')],
-    [(False, '87-2'), (False, '87-3')],
-    [(False, '87-1'), (False, '87-9')],
-    [(False, '87-1'), (False, '87-8')],
-    [(False, '87-1'), (False, '87-7')],
-    [(False, '87-1'), (False, '87-6')],
-    [(False, '87-1'), (False, '87-5')],
-    [(False, '87-1'), (False, '87-4')],
-    [(False, '87-1'), (False, '87-3')],
-    [(False, '87-1'), (False, '87-2')],
-    [(True, '87-1'), (True, '87-2'), (True, '87-3'), (True, '87-4'), (True, '87-5'), (True, '87-6'), (True, '87-7'), (True, '87-8'), (True, '87-9')],
-    [(False, '88-8'), (False, '88-9')],
-    [(False, '88-7'), (False, '88-9')],
-    [(False, '88-7'), (False, '88-8')],
-    [(False, '88-6'), (False, '88-9')],
-    [(False, '88-6'), (False, '88-8')],
-    [(False, '88-6'), (False, '88-7')],
-    [(False, '88-5'), (False, '88-9')],
-    [(False, '88-5'), (False, '88-8')],
-    [(False, '88-5'), (False, '88-7')],
-    [(False, '88-5'), (False, '88-6')],
-    [(False, '88-4'), (False, '88-9')],
-    [(False, '88-4'), (False, '88-8')],
-    [(False, '88-4'), (False, '88-7')],
-    [(False, '88-4'), (False, '88-6')],
-    [(False, '88-4'), (False, '88-5')],
-    [(False, '88-3'), (False, '88-9')],
-    [(False, '88-3'), (False, '88-8')],
-    [(False, '88-3'), (False, '88-7')],
-    [(False, '88-3'), (False, '88-6')],
-    [(False, '88-3'), (False, '88-5')],
-    [(False, '88-3'), (False, '88-4')],
-    [(False, '88-2'), (False, '88-9')],
-    [(False, '88-2'), (False, '88-8')],
-    [(False, '88-2'), (False, '88-7')],
-    [(False, '88-2'), (False, '88-6')],
-    [(False, '88-2'), (False, '88-5')],
-    [(False, '88-2'), (False, '88-4')],
-    [(False, '88-2'), (False, '88-3')],
-    [(False, '88-1'), (False, '88-9')],
-    [(False, '88-1'), (False, '88-8')],
-    [(False, '88-1'), (False, '88-7')],
-    [(False, '88-1'), (False, '88-6')],
-    [(False, '88-1'), (False, '88-5')],
-    [(False, '88-1'), (False, '88-4')],
-    [(False, '88-1'), (False, '88-3')],
-    [(False, '88-1'), (False, '88-2')],
-    [(True, '88-1'), (True, '88-2'), (True, '88-3'), (True, '88-4'), (True, '88-5'), (True, '88-6'), (True, '88-7'), (True, '88-8'), (True, '88-9')],
-    [(False, '05-1'), (False, '08-1')],
-    [(False, '05-1'), (False, '07-1')],
-    [(False, '05-1'), (False, '06-1')],
-    [(False, '04-1'), (False, '08-1')],
-    [(False, '04-1'), (False, '07-1')],
-    [(False, '04-1'), (False, '06-1')],
-    [(False, '03-1'), (False, '08-1')],
-    [(False, '03-1'), (False, '07-1')],
-    [(False, '03-1'), (False, '06-1')],
-    [(False, '02-1'), (False, '08-1')],
-    [(False, '02-1'), (False, '07-1')],
-    [(False, '02-1'), (False, '06-1')],
-    [(False, '02-1'), (False, '05-1')],
-    [(False, '02-1'), (False, '04-1')],
-    [(False, '02-1'), (False, '03-1')],
-    [(False, '01-1'), (False, '08-1')],
-    [(False, '01-1'), (False, '07-1')],
-    [(False, '01-1'), (False, '06-1')],
-    [(False, '01-1'), (False, '05-1')],
-    [(False, '01-1'), (False, '04-1')],
-    [(False, '01-1'), (False, '03-1')],
-    [(False, '00-1'), (False, '08-1')],
-    [(False, '00-1'), (False, '07-1')],
-    [(False, '00-1'), (False, '06-1')],
-    [(False, '00-1'), (False, '05-1')],
-    [(False, '00-1'), (False, '04-1')],
-    [(False, '00-1'), (False, '03-1')],
-    [(True, '00-1'), (True, '01-1'), (True, '02-1'), (True, '03-1'), (True, '04-1'), (True, '05-1'), (True, '06-1'), (True, '07-1'), (True, '08-1')],
-    [(False, '15-1'), (False, '18-1')],
-    [(False, '15-1'), (False, '17-1')],
-    [(False, '15-1'), (False, '16-1')],
-    [(False, '14-1'), (False, '18-1')],
-    [(False, '14-1'), (False, '17-1')],
-    [(False, '14-1'), (False, '16-1')],
-    [(False, '13-1'), (False, '18-1')],
-    [(False, '13-1'), (False, '17-1')],
-    [(False, '13-1'), (False, '16-1')],
-    [(False, '12-1'), (False, '18-1')],
-    [(False, '12-1'), (False, '17-1')],
-    [(False, '12-1'), (False, '16-1')],
-    [(False, '12-1'), (False, '15-1')],
-    [(False, '12-1'), (False, '14-1')],
-    [(False, '12-1'), (False, '13-1')],
-    [(False, '11-1'), (False, '18-1')],
-    [(False, '11-1'), (False, '17-1')],
-    [(False, '11-1'), (False, '16-1')],
-    [(False, '11-1'), (False, '15-1')],
-    [(False, '11-1'), (False, '14-1')],
-    [(False, '11-1'), (False, '13-1')],
-    [(False, '10-1'), (False, '18-1')],
-    [(False, '10-1'), (False, '17-1')],
-    [(False, '10-1'), (False, '16-1')],
-    [(False, '10-1'), (False, '15-1')],
-    [(False, '10-1'), (False, '14-1')],
-    [(False, '10-1'), (False, '13-1')],
-    [(True, '10-1'), (True, '11-1'), (True, '12-1'), (True, '13-1'), (True, '14-1'), (True, '15-1'), (True, '16-1'), (True, '17-1'), (True, '18-1')],
-    [(False, '25-1'), (False, '28-1')],
-    [(False, '25-1'), (False, '27-1')],
-    [(False, '25-1'), (False, '26-1')],
-    [(False, '24-1'), (False, '28-1')],
-    [(False, '24-1'), (False, '27-1')],
-    [(False, '24-1'), (False, '26-1')],
-    [(False, '23-1'), (False, '28-1')],
-    [(False, '23-1'), (False, '27-1')],
-    [(False, '23-1'), (False, '26-1')],
-    [(False, '22-1'), (False, '28-1')],
-    [(False, '22-1'), (False, '27-1')],
-    [(False, '22-1'), (False, '26-1')],
-    [(False, '22-1'), (False, '25-1')],
-    [(False, '22-1'), (False, '24-1')],
-    [(False, '22-1'), (False, '23-1')],
-    [(False, '21-1'), (False, '28-1')],
-    [(False, '21-1'), (False, '27-1')],
-    [(False, '21-1'), (False, '26-1')],
-    [(False, '21-1'), (False, '25-1')],
-    [(False, '21-1'), (False, '24-1')],
-    [(False, '21-1'), (False, '23-1')],
-    [(False, '20-1'), (False, '28-1')],
-    [(False, '20-1'), (False, '27-1')],
-    [(False, '20-1'), (False, '26-1')],
-    [(False, '20-1'), (False, '25-1')],
-    [(False, '20-1'), (False, '24-1')],
-    [(False, '20-1'), (False, '23-1')],
-    [(True, '20-1'), (True, '21-1'), (True, '22-1'), (True, '23-1'), (True, '24-1'), (True, '25-1'), (True, '26-1'), (True, '27-1'), (True, '28-1')],
-    [(False, '35-1'), (False, '38-1')],
-    [(False, '35-1'), (False, '37-1')],
-    [(False, '35-1'), (False, '36-1')],
-    [(False, '34-1'), (False, '38-1')],
-    [(False, '34-1'), (False, '37-1')],
-    [(False, '34-1'), (False, '36-1')],
-    [(False, '33-1'), (False, '38-1')],
-    [(False, '33-1'), (False, '37-1')],
-    [(False, '33-1'), (False, '36-1')],
-    [(False, '32-1'), (False, '38-1')],
-    [(False, '32-1'), (False, '37-1')],
-    [(False, '32-1'), (False, '36-1')],
-    [(False, '32-1'), (False, '35-1')],
-    [(False, '32-1'), (False, '34-1')],
-    [(False, '32-1'), (False, '33-1')],
-    [(False, '31-1'), (False, '38-1')],
-    [(False, '31-1'), (False, '37-1')],
-    [(False, '31-1'), (False, '36-1')],
-    [(False, '31-1'), (False, '35-1')],
-    [(False, '31-1'), (False, '34-1')],
-    [(False, '31-1'), (False, '33-1')],
-    [(False, '30-1'), (False, '38-1')],
-    [(False, '30-1'), (False, '37-1')],
-    [(False, '30-1'), (False, '36-1')],
-    [(False, '30-1'), (False, '35-1')],
-    [(False, '30-1'), (False, '34-1')],
-    [(False, '30-1'), (False, '33-1')],
-    [(True, '30-1'), (True, '31-1'), (True, '32-1'), (True, '33-1'), (True, '34-1'), (True, '35-1'), (True, '36-1'), (True, '37-1'), (True, '38-1')],
-    [(False, '45-1'), (False, '48-1')],
-    [(False, '45-1'), (False, '47-1')],
-    [(False, '45-1'), (False, '46-1')],
-    [(False, '44-1'), (False, '48-1')],
-    [(False, '44-1'), (False, '47-1')],
-    [(False, '44-1'), (False, '46-1')],
-    [(False, '43-1'), (False, '48-1')],
-    [(False, '43-1'), (False, '47-1')],
-    [(False, '43-1'), (False, '46-1')],
-    [(False, '42-1'), (False, '48-1')],
-    [(False, '42-1'), (False, '47-1')],
-    [(False, '42-1'), (False, '46-1')],
-    [(False, '42-1'), (False, '45-1')],
-    [(False, '42-1'), (False, '44-1')],
-    [(False, '42-1'), (False, '43-1')],
-    [(False, '41-1'), (False, '48-1')],
-    [(False, '41-1'), (False, '47-1')],
-    [(False, '41-1'), (False, '46-1')],
-    [(False, '41-1'), (False, '45-1')],
-    [(False, '41-1'), (False, '44-1')],
-    [(False, '41-1'), (False, '43-1')],
-    [(False, '40-1'), (False, '48-1')],
-    [(False, '40-1'), (False, '47-1')],
-    [(False, '40-1'), (False, '46-1')],
-    [(False, '40-1'), (False, '45-1')],
-    [(False, '40-1'), (False, '44-1')],
-    [(False, '40-1'), (False, '43-1')],
-    [(True, '40-1'), (True, '41-1'), (True, '42-1'), (True, '43-1'), (True, '44-1'), (True, '45-1'), (True, '46-1'), (True, '47-1'), (True, '48-1')],
-    [(False, '55-1'), (False, '58-1')],
-    [(False, '55-1'), (False, '57-1')],
-    [(False, '55-1'), (False, '56-1')],
-    [(False, '54-1'), (False, '58-1')],
-    [(False, '54-1'), (False, '57-1')],
-    [(False, '54-1'), (False, '56-1')],
-    [(False, '53-1'), (False, '58-1')],
-    [(False, '53-1'), (False, '57-1')],
-    [(False, '53-1'), (False, '56-1')],
-    [(False, '52-1'), (False, '58-1')],
-    [(False, '52-1'), (False, '57-1')],
-    [(False, '52-1'), (False, '56-1')],
-    [(False, '52-1'), (False, '55-1')],
-    [(False, '52-1'), (False, '54-1')],
-    [(False, '52-1'), (False, '53-1')],
-    [(False, '51-1'), (False, '58-1')],
-    [(False, '51-1'), (False, '57-1')],
-    [(False, '51-1'), (False, '56-1')],
-    [(False, '51-1'), (False, '55-1')],
-    [(False, '51-1'), (False, '54-1')],
-    [(False, '51-1'), (False, '53-1')],
-    [(False, '50-1'), (False, '58-1')],
-    [(False, '50-1'), (False, '57-1')],
-    [(False, '50-1'), (False, '56-1')],
-    [(False, '50-1'), (False, '55-1')],
-    [(False, '50-1'), (False, '54-1')],
-    [(False, '50-1'), (False, '53-1')],
-    [(True, '50-1'), (True, '51-1'), (True, '52-1'), (True, '53-1'), (True, '54-1'), (True, '55-1'), (True, '56-1'), (True, '57-1'), (True, '58-1')],
-    [(False, '65-1'), (False, '68-1')],
-    [(False, '65-1'), (False, '67-1')],
-    [(False, '65-1'), (False, '66-1')],
-    [(False, '64-1'), (False, '68-1')],
-    [(False, '64-1'), (False, '67-1')],
-    [(False, '64-1'), (False, '66-1')],
-    [(False, '63-1'), (False, '68-1')],
-    [(False, '63-1'), (False, '67-1')],
-    [(False, '63-1'), (False, '66-1')],
-    [(False, '62-1'), (False, '68-1')],
-    [(False, '62-1'), (False, '67-1')],
-    [(False, '62-1'), (False, '66-1')],
-    [(False, '62-1'), (False, '65-1')],
-    [(False, '62-1'), (False, '64-1')],
-    [(False, '62-1'), (False, '63-1')],
-    [(False, '61-1'), (False, '68-1')],
-    [(False, '61-1'), (False, '67-1')],
-    [(False, '61-1'), (False, '66-1')],
-    [(False, '61-1'), (False, '65-1')],
-    [(False, '61-1'), (False, '64-1')],
-    [(False, '61-1'), (False, '63-1')],
-    [(False, '60-1'), (False, '68-1')],
-    [(False, '60-1'), (False, '67-1')],
-    [(False, '60-1'), (False, '66-1')],
-    [(False, '60-1'), (False, '65-1')],
-    [(False, '60-1'), (False, '64-1')],
-    [(False, '60-1'), (False, '63-1')],
-    [(True, '60-1'), (True, '61-1'), (True, '62-1'), (True, '63-1'), (True, '64-1'), (True, '65-1'), (True, '66-1'), (True, '67-1'), (True, '68-1')],
-    [(False, '75-1'), (False, '78-1')],
-    [(False, '75-1'), (False, '77-1')],
-    [(False, '75-1'), (False, '76-1')],
-    [(False, '74-1'), (False, '78-1')],
-    [(False, '74-1'), (False, '77-1')],
-    [(False, '74-1'), (False, '76-1')],
-    [(False, '73-1'), (False, '78-1')],
-    [(False, '73-1'), (False, '77-1')],
-    [(False, '73-1'), (False, '76-1')],
-    [(False, '72-1'), (False, '78-1')],
-    [(False, '72-1'), (False, '77-1')],
-    [(False, '72-1'), (False, '76-1')],
-    [(False, '72-1'), (False, '75-1')],
-    [(False, '72-1'), (False, '74-1')],
-    [(False, '72-1'), (False, '73-1')],
-    [(False, '71-1'), (False, '78-1')],
-    [(False, '71-1'), (False, '77-1')],
-    [(False, '71-1'), (False, '76-1')],
-    [(False, '71-1'), (False, '75-1')],
-    [(False, '71-1'), (False, '74-1')],
-    [(False, '71-1'), (False, '73-1')],
-    [(False, '70-1'), (False, '78-1')],
-    [(False, '70-1'), (False, '77-1')],
-    [(False, '70-1'), (False, '76-1')],
-    [(False, '70-1'), (False, '75-1')],
-    [(False, '70-1'), (False, '74-1')],
-    [(False, '70-1'), (False, '73-1')],
-    [(True, '70-1'), (True, '71-1'), (True, '72-1'), (True, '73-1'), (True, '74-1'), (True, '75-1'), (True, '76-1'), (True, '77-1'), (True, '78-1')],
-    [(False, '85-1'), (False, '88-1')],
-    [(False, '85-1'), (False, '87-1')],
-    [(False, '85-1'), (False, '86-1')],
-    [(False, '84-1'), (False, '88-1')],
-    [(False, '84-1'), (False, '87-1')],
-    [(False, '84-1'), (False, '86-1')],
-    [(False, '83-1'), (False, '88-1')],
-    [(False, '83-1'), (False, '87-1')],
-    [(False, '83-1'), (False, '86-1')],
-    [(False, '82-1'), (False, '88-1')],
-    [(False, '82-1'), (False, '87-1')],
-    [(False, '82-1'), (False, '86-1')],
-    [(False, '82-1'), (False, '85-1')],
-    [(False, '82-1'), (False, '84-1')],
-    [(False, '82-1'), (False, '83-1')],
-    [(False, '81-1'), (False, '88-1')],
-    [(False, '81-1'), (False, '87-1')],
-    [(False, '81-1'), (False, '86-1')],
-    [(False, '81-1'), (False, '85-1')],
-    [(False, '81-1'), (False, '84-1')],
-    [(False, '81-1'), (False, '83-1')],
-    [(False, '80-1'), (False, '88-1')],
-    [(False, '80-1'), (False, '87-1')],
-    [(False, '80-1'), (False, '86-1')],
-    [(False, '80-1'), (False, '85-1')],
-    [(False, '80-1'), (False, '84-1')],
-    [(False, '80-1'), (False, '83-1')],
-    [(True, '80-1'), (True, '81-1'), (True, '82-1'), (True, '83-1'), (True, '84-1'), (True, '85-1'), (True, '86-1'), (True, '87-1'), (True, '88-1')],
-    [(False, '05-2'), (False, '08-2')],
-    [(False, '05-2'), (False, '07-2')],
-    [(False, '05-2'), (False, '06-2')],
-    [(False, '04-2'), (False, '08-2')],
-    [(False, '04-2'), (False, '07-2')],
-    [(False, '04-2'), (False, '06-2')],
-    [(False, '03-2'), (False, '08-2')],
-    [(False, '03-2'), (False, '07-2')],
-    [(False, '03-2'), (False, '06-2')],
-    [(False, '02-2'), (False, '08-2')],
-    [(False, '02-2'), (False, '07-2')],
-    [(False, '02-2'), (False, '06-2')],
-    [(False, '02-2'), (False, '05-2')],
-    [(False, '02-2'), (False, '04-2')],
-    [(False, '02-2'), (False, '03-2')],
-    [(False, '01-2'), (False, '08-2')],
-    [(False, '01-2'), (False, '07-2')],
-    [(False, '01-2'), (False, '06-2')],
-    [(False, '01-2'), (False, '05-2')],
-    [(False, '01-2'), (False, '04-2')],
-    [(False, '01-2'), (False, '03-2')],
-    [(False, '00-2'), (False, '08-2')],
-    [(False, '00-2'), (False, '07-2')],
-    [(False, '00-2'), (False, '06-2')],
-    [(False, '00-2'), (False, '05-2')],
-    [(False, '00-2'), (False, '04-2')],
-    [(False, '00-2'), (False, '03-2')],
-    [(True, '00-2'), (True, '01-2'), (True, '02-2'), (True, '03-2'), (True, '04-2'), (True, '05-2'), (True, '06-2'), (True, '07-2'), (True, '08-2')],
-    [(False, '15-2'), (False, '18-2')],
-    [(False, '15-2'), (False, '17-2')],
-    [(False, '15-2'), (False, '16-2')],
-    [(False, '14-2'), (False, '18-2')],
-    [(False, '14-2'), (False, '17-2')],
-    [(False, '14-2'), (False, '16-2')],
-    [(False, '13-2'), (False, '18-2')],
-    [(False, '13-2'), (False, '17-2')],
-    [(False, '13-2'), (False, '16-2')],
-    [(False, '12-2'), (False, '18-2')],
-    [(False, '12-2'), (False, '17-2')],
-    [(False, '12-2'), (False, '16-2')],
-    [(False, '12-2'), (False, '15-2')],
-    [(False, '12-2'), (False, '14-2')],
-    [(False, '12-2'), (False, '13-2')],
-    [(False, '11-2'), (False, '18-2')],
-    [(False, '11-2'), (False, '17-2')],
-    [(False, '11-2'), (False, '16-2')],
-    [(False, '11-2'), (False, '15-2')],
-    [(False, '11-2'), (False, '14-2')],
-    [(False, '11-2'), (False, '13-2')],
-    [(False, '10-2'), (False, '18-2')],
-    [(False, '10-2'), (False, '17-2')],
-    [(False, '10-2'), (False, '16-2')],
-    [(False, '10-2'), (False, '15-2')],
-    [(False, '10-2'), (False, '14-2')],
-    [(False, '10-2'), (False, '13-2')],
-    [(True, '10-2'), (True, '11-2'), (True, '12-2'), (True, '13-2'), (True, '14-2'), (True, '15-2'), (True, '16-2'), (True, '17-2'), (True, '18-2')],
-    [(False, '25-2'), (False, '28-2')],
-    [(False, '25-2'), (False, '27-2')],
-    [(False, '25-2'), (False, '26-2')],
-    [(False, '24-2'), (False, '28-2')],
-    [(False, '24-2'), (False, '27-2')],
-    [(False, '24-2'), (False, '26-2')],
-    [(False, '23-2'), (False, '28-2')],
-    [(False, '23-2'), (False, '27-2')],
-    [(False, '23-2'), (False, '26-2')],
-    [(False, '22-2'), (False, '28-2')],
-    [(False, '22-2'), (False, '27-2')],
-    [(False, '22-2'), (False, '26-2')],
-    [(False, '22-2'), (False, '25-2')],
-    [(False, '22-2'), (False, '24-2')],
-    [(False, '22-2'), (False, '23-2')],
-    [(False, '21-2'), (False, '28-2')],
-    [(False, '21-2'), (False, '27-2')],
-    [(False, '21-2'), (False, '26-2')],
-    [(False, '21-2'), (False, '25-2')],
-    [(False, '21-2'), (False, '24-2')],
-    [(False, '21-2'), (False, '23-2')],
-    [(False, '20-2'), (False, '28-2')],
-    [(False, '20-2'), (False, '27-2')],
-    [(False, '20-2'), (False, '26-2')],
-    [(False, '20-2'), (False, '25-2')],
-    [(False, '20-2'), (False, '24-2')],
-    [(False, '20-2'), (False, '23-2')],
-    [(True, '20-2'), (True, '21-2'), (True, '22-2'), (True, '23-2'), (True, '24-2'), (True, '25-2'), (True, '26-2'), (True, '27-2'), (True, '28-2')],
-    [(False, '35-2'), (False, '38-2')],
-    [(False, '35-2'), (False, '37-2')],
-    [(False, '35-2'), (False, '36-2')],
-    [(False, '34-2'), (False, '38-2')],
-    [(False, '34-2'), (False, '37-2')],
-    [(False, '34-2'), (False, '36-2')],
-    [(False, '33-2'), (False, '38-2')],
-    [(False, '33-2'), (False, '37-2')],
-    [(False, '33-2'), (False, '36-2')],
-    [(False, '32-2'), (False, '38-2')],
-    [(False, '32-2'), (False, '37-2')],
-    [(False, '32-2'), (False, '36-2')],
-    [(False, '32-2'), (False, '35-2')],
-    [(False, '32-2'), (False, '34-2')],
-    [(False, '32-2'), (False, '33-2')],
-    [(False, '31-2'), (False, '38-2')],
-    [(False, '31-2'), (False, '37-2')],
-    [(False, '31-2'), (False, '36-2')],
-    [(False, '31-2'), (False, '35-2')],
-    [(False, '31-2'), (False, '34-2')],
-    [(False, '31-2'), (False, '33-2')],
-    [(False, '30-2'), (False, '38-2')],
-    [(False, '30-2'), (False, '37-2')],
-    [(False, '30-2'), (False, '36-2')],
-    [(False, '30-2'), (False, '35-2')],
-    [(False, '30-2'), (False, '34-2')],
-    [(False, '30-2'), (False, '33-2')],
-    [(True, '30-2'), (True, '31-2'), (True, '32-2'), (True, '33-2'), (True, '34-2'), (True, '35-2'), (True, '36-2'), (True, '37-2'), (True, '38-2')],
-    [(False, '45-2'), (False, '48-2')],
-    [(False, '45-2'), (False, '47-2')],
-    [(False, '45-2'), (False, '46-2')],
-    [(False, '44-2'), (False, '48-2')],
-    [(False, '44-2'), (False, '47-2')],
-    [(False, '44-2'), (False, '46-2')],
-    [(False, '43-2'), (False, '48-2')],
-    [(False, '43-2'), (False, '47-2')],
-    [(False, '43-2'), (False, '46-2')],
-    [(False, '42-2'), (False, '48-2')],
-    [(False, '42-2'), (False, '47-2')],
-    [(False, '42-2'), (False, '46-2')],
-    [(False, '42-2'), (False, '45-2')],
-    [(False, '42-2'), (False, '44-2')],
-    [(False, '42-2'), (False, '43-2')],
-    [(False, '41-2'), (False, '48-2')],
-    [(False, '41-2'), (False, '47-2')],
-    [(False, '41-2'), (False, '46-2')],
-    [(False, '41-2'), (False, '45-2')],
-    [(False, '41-2'), (False, '44-2')],
-    [(False, '41-2'), (False, '43-2')],
-    [(False, '40-2'), (False, '48-2')],
-    [(False, '40-2'), (False, '47-2')],
-    [(False, '40-2'), (False, '46-2')],
-    [(False, '40-2'), (False, '45-2')],
-    [(False, '40-2'), (False, '44-2')],
-    [(False, '40-2'), (False, '43-2')],
-    [(True, '40-2'), (True, '41-2'), (True, '42-2'), (True, '43-2'), (True, '44-2'), (True, '45-2'), (True, '46-2'), (True, '47-2'), (True, '48-2')],
-    [(False, '55-2'), (False, '58-2')],
-    [(False, '55-2'), (False, '57-2')],
-    [(False, '55-2'), (False, '56-2')],
-    [(False, '54-2'), (False, '58-2')],
-    [(False, '54-2'), (False, '57-2')],
-    [(False, '54-2'), (False, '56-2')],
-    [(False, '53-2'), (False, '58-2')],
-    [(False, '53-2'), (False, '57-2')],
-    [(False, '53-2'), (False, '56-2')],
-    [(False, '52-2'), (False, '58-2')],
-    [(False, '52-2'), (False, '57-2')],
-    [(False, '52-2'), (False, '56-2')],
-    [(False, '52-2'), (False, '55-2')],
-    [(False, '52-2'), (False, '54-2')],
-    [(False, '52-2'), (False, '53-2')],
-    [(False, '51-2'), (False, '58-2')],
-    [(False, '51-2'), (False, '57-2')],
-    [(False, '51-2'), (False, '56-2')],
-    [(False, '51-2'), (False, '55-2')],
-    [(False, '51-2'), (False, '54-2')],
-    [(False, '51-2'), (False, '53-2')],
-    [(False, '50-2'), (False, '58-2')],
-    [(False, '50-2'), (False, '57-2')],
-    [(False, '50-2'), (False, '56-2')],
-    [(False, '50-2'), (False, '55-2')],
-    [(False, '50-2'), (False, '54-2')],
-    [(False, '50-2'), (False, '53-2')],
-    [(True, '50-2'), (True, '51-2'), (True, '52-2'), (True, '53-2'), (True, '54-2'), (True, '55-2'), (True, '56-2'), (True, '57-2'), (True, '58-2')],
-    [(False, '65-2'), (False, '68-2')],
-    [(False, '65-2'), (False, '67-2')],
-    [(False, '65-2'), (False, '66-2')],
-    [(False, '64-2'), (False, '68-2')],
-    [(False, '64-2'), (False, '67-2')],
-    [(False, '64-2'), (False, '66-2')],
-    [(False, '63-2'), (False, '68-2')],
-    [(False, '63-2'), (False, '67-2')],
-    [(False, '63-2'), (False, '66-2')],
-    [(False, '62-2'), (False, '68-2')],
-    [(False, '62-2'), (False, '67-2')],
-    [(False, '62-2'), (False, '66-2')],
-    [(False, '62-2'), (False, '65-2')],
-    [(False, '62-2'), (False, '64-2')],
-    [(False, '62-2'), (False, '63-2')],
-    [(False, '61-2'), (False, '68-2')],
-    [(False, '61-2'), (False, '67-2')],
-    [(False, '61-2'), (False, '66-2')],
-    [(False, '61-2'), (False, '65-2')],
-    [(False, '61-2'), (False, '64-2')],
-    [(False, '61-2'), (False, '63-2')],
-    [(False, '60-2'), (False, '68-2')],
-    [(False, '60-2'), (False, '67-2')],
-    [(False, '60-2'), (False, '66-2')],
-    [(False, '60-2'), (False, '65-2')],
-    [(False, '60-2'), (False, '64-2')],
-    [(False, '60-2'), (False, '63-2')],
-    [(True, '60-2'), (True, '61-2'), (True, '62-2'), (True, '63-2'), (True, '64-2'), (True, '65-2'), (True, '66-2'), (True, '67-2'), (True, '68-2')],
-    [(False, '75-2'), (False, '78-2')],
-    [(False, '75-2'), (False, '77-2')],
-    [(False, '75-2'), (False, '76-2')],
-    [(False, '74-2'), (False, '78-2')],
-    [(False, '74-2'), (False, '77-2')],
-    [(False, '74-2'), (False, '76-2')],
-    [(False, '73-2'), (False, '78-2')],
-    [(False, '73-2'), (False, '77-2')],
-    [(False, '73-2'), (False, '76-2')],
-    [(False, '72-2'), (False, '78-2')],
-    [(False, '72-2'), (False, '77-2')],
-    [(False, '72-2'), (False, '76-2')],
-    [(False, '72-2'), (False, '75-2')],
-    [(False, '72-2'), (False, '74-2')],
-    [(False, '72-2'), (False, '73-2')],
-    [(False, '71-2'), (False, '78-2')],
-    [(False, '71-2'), (False, '77-2')],
-    [(False, '71-2'), (False, '76-2')],
-    [(False, '71-2'), (False, '75-2')],
-    [(False, '71-2'), (False, '74-2')],
-    [(False, '71-2'), (False, '73-2')],
-    [(False, '70-2'), (False, '78-2')],
-    [(False, '70-2'), (False, '77-2')],
-    [(False, '70-2'), (False, '76-2')],
-    [(False, '70-2'), (False, '75-2')],
-    [(False, '70-2'), (False, '74-2')],
-    [(False, '70-2'), (False, '73-2')],
-    [(True, '70-2'), (True, '71-2'), (True, '72-2'), (True, '73-2'), (True, '74-2'), (True, '75-2'), (True, '76-2'), (True, '77-2'), (True, '78-2')],
-    [(False, '85-2'), (False, '88-2')],
-    [(False, '85-2'), (False, '87-2')],
-    [(False, '85-2'), (False, '86-2')],
-    [(False, '84-2'), (False, '88-2')],
-    [(False, '84-2'), (False, '87-2')],
-    [(False, '84-2'), (False, '86-2')],
-    [(False, '83-2'), (False, '88-2')],
-    [(False, '83-2'), (False, '87-2')],
-    [(False, '83-2'), (False, '86-2')],
-    [(False, '82-2'), (False, '88-2')],
-    [(False, '82-2'), (False, '87-2')],
-    [(False, '82-2'), (False, '86-2')],
-    [(False, '82-2'), (False, '85-2')],
-    [(False, '82-2'), (False, '84-2')],
-    [(False, '82-2'), (False, '83-2')],
-    [(False, '81-2'), (False, '88-2')],
-    [(False, '81-2'), (False, '87-2')],
-    [(False, '81-2'), (False, '86-2')],
-    [(False, '81-2'), (False, '85-2')],
-    [(False, '81-2'), (False, '84-2')],
-    [(False, '81-2'), (False, '83-2')],
-    [(False, '80-2'), (False, '88-2')],
-    [(False, '80-2'), (False, '87-2')],
-    [(False, '80-2'), (False, '86-2')],
-    [(False, '80-2'), (False, '85-2')],
-    [(False, '80-2'), (False, '84-2')],
-    [(False, '80-2'), (False, '83-2')],
-    [(True, '80-2'), (True, '81-2'), (True, '82-2'), (True, '83-2'), (True, '84-2'), (True, '85-2'), (True, '86-2'), (True, '87-2'), (True, '88-2')],
-    [(False, '05-3'), (False, '08-3')],
-    [(False, '05-3'), (False, '07-3')],
-    [(False, '05-3'), (False, '06-3')],
-    [(False, '04-3'), (False, '08-3')],
-    [(False, '04-3'), (False, '07-3')],
-    [(False, '04-3'), (False, '06-3')],
-    [(False, '03-3'), (False, '08-3')],
-    [(False, '03-3'), (False, '07-3')],
-    [(False, '03-3'), (False, '06-3')],
-    [(False, '02-3'), (False, '08-3')],
-    [(False, '02-3'), (False, '07-3')],
-    [(False, '02-3'), (False, '06-3')],
-    [(False, '02-3'), (False, '05-3')],
-    [(False, '02-3'), (False, '04-3')],
-    [(False, '02-3'), (False, '03-3')],
-    [(False, '01-3'), (False, '08-3')],
-    [(False, '01-3'), (False, '07-3')],
-    [(False, '01-3'), (False, '06-3')],
-    [(False, '01-3'), (False, '05-3')],
-    [(False, '01-3'), (False, '04-3')],
-    [(False, '01-3'), (False, '03-3')],
-    [(False, '00-3'), (False, '08-3')],
-    [(False, '00-3'), (False, '07-3')],
-    [(False, '00-3'), (False, '06-3')],
-    [(False, '00-3'), (False, '05-3')],
-    [(False, '00-3'), (False, '04-3')],
-    [(False, '00-3'), (False, '03-3')],
-    [(True, '00-3'), (True, '01-3'), (True, '02-3'), (True, '03-3'), (True, '04-3'), (True, '05-3'), (True, '06-3'), (True, '07-3'), (True, '08-3')],
-    [(False, '15-3'), (False, '18-3')],
-    [(False, '15-3'), (False, '17-3')],
-    [(False, '15-3'), (False, '16-3')],
-    [(False, '14-3'), (False, '18-3')],
-    [(False, '14-3'), (False, '17-3')],
-    [(False, '14-3'), (False, '16-3')],
-    [(False, '13-3'), (False, '18-3')],
-    [(False, '13-3'), (False, '17-3')],
-    [(False, '13-3'), (False, '16-3')],
-    [(False, '12-3'), (False, '18-3')],
-    [(False, '12-3'), (False, '17-3')],
-    [(False, '12-3'), (False, '16-3')],
-    [(False, '12-3'), (False, '15-3')],
-    [(False, '12-3'), (False, '14-3')],
-    [(False, '12-3'), (False, '13-3')],
-    [(False, '11-3'), (False, '18-3')],
-    [(False, '11-3'), (False, '17-3')],
-    [(False, '11-3'), (False, '16-3')],
-    [(False, '11-3'), (False, '15-3')],
-    [(False, '11-3'), (False, '14-3')],
-    [(False, '11-3'), (False, '13-3')],
-    [(False, '10-3'), (False, '18-3')],
-    [(False, '10-3'), (False, '17-3')],
-    [(False, '10-3'), (False, '16-3')],
-    [(False, '10-3'), (False, '15-3')],
-    [(False, '10-3'), (False, '14-3')],
-    [(False, '10-3'), (False, '13-3')],
-    [(True, '10-3'), (True, '11-3'), (True, '12-3'), (True, '13-3'), (True, '14-3'), (True, '15-3'), (True, '16-3'), (True, '17-3'), (True, '18-3')],
-    [(False, '25-3'), (False, '28-3')],
-    [(False, '25-3'), (False, '27-3')],
-    [(False, '25-3'), (False, '26-3')],
-    [(False, '24-3'), (False, '28-3')],
-    [(False, '24-3'), (False, '27-3')],
-    [(False, '24-3'), (False, '26-3')],
-    [(False, '23-3'), (False, '28-3')],
-    [(False, '23-3'), (False, '27-3')],
-    [(False, '23-3'), (False, '26-3')],
-    [(False, '22-3'), (False, '28-3')],
-    [(False, '22-3'), (False, '27-3')],
-    [(False, '22-3'), (False, '26-3')],
-    [(False, '22-3'), (False, '25-3')],
-    [(False, '22-3'), (False, '24-3')],
-    [(False, '22-3'), (False, '23-3')],
-    [(False, '21-3'), (False, '28-3')],
-    [(False, '21-3'), (False, '27-3')],
-    [(False, '21-3'), (False, '26-3')],
-    [(False, '21-3'), (False, '25-3')],
-    [(False, '21-3'), (False, '24-3')],
-    [(False, '21-3'), (False, '23-3')],
-    [(False, '20-3'), (False, '28-3')],
-    [(False, '20-3'), (False, '27-3')],
-    [(False, '20-3'), (False, '26-3')],
-    [(False, '20-3'), (False, '25-3')],
-    [(False, '20-3'), (False, '24-3')],
-    [(False, '20-3'), (False, '23-3')],
-    [(True, '20-3'), (True, '21-3'), (True, '22-3'), (True, '23-3'), (True, '24-3'), (True, '25-3'), (True, '26-3'), (True, '27-3'), (True, '28-3')],
-    [(False, '35-3'), (False, '38-3')],
-    [(False, '35-3'), (False, '37-3')],
-    [(False, '35-3'), (False, '36-3')],
-    [(False, '34-3'), (False, '38-3')],
-    [(False, '34-3'), (False, '37-3')],
-    [(False, '34-3'), (False, '36-3')],
-    [(False, '33-3'), (False, '38-3')],
-    [(False, '33-3'), (False, '37-3')],
-    [(False, '33-3'), (False, '36-3')],
-    [(False, '32-3'), (False, '38-3')],
-    [(False, '32-3'), (False, '37-3')],
-    [(False, '32-3'), (False, '36-3')],
-    [(False, '32-3'), (False, '35-3')],
-    [(False, '32-3'), (False, '34-3')],
-    [(False, '32-3'), (False, '33-3')],
-    [(False, '31-3'), (False, '38-3')],
-    [(False, '31-3'), (False, '37-3')],
-    [(False, '31-3'), (False, '36-3')],
-    [(False, '31-3'), (False, '35-3')],
-    [(False, '31-3'), (False, '34-3')],
-    [(False, '31-3'), (False, '33-3')],
-    [(False, '30-3'), (False, '38-3')],
-    [(False, '30-3'), (False, '37-3')],
-    [(False, '30-3'), (False, '36-3')],
-    [(False, '30-3'), (False, '35-3')],
-    [(False, '30-3'), (False, '34-3')],
-    [(False, '30-3'), (False, '33-3')],
-    [(True, '30-3'), (True, '31-3'), (True, '32-3'), (True, '33-3'), (True, '34-3'), (True, '35-3'), (True, '36-3'), (True, '37-3'), (True, '38-3')],
-    [(False, '45-3'), (False, '48-3')],
-    [(False, '45-3'), (False, '47-3')],
-    [(False, '45-3'), (False, '46-3')],
-    [(False, '44-3'), (False, '48-3')],
-    [(False, '44-3'), (False, '47-3')],
-    [(False, '44-3'), (False, '46-3')],
-    [(False, '43-3'), (False, '48-3')],
-    [(False, '43-3'), (False, '47-3')],
-    [(False, '43-3'), (False, '46-3')],
-    [(False, '42-3'), (False, '48-3')],
-    [(False, '42-3'), (False, '47-3')],
-    [(False, '42-3'), (False, '46-3')],
-    [(False, '42-3'), (False, '45-3')],
-    [(False, '42-3'), (False, '44-3')],
-    [(False, '42-3'), (False, '43-3')],
-    [(False, '41-3'), (False, '48-3')],
-    [(False, '41-3'), (False, '47-3')],
-    [(False, '41-3'), (False, '46-3')],
-    [(False, '41-3'), (False, '45-3')],
-    [(False, '41-3'), (False, '44-3')],
-    [(False, '41-3'), (False, '43-3')],
-    [(False, '40-3'), (False, '48-3')],
-    [(False, '40-3'), (False, '47-3')],
-    [(False, '40-3'), (False, '46-3')],
-    [(False, '40-3'), (False, '45-3')],
-    [(False, '40-3'), (False, '44-3')],
-    [(False, '40-3'), (False, '43-3')],
-    [(True, '40-3'), (True, '41-3'), (True, '42-3'), (True, '43-3'), (True, '44-3'), (True, '45-3'), (True, '46-3'), (True, '47-3'), (True, '48-3')],
-    [(False, '55-3'), (False, '58-3')],
-    [(False, '55-3'), (False, '57-3')],
-    [(False, '55-3'), (False, '56-3')],
-    [(False, '54-3'), (False, '58-3')],
-    [(False, '54-3'), (False, '57-3')],
-    [(False, '54-3'), (False, '56-3')],
-    [(False, '53-3'), (False, '58-3')],
-    [(False, '53-3'), (False, '57-3')],
-    [(False, '53-3'), (False, '56-3')],
-    [(False, '52-3'), (False, '58-3')],
-    [(False, '52-3'), (False, '57-3')],
-    [(False, '52-3'), (False, '56-3')],
-    [(False, '52-3'), (False, '55-3')],
-    [(False, '52-3'), (False, '54-3')],
-    [(False, '52-3'), (False, '53-3')],
-    [(False, '51-3'), (False, '58-3')],
-    [(False, '51-3'), (False, '57-3')],
-    [(False, '51-3'), (False, '56-3')],
-    [(False, '51-3'), (False, '55-3')],
-    [(False, '51-3'), (False, '54-3')],
-    [(False, '51-3'), (False, '53-3')],
-    [(False, '50-3'), (False, '58-3')],
-    [(False, '50-3'), (False, '57-3')],
-    [(False, '50-3'), (False, '56-3')],
-    [(False, '50-3'), (False, '55-3')],
-    [(False, '50-3'), (False, '54-3')],
-    [(False, '50-3'), (False, '53-3')],
-    [(True, '50-3'), (True, '51-3'), (True, '52-3'), (True, '53-3'), (True, '54-3'), (True, '55-3'), (True, '56-3'), (True, '57-3'), (True, '58-3')],
-    [(False, '65-3'), (False, '68-3')],
-    [(False, '65-3'), (False, '67-3')],
-    [(False, '65-3'), (False, '66-3')],
-    [(False, '64-3'), (False, '68-3')],
-    [(False, '64-3'), (False, '67-3')],
-    [(False, '64-3'), (False, '66-3')],
-    [(False, '63-3'), (False, '68-3')],
-    [(False, '63-3'), (False, '67-3')],
-    [(False, '63-3'), (False, '66-3')],
-    [(False, '62-3'), (False, '68-3')],
-    [(False, '62-3'), (False, '67-3')],
-    [(False, '62-3'), (False, '66-3')],
-    [(False, '62-3'), (False, '65-3')],
-    [(False, '62-3'), (False, '64-3')],
-    [(False, '62-3'), (False, '63-3')],
-    [(False, '61-3'), (False, '68-3')],
-    [(False, '61-3'), (False, '67-3')],
-    [(False, '61-3'), (False, '66-3')],
-    [(False, '61-3'), (False, '65-3')],
-    [(False, '61-3'), (False, '64-3')],
-    [(False, '61-3'), (False, '63-3')],
-    [(False, '60-3'), (False, '68-3')],
-    [(False, '60-3'), (False, '67-3')],
-    [(False, '60-3'), (False, '66-3')],
-    [(False, '60-3'), (False, '65-3')],
-    [(False, '60-3'), (False, '64-3')],
-    [(False, '60-3'), (False, '63-3')],
-    [(True, '60-3'), (True, '61-3'), (True, '62-3'), (True, '63-3'), (True, '64-3'), (True, '65-3'), (True, '66-3'), (True, '67-3'), (True, '68-3')],
-    [(False, '75-3'), (False, '78-3')],
-    [(False, '75-3'), (False, '77-3')],
-    [(False, '75-3'), (False, '76-3')],
-    [(False, '74-3'), (False, '78-3')],
-    [(False, '74-3'), (False, '77-3')],
-    [(False, '74-3'), (False, '76-3')],
-    [(False, '73-3'), (False, '78-3')],
-    [(False, '73-3'), (False, '77-3')],
-    [(False, '73-3'), (False, '76-3')],
-    [(False, '72-3'), (False, '78-3')],
-    [(False, '72-3'), (False, '77-3')],
-    [(False, '72-3'), (False, '76-3')],
-    [(False, '72-3'), (False, '75-3')],
-    [(False, '72-3'), (False, '74-3')],
-    [(False, '72-3'), (False, '73-3')],
-    [(False, '71-3'), (False, '78-3')],
-    [(False, '71-3'), (False, '77-3')],
-    [(False, '71-3'), (False, '76-3')],
-    [(False, '71-3'), (False, '75-3')],
-    [(False, '71-3'), (False, '74-3')],
-    [(False, '71-3'), (False, '73-3')],
-    [(False, '70-3'), (False, '78-3')],
-    [(False, '70-3'), (False, '77-3')],
-    [(False, '70-3'), (False, '76-3')],
-    [(False, '70-3'), (False, '75-3')],
-    [(False, '70-3'), (False, '74-3')],
-    [(False, '70-3'), (False, '73-3')],
-    [(True, '70-3'), (True, '71-3'), (True, '72-3'), (True, '73-3'), (True, '74-3'), (True, '75-3'), (True, '76-3'), (True, '77-3'), (True, '78-3')],
-    [(False, '85-3'), (False, '88-3')],
-    [(False, '85-3'), (False, '87-3')],
-    [(False, '85-3'), (False, '86-3')],
-    [(False, '84-3'), (False, '88-3')],
-    [(False, '84-3'), (False, '87-3')],
-    [(False, '84-3'), (False, '86-3')],
-    [(False, '83-3'), (False, '88-3')],
-    [(False, '83-3'), (False, '87-3')],
-    [(False, '83-3'), (False, '86-3')],
-    [(False, '82-3'), (False, '88-3')],
-    [(False, '82-3'), (False, '87-3')],
-    [(False, '82-3'), (False, '86-3')],
-    [(False, '82-3'), (False, '85-3')],
-    [(False, '82-3'), (False, '84-3')],
-    [(False, '82-3'), (False, '83-3')],
-    [(False, '81-3'), (False, '88-3')],
-    [(False, '81-3'), (False, '87-3')],
-    [(False, '81-3'), (False, '86-3')],
-    [(False, '81-3'), (False, '85-3')],
-    [(False, '81-3'), (False, '84-3')],
-    [(False, '81-3'), (False, '83-3')],
-    [(False, '80-3'), (False, '88-3')],
-    [(False, '80-3'), (False, '87-3')],
-    [(False, '80-3'), (False, '86-3')],
-    [(False, '80-3'), (False, '85-3')],
-    [(False, '80-3'), (False, '84-3')],
-    [(False, '80-3'), (False, '83-3')],
-    [(True, '80-3'), (True, '81-3'), (True, '82-3'), (True, '83-3'), (True, '84-3'), (True, '85-3'), (True, '86-3'), (True, '87-3'), (True, '88-3')],
-    [(False, '05-4'), (False, '08-4')],
-    [(False, '05-4'), (False, '07-4')],
-    [(False, '05-4'), (False, '06-4')],
-    [(False, '04-4'), (False, '08-4')],
-    [(False, '04-4'), (False, '07-4')],
-    [(False, '04-4'), (False, '06-4')],
-    [(False, '03-4'), (False, '08-4')],
-    [(False, '03-4'), (False, '07-4')],
-    [(False, '03-4'), (False, '06-4')],
-    [(False, '02-4'), (False, '08-4')],
-    [(False, '02-4'), (False, '07-4')],
-    [(False, '02-4'), (False, '06-4')],
-    [(False, '02-4'), (False, '05-4')],
-    [(False, '02-4'), (False, '04-4')],
-    [(False, '02-4'), (False, '03-4')],
-    [(False, '01-4'), (False, '08-4')],
-    [(False, '01-4'), (False, '07-4')],
-    [(False, '01-4'), (False, '06-4')],
-    [(False, '01-4'), (False, '05-4')],
-    [(False, '01-4'), (False, '04-4')],
-    [(False, '01-4'), (False, '03-4')],
-    [(False, '00-4'), (False, '08-4')],
-    [(False, '00-4'), (False, '07-4')],
-    [(False, '00-4'), (False, '06-4')],
-    [(False, '00-4'), (False, '05-4')],
-    [(False, '00-4'), (False, '04-4')],
-    [(False, '00-4'), (False, '03-4')],
-    [(True, '00-4'), (True, '01-4'), (True, '02-4'), (True, '03-4'), (True, '04-4'), (True, '05-4'), (True, '06-4'), (True, '07-4'), (True, '08-4')],
-    [(False, '15-4'), (False, '18-4')],
-    [(False, '15-4'), (False, '17-4')],
-    [(False, '15-4'), (False, '16-4')],
-    [(False, '14-4'), (False, '18-4')],
-    [(False, '14-4'), (False, '17-4')],
-    [(False, '14-4'), (False, '16-4')],
-    [(False, '13-4'), (False, '18-4')],
-    [(False, '13-4'), (False, '17-4')],
-    [(False, '13-4'), (False, '16-4')],
-    [(False, '12-4'), (False, '18-4')],
-    [(False, '12-4'), (False, '17-4')],
-    [(False, '12-4'), (False, '16-4')],
-    [(False, '12-4'), (False, '15-4')],
-    [(False, '12-4'), (False, '14-4')],
-    [(False, '12-4'), (False, '13-4')],
-    [(False, '11-4'), (False, '18-4')],
-    [(False, '11-4'), (False, '17-4')],
-    [(False, '11-4'), (False, '16-4')],
-    [(False, '11-4'), (False, '15-4')],
-    [(False, '11-4'), (False, '14-4')],
-    [(False, '11-4'), (False, '13-4')],
-    [(False, '10-4'), (False, '18-4')],
-    [(False, '10-4'), (False, '17-4')],
-    [(False, '10-4'), (False, '16-4')],
-    [(False, '10-4'), (False, '15-4')],
-    [(False, '10-4'), (False, '14-4')],
-    [(False, '10-4'), (False, '13-4')],
-    [(True, '10-4'), (True, '11-4'), (True, '12-4'), (True, '13-4'), (True, '14-4'), (True, '15-4'), (True, '16-4'), (True, '17-4'), (True, '18-4')],
-    [(False, '25-4'), (False, '28-4')],
-    [(False, '25-4'), (False, '27-4')],
-    [(False, '25-4'), (False, '26-4')],
-    [(False, '24-4'), (False, '28-4')],
-    [(False, '24-4'), (False, '27-4')],
-    [(False, '24-4'), (False, '26-4')],
-    [(False, '23-4'), (False, '28-4')],
-    [(False, '23-4'), (False, '27-4')],
-    [(False, '23-4'), (False, '26-4')],
-    [(False, '22-4'), (False, '28-4')],
-    [(False, '22-4'), (False, '27-4')],
-    [(False, '22-4'), (False, '26-4')],
-    [(False, '22-4'), (False, '25-4')],
-    [(False, '22-4'), (False, '24-4')],
-    [(False, '22-4'), (False, '23-4')],
-    [(False, '21-4'), (False, '28-4')],
-    [(False, '21-4'), (False, '27-4')],
-    [(False, '21-4'), (False, '26-4')],
-    [(False, '21-4'), (False, '25-4')],
-    [(False, '21-4'), (False, '24-4')],
-    [(False, '21-4'), (False, '23-4')],
-    [(False, '20-4'), (False, '28-4')],
-    [(False, '20-4'), (False, '27-4')],
-    [(False, '20-4'), (False, '26-4')],
-    [(False, '20-4'), (False, '25-4')],
-    [(False, '20-4'), (False, '24-4')],
-    [(False, '20-4'), (False, '23-4')],
-    [(True, '20-4'), (True, '21-4'), (True, '22-4'), (True, '23-4'), (True, '24-4'), (True, '25-4'), (True, '26-4'), (True, '27-4'), (True, '28-4')],
-    [(False, '35-4'), (False, '38-4')],
-    [(False, '35-4'), (False, '37-4')],
-    [(False, '35-4'), (False, '36-4')],
-    [(False, '34-4'), (False, '38-4')],
-    [(False, '34-4'), (False, '37-4')],
-    [(False, '34-4'), (False, '36-4')],
-    [(False, '33-4'), (False, '38-4')],
-    [(False, '33-4'), (False, '37-4')],
-    [(False, '33-4'), (False, '36-4')],
-    [(False, '32-4'), (False, '38-4')],
-    [(False, '32-4'), (False, '37-4')],
-    [(False, '32-4'), (False, '36-4')],
-    [(False, '32-4'), (False, '35-4')],
-    [(False, '32-4'), (False, '34-4')],
-    [(False, '32-4'), (False, '33-4')],
-    [(False, '31-4'), (False, '38-4')],
-    [(False, '31-4'), (False, '37-4')],
-    [(False, '31-4'), (False, '36-4')],
-    [(False, '31-4'), (False, '35-4')],
-    [(False, '31-4'), (False, '34-4')],
-    [(False, '31-4'), (False, '33-4')],
-    [(False, '30-4'), (False, '38-4')],
-    [(False, '30-4'), (False, '37-4')],
-    [(False, '30-4'), (False, '36-4')],
-    [(False, '30-4'), (False, '35-4')],
-    [(False, '30-4'), (False, '34-4')],
-    [(False, '30-4'), (False, '33-4')],
-    [(True, '30-4'), (True, '31-4'), (True, '32-4'), (True, '33-4'), (True, '34-4'), (True, '35-4'), (True, '36-4'), (True, '37-4'), (True, '38-4')],
-    [(False, '45-4'), (False, '48-4')],
-    [(False, '45-4'), (False, '47-4')],
-    [(False, '45-4'), (False, '46-4')],
-    [(False, '44-4'), (False, '48-4')],
-    [(False, '44-4'), (False, '47-4')],
-    [(False, '44-4'), (False, '46-4')],
-    [(False, '43-4'), (False, '48-4')],
-    [(False, '43-4'), (False, '47-4')],
-    [(False, '43-4'), (False, '46-4')],
-    [(False, '42-4'), (False, '48-4')],
-    [(False, '42-4'), (False, '47-4')],
-    [(False, '42-4'), (False, '46-4')],
-    [(False, '42-4'), (False, '45-4')],
-    [(False, '42-4'), (False, '44-4')],
-    [(False, '42-4'), (False, '43-4')],
-    [(False, '41-4'), (False, '48-4')],
-    [(False, '41-4'), (False, '47-4')],
-    [(False, '41-4'), (False, '46-4')],
-    [(False, '41-4'), (False, '45-4')],
-    [(False, '41-4'), (False, '44-4')],
-    [(False, '41-4'), (False, '43-4')],
-    [(False, '40-4'), (False, '48-4')],
-    [(False, '40-4'), (False, '47-4')],
-    [(False, '40-4'), (False, '46-4')],
-    [(False, '40-4'), (False, '45-4')],
-    [(False, '40-4'), (False, '44-4')],
-    [(False, '40-4'), (False, '43-4')],
-    [(True, '40-4'), (True, '41-4'), (True, '42-4'), (True, '43-4'), (True, '44-4'), (True, '45-4'), (True, '46-4'), (True, '47-4'), (True, '48-4')],
-    [(False, '55-4'), (False, '58-4')],
-    [(False, '55-4'), (False, '57-4')],
-    [(False, '55-4'), (False, '56-4')],
-    [(False, '54-4'), (False, '58-4')],
-    [(False, '54-4'), (False, '57-4')],
-    [(False, '54-4'), (False, '56-4')],
-    [(False, '53-4'), (False, '58-4')],
-    [(False, '53-4'), (False, '57-4')],
-    [(False, '53-4'), (False, '56-4')],
-    [(False, '52-4'), (False, '58-4')],
-    [(False, '52-4'), (False, '57-4')],
-    [(False, '52-4'), (False, '56-4')],
-    [(False, '52-4'), (False, '55-4')],
-    [(False, '52-4'), (False, '54-4')],
-    [(False, '52-4'), (False, '53-4')],
-    [(False, '51-4'), (False, '58-4')],
-    [(False, '51-4'), (False, '57-4')],
-    [(False, '51-4'), (False, '56-4')],
-    [(False, '51-4'), (False, '55-4')],
-    [(False, '51-4'), (False, '54-4')],
-    [(False, '51-4'), (False, '53-4')],
-    [(False, '50-4'), (False, '58-4')],
-    [(False, '50-4'), (False, '57-4')],
-    [(False, '50-4'), (False, '56-4')],
-    [(False, '50-4'), (False, '55-4')],
-    [(False, '50-4'), (False, '54-4')],
-    [(False, '50-4'), (False, '53-4')],
-    [(True, '50-4'), (True, '51-4'), (True, '52-4'), (True, '53-4'), (True, '54-4'), (True, '55-4'), (True, '56-4'), (True, '57-4'), (True, '58-4')],
-    [(False, '65-4'), (False, '68-4')],
-    [(False, '65-4'), (False, '67-4')],
-    [(False, '65-4'), (False, '66-4')],
-    [(False, '64-4'), (False, '68-4')],
-    [(False, '64-4'), (False, '67-4')],
-    [(False, '64-4'), (False, '66-4')],
-    [(False, '63-4'), (False, '68-4')],
-    [(False, '63-4'), (False, '67-4')],
-    [(False, '63-4'), (False, '66-4')],
-    [(False, '62-4'), (False, '68-4')],
-    [(False, '62-4'), (False, '67-4')],
-    [(False, '62-4'), (False, '66-4')],
-    [(False, '62-4'), (False, '65-4')],
-    [(False, '62-4'), (False, '64-4')],
-    [(False, '62-4'), (False, '63-4')],
-    [(False, '61-4'), (False, '68-4')],
-    [(False, '61-4'), (False, '67-4')],
-    [(False, '61-4'), (False, '66-4')],
-    [(False, '61-4'), (False, '65-4')],
-    [(False, '61-4'), (False, '64-4')],
-    [(False, '61-4'), (False, '63-4')],
-    [(False, '60-4'), (False, '68-4')],
-    [(False, '60-4'), (False, '67-4')],
-    [(False, '60-4'), (False, '66-4')],
-    [(False, '60-4'), (False, '65-4')],
-    [(False, '60-4'), (False, '64-4')],
-    [(False, '60-4'), (False, '63-4')],
-    [(True, '60-4'), (True, '61-4'), (True, '62-4'), (True, '63-4'), (True, '64-4'), (True, '65-4'), (True, '66-4'), (True, '67-4'), (True, '68-4')],
-    [(False, '75-4'), (False, '78-4')],
-    [(False, '75-4'), (False, '77-4')],
-    [(False, '75-4'), (False, '76-4')],
-    [(False, '74-4'), (False, '78-4')],
-    [(False, '74-4'), (False, '77-4')],
-    [(False, '74-4'), (False, '76-4')],
-    [(False, '73-4'), (False, '78-4')],
-    [(False, '73-4'), (False, '77-4')],
-    [(False, '73-4'), (False, '76-4')],
-    [(False, '72-4'), (False, '78-4')],
-    [(False, '72-4'), (False, '77-4')],
-    [(False, '72-4'), (False, '76-4')],
-    [(False, '72-4'), (False, '75-4')],
-    [(False, '72-4'), (False, '74-4')],
-    [(False, '72-4'), (False, '73-4')],
-    [(False, '71-4'), (False, '78-4')],
-    [(False, '71-4'), (False, '77-4')],
-    [(False, '71-4'), (False, '76-4')],
-    [(False, '71-4'), (False, '75-4')],
-    [(False, '71-4'), (False, '74-4')],
-    [(False, '71-4'), (False, '73-4')],
-    [(False, '70-4'), (False, '78-4')],
-    [(False, '70-4'), (False, '77-4')],
-    [(False, '70-4'), (False, '76-4')],
-    [(False, '70-4'), (False, '75-4')],
-    [(False, '70-4'), (False, '74-4')],
-    [(False, '70-4'), (False, '73-4')],
-    [(True, '70-4'), (True, '71-4'), (True, '72-4'), (True, '73-4'), (True, '74-4'), (True, '75-4'), (True, '76-4'), (True, '77-4'), (True, '78-4')],
-    [(False, '85-4'), (False, '88-4')],
-    [(False, '85-4'), (False, '87-4')],
-    [(False, '85-4'), (False, '86-4')],
-    [(False, '84-4'), (False, '88-4')],
-    [(False, '84-4'), (False, '87-4')],
-    [(False, '84-4'), (False, '86-4')],
-    [(False, '83-4'), (False, '88-4')],
-    [(False, '83-4'), (False, '87-4')],
-    [(False, '83-4'), (False, '86-4')],
-    [(False, '82-4'), (False, '88-4')],
-    [(False, '82-4'), (False, '87-4')],
-    [(False, '82-4'), (False, '86-4')],
-    [(False, '82-4'), (False, '85-4')],
-    [(False, '82-4'), (False, '84-4')],
-    [(False, '82-4'), (False, '83-4')],
-    [(False, '81-4'), (False, '88-4')],
-    [(False, '81-4'), (False, '87-4')],
-    [(False, '81-4'), (False, '86-4')],
-    [(False, '81-4'), (False, '85-4')],
-    [(False, '81-4'), (False, '84-4')],
-    [(False, '81-4'), (False, '83-4')],
-    [(False, '80-4'), (False, '88-4')],
-    [(False, '80-4'), (False, '87-4')],
-    [(False, '80-4'), (False, '86-4')],
-    [(False, '80-4'), (False, '85-4')],
-    [(False, '80-4'), (False, '84-4')],
-    [(False, '80-4'), (False, '83-4')],
-    [(True, '80-4'), (True, '81-4'), (True, '82-4'), (True, '83-4'), (True, '84-4'), (True, '85-4'), (True, '86-4'), (True, '87-4'), (True, '88-4')],
-    [(False, '05-5'), (False, '08-5')],
-    [(False, '05-5'), (False, '07-5')],
-    [(False, '05-5'), (False, '06-5')],
-    [(False, '04-5'), (False, '08-5')],
-    [(False, '04-5'), (False, '07-5')],
-    [(False, '04-5'), (False, '06-5')],
-    [(False, '03-5'), (False, '08-5')],
-    [(False, '03-5'), (False, '07-5')],
-    [(False, '03-5'), (False, '06-5')],
-    [(False, '02-5'), (False, '08-5')],
-    [(False, '02-5'), (False, '07-5')],
-    [(False, '02-5'), (False, '06-5')],
-    [(False, '02-5'), (False, '05-5')],
-    [(False, '02-5'), (False, '04-5')],
-    [(False, '02-5'), (False, '03-5')],
-    [(False, '01-5'), (False, '08-5')],
-    [(False, '01-5'), (False, '07-5')],
-    [(False, '01-5'), (False, '06-5')],
-    [(False, '01-5'), (False, '05-5')],
-    [(False, '01-5'), (False, '04-5')],
-    [(False, '01-5'), (False, '03-5')],
-    [(False, '00-5'), (False, '08-5')],
-    [(False, '00-5'), (False, '07-5')],
-    [(False, '00-5'), (False, '06-5')],
-    [(False, '00-5'), (False, '05-5')],
-    [(False, '00-5'), (False, '04-5')],
-    [(False, '00-5'), (False, '03-5')],
-    [(True, '00-5'), (True, '01-5'), (True, '02-5'), (True, '03-5'), (True, '04-5'), (True, '05-5'), (True, '06-5'), (True, '07-5'), (True, '08-5')],
-    [(False, '15-5'), (False, '18-5')],
-    [(False, '15-5'), (False, '17-5')],
-    [(False, '15-5'), (False, '16-5')],
-    [(False, '14-5'), (False, '18-5')],
-    [(False, '14-5'), (False, '17-5')],
-    [(False, '14-5'), (False, '16-5')],
-    [(False, '13-5'), (False, '18-5')],
-    [(False, '13-5'), (False, '17-5')],
-    [(False, '13-5'), (False, '16-5')],
-    [(False, '12-5'), (False, '18-5')],
-    [(False, '12-5'), (False, '17-5')],
-    [(False, '12-5'), (False, '16-5')],
-    [(False, '12-5'), (False, '15-5')],
-    [(False, '12-5'), (False, '14-5')],
-    [(False, '12-5'), (False, '13-5')],
-    [(False, '11-5'), (False, '18-5')],
-    [(False, '11-5'), (False, '17-5')],
-    [(False, '11-5'), (False, '16-5')],
-    [(False, '11-5'), (False, '15-5')],
-    [(False, '11-5'), (False, '14-5')],
-    [(False, '11-5'), (False, '13-5')],
-    [(False, '10-5'), (False, '18-5')],
-    [(False, '10-5'), (False, '17-5')],
-    [(False, '10-5'), (False, '16-5')],
-    [(False, '10-5'), (False, '15-5')],
-    [(False, '10-5'), (False, '14-5')],
-    [(False, '10-5'), (False, '13-5')],
-    [(True, '10-5'), (True, '11-5'), (True, '12-5'), (True, '13-5'), (True, '14-5'), (True, '15-5'), (True, '16-5'), (True, '17-5'), (True, '18-5')],
-    [(False, '25-5'), (False, '28-5')],
-    [(False, '25-5'), (False, '27-5')],
-    [(False, '25-5'), (False, '26-5')],
-    [(False, '24-5'), (False, '28-5')],
-    [(False, '24-5'), (False, '27-5')],
-    [(False, '24-5'), (False, '26-5')],
-    [(False, '23-5'), (False, '28-5')],
-    [(False, '23-5'), (False, '27-5')],
-    [(False, '23-5'), (False, '26-5')],
-    [(False, '22-5'), (False, '28-5')],
-    [(False, '22-5'), (False, '27-5')],
-    [(False, '22-5'), (False, '26-5')],
-    [(False, '22-5'), (False, '25-5')],
-    [(False, '22-5'), (False, '24-5')],
-    [(False, '22-5'), (False, '23-5')],
-    [(False, '21-5'), (False, '28-5')],
-    [(False, '21-5'), (False, '27-5')],
-    [(False, '21-5'), (False, '26-5')],
-    [(False, '21-5'), (False, '25-5')],
-    [(False, '21-5'), (False, '24-5')],
-    [(False, '21-5'), (False, '23-5')],
-    [(False, '20-5'), (False, '28-5')],
-    [(False, '20-5'), (False, '27-5')],
-    [(False, '20-5'), (False, '26-5')],
-    [(False, '20-5'), (False, '25-5')],
-    [(False, '20-5'), (False, '24-5')],
-    [(False, '20-5'), (False, '23-5')],
-    [(True, '20-5'), (True, '21-5'), (True, '22-5'), (True, '23-5'), (True, '24-5'), (True, '25-5'), (True, '26-5'), (True, '27-5'), (True, '28-5')],
-    [(False, '35-5'), (False, '38-5')],
-    [(False, '35-5'), (False, '37-5')],
-    [(False, '35-5'), (False, '36-5')],
-    [(False, '34-5'), (False, '38-5')],
-    [(False, '34-5'), (False, '37-5')],
-    [(False, '34-5'), (False, '36-5')],
-    [(False, '33-5'), (False, '38-5')],
-    [(False, '33-5'), (False, '37-5')],
-    [(False, '33-5'), (False, '36-5')],
-    [(False, '32-5'), (False, '38-5')],
-    [(False, '32-5'), (False, '37-5')],
-    [(False, '32-5'), (False, '36-5')],
-    [(False, '32-5'), (False, '35-5')],
-    [(False, '32-5'), (False, '34-5')],
-    [(False, '32-5'), (False, '33-5')],
-    [(False, '31-5'), (False, '38-5')],
-    [(False, '31-5'), (False, '37-5')],
-    [(False, '31-5'), (False, '36-5')],
-    [(False, '31-5'), (False, '35-5')],
-    [(False, '31-5'), (False, '34-5')],
-    [(False, '31-5'), (False, '33-5')],
-    [(False, '30-5'), (False, '38-5')],
-    [(False, '30-5'), (False, '37-5')],
-    [(False, '30-5'), (False, '36-5')],
-    [(False, '30-5'), (False, '35-5')],
-    [(False, '30-5'), (False, '34-5')],
-    [(False, '30-5'), (False, '33-5')],
-    [(True, '30-5'), (True, '31-5'), (True, '32-5'), (True, '33-5'), (True, '34-5'), (True, '35-5'), (True, '36-5'), (True, '37-5'), (True, '38-5')],
-    [(False, '45-5'), (False, '48-5')],
-    [(False, '45-5'), (False, '47-5')],
-    [(False, '45-5'), (False, '46-5')],
-    [(False, '44-5'), (False, '48-5')],
-    [(False, '44-5'), (False, '47-5')],
-    [(False, '44-5'), (False, '46-5')],
-    [(False, '43-5'), (False, '48-5')],
-    [(False, '43-5'), (False, '47-5')],
-    [(False, '43-5'), (False, '46-5')],
-    [(False, '42-5'), (False, '48-5')],
-    [(False, '42-5'), (False, '47-5')],
-    [(False, '42-5'), (False, '46-5')],
-    [(False, '42-5'), (False, '45-5')],
-    [(False, '42-5'), (False, '44-5')],
-    [(False, '42-5'), (False, '43-5')],
-    [(False, '41-5'), (False, '48-5')],
-    [(False, '41-5'), (False, '47-5')],
-    [(False, '41-5'), (False, '46-5')],
-    [(False, '41-5'), (False, '45-5')],
-    [(False, '41-5'), (False, '44-5')],
-    [(False, '41-5'), (False, '43-5')],
-    [(False, '40-5'), (False, '48-5')],
-    [(False, '40-5'), (False, '47-5')],
-    [(False, '40-5'), (False, '46-5')],
-    [(False, '40-5'), (False, '45-5')],
-    [(False, '40-5'), (False, '44-5')],
-    [(False, '40-5'), (False, '43-5')],
-    [(True, '40-5'), (True, '41-5'), (True, '42-5'), (True, '43-5'), (True, '44-5'), (True, '45-5'), (True, '46-5'), (True, '47-5'), (True, '48-5')],
-    [(False, '55-5'), (False, '58-5')],
-    [(False, '55-5'), (False, '57-5')],
-    [(False, '55-5'), (False, '56-5')],
-    [(False, '54-5'), (False, '58-5')],
-    [(False, '54-5'), (False, '57-5')],
-    [(False, '54-5'), (False, '56-5')],
-    [(False, '53-5'), (False, '58-5')],
-    [(False, '53-5'), (False, '57-5')],
-    [(False, '53-5'), (False, '56-5')],
-    [(False, '52-5'), (False, '58-5')],
-    [(False, '52-5'), (False, '57-5')],
-    [(False, '52-5'), (False, '56-5')],
-    [(False, '52-5'), (False, '55-5')],
-    [(False, '52-5'), (False, '54-5')],
-    [(False, '52-5'), (False, '53-5')],
-    [(False, '51-5'), (False, '58-5')],
-    [(False, '51-5'), (False, '57-5')],
-    [(False, '51-5'), (False, '56-5')],
-    [(False, '51-5'), (False, '55-5')],
-    [(False, '51-5'), (False, '54-5')],
-    [(False, '51-5'), (False, '53-5')],
-    [(False, '50-5'), (False, '58-5')],
-    [(False, '50-5'), (False, '57-5')],
-    [(False, '50-5'), (False, '56-5')],
-    [(False, '50-5'), (False, '55-5')],
-    [(False, '50-5'), (False, '54-5')],
-    [(False, '50-5'), (False, '53-5')],
-    [(True, '50-5'), (True, '51-5'), (True, '52-5'), (True, '53-5'), (True, '54-5'), (True, '55-5'), (True, '56-5'), (True, '57-5'), (True, '58-5')],
-    [(False, '65-5'), (False, '68-5')],
-    [(False, '65-5'), (False, '67-5')],
-    [(False, '65-5'), (False, '66-5')],
-    [(False, '64-5'), (False, '68-5')],
-    [(False, '64-5'), (False, '67-5')],
-    [(False, '64-5'), (False, '66-5')],
-    [(False, '63-5'), (False, '68-5')],
-    [(False, '63-5'), (False, '67-5')],
-    [(False, '63-5'), (False, '66-5')],
-    [(False, '62-5'), (False, '68-5')],
-    [(False, '62-5'), (False, '67-5')],
-    [(False, '62-5'), (False, '66-5')],
-    [(False, '62-5'), (False, '65-5')],
-    [(False, '62-5'), (False, '64-5')],
-    [(False, '62-5'), (False, '63-5')],
-    [(False, '61-5'), (False, '68-5')],
-    [(False, '61-5'), (False, '67-5')],
-    [(False, '61-5'), (False, '66-5')],
-    [(False, '61-5'), (False, '65-5')],
-    [(False, '61-5'), (False, '64-5')],
-    [(False, '61-5'), (False, '63-5')],
-    [(False, '60-5'), (False, '68-5')],
-    [(False, '60-5'), (False, '67-5')],
-    [(False, '60-5'), (False, '66-5')],
-    [(False, '60-5'), (False, '65-5')],
-    [(False, '60-5'), (False, '64-5')],
-    [(False, '60-5'), (False, '63-5')],
-    [(True, '60-5'), (True, '61-5'), (True, '62-5'), (True, '63-5'), (True, '64-5'), (True, '65-5'), (True, '66-5'), (True, '67-5'), (True, '68-5')],
-    [(False, '75-5'), (False, '78-5')],
-    [(False, '75-5'), (False, '77-5')],
-    [(False, '75-5'), (False, '76-5')],
-    [(False, '74-5'), (False, '78-5')],
-    [(False, '74-5'), (False, '77-5')],
-    [(False, '74-5'), (False, '76-5')],
-    [(False, '73-5'), (False, '78-5')],
-    [(False, '73-5'), (False, '77-5')],
-    [(False, '73-5'), (False, '76-5')],
-    [(False, '72-5'), (False, '78-5')],
-    [(False, '72-5'), (False, '77-5')],
-    [(False, '72-5'), (False, '76-5')],
-    [(False, '72-5'), (False, '75-5')],
-    [(False, '72-5'), (False, '74-5')],
-    [(False, '72-5'), (False, '73-5')],
-    [(False, '71-5'), (False, '78-5')],
-    [(False, '71-5'), (False, '77-5')],
-    [(False, '71-5'), (False, '76-5')],
-    [(False, '71-5'), (False, '75-5')],
-    [(False, '71-5'), (False, '74-5')],
-    [(False, '71-5'), (False, '73-5')],
-    [(False, '70-5'), (False, '78-5')],
-    [(False, '70-5'), (False, '77-5')],
-    [(False, '70-5'), (False, '76-5')],
-    [(False, '70-5'), (False, '75-5')],
-    [(False, '70-5'), (False, '74-5')],
-    [(False, '70-5'), (False, '73-5')],
-    [(True, '70-5'), (True, '71-5'), (True, '72-5'), (True, '73-5'), (True, '74-5'), (True, '75-5'), (True, '76-5'), (True, '77-5'), (True, '78-5')],
-    [(False, '85-5'), (False, '88-5')],
-    [(False, '85-5'), (False, '87-5')],
-    [(False, '85-5'), (False, '86-5')],
-    [(False, '84-5'), (False, '88-5')],
-    [(False, '84-5'), (False, '87-5')],
-    [(False, '84-5'), (False, '86-5')],
-    [(False, '83-5'), (False, '88-5')],
-    [(False, '83-5'), (False, '87-5')],
-    [(False, '83-5'), (False, '86-5')],
-    [(False, '82-5'), (False, '88-5')],
-    [(False, '82-5'), (False, '87-5')],
-    [(False, '82-5'), (False, '86-5')],
-    [(False, '82-5'), (False, '85-5')],
-    [(False, '82-5'), (False, '84-5')],
-    [(False, '82-5'), (False, '83-5')],
-    [(False, '81-5'), (False, '88-5')],
-    [(False, '81-5'), (False, '87-5')],
-    [(False, '81-5'), (False, '86-5')],
-    [(False, '81-5'), (False, '85-5')],
-    [(False, '81-5'), (False, '84-5')],
-    [(False, '81-5'), (False, '83-5')],
-    [(False, '80-5'), (False, '88-5')],
-    [(False, '80-5'), (False, '87-5')],
-    [(False, '80-5'), (False, '86-5')],
-    [(False, '80-5'), (False, '85-5')],
-    [(False, '80-5'), (False, '84-5')],
-    [(False, '80-5'), (False, '83-5')],
-    [(True, '80-5'), (True, '81-5'), (True, '82-5'), (True, '83-5'), (True, '84-5'), (True, '85-5'), (True, '86-5'), (True, '87-5'), (True, '88-5')],
-    [(False, '05-6'), (False, '08-6')],
-    [(False, '05-6'), (False, '07-6')],
-    [(False, '05-6'), (False, '06-6')],
-    [(False, '04-6'), (False, '08-6')],
-    [(False, '04-6'), (False, '07-6')],
-    [(False, '04-6'), (False, '06-6')],
-    [(False, '03-6'), (False, '08-6')],
-    [(False, '03-6'), (False, '07-6')],
-    [(False, '03-6'), (False, '06-6')],
-    [(False, '02-6'), (False, '08-6')],
-    [(False, '02-6'), (False, '07-6')],
-    [(False, '02-6'), (False, '06-6')],
-    [(False, '02-6'), (False, '05-6')],
-    [(False, '02-6'), (False, '04-6')],
-    [(False, '02-6'), (False, '03-6')],
-    [(False, '01-6'), (False, '08-6')],
-    [(False, '01-6'), (False, '07-6')],
-    [(False, '01-6'), (False, '06-6')],
-    [(False, '01-6'), (False, '05-6')],
-    [(False, '01-6'), (False, '04-6')],
-    [(False, '01-6'), (False, '03-6')],
-    [(False, '00-6'), (False, '08-6')],
-    [(False, '00-6'), (False, '07-6')],
-    [(False, '00-6'), (False, '06-6')],
-    [(False, '00-6'), (False, '05-6')],
-    [(False, '00-6'), (False, '04-6')],
-    [(False, '00-6'), (False, '03-6')],
-    [(True, '00-6'), (True, '01-6'), (True, '02-6'), (True, '03-6'), (True, '04-6'), (True, '05-6'), (True, '06-6'), (True, '07-6'), (True, '08-6')],
-    [(False, '15-6'), (False, '18-6')],
-    [(False, '15-6'), (False, '17-6')],
-    [(False, '15-6'), (False, '16-6')],
-    [(False, '14-6'), (False, '18-6')],
-    [(False, '14-6'), (False, '17-6')],
-    [(False, '14-6'), (False, '16-6')],
-    [(False, '13-6'), (False, '18-6')],
-    [(False, '13-6'), (False, '17-6')],
-    [(False, '13-6'), (False, '16-6')],
-    [(False, '12-6'), (False, '18-6')],
-    [(False, '12-6'), (False, '17-6')],
-    [(False, '12-6'), (False, '16-6')],
-    [(False, '12-6'), (False, '15-6')],
-    [(False, '12-6'), (False, '14-6')],
-    [(False, '12-6'), (False, '13-6')],
-    [(False, '11-6'), (False, '18-6')],
-    [(False, '11-6'), (False, '17-6')],
-    [(False, '11-6'), (False, '16-6')],
-    [(False, '11-6'), (False, '15-6')],
-    [(False, '11-6'), (False, '14-6')],
-    [(False, '11-6'), (False, '13-6')],
-    [(False, '10-6'), (False, '18-6')],
-    [(False, '10-6'), (False, '17-6')],
-    [(False, '10-6'), (False, '16-6')],
-    [(False, '10-6'), (False, '15-6')],
-    [(False, '10-6'), (False, '14-6')],
-    [(False, '10-6'), (False, '13-6')],
-    [(True, '10-6'), (True, '11-6'), (True, '12-6'), (True, '13-6'), (True, '14-6'), (True, '15-6'), (True, '16-6'), (True, '17-6'), (True, '18-6')],
-    [(False, '25-6'), (False, '28-6')],
-    [(False, '25-6'), (False, '27-6')],
-    [(False, '25-6'), (False, '26-6')],
-    [(False, '24-6'), (False, '28-6')],
-    [(False, '24-6'), (False, '27-6')],
-    [(False, '24-6'), (False, '26-6')],
-    [(False, '23-6'), (False, '28-6')],
-    [(False, '23-6'), (False, '27-6')],
-    [(False, '23-6'), (False, '26-6')],
-    [(False, '22-6'), (False, '28-6')],
-    [(False, '22-6'), (False, '27-6')],
-    [(False, '22-6'), (False, '26-6')],
-    [(False, '22-6'), (False, '25-6')],
-    [(False, '22-6'), (False, '24-6')],
-    [(False, '22-6'), (False, '23-6')],
-    [(False, '21-6'), (False, '28-6')],
-    [(False, '21-6'), (False, '27-6')],
-    [(False, '21-6'), (False, '26-6')],
-    [(False, '21-6'), (False, '25-6')],
-    [(False, '21-6'), (False, '24-6')],
-    [(False, '21-6'), (False, '23-6')],
-    [(False, '20-6'), (False, '28-6')],
-    [(False, '20-6'), (False, '27-6')],
-    [(False, '20-6'), (False, '26-6')],
-    [(False, '20-6'), (False, '25-6')],
-    [(False, '20-6'), (False, '24-6')],
-    [(False, '20-6'), (False, '23-6')],
-    [(True, '20-6'), (True, '21-6'), (True, '22-6'), (True, '23-6'), (True, '24-6'), (True, '25-6'), (True, '26-6'), (True, '27-6'), (True, '28-6')],
-    [(False, '35-6'), (False, '38-6')],
-    [(False, '35-6'), (False, '37-6')],
-    [(False, '35-6'), (False, '36-6')],
-    [(False, '34-6'), (False, '38-6')],
-    [(False, '34-6'), (False, '37-6')],
-    [(False, '34-6'), (False, '36-6')],
-    [(False, '33-6'), (False, '38-6')],
-    [(False, '33-6'), (False, '37-6')],
-    [(False, '33-6'), (False, '36-6')],
-    [(False, '32-6'), (False, '38-6')],
-    [(False, '32-6'), (False, '37-6')],
-    [(False, '32-6'), (False, '36-6')],
-    [(False, '32-6'), (False, '35-6')],
-    [(False, '32-6'), (False, '34-6')],
-    [(False, '32-6'), (False, '33-6')],
-    [(False, '31-6'), (False, '38-6')],
-    [(False, '31-6'), (False, '37-6')],
-    [(False, '31-6'), (False, '36-6')],
-    [(False, '31-6'), (False, '35-6')],
-    [(False, '31-6'), (False, '34-6')],
-    [(False, '31-6'), (False, '33-6')],
-    [(False, '30-6'), (False, '38-6')],
-    [(False, '30-6'), (False, '37-6')],
-    [(False, '30-6'), (False, '36-6')],
-    [(False, '30-6'), (False, '35-6')],
-    [(False, '30-6'), (False, '34-6')],
-    [(False, '30-6'), (False, '33-6')],
-    [(True, '30-6'), (True, '31-6'), (True, '32-6'), (True, '33-6'), (True, '34-6'), (True, '35-6'), (True, '36-6'), (True, '37-6'), (True, '38-6')],
-    [(False, '45-6'), (False, '48-6')],
-    [(False, '45-6'), (False, '47-6')],
-    [(False, '45-6'), (False, '46-6')],
-    [(False, '44-6'), (False, '48-6')],
-    [(False, '44-6'), (False, '47-6')],
-    [(False, '44-6'), (False, '46-6')],
-    [(False, '43-6'), (False, '48-6')],
-    [(False, '43-6'), (False, '47-6')],
-    [(False, '43-6'), (False, '46-6')],
-    [(False, '42-6'), (False, '48-6')],
-    [(False, '42-6'), (False, '47-6')],
-    [(False, '42-6'), (False, '46-6')],
-    [(False, '42-6'), (False, '45-6')],
-    [(False, '42-6'), (False, '44-6')],
-    [(False, '42-6'), (False, '43-6')],
-    [(False, '41-6'), (False, '48-6')],
-    [(False, '41-6'), (False, '47-6')],
-    [(False, '41-6'), (False, '46-6')],
-    [(False, '41-6'), (False, '45-6')],
-    [(False, '41-6'), (False, '44-6')],
-    [(False, '41-6'), (False, '43-6')],
-    [(False, '40-6'), (False, '48-6')],
-    [(False, '40-6'), (False, '47-6')],
-    [(False, '40-6'), (False, '46-6')],
-    [(False, '40-6'), (False, '45-6')],
-    [(False, '40-6'), (False, '44-6')],
-    [(False, '40-6'), (False, '43-6')],
-    [(True, '40-6'), (True, '41-6'), (True, '42-6'), (True, '43-6'), (True, '44-6'), (True, '45-6'), (True, '46-6'), (True, '47-6'), (True, '48-6')],
-    [(False, '55-6'), (False, '58-6')],
-    [(False, '55-6'), (False, '57-6')],
-    [(False, '55-6'), (False, '56-6')],
-    [(False, '54-6'), (False, '58-6')],
-    [(False, '54-6'), (False, '57-6')],
-    [(False, '54-6'), (False, '56-6')],
-    [(False, '53-6'), (False, '58-6')],
-    [(False, '53-6'), (False, '57-6')],
-    [(False, '53-6'), (False, '56-6')],
-    [(False, '52-6'), (False, '58-6')],
-    [(False, '52-6'), (False, '57-6')],
-    [(False, '52-6'), (False, '56-6')],
-    [(False, '52-6'), (False, '55-6')],
-    [(False, '52-6'), (False, '54-6')],
-    [(False, '52-6'), (False, '53-6')],
-    [(False, '51-6'), (False, '58-6')],
-    [(False, '51-6'), (False, '57-6')],
-    [(False, '51-6'), (False, '56-6')],
-    [(False, '51-6'), (False, '55-6')],
-    [(False, '51-6'), (False, '54-6')],
-    [(False, '51-6'), (False, '53-6')],
-    [(False, '50-6'), (False, '58-6')],
-    [(False, '50-6'), (False, '57-6')],
-    [(False, '50-6'), (False, '56-6')],
-    [(False, '50-6'), (False, '55-6')],
-    [(False, '50-6'), (False, '54-6')],
-    [(False, '50-6'), (False, '53-6')],
-    [(True, '50-6'), (True, '51-6'), (True, '52-6'), (True, '53-6'), (True, '54-6'), (True, '55-6'), (True, '56-6'), (True, '57-6'), (True, '58-6')],
-    [(False, '65-6'), (False, '68-6')],
-    [(False, '65-6'), (False, '67-6')],
-    [(False, '65-6'), (False, '66-6')],
-    [(False, '64-6'), (False, '68-6')],
-    [(False, '64-6'), (False, '67-6')],
-    [(False, '64-6'), (False, '66-6')],
-    [(False, '63-6'), (False, '68-6')],
-    [(False, '63-6'), (False, '67-6')],
-    [(False, '63-6'), (False, '66-6')],
-    [(False, '62-6'), (False, '68-6')],
-    [(False, '62-6'), (False, '67-6')],
-    [(False, '62-6'), (False, '66-6')],
-    [(False, '62-6'), (False, '65-6')],
-    [(False, '62-6'), (False, '64-6')],
-    [(False, '62-6'), (False, '63-6')],
-    [(False, '61-6'), (False, '68-6')],
-    [(False, '61-6'), (False, '67-6')],
-    [(False, '61-6'), (False, '66-6')],
-    [(False, '61-6'), (False, '65-6')],
-    [(False, '61-6'), (False, '64-6')],
-    [(False, '61-6'), (False, '63-6')],
-    [(False, '60-6'), (False, '68-6')],
-    [(False, '60-6'), (False, '67-6')],
-    [(False, '60-6'), (False, '66-6')],
-    [(False, '60-6'), (False, '65-6')],
-    [(False, '60-6'), (False, '64-6')],
-    [(False, '60-6'), (False, '63-6')],
-    [(True, '60-6'), (True, '61-6'), (True, '62-6'), (True, '63-6'), (True, '64-6'), (True, '65-6'), (True, '66-6'), (True, '67-6'), (True, '68-6')],
-    [(False, '75-6'), (False, '78-6')],
-    [(False, '75-6'), (False, '77-6')],
-    [(False, '75-6'), (False, '76-6')],
-    [(False, '74-6'), (False, '78-6')],
-    [(False, '74-6'), (False, '77-6')],
-    [(False, '74-6'), (False, '76-6')],
-    [(False, '73-6'), (False, '78-6')],
-    [(False, '73-6'), (False, '77-6')],
-    [(False, '73-6'), (False, '76-6')],
-    [(False, '72-6'), (False, '78-6')],
-    [(False, '72-6'), (False, '77-6')],
-    [(False, '72-6'), (False, '76-6')],
-    [(False, '72-6'), (False, '75-6')],
-    [(False, '72-6'), (False, '74-6')],
-    [(False, '72-6'), (False, '73-6')],
-    [(False, '71-6'), (False, '78-6')],
-    [(False, '71-6'), (False, '77-6')],
-    [(False, '71-6'), (False, '76-6')],
-    [(False, '71-6'), (False, '75-6')],
-    [(False, '71-6'), (False, '74-6')],
-    [(False, '71-6'), (False, '73-6')],
-    [(False, '70-6'), (False, '78-6')],
-    [(False, '70-6'), (False, '77-6')],
-    [(False, '70-6'), (False, '76-6')],
-    [(False, '70-6'), (False, '75-6')],
-    [(False, '70-6'), (False, '74-6')],
-    [(False, '70-6'), (False, '73-6')],
-    [(True, '70-6'), (True, '71-6'), (True, '72-6'), (True, '73-6'), (True, '74-6'), (True, '75-6'), (True, '76-6'), (True, '77-6'), (True, '78-6')],
-    [(False, '85-6'), (False, '88-6')],
-    [(False, '85-6'), (False, '87-6')],
-    [(False, '85-6'), (False, '86-6')],
-    [(False, '84-6'), (False, '88-6')],
-    [(False, '84-6'), (False, '87-6')],
-    [(False, '84-6'), (False, '86-6')],
-    [(False, '83-6'), (False, '88-6')],
-    [(False, '83-6'), (False, '87-6')],
-    [(False, '83-6'), (False, '86-6')],
-    [(False, '82-6'), (False, '88-6')],
-    [(False, '82-6'), (False, '87-6')],
-    [(False, '82-6'), (False, '86-6')],
-    [(False, '82-6'), (False, '85-6')],
-    [(False, '82-6'), (False, '84-6')],
-    [(False, '82-6'), (False, '83-6')],
-    [(False, '81-6'), (False, '88-6')],
-    [(False, '81-6'), (False, '87-6')],
-    [(False, '81-6'), (False, '86-6')],
-    [(False, '81-6'), (False, '85-6')],
-    [(False, '81-6'), (False, '84-6')],
-    [(False, '81-6'), (False, '83-6')],
-    [(False, '80-6'), (False, '88-6')],
-    [(False, '80-6'), (False, '87-6')],
-    [(False, '80-6'), (False, '86-6')],
-    [(False, '80-6'), (False, '85-6')],
-    [(False, '80-6'), (False, '84-6')],
-    [(False, '80-6'), (False, '83-6')],
-    [(True, '80-6'), (True, '81-6'), (True, '82-6'), (True, '83-6'), (True, '84-6'), (True, '85-6'), (True, '86-6'), (True, '87-6'), (True, '88-6')],
-    [(False, '05-7'), (False, '08-7')],
-    [(False, '05-7'), (False, '07-7')],
-    [(False, '05-7'), (False, '06-7')],
-    [(False, '04-7'), (False, '08-7')],
-    [(False, '04-7'), (False, '07-7')],
-    [(False, '04-7'), (False, '06-7')],
-    [(False, '03-7'), (False, '08-7')],
-    [(False, '03-7'), (False, '07-7')],
-    [(False, '03-7'), (False, '06-7')],
-    [(False, '02-7'), (False, '08-7')],
-    [(False, '02-7'), (False, '07-7')],
-    [(False, '02-7'), (False, '06-7')],
-    [(False, '02-7'), (False, '05-7')],
-    [(False, '02-7'), (False, '04-7')],
-    [(False, '02-7'), (False, '03-7')],
-    [(False, '01-7'), (False, '08-7')],
-    [(False, '01-7'), (False, '07-7')],
-    [(False, '01-7'), (False, '06-7')],
-    [(False, '01-7'), (False, '05-7')],
-    [(False, '01-7'), (False, '04-7')],
-    [(False, '01-7'), (False, '03-7')],
-    [(False, '00-7'), (False, '08-7')],
-    [(False, '00-7'), (False, '07-7')],
-    [(False, '00-7'), (False, '06-7')],
-    [(False, '00-7'), (False, '05-7')],
-    [(False, '00-7'), (False, '04-7')],
-    [(False, '00-7'), (False, '03-7')],
-    [(True, '00-7'), (True, '01-7'), (True, '02-7'), (True, '03-7'), (True, '04-7'), (True, '05-7'), (True, '06-7'), (True, '07-7'), (True, '08-7')],
-    [(False, '15-7'), (False, '18-7')],
-    [(False, '15-7'), (False, '17-7')],
-    [(False, '15-7'), (False, '16-7')],
-    [(False, '14-7'), (False, '18-7')],
-    [(False, '14-7'), (False, '17-7')],
-    [(False, '14-7'), (False, '16-7')],
-    [(False, '13-7'), (False, '18-7')],
-    [(False, '13-7'), (False, '17-7')],
-    [(False, '13-7'), (False, '16-7')],
-    [(False, '12-7'), (False, '18-7')],
-    [(False, '12-7'), (False, '17-7')],
-    [(False, '12-7'), (False, '16-7')],
-    [(False, '12-7'), (False, '15-7')],
-    [(False, '12-7'), (False, '14-7')],
-    [(False, '12-7'), (False, '13-7')],
-    [(False, '11-7'), (False, '18-7')],
-    [(False, '11-7'), (False, '17-7')],
-    [(False, '11-7'), (False, '16-7')],
-    [(False, '11-7'), (False, '15-7')],
-    [(False, '11-7'), (False, '14-7')],
-    [(False, '11-7'), (False, '13-7')],
-    [(False, '10-7'), (False, '18-7')],
-    [(False, '10-7'), (False, '17-7')],
-    [(False, '10-7'), (False, '16-7')],
-    [(False, '10-7'), (False, '15-7')],
-    [(False, '10-7'), (False, '14-7')],
-    [(False, '10-7'), (False, '13-7')],
-    [(True, '10-7'), (True, '11-7'), (True, '12-7'), (True, '13-7'), (True, '14-7'), (True, '15-7'), (True, '16-7'), (True, '17-7'), (True, '18-7')],
-    [(False, '25-7'), (False, '28-7')],
-    [(False, '25-7'), (False, '27-7')],
-    [(False, '25-7'), (False, '26-7')],
-    [(False, '24-7'), (False, '28-7')],
-    [(False, '24-7'), (False, '27-7')],
-    [(False, '24-7'), (False, '26-7')],
-    [(False, '23-7'), (False, '28-7')],
-    [(False, '23-7'), (False, '27-7')],
-    [(False, '23-7'), (False, '26-7')],
-    [(False, '22-7'), (False, '28-7')],
-    [(False, '22-7'), (False, '27-7')],
-    [(False, '22-7'), (False, '26-7')],
-    [(False, '22-7'), (False, '25-7')],
-    [(False, '22-7'), (False, '24-7')],
-    [(False, '22-7'), (False, '23-7')],
-    [(False, '21-7'), (False, '28-7')],
-    [(False, '21-7'), (False, '27-7')],
-    [(False, '21-7'), (False, '26-7')],
-    [(False, '21-7'), (False, '25-7')],
-    [(False, '21-7'), (False, '24-7')],
-    [(False, '21-7'), (False, '23-7')],
-    [(False, '20-7'), (False, '28-7')],
-    [(False, '20-7'), (False, '27-7')],
-    [(False, '20-7'), (False, '26-7')],
-    [(False, '20-7'), (False, '25-7')],
-    [(False, '20-7'), (False, '24-7')],
-    [(False, '20-7'), (False, '23-7')],
-    [(True, '20-7'), (True, '21-7'), (True, '22-7'), (True, '23-7'), (True, '24-7'), (True, '25-7'), (True, '26-7'), (True, '27-7'), (True, '28-7')],
-    [(False, '35-7'), (False, '38-7')],
-    [(False, '35-7'), (False, '37-7')],
-    [(False, '35-7'), (False, '36-7')],
-    [(False, '34-7'), (False, '38-7')],
-    [(False, '34-7'), (False, '37-7')],
-    [(False, '34-7'), (False, '36-7')],
-    [(False, '33-7'), (False, '38-7')],
-    [(False, '33-7'), (False, '37-7')],
-    [(False, '33-7'), (False, '36-7')],
-    [(False, '32-7'), (False, '38-7')],
-    [(False, '32-7'), (False, '37-7')],
-    [(False, '32-7'), (False, '36-7')],
-    [(False, '32-7'), (False, '35-7')],
-    [(False, '32-7'), (False, '34-7')],
-    [(False, '32-7'), (False, '33-7')],
-    [(False, '31-7'), (False, '38-7')],
-    [(False, '31-7'), (False, '37-7')],
-    [(False, '31-7'), (False, '36-7')],
-    [(False, '31-7'), (False, '35-7')],
-    [(False, '31-7'), (False, '34-7')],
-    [(False, '31-7'), (False, '33-7')],
-    [(False, '30-7'), (False, '38-7')],
-    [(False, '30-7'), (False, '37-7')],
-    [(False, '30-7'), (False, '36-7')],
-    [(False, '30-7'), (False, '35-7')],
-    [(False, '30-7'), (False, '34-7')],
-    [(False, '30-7'), (False, '33-7')],
-    [(True, '30-7'), (True, '31-7'), (True, '32-7'), (True, '33-7'), (True, '34-7'), (True, '35-7'), (True, '36-7'), (True, '37-7'), (True, '38-7')],
-    [(False, '45-7'), (False, '48-7')],
-    [(False, '45-7'), (False, '47-7')],
-    [(False, '45-7'), (False, '46-7')],
-    [(False, '44-7'), (False, '48-7')],
-    [(False, '44-7'), (False, '47-7')],
-    [(False, '44-7'), (False, '46-7')],
-    [(False, '43-7'), (False, '48-7')],
-    [(False, '43-7'), (False, '47-7')],
-    [(False, '43-7'), (False, '46-7')],
-    [(False, '42-7'), (False, '48-7')],
-    [(False, '42-7'), (False, '47-7')],
-    [(False, '42-7'), (False, '46-7')],
-    [(False, '42-7'), (False, '45-7')],
-    [(False, '42-7'), (False, '44-7')],
-    [(False, '42-7'), (False, '43-7')],
-    [(False, '41-7'), (False, '48-7')],
-    [(False, '41-7'), (False, '47-7')],
-    [(False, '41-7'), (False, '46-7')],
-    [(False, '41-7'), (False, '45-7')],
-    [(False, '41-7'), (False, '44-7')],
-    [(False, '41-7'), (False, '43-7')],
-    [(False, '40-7'), (False, '48-7')],
-    [(False, '40-7'), (False, '47-7')],
-    [(False, '40-7'), (False, '46-7')],
-    [(False, '40-7'), (False, '45-7')],
-    [(False, '40-7'), (False, '44-7')],
-    [(False, '40-7'), (False, '43-7')],
-    [(True, '40-7'), (True, '41-7'), (True, '42-7'), (True, '43-7'), (True, '44-7'), (True, '45-7'), (True, '46-7'), (True, '47-7'), (True, '48-7')],
-    [(False, '55-7'), (False, '58-7')],
-    [(False, '55-7'), (False, '57-7')],
-    [(False, '55-7'), (False, '56-7')],
-    [(False, '54-7'), (False, '58-7')],
-    [(False, '54-7'), (False, '57-7')],
-    [(False, '54-7'), (False, '56-7')],
-    [(False, '53-7'), (False, '58-7')],
-    [(False, '53-7'), (False, '57-7')],
-    [(False, '53-7'), (False, '56-7')],
-    [(False, '52-7'), (False, '58-7')],
-    [(False, '52-7'), (False, '57-7')],
-    [(False, '52-7'), (False, '56-7')],
-    [(False, '52-7'), (False, '55-7')],
-    [(False, '52-7'), (False, '54-7')],
-    [(False, '52-7'), (False, '53-7')],
-    [(False, '51-7'), (False, '58-7')],
-    [(False, '51-7'), (False, '57-7')],
-    [(False, '51-7'), (False, '56-7')],
-    [(False, '51-7'), (False, '55-7')],
-    [(False, '51-7'), (False, '54-7')],
-    [(False, '51-7'), (False, '53-7')],
-    [(False, '50-7'), (False, '58-7')],
-    [(False, '50-7'), (False, '57-7')],
-    [(False, '50-7'), (False, '56-7')],
-    [(False, '50-7'), (False, '55-7')],
-    [(False, '50-7'), (False, '54-7')],
-    [(False, '50-7'), (False, '53-7')],
-    [(True, '50-7'), (True, '51-7'), (True, '52-7'), (True, '53-7'), (True, '54-7'), (True, '55-7'), (True, '56-7'), (True, '57-7'), (True, '58-7')],
-    [(False, '65-7'), (False, '68-7')],
-    [(False, '65-7'), (False, '67-7')],
-    [(False, '65-7'), (False, '66-7')],
-    [(False, '64-7'), (False, '68-7')],
-    [(False, '64-7'), (False, '67-7')],
-    [(False, '64-7'), (False, '66-7')],
-    [(False, '63-7'), (False, '68-7')],
-    [(False, '63-7'), (False, '67-7')],
-    [(False, '63-7'), (False, '66-7')],
-    [(False, '62-7'), (False, '68-7')],
-    [(False, '62-7'), (False, '67-7')],
-    [(False, '62-7'), (False, '66-7')],
-    [(False, '62-7'), (False, '65-7')],
-    [(False, '62-7'), (False, '64-7')],
-    [(False, '62-7'), (False, '63-7')],
-    [(False, '61-7'), (False, '68-7')],
-    [(False, '61-7'), (False, '67-7')],
-    [(False, '61-7'), (False, '66-7')],
-    [(False, '61-7'), (False, '65-7')],
-    [(False, '61-7'), (False, '64-7')],
-    [(False, '61-7'), (False, '63-7')],
-    [(False, '60-7'), (False, '68-7')],
-    [(False, '60-7'), (False, '67-7')],
-    [(False, '60-7'), (False, '66-7')],
-    [(False, '60-7'), (False, '65-7')],
-    [(False, '60-7'), (False, '64-7')],
-    [(False, '60-7'), (False, '63-7')],
-    [(True, '60-7'), (True, '61-7'), (True, '62-7'), (True, '63-7'), (True, '64-7'), (True, '65-7'), (True, '66-7'), (True, '67-7'), (True, '68-7')],
-    [(False, '75-7'), (False, '78-7')],
-    [(False, '75-7'), (False, '77-7')],
-    [(False, '75-7'), (False, '76-7')],
-    [(False, '74-7'), (False, '78-7')],
-    [(False, '74-7'), (False, '77-7')],
-    [(False, '74-7'), (False, '76-7')],
-    [(False, '73-7'), (False, '78-7')],
-    [(False, '73-7'), (False, '77-7')],
-    [(False, '73-7'), (False, '76-7')],
-    [(False, '72-7'), (False, '78-7')],
-    [(False, '72-7'), (False, '77-7')],
-    [(False, '72-7'), (False, '76-7')],
-    [(False, '72-7'), (False, '75-7')],
-    [(False, '72-7'), (False, '74-7')],
-    [(False, '72-7'), (False, '73-7')],
-    [(False, '71-7'), (False, '78-7')],
-    [(False, '71-7'), (False, '77-7')],
-    [(False, '71-7'), (False, '76-7')],
-    [(False, '71-7'), (False, '75-7')],
-    [(False, '71-7'), (False, '74-7')],
-    [(False, '71-7'), (False, '73-7')],
-    [(False, '70-7'), (False, '78-7')],
-    [(False, '70-7'), (False, '77-7')],
-    [(False, '70-7'), (False, '76-7')],
-    [(False, '70-7'), (False, '75-7')],
-    [(False, '70-7'), (False, '74-7')],
-    [(False, '70-7'), (False, '73-7')],
-    [(True, '70-7'), (True, '71-7'), (True, '72-7'), (True, '73-7'), (True, '74-7'), (True, '75-7'), (True, '76-7'), (True, '77-7'), (True, '78-7')],
-    [(False, '85-7'), (False, '88-7')],
-    [(False, '85-7'), (False, '87-7')],
-    [(False, '85-7'), (False, '86-7')],
-    [(False, '84-7'), (False, '88-7')],
-    [(False, '84-7'), (False, '87-7')],
-    [(False, '84-7'), (False, '86-7')],
-    [(False, '83-7'), (False, '88-7')],
-    [(False, '83-7'), (False, '87-7')],
-    [(False, '83-7'), (False, '86-7')],
-    [(False, '82-7'), (False, '88-7')],
-    [(False, '82-7'), (False, '87-7')],
-    [(False, '82-7'), (False, '86-7')],
-    [(False, '82-7'), (False, '85-7')],
-    [(False, '82-7'), (False, '84-7')],
-    [(False, '82-7'), (False, '83-7')],
-    [(False, '81-7'), (False, '88-7')],
-    [(False, '81-7'), (False, '87-7')],
-    [(False, '81-7'), (False, '86-7')],
-    [(False, '81-7'), (False, '85-7')],
-    [(False, '81-7'), (False, '84-7')],
-    [(False, '81-7'), (False, '83-7')],
-    [(False, '80-7'), (False, '88-7')],
-    [(False, '80-7'), (False, '87-7')],
-    [(False, '80-7'), (False, '86-7')],
-    [(False, '80-7'), (False, '85-7')],
-    [(False, '80-7'), (False, '84-7')],
-    [(False, '80-7'), (False, '83-7')],
-    [(True, '80-7'), (True, '81-7'), (True, '82-7'), (True, '83-7'), (True, '84-7'), (True, '85-7'), (True, '86-7'), (True, '87-7'), (True, '88-7')],
-    [(False, '05-8'), (False, '08-8')],
-    [(False, '05-8'), (False, '07-8')],
-    [(False, '05-8'), (False, '06-8')],
-    [(False, '04-8'), (False, '08-8')],
-    [(False, '04-8'), (False, '07-8')],
-    [(False, '04-8'), (False, '06-8')],
-    [(False, '03-8'), (False, '08-8')],
-    [(False, '03-8'), (False, '07-8')],
-    [(False, '03-8'), (False, '06-8')],
-    [(False, '02-8'), (False, '08-8')],
-    [(False, '02-8'), (False, '07-8')],
-    [(False, '02-8'), (False, '06-8')],
-    [(False, '02-8'), (False, '05-8')],
-    [(False, '02-8'), (False, '04-8')],
-    [(False, '02-8'), (False, '03-8')],
-    [(False, '01-8'), (False, '08-8')],
-    [(False, '01-8'), (False, '07-8')],
-    [(False, '01-8'), (False, '06-8')],
-    [(False, '01-8'), (False, '05-8')],
-    [(False, '01-8'), (False, '04-8')],
-    [(False, '01-8'), (False, '03-8')],
-    [(False, '00-8'), (False, '08-8')],
-    [(False, '00-8'), (False, '07-8')],
-    [(False, '00-8'), (False, '06-8')],
-    [(False, '00-8'), (False, '05-8')],
-    [(False, '00-8'), (False, '04-8')],
-    [(False, '00-8'), (False, '03-8')],
-    [(True, '00-8'), (True, '01-8'), (True, '02-8'), (True, '03-8'), (True, '04-8'), (True, '05-8'), (True, '06-8'), (True, '07-8'), (True, '08-8')],
-    [(False, '15-8'), (False, '18-8')],
-    [(False, '15-8'), (False, '17-8')],
-    [(False, '15-8'), (False, '16-8')],
-    [(False, '14-8'), (False, '18-8')],
-    [(False, '14-8'), (False, '17-8')],
-    [(False, '14-8'), (False, '16-8')],
-    [(False, '13-8'), (False, '18-8')],
-    [(False, '13-8'), (False, '17-8')],
-    [(False, '13-8'), (False, '16-8')],
-    [(False, '12-8'), (False, '18-8')],
-    [(False, '12-8'), (False, '17-8')],
-    [(False, '12-8'), (False, '16-8')],
-    [(False, '12-8'), (False, '15-8')],
-    [(False, '12-8'), (False, '14-8')],
-    [(False, '12-8'), (False, '13-8')],
-    [(False, '11-8'), (False, '18-8')],
-    [(False, '11-8'), (False, '17-8')],
-    [(False, '11-8'), (False, '16-8')],
-    [(False, '11-8'), (False, '15-8')],
-    [(False, '11-8'), (False, '14-8')],
-    [(False, '11-8'), (False, '13-8')],
-    [(False, '10-8'), (False, '18-8')],
-    [(False, '10-8'), (False, '17-8')],
-    [(False, '10-8'), (False, '16-8')],
-    [(False, '10-8'), (False, '15-8')],
-    [(False, '10-8'), (False, '14-8')],
-    [(False, '10-8'), (False, '13-8')],
-    [(True, '10-8'), (True, '11-8'), (True, '12-8'), (True, '13-8'), (True, '14-8'), (True, '15-8'), (True, '16-8'), (True, '17-8'), (True, '18-8')],
-    [(False, '25-8'), (False, '28-8')],
-    [(False, '25-8'), (False, '27-8')],
-    [(False, '25-8'), (False, '26-8')],
-    [(False, '24-8'), (False, '28-8')],
-    [(False, '24-8'), (False, '27-8')],
-    [(False, '24-8'), (False, '26-8')],
-    [(False, '23-8'), (False, '28-8')],
-    [(False, '23-8'), (False, '27-8')],
-    [(False, '23-8'), (False, '26-8')],
-    [(False, '22-8'), (False, '28-8')],
-    [(False, '22-8'), (False, '27-8')],
-    [(False, '22-8'), (False, '26-8')],
-    [(False, '22-8'), (False, '25-8')],
-    [(False, '22-8'), (False, '24-8')],
-    [(False, '22-8'), (False, '23-8')],
-    [(False, '21-8'), (False, '28-8')],
-    [(False, '21-8'), (False, '27-8')],
-    [(False, '21-8'), (False, '26-8')],
-    [(False, '21-8'), (False, '25-8')],
-    [(False, '21-8'), (False, '24-8')],
-    [(False, '21-8'), (False, '23-8')],
-    [(False, '20-8'), (False, '28-8')],
-    [(False, '20-8'), (False, '27-8')],
-    [(False, '20-8'), (False, '26-8')],
-    [(False, '20-8'), (False, '25-8')],
-    [(False, '20-8'), (False, '24-8')],
-    [(False, '20-8'), (False, '23-8')],
-    [(True, '20-8'), (True, '21-8'), (True, '22-8'), (True, '23-8'), (True, '24-8'), (True, '25-8'), (True, '26-8'), (True, '27-8'), (True, '28-8')],
-    [(False, '35-8'), (False, '38-8')],
-    [(False, '35-8'), (False, '37-8')],
-    [(False, '35-8'), (False, '36-8')],
-    [(False, '34-8'), (False, '38-8')],
-    [(False, '34-8'), (False, '37-8')],
-    [(False, '34-8'), (False, '36-8')],
-    [(False, '33-8'), (False, '38-8')],
-    [(False, '33-8'), (False, '37-8')],
-    [(False, '33-8'), (False, '36-8')],
-    [(False, '32-8'), (False, '38-8')],
-    [(False, '32-8'), (False, '37-8')],
-    [(False, '32-8'), (False, '36-8')],
-    [(False, '32-8'), (False, '35-8')],
-    [(False, '32-8'), (False, '34-8')],
-    [(False, '32-8'), (False, '33-8')],
-    [(False, '31-8'), (False, '38-8')],
-    [(False, '31-8'), (False, '37-8')],
-    [(False, '31-8'), (False, '36-8')],
-    [(False, '31-8'), (False, '35-8')],
-    [(False, '31-8'), (False, '34-8')],
-    [(False, '31-8'), (False, '33-8')],
-    [(False, '30-8'), (False, '38-8')],
-    [(False, '30-8'), (False, '37-8')],
-    [(False, '30-8'), (False, '36-8')],
-    [(False, '30-8'), (False, '35-8')],
-    [(False, '30-8'), (False, '34-8')],
-    [(False, '30-8'), (False, '33-8')],
-    [(True, '30-8'), (True, '31-8'), (True, '32-8'), (True, '33-8'), (True, '34-8'), (True, '35-8'), (True, '36-8'), (True, '37-8'), (True, '38-8')],
-    [(False, '45-8'), (False, '48-8')],
-    [(False, '45-8'), (False, '47-8')],
-    [(False, '45-8'), (False, '46-8')],
-    [(False, '44-8'), (False, '48-8')],
-    [(False, '44-8'), (False, '47-8')],
-    [(False, '44-8'), (False, '46-8')],
-    [(False, '43-8'), (False, '48-8')],
-    [(False, '43-8'), (False, '47-8')],
-    [(False, '43-8'), (False, '46-8')],
-    [(False, '42-8'), (False, '48-8')],
-    [(False, '42-8'), (False, '47-8')],
-    [(False, '42-8'), (False, '46-8')],
-    [(False, '42-8'), (False, '45-8')],
-    [(False, '42-8'), (False, '44-8')],
-    [(False, '42-8'), (False, '43-8')],
-    [(False, '41-8'), (False, '48-8')],
-    [(False, '41-8'), (False, '47-8')],
-    [(False, '41-8'), (False, '46-8')],
-    [(False, '41-8'), (False, '45-8')],
-    [(False, '41-8'), (False, '44-8')],
-    [(False, '41-8'), (False, '43-8')],
-    [(False, '40-8'), (False, '48-8')],
-    [(False, '40-8'), (False, '47-8')],
-    [(False, '40-8'), (False, '46-8')],
-    [(False, '40-8'), (False, '45-8')],
-    [(False, '40-8'), (False, '44-8')],
-    [(False, '40-8'), (False, '43-8')],
-    [(True, '40-8'), (True, '41-8'), (True, '42-8'), (True, '43-8'), (True, '44-8'), (True, '45-8'), (True, '46-8'), (True, '47-8'), (True, '48-8')],
-    [(False, '55-8'), (False, '58-8')],
-    [(False, '55-8'), (False, '57-8')],
-    [(False, '55-8'), (False, '56-8')],
-    [(False, '54-8'), (False, '58-8')],
-    [(False, '54-8'), (False, '57-8')],
-    [(False, '54-8'), (False, '56-8')],
-    [(False, '53-8'), (False, '58-8')],
-    [(False, '53-8'), (False, '57-8')],
-    [(False, '53-8'), (False, '56-8')],
-    [(False, '52-8'), (False, '58-8')],
-    [(False, '52-8'), (False, '57-8')],
-    [(False, '52-8'), (False, '56-8')],
-    [(False, '52-8'), (False, '55-8')],
-    [(False, '52-8'), (False, '54-8')],
-    [(False, '52-8'), (False, '53-8')],
-    [(False, '51-8'), (False, '58-8')],
-    [(False, '51-8'), (False, '57-8')],
-    [(False, '51-8'), (False, '56-8')],
-    [(False, '51-8'), (False, '55-8')],
-    [(False, '51-8'), (False, '54-8')],
-    [(False, '51-8'), (False, '53-8')],
-    [(False, '50-8'), (False, '58-8')],
-    [(False, '50-8'), (False, '57-8')],
-    [(False, '50-8'), (False, '56-8')],
-    [(False, '50-8'), (False, '55-8')],
-    [(False, '50-8'), (False, '54-8')],
-    [(False, '50-8'), (False, '53-8')],
-    [(True, '50-8'), (True, '51-8'), (True, '52-8'), (True, '53-8'), (True, '54-8'), (True, '55-8'), (True, '56-8'), (True, '57-8'), (True, '58-8')],
-    [(False, '65-8'), (False, '68-8')],
-    [(False, '65-8'), (False, '67-8')],
-    [(False, '65-8'), (False, '66-8')],
-    [(False, '64-8'), (False, '68-8')],
-    [(False, '64-8'), (False, '67-8')],
-    [(False, '64-8'), (False, '66-8')],
-    [(False, '63-8'), (False, '68-8')],
-    [(False, '63-8'), (False, '67-8')],
-    [(False, '63-8'), (False, '66-8')],
-    [(False, '62-8'), (False, '68-8')],
-    [(False, '62-8'), (False, '67-8')],
-    [(False, '62-8'), (False, '66-8')],
-    [(False, '62-8'), (False, '65-8')],
-    [(False, '62-8'), (False, '64-8')],
-    [(False, '62-8'), (False, '63-8')],
-    [(False, '61-8'), (False, '68-8')],
-    [(False, '61-8'), (False, '67-8')],
-    [(False, '61-8'), (False, '66-8')],
-    [(False, '61-8'), (False, '65-8')],
-    [(False, '61-8'), (False, '64-8')],
-    [(False, '61-8'), (False, '63-8')],
-    [(False, '60-8'), (False, '68-8')],
-    [(False, '60-8'), (False, '67-8')],
-    [(False, '60-8'), (False, '66-8')],
-    [(False, '60-8'), (False, '65-8')],
-    [(False, '60-8'), (False, '64-8')],
-    [(False, '60-8'), (False, '63-8')],
-    [(True, '60-8'), (True, '61-8'), (True, '62-8'), (True, '63-8'), (True, '64-8'), (True, '65-8'), (True, '66-8'), (True, '67-8'), (True, '68-8')],
-    [(False, '75-8'), (False, '78-8')],
-    [(False, '75-8'), (False, '77-8')],
-    [(False, '75-8'), (False, '76-8')],
-    [(False, '74-8'), (False, '78-8')],
-    [(False, '74-8'), (False, '77-8')],
-    [(False, '74-8'), (False, '76-8')],
-    [(False, '73-8'), (False, '78-8')],
-    [(False, '73-8'), (False, '77-8')],
-    [(False, '73-8'), (False, '76-8')],
-    [(False, '72-8'), (False, '78-8')],
-    [(False, '72-8'), (False, '77-8')],
-    [(False, '72-8'), (False, '76-8')],
-    [(False, '72-8'), (False, '75-8')],
-    [(False, '72-8'), (False, '74-8')],
-    [(False, '72-8'), (False, '73-8')],
-    [(False, '71-8'), (False, '78-8')],
-    [(False, '71-8'), (False, '77-8')],
-    [(False, '71-8'), (False, '76-8')],
-    [(False, '71-8'), (False, '75-8')],
-    [(False, '71-8'), (False, '74-8')],
-    [(False, '71-8'), (False, '73-8')],
-    [(False, '70-8'), (False, '78-8')],
-    [(False, '70-8'), (False, '77-8')],
-    [(False, '70-8'), (False, '76-8')],
-    [(False, '70-8'), (False, '75-8')],
-    [(False, '70-8'), (False, '74-8')],
-    [(False, '70-8'), (False, '73-8')],
-    [(True, '70-8'), (True, '71-8'), (True, '72-8'), (True, '73-8'), (True, '74-8'), (True, '75-8'), (True, '76-8'), (True, '77-8'), (True, '78-8')],
-    [(False, '85-8'), (False, '88-8')],
-    [(False, '85-8'), (False, '87-8')],
-    [(False, '85-8'), (False, '86-8')],
-    [(False, '84-8'), (False, '88-8')],
-    [(False, '84-8'), (False, '87-8')],
-    [(False, '84-8'), (False, '86-8')],
-    [(False, '83-8'), (False, '88-8')],
-    [(False, '83-8'), (False, '87-8')],
-    [(False, '83-8'), (False, '86-8')],
-    [(False, '82-8'), (False, '88-8')],
-    [(False, '82-8'), (False, '87-8')],
-    [(False, '82-8'), (False, '86-8')],
-    [(False, '82-8'), (False, '85-8')],
-    [(False, '82-8'), (False, '84-8')],
-    [(False, '82-8'), (False, '83-8')],
-    [(False, '81-8'), (False, '88-8')],
-    [(False, '81-8'), (False, '87-8')],
-    [(False, '81-8'), (False, '86-8')],
-    [(False, '81-8'), (False, '85-8')],
-    [(False, '81-8'), (False, '84-8')],
-    [(False, '81-8'), (False, '83-8')],
-    [(False, '80-8'), (False, '88-8')],
-    [(False, '80-8'), (False, '87-8')],
-    [(False, '80-8'), (False, '86-8')],
-    [(False, '80-8'), (False, '85-8')],
-    [(False, '80-8'), (False, '84-8')],
-    [(False, '80-8'), (False, '83-8')],
-    [(True, '80-8'), (True, '81-8'), (True, '82-8'), (True, '83-8'), (True, '84-8'), (True, '85-8'), (True, '86-8'), (True, '87-8'), (True, '88-8')],
-    [(False, '05-9'), (False, '08-9')],
-    [(False, '05-9'), (False, '07-9')],
-    [(False, '05-9'), (False, '06-9')],
-    [(False, '04-9'), (False, '08-9')],
-    [(False, '04-9'), (False, '07-9')],
-    [(False, '04-9'), (False, '06-9')],
-    [(False, '03-9'), (False, '08-9')],
-    [(False, '03-9'), (False, '07-9')],
-    [(False, '03-9'), (False, '06-9')],
-    [(False, '02-9'), (False, '08-9')],
-    [(False, '02-9'), (False, '07-9')],
-    [(False, '02-9'), (False, '06-9')],
-    [(False, '02-9'), (False, '05-9')],
-    [(False, '02-9'), (False, '04-9')],
-    [(False, '02-9'), (False, '03-9')],
-    [(False, '01-9'), (False, '08-9')],
-    [(False, '01-9'), (False, '07-9')],
-    [(False, '01-9'), (False, '06-9')],
-    [(False, '01-9'), (False, '05-9')],
-    [(False, '01-9'), (False, '04-9')],
-    [(False, '01-9'), (False, '03-9')],
-    [(False, '00-9'), (False, '08-9')],
-    [(False, '00-9'), (False, '07-9')],
-    [(False, '00-9'), (False, '06-9')],
-    [(False, '00-9'), (False, '05-9')],
-    [(False, '00-9'), (False, '04-9')],
-    [(False, '00-9'), (False, '03-9')],
-    [(True, '00-9'), (True, '01-9'), (True, '02-9'), (True, '03-9'), (True, '04-9'), (True, '05-9'), (True, '06-9'), (True, '07-9'), (True, '08-9')],
-    [(False, '15-9'), (False, '18-9')],
-    [(False, '15-9'), (False, '17-9')],
-    [(False, '15-9'), (False, '16-9')],
-    [(False, '14-9'), (False, '18-9')],
-    [(False, '14-9'), (False, '17-9')],
-    [(False, '14-9'), (False, '16-9')],
-    [(False, '13-9'), (False, '18-9')],
-    [(False, '13-9'), (False, '17-9')],
-    [(False, '13-9'), (False, '16-9')],
-    [(False, '12-9'), (False, '18-9')],
-    [(False, '12-9'), (False, '17-9')],
-    [(False, '12-9'), (False, '16-9')],
-    [(False, '12-9'), (False, '15-9')],
-    [(False, '12-9'), (False, '14-9')],
-    [(False, '12-9'), (False, '13-9')],
-    [(False, '11-9'), (False, '18-9')],
-    [(False, '11-9'), (False, '17-9')],
-    [(False, '11-9'), (False, '16-9')],
-    [(False, '11-9'), (False, '15-9')],
-    [(False, '11-9'), (False, '14-9')],
-    [(False, '11-9'), (False, '13-9')],
-    [(False, '10-9'), (False, '18-9')],
-    [(False, '10-9'), (False, '17-9')],
-    [(False, '10-9'), (False, '16-9')],
-    [(False, '10-9'), (False, '15-9')],
-    [(False, '10-9'), (False, '14-9')],
-    [(False, '10-9'), (False, '13-9')],
-    [(True, '10-9'), (True, '11-9'), (True, '12-9'), (True, '13-9'), (True, '14-9'), (True, '15-9'), (True, '16-9'), (True, '17-9'), (True, '18-9')],
-    [(False, '25-9'), (False, '28-9')],
-    [(False, '25-9'), (False, '27-9')],
-    [(False, '25-9'), (False, '26-9')],
-    [(False, '24-9'), (False, '28-9')],
-    [(False, '24-9'), (False, '27-9')],
-    [(False, '24-9'), (False, '26-9')],
-    [(False, '23-9'), (False, '28-9')],
-    [(False, '23-9'), (False, '27-9')],
-    [(False, '23-9'), (False, '26-9')],
-    [(False, '22-9'), (False, '28-9')],
-    [(False, '22-9'), (False, '27-9')],
-    [(False, '22-9'), (False, '26-9')],
-    [(False, '22-9'), (False, '25-9')],
-    [(False, '22-9'), (False, '24-9')],
-    [(False, '22-9'), (False, '23-9')],
-    [(False, '21-9'), (False, '28-9')],
-    [(False, '21-9'), (False, '27-9')],
-    [(False, '21-9'), (False, '26-9')],
-    [(False, '21-9'), (False, '25-9')],
-    [(False, '21-9'), (False, '24-9')],
-    [(False, '21-9'), (False, '23-9')],
-    [(False, '20-9'), (False, '28-9')],
-    [(False, '20-9'), (False, '27-9')],
-    [(False, '20-9'), (False, '26-9')],
-    [(False, '20-9'), (False, '25-9')],
-    [(False, '20-9'), (False, '24-9')],
-    [(False, '20-9'), (False, '23-9')],
-    [(True, '20-9'), (True, '21-9'), (True, '22-9'), (True, '23-9'), (True, '24-9'), (True, '25-9'), (True, '26-9'), (True, '27-9'), (True, '28-9')],
-    [(False, '35-9'), (False, '38-9')],
-    [(False, '35-9'), (False, '37-9')],
-    [(False, '35-9'), (False, '36-9')],
-    [(False, '34-9'), (False, '38-9')],
-    [(False, '34-9'), (False, '37-9')],
-    [(False, '34-9'), (False, '36-9')],
-    [(False, '33-9'), (False, '38-9')],
-    [(False, '33-9'), (False, '37-9')],
-    [(False, '33-9'), (False, '36-9')],
-    [(False, '32-9'), (False, '38-9')],
-    [(False, '32-9'), (False, '37-9')],
-    [(False, '32-9'), (False, '36-9')],
-    [(False, '32-9'), (False, '35-9')],
-    [(False, '32-9'), (False, '34-9')],
-    [(False, '32-9'), (False, '33-9')],
-    [(False, '31-9'), (False, '38-9')],
-    [(False, '31-9'), (False, '37-9')],
-    [(False, '31-9'), (False, '36-9')],
-    [(False, '31-9'), (False, '35-9')],
-    [(False, '31-9'), (False, '34-9')],
-    [(False, '31-9'), (False, '33-9')],
-    [(False, '30-9'), (False, '38-9')],
-    [(False, '30-9'), (False, '37-9')],
-    [(False, '30-9'), (False, '36-9')],
-    [(False, '30-9'), (False, '35-9')],
-    [(False, '30-9'), (False, '34-9')],
-    [(False, '30-9'), (False, '33-9')],
-    [(True, '30-9'), (True, '31-9'), (True, '32-9'), (True, '33-9'), (True, '34-9'), (True, '35-9'), (True, '36-9'), (True, '37-9'), (True, '38-9')],
-    [(False, '45-9'), (False, '48-9')],
-    [(False, '45-9'), (False, '47-9')],
-    [(False, '45-9'), (False, '46-9')],
-    [(False, '44-9'), (False, '48-9')],
-    [(False, '44-9'), (False, '47-9')],
-    [(False, '44-9'), (False, '46-9')],
-    [(False, '43-9'), (False, '48-9')],
-    [(False, '43-9'), (False, '47-9')],
-    [(False, '43-9'), (False, '46-9')],
-    [(False, '42-9'), (False, '48-9')],
-    [(False, '42-9'), (False, '47-9')],
-    [(False, '42-9'), (False, '46-9')],
-    [(False, '42-9'), (False, '45-9')],
-    [(False, '42-9'), (False, '44-9')],
-    [(False, '42-9'), (False, '43-9')],
-    [(False, '41-9'), (False, '48-9')],
-    [(False, '41-9'), (False, '47-9')],
-    [(False, '41-9'), (False, '46-9')],
-    [(False, '41-9'), (False, '45-9')],
-    [(False, '41-9'), (False, '44-9')],
-    [(False, '41-9'), (False, '43-9')],
-    [(False, '40-9'), (False, '48-9')],
-    [(False, '40-9'), (False, '47-9')],
-    [(False, '40-9'), (False, '46-9')],
-    [(False, '40-9'), (False, '45-9')],
-    [(False, '40-9'), (False, '44-9')],
-    [(False, '40-9'), (False, '43-9')],
-    [(True, '40-9'), (True, '41-9'), (True, '42-9'), (True, '43-9'), (True, '44-9'), (True, '45-9'), (True, '46-9'), (True, '47-9'), (True, '48-9')],
-    [(False, '55-9'), (False, '58-9')],
-    [(False, '55-9'), (False, '57-9')],
-    [(False, '55-9'), (False, '56-9')],
-    [(False, '54-9'), (False, '58-9')],
-    [(False, '54-9'), (False, '57-9')],
-    [(False, '54-9'), (False, '56-9')],
-    [(False, '53-9'), (False, '58-9')],
-    [(False, '53-9'), (False, '57-9')],
-    [(False, '53-9'), (False, '56-9')],
-    [(False, '52-9'), (False, '58-9')],
-    [(False, '52-9'), (False, '57-9')],
-    [(False, '52-9'), (False, '56-9')],
-    [(False, '52-9'), (False, '55-9')],
-    [(False, '52-9'), (False, '54-9')],
-    [(False, '52-9'), (False, '53-9')],
-    [(False, '51-9'), (False, '58-9')],
-    [(False, '51-9'), (False, '57-9')],
-    [(False, '51-9'), (False, '56-9')],
-    [(False, '51-9'), (False, '55-9')],
-    [(False, '51-9'), (False, '54-9')],
-    [(False, '51-9'), (False, '53-9')],
-    [(False, '50-9'), (False, '58-9')],
-    [(False, '50-9'), (False, '57-9')],
-    [(False, '50-9'), (False, '56-9')],
-    [(False, '50-9'), (False, '55-9')],
-    [(False, '50-9'), (False, '54-9')],
-    [(False, '50-9'), (False, '53-9')],
-    [(True, '50-9'), (True, '51-9'), (True, '52-9'), (True, '53-9'), (True, '54-9'), (True, '55-9'), (True, '56-9'), (True, '57-9'), (True, '58-9')],
-    [(False, '65-9'), (False, '68-9')],
-    [(False, '65-9'), (False, '67-9')],
-    [(False, '65-9'), (False, '66-9')],
-    [(False, '64-9'), (False, '68-9')],
-    [(False, '64-9'), (False, '67-9')],
-    [(False, '64-9'), (False, '66-9')],
-    [(False, '63-9'), (False, '68-9')],
-    [(False, '63-9'), (False, '67-9')],
-    [(False, '63-9'), (False, '66-9')],
-    [(False, '62-9'), (False, '68-9')],
-    [(False, '62-9'), (False, '67-9')],
-    [(False, '62-9'), (False, '66-9')],
-    [(False, '62-9'), (False, '65-9')],
-    [(False, '62-9'), (False, '64-9')],
-    [(False, '62-9'), (False, '63-9')],
-    [(False, '61-9'), (False, '68-9')],
-    [(False, '61-9'), (False, '67-9')],
-    [(False, '61-9'), (False, '66-9')],
-    [(False, '61-9'), (False, '65-9')],
-    [(False, '61-9'), (False, '64-9')],
-    [(False, '61-9'), (False, '63-9')],
-    [(False, '60-9'), (False, '68-9')],
-    [(False, '60-9'), (False, '67-9')],
-    [(False, '60-9'), (False, '66-9')],
-    [(False, '60-9'), (False, '65-9')],
-    [(False, '60-9'), (False, '64-9')],
-    [(False, '60-9'), (False, '63-9')],
-    [(True, '60-9'), (True, '61-9'), (True, '62-9'), (True, '63-9'), (True, '64-9'), (True, '65-9'), (True, '66-9'), (True, '67-9'), (True, '68-9')],
-    [(False, '75-9'), (False, '78-9')],
-    [(False, '75-9'), (False, '77-9')],
-    [(False, '75-9'), (False, '76-9')],
-    [(False, '74-9'), (False, '78-9')],
-    [(False, '74-9'), (False, '77-9')],
-    [(False, '74-9'), (False, '76-9')],
-    [(False, '73-9'), (False, '78-9')],
-    [(False, '73-9'), (False, '77-9')],
-    [(False, '73-9'), (False, '76-9')],
-    [(False, '72-9'), (False, '78-9')],
-    [(False, '72-9'), (False, '77-9')],
-    [(False, '72-9'), (False, '76-9')],
-    [(False, '72-9'), (False, '75-9')],
-    [(False, '72-9'), (False, '74-9')],
-    [(False, '72-9'), (False, '73-9')],
-    [(False, '71-9'), (False, '78-9')],
-    [(False, '71-9'), (False, '77-9')],
-    [(False, '71-9'), (False, '76-9')],
-    [(False, '71-9'), (False, '75-9')],
-    [(False, '71-9'), (False, '74-9')],
-    [(False, '71-9'), (False, '73-9')],
-    [(False, '70-9'), (False, '78-9')],
-    [(False, '70-9'), (False, '77-9')],
-    [(False, '70-9'), (False, '76-9')],
-    [(False, '70-9'), (False, '75-9')],
-    [(False, '70-9'), (False, '74-9')],
-    [(False, '70-9'), (False, '73-9')],
-    [(True, '70-9'), (True, '71-9'), (True, '72-9'), (True, '73-9'), (True, '74-9'), (True, '75-9'), (True, '76-9'), (True, '77-9'), (True, '78-9')],
-    [(False, '85-9'), (False, '88-9')],
-    [(False, '85-9'), (False, '87-9')],
-    [(False, '85-9'), (False, '86-9')],
-    [(False, '84-9'), (False, '88-9')],
-    [(False, '84-9'), (False, '87-9')],
-    [(False, '84-9'), (False, '86-9')],
-    [(False, '83-9'), (False, '88-9')],
-    [(False, '83-9'), (False, '87-9')],
-    [(False, '83-9'), (False, '86-9')],
-    [(False, '82-9'), (False, '88-9')],
-    [(False, '82-9'), (False, '87-9')],
-    [(False, '82-9'), (False, '86-9')],
-    [(False, '82-9'), (False, '85-9')],
-    [(False, '82-9'), (False, '84-9')],
-    [(False, '82-9'), (False, '83-9')],
-    [(False, '81-9'), (False, '88-9')],
-    [(False, '81-9'), (False, '87-9')],
-    [(False, '81-9'), (False, '86-9')],
-    [(False, '81-9'), (False, '85-9')],
-    [(False, '81-9'), (False, '84-9')],
-    [(False, '81-9'), (False, '83-9')],
-    [(False, '80-9'), (False, '88-9')],
-    [(False, '80-9'), (False, '87-9')],
-    [(False, '80-9'), (False, '86-9')],
-    [(False, '80-9'), (False, '85-9')],
-    [(False, '80-9'), (False, '84-9')],
-    [(False, '80-9'), (False, '83-9')],
-    [(True, '80-9'), (True, '81-9'), (True, '82-9'), (True, '83-9'), (True, '84-9'), (True, '85-9'), (True, '86-9'), (True, '87-9'), (True, '88-9')],
-    [(False, '50-1'), (False, '80-1')],
-    [(False, '50-1'), (False, '70-1')],
-    [(False, '50-1'), (False, '60-1')],
-    [(False, '40-1'), (False, '80-1')],
-    [(False, '40-1'), (False, '70-1')],
-    [(False, '40-1'), (False, '60-1')],
-    [(False, '30-1'), (False, '80-1')],
-    [(False, '30-1'), (False, '70-1')],
-    [(False, '30-1'), (False, '60-1')],
-    [(False, '20-1'), (False, '80-1')],
-    [(False, '20-1'), (False, '70-1')],
-    [(False, '20-1'), (False, '60-1')],
-    [(False, '20-1'), (False, '50-1')],
-    [(False, '20-1'), (False, '40-1')],
-    [(False, '20-1'), (False, '30-1')],
-    [(False, '10-1'), (False, '80-1')],
-    [(False, '10-1'), (False, '70-1')],
-    [(False, '10-1'), (False, '60-1')],
-    [(False, '10-1'), (False, '50-1')],
-    [(False, '10-1'), (False, '40-1')],
-    [(False, '10-1'), (False, '30-1')],
-    [(False, '00-1'), (False, '80-1')],
-    [(False, '00-1'), (False, '70-1')],
-    [(False, '00-1'), (False, '60-1')],
-    [(False, '00-1'), (False, '50-1')],
-    [(False, '00-1'), (False, '40-1')],
-    [(False, '00-1'), (False, '30-1')],
-    [(True, '00-1'), (True, '10-1'), (True, '20-1'), (True, '30-1'), (True, '40-1'), (True, '50-1'), (True, '60-1'), (True, '70-1'), (True, '80-1')],
-    [(False, '51-1'), (False, '81-1')],
-    [(False, '51-1'), (False, '71-1')],
-    [(False, '51-1'), (False, '61-1')],
-    [(False, '41-1'), (False, '81-1')],
-    [(False, '41-1'), (False, '71-1')],
-    [(False, '41-1'), (False, '61-1')],
-    [(False, '31-1'), (False, '81-1')],
-    [(False, '31-1'), (False, '71-1')],
-    [(False, '31-1'), (False, '61-1')],
-    [(False, '21-1'), (False, '81-1')],
-    [(False, '21-1'), (False, '71-1')],
-    [(False, '21-1'), (False, '61-1')],
-    [(False, '21-1'), (False, '51-1')],
-    [(False, '21-1'), (False, '41-1')],
-    [(False, '21-1'), (False, '31-1')],
-    [(False, '11-1'), (False, '81-1')],
-    [(False, '11-1'), (False, '71-1')],
-    [(False, '11-1'), (False, '61-1')],
-    [(False, '11-1'), (False, '51-1')],
-    [(False, '11-1'), (False, '41-1')],
-    [(False, '11-1'), (False, '31-1')],
-    [(False, '01-1'), (False, '81-1')],
-    [(False, '01-1'), (False, '71-1')],
-    [(False, '01-1'), (False, '61-1')],
-    [(False, '01-1'), (False, '51-1')],
-    [(False, '01-1'), (False, '41-1')],
-    [(False, '01-1'), (False, '31-1')],
-    [(True, '01-1'), (True, '11-1'), (True, '21-1'), (True, '31-1'), (True, '41-1'), (True, '51-1'), (True, '61-1'), (True, '71-1'), (True, '81-1')],
-    [(False, '52-1'), (False, '82-1')],
-    [(False, '52-1'), (False, '72-1')],
-    [(False, '52-1'), (False, '62-1')],
-    [(False, '42-1'), (False, '82-1')],
-    [(False, '42-1'), (False, '72-1')],
-    [(False, '42-1'), (False, '62-1')],
-    [(False, '32-1'), (False, '82-1')],
-    [(False, '32-1'), (False, '72-1')],
-    [(False, '32-1'), (False, '62-1')],
-    [(False, '22-1'), (False, '82-1')],
-    [(False, '22-1'), (False, '72-1')],
-    [(False, '22-1'), (False, '62-1')],
-    [(False, '22-1'), (False, '52-1')],
-    [(False, '22-1'), (False, '42-1')],
-    [(False, '22-1'), (False, '32-1')],
-    [(False, '12-1'), (False, '82-1')],
-    [(False, '12-1'), (False, '72-1')],
-    [(False, '12-1'), (False, '62-1')],
-    [(False, '12-1'), (False, '52-1')],
-    [(False, '12-1'), (False, '42-1')],
-    [(False, '12-1'), (False, '32-1')],
-    [(False, '02-1'), (False, '82-1')],
-    [(False, '02-1'), (False, '72-1')],
-    [(False, '02-1'), (False, '62-1')],
-    [(False, '02-1'), (False, '52-1')],
-    [(False, '02-1'), (False, '42-1')],
-    [(False, '02-1'), (False, '32-1')],
-    [(True, '02-1'), (True, '12-1'), (True, '22-1'), (True, '32-1'), (True, '42-1'), (True, '52-1'), (True, '62-1'), (True, '72-1'), (True, '82-1')],
-    [(False, '53-1'), (False, '83-1')],
-    [(False, '53-1'), (False, '73-1')],
-    [(False, '53-1'), (False, '63-1')],
-    [(False, '43-1'), (False, '83-1')],
-    [(False, '43-1'), (False, '73-1')],
-    [(False, '43-1'), (False, '63-1')],
-    [(False, '33-1'), (False, '83-1')],
-    [(False, '33-1'), (False, '73-1')],
-    [(False, '33-1'), (False, '63-1')],
-    [(False, '23-1'), (False, '83-1')],
-    [(False, '23-1'), (False, '73-1')],
-    [(False, '23-1'), (False, '63-1')],
-    [(False, '23-1'), (False, '53-1')],
-    [(False, '23-1'), (False, '43-1')],
-    [(False, '23-1'), (False, '33-1')],
-    [(False, '13-1'), (False, '83-1')],
-    [(False, '13-1'), (False, '73-1')],
-    [(False, '13-1'), (False, '63-1')],
-    [(False, '13-1'), (False, '53-1')],
-    [(False, '13-1'), (False, '43-1')],
-    [(False, '13-1'), (False, '33-1')],
-    [(False, '03-1'), (False, '83-1')],
-    [(False, '03-1'), (False, '73-1')],
-    [(False, '03-1'), (False, '63-1')],
-    [(False, '03-1'), (False, '53-1')],
-    [(False, '03-1'), (False, '43-1')],
-    [(False, '03-1'), (False, '33-1')],
-    [(True, '03-1'), (True, '13-1'), (True, '23-1'), (True, '33-1'), (True, '43-1'), (True, '53-1'), (True, '63-1'), (True, '73-1'), (True, '83-1')],
-    [(False, '54-1'), (False, '84-1')],
-    [(False, '54-1'), (False, '74-1')],
-    [(False, '54-1'), (False, '64-1')],
-    [(False, '44-1'), (False, '84-1')],
-    [(False, '44-1'), (False, '74-1')],
-    [(False, '44-1'), (False, '64-1')],
-    [(False, '34-1'), (False, '84-1')],
-    [(False, '34-1'), (False, '74-1')],
-    [(False, '34-1'), (False, '64-1')],
-    [(False, '24-1'), (False, '84-1')],
-    [(False, '24-1'), (False, '74-1')],
-    [(False, '24-1'), (False, '64-1')],
-    [(False, '24-1'), (False, '54-1')],
-    [(False, '24-1'), (False, '44-1')],
-    [(False, '24-1'), (False, '34-1')],
-    [(False, '14-1'), (False, '84-1')],
-    [(False, '14-1'), (False, '74-1')],
-    [(False, '14-1'), (False, '64-1')],
-    [(False, '14-1'), (False, '54-1')],
-    [(False, '14-1'), (False, '44-1')],
-    [(False, '14-1'), (False, '34-1')],
-    [(False, '04-1'), (False, '84-1')],
-    [(False, '04-1'), (False, '74-1')],
-    [(False, '04-1'), (False, '64-1')],
-    [(False, '04-1'), (False, '54-1')],
-    [(False, '04-1'), (False, '44-1')],
-    [(False, '04-1'), (False, '34-1')],
-    [(True, '04-1'), (True, '14-1'), (True, '24-1'), (True, '34-1'), (True, '44-1'), (True, '54-1'), (True, '64-1'), (True, '74-1'), (True, '84-1')],
-    [(False, '55-1'), (False, '85-1')],
-    [(False, '55-1'), (False, '75-1')],
-    [(False, '55-1'), (False, '65-1')],
-    [(False, '45-1'), (False, '85-1')],
-    [(False, '45-1'), (False, '75-1')],
-    [(False, '45-1'), (False, '65-1')],
-    [(False, '35-1'), (False, '85-1')],
-    [(False, '35-1'), (False, '75-1')],
-    [(False, '35-1'), (False, '65-1')],
-    [(False, '25-1'), (False, '85-1')],
-    [(False, '25-1'), (False, '75-1')],
-    [(False, '25-1'), (False, '65-1')],
-    [(False, '25-1'), (False, '55-1')],
-    [(False, '25-1'), (False, '45-1')],
-    [(False, '25-1'), (False, '35-1')],
-    [(False, '15-1'), (False, '85-1')],
-    [(False, '15-1'), (False, '75-1')],
-    [(False, '15-1'), (False, '65-1')],
-    [(False, '15-1'), (False, '55-1')],
-    [(False, '15-1'), (False, '45-1')],
-    [(False, '15-1'), (False, '35-1')],
-    [(False, '05-1'), (False, '85-1')],
-    [(False, '05-1'), (False, '75-1')],
-    [(False, '05-1'), (False, '65-1')],
-    [(False, '05-1'), (False, '55-1')],
-    [(False, '05-1'), (False, '45-1')],
-    [(False, '05-1'), (False, '35-1')],
-    [(True, '05-1'), (True, '15-1'), (True, '25-1'), (True, '35-1'), (True, '45-1'), (True, '55-1'), (True, '65-1'), (True, '75-1'), (True, '85-1')],
-    [(False, '56-1'), (False, '86-1')],
-    [(False, '56-1'), (False, '76-1')],
-    [(False, '56-1'), (False, '66-1')],
-    [(False, '46-1'), (False, '86-1')],
-    [(False, '46-1'), (False, '76-1')],
-    [(False, '46-1'), (False, '66-1')],
-    [(False, '36-1'), (False, '86-1')],
-    [(False, '36-1'), (False, '76-1')],
-    [(False, '36-1'), (False, '66-1')],
-    [(False, '26-1'), (False, '86-1')],
-    [(False, '26-1'), (False, '76-1')],
-    [(False, '26-1'), (False, '66-1')],
-    [(False, '26-1'), (False, '56-1')],
-    [(False, '26-1'), (False, '46-1')],
-    [(False, '26-1'), (False, '36-1')],
-    [(False, '16-1'), (False, '86-1')],
-    [(False, '16-1'), (False, '76-1')],
-    [(False, '16-1'), (False, '66-1')],
-    [(False, '16-1'), (False, '56-1')],
-    [(False, '16-1'), (False, '46-1')],
-    [(False, '16-1'), (False, '36-1')],
-    [(False, '06-1'), (False, '86-1')],
-    [(False, '06-1'), (False, '76-1')],
-    [(False, '06-1'), (False, '66-1')],
-    [(False, '06-1'), (False, '56-1')],
-    [(False, '06-1'), (False, '46-1')],
-    [(False, '06-1'), (False, '36-1')],
-    [(True, '06-1'), (True, '16-1'), (True, '26-1'), (True, '36-1'), (True, '46-1'), (True, '56-1'), (True, '66-1'), (True, '76-1'), (True, '86-1')],
-    [(False, '57-1'), (False, '87-1')],
-    [(False, '57-1'), (False, '77-1')],
-    [(False, '57-1'), (False, '67-1')],
-    [(False, '47-1'), (False, '87-1')],
-    [(False, '47-1'), (False, '77-1')],
-    [(False, '47-1'), (False, '67-1')],
-    [(False, '37-1'), (False, '87-1')],
-    [(False, '37-1'), (False, '77-1')],
-    [(False, '37-1'), (False, '67-1')],
-    [(False, '27-1'), (False, '87-1')],
-    [(False, '27-1'), (False, '77-1')],
-    [(False, '27-1'), (False, '67-1')],
-    [(False, '27-1'), (False, '57-1')],
-    [(False, '27-1'), (False, '47-1')],
-    [(False, '27-1'), (False, '37-1')],
-    [(False, '17-1'), (False, '87-1')],
-    [(False, '17-1'), (False, '77-1')],
-    [(False, '17-1'), (False, '67-1')],
-    [(False, '17-1'), (False, '57-1')],
-    [(False, '17-1'), (False, '47-1')],
-    [(False, '17-1'), (False, '37-1')],
-    [(False, '07-1'), (False, '87-1')],
-    [(False, '07-1'), (False, '77-1')],
-    [(False, '07-1'), (False, '67-1')],
-    [(False, '07-1'), (False, '57-1')],
-    [(False, '07-1'), (False, '47-1')],
-    [(False, '07-1'), (False, '37-1')],
-    [(True, '07-1'), (True, '17-1'), (True, '27-1'), (True, '37-1'), (True, '47-1'), (True, '57-1'), (True, '67-1'), (True, '77-1'), (True, '87-1')],
-    [(False, '58-1'), (False, '88-1')],
-    [(False, '58-1'), (False, '78-1')],
-    [(False, '58-1'), (False, '68-1')],
-    [(False, '48-1'), (False, '88-1')],
-    [(False, '48-1'), (False, '78-1')],
-    [(False, '48-1'), (False, '68-1')],
-    [(False, '38-1'), (False, '88-1')],
-    [(False, '38-1'), (False, '78-1')],
-    [(False, '38-1'), (False, '68-1')],
-    [(False, '28-1'), (False, '88-1')],
-    [(False, '28-1'), (False, '78-1')],
-    [(False, '28-1'), (False, '68-1')],
-    [(False, '28-1'), (False, '58-1')],
-    [(False, '28-1'), (False, '48-1')],
-    [(False, '28-1'), (False, '38-1')],
-    [(False, '18-1'), (False, '88-1')],
-    [(False, '18-1'), (False, '78-1')],
-    [(False, '18-1'), (False, '68-1')],
-    [(False, '18-1'), (False, '58-1')],
-    [(False, '18-1'), (False, '48-1')],
-    [(False, '18-1'), (False, '38-1')],
-    [(False, '08-1'), (False, '88-1')],
-    [(False, '08-1'), (False, '78-1')],
-    [(False, '08-1'), (False, '68-1')],
-    [(False, '08-1'), (False, '58-1')],
-    [(False, '08-1'), (False, '48-1')],
-    [(False, '08-1'), (False, '38-1')],
-    [(True, '08-1'), (True, '18-1'), (True, '28-1'), (True, '38-1'), (True, '48-1'), (True, '58-1'), (True, '68-1'), (True, '78-1'), (True, '88-1')],
-    [(False, '50-2'), (False, '80-2')],
-    [(False, '50-2'), (False, '70-2')],
-    [(False, '50-2'), (False, '60-2')],
-    [(False, '40-2'), (False, '80-2')],
-    [(False, '40-2'), (False, '70-2')],
-    [(False, '40-2'), (False, '60-2')],
-    [(False, '30-2'), (False, '80-2')],
-    [(False, '30-2'), (False, '70-2')],
-    [(False, '30-2'), (False, '60-2')],
-    [(False, '20-2'), (False, '80-2')],
-    [(False, '20-2'), (False, '70-2')],
-    [(False, '20-2'), (False, '60-2')],
-    [(False, '20-2'), (False, '50-2')],
-    [(False, '20-2'), (False, '40-2')],
-    [(False, '20-2'), (False, '30-2')],
-    [(False, '10-2'), (False, '80-2')],
-    [(False, '10-2'), (False, '70-2')],
-    [(False, '10-2'), (False, '60-2')],
-    [(False, '10-2'), (False, '50-2')],
-    [(False, '10-2'), (False, '40-2')],
-    [(False, '10-2'), (False, '30-2')],
-    [(False, '00-2'), (False, '80-2')],
-    [(False, '00-2'), (False, '70-2')],
-    [(False, '00-2'), (False, '60-2')],
-    [(False, '00-2'), (False, '50-2')],
-    [(False, '00-2'), (False, '40-2')],
-    [(False, '00-2'), (False, '30-2')],
-    [(True, '00-2'), (True, '10-2'), (True, '20-2'), (True, '30-2'), (True, '40-2'), (True, '50-2'), (True, '60-2'), (True, '70-2'), (True, '80-2')],
-    [(False, '51-2'), (False, '81-2')],
-    [(False, '51-2'), (False, '71-2')],
-    [(False, '51-2'), (False, '61-2')],
-    [(False, '41-2'), (False, '81-2')],
-    [(False, '41-2'), (False, '71-2')],
-    [(False, '41-2'), (False, '61-2')],
-    [(False, '31-2'), (False, '81-2')],
-    [(False, '31-2'), (False, '71-2')],
-    [(False, '31-2'), (False, '61-2')],
-    [(False, '21-2'), (False, '81-2')],
-    [(False, '21-2'), (False, '71-2')],
-    [(False, '21-2'), (False, '61-2')],
-    [(False, '21-2'), (False, '51-2')],
-    [(False, '21-2'), (False, '41-2')],
-    [(False, '21-2'), (False, '31-2')],
-    [(False, '11-2'), (False, '81-2')],
-    [(False, '11-2'), (False, '71-2')],
-    [(False, '11-2'), (False, '61-2')],
-    [(False, '11-2'), (False, '51-2')],
-    [(False, '11-2'), (False, '41-2')],
-    [(False, '11-2'), (False, '31-2')],
-    [(False, '01-2'), (False, '81-2')],
-    [(False, '01-2'), (False, '71-2')],
-    [(False, '01-2'), (False, '61-2')],
-    [(False, '01-2'), (False, '51-2')],
-    [(False, '01-2'), (False, '41-2')],
-    [(False, '01-2'), (False, '31-2')],
-    [(True, '01-2'), (True, '11-2'), (True, '21-2'), (True, '31-2'), (True, '41-2'), (True, '51-2'), (True, '61-2'), (True, '71-2'), (True, '81-2')],
-    [(False, '52-2'), (False, '82-2')],
-    [(False, '52-2'), (False, '72-2')],
-    [(False, '52-2'), (False, '62-2')],
-    [(False, '42-2'), (False, '82-2')],
-    [(False, '42-2'), (False, '72-2')],
-    [(False, '42-2'), (False, '62-2')],
-    [(False, '32-2'), (False, '82-2')],
-    [(False, '32-2'), (False, '72-2')],
-    [(False, '32-2'), (False, '62-2')],
-    [(False, '22-2'), (False, '82-2')],
-    [(False, '22-2'), (False, '72-2')],
-    [(False, '22-2'), (False, '62-2')],
-    [(False, '22-2'), (False, '52-2')],
-    [(False, '22-2'), (False, '42-2')],
-    [(False, '22-2'), (False, '32-2')],
-    [(False, '12-2'), (False, '82-2')],
-    [(False, '12-2'), (False, '72-2')],
-    [(False, '12-2'), (False, '62-2')],
-    [(False, '12-2'), (False, '52-2')],
-    [(False, '12-2'), (False, '42-2')],
-    [(False, '12-2'), (False, '32-2')],
-    [(False, '02-2'), (False, '82-2')],
-    [(False, '02-2'), (False, '72-2')],
-    [(False, '02-2'), (False, '62-2')],
-    [(False, '02-2'), (False, '52-2')],
-    [(False, '02-2'), (False, '42-2')],
-    [(False, '02-2'), (False, '32-2')],
-    [(True, '02-2'), (True, '12-2'), (True, '22-2'), (True, '32-2'), (True, '42-2'), (True, '52-2'), (True, '62-2'), (True, '72-2'), (True, '82-2')],
-    [(False, '53-2'), (False, '83-2')],
-    [(False, '53-2'), (False, '73-2')],
-    [(False, '53-2'), (False, '63-2')],
-    [(False, '43-2'), (False, '83-2')],
-    [(False, '43-2'), (False, '73-2')],
-    [(False, '43-2'), (False, '63-2')],
-    [(False, '33-2'), (False, '83-2')],
-    [(False, '33-2'), (False, '73-2')],
-    [(False, '33-2'), (False, '63-2')],
-    [(False, '23-2'), (False, '83-2')],
-    [(False, '23-2'), (False, '73-2')],
-    [(False, '23-2'), (False, '63-2')],
-    [(False, '23-2'), (False, '53-2')],
-    [(False, '23-2'), (False, '43-2')],
-    [(False, '23-2'), (False, '33-2')],
-    [(False, '13-2'), (False, '83-2')],
-    [(False, '13-2'), (False, '73-2')],
-    [(False, '13-2'), (False, '63-2')],
-    [(False, '13-2'), (False, '53-2')],
-    [(False, '13-2'), (False, '43-2')],
-    [(False, '13-2'), (False, '33-2')],
-    [(False, '03-2'), (False, '83-2')],
-    [(False, '03-2'), (False, '73-2')],
-    [(False, '03-2'), (False, '63-2')],
-    [(False, '03-2'), (False, '53-2')],
-    [(False, '03-2'), (False, '43-2')],
-    [(False, '03-2'), (False, '33-2')],
-    [(True, '03-2'), (True, '13-2'), (True, '23-2'), (True, '33-2'), (True, '43-2'), (True, '53-2'), (True, '63-2'), (True, '73-2'), (True, '83-2')],
-    [(False, '54-2'), (False, '84-2')],
-    [(False, '54-2'), (False, '74-2')],
-    [(False, '54-2'), (False, '64-2')],
-    [(False, '44-2'), (False, '84-2')],
-    [(False, '44-2'), (False, '74-2')],
-    [(False, '44-2'), (False, '64-2')],
-    [(False, '34-2'), (False, '84-2')],
-    [(False, '34-2'), (False, '74-2')],
-    [(False, '34-2'), (False, '64-2')],
-    [(False, '24-2'), (False, '84-2')],
-    [(False, '24-2'), (False, '74-2')],
-    [(False, '24-2'), (False, '64-2')],
-    [(False, '24-2'), (False, '54-2')],
-    [(False, '24-2'), (False, '44-2')],
-    [(False, '24-2'), (False, '34-2')],
-    [(False, '14-2'), (False, '84-2')],
-    [(False, '14-2'), (False, '74-2')],
-    [(False, '14-2'), (False, '64-2')],
-    [(False, '14-2'), (False, '54-2')],
-    [(False, '14-2'), (False, '44-2')],
-    [(False, '14-2'), (False, '34-2')],
-    [(False, '04-2'), (False, '84-2')],
-    [(False, '04-2'), (False, '74-2')],
-    [(False, '04-2'), (False, '64-2')],
-    [(False, '04-2'), (False, '54-2')],
-    [(False, '04-2'), (False, '44-2')],
-    [(False, '04-2'), (False, '34-2')],
-    [(True, '04-2'), (True, '14-2'), (True, '24-2'), (True, '34-2'), (True, '44-2'), (True, '54-2'), (True, '64-2'), (True, '74-2'), (True, '84-2')],
-    [(False, '55-2'), (False, '85-2')],
-    [(False, '55-2'), (False, '75-2')],
-    [(False, '55-2'), (False, '65-2')],
-    [(False, '45-2'), (False, '85-2')],
-    [(False, '45-2'), (False, '75-2')],
-    [(False, '45-2'), (False, '65-2')],
-    [(False, '35-2'), (False, '85-2')],
-    [(False, '35-2'), (False, '75-2')],
-    [(False, '35-2'), (False, '65-2')],
-    [(False, '25-2'), (False, '85-2')],
-    [(False, '25-2'), (False, '75-2')],
-    [(False, '25-2'), (False, '65-2')],
-    [(False, '25-2'), (False, '55-2')],
-    [(False, '25-2'), (False, '45-2')],
-    [(False, '25-2'), (False, '35-2')],
-    [(False, '15-2'), (False, '85-2')],
-    [(False, '15-2'), (False, '75-2')],
-    [(False, '15-2'), (False, '65-2')],
-    [(False, '15-2'), (False, '55-2')],
-    [(False, '15-2'), (False, '45-2')],
-    [(False, '15-2'), (False, '35-2')],
-    [(False, '05-2'), (False, '85-2')],
-    [(False, '05-2'), (False, '75-2')],
-    [(False, '05-2'), (False, '65-2')],
-    [(False, '05-2'), (False, '55-2')],
-    [(False, '05-2'), (False, '45-2')],
-    [(False, '05-2'), (False, '35-2')],
-    [(True, '05-2'), (True, '15-2'), (True, '25-2'), (True, '35-2'), (True, '45-2'), (True, '55-2'), (True, '65-2'), (True, '75-2'), (True, '85-2')],
-    [(False, '56-2'), (False, '86-2')],
-    [(False, '56-2'), (False, '76-2')],
-    [(False, '56-2'), (False, '66-2')],
-    [(False, '46-2'), (False, '86-2')],
-    [(False, '46-2'), (False, '76-2')],
-    [(False, '46-2'), (False, '66-2')],
-    [(False, '36-2'), (False, '86-2')],
-    [(False, '36-2'), (False, '76-2')],
-    [(False, '36-2'), (False, '66-2')],
-    [(False, '26-2'), (False, '86-2')],
-    [(False, '26-2'), (False, '76-2')],
-    [(False, '26-2'), (False, '66-2')],
-    [(False, '26-2'), (False, '56-2')],
-    [(False, '26-2'), (False, '46-2')],
-    [(False, '26-2'), (False, '36-2')],
-    [(False, '16-2'), (False, '86-2')],
-    [(False, '16-2'), (False, '76-2')],
-    [(False, '16-2'), (False, '66-2')],
-    [(False, '16-2'), (False, '56-2')],
-    [(False, '16-2'), (False, '46-2')],
-    [(False, '16-2'), (False, '36-2')],
-    [(False, '06-2'), (False, '86-2')],
-    [(False, '06-2'), (False, '76-2')],
-    [(False, '06-2'), (False, '66-2')],
-    [(False, '06-2'), (False, '56-2')],
-    [(False, '06-2'), (False, '46-2')],
-    [(False, '06-2'), (False, '36-2')],
-    [(True, '06-2'), (True, '16-2'), (True, '26-2'), (True, '36-2'), (True, '46-2'), (True, '56-2'), (True, '66-2'), (True, '76-2'), (True, '86-2')],
-    [(False, '57-2'), (False, '87-2')],
-    [(False, '57-2'), (False, '77-2')],
-    [(False, '57-2'), (False, '67-2')],
-    [(False, '47-2'), (False, '87-2')],
-    [(False, '47-2'), (False, '77-2')],
-    [(False, '47-2'), (False, '67-2')],
-    [(False, '37-2'), (False, '87-2')],
-    [(False, '37-2'), (False, '77-2')],
-    [(False, '37-2'), (False, '67-2')],
-    [(False, '27-2'), (False, '87-2')],
-    [(False, '27-2'), (False, '77-2')],
-    [(False, '27-2'), (False, '67-2')],
-    [(False, '27-2'), (False, '57-2')],
-    [(False, '27-2'), (False, '47-2')],
-    [(False, '27-2'), (False, '37-2')],
-    [(False, '17-2'), (False, '87-2')],
-    [(False, '17-2'), (False, '77-2')],
-    [(False, '17-2'), (False, '67-2')],
-    [(False, '17-2'), (False, '57-2')],
-    [(False, '17-2'), (False, '47-2')],
-    [(False, '17-2'), (False, '37-2')],
-    [(False, '07-2'), (False, '87-2')],
-    [(False, '07-2'), (False, '77-2')],
-    [(False, '07-2'), (False, '67-2')],
-    [(False, '07-2'), (False, '57-2')],
-    [(False, '07-2'), (False, '47-2')],
-    [(False, '07-2'), (False, '37-2')],
-    [(True, '07-2'), (True, '17-2'), (True, '27-2'), (True, '37-2'), (True, '47-2'), (True, '57-2'), (True, '67-2'), (True, '77-2'), (True, '87-2')],
-    [(False, '58-2'), (False, '88-2')],
-    [(False, '58-2'), (False, '78-2')],
-    [(False, '58-2'), (False, '68-2')],
-    [(False, '48-2'), (False, '88-2')],
-    [(False, '48-2'), (False, '78-2')],
-    [(False, '48-2'), (False, '68-2')],
-    [(False, '38-2'), (False, '88-2')],
-    [(False, '38-2'), (False, '78-2')],
-    [(False, '38-2'), (False, '68-2')],
-    [(False, '28-2'), (False, '88-2')],
-    [(False, '28-2'), (False, '78-2')],
-    [(False, '28-2'), (False, '68-2')],
-    [(False, '28-2'), (False, '58-2')],
-    [(False, '28-2'), (False, '48-2')],
-    [(False, '28-2'), (False, '38-2')],
-    [(False, '18-2'), (False, '88-2')],
-    [(False, '18-2'), (False, '78-2')],
-    [(False, '18-2'), (False, '68-2')],
-    [(False, '18-2'), (False, '58-2')],
-    [(False, '18-2'), (False, '48-2')],
-    [(False, '18-2'), (False, '38-2')],
-    [(False, '08-2'), (False, '88-2')],
-    [(False, '08-2'), (False, '78-2')],
-    [(False, '08-2'), (False, '68-2')],
-    [(False, '08-2'), (False, '58-2')],
-    [(False, '08-2'), (False, '48-2')],
-    [(False, '08-2'), (False, '38-2')],
-    [(True, '08-2'), (True, '18-2'), (True, '28-2'), (True, '38-2'), (True, '48-2'), (True, '58-2'), (True, '68-2'), (True, '78-2'), (True, '88-2')],
-    [(False, '50-3'), (False, '80-3')],
-    [(False, '50-3'), (False, '70-3')],
-    [(False, '50-3'), (False, '60-3')],
-    [(False, '40-3'), (False, '80-3')],
-    [(False, '40-3'), (False, '70-3')],
-    [(False, '40-3'), (False, '60-3')],
-    [(False, '30-3'), (False, '80-3')],
-    [(False, '30-3'), (False, '70-3')],
-    [(False, '30-3'), (False, '60-3')],
-    [(False, '20-3'), (False, '80-3')],
-    [(False, '20-3'), (False, '70-3')],
-    [(False, '20-3'), (False, '60-3')],
-    [(False, '20-3'), (False, '50-3')],
-    [(False, '20-3'), (False, '40-3')],
-    [(False, '20-3'), (False, '30-3')],
-    [(False, '10-3'), (False, '80-3')],
-    [(False, '10-3'), (False, '70-3')],
-    [(False, '10-3'), (False, '60-3')],
-    [(False, '10-3'), (False, '50-3')],
-    [(False, '10-3'), (False, '40-3')],
-    [(False, '10-3'), (False, '30-3')],
-    [(False, '00-3'), (False, '80-3')],
-    [(False, '00-3'), (False, '70-3')],
-    [(False, '00-3'), (False, '60-3')],
-    [(False, '00-3'), (False, '50-3')],
-    [(False, '00-3'), (False, '40-3')],
-    [(False, '00-3'), (False, '30-3')],
-    [(True, '00-3'), (True, '10-3'), (True, '20-3'), (True, '30-3'), (True, '40-3'), (True, '50-3'), (True, '60-3'), (True, '70-3'), (True, '80-3')],
-    [(False, '51-3'), (False, '81-3')],
-    [(False, '51-3'), (False, '71-3')],
-    [(False, '51-3'), (False, '61-3')],
-    [(False, '41-3'), (False, '81-3')],
-    [(False, '41-3'), (False, '71-3')],
-    [(False, '41-3'), (False, '61-3')],
-    [(False, '31-3'), (False, '81-3')],
-    [(False, '31-3'), (False, '71-3')],
-    [(False, '31-3'), (False, '61-3')],
-    [(False, '21-3'), (False, '81-3')],
-    [(False, '21-3'), (False, '71-3')],
-    [(False, '21-3'), (False, '61-3')],
-    [(False, '21-3'), (False, '51-3')],
-    [(False, '21-3'), (False, '41-3')],
-    [(False, '21-3'), (False, '31-3')],
-    [(False, '11-3'), (False, '81-3')],
-    [(False, '11-3'), (False, '71-3')],
-    [(False, '11-3'), (False, '61-3')],
-    [(False, '11-3'), (False, '51-3')],
-    [(False, '11-3'), (False, '41-3')],
-    [(False, '11-3'), (False, '31-3')],
-    [(False, '01-3'), (False, '81-3')],
-    [(False, '01-3'), (False, '71-3')],
-    [(False, '01-3'), (False, '61-3')],
-    [(False, '01-3'), (False, '51-3')],
-    [(False, '01-3'), (False, '41-3')],
-    [(False, '01-3'), (False, '31-3')],
-    [(True, '01-3'), (True, '11-3'), (True, '21-3'), (True, '31-3'), (True, '41-3'), (True, '51-3'), (True, '61-3'), (True, '71-3'), (True, '81-3')],
-    [(False, '52-3'), (False, '82-3')],
-    [(False, '52-3'), (False, '72-3')],
-    [(False, '52-3'), (False, '62-3')],
-    [(False, '42-3'), (False, '82-3')],
-    [(False, '42-3'), (False, '72-3')],
-    [(False, '42-3'), (False, '62-3')],
-    [(False, '32-3'), (False, '82-3')],
-    [(False, '32-3'), (False, '72-3')],
-    [(False, '32-3'), (False, '62-3')],
-    [(False, '22-3'), (False, '82-3')],
-    [(False, '22-3'), (False, '72-3')],
-    [(False, '22-3'), (False, '62-3')],
-    [(False, '22-3'), (False, '52-3')],
-    [(False, '22-3'), (False, '42-3')],
-    [(False, '22-3'), (False, '32-3')],
-    [(False, '12-3'), (False, '82-3')],
-    [(False, '12-3'), (False, '72-3')],
-    [(False, '12-3'), (False, '62-3')],
-    [(False, '12-3'), (False, '52-3')],
-    [(False, '12-3'), (False, '42-3')],
-    [(False, '12-3'), (False, '32-3')],
-    [(False, '02-3'), (False, '82-3')],
-    [(False, '02-3'), (False, '72-3')],
-    [(False, '02-3'), (False, '62-3')],
-    [(False, '02-3'), (False, '52-3')],
-    [(False, '02-3'), (False, '42-3')],
-    [(False, '02-3'), (False, '32-3')],
-    [(True, '02-3'), (True, '12-3'), (True, '22-3'), (True, '32-3'), (True, '42-3'), (True, '52-3'), (True, '62-3'), (True, '72-3'), (True, '82-3')],
-    [(False, '53-3'), (False, '83-3')],
-    [(False, '53-3'), (False, '73-3')],
-    [(False, '53-3'), (False, '63-3')],
-    [(False, '43-3'), (False, '83-3')],
-    [(False, '43-3'), (False, '73-3')],
-    [(False, '43-3'), (False, '63-3')],
-    [(False, '33-3'), (False, '83-3')],
-    [(False, '33-3'), (False, '73-3')],
-    [(False, '33-3'), (False, '63-3')],
-    [(False, '23-3'), (False, '83-3')],
-    [(False, '23-3'), (False, '73-3')],
-    [(False, '23-3'), (False, '63-3')],
-    [(False, '23-3'), (False, '53-3')],
-    [(False, '23-3'), (False, '43-3')],
-    [(False, '23-3'), (False, '33-3')],
-    [(False, '13-3'), (False, '83-3')],
-    [(False, '13-3'), (False, '73-3')],
-    [(False, '13-3'), (False, '63-3')],
-    [(False, '13-3'), (False, '53-3')],
-    [(False, '13-3'), (False, '43-3')],
-    [(False, '13-3'), (False, '33-3')],
-    [(False, '03-3'), (False, '83-3')],
-    [(False, '03-3'), (False, '73-3')],
-    [(False, '03-3'), (False, '63-3')],
-    [(False, '03-3'), (False, '53-3')],
-    [(False, '03-3'), (False, '43-3')],
-    [(False, '03-3'), (False, '33-3')],
-    [(True, '03-3'), (True, '13-3'), (True, '23-3'), (True, '33-3'), (True, '43-3'), (True, '53-3'), (True, '63-3'), (True, '73-3'), (True, '83-3')],
-    [(False, '54-3'), (False, '84-3')],
-    [(False, '54-3'), (False, '74-3')],
-    [(False, '54-3'), (False, '64-3')],
-    [(False, '44-3'), (False, '84-3')],
-    [(False, '44-3'), (False, '74-3')],
-    [(False, '44-3'), (False, '64-3')],
-    [(False, '34-3'), (False, '84-3')],
-    [(False, '34-3'), (False, '74-3')],
-    [(False, '34-3'), (False, '64-3')],
-    [(False, '24-3'), (False, '84-3')],
-    [(False, '24-3'), (False, '74-3')],
-    [(False, '24-3'), (False, '64-3')],
-    [(False, '24-3'), (False, '54-3')],
-    [(False, '24-3'), (False, '44-3')],
-    [(False, '24-3'), (False, '34-3')],
-    [(False, '14-3'), (False, '84-3')],
-    [(False, '14-3'), (False, '74-3')],
-    [(False, '14-3'), (False, '64-3')],
-    [(False, '14-3'), (False, '54-3')],
-    [(False, '14-3'), (False, '44-3')],
-    [(False, '14-3'), (False, '34-3')],
-    [(False, '04-3'), (False, '84-3')],
-    [(False, '04-3'), (False, '74-3')],
-    [(False, '04-3'), (False, '64-3')],
-    [(False, '04-3'), (False, '54-3')],
-    [(False, '04-3'), (False, '44-3')],
-    [(False, '04-3'), (False, '34-3')],
-    [(True, '04-3'), (True, '14-3'), (True, '24-3'), (True, '34-3'), (True, '44-3'), (True, '54-3'), (True, '64-3'), (True, '74-3'), (True, '84-3')],
-    [(False, '55-3'), (False, '85-3')],
-    [(False, '55-3'), (False, '75-3')],
-    [(False, '55-3'), (False, '65-3')],
-    [(False, '45-3'), (False, '85-3')],
-    [(False, '45-3'), (False, '75-3')],
-    [(False, '45-3'), (False, '65-3')],
-    [(False, '35-3'), (False, '85-3')],
-    [(False, '35-3'), (False, '75-3')],
-    [(False, '35-3'), (False, '65-3')],
-    [(False, '25-3'), (False, '85-3')],
-    [(False, '25-3'), (False, '75-3')],
-    [(False, '25-3'), (False, '65-3')],
-    [(False, '25-3'), (False, '55-3')],
-    [(False, '25-3'), (False, '45-3')],
-    [(False, '25-3'), (False, '35-3')],
-    [(False, '15-3'), (False, '85-3')],
-    [(False, '15-3'), (False, '75-3')],
-    [(False, '15-3'), (False, '65-3')],
-    [(False, '15-3'), (False, '55-3')],
-    [(False, '15-3'), (False, '45-3')],
-    [(False, '15-3'), (False, '35-3')],
-    [(False, '05-3'), (False, '85-3')],
-    [(False, '05-3'), (False, '75-3')],
-    [(False, '05-3'), (False, '65-3')],
-    [(False, '05-3'), (False, '55-3')],
-    [(False, '05-3'), (False, '45-3')],
-    [(False, '05-3'), (False, '35-3')],
-    [(True, '05-3'), (True, '15-3'), (True, '25-3'), (True, '35-3'), (True, '45-3'), (True, '55-3'), (True, '65-3'), (True, '75-3'), (True, '85-3')],
-    [(False, '56-3'), (False, '86-3')],
-    [(False, '56-3'), (False, '76-3')],
-    [(False, '56-3'), (False, '66-3')],
-    [(False, '46-3'), (False, '86-3')],
-    [(False, '46-3'), (False, '76-3')],
-    [(False, '46-3'), (False, '66-3')],
-    [(False, '36-3'), (False, '86-3')],
-    [(False, '36-3'), (False, '76-3')],
-    [(False, '36-3'), (False, '66-3')],
-    [(False, '26-3'), (False, '86-3')],
-    [(False, '26-3'), (False, '76-3')],
-    [(False, '26-3'), (False, '66-3')],
-    [(False, '26-3'), (False, '56-3')],
-    [(False, '26-3'), (False, '46-3')],
-    [(False, '26-3'), (False, '36-3')],
-    [(False, '16-3'), (False, '86-3')],
-    [(False, '16-3'), (False, '76-3')],
-    [(False, '16-3'), (False, '66-3')],
-    [(False, '16-3'), (False, '56-3')],
-    [(False, '16-3'), (False, '46-3')],
-    [(False, '16-3'), (False, '36-3')],
-    [(False, '06-3'), (False, '86-3')],
-    [(False, '06-3'), (False, '76-3')],
-    [(False, '06-3'), (False, '66-3')],
-    [(False, '06-3'), (False, '56-3')],
-    [(False, '06-3'), (False, '46-3')],
-    [(False, '06-3'), (False, '36-3')],
-    [(True, '06-3'), (True, '16-3'), (True, '26-3'), (True, '36-3'), (True, '46-3'), (True, '56-3'), (True, '66-3'), (True, '76-3'), (True, '86-3')],
-    [(False, '57-3'), (False, '87-3')],
-    [(False, '57-3'), (False, '77-3')],
-    [(False, '57-3'), (False, '67-3')],
-    [(False, '47-3'), (False, '87-3')],
-    [(False, '47-3'), (False, '77-3')],
-    [(False, '47-3'), (False, '67-3')],
-    [(False, '37-3'), (False, '87-3')],
-    [(False, '37-3'), (False, '77-3')],
-    [(False, '37-3'), (False, '67-3')],
-    [(False, '27-3'), (False, '87-3')],
-    [(False, '27-3'), (False, '77-3')],
-    [(False, '27-3'), (False, '67-3')],
-    [(False, '27-3'), (False, '57-3')],
-    [(False, '27-3'), (False, '47-3')],
-    [(False, '27-3'), (False, '37-3')],
-    [(False, '17-3'), (False, '87-3')],
-    [(False, '17-3'), (False, '77-3')],
-    [(False, '17-3'), (False, '67-3')],
-    [(False, '17-3'), (False, '57-3')],
-    [(False, '17-3'), (False, '47-3')],
-    [(False, '17-3'), (False, '37-3')],
-    [(False, '07-3'), (False, '87-3')],
-    [(False, '07-3'), (False, '77-3')],
-    [(False, '07-3'), (False, '67-3')],
-    [(False, '07-3'), (False, '57-3')],
-    [(False, '07-3'), (False, '47-3')],
-    [(False, '07-3'), (False, '37-3')],
-    [(True, '07-3'), (True, '17-3'), (True, '27-3'), (True, '37-3'), (True, '47-3'), (True, '57-3'), (True, '67-3'), (True, '77-3'), (True, '87-3')],
-    [(False, '58-3'), (False, '88-3')],
-    [(False, '58-3'), (False, '78-3')],
-    [(False, '58-3'), (False, '68-3')],
-    [(False, '48-3'), (False, '88-3')],
-    [(False, '48-3'), (False, '78-3')],
-    [(False, '48-3'), (False, '68-3')],
-    [(False, '38-3'), (False, '88-3')],
-    [(False, '38-3'), (False, '78-3')],
-    [(False, '38-3'), (False, '68-3')],
-    [(False, '28-3'), (False, '88-3')],
-    [(False, '28-3'), (False, '78-3')],
-    [(False, '28-3'), (False, '68-3')],
-    [(False, '28-3'), (False, '58-3')],
-    [(False, '28-3'), (False, '48-3')],
-    [(False, '28-3'), (False, '38-3')],
-    [(False, '18-3'), (False, '88-3')],
-    [(False, '18-3'), (False, '78-3')],
-    [(False, '18-3'), (False, '68-3')],
-    [(False, '18-3'), (False, '58-3')],
-    [(False, '18-3'), (False, '48-3')],
-    [(False, '18-3'), (False, '38-3')],
-    [(False, '08-3'), (False, '88-3')],
-    [(False, '08-3'), (False, '78-3')],
-    [(False, '08-3'), (False, '68-3')],
-    [(False, '08-3'), (False, '58-3')],
-    [(False, '08-3'), (False, '48-3')],
-    [(False, '08-3'), (False, '38-3')],
-    [(True, '08-3'), (True, '18-3'), (True, '28-3'), (True, '38-3'), (True, '48-3'), (True, '58-3'), (True, '68-3'), (True, '78-3'), (True, '88-3')],
-    [(False, '50-4'), (False, '80-4')],
-    [(False, '50-4'), (False, '70-4')],
-    [(False, '50-4'), (False, '60-4')],
-    [(False, '40-4'), (False, '80-4')],
-    [(False, '40-4'), (False, '70-4')],
-    [(False, '40-4'), (False, '60-4')],
-    [(False, '30-4'), (False, '80-4')],
-    [(False, '30-4'), (False, '70-4')],
-    [(False, '30-4'), (False, '60-4')],
-    [(False, '20-4'), (False, '80-4')],
-    [(False, '20-4'), (False, '70-4')],
-    [(False, '20-4'), (False, '60-4')],
-    [(False, '20-4'), (False, '50-4')],
-    [(False, '20-4'), (False, '40-4')],
-    [(False, '20-4'), (False, '30-4')],
-    [(False, '10-4'), (False, '80-4')],
-    [(False, '10-4'), (False, '70-4')],
-    [(False, '10-4'), (False, '60-4')],
-    [(False, '10-4'), (False, '50-4')],
-    [(False, '10-4'), (False, '40-4')],
-    [(False, '10-4'), (False, '30-4')],
-    [(False, '00-4'), (False, '80-4')],
-    [(False, '00-4'), (False, '70-4')],
-    [(False, '00-4'), (False, '60-4')],
-    [(False, '00-4'), (False, '50-4')],
-    [(False, '00-4'), (False, '40-4')],
-    [(False, '00-4'), (False, '30-4')],
-    [(True, '00-4'), (True, '10-4'), (True, '20-4'), (True, '30-4'), (True, '40-4'), (True, '50-4'), (True, '60-4'), (True, '70-4'), (True, '80-4')],
-    [(False, '51-4'), (False, '81-4')],
-    [(False, '51-4'), (False, '71-4')],
-    [(False, '51-4'), (False, '61-4')],
-    [(False, '41-4'), (False, '81-4')],
-    [(False, '41-4'), (False, '71-4')],
-    [(False, '41-4'), (False, '61-4')],
-    [(False, '31-4'), (False, '81-4')],
-    [(False, '31-4'), (False, '71-4')],
-    [(False, '31-4'), (False, '61-4')],
-    [(False, '21-4'), (False, '81-4')],
-    [(False, '21-4'), (False, '71-4')],
-    [(False, '21-4'), (False, '61-4')],
-    [(False, '21-4'), (False, '51-4')],
-    [(False, '21-4'), (False, '41-4')],
-    [(False, '21-4'), (False, '31-4')],
-    [(False, '11-4'), (False, '81-4')],
-    [(False, '11-4'), (False, '71-4')],
-    [(False, '11-4'), (False, '61-4')],
-    [(False, '11-4'), (False, '51-4')],
-    [(False, '11-4'), (False, '41-4')],
-    [(False, '11-4'), (False, '31-4')],
-    [(False, '01-4'), (False, '81-4')],
-    [(False, '01-4'), (False, '71-4')],
-    [(False, '01-4'), (False, '61-4')],
-    [(False, '01-4'), (False, '51-4')],
-    [(False, '01-4'), (False, '41-4')],
-    [(False, '01-4'), (False, '31-4')],
-    [(True, '01-4'), (True, '11-4'), (True, '21-4'), (True, '31-4'), (True, '41-4'), (True, '51-4'), (True, '61-4'), (True, '71-4'), (True, '81-4')],
-    [(False, '52-4'), (False, '82-4')],
-    [(False, '52-4'), (False, '72-4')],
-    [(False, '52-4'), (False, '62-4')],
-    [(False, '42-4'), (False, '82-4')],
-    [(False, '42-4'), (False, '72-4')],
-    [(False, '42-4'), (False, '62-4')],
-    [(False, '32-4'), (False, '82-4')],
-    [(False, '32-4'), (False, '72-4')],
-    [(False, '32-4'), (False, '62-4')],
-    [(False, '22-4'), (False, '82-4')],
-    [(False, '22-4'), (False, '72-4')],
-    [(False, '22-4'), (False, '62-4')],
-    [(False, '22-4'), (False, '52-4')],
-    [(False, '22-4'), (False, '42-4')],
-    [(False, '22-4'), (False, '32-4')],
-    [(False, '12-4'), (False, '82-4')],
-    [(False, '12-4'), (False, '72-4')],
-    [(False, '12-4'), (False, '62-4')],
-    [(False, '12-4'), (False, '52-4')],
-    [(False, '12-4'), (False, '42-4')],
-    [(False, '12-4'), (False, '32-4')],
-    [(False, '02-4'), (False, '82-4')],
-    [(False, '02-4'), (False, '72-4')],
-    [(False, '02-4'), (False, '62-4')],
-    [(False, '02-4'), (False, '52-4')],
-    [(False, '02-4'), (False, '42-4')],
-    [(False, '02-4'), (False, '32-4')],
-    [(True, '02-4'), (True, '12-4'), (True, '22-4'), (True, '32-4'), (True, '42-4'), (True, '52-4'), (True, '62-4'), (True, '72-4'), (True, '82-4')],
-    [(False, '53-4'), (False, '83-4')],
-    [(False, '53-4'), (False, '73-4')],
-    [(False, '53-4'), (False, '63-4')],
-    [(False, '43-4'), (False, '83-4')],
-    [(False, '43-4'), (False, '73-4')],
-    [(False, '43-4'), (False, '63-4')],
-    [(False, '33-4'), (False, '83-4')],
-    [(False, '33-4'), (False, '73-4')],
-    [(False, '33-4'), (False, '63-4')],
-    [(False, '23-4'), (False, '83-4')],
-    [(False, '23-4'), (False, '73-4')],
-    [(False, '23-4'), (False, '63-4')],
-    [(False, '23-4'), (False, '53-4')],
-    [(False, '23-4'), (False, '43-4')],
-    [(False, '23-4'), (False, '33-4')],
-    [(False, '13-4'), (False, '83-4')],
-    [(False, '13-4'), (False, '73-4')],
-    [(False, '13-4'), (False, '63-4')],
-    [(False, '13-4'), (False, '53-4')],
-    [(False, '13-4'), (False, '43-4')],
-    [(False, '13-4'), (False, '33-4')],
-    [(False, '03-4'), (False, '83-4')],
-    [(False, '03-4'), (False, '73-4')],
-    [(False, '03-4'), (False, '63-4')],
-    [(False, '03-4'), (False, '53-4')],
-    [(False, '03-4'), (False, '43-4')],
-    [(False, '03-4'), (False, '33-4')],
-    [(True, '03-4'), (True, '13-4'), (True, '23-4'), (True, '33-4'), (True, '43-4'), (True, '53-4'), (True, '63-4'), (True, '73-4'), (True, '83-4')],
-    [(False, '54-4'), (False, '84-4')],
-    [(False, '54-4'), (False, '74-4')],
-    [(False, '54-4'), (False, '64-4')],
-    [(False, '44-4'), (False, '84-4')],
-    [(False, '44-4'), (False, '74-4')],
-    [(False, '44-4'), (False, '64-4')],
-    [(False, '34-4'), (False, '84-4')],
-    [(False, '34-4'), (False, '74-4')],
-    [(False, '34-4'), (False, '64-4')],
-    [(False, '24-4'), (False, '84-4')],
-    [(False, '24-4'), (False, '74-4')],
-    [(False, '24-4'), (False, '64-4')],
-    [(False, '24-4'), (False, '54-4')],
-    [(False, '24-4'), (False, '44-4')],
-    [(False, '24-4'), (False, '34-4')],
-    [(False, '14-4'), (False, '84-4')],
-    [(False, '14-4'), (False, '74-4')],
-    [(False, '14-4'), (False, '64-4')],
-    [(False, '14-4'), (False, '54-4')],
-    [(False, '14-4'), (False, '44-4')],
-    [(False, '14-4'), (False, '34-4')],
-    [(False, '04-4'), (False, '84-4')],
-    [(False, '04-4'), (False, '74-4')],
-    [(False, '04-4'), (False, '64-4')],
-    [(False, '04-4'), (False, '54-4')],
-    [(False, '04-4'), (False, '44-4')],
-    [(False, '04-4'), (False, '34-4')],
-    [(True, '04-4'), (True, '14-4'), (True, '24-4'), (True, '34-4'), (True, '44-4'), (True, '54-4'), (True, '64-4'), (True, '74-4'), (True, '84-4')],
-    [(False, '55-4'), (False, '85-4')],
-    [(False, '55-4'), (False, '75-4')],
-    [(False, '55-4'), (False, '65-4')],
-    [(False, '45-4'), (False, '85-4')],
-    [(False, '45-4'), (False, '75-4')],
-    [(False, '45-4'), (False, '65-4')],
-    [(False, '35-4'), (False, '85-4')],
-    [(False, '35-4'), (False, '75-4')],
-    [(False, '35-4'), (False, '65-4')],
-    [(False, '25-4'), (False, '85-4')],
-    [(False, '25-4'), (False, '75-4')],
-    [(False, '25-4'), (False, '65-4')],
-    [(False, '25-4'), (False, '55-4')],
-    [(False, '25-4'), (False, '45-4')],
-    [(False, '25-4'), (False, '35-4')],
-    [(False, '15-4'), (False, '85-4')],
-    [(False, '15-4'), (False, '75-4')],
-    [(False, '15-4'), (False, '65-4')],
-    [(False, '15-4'), (False, '55-4')],
-    [(False, '15-4'), (False, '45-4')],
-    [(False, '15-4'), (False, '35-4')],
-    [(False, '05-4'), (False, '85-4')],
-    [(False, '05-4'), (False, '75-4')],
-    [(False, '05-4'), (False, '65-4')],
-    [(False, '05-4'), (False, '55-4')],
-    [(False, '05-4'), (False, '45-4')],
-    [(False, '05-4'), (False, '35-4')],
-    [(True, '05-4'), (True, '15-4'), (True, '25-4'), (True, '35-4'), (True, '45-4'), (True, '55-4'), (True, '65-4'), (True, '75-4'), (True, '85-4')],
-    [(False, '56-4'), (False, '86-4')],
-    [(False, '56-4'), (False, '76-4')],
-    [(False, '56-4'), (False, '66-4')],
-    [(False, '46-4'), (False, '86-4')],
-    [(False, '46-4'), (False, '76-4')],
-    [(False, '46-4'), (False, '66-4')],
-    [(False, '36-4'), (False, '86-4')],
-    [(False, '36-4'), (False, '76-4')],
-    [(False, '36-4'), (False, '66-4')],
-    [(False, '26-4'), (False, '86-4')],
-    [(False, '26-4'), (False, '76-4')],
-    [(False, '26-4'), (False, '66-4')],
-    [(False, '26-4'), (False, '56-4')],
-    [(False, '26-4'), (False, '46-4')],
-    [(False, '26-4'), (False, '36-4')],
-    [(False, '16-4'), (False, '86-4')],
-    [(False, '16-4'), (False, '76-4')],
-    [(False, '16-4'), (False, '66-4')],
-    [(False, '16-4'), (False, '56-4')],
-    [(False, '16-4'), (False, '46-4')],
-    [(False, '16-4'), (False, '36-4')],
-    [(False, '06-4'), (False, '86-4')],
-    [(False, '06-4'), (False, '76-4')],
-    [(False, '06-4'), (False, '66-4')],
-    [(False, '06-4'), (False, '56-4')],
-    [(False, '06-4'), (False, '46-4')],
-    [(False, '06-4'), (False, '36-4')],
-    [(True, '06-4'), (True, '16-4'), (True, '26-4'), (True, '36-4'), (True, '46-4'), (True, '56-4'), (True, '66-4'), (True, '76-4'), (True, '86-4')],
-    [(False, '57-4'), (False, '87-4')],
-    [(False, '57-4'), (False, '77-4')],
-    [(False, '57-4'), (False, '67-4')],
-    [(False, '47-4'), (False, '87-4')],
-    [(False, '47-4'), (False, '77-4')],
-    [(False, '47-4'), (False, '67-4')],
-    [(False, '37-4'), (False, '87-4')],
-    [(False, '37-4'), (False, '77-4')],
-    [(False, '37-4'), (False, '67-4')],
-    [(False, '27-4'), (False, '87-4')],
-    [(False, '27-4'), (False, '77-4')],
-    [(False, '27-4'), (False, '67-4')],
-    [(False, '27-4'), (False, '57-4')],
-    [(False, '27-4'), (False, '47-4')],
-    [(False, '27-4'), (False, '37-4')],
-    [(False, '17-4'), (False, '87-4')],
-    [(False, '17-4'), (False, '77-4')],
-    [(False, '17-4'), (False, '67-4')],
-    [(False, '17-4'), (False, '57-4')],
-    [(False, '17-4'), (False, '47-4')],
-    [(False, '17-4'), (False, '37-4')],
-    [(False, '07-4'), (False, '87-4')],
-    [(False, '07-4'), (False, '77-4')],
-    [(False, '07-4'), (False, '67-4')],
-    [(False, '07-4'), (False, '57-4')],
-    [(False, '07-4'), (False, '47-4')],
-    [(False, '07-4'), (False, '37-4')],
-    [(True, '07-4'), (True, '17-4'), (True, '27-4'), (True, '37-4'), (True, '47-4'), (True, '57-4'), (True, '67-4'), (True, '77-4'), (True, '87-4')],
-    [(False, '58-4'), (False, '88-4')],
-    [(False, '58-4'), (False, '78-4')],
-    [(False, '58-4'), (False, '68-4')],
-    [(False, '48-4'), (False, '88-4')],
-    [(False, '48-4'), (False, '78-4')],
-    [(False, '48-4'), (False, '68-4')],
-    [(False, '38-4'), (False, '88-4')],
-    [(False, '38-4'), (False, '78-4')],
-    [(False, '38-4'), (False, '68-4')],
-    [(False, '28-4'), (False, '88-4')],
-    [(False, '28-4'), (False, '78-4')],
-    [(False, '28-4'), (False, '68-4')],
-    [(False, '28-4'), (False, '58-4')],
-    [(False, '28-4'), (False, '48-4')],
-    [(False, '28-4'), (False, '38-4')],
-    [(False, '18-4'), (False, '88-4')],
-    [(False, '18-4'), (False, '78-4')],
-    [(False, '18-4'), (False, '68-4')],
-    [(False, '18-4'), (False, '58-4')],
-    [(False, '18-4'), (False, '48-4')],
-    [(False, '18-4'), (False, '38-4')],
-    [(False, '08-4'), (False, '88-4')],
-    [(False, '08-4'), (False, '78-4')],
-    [(False, '08-4'), (False, '68-4')],
-    [(False, '08-4'), (False, '58-4')],
-    [(False, '08-4'), (False, '48-4')],
-    [(False, '08-4'), (False, '38-4')],
-    [(True, '08-4'), (True, '18-4'), (True, '28-4'), (True, '38-4'), (True, '48-4'), (True, '58-4'), (True, '68-4'), (True, '78-4'), (True, '88-4')],
-    [(False, '50-5'), (False, '80-5')],
-    [(False, '50-5'), (False, '70-5')],
-    [(False, '50-5'), (False, '60-5')],
-    [(False, '40-5'), (False, '80-5')],
-    [(False, '40-5'), (False, '70-5')],
-    [(False, '40-5'), (False, '60-5')],
-    [(False, '30-5'), (False, '80-5')],
-    [(False, '30-5'), (False, '70-5')],
-    [(False, '30-5'), (False, '60-5')],
-    [(False, '20-5'), (False, '80-5')],
-    [(False, '20-5'), (False, '70-5')],
-    [(False, '20-5'), (False, '60-5')],
-    [(False, '20-5'), (False, '50-5')],
-    [(False, '20-5'), (False, '40-5')],
-    [(False, '20-5'), (False, '30-5')],
-    [(False, '10-5'), (False, '80-5')],
-    [(False, '10-5'), (False, '70-5')],
-    [(False, '10-5'), (False, '60-5')],
-    [(False, '10-5'), (False, '50-5')],
-    [(False, '10-5'), (False, '40-5')],
-    [(False, '10-5'), (False, '30-5')],
-    [(False, '00-5'), (False, '80-5')],
-    [(False, '00-5'), (False, '70-5')],
-    [(False, '00-5'), (False, '60-5')],
-    [(False, '00-5'), (False, '50-5')],
-    [(False, '00-5'), (False, '40-5')],
-    [(False, '00-5'), (False, '30-5')],
-    [(True, '00-5'), (True, '10-5'), (True, '20-5'), (True, '30-5'), (True, '40-5'), (True, '50-5'), (True, '60-5'), (True, '70-5'), (True, '80-5')],
-    [(False, '51-5'), (False, '81-5')],
-    [(False, '51-5'), (False, '71-5')],
-    [(False, '51-5'), (False, '61-5')],
-    [(False, '41-5'), (False, '81-5')],
-    [(False, '41-5'), (False, '71-5')],
-    [(False, '41-5'), (False, '61-5')],
-    [(False, '31-5'), (False, '81-5')],
-    [(False, '31-5'), (False, '71-5')],
-    [(False, '31-5'), (False, '61-5')],
-    [(False, '21-5'), (False, '81-5')],
-    [(False, '21-5'), (False, '71-5')],
-    [(False, '21-5'), (False, '61-5')],
-    [(False, '21-5'), (False, '51-5')],
-    [(False, '21-5'), (False, '41-5')],
-    [(False, '21-5'), (False, '31-5')],
-    [(False, '11-5'), (False, '81-5')],
-    [(False, '11-5'), (False, '71-5')],
-    [(False, '11-5'), (False, '61-5')],
-    [(False, '11-5'), (False, '51-5')],
-    [(False, '11-5'), (False, '41-5')],
-    [(False, '11-5'), (False, '31-5')],
-    [(False, '01-5'), (False, '81-5')],
-    [(False, '01-5'), (False, '71-5')],
-    [(False, '01-5'), (False, '61-5')],
-    [(False, '01-5'), (False, '51-5')],
-    [(False, '01-5'), (False, '41-5')],
-    [(False, '01-5'), (False, '31-5')],
-    [(True, '01-5'), (True, '11-5'), (True, '21-5'), (True, '31-5'), (True, '41-5'), (True, '51-5'), (True, '61-5'), (True, '71-5'), (True, '81-5')],
-    [(False, '52-5'), (False, '82-5')],
-    [(False, '52-5'), (False, '72-5')],
-    [(False, '52-5'), (False, '62-5')],
-    [(False, '42-5'), (False, '82-5')],
-    [(False, '42-5'), (False, '72-5')],
-    [(False, '42-5'), (False, '62-5')],
-    [(False, '32-5'), (False, '82-5')],
-    [(False, '32-5'), (False, '72-5')],
-    [(False, '32-5'), (False, '62-5')],
-    [(False, '22-5'), (False, '82-5')],
-    [(False, '22-5'), (False, '72-5')],
-    [(False, '22-5'), (False, '62-5')],
-    [(False, '22-5'), (False, '52-5')],
-    [(False, '22-5'), (False, '42-5')],
-    [(False, '22-5'), (False, '32-5')],
-    [(False, '12-5'), (False, '82-5')],
-    [(False, '12-5'), (False, '72-5')],
-    [(False, '12-5'), (False, '62-5')],
-    [(False, '12-5'), (False, '52-5')],
-    [(False, '12-5'), (False, '42-5')],
-    [(False, '12-5'), (False, '32-5')],
-    [(False, '02-5'), (False, '82-5')],
-    [(False, '02-5'), (False, '72-5')],
-    [(False, '02-5'), (False, '62-5')],
-    [(False, '02-5'), (False, '52-5')],
-    [(False, '02-5'), (False, '42-5')],
-    [(False, '02-5'), (False, '32-5')],
-    [(True, '02-5'), (True, '12-5'), (True, '22-5'), (True, '32-5'), (True, '42-5'), (True, '52-5'), (True, '62-5'), (True, '72-5'), (True, '82-5')],
-    [(False, '53-5'), (False, '83-5')],
-    [(False, '53-5'), (False, '73-5')],
-    [(False, '53-5'), (False, '63-5')],
-    [(False, '43-5'), (False, '83-5')],
-    [(False, '43-5'), (False, '73-5')],
-    [(False, '43-5'), (False, '63-5')],
-    [(False, '33-5'), (False, '83-5')],
-    [(False, '33-5'), (False, '73-5')],
-    [(False, '33-5'), (False, '63-5')],
-    [(False, '23-5'), (False, '83-5')],
-    [(False, '23-5'), (False, '73-5')],
-    [(False, '23-5'), (False, '63-5')],
-    [(False, '23-5'), (False, '53-5')],
-    [(False, '23-5'), (False, '43-5')],
-    [(False, '23-5'), (False, '33-5')],
-    [(False, '13-5'), (False, '83-5')],
-    [(False, '13-5'), (False, '73-5')],
-    [(False, '13-5'), (False, '63-5')],
-    [(False, '13-5'), (False, '53-5')],
-    [(False, '13-5'), (False, '43-5')],
-    [(False, '13-5'), (False, '33-5')],
-    [(False, '03-5'), (False, '83-5')],
-    [(False, '03-5'), (False, '73-5')],
-    [(False, '03-5'), (False, '63-5')],
-    [(False, '03-5'), (False, '53-5')],
-    [(False, '03-5'), (False, '43-5')],
-    [(False, '03-5'), (False, '33-5')],
-    [(True, '03-5'), (True, '13-5'), (True, '23-5'), (True, '33-5'), (True, '43-5'), (True, '53-5'), (True, '63-5'), (True, '73-5'), (True, '83-5')],
-    [(False, '54-5'), (False, '84-5')],
-    [(False, '54-5'), (False, '74-5')],
-    [(False, '54-5'), (False, '64-5')],
-    [(False, '44-5'), (False, '84-5')],
-    [(False, '44-5'), (False, '74-5')],
-    [(False, '44-5'), (False, '64-5')],
-    [(False, '34-5'), (False, '84-5')],
-    [(False, '34-5'), (False, '74-5')],
-    [(False, '34-5'), (False, '64-5')],
-    [(False, '24-5'), (False, '84-5')],
-    [(False, '24-5'), (False, '74-5')],
-    [(False, '24-5'), (False, '64-5')],
-    [(False, '24-5'), (False, '54-5')],
-    [(False, '24-5'), (False, '44-5')],
-    [(False, '24-5'), (False, '34-5')],
-    [(False, '14-5'), (False, '84-5')],
-    [(False, '14-5'), (False, '74-5')],
-    [(False, '14-5'), (False, '64-5')],
-    [(False, '14-5'), (False, '54-5')],
-    [(False, '14-5'), (False, '44-5')],
-    [(False, '14-5'), (False, '34-5')],
-    [(False, '04-5'), (False, '84-5')],
-    [(False, '04-5'), (False, '74-5')],
-    [(False, '04-5'), (False, '64-5')],
-    [(False, '04-5'), (False, '54-5')],
-    [(False, '04-5'), (False, '44-5')],
-    [(False, '04-5'), (False, '34-5')],
-    [(True, '04-5'), (True, '14-5'), (True, '24-5'), (True, '34-5'), (True, '44-5'), (True, '54-5'), (True, '64-5'), (True, '74-5'), (True, '84-5')],
-    [(False, '55-5'), (False, '85-5')],
-    [(False, '55-5'), (False, '75-5')],
-    [(False, '55-5'), (False, '65-5')],
-    [(False, '45-5'), (False, '85-5')],
-    [(False, '45-5'), (False, '75-5')],
-    [(False, '45-5'), (False, '65-5')],
-    [(False, '35-5'), (False, '85-5')],
-    [(False, '35-5'), (False, '75-5')],
-    [(False, '35-5'), (False, '65-5')],
-    [(False, '25-5'), (False, '85-5')],
-    [(False, '25-5'), (False, '75-5')],
-    [(False, '25-5'), (False, '65-5')],
-    [(False, '25-5'), (False, '55-5')],
-    [(False, '25-5'), (False, '45-5')],
-    [(False, '25-5'), (False, '35-5')],
-    [(False, '15-5'), (False, '85-5')],
-    [(False, '15-5'), (False, '75-5')],
-    [(False, '15-5'), (False, '65-5')],
-    [(False, '15-5'), (False, '55-5')],
-    [(False, '15-5'), (False, '45-5')],
-    [(False, '15-5'), (False, '35-5')],
-    [(False, '05-5'), (False, '85-5')],
-    [(False, '05-5'), (False, '75-5')],
-    [(False, '05-5'), (False, '65-5')],
-    [(False, '05-5'), (False, '55-5')],
-    [(False, '05-5'), (False, '45-5')],
-    [(False, '05-5'), (False, '35-5')],
-    [(True, '05-5'), (True, '15-5'), (True, '25-5'), (True, '35-5'), (True, '45-5'), (True, '55-5'), (True, '65-5'), (True, '75-5'), (True, '85-5')],
-    [(False, '56-5'), (False, '86-5')],
-    [(False, '56-5'), (False, '76-5')],
-    [(False, '56-5'), (False, '66-5')],
-    [(False, '46-5'), (False, '86-5')],
-    [(False, '46-5'), (False, '76-5')],
-    [(False, '46-5'), (False, '66-5')],
-    [(False, '36-5'), (False, '86-5')],
-    [(False, '36-5'), (False, '76-5')],
-    [(False, '36-5'), (False, '66-5')],
-    [(False, '26-5'), (False, '86-5')],
-    [(False, '26-5'), (False, '76-5')],
-    [(False, '26-5'), (False, '66-5')],
-    [(False, '26-5'), (False, '56-5')],
-    [(False, '26-5'), (False, '46-5')],
-    [(False, '26-5'), (False, '36-5')],
-    [(False, '16-5'), (False, '86-5')],
-    [(False, '16-5'), (False, '76-5')],
-    [(False, '16-5'), (False, '66-5')],
-    [(False, '16-5'), (False, '56-5')],
-    [(False, '16-5'), (False, '46-5')],
-    [(False, '16-5'), (False, '36-5')],
-    [(False, '06-5'), (False, '86-5')],
-    [(False, '06-5'), (False, '76-5')],
-    [(False, '06-5'), (False, '66-5')],
-    [(False, '06-5'), (False, '56-5')],
-    [(False, '06-5'), (False, '46-5')],
-    [(False, '06-5'), (False, '36-5')],
-    [(True, '06-5'), (True, '16-5'), (True, '26-5'), (True, '36-5'), (True, '46-5'), (True, '56-5'), (True, '66-5'), (True, '76-5'), (True, '86-5')],
-    [(False, '57-5'), (False, '87-5')],
-    [(False, '57-5'), (False, '77-5')],
-    [(False, '57-5'), (False, '67-5')],
-    [(False, '47-5'), (False, '87-5')],
-    [(False, '47-5'), (False, '77-5')],
-    [(False, '47-5'), (False, '67-5')],
-    [(False, '37-5'), (False, '87-5')],
-    [(False, '37-5'), (False, '77-5')],
-    [(False, '37-5'), (False, '67-5')],
-    [(False, '27-5'), (False, '87-5')],
-    [(False, '27-5'), (False, '77-5')],
-    [(False, '27-5'), (False, '67-5')],
-    [(False, '27-5'), (False, '57-5')],
-    [(False, '27-5'), (False, '47-5')],
-    [(False, '27-5'), (False, '37-5')],
-    [(False, '17-5'), (False, '87-5')],
-    [(False, '17-5'), (False, '77-5')],
-    [(False, '17-5'), (False, '67-5')],
-    [(False, '17-5'), (False, '57-5')],
-    [(False, '17-5'), (False, '47-5')],
-    [(False, '17-5'), (False, '37-5')],
-    [(False, '07-5'), (False, '87-5')],
-    [(False, '07-5'), (False, '77-5')],
-    [(False, '07-5'), (False, '67-5')],
-    [(False, '07-5'), (False, '57-5')],
-    [(False, '07-5'), (False, '47-5')],
-    [(False, '07-5'), (False, '37-5')],
-    [(True, '07-5'), (True, '17-5'), (True, '27-5'), (True, '37-5'), (True, '47-5'), (True, '57-5'), (True, '67-5'), (True, '77-5'), (True, '87-5')],
-    [(False, '58-5'), (False, '88-5')],
-    [(False, '58-5'), (False, '78-5')],
-    [(False, '58-5'), (False, '68-5')],
-    [(False, '48-5'), (False, '88-5')],
-    [(False, '48-5'), (False, '78-5')],
-    [(False, '48-5'), (False, '68-5')],
-    [(False, '38-5'), (False, '88-5')],
-    [(False, '38-5'), (False, '78-5')],
-    [(False, '38-5'), (False, '68-5')],
-    [(False, '28-5'), (False, '88-5')],
-    [(False, '28-5'), (False, '78-5')],
-    [(False, '28-5'), (False, '68-5')],
-    [(False, '28-5'), (False, '58-5')],
-    [(False, '28-5'), (False, '48-5')],
-    [(False, '28-5'), (False, '38-5')],
-    [(False, '18-5'), (False, '88-5')],
-    [(False, '18-5'), (False, '78-5')],
-    [(False, '18-5'), (False, '68-5')],
-    [(False, '18-5'), (False, '58-5')],
-    [(False, '18-5'), (False, '48-5')],
-    [(False, '18-5'), (False, '38-5')],
-    [(False, '08-5'), (False, '88-5')],
-    [(False, '08-5'), (False, '78-5')],
-    [(False, '08-5'), (False, '68-5')],
-    [(False, '08-5'), (False, '58-5')],
-    [(False, '08-5'), (False, '48-5')],
-    [(False, '08-5'), (False, '38-5')],
-    [(True, '08-5'), (True, '18-5'), (True, '28-5'), (True, '38-5'), (True, '48-5'), (True, '58-5'), (True, '68-5'), (True, '78-5'), (True, '88-5')],
-    [(False, '50-6'), (False, '80-6')],
-    [(False, '50-6'), (False, '70-6')],
-    [(False, '50-6'), (False, '60-6')],
-    [(False, '40-6'), (False, '80-6')],
-    [(False, '40-6'), (False, '70-6')],
-    [(False, '40-6'), (False, '60-6')],
-    [(False, '30-6'), (False, '80-6')],
-    [(False, '30-6'), (False, '70-6')],
-    [(False, '30-6'), (False, '60-6')],
-    [(False, '20-6'), (False, '80-6')],
-    [(False, '20-6'), (False, '70-6')],
-    [(False, '20-6'), (False, '60-6')],
-    [(False, '20-6'), (False, '50-6')],
-    [(False, '20-6'), (False, '40-6')],
-    [(False, '20-6'), (False, '30-6')],
-    [(False, '10-6'), (False, '80-6')],
-    [(False, '10-6'), (False, '70-6')],
-    [(False, '10-6'), (False, '60-6')],
-    [(False, '10-6'), (False, '50-6')],
-    [(False, '10-6'), (False, '40-6')],
-    [(False, '10-6'), (False, '30-6')],
-    [(False, '00-6'), (False, '80-6')],
-    [(False, '00-6'), (False, '70-6')],
-    [(False, '00-6'), (False, '60-6')],
-    [(False, '00-6'), (False, '50-6')],
-    [(False, '00-6'), (False, '40-6')],
-    [(False, '00-6'), (False, '30-6')],
-    [(True, '00-6'), (True, '10-6'), (True, '20-6'), (True, '30-6'), (True, '40-6'), (True, '50-6'), (True, '60-6'), (True, '70-6'), (True, '80-6')],
-    [(False, '51-6'), (False, '81-6')],
-    [(False, '51-6'), (False, '71-6')],
-    [(False, '51-6'), (False, '61-6')],
-    [(False, '41-6'), (False, '81-6')],
-    [(False, '41-6'), (False, '71-6')],
-    [(False, '41-6'), (False, '61-6')],
-    [(False, '31-6'), (False, '81-6')],
-    [(False, '31-6'), (False, '71-6')],
-    [(False, '31-6'), (False, '61-6')],
-    [(False, '21-6'), (False, '81-6')],
-    [(False, '21-6'), (False, '71-6')],
-    [(False, '21-6'), (False, '61-6')],
-    [(False, '21-6'), (False, '51-6')],
-    [(False, '21-6'), (False, '41-6')],
-    [(False, '21-6'), (False, '31-6')],
-    [(False, '11-6'), (False, '81-6')],
-    [(False, '11-6'), (False, '71-6')],
-    [(False, '11-6'), (False, '61-6')],
-    [(False, '11-6'), (False, '51-6')],
-    [(False, '11-6'), (False, '41-6')],
-    [(False, '11-6'), (False, '31-6')],
-    [(False, '01-6'), (False, '81-6')],
-    [(False, '01-6'), (False, '71-6')],
-    [(False, '01-6'), (False, '61-6')],
-    [(False, '01-6'), (False, '51-6')],
-    [(False, '01-6'), (False, '41-6')],
-    [(False, '01-6'), (False, '31-6')],
-    [(True, '01-6'), (True, '11-6'), (True, '21-6'), (True, '31-6'), (True, '41-6'), (True, '51-6'), (True, '61-6'), (True, '71-6'), (True, '81-6')],
-    [(False, '52-6'), (False, '82-6')],
-    [(False, '52-6'), (False, '72-6')],
-    [(False, '52-6'), (False, '62-6')],
-    [(False, '42-6'), (False, '82-6')],
-    [(False, '42-6'), (False, '72-6')],
-    [(False, '42-6'), (False, '62-6')],
-    [(False, '32-6'), (False, '82-6')],
-    [(False, '32-6'), (False, '72-6')],
-    [(False, '32-6'), (False, '62-6')],
-    [(False, '22-6'), (False, '82-6')],
-    [(False, '22-6'), (False, '72-6')],
-    [(False, '22-6'), (False, '62-6')],
-    [(False, '22-6'), (False, '52-6')],
-    [(False, '22-6'), (False, '42-6')],
-    [(False, '22-6'), (False, '32-6')],
-    [(False, '12-6'), (False, '82-6')],
-    [(False, '12-6'), (False, '72-6')],
-    [(False, '12-6'), (False, '62-6')],
-    [(False, '12-6'), (False, '52-6')],
-    [(False, '12-6'), (False, '42-6')],
-    [(False, '12-6'), (False, '32-6')],
-    [(False, '02-6'), (False, '82-6')],
-    [(False, '02-6'), (False, '72-6')],
-    [(False, '02-6'), (False, '62-6')],
-    [(False, '02-6'), (False, '52-6')],
-    [(False, '02-6'), (False, '42-6')],
-    [(False, '02-6'), (False, '32-6')],
-    [(True, '02-6'), (True, '12-6'), (True, '22-6'), (True, '32-6'), (True, '42-6'), (True, '52-6'), (True, '62-6'), (True, '72-6'), (True, '82-6')],
-    [(False, '53-6'), (False, '83-6')],
-    [(False, '53-6'), (False, '73-6')],
-    [(False, '53-6'), (False, '63-6')],
-    [(False, '43-6'), (False, '83-6')],
-    [(False, '43-6'), (False, '73-6')],
-    [(False, '43-6'), (False, '63-6')],
-    [(False, '33-6'), (False, '83-6')],
-    [(False, '33-6'), (False, '73-6')],
-    [(False, '33-6'), (False, '63-6')],
-    [(False, '23-6'), (False, '83-6')],
-    [(False, '23-6'), (False, '73-6')],
-    [(False, '23-6'), (False, '63-6')],
-    [(False, '23-6'), (False, '53-6')],
-    [(False, '23-6'), (False, '43-6')],
-    [(False, '23-6'), (False, '33-6')],
-    [(False, '13-6'), (False, '83-6')],
-    [(False, '13-6'), (False, '73-6')],
-    [(False, '13-6'), (False, '63-6')],
-    [(False, '13-6'), (False, '53-6')],
-    [(False, '13-6'), (False, '43-6')],
-    [(False, '13-6'), (False, '33-6')],
-    [(False, '03-6'), (False, '83-6')],
-    [(False, '03-6'), (False, '73-6')],
-    [(False, '03-6'), (False, '63-6')],
-    [(False, '03-6'), (False, '53-6')],
-    [(False, '03-6'), (False, '43-6')],
-    [(False, '03-6'), (False, '33-6')],
-    [(True, '03-6'), (True, '13-6'), (True, '23-6'), (True, '33-6'), (True, '43-6'), (True, '53-6'), (True, '63-6'), (True, '73-6'), (True, '83-6')],
-    [(False, '54-6'), (False, '84-6')],
-    [(False, '54-6'), (False, '74-6')],
-    [(False, '54-6'), (False, '64-6')],
-    [(False, '44-6'), (False, '84-6')],
-    [(False, '44-6'), (False, '74-6')],
-    [(False, '44-6'), (False, '64-6')],
-    [(False, '34-6'), (False, '84-6')],
-    [(False, '34-6'), (False, '74-6')],
-    [(False, '34-6'), (False, '64-6')],
-    [(False, '24-6'), (False, '84-6')],
-    [(False, '24-6'), (False, '74-6')],
-    [(False, '24-6'), (False, '64-6')],
-    [(False, '24-6'), (False, '54-6')],
-    [(False, '24-6'), (False, '44-6')],
-    [(False, '24-6'), (False, '34-6')],
-    [(False, '14-6'), (False, '84-6')],
-    [(False, '14-6'), (False, '74-6')],
-    [(False, '14-6'), (False, '64-6')],
-    [(False, '14-6'), (False, '54-6')],
-    [(False, '14-6'), (False, '44-6')],
-    [(False, '14-6'), (False, '34-6')],
-    [(False, '04-6'), (False, '84-6')],
-    [(False, '04-6'), (False, '74-6')],
-    [(False, '04-6'), (False, '64-6')],
-    [(False, '04-6'), (False, '54-6')],
-    [(False, '04-6'), (False, '44-6')],
-    [(False, '04-6'), (False, '34-6')],
-    [(True, '04-6'), (True, '14-6'), (True, '24-6'), (True, '34-6'), (True, '44-6'), (True, '54-6'), (True, '64-6'), (True, '74-6'), (True, '84-6')],
-    [(False, '55-6'), (False, '85-6')],
-    [(False, '55-6'), (False, '75-6')],
-    [(False, '55-6'), (False, '65-6')],
-    [(False, '45-6'), (False, '85-6')],
-    [(False, '45-6'), (False, '75-6')],
-    [(False, '45-6'), (False, '65-6')],
-    [(False, '35-6'), (False, '85-6')],
-    [(False, '35-6'), (False, '75-6')],
-    [(False, '35-6'), (False, '65-6')],
-    [(False, '25-6'), (False, '85-6')],
-    [(False, '25-6'), (False, '75-6')],
-    [(False, '25-6'), (False, '65-6')],
-    [(False, '25-6'), (False, '55-6')],
-    [(False, '25-6'), (False, '45-6')],
-    [(False, '25-6'), (False, '35-6')],
-    [(False, '15-6'), (False, '85-6')],
-    [(False, '15-6'), (False, '75-6')],
-    [(False, '15-6'), (False, '65-6')],
-    [(False, '15-6'), (False, '55-6')],
-    [(False, '15-6'), (False, '45-6')],
-    [(False, '15-6'), (False, '35-6')],
-    [(False, '05-6'), (False, '85-6')],
-    [(False, '05-6'), (False, '75-6')],
-    [(False, '05-6'), (False, '65-6')],
-    [(False, '05-6'), (False, '55-6')],
-    [(False, '05-6'), (False, '45-6')],
-    [(False, '05-6'), (False, '35-6')],
-    [(True, '05-6'), (True, '15-6'), (True, '25-6'), (True, '35-6'), (True, '45-6'), (True, '55-6'), (True, '65-6'), (True, '75-6'), (True, '85-6')],
-    [(False, '56-6'), (False, '86-6')],
-    [(False, '56-6'), (False, '76-6')],
-    [(False, '56-6'), (False, '66-6')],
-    [(False, '46-6'), (False, '86-6')],
-    [(False, '46-6'), (False, '76-6')],
-    [(False, '46-6'), (False, '66-6')],
-    [(False, '36-6'), (False, '86-6')],
-    [(False, '36-6'), (False, '76-6')],
-    [(False, '36-6'), (False, '66-6')],
-    [(False, '26-6'), (False, '86-6')],
-    [(False, '26-6'), (False, '76-6')],
-    [(False, '26-6'), (False, '66-6')],
-    [(False, '26-6'), (False, '56-6')],
-    [(False, '26-6'), (False, '46-6')],
-    [(False, '26-6'), (False, '36-6')],
-    [(False, '16-6'), (False, '86-6')],
-    [(False, '16-6'), (False, '76-6')],
-    [(False, '16-6'), (False, '66-6')],
-    [(False, '16-6'), (False, '56-6')],
-    [(False, '16-6'), (False, '46-6')],
-    [(False, '16-6'), (False, '36-6')],
-    [(False, '06-6'), (False, '86-6')],
-    [(False, '06-6'), (False, '76-6')],
-    [(False, '06-6'), (False, '66-6')],
-    [(False, '06-6'), (False, '56-6')],
-    [(False, '06-6'), (False, '46-6')],
-    [(False, '06-6'), (False, '36-6')],
-    [(True, '06-6'), (True, '16-6'), (True, '26-6'), (True, '36-6'), (True, '46-6'), (True, '56-6'), (True, '66-6'), (True, '76-6'), (True, '86-6')],
-    [(False, '57-6'), (False, '87-6')],
-    [(False, '57-6'), (False, '77-6')],
-    [(False, '57-6'), (False, '67-6')],
-    [(False, '47-6'), (False, '87-6')],
-    [(False, '47-6'), (False, '77-6')],
-    [(False, '47-6'), (False, '67-6')],
-    [(False, '37-6'), (False, '87-6')],
-    [(False, '37-6'), (False, '77-6')],
-    [(False, '37-6'), (False, '67-6')],
-    [(False, '27-6'), (False, '87-6')],
-    [(False, '27-6'), (False, '77-6')],
-    [(False, '27-6'), (False, '67-6')],
-    [(False, '27-6'), (False, '57-6')],
-    [(False, '27-6'), (False, '47-6')],
-    [(False, '27-6'), (False, '37-6')],
-    [(False, '17-6'), (False, '87-6')],
-    [(False, '17-6'), (False, '77-6')],
-    [(False, '17-6'), (False, '67-6')],
-    [(False, '17-6'), (False, '57-6')],
-    [(False, '17-6'), (False, '47-6')],
-    [(False, '17-6'), (False, '37-6')],
-    [(False, '07-6'), (False, '87-6')],
-    [(False, '07-6'), (False, '77-6')],
-    [(False, '07-6'), (False, '67-6')],
-    [(False, '07-6'), (False, '57-6')],
-    [(False, '07-6'), (False, '47-6')],
-    [(False, '07-6'), (False, '37-6')],
-    [(True, '07-6'), (True, '17-6'), (True, '27-6'), (True, '37-6'), (True, '47-6'), (True, '57-6'), (True, '67-6'), (True, '77-6'), (True, '87-6')],
-    [(False, '58-6'), (False, '88-6')],
-    [(False, '58-6'), (False, '78-6')],
-    [(False, '58-6'), (False, '68-6')],
-    [(False, '48-6'), (False, '88-6')],
-    [(False, '48-6'), (False, '78-6')],
-    [(False, '48-6'), (False, '68-6')],
-    [(False, '38-6'), (False, '88-6')],
-    [(False, '38-6'), (False, '78-6')],
-    [(False, '38-6'), (False, '68-6')],
-    [(False, '28-6'), (False, '88-6')],
-    [(False, '28-6'), (False, '78-6')],
-    [(False, '28-6'), (False, '68-6')],
-    [(False, '28-6'), (False, '58-6')],
-    [(False, '28-6'), (False, '48-6')],
-    [(False, '28-6'), (False, '38-6')],
-    [(False, '18-6'), (False, '88-6')],
-    [(False, '18-6'), (False, '78-6')],
-    [(False, '18-6'), (False, '68-6')],
-    [(False, '18-6'), (False, '58-6')],
-    [(False, '18-6'), (False, '48-6')],
-    [(False, '18-6'), (False, '38-6')],
-    [(False, '08-6'), (False, '88-6')],
-    [(False, '08-6'), (False, '78-6')],
-    [(False, '08-6'), (False, '68-6')],
-    [(False, '08-6'), (False, '58-6')],
-    [(False, '08-6'), (False, '48-6')],
-    [(False, '08-6'), (False, '38-6')],
-    [(True, '08-6'), (True, '18-6'), (True, '28-6'), (True, '38-6'), (True, '48-6'), (True, '58-6'), (True, '68-6'), (True, '78-6'), (True, '88-6')],
-    [(False, '50-7'), (False, '80-7')],
-    [(False, '50-7'), (False, '70-7')],
-    [(False, '50-7'), (False, '60-7')],
-    [(False, '40-7'), (False, '80-7')],
-    [(False, '40-7'), (False, '70-7')],
-    [(False, '40-7'), (False, '60-7')],
-    [(False, '30-7'), (False, '80-7')],
-    [(False, '30-7'), (False, '70-7')],
-    [(False, '30-7'), (False, '60-7')],
-    [(False, '20-7'), (False, '80-7')],
-    [(False, '20-7'), (False, '70-7')],
-    [(False, '20-7'), (False, '60-7')],
-    [(False, '20-7'), (False, '50-7')],
-    [(False, '20-7'), (False, '40-7')],
-    [(False, '20-7'), (False, '30-7')],
-    [(False, '10-7'), (False, '80-7')],
-    [(False, '10-7'), (False, '70-7')],
-    [(False, '10-7'), (False, '60-7')],
-    [(False, '10-7'), (False, '50-7')],
-    [(False, '10-7'), (False, '40-7')],
-    [(False, '10-7'), (False, '30-7')],
-    [(False, '00-7'), (False, '80-7')],
-    [(False, '00-7'), (False, '70-7')],
-    [(False, '00-7'), (False, '60-7')],
-    [(False, '00-7'), (False, '50-7')],
-    [(False, '00-7'), (False, '40-7')],
-    [(False, '00-7'), (False, '30-7')],
-    [(True, '00-7'), (True, '10-7'), (True, '20-7'), (True, '30-7'), (True, '40-7'), (True, '50-7'), (True, '60-7'), (True, '70-7'), (True, '80-7')],
-    [(False, '51-7'), (False, '81-7')],
-    [(False, '51-7'), (False, '71-7')],
-    [(False, '51-7'), (False, '61-7')],
-    [(False, '41-7'), (False, '81-7')],
-    [(False, '41-7'), (False, '71-7')],
-    [(False, '41-7'), (False, '61-7')],
-    [(False, '31-7'), (False, '81-7')],
-    [(False, '31-7'), (False, '71-7')],
-    [(False, '31-7'), (False, '61-7')],
-    [(False, '21-7'), (False, '81-7')],
-    [(False, '21-7'), (False, '71-7')],
-    [(False, '21-7'), (False, '61-7')],
-    [(False, '21-7'), (False, '51-7')],
-    [(False, '21-7'), (False, '41-7')],
-    [(False, '21-7'), (False, '31-7')],
-    [(False, '11-7'), (False, '81-7')],
-    [(False, '11-7'), (False, '71-7')],
-    [(False, '11-7'), (False, '61-7')],
-    [(False, '11-7'), (False, '51-7')],
-    [(False, '11-7'), (False, '41-7')],
-    [(False, '11-7'), (False, '31-7')],
-    [(False, '01-7'), (False, '81-7')],
-    [(False, '01-7'), (False, '71-7')],
-    [(False, '01-7'), (False, '61-7')],
-    [(False, '01-7'), (False, '51-7')],
-    [(False, '01-7'), (False, '41-7')],
-    [(False, '01-7'), (False, '31-7')],
-    [(True, '01-7'), (True, '11-7'), (True, '21-7'), (True, '31-7'), (True, '41-7'), (True, '51-7'), (True, '61-7'), (True, '71-7'), (True, '81-7')],
-    [(False, '52-7'), (False, '82-7')],
-    [(False, '52-7'), (False, '72-7')],
-    [(False, '52-7'), (False, '62-7')],
-    [(False, '42-7'), (False, '82-7')],
-    [(False, '42-7'), (False, '72-7')],
-    [(False, '42-7'), (False, '62-7')],
-    [(False, '32-7'), (False, '82-7')],
-    [(False, '32-7'), (False, '72-7')],
-    [(False, '32-7'), (False, '62-7')],
-    [(False, '22-7'), (False, '82-7')],
-    [(False, '22-7'), (False, '72-7')],
-    [(False, '22-7'), (False, '62-7')],
-    [(False, '22-7'), (False, '52-7')],
-    [(False, '22-7'), (False, '42-7')],
-    [(False, '22-7'), (False, '32-7')],
-    [(False, '12-7'), (False, '82-7')],
-    [(False, '12-7'), (False, '72-7')],
-    [(False, '12-7'), (False, '62-7')],
-    [(False, '12-7'), (False, '52-7')],
-    [(False, '12-7'), (False, '42-7')],
-    [(False, '12-7'), (False, '32-7')],
-    [(False, '02-7'), (False, '82-7')],
-    [(False, '02-7'), (False, '72-7')],
-    [(False, '02-7'), (False, '62-7')],
-    [(False, '02-7'), (False, '52-7')],
-    [(False, '02-7'), (False, '42-7')],
-    [(False, '02-7'), (False, '32-7')],
-    [(True, '02-7'), (True, '12-7'), (True, '22-7'), (True, '32-7'), (True, '42-7'), (True, '52-7'), (True, '62-7'), (True, '72-7'), (True, '82-7')],
-    [(False, '53-7'), (False, '83-7')],
-    [(False, '53-7'), (False, '73-7')],
-    [(False, '53-7'), (False, '63-7')],
-    [(False, '43-7'), (False, '83-7')],
-    [(False, '43-7'), (False, '73-7')],
-    [(False, '43-7'), (False, '63-7')],
-    [(False, '33-7'), (False, '83-7')],
-    [(False, '33-7'), (False, '73-7')],
-    [(False, '33-7'), (False, '63-7')],
-    [(False, '23-7'), (False, '83-7')],
-    [(False, '23-7'), (False, '73-7')],
-    [(False, '23-7'), (False, '63-7')],
-    [(False, '23-7'), (False, '53-7')],
-    [(False, '23-7'), (False, '43-7')],
-    [(False, '23-7'), (False, '33-7')],
-    [(False, '13-7'), (False, '83-7')],
-    [(False, '13-7'), (False, '73-7')],
-    [(False, '13-7'), (False, '63-7')],
-    [(False, '13-7'), (False, '53-7')],
-    [(False, '13-7'), (False, '43-7')],
-    [(False, '13-7'), (False, '33-7')],
-    [(False, '03-7'), (False, '83-7')],
-    [(False, '03-7'), (False, '73-7')],
-    [(False, '03-7'), (False, '63-7')],
-    [(False, '03-7'), (False, '53-7')],
-    [(False, '03-7'), (False, '43-7')],
-    [(False, '03-7'), (False, '33-7')],
-    [(True, '03-7'), (True, '13-7'), (True, '23-7'), (True, '33-7'), (True, '43-7'), (True, '53-7'), (True, '63-7'), (True, '73-7'), (True, '83-7')],
-    [(False, '54-7'), (False, '84-7')],
-    [(False, '54-7'), (False, '74-7')],
-    [(False, '54-7'), (False, '64-7')],
-    [(False, '44-7'), (False, '84-7')],
-    [(False, '44-7'), (False, '74-7')],
-    [(False, '44-7'), (False, '64-7')],
-    [(False, '34-7'), (False, '84-7')],
-    [(False, '34-7'), (False, '74-7')],
-    [(False, '34-7'), (False, '64-7')],
-    [(False, '24-7'), (False, '84-7')],
-    [(False, '24-7'), (False, '74-7')],
-    [(False, '24-7'), (False, '64-7')],
-    [(False, '24-7'), (False, '54-7')],
-    [(False, '24-7'), (False, '44-7')],
-    [(False, '24-7'), (False, '34-7')],
-    [(False, '14-7'), (False, '84-7')],
-    [(False, '14-7'), (False, '74-7')],
-    [(False, '14-7'), (False, '64-7')],
-    [(False, '14-7'), (False, '54-7')],
-    [(False, '14-7'), (False, '44-7')],
-    [(False, '14-7'), (False, '34-7')],
-    [(False, '04-7'), (False, '84-7')],
-    [(False, '04-7'), (False, '74-7')],
-    [(False, '04-7'), (False, '64-7')],
-    [(False, '04-7'), (False, '54-7')],
-    [(False, '04-7'), (False, '44-7')],
-    [(False, '04-7'), (False, '34-7')],
-    [(True, '04-7'), (True, '14-7'), (True, '24-7'), (True, '34-7'), (True, '44-7'), (True, '54-7'), (True, '64-7'), (True, '74-7'), (True, '84-7')],
-    [(False, '55-7'), (False, '85-7')],
-    [(False, '55-7'), (False, '75-7')],
-    [(False, '55-7'), (False, '65-7')],
-    [(False, '45-7'), (False, '85-7')],
-    [(False, '45-7'), (False, '75-7')],
-    [(False, '45-7'), (False, '65-7')],
-    [(False, '35-7'), (False, '85-7')],
-    [(False, '35-7'), (False, '75-7')],
-    [(False, '35-7'), (False, '65-7')],
-    [(False, '25-7'), (False, '85-7')],
-    [(False, '25-7'), (False, '75-7')],
-    [(False, '25-7'), (False, '65-7')],
-    [(False, '25-7'), (False, '55-7')],
-    [(False, '25-7'), (False, '45-7')],
-    [(False, '25-7'), (False, '35-7')],
-    [(False, '15-7'), (False, '85-7')],
-    [(False, '15-7'), (False, '75-7')],
-    [(False, '15-7'), (False, '65-7')],
-    [(False, '15-7'), (False, '55-7')],
-    [(False, '15-7'), (False, '45-7')],
-    [(False, '15-7'), (False, '35-7')],
-    [(False, '05-7'), (False, '85-7')],
-    [(False, '05-7'), (False, '75-7')],
-    [(False, '05-7'), (False, '65-7')],
-    [(False, '05-7'), (False, '55-7')],
-    [(False, '05-7'), (False, '45-7')],
-    [(False, '05-7'), (False, '35-7')],
-    [(True, '05-7'), (True, '15-7'), (True, '25-7'), (True, '35-7'), (True, '45-7'), (True, '55-7'), (True, '65-7'), (True, '75-7'), (True, '85-7')],
-    [(False, '56-7'), (False, '86-7')],
-    [(False, '56-7'), (False, '76-7')],
-    [(False, '56-7'), (False, '66-7')],
-    [(False, '46-7'), (False, '86-7')],
-    [(False, '46-7'), (False, '76-7')],
-    [(False, '46-7'), (False, '66-7')],
-    [(False, '36-7'), (False, '86-7')],
-    [(False, '36-7'), (False, '76-7')],
-    [(False, '36-7'), (False, '66-7')],
-    [(False, '26-7'), (False, '86-7')],
-    [(False, '26-7'), (False, '76-7')],
-    [(False, '26-7'), (False, '66-7')],
-    [(False, '26-7'), (False, '56-7')],
-    [(False, '26-7'), (False, '46-7')],
-    [(False, '26-7'), (False, '36-7')],
-    [(False, '16-7'), (False, '86-7')],
-    [(False, '16-7'), (False, '76-7')],
-    [(False, '16-7'), (False, '66-7')],
-    [(False, '16-7'), (False, '56-7')],
-    [(False, '16-7'), (False, '46-7')],
-    [(False, '16-7'), (False, '36-7')],
-    [(False, '06-7'), (False, '86-7')],
-    [(False, '06-7'), (False, '76-7')],
-    [(False, '06-7'), (False, '66-7')],
-    [(False, '06-7'), (False, '56-7')],
-    [(False, '06-7'), (False, '46-7')],
-    [(False, '06-7'), (False, '36-7')],
-    [(True, '06-7'), (True, '16-7'), (True, '26-7'), (True, '36-7'), (True, '46-7'), (True, '56-7'), (True, '66-7'), (True, '76-7'), (True, '86-7')],
-    [(False, '57-7'), (False, '87-7')],
-    [(False, '57-7'), (False, '77-7')],
-    [(False, '57-7'), (False, '67-7')],
-    [(False, '47-7'), (False, '87-7')],
-    [(False, '47-7'), (False, '77-7')],
-    [(False, '47-7'), (False, '67-7')],
-    [(False, '37-7'), (False, '87-7')],
-    [(False, '37-7'), (False, '77-7')],
-    [(False, '37-7'), (False, '67-7')],
-    [(False, '27-7'), (False, '87-7')],
-    [(False, '27-7'), (False, '77-7')],
-    [(False, '27-7'), (False, '67-7')],
-    [(False, '27-7'), (False, '57-7')],
-    [(False, '27-7'), (False, '47-7')],
-    [(False, '27-7'), (False, '37-7')],
-    [(False, '17-7'), (False, '87-7')],
-    [(False, '17-7'), (False, '77-7')],
-    [(False, '17-7'), (False, '67-7')],
-    [(False, '17-7'), (False, '57-7')],
-    [(False, '17-7'), (False, '47-7')],
-    [(False, '17-7'), (False, '37-7')],
-    [(False, '07-7'), (False, '87-7')],
-    [(False, '07-7'), (False, '77-7')],
-    [(False, '07-7'), (False, '67-7')],
-    [(False, '07-7'), (False, '57-7')],
-    [(False, '07-7'), (False, '47-7')],
-    [(False, '07-7'), (False, '37-7')],
-    [(True, '07-7'), (True, '17-7'), (True, '27-7'), (True, '37-7'), (True, '47-7'), (True, '57-7'), (True, '67-7'), (True, '77-7'), (True, '87-7')],
-    [(False, '58-7'), (False, '88-7')],
-    [(False, '58-7'), (False, '78-7')],
-    [(False, '58-7'), (False, '68-7')],
-    [(False, '48-7'), (False, '88-7')],
-    [(False, '48-7'), (False, '78-7')],
-    [(False, '48-7'), (False, '68-7')],
-    [(False, '38-7'), (False, '88-7')],
-    [(False, '38-7'), (False, '78-7')],
-    [(False, '38-7'), (False, '68-7')],
-    [(False, '28-7'), (False, '88-7')],
-    [(False, '28-7'), (False, '78-7')],
-    [(False, '28-7'), (False, '68-7')],
-    [(False, '28-7'), (False, '58-7')],
-    [(False, '28-7'), (False, '48-7')],
-    [(False, '28-7'), (False, '38-7')],
-    [(False, '18-7'), (False, '88-7')],
-    [(False, '18-7'), (False, '78-7')],
-    [(False, '18-7'), (False, '68-7')],
-    [(False, '18-7'), (False, '58-7')],
-    [(False, '18-7'), (False, '48-7')],
-    [(False, '18-7'), (False, '38-7')],
-    [(False, '08-7'), (False, '88-7')],
-    [(False, '08-7'), (False, '78-7')],
-    [(False, '08-7'), (False, '68-7')],
-    [(False, '08-7'), (False, '58-7')],
-    [(False, '08-7'), (False, '48-7')],
-    [(False, '08-7'), (False, '38-7')],
-    [(True, '08-7'), (True, '18-7'), (True, '28-7'), (True, '38-7'), (True, '48-7'), (True, '58-7'), (True, '68-7'), (True, '78-7'), (True, '88-7')],
-    [(False, '50-8'), (False, '80-8')],
-    [(False, '50-8'), (False, '70-8')],
-    [(False, '50-8'), (False, '60-8')],
-    [(False, '40-8'), (False, '80-8')],
-    [(False, '40-8'), (False, '70-8')],
-    [(False, '40-8'), (False, '60-8')],
-    [(False, '30-8'), (False, '80-8')],
-    [(False, '30-8'), (False, '70-8')],
-    [(False, '30-8'), (False, '60-8')],
-    [(False, '20-8'), (False, '80-8')],
-    [(False, '20-8'), (False, '70-8')],
-    [(False, '20-8'), (False, '60-8')],
-    [(False, '20-8'), (False, '50-8')],
-    [(False, '20-8'), (False, '40-8')],
-    [(False, '20-8'), (False, '30-8')],
-    [(False, '10-8'), (False, '80-8')],
-    [(False, '10-8'), (False, '70-8')],
-    [(False, '10-8'), (False, '60-8')],
-    [(False, '10-8'), (False, '50-8')],
-    [(False, '10-8'), (False, '40-8')],
-    [(False, '10-8'), (False, '30-8')],
-    [(False, '00-8'), (False, '80-8')],
-    [(False, '00-8'), (False, '70-8')],
-    [(False, '00-8'), (False, '60-8')],
-    [(False, '00-8'), (False, '50-8')],
-    [(False, '00-8'), (False, '40-8')],
-    [(False, '00-8'), (False, '30-8')],
-    [(True, '00-8'), (True, '10-8'), (True, '20-8'), (True, '30-8'), (True, '40-8'), (True, '50-8'), (True, '60-8'), (True, '70-8'), (True, '80-8')],
-    [(False, '51-8'), (False, '81-8')],
-    [(False, '51-8'), (False, '71-8')],
-    [(False, '51-8'), (False, '61-8')],
-    [(False, '41-8'), (False, '81-8')],
-    [(False, '41-8'), (False, '71-8')],
-    [(False, '41-8'), (False, '61-8')],
-    [(False, '31-8'), (False, '81-8')],
-    [(False, '31-8'), (False, '71-8')],
-    [(False, '31-8'), (False, '61-8')],
-    [(False, '21-8'), (False, '81-8')],
-    [(False, '21-8'), (False, '71-8')],
-    [(False, '21-8'), (False, '61-8')],
-    [(False, '21-8'), (False, '51-8')],
-    [(False, '21-8'), (False, '41-8')],
-    [(False, '21-8'), (False, '31-8')],
-    [(False, '11-8'), (False, '81-8')],
-    [(False, '11-8'), (False, '71-8')],
-    [(False, '11-8'), (False, '61-8')],
-    [(False, '11-8'), (False, '51-8')],
-    [(False, '11-8'), (False, '41-8')],
-    [(False, '11-8'), (False, '31-8')],
-    [(False, '01-8'), (False, '81-8')],
-    [(False, '01-8'), (False, '71-8')],
-    [(False, '01-8'), (False, '61-8')],
-    [(False, '01-8'), (False, '51-8')],
-    [(False, '01-8'), (False, '41-8')],
-    [(False, '01-8'), (False, '31-8')],
-    [(True, '01-8'), (True, '11-8'), (True, '21-8'), (True, '31-8'), (True, '41-8'), (True, '51-8'), (True, '61-8'), (True, '71-8'), (True, '81-8')],
-    [(False, '52-8'), (False, '82-8')],
-    [(False, '52-8'), (False, '72-8')],
-    [(False, '52-8'), (False, '62-8')],
-    [(False, '42-8'), (False, '82-8')],
-    [(False, '42-8'), (False, '72-8')],
-    [(False, '42-8'), (False, '62-8')],
-    [(False, '32-8'), (False, '82-8')],
-    [(False, '32-8'), (False, '72-8')],
-    [(False, '32-8'), (False, '62-8')],
-    [(False, '22-8'), (False, '82-8')],
-    [(False, '22-8'), (False, '72-8')],
-    [(False, '22-8'), (False, '62-8')],
-    [(False, '22-8'), (False, '52-8')],
-    [(False, '22-8'), (False, '42-8')],
-    [(False, '22-8'), (False, '32-8')],
-    [(False, '12-8'), (False, '82-8')],
-    [(False, '12-8'), (False, '72-8')],
-    [(False, '12-8'), (False, '62-8')],
-    [(False, '12-8'), (False, '52-8')],
-    [(False, '12-8'), (False, '42-8')],
-    [(False, '12-8'), (False, '32-8')],
-    [(False, '02-8'), (False, '82-8')],
-    [(False, '02-8'), (False, '72-8')],
-    [(False, '02-8'), (False, '62-8')],
-    [(False, '02-8'), (False, '52-8')],
-    [(False, '02-8'), (False, '42-8')],
-    [(False, '02-8'), (False, '32-8')],
-    [(True, '02-8'), (True, '12-8'), (True, '22-8'), (True, '32-8'), (True, '42-8'), (True, '52-8'), (True, '62-8'), (True, '72-8'), (True, '82-8')],
-    [(False, '53-8'), (False, '83-8')],
-    [(False, '53-8'), (False, '73-8')],
-    [(False, '53-8'), (False, '63-8')],
-    [(False, '43-8'), (False, '83-8')],
-    [(False, '43-8'), (False, '73-8')],
-    [(False, '43-8'), (False, '63-8')],
-    [(False, '33-8'), (False, '83-8')],
-    [(False, '33-8'), (False, '73-8')],
-    [(False, '33-8'), (False, '63-8')],
-    [(False, '23-8'), (False, '83-8')],
-    [(False, '23-8'), (False, '73-8')],
-    [(False, '23-8'), (False, '63-8')],
-    [(False, '23-8'), (False, '53-8')],
-    [(False, '23-8'), (False, '43-8')],
-    [(False, '23-8'), (False, '33-8')],
-    [(False, '13-8'), (False, '83-8')],
-    [(False, '13-8'), (False, '73-8')],
-    [(False, '13-8'), (False, '63-8')],
-    [(False, '13-8'), (False, '53-8')],
-    [(False, '13-8'), (False, '43-8')],
-    [(False, '13-8'), (False, '33-8')],
-    [(False, '03-8'), (False, '83-8')],
-    [(False, '03-8'), (False, '73-8')],
-    [(False, '03-8'), (False, '63-8')],
-    [(False, '03-8'), (False, '53-8')],
-    [(False, '03-8'), (False, '43-8')],
-    [(False, '03-8'), (False, '33-8')],
-    [(True, '03-8'), (True, '13-8'), (True, '23-8'), (True, '33-8'), (True, '43-8'), (True, '53-8'), (True, '63-8'), (True, '73-8'), (True, '83-8')],
-    [(False, '54-8'), (False, '84-8')],
-    [(False, '54-8'), (False, '74-8')],
-    [(False, '54-8'), (False, '64-8')],
-    [(False, '44-8'), (False, '84-8')],
-    [(False, '44-8'), (False, '74-8')],
-    [(False, '44-8'), (False, '64-8')],
-    [(False, '34-8'), (False, '84-8')],
-    [(False, '34-8'), (False, '74-8')],
-    [(False, '34-8'), (False, '64-8')],
-    [(False, '24-8'), (False, '84-8')],
-    [(False, '24-8'), (False, '74-8')],
-    [(False, '24-8'), (False, '64-8')],
-    [(False, '24-8'), (False, '54-8')],
-    [(False, '24-8'), (False, '44-8')],
-    [(False, '24-8'), (False, '34-8')],
-    [(False, '14-8'), (False, '84-8')],
-    [(False, '14-8'), (False, '74-8')],
-    [(False, '14-8'), (False, '64-8')],
-    [(False, '14-8'), (False, '54-8')],
-    [(False, '14-8'), (False, '44-8')],
-    [(False, '14-8'), (False, '34-8')],
-    [(False, '04-8'), (False, '84-8')],
-    [(False, '04-8'), (False, '74-8')],
-    [(False, '04-8'), (False, '64-8')],
-    [(False, '04-8'), (False, '54-8')],
-    [(False, '04-8'), (False, '44-8')],
-    [(False, '04-8'), (False, '34-8')],
-    [(True, '04-8'), (True, '14-8'), (True, '24-8'), (True, '34-8'), (True, '44-8'), (True, '54-8'), (True, '64-8'), (True, '74-8'), (True, '84-8')],
-    [(False, '55-8'), (False, '85-8')],
-    [(False, '55-8'), (False, '75-8')],
-    [(False, '55-8'), (False, '65-8')],
-    [(False, '45-8'), (False, '85-8')],
-    [(False, '45-8'), (False, '75-8')],
-    [(False, '45-8'), (False, '65-8')],
-    [(False, '35-8'), (False, '85-8')],
-    [(False, '35-8'), (False, '75-8')],
-    [(False, '35-8'), (False, '65-8')],
-    [(False, '25-8'), (False, '85-8')],
-    [(False, '25-8'), (False, '75-8')],
-    [(False, '25-8'), (False, '65-8')],
-    [(False, '25-8'), (False, '55-8')],
-    [(False, '25-8'), (False, '45-8')],
-    [(False, '25-8'), (False, '35-8')],
-    [(False, '15-8'), (False, '85-8')],
-    [(False, '15-8'), (False, '75-8')],
-    [(False, '15-8'), (False, '65-8')],
-    [(False, '15-8'), (False, '55-8')],
-    [(False, '15-8'), (False, '45-8')],
-    [(False, '15-8'), (False, '35-8')],
-    [(False, '05-8'), (False, '85-8')],
-    [(False, '05-8'), (False, '75-8')],
-    [(False, '05-8'), (False, '65-8')],
-    [(False, '05-8'), (False, '55-8')],
-    [(False, '05-8'), (False, '45-8')],
-    [(False, '05-8'), (False, '35-8')],
-    [(True, '05-8'), (True, '15-8'), (True, '25-8'), (True, '35-8'), (True, '45-8'), (True, '55-8'), (True, '65-8'), (True, '75-8'), (True, '85-8')],
-    [(False, '56-8'), (False, '86-8')],
-    [(False, '56-8'), (False, '76-8')],
-    [(False, '56-8'), (False, '66-8')],
-    [(False, '46-8'), (False, '86-8')],
-    [(False, '46-8'), (False, '76-8')],
-    [(False, '46-8'), (False, '66-8')],
-    [(False, '36-8'), (False, '86-8')],
-    [(False, '36-8'), (False, '76-8')],
-    [(False, '36-8'), (False, '66-8')],
-    [(False, '26-8'), (False, '86-8')],
-    [(False, '26-8'), (False, '76-8')],
-    [(False, '26-8'), (False, '66-8')],
-    [(False, '26-8'), (False, '56-8')],
-    [(False, '26-8'), (False, '46-8')],
-    [(False, '26-8'), (False, '36-8')],
-    [(False, '16-8'), (False, '86-8')],
-    [(False, '16-8'), (False, '76-8')],
-    [(False, '16-8'), (False, '66-8')],
-    [(False, '16-8'), (False, '56-8')],
-    [(False, '16-8'), (False, '46-8')],
-    [(False, '16-8'), (False, '36-8')],
-    [(False, '06-8'), (False, '86-8')],
-    [(False, '06-8'), (False, '76-8')],
-    [(False, '06-8'), (False, '66-8')],
-    [(False, '06-8'), (False, '56-8')],
-    [(False, '06-8'), (False, '46-8')],
-    [(False, '06-8'), (False, '36-8')],
-    [(True, '06-8'), (True, '16-8'), (True, '26-8'), (True, '36-8'), (True, '46-8'), (True, '56-8'), (True, '66-8'), (True, '76-8'), (True, '86-8')],
-    [(False, '57-8'), (False, '87-8')],
-    [(False, '57-8'), (False, '77-8')],
-    [(False, '57-8'), (False, '67-8')],
-    [(False, '47-8'), (False, '87-8')],
-    [(False, '47-8'), (False, '77-8')],
-    [(False, '47-8'), (False, '67-8')],
-    [(False, '37-8'), (False, '87-8')],
-    [(False, '37-8'), (False, '77-8')],
-    [(False, '37-8'), (False, '67-8')],
-    [(False, '27-8'), (False, '87-8')],
-    [(False, '27-8'), (False, '77-8')],
-    [(False, '27-8'), (False, '67-8')],
-    [(False, '27-8'), (False, '57-8')],
-    [(False, '27-8'), (False, '47-8')],
-    [(False, '27-8'), (False, '37-8')],
-    [(False, '17-8'), (False, '87-8')],
-    [(False, '17-8'), (False, '77-8')],
-    [(False, '17-8'), (False, '67-8')],
-    [(False, '17-8'), (False, '57-8')],
-    [(False, '17-8'), (False, '47-8')],
-    [(False, '17-8'), (False, '37-8')],
-    [(False, '07-8'), (False, '87-8')],
-    [(False, '07-8'), (False, '77-8')],
-    [(False, '07-8'), (False, '67-8')],
-    [(False, '07-8'), (False, '57-8')],
-    [(False, '07-8'), (False, '47-8')],
-    [(False, '07-8'), (False, '37-8')],
-    [(True, '07-8'), (True, '17-8'), (True, '27-8'), (True, '37-8'), (True, '47-8'), (True, '57-8'), (True, '67-8'), (True, '77-8'), (True, '87-8')],
-    [(False, '58-8'), (False, '88-8')],
-    [(False, '58-8'), (False, '78-8')],
-    [(False, '58-8'), (False, '68-8')],
-    [(False, '48-8'), (False, '88-8')],
-    [(False, '48-8'), (False, '78-8')],
-    [(False, '48-8'), (False, '68-8')],
-    [(False, '38-8'), (False, '88-8')],
-    [(False, '38-8'), (False, '78-8')],
-    [(False, '38-8'), (False, '68-8')],
-    [(False, '28-8'), (False, '88-8')],
-    [(False, '28-8'), (False, '78-8')],
-    [(False, '28-8'), (False, '68-8')],
-    [(False, '28-8'), (False, '58-8')],
-    [(False, '28-8'), (False, '48-8')],
-    [(False, '28-8'), (False, '38-8')],
-    [(False, '18-8'), (False, '88-8')],
-    [(False, '18-8'), (False, '78-8')],
-    [(False, '18-8'), (False, '68-8')],
-    [(False, '18-8'), (False, '58-8')],
-    [(False, '18-8'), (False, '48-8')],
-    [(False, '18-8'), (False, '38-8')],
-    [(False, '08-8'), (False, '88-8')],
-    [(False, '08-8'), (False, '78-8')],
-    [(False, '08-8'), (False, '68-8')],
-    [(False, '08-8'), (False, '58-8')],
-    [(False, '08-8'), (False, '48-8')],
-    [(False, '08-8'), (False, '38-8')],
-    [(True, '08-8'), (True, '18-8'), (True, '28-8'), (True, '38-8'), (True, '48-8'), (True, '58-8'), (True, '68-8'), (True, '78-8'), (True, '88-8')],
-    [(False, '50-9'), (False, '80-9')],
-    [(False, '50-9'), (False, '70-9')],
-    [(False, '50-9'), (False, '60-9')],
-    [(False, '40-9'), (False, '80-9')],
-    [(False, '40-9'), (False, '70-9')],
-    [(False, '40-9'), (False, '60-9')],
-    [(False, '30-9'), (False, '80-9')],
-    [(False, '30-9'), (False, '70-9')],
-    [(False, '30-9'), (False, '60-9')],
-    [(False, '20-9'), (False, '80-9')],
-    [(False, '20-9'), (False, '70-9')],
-    [(False, '20-9'), (False, '60-9')],
-    [(False, '20-9'), (False, '50-9')],
-    [(False, '20-9'), (False, '40-9')],
-    [(False, '20-9'), (False, '30-9')],
-    [(False, '10-9'), (False, '80-9')],
-    [(False, '10-9'), (False, '70-9')],
-    [(False, '10-9'), (False, '60-9')],
-    [(False, '10-9'), (False, '50-9')],
-    [(False, '10-9'), (False, '40-9')],
-    [(False, '10-9'), (False, '30-9')],
-    [(False, '00-9'), (False, '80-9')],
-    [(False, '00-9'), (False, '70-9')],
-    [(False, '00-9'), (False, '60-9')],
-    [(False, '00-9'), (False, '50-9')],
-    [(False, '00-9'), (False, '40-9')],
-    [(False, '00-9'), (False, '30-9')],
-    [(True, '00-9'), (True, '10-9'), (True, '20-9'), (True, '30-9'), (True, '40-9'), (True, '50-9'), (True, '60-9'), (True, '70-9'), (True, '80-9')],
-    [(False, '51-9'), (False, '81-9')],
-    [(False, '51-9'), (False, '71-9')],
-    [(False, '51-9'), (False, '61-9')],
-    [(False, '41-9'), (False, '81-9')],
-    [(False, '41-9'), (False, '71-9')],
-    [(False, '41-9'), (False, '61-9')],
-    [(False, '31-9'), (False, '81-9')],
-    [(False, '31-9'), (False, '71-9')],
-    [(False, '31-9'), (False, '61-9')],
-    [(False, '21-9'), (False, '81-9')],
-    [(False, '21-9'), (False, '71-9')],
-    [(False, '21-9'), (False, '61-9')],
-    [(False, '21-9'), (False, '51-9')],
-    [(False, '21-9'), (False, '41-9')],
-    [(False, '21-9'), (False, '31-9')],
-    [(False, '11-9'), (False, '81-9')],
-    [(False, '11-9'), (False, '71-9')],
-    [(False, '11-9'), (False, '61-9')],
-    [(False, '11-9'), (False, '51-9')],
-    [(False, '11-9'), (False, '41-9')],
-    [(False, '11-9'), (False, '31-9')],
-    [(False, '01-9'), (False, '81-9')],
-    [(False, '01-9'), (False, '71-9')],
-    [(False, '01-9'), (False, '61-9')],
-    [(False, '01-9'), (False, '51-9')],
-    [(False, '01-9'), (False, '41-9')],
-    [(False, '01-9'), (False, '31-9')],
-    [(True, '01-9'), (True, '11-9'), (True, '21-9'), (True, '31-9'), (True, '41-9'), (True, '51-9'), (True, '61-9'), (True, '71-9'), (True, '81-9')],
-    [(False, '52-9'), (False, '82-9')],
-    [(False, '52-9'), (False, '72-9')],
-    [(False, '52-9'), (False, '62-9')],
-    [(False, '42-9'), (False, '82-9')],
-    [(False, '42-9'), (False, '72-9')],
-    [(False, '42-9'), (False, '62-9')],
-    [(False, '32-9'), (False, '82-9')],
-    [(False, '32-9'), (False, '72-9')],
-    [(False, '32-9'), (False, '62-9')],
-    [(False, '22-9'), (False, '82-9')],
-    [(False, '22-9'), (False, '72-9')],
-    [(False, '22-9'), (False, '62-9')],
-    [(False, '22-9'), (False, '52-9')],
-    [(False, '22-9'), (False, '42-9')],
-    [(False, '22-9'), (False, '32-9')],
-    [(False, '12-9'), (False, '82-9')],
-    [(False, '12-9'), (False, '72-9')],
-    [(False, '12-9'), (False, '62-9')],
-    [(False, '12-9'), (False, '52-9')],
-    [(False, '12-9'), (False, '42-9')],
-    [(False, '12-9'), (False, '32-9')],
-    [(False, '02-9'), (False, '82-9')],
-    [(False, '02-9'), (False, '72-9')],
-    [(False, '02-9'), (False, '62-9')],
-    [(False, '02-9'), (False, '52-9')],
-    [(False, '02-9'), (False, '42-9')],
-    [(False, '02-9'), (False, '32-9')],
-    [(True, '02-9'), (True, '12-9'), (True, '22-9'), (True, '32-9'), (True, '42-9'), (True, '52-9'), (True, '62-9'), (True, '72-9'), (True, '82-9')],
-    [(False, '53-9'), (False, '83-9')],
-    [(False, '53-9'), (False, '73-9')],
-    [(False, '53-9'), (False, '63-9')],
-    [(False, '43-9'), (False, '83-9')],
-    [(False, '43-9'), (False, '73-9')],
-    [(False, '43-9'), (False, '63-9')],
-    [(False, '33-9'), (False, '83-9')],
-    [(False, '33-9'), (False, '73-9')],
-    [(False, '33-9'), (False, '63-9')],
-    [(False, '23-9'), (False, '83-9')],
-    [(False, '23-9'), (False, '73-9')],
-    [(False, '23-9'), (False, '63-9')],
-    [(False, '23-9'), (False, '53-9')],
-    [(False, '23-9'), (False, '43-9')],
-    [(False, '23-9'), (False, '33-9')],
-    [(False, '13-9'), (False, '83-9')],
-    [(False, '13-9'), (False, '73-9')],
-    [(False, '13-9'), (False, '63-9')],
-    [(False, '13-9'), (False, '53-9')],
-    [(False, '13-9'), (False, '43-9')],
-    [(False, '13-9'), (False, '33-9')],
-    [(False, '03-9'), (False, '83-9')],
-    [(False, '03-9'), (False, '73-9')],
-    [(False, '03-9'), (False, '63-9')],
-    [(False, '03-9'), (False, '53-9')],
-    [(False, '03-9'), (False, '43-9')],
-    [(False, '03-9'), (False, '33-9')],
-    [(True, '03-9'), (True, '13-9'), (True, '23-9'), (True, '33-9'), (True, '43-9'), (True, '53-9'), (True, '63-9'), (True, '73-9'), (True, '83-9')],
-    [(False, '54-9'), (False, '84-9')],
-    [(False, '54-9'), (False, '74-9')],
-    [(False, '54-9'), (False, '64-9')],
-    [(False, '44-9'), (False, '84-9')],
-    [(False, '44-9'), (False, '74-9')],
-    [(False, '44-9'), (False, '64-9')],
-    [(False, '34-9'), (False, '84-9')],
-    [(False, '34-9'), (False, '74-9')],
-    [(False, '34-9'), (False, '64-9')],
-    [(False, '24-9'), (False, '84-9')],
-    [(False, '24-9'), (False, '74-9')],
-    [(False, '24-9'), (False, '64-9')],
-    [(False, '24-9'), (False, '54-9')],
-    [(False, '24-9'), (False, '44-9')],
-    [(False, '24-9'), (False, '34-9')],
-    [(False, '14-9'), (False, '84-9')],
-    [(False, '14-9'), (False, '74-9')],
-    [(False, '14-9'), (False, '64-9')],
-    [(False, '14-9'), (False, '54-9')],
-    [(False, '14-9'), (False, '44-9')],
-    [(False, '14-9'), (False, '34-9')],
-    [(False, '04-9'), (False, '84-9')],
-    [(False, '04-9'), (False, '74-9')],
-    [(False, '04-9'), (False, '64-9')],
-    [(False, '04-9'), (False, '54-9')],
-    [(False, '04-9'), (False, '44-9')],
-    [(False, '04-9'), (False, '34-9')],
-    [(True, '04-9'), (True, '14-9'), (True, '24-9'), (True, '34-9'), (True, '44-9'), (True, '54-9'), (True, '64-9'), (True, '74-9'), (True, '84-9')],
-    [(False, '55-9'), (False, '85-9')],
-    [(False, '55-9'), (False, '75-9')],
-    [(False, '55-9'), (False, '65-9')],
-    [(False, '45-9'), (False, '85-9')],
-    [(False, '45-9'), (False, '75-9')],
-    [(False, '45-9'), (False, '65-9')],
-    [(False, '35-9'), (False, '85-9')],
-    [(False, '35-9'), (False, '75-9')],
-    [(False, '35-9'), (False, '65-9')],
-    [(False, '25-9'), (False, '85-9')],
-    [(False, '25-9'), (False, '75-9')],
-    [(False, '25-9'), (False, '65-9')],
-    [(False, '25-9'), (False, '55-9')],
-    [(False, '25-9'), (False, '45-9')],
-    [(False, '25-9'), (False, '35-9')],
-    [(False, '15-9'), (False, '85-9')],
-    [(False, '15-9'), (False, '75-9')],
-    [(False, '15-9'), (False, '65-9')],
-    [(False, '15-9'), (False, '55-9')],
-    [(False, '15-9'), (False, '45-9')],
-    [(False, '15-9'), (False, '35-9')],
-    [(False, '05-9'), (False, '85-9')],
-    [(False, '05-9'), (False, '75-9')],
-    [(False, '05-9'), (False, '65-9')],
-    [(False, '05-9'), (False, '55-9')],
-    [(False, '05-9'), (False, '45-9')],
-    [(False, '05-9'), (False, '35-9')],
-    [(True, '05-9'), (True, '15-9'), (True, '25-9'), (True, '35-9'), (True, '45-9'), (True, '55-9'), (True, '65-9'), (True, '75-9'), (True, '85-9')],
-    [(False, '56-9'), (False, '86-9')],
-    [(False, '56-9'), (False, '76-9')],
-    [(False, '56-9'), (False, '66-9')],
-    [(False, '46-9'), (False, '86-9')],
-    [(False, '46-9'), (False, '76-9')],
-    [(False, '46-9'), (False, '66-9')],
-    [(False, '36-9'), (False, '86-9')],
-    [(False, '36-9'), (False, '76-9')],
-    [(False, '36-9'), (False, '66-9')],
-    [(False, '26-9'), (False, '86-9')],
-    [(False, '26-9'), (False, '76-9')],
-    [(False, '26-9'), (False, '66-9')],
-    [(False, '26-9'), (False, '56-9')],
-    [(False, '26-9'), (False, '46-9')],
-    [(False, '26-9'), (False, '36-9')],
-    [(False, '16-9'), (False, '86-9')],
-    [(False, '16-9'), (False, '76-9')],
-    [(False, '16-9'), (False, '66-9')],
-    [(False, '16-9'), (False, '56-9')],
-    [(False, '16-9'), (False, '46-9')],
-    [(False, '16-9'), (False, '36-9')],
-    [(False, '06-9'), (False, '86-9')],
-    [(False, '06-9'), (False, '76-9')],
-    [(False, '06-9'), (False, '66-9')],
-    [(False, '06-9'), (False, '56-9')],
-    [(False, '06-9'), (False, '46-9')],
-    [(False, '06-9'), (False, '36-9')],
-    [(True, '06-9'), (True, '16-9'), (True, '26-9'), (True, '36-9'), (True, '46-9'), (True, '56-9'), (True, '66-9'), (True, '76-9'), (True, '86-9')],
-    [(False, '57-9'), (False, '87-9')],
-    [(False, '57-9'), (False, '77-9')],
-    [(False, '57-9'), (False, '67-9')],
-    [(False, '47-9'), (False, '87-9')],
-    [(False, '47-9'), (False, '77-9')],
-    [(False, '47-9'), (False, '67-9')],
-    [(False, '37-9'), (False, '87-9')],
-    [(False, '37-9'), (False, '77-9')],
-    [(False, '37-9'), (False, '67-9')],
-    [(False, '27-9'), (False, '87-9')],
-    [(False, '27-9'), (False, '77-9')],
-    [(False, '27-9'), (False, '67-9')],
-    [(False, '27-9'), (False, '57-9')],
-    [(False, '27-9'), (False, '47-9')],
-    [(False, '27-9'), (False, '37-9')],
-    [(False, '17-9'), (False, '87-9')],
-    [(False, '17-9'), (False, '77-9')],
-    [(False, '17-9'), (False, '67-9')],
-    [(False, '17-9'), (False, '57-9')],
-    [(False, '17-9'), (False, '47-9')],
-    [(False, '17-9'), (False, '37-9')],
-    [(False, '07-9'), (False, '87-9')],
-    [(False, '07-9'), (False, '77-9')],
-    [(False, '07-9'), (False, '67-9')],
-    [(False, '07-9'), (False, '57-9')],
-    [(False, '07-9'), (False, '47-9')],
-    [(False, '07-9'), (False, '37-9')],
-    [(True, '07-9'), (True, '17-9'), (True, '27-9'), (True, '37-9'), (True, '47-9'), (True, '57-9'), (True, '67-9'), (True, '77-9'), (True, '87-9')],
-    [(False, '58-9'), (False, '88-9')],
-    [(False, '58-9'), (False, '78-9')],
-    [(False, '58-9'), (False, '68-9')],
-    [(False, '48-9'), (False, '88-9')],
-    [(False, '48-9'), (False, '78-9')],
-    [(False, '48-9'), (False, '68-9')],
-    [(False, '38-9'), (False, '88-9')],
-    [(False, '38-9'), (False, '78-9')],
-    [(False, '38-9'), (False, '68-9')],
-    [(False, '28-9'), (False, '88-9')],
-    [(False, '28-9'), (False, '78-9')],
-    [(False, '28-9'), (False, '68-9')],
-    [(False, '28-9'), (False, '58-9')],
-    [(False, '28-9'), (False, '48-9')],
-    [(False, '28-9'), (False, '38-9')],
-    [(False, '18-9'), (False, '88-9')],
-    [(False, '18-9'), (False, '78-9')],
-    [(False, '18-9'), (False, '68-9')],
-    [(False, '18-9'), (False, '58-9')],
-    [(False, '18-9'), (False, '48-9')],
-    [(False, '18-9'), (False, '38-9')],
-    [(False, '08-9'), (False, '88-9')],
-    [(False, '08-9'), (False, '78-9')],
-    [(False, '08-9'), (False, '68-9')],
-    [(False, '08-9'), (False, '58-9')],
-    [(False, '08-9'), (False, '48-9')],
-    [(False, '08-9'), (False, '38-9')],
-    [(True, '08-9'), (True, '18-9'), (True, '28-9'), (True, '38-9'), (True, '48-9'), (True, '58-9'), (True, '68-9'), (True, '78-9'), (True, '88-9')],
-    [(False, '21-1'), (False, '22-1')],
-    [(False, '20-1'), (False, '22-1')],
-    [(False, '20-1'), (False, '21-1')],
-    [(False, '12-1'), (False, '22-1')],
-    [(False, '12-1'), (False, '21-1')],
-    [(False, '12-1'), (False, '20-1')],
-    [(False, '11-1'), (False, '22-1')],
-    [(False, '11-1'), (False, '21-1')],
-    [(False, '11-1'), (False, '20-1')],
-    [(False, '11-1'), (False, '12-1')],
-    [(False, '10-1'), (False, '22-1')],
-    [(False, '10-1'), (False, '21-1')],
-    [(False, '10-1'), (False, '20-1')],
-    [(False, '10-1'), (False, '12-1')],
-    [(False, '10-1'), (False, '11-1')],
-    [(False, '02-1'), (False, '22-1')],
-    [(False, '02-1'), (False, '21-1')],
-    [(False, '02-1'), (False, '20-1')],
-    [(False, '02-1'), (False, '12-1')],
-    [(False, '02-1'), (False, '11-1')],
-    [(False, '02-1'), (False, '10-1')],
-    [(False, '01-1'), (False, '22-1')],
-    [(False, '01-1'), (False, '21-1')],
-    [(False, '01-1'), (False, '20-1')],
-    [(False, '01-1'), (False, '12-1')],
-    [(False, '01-1'), (False, '11-1')],
-    [(False, '01-1'), (False, '10-1')],
-    [(False, '01-1'), (False, '02-1')],
-    [(False, '00-1'), (False, '22-1')],
-    [(False, '00-1'), (False, '21-1')],
-    [(False, '00-1'), (False, '20-1')],
-    [(False, '00-1'), (False, '12-1')],
-    [(False, '00-1'), (False, '11-1')],
-    [(False, '00-1'), (False, '10-1')],
-    [(False, '00-1'), (False, '02-1')],
-    [(False, '00-1'), (False, '01-1')],
-    [(True, '00-1'), (True, '01-1'), (True, '02-1'), (True, '10-1'), (True, '11-1'), (True, '12-1'), (True, '20-1'), (True, '21-1'), (True, '22-1')],
-    [(False, '21-2'), (False, '22-2')],
-    [(False, '20-2'), (False, '22-2')],
-    [(False, '20-2'), (False, '21-2')],
-    [(False, '12-2'), (False, '22-2')],
-    [(False, '12-2'), (False, '21-2')],
-    [(False, '12-2'), (False, '20-2')],
-    [(False, '11-2'), (False, '22-2')],
-    [(False, '11-2'), (False, '21-2')],
-    [(False, '11-2'), (False, '20-2')],
-    [(False, '11-2'), (False, '12-2')],
-    [(False, '10-2'), (False, '22-2')],
-    [(False, '10-2'), (False, '21-2')],
-    [(False, '10-2'), (False, '20-2')],
-    [(False, '10-2'), (False, '12-2')],
-    [(False, '10-2'), (False, '11-2')],
-    [(False, '02-2'), (False, '22-2')],
-    [(False, '02-2'), (False, '21-2')],
-    [(False, '02-2'), (False, '20-2')],
-    [(False, '02-2'), (False, '12-2')],
-    [(False, '02-2'), (False, '11-2')],
-    [(False, '02-2'), (False, '10-2')],
-    [(False, '01-2'), (False, '22-2')],
-    [(False, '01-2'), (False, '21-2')],
-    [(False, '01-2'), (False, '20-2')],
-    [(False, '01-2'), (False, '12-2')],
-    [(False, '01-2'), (False, '11-2')],
-    [(False, '01-2'), (False, '10-2')],
-    [(False, '01-2'), (False, '02-2')],
-    [(False, '00-2'), (False, '22-2')],
-    [(False, '00-2'), (False, '21-2')],
-    [(False, '00-2'), (False, '20-2')],
-    [(False, '00-2'), (False, '12-2')],
-    [(False, '00-2'), (False, '11-2')],
-    [(False, '00-2'), (False, '10-2')],
-    [(False, '00-2'), (False, '02-2')],
-    [(False, '00-2'), (False, '01-2')],
-    [(True, '00-2'), (True, '01-2'), (True, '02-2'), (True, '10-2'), (True, '11-2'), (True, '12-2'), (True, '20-2'), (True, '21-2'), (True, '22-2')],
-    [(False, '21-3'), (False, '22-3')],
-    [(False, '20-3'), (False, '22-3')],
-    [(False, '20-3'), (False, '21-3')],
-    [(False, '12-3'), (False, '22-3')],
-    [(False, '12-3'), (False, '21-3')],
-    [(False, '12-3'), (False, '20-3')],
-    [(False, '11-3'), (False, '22-3')],
-    [(False, '11-3'), (False, '21-3')],
-    [(False, '11-3'), (False, '20-3')],
-    [(False, '11-3'), (False, '12-3')],
-    [(False, '10-3'), (False, '22-3')],
-    [(False, '10-3'), (False, '21-3')],
-    [(False, '10-3'), (False, '20-3')],
-    [(False, '10-3'), (False, '12-3')],
-    [(False, '10-3'), (False, '11-3')],
-    [(False, '02-3'), (False, '22-3')],
-    [(False, '02-3'), (False, '21-3')],
-    [(False, '02-3'), (False, '20-3')],
-    [(False, '02-3'), (False, '12-3')],
-    [(False, '02-3'), (False, '11-3')],
-    [(False, '02-3'), (False, '10-3')],
-    [(False, '01-3'), (False, '22-3')],
-    [(False, '01-3'), (False, '21-3')],
-    [(False, '01-3'), (False, '20-3')],
-    [(False, '01-3'), (False, '12-3')],
-    [(False, '01-3'), (False, '11-3')],
-    [(False, '01-3'), (False, '10-3')],
-    [(False, '01-3'), (False, '02-3')],
-    [(False, '00-3'), (False, '22-3')],
-    [(False, '00-3'), (False, '21-3')],
-    [(False, '00-3'), (False, '20-3')],
-    [(False, '00-3'), (False, '12-3')],
-    [(False, '00-3'), (False, '11-3')],
-    [(False, '00-3'), (False, '10-3')],
-    [(False, '00-3'), (False, '02-3')],
-    [(False, '00-3'), (False, '01-3')],
-    [(True, '00-3'), (True, '01-3'), (True, '02-3'), (True, '10-3'), (True, '11-3'), (True, '12-3'), (True, '20-3'), (True, '21-3'), (True, '22-3')],
-    [(False, '21-4'), (False, '22-4')],
-    [(False, '20-4'), (False, '22-4')],
-    [(False, '20-4'), (False, '21-4')],
-    [(False, '12-4'), (False, '22-4')],
-    [(False, '12-4'), (False, '21-4')],
-    [(False, '12-4'), (False, '20-4')],
-    [(False, '11-4'), (False, '22-4')],
-    [(False, '11-4'), (False, '21-4')],
-    [(False, '11-4'), (False, '20-4')],
-    [(False, '11-4'), (False, '12-4')],
-    [(False, '10-4'), (False, '22-4')],
-    [(False, '10-4'), (False, '21-4')],
-    [(False, '10-4'), (False, '20-4')],
-    [(False, '10-4'), (False, '12-4')],
-    [(False, '10-4'), (False, '11-4')],
-    [(False, '02-4'), (False, '22-4')],
-    [(False, '02-4'), (False, '21-4')],
-    [(False, '02-4'), (False, '20-4')],
-    [(False, '02-4'), (False, '12-4')],
-    [(False, '02-4'), (False, '11-4')],
-    [(False, '02-4'), (False, '10-4')],
-    [(False, '01-4'), (False, '22-4')],
-    [(False, '01-4'), (False, '21-4')],
-    [(False, '01-4'), (False, '20-4')],
-    [(False, '01-4'), (False, '12-4')],
-    [(False, '01-4'), (False, '11-4')],
-    [(False, '01-4'), (False, '10-4')],
-    [(False, '01-4'), (False, '02-4')],
-    [(False, '00-4'), (False, '22-4')],
-    [(False, '00-4'), (False, '21-4')],
-    [(False, '00-4'), (False, '20-4')],
-    [(False, '00-4'), (False, '12-4')],
-    [(False, '00-4'), (False, '11-4')],
-    [(False, '00-4'), (False, '10-4')],
-    [(False, '00-4'), (False, '02-4')],
-    [(False, '00-4'), (False, '01-4')],
-    [(True, '00-4'), (True, '01-4'), (True, '02-4'), (True, '10-4'), (True, '11-4'), (True, '12-4'), (True, '20-4'), (True, '21-4'), (True, '22-4')],
-    [(False, '21-5'), (False, '22-5')],
-    [(False, '20-5'), (False, '22-5')],
-    [(False, '20-5'), (False, '21-5')],
-    [(False, '12-5'), (False, '22-5')],
-    [(False, '12-5'), (False, '21-5')],
-    [(False, '12-5'), (False, '20-5')],
-    [(False, '11-5'), (False, '22-5')],
-    [(False, '11-5'), (False, '21-5')],
-    [(False, '11-5'), (False, '20-5')],
-    [(False, '11-5'), (False, '12-5')],
-    [(False, '10-5'), (False, '22-5')],
-    [(False, '10-5'), (False, '21-5')],
-    [(False, '10-5'), (False, '20-5')],
-    [(False, '10-5'), (False, '12-5')],
-    [(False, '10-5'), (False, '11-5')],
-    [(False, '02-5'), (False, '22-5')],
-    [(False, '02-5'), (False, '21-5')],
-    [(False, '02-5'), (False, '20-5')],
-    [(False, '02-5'), (False, '12-5')],
-    [(False, '02-5'), (False, '11-5')],
-    [(False, '02-5'), (False, '10-5')],
-    [(False, '01-5'), (False, '22-5')],
-    [(False, '01-5'), (False, '21-5')],
-    [(False, '01-5'), (False, '20-5')],
-    [(False, '01-5'), (False, '12-5')],
-    [(False, '01-5'), (False, '11-5')],
-    [(False, '01-5'), (False, '10-5')],
-    [(False, '01-5'), (False, '02-5')],
-    [(False, '00-5'), (False, '22-5')],
-    [(False, '00-5'), (False, '21-5')],
-    [(False, '00-5'), (False, '20-5')],
-    [(False, '00-5'), (False, '12-5')],
-    [(False, '00-5'), (False, '11-5')],
-    [(False, '00-5'), (False, '10-5')],
-    [(False, '00-5'), (False, '02-5')],
-    [(False, '00-5'), (False, '01-5')],
-    [(True, '00-5'), (True, '01-5'), (True, '02-5'), (True, '10-5'), (True, '11-5'), (True, '12-5'), (True, '20-5'), (True, '21-5'), (True, '22-5')],
-    [(False, '21-6'), (False, '22-6')],
-    [(False, '20-6'), (False, '22-6')],
-    [(False, '20-6'), (False, '21-6')],
-    [(False, '12-6'), (False, '22-6')],
-    [(False, '12-6'), (False, '21-6')],
-    [(False, '12-6'), (False, '20-6')],
-    [(False, '11-6'), (False, '22-6')],
-    [(False, '11-6'), (False, '21-6')],
-    [(False, '11-6'), (False, '20-6')],
-    [(False, '11-6'), (False, '12-6')],
-    [(False, '10-6'), (False, '22-6')],
-    [(False, '10-6'), (False, '21-6')],
-    [(False, '10-6'), (False, '20-6')],
-    [(False, '10-6'), (False, '12-6')],
-    [(False, '10-6'), (False, '11-6')],
-    [(False, '02-6'), (False, '22-6')],
-    [(False, '02-6'), (False, '21-6')],
-    [(False, '02-6'), (False, '20-6')],
-    [(False, '02-6'), (False, '12-6')],
-    [(False, '02-6'), (False, '11-6')],
-    [(False, '02-6'), (False, '10-6')],
-    [(False, '01-6'), (False, '22-6')],
-    [(False, '01-6'), (False, '21-6')],
-    [(False, '01-6'), (False, '20-6')],
-    [(False, '01-6'), (False, '12-6')],
-    [(False, '01-6'), (False, '11-6')],
-    [(False, '01-6'), (False, '10-6')],
-    [(False, '01-6'), (False, '02-6')],
-    [(False, '00-6'), (False, '22-6')],
-    [(False, '00-6'), (False, '21-6')],
-    [(False, '00-6'), (False, '20-6')],
-    [(False, '00-6'), (False, '12-6')],
-    [(False, '00-6'), (False, '11-6')],
-    [(False, '00-6'), (False, '10-6')],
-    [(False, '00-6'), (False, '02-6')],
-    [(False, '00-6'), (False, '01-6')],
-    [(True, '00-6'), (True, '01-6'), (True, '02-6'), (True, '10-6'), (True, '11-6'), (True, '12-6'), (True, '20-6'), (True, '21-6'), (True, '22-6')],
-    [(False, '21-7'), (False, '22-7')],
-    [(False, '20-7'), (False, '22-7')],
-    [(False, '20-7'), (False, '21-7')],
-    [(False, '12-7'), (False, '22-7')],
-    [(False, '12-7'), (False, '21-7')],
-    [(False, '12-7'), (False, '20-7')],
-    [(False, '11-7'), (False, '22-7')],
-    [(False, '11-7'), (False, '21-7')],
-    [(False, '11-7'), (False, '20-7')],
-    [(False, '11-7'), (False, '12-7')],
-    [(False, '10-7'), (False, '22-7')],
-    [(False, '10-7'), (False, '21-7')],
-    [(False, '10-7'), (False, '20-7')],
-    [(False, '10-7'), (False, '12-7')],
-    [(False, '10-7'), (False, '11-7')],
-    [(False, '02-7'), (False, '22-7')],
-    [(False, '02-7'), (False, '21-7')],
-    [(False, '02-7'), (False, '20-7')],
-    [(False, '02-7'), (False, '12-7')],
-    [(False, '02-7'), (False, '11-7')],
-    [(False, '02-7'), (False, '10-7')],
-    [(False, '01-7'), (False, '22-7')],
-    [(False, '01-7'), (False, '21-7')],
-    [(False, '01-7'), (False, '20-7')],
-    [(False, '01-7'), (False, '12-7')],
-    [(False, '01-7'), (False, '11-7')],
-    [(False, '01-7'), (False, '10-7')],
-    [(False, '01-7'), (False, '02-7')],
-    [(False, '00-7'), (False, '22-7')],
-    [(False, '00-7'), (False, '21-7')],
-    [(False, '00-7'), (False, '20-7')],
-    [(False, '00-7'), (False, '12-7')],
-    [(False, '00-7'), (False, '11-7')],
-    [(False, '00-7'), (False, '10-7')],
-    [(False, '00-7'), (False, '02-7')],
-    [(False, '00-7'), (False, '01-7')],
-    [(True, '00-7'), (True, '01-7'), (True, '02-7'), (True, '10-7'), (True, '11-7'), (True, '12-7'), (True, '20-7'), (True, '21-7'), (True, '22-7')],
-    [(False, '21-8'), (False, '22-8')],
-    [(False, '20-8'), (False, '22-8')],
-    [(False, '20-8'), (False, '21-8')],
-    [(False, '12-8'), (False, '22-8')],
-    [(False, '12-8'), (False, '21-8')],
-    [(False, '12-8'), (False, '20-8')],
-    [(False, '11-8'), (False, '22-8')],
-    [(False, '11-8'), (False, '21-8')],
-    [(False, '11-8'), (False, '20-8')],
-    [(False, '11-8'), (False, '12-8')],
-    [(False, '10-8'), (False, '22-8')],
-    [(False, '10-8'), (False, '21-8')],
-    [(False, '10-8'), (False, '20-8')],
-    [(False, '10-8'), (False, '12-8')],
-    [(False, '10-8'), (False, '11-8')],
-    [(False, '02-8'), (False, '22-8')],
-    [(False, '02-8'), (False, '21-8')],
-    [(False, '02-8'), (False, '20-8')],
-    [(False, '02-8'), (False, '12-8')],
-    [(False, '02-8'), (False, '11-8')],
-    [(False, '02-8'), (False, '10-8')],
-    [(False, '01-8'), (False, '22-8')],
-    [(False, '01-8'), (False, '21-8')],
-    [(False, '01-8'), (False, '20-8')],
-    [(False, '01-8'), (False, '12-8')],
-    [(False, '01-8'), (False, '11-8')],
-    [(False, '01-8'), (False, '10-8')],
-    [(False, '01-8'), (False, '02-8')],
-    [(False, '00-8'), (False, '22-8')],
-    [(False, '00-8'), (False, '21-8')],
-    [(False, '00-8'), (False, '20-8')],
-    [(False, '00-8'), (False, '12-8')],
-    [(False, '00-8'), (False, '11-8')],
-    [(False, '00-8'), (False, '10-8')],
-    [(False, '00-8'), (False, '02-8')],
-    [(False, '00-8'), (False, '01-8')],
-    [(True, '00-8'), (True, '01-8'), (True, '02-8'), (True, '10-8'), (True, '11-8'), (True, '12-8'), (True, '20-8'), (True, '21-8'), (True, '22-8')],
-    [(False, '21-9'), (False, '22-9')],
-    [(False, '20-9'), (False, '22-9')],
-    [(False, '20-9'), (False, '21-9')],
-    [(False, '12-9'), (False, '22-9')],
-    [(False, '12-9'), (False, '21-9')],
-    [(False, '12-9'), (False, '20-9')],
-    [(False, '11-9'), (False, '22-9')],
-    [(False, '11-9'), (False, '21-9')],
-    [(False, '11-9'), (False, '20-9')],
-    [(False, '11-9'), (False, '12-9')],
-    [(False, '10-9'), (False, '22-9')],
-    [(False, '10-9'), (False, '21-9')],
-    [(False, '10-9'), (False, '20-9')],
-    [(False, '10-9'), (False, '12-9')],
-    [(False, '10-9'), (False, '11-9')],
-    [(False, '02-9'), (False, '22-9')],
-    [(False, '02-9'), (False, '21-9')],
-    [(False, '02-9'), (False, '20-9')],
-    [(False, '02-9'), (False, '12-9')],
-    [(False, '02-9'), (False, '11-9')],
-    [(False, '02-9'), (False, '10-9')],
-    [(False, '01-9'), (False, '22-9')],
-    [(False, '01-9'), (False, '21-9')],
-    [(False, '01-9'), (False, '20-9')],
-    [(False, '01-9'), (False, '12-9')],
-    [(False, '01-9'), (False, '11-9')],
-    [(False, '01-9'), (False, '10-9')],
-    [(False, '01-9'), (False, '02-9')],
-    [(False, '00-9'), (False, '22-9')],
-    [(False, '00-9'), (False, '21-9')],
-    [(False, '00-9'), (False, '20-9')],
-    [(False, '00-9'), (False, '12-9')],
-    [(False, '00-9'), (False, '11-9')],
-    [(False, '00-9'), (False, '10-9')],
-    [(False, '00-9'), (False, '02-9')],
-    [(False, '00-9'), (False, '01-9')],
-    [(True, '00-9'), (True, '01-9'), (True, '02-9'), (True, '10-9'), (True, '11-9'), (True, '12-9'), (True, '20-9'), (True, '21-9'), (True, '22-9')],
-    [(False, '24-1'), (False, '25-1')],
-    [(False, '23-1'), (False, '25-1')],
-    [(False, '23-1'), (False, '24-1')],
-    [(False, '15-1'), (False, '25-1')],
-    [(False, '15-1'), (False, '24-1')],
-    [(False, '15-1'), (False, '23-1')],
-    [(False, '14-1'), (False, '25-1')],
-    [(False, '14-1'), (False, '24-1')],
-    [(False, '14-1'), (False, '23-1')],
-    [(False, '14-1'), (False, '15-1')],
-    [(False, '13-1'), (False, '25-1')],
-    [(False, '13-1'), (False, '24-1')],
-    [(False, '13-1'), (False, '23-1')],
-    [(False, '13-1'), (False, '15-1')],
-    [(False, '13-1'), (False, '14-1')],
-    [(False, '05-1'), (False, '25-1')],
-    [(False, '05-1'), (False, '24-1')],
-    [(False, '05-1'), (False, '23-1')],
-    [(False, '05-1'), (False, '15-1')],
-    [(False, '05-1'), (False, '14-1')],
-    [(False, '05-1'), (False, '13-1')],
-    [(False, '04-1'), (False, '25-1')],
-    [(False, '04-1'), (False, '24-1')],
-    [(False, '04-1'), (False, '23-1')],
-    [(False, '04-1'), (False, '15-1')],
-    [(False, '04-1'), (False, '14-1')],
-    [(False, '04-1'), (False, '13-1')],
-    [(False, '04-1'), (False, '05-1')],
-    [(False, '03-1'), (False, '25-1')],
-    [(False, '03-1'), (False, '24-1')],
-    [(False, '03-1'), (False, '23-1')],
-    [(False, '03-1'), (False, '15-1')],
-    [(False, '03-1'), (False, '14-1')],
-    [(False, '03-1'), (False, '13-1')],
-    [(False, '03-1'), (False, '05-1')],
-    [(False, '03-1'), (False, '04-1')],
-    [(True, '03-1'), (True, '04-1'), (True, '05-1'), (True, '13-1'), (True, '14-1'), (True, '15-1'), (True, '23-1'), (True, '24-1'), (True, '25-1')],
-    [(False, '24-2'), (False, '25-2')],
-    [(False, '23-2'), (False, '25-2')],
-    [(False, '23-2'), (False, '24-2')],
-    [(False, '15-2'), (False, '25-2')],
-    [(False, '15-2'), (False, '24-2')],
-    [(False, '15-2'), (False, '23-2')],
-    [(False, '14-2'), (False, '25-2')],
-    [(False, '14-2'), (False, '24-2')],
-    [(False, '14-2'), (False, '23-2')],
-    [(False, '14-2'), (False, '15-2')],
-    [(False, '13-2'), (False, '25-2')],
-    [(False, '13-2'), (False, '24-2')],
-    [(False, '13-2'), (False, '23-2')],
-    [(False, '13-2'), (False, '15-2')],
-    [(False, '13-2'), (False, '14-2')],
-    [(False, '05-2'), (False, '25-2')],
-    [(False, '05-2'), (False, '24-2')],
-    [(False, '05-2'), (False, '23-2')],
-    [(False, '05-2'), (False, '15-2')],
-    [(False, '05-2'), (False, '14-2')],
-    [(False, '05-2'), (False, '13-2')],
-    [(False, '04-2'), (False, '25-2')],
-    [(False, '04-2'), (False, '24-2')],
-    [(False, '04-2'), (False, '23-2')],
-    [(False, '04-2'), (False, '15-2')],
-    [(False, '04-2'), (False, '14-2')],
-    [(False, '04-2'), (False, '13-2')],
-    [(False, '04-2'), (False, '05-2')],
-    [(False, '03-2'), (False, '25-2')],
-    [(False, '03-2'), (False, '24-2')],
-    [(False, '03-2'), (False, '23-2')],
-    [(False, '03-2'), (False, '15-2')],
-    [(False, '03-2'), (False, '14-2')],
-    [(False, '03-2'), (False, '13-2')],
-    [(False, '03-2'), (False, '05-2')],
-    [(False, '03-2'), (False, '04-2')],
-    [(True, '03-2'), (True, '04-2'), (True, '05-2'), (True, '13-2'), (True, '14-2'), (True, '15-2'), (True, '23-2'), (True, '24-2'), (True, '25-2')],
-    [(False, '24-3'), (False, '25-3')],
-    [(False, '23-3'), (False, '25-3')],
-    [(False, '23-3'), (False, '24-3')],
-    [(False, '15-3'), (False, '25-3')],
-    [(False, '15-3'), (False, '24-3')],
-    [(False, '15-3'), (False, '23-3')],
-    [(False, '14-3'), (False, '25-3')],
-    [(False, '14-3'), (False, '24-3')],
-    [(False, '14-3'), (False, '23-3')],
-    [(False, '14-3'), (False, '15-3')],
-    [(False, '13-3'), (False, '25-3')],
-    [(False, '13-3'), (False, '24-3')],
-    [(False, '13-3'), (False, '23-3')],
-    [(False, '13-3'), (False, '15-3')],
-    [(False, '13-3'), (False, '14-3')],
-    [(False, '05-3'), (False, '25-3')],
-    [(False, '05-3'), (False, '24-3')],
-    [(False, '05-3'), (False, '23-3')],
-    [(False, '05-3'), (False, '15-3')],
-    [(False, '05-3'), (False, '14-3')],
-    [(False, '05-3'), (False, '13-3')],
-    [(False, '04-3'), (False, '25-3')],
-    [(False, '04-3'), (False, '24-3')],
-    [(False, '04-3'), (False, '23-3')],
-    [(False, '04-3'), (False, '15-3')],
-    [(False, '04-3'), (False, '14-3')],
-    [(False, '04-3'), (False, '13-3')],
-    [(False, '04-3'), (False, '05-3')],
-    [(False, '03-3'), (False, '25-3')],
-    [(False, '03-3'), (False, '24-3')],
-    [(False, '03-3'), (False, '23-3')],
-    [(False, '03-3'), (False, '15-3')],
-    [(False, '03-3'), (False, '14-3')],
-    [(False, '03-3'), (False, '13-3')],
-    [(False, '03-3'), (False, '05-3')],
-    [(False, '03-3'), (False, '04-3')],
-    [(True, '03-3'), (True, '04-3'), (True, '05-3'), (True, '13-3'), (True, '14-3'), (True, '15-3'), (True, '23-3'), (True, '24-3'), (True, '25-3')],
-    [(False, '24-4'), (False, '25-4')],
-    [(False, '23-4'), (False, '25-4')],
-    [(False, '23-4'), (False, '24-4')],
-    [(False, '15-4'), (False, '25-4')],
-    [(False, '15-4'), (False, '24-4')],
-    [(False, '15-4'), (False, '23-4')],
-    [(False, '14-4'), (False, '25-4')],
-    [(False, '14-4'), (False, '24-4')],
-    [(False, '14-4'), (False, '23-4')],
-    [(False, '14-4'), (False, '15-4')],
-    [(False, '13-4'), (False, '25-4')],
-    [(False, '13-4'), (False, '24-4')],
-    [(False, '13-4'), (False, '23-4')],
-    [(False, '13-4'), (False, '15-4')],
-    [(False, '13-4'), (False, '14-4')],
-    [(False, '05-4'), (False, '25-4')],
-    [(False, '05-4'), (False, '24-4')],
-    [(False, '05-4'), (False, '23-4')],
-    [(False, '05-4'), (False, '15-4')],
-    [(False, '05-4'), (False, '14-4')],
-    [(False, '05-4'), (False, '13-4')],
-    [(False, '04-4'), (False, '25-4')],
-    [(False, '04-4'), (False, '24-4')],
-    [(False, '04-4'), (False, '23-4')],
-    [(False, '04-4'), (False, '15-4')],
-    [(False, '04-4'), (False, '14-4')],
-    [(False, '04-4'), (False, '13-4')],
-    [(False, '04-4'), (False, '05-4')],
-    [(False, '03-4'), (False, '25-4')],
-    [(False, '03-4'), (False, '24-4')],
-    [(False, '03-4'), (False, '23-4')],
-    [(False, '03-4'), (False, '15-4')],
-    [(False, '03-4'), (False, '14-4')],
-    [(False, '03-4'), (False, '13-4')],
-    [(False, '03-4'), (False, '05-4')],
-    [(False, '03-4'), (False, '04-4')],
-    [(True, '03-4'), (True, '04-4'), (True, '05-4'), (True, '13-4'), (True, '14-4'), (True, '15-4'), (True, '23-4'), (True, '24-4'), (True, '25-4')],
-    [(False, '24-5'), (False, '25-5')],
-    [(False, '23-5'), (False, '25-5')],
-    [(False, '23-5'), (False, '24-5')],
-    [(False, '15-5'), (False, '25-5')],
-    [(False, '15-5'), (False, '24-5')],
-    [(False, '15-5'), (False, '23-5')],
-    [(False, '14-5'), (False, '25-5')],
-    [(False, '14-5'), (False, '24-5')],
-    [(False, '14-5'), (False, '23-5')],
-    [(False, '14-5'), (False, '15-5')],
-    [(False, '13-5'), (False, '25-5')],
-    [(False, '13-5'), (False, '24-5')],
-    [(False, '13-5'), (False, '23-5')],
-    [(False, '13-5'), (False, '15-5')],
-    [(False, '13-5'), (False, '14-5')],
-    [(False, '05-5'), (False, '25-5')],
-    [(False, '05-5'), (False, '24-5')],
-    [(False, '05-5'), (False, '23-5')],
-    [(False, '05-5'), (False, '15-5')],
-    [(False, '05-5'), (False, '14-5')],
-    [(False, '05-5'), (False, '13-5')],
-    [(False, '04-5'), (False, '25-5')],
-    [(False, '04-5'), (False, '24-5')],
-    [(False, '04-5'), (False, '23-5')],
-    [(False, '04-5'), (False, '15-5')],
-    [(False, '04-5'), (False, '14-5')],
-    [(False, '04-5'), (False, '13-5')],
-    [(False, '04-5'), (False, '05-5')],
-    [(False, '03-5'), (False, '25-5')],
-    [(False, '03-5'), (False, '24-5')],
-    [(False, '03-5'), (False, '23-5')],
-    [(False, '03-5'), (False, '15-5')],
-    [(False, '03-5'), (False, '14-5')],
-    [(False, '03-5'), (False, '13-5')],
-    [(False, '03-5'), (False, '05-5')],
-    [(False, '03-5'), (False, '04-5')],
-    [(True, '03-5'), (True, '04-5'), (True, '05-5'), (True, '13-5'), (True, '14-5'), (True, '15-5'), (True, '23-5'), (True, '24-5'), (True, '25-5')],
-    [(False, '24-6'), (False, '25-6')],
-    [(False, '23-6'), (False, '25-6')],
-    [(False, '23-6'), (False, '24-6')],
-    [(False, '15-6'), (False, '25-6')],
-    [(False, '15-6'), (False, '24-6')],
-    [(False, '15-6'), (False, '23-6')],
-    [(False, '14-6'), (False, '25-6')],
-    [(False, '14-6'), (False, '24-6')],
-    [(False, '14-6'), (False, '23-6')],
-    [(False, '14-6'), (False, '15-6')],
-    [(False, '13-6'), (False, '25-6')],
-    [(False, '13-6'), (False, '24-6')],
-    [(False, '13-6'), (False, '23-6')],
-    [(False, '13-6'), (False, '15-6')],
-    [(False, '13-6'), (False, '14-6')],
-    [(False, '05-6'), (False, '25-6')],
-    [(False, '05-6'), (False, '24-6')],
-    [(False, '05-6'), (False, '23-6')],
-    [(False, '05-6'), (False, '15-6')],
-    [(False, '05-6'), (False, '14-6')],
-    [(False, '05-6'), (False, '13-6')],
-    [(False, '04-6'), (False, '25-6')],
-    [(False, '04-6'), (False, '24-6')],
-    [(False, '04-6'), (False, '23-6')],
-    [(False, '04-6'), (False, '15-6')],
-    [(False, '04-6'), (False, '14-6')],
-    [(False, '04-6'), (False, '13-6')],
-    [(False, '04-6'), (False, '05-6')],
-    [(False, '03-6'), (False, '25-6')],
-    [(False, '03-6'), (False, '24-6')],
-    [(False, '03-6'), (False, '23-6')],
-    [(False, '03-6'), (False, '15-6')],
-    [(False, '03-6'), (False, '14-6')],
-    [(False, '03-6'), (False, '13-6')],
-    [(False, '03-6'), (False, '05-6')],
-    [(False, '03-6'), (False, '04-6')],
-    [(True, '03-6'), (True, '04-6'), (True, '05-6'), (True, '13-6'), (True, '14-6'), (True, '15-6'), (True, '23-6'), (True, '24-6'), (True, '25-6')],
-    [(False, '24-7'), (False, '25-7')],
-    [(False, '23-7'), (False, '25-7')],
-    [(False, '23-7'), (False, '24-7')],
-    [(False, '15-7'), (False, '25-7')],
-    [(False, '15-7'), (False, '24-7')],
-    [(False, '15-7'), (False, '23-7')],
-    [(False, '14-7'), (False, '25-7')],
-    [(False, '14-7'), (False, '24-7')],
-    [(False, '14-7'), (False, '23-7')],
-    [(False, '14-7'), (False, '15-7')],
-    [(False, '13-7'), (False, '25-7')],
-    [(False, '13-7'), (False, '24-7')],
-    [(False, '13-7'), (False, '23-7')],
-    [(False, '13-7'), (False, '15-7')],
-    [(False, '13-7'), (False, '14-7')],
-    [(False, '05-7'), (False, '25-7')],
-    [(False, '05-7'), (False, '24-7')],
-    [(False, '05-7'), (False, '23-7')],
-    [(False, '05-7'), (False, '15-7')],
-    [(False, '05-7'), (False, '14-7')],
-    [(False, '05-7'), (False, '13-7')],
-    [(False, '04-7'), (False, '25-7')],
-    [(False, '04-7'), (False, '24-7')],
-    [(False, '04-7'), (False, '23-7')],
-    [(False, '04-7'), (False, '15-7')],
-    [(False, '04-7'), (False, '14-7')],
-    [(False, '04-7'), (False, '13-7')],
-    [(False, '04-7'), (False, '05-7')],
-    [(False, '03-7'), (False, '25-7')],
-    [(False, '03-7'), (False, '24-7')],
-    [(False, '03-7'), (False, '23-7')],
-    [(False, '03-7'), (False, '15-7')],
-    [(False, '03-7'), (False, '14-7')],
-    [(False, '03-7'), (False, '13-7')],
-    [(False, '03-7'), (False, '05-7')],
-    [(False, '03-7'), (False, '04-7')],
-    [(True, '03-7'), (True, '04-7'), (True, '05-7'), (True, '13-7'), (True, '14-7'), (True, '15-7'), (True, '23-7'), (True, '24-7'), (True, '25-7')],
-    [(False, '24-8'), (False, '25-8')],
-    [(False, '23-8'), (False, '25-8')],
-    [(False, '23-8'), (False, '24-8')],
-    [(False, '15-8'), (False, '25-8')],
-    [(False, '15-8'), (False, '24-8')],
-    [(False, '15-8'), (False, '23-8')],
-    [(False, '14-8'), (False, '25-8')],
-    [(False, '14-8'), (False, '24-8')],
-    [(False, '14-8'), (False, '23-8')],
-    [(False, '14-8'), (False, '15-8')],
-    [(False, '13-8'), (False, '25-8')],
-    [(False, '13-8'), (False, '24-8')],
-    [(False, '13-8'), (False, '23-8')],
-    [(False, '13-8'), (False, '15-8')],
-    [(False, '13-8'), (False, '14-8')],
-    [(False, '05-8'), (False, '25-8')],
-    [(False, '05-8'), (False, '24-8')],
-    [(False, '05-8'), (False, '23-8')],
-    [(False, '05-8'), (False, '15-8')],
-    [(False, '05-8'), (False, '14-8')],
-    [(False, '05-8'), (False, '13-8')],
-    [(False, '04-8'), (False, '25-8')],
-    [(False, '04-8'), (False, '24-8')],
-    [(False, '04-8'), (False, '23-8')],
-    [(False, '04-8'), (False, '15-8')],
-    [(False, '04-8'), (False, '14-8')],
-    [(False, '04-8'), (False, '13-8')],
-    [(False, '04-8'), (False, '05-8')],
-    [(False, '03-8'), (False, '25-8')],
-    [(False, '03-8'), (False, '24-8')],
-    [(False, '03-8'), (False, '23-8')],
-    [(False, '03-8'), (False, '15-8')],
-    [(False, '03-8'), (False, '14-8')],
-    [(False, '03-8'), (False, '13-8')],
-    [(False, '03-8'), (False, '05-8')],
-    [(False, '03-8'), (False, '04-8')],
-    [(True, '03-8'), (True, '04-8'), (True, '05-8'), (True, '13-8'), (True, '14-8'), (True, '15-8'), (True, '23-8'), (True, '24-8'), (True, '25-8')],
-    [(False, '24-9'), (False, '25-9')],
-    [(False, '23-9'), (False, '25-9')],
-    [(False, '23-9'), (False, '24-9')],
-    [(False, '15-9'), (False, '25-9')],
-    [(False, '15-9'), (False, '24-9')],
-    [(False, '15-9'), (False, '23-9')],
-    [(False, '14-9'), (False, '25-9')],
-    [(False, '14-9'), (False, '24-9')],
-    [(False, '14-9'), (False, '23-9')],
-    [(False, '14-9'), (False, '15-9')],
-    [(False, '13-9'), (False, '25-9')],
-    [(False, '13-9'), (False, '24-9')],
-    [(False, '13-9'), (False, '23-9')],
-    [(False, '13-9'), (False, '15-9')],
-    [(False, '13-9'), (False, '14-9')],
-    [(False, '05-9'), (False, '25-9')],
-    [(False, '05-9'), (False, '24-9')],
-    [(False, '05-9'), (False, '23-9')],
-    [(False, '05-9'), (False, '15-9')],
-    [(False, '05-9'), (False, '14-9')],
-    [(False, '05-9'), (False, '13-9')],
-    [(False, '04-9'), (False, '25-9')],
-    [(False, '04-9'), (False, '24-9')],
-    [(False, '04-9'), (False, '23-9')],
-    [(False, '04-9'), (False, '15-9')],
-    [(False, '04-9'), (False, '14-9')],
-    [(False, '04-9'), (False, '13-9')],
-    [(False, '04-9'), (False, '05-9')],
-    [(False, '03-9'), (False, '25-9')],
-    [(False, '03-9'), (False, '24-9')],
-    [(False, '03-9'), (False, '23-9')],
-    [(False, '03-9'), (False, '15-9')],
-    [(False, '03-9'), (False, '14-9')],
-    [(False, '03-9'), (False, '13-9')],
-    [(False, '03-9'), (False, '05-9')],
-    [(False, '03-9'), (False, '04-9')],
-    [(True, '03-9'), (True, '04-9'), (True, '05-9'), (True, '13-9'), (True, '14-9'), (True, '15-9'), (True, '23-9'), (True, '24-9'), (True, '25-9')],
-    [(False, '27-1'), (False, '28-1')],
-    [(False, '26-1'), (False, '28-1')],
-    [(False, '26-1'), (False, '27-1')],
-    [(False, '18-1'), (False, '28-1')],
-    [(False, '18-1'), (False, '27-1')],
-    [(False, '18-1'), (False, '26-1')],
-    [(False, '17-1'), (False, '28-1')],
-    [(False, '17-1'), (False, '27-1')],
-    [(False, '17-1'), (False, '26-1')],
-    [(False, '17-1'), (False, '18-1')],
-    [(False, '16-1'), (False, '28-1')],
-    [(False, '16-1'), (False, '27-1')],
-    [(False, '16-1'), (False, '26-1')],
-    [(False, '16-1'), (False, '18-1')],
-    [(False, '16-1'), (False, '17-1')],
-    [(False, '08-1'), (False, '28-1')],
-    [(False, '08-1'), (False, '27-1')],
-    [(False, '08-1'), (False, '26-1')],
-    [(False, '08-1'), (False, '18-1')],
-    [(False, '08-1'), (False, '17-1')],
-    [(False, '08-1'), (False, '16-1')],
-    [(False, '07-1'), (False, '28-1')],
-    [(False, '07-1'), (False, '27-1')],
-    [(False, '07-1'), (False, '26-1')],
-    [(False, '07-1'), (False, '18-1')],
-    [(False, '07-1'), (False, '17-1')],
-    [(False, '07-1'), (False, '16-1')],
-    [(False, '07-1'), (False, '08-1')],
-    [(False, '06-1'), (False, '28-1')],
-    [(False, '06-1'), (False, '27-1')],
-    [(False, '06-1'), (False, '26-1')],
-    [(False, '06-1'), (False, '18-1')],
-    [(False, '06-1'), (False, '17-1')],
-    [(False, '06-1'), (False, '16-1')],
-    [(False, '06-1'), (False, '08-1')],
-    [(False, '06-1'), (False, '07-1')],
-    [(True, '06-1'), (True, '07-1'), (True, '08-1'), (True, '16-1'), (True, '17-1'), (True, '18-1'), (True, '26-1'), (True, '27-1'), (True, '28-1')],
-    [(False, '27-2'), (False, '28-2')],
-    [(False, '26-2'), (False, '28-2')],
-    [(False, '26-2'), (False, '27-2')],
-    [(False, '18-2'), (False, '28-2')],
-    [(False, '18-2'), (False, '27-2')],
-    [(False, '18-2'), (False, '26-2')],
-    [(False, '17-2'), (False, '28-2')],
-    [(False, '17-2'), (False, '27-2')],
-    [(False, '17-2'), (False, '26-2')],
-    [(False, '17-2'), (False, '18-2')],
-    [(False, '16-2'), (False, '28-2')],
-    [(False, '16-2'), (False, '27-2')],
-    [(False, '16-2'), (False, '26-2')],
-    [(False, '16-2'), (False, '18-2')],
-    [(False, '16-2'), (False, '17-2')],
-    [(False, '08-2'), (False, '28-2')],
-    [(False, '08-2'), (False, '27-2')],
-    [(False, '08-2'), (False, '26-2')],
-    [(False, '08-2'), (False, '18-2')],
-    [(False, '08-2'), (False, '17-2')],
-    [(False, '08-2'), (False, '16-2')],
-    [(False, '07-2'), (False, '28-2')],
-    [(False, '07-2'), (False, '27-2')],
-    [(False, '07-2'), (False, '26-2')],
-    [(False, '07-2'), (False, '18-2')],
-    [(False, '07-2'), (False, '17-2')],
-    [(False, '07-2'), (False, '16-2')],
-    [(False, '07-2'), (False, '08-2')],
-    [(False, '06-2'), (False, '28-2')],
-    [(False, '06-2'), (False, '27-2')],
-    [(False, '06-2'), (False, '26-2')],
-    [(False, '06-2'), (False, '18-2')],
-    [(False, '06-2'), (False, '17-2')],
-    [(False, '06-2'), (False, '16-2')],
-    [(False, '06-2'), (False, '08-2')],
-    [(False, '06-2'), (False, '07-2')],
-    [(True, '06-2'), (True, '07-2'), (True, '08-2'), (True, '16-2'), (True, '17-2'), (True, '18-2'), (True, '26-2'), (True, '27-2'), (True, '28-2')],
-    [(False, '27-3'), (False, '28-3')],
-    [(False, '26-3'), (False, '28-3')],
-    [(False, '26-3'), (False, '27-3')],
-    [(False, '18-3'), (False, '28-3')],
-    [(False, '18-3'), (False, '27-3')],
-    [(False, '18-3'), (False, '26-3')],
-    [(False, '17-3'), (False, '28-3')],
-    [(False, '17-3'), (False, '27-3')],
-    [(False, '17-3'), (False, '26-3')],
-    [(False, '17-3'), (False, '18-3')],
-    [(False, '16-3'), (False, '28-3')],
-    [(False, '16-3'), (False, '27-3')],
-    [(False, '16-3'), (False, '26-3')],
-    [(False, '16-3'), (False, '18-3')],
-    [(False, '16-3'), (False, '17-3')],
-    [(False, '08-3'), (False, '28-3')],
-    [(False, '08-3'), (False, '27-3')],
-    [(False, '08-3'), (False, '26-3')],
-    [(False, '08-3'), (False, '18-3')],
-    [(False, '08-3'), (False, '17-3')],
-    [(False, '08-3'), (False, '16-3')],
-    [(False, '07-3'), (False, '28-3')],
-    [(False, '07-3'), (False, '27-3')],
-    [(False, '07-3'), (False, '26-3')],
-    [(False, '07-3'), (False, '18-3')],
-    [(False, '07-3'), (False, '17-3')],
-    [(False, '07-3'), (False, '16-3')],
-    [(False, '07-3'), (False, '08-3')],
-    [(False, '06-3'), (False, '28-3')],
-    [(False, '06-3'), (False, '27-3')],
-    [(False, '06-3'), (False, '26-3')],
-    [(False, '06-3'), (False, '18-3')],
-    [(False, '06-3'), (False, '17-3')],
-    [(False, '06-3'), (False, '16-3')],
-    [(False, '06-3'), (False, '08-3')],
-    [(False, '06-3'), (False, '07-3')],
-    [(True, '06-3'), (True, '07-3'), (True, '08-3'), (True, '16-3'), (True, '17-3'), (True, '18-3'), (True, '26-3'), (True, '27-3'), (True, '28-3')],
-    [(False, '27-4'), (False, '28-4')],
-    [(False, '26-4'), (False, '28-4')],
-    [(False, '26-4'), (False, '27-4')],
-    [(False, '18-4'), (False, '28-4')],
-    [(False, '18-4'), (False, '27-4')],
-    [(False, '18-4'), (False, '26-4')],
-    [(False, '17-4'), (False, '28-4')],
-    [(False, '17-4'), (False, '27-4')],
-    [(False, '17-4'), (False, '26-4')],
-    [(False, '17-4'), (False, '18-4')],
-    [(False, '16-4'), (False, '28-4')],
-    [(False, '16-4'), (False, '27-4')],
-    [(False, '16-4'), (False, '26-4')],
-    [(False, '16-4'), (False, '18-4')],
-    [(False, '16-4'), (False, '17-4')],
-    [(False, '08-4'), (False, '28-4')],
-    [(False, '08-4'), (False, '27-4')],
-    [(False, '08-4'), (False, '26-4')],
-    [(False, '08-4'), (False, '18-4')],
-    [(False, '08-4'), (False, '17-4')],
-    [(False, '08-4'), (False, '16-4')],
-    [(False, '07-4'), (False, '28-4')],
-    [(False, '07-4'), (False, '27-4')],
-    [(False, '07-4'), (False, '26-4')],
-    [(False, '07-4'), (False, '18-4')],
-    [(False, '07-4'), (False, '17-4')],
-    [(False, '07-4'), (False, '16-4')],
-    [(False, '07-4'), (False, '08-4')],
-    [(False, '06-4'), (False, '28-4')],
-    [(False, '06-4'), (False, '27-4')],
-    [(False, '06-4'), (False, '26-4')],
-    [(False, '06-4'), (False, '18-4')],
-    [(False, '06-4'), (False, '17-4')],
-    [(False, '06-4'), (False, '16-4')],
-    [(False, '06-4'), (False, '08-4')],
-    [(False, '06-4'), (False, '07-4')],
-    [(True, '06-4'), (True, '07-4'), (True, '08-4'), (True, '16-4'), (True, '17-4'), (True, '18-4'), (True, '26-4'), (True, '27-4'), (True, '28-4')],
-    [(False, '27-5'), (False, '28-5')],
-    [(False, '26-5'), (False, '28-5')],
-    [(False, '26-5'), (False, '27-5')],
-    [(False, '18-5'), (False, '28-5')],
-    [(False, '18-5'), (False, '27-5')],
-    [(False, '18-5'), (False, '26-5')],
-    [(False, '17-5'), (False, '28-5')],
-    [(False, '17-5'), (False, '27-5')],
-    [(False, '17-5'), (False, '26-5')],
-    [(False, '17-5'), (False, '18-5')],
-    [(False, '16-5'), (False, '28-5')],
-    [(False, '16-5'), (False, '27-5')],
-    [(False, '16-5'), (False, '26-5')],
-    [(False, '16-5'), (False, '18-5')],
-    [(False, '16-5'), (False, '17-5')],
-    [(False, '08-5'), (False, '28-5')],
-    [(False, '08-5'), (False, '27-5')],
-    [(False, '08-5'), (False, '26-5')],
-    [(False, '08-5'), (False, '18-5')],
-    [(False, '08-5'), (False, '17-5')],
-    [(False, '08-5'), (False, '16-5')],
-    [(False, '07-5'), (False, '28-5')],
-    [(False, '07-5'), (False, '27-5')],
-    [(False, '07-5'), (False, '26-5')],
-    [(False, '07-5'), (False, '18-5')],
-    [(False, '07-5'), (False, '17-5')],
-    [(False, '07-5'), (False, '16-5')],
-    [(False, '07-5'), (False, '08-5')],
-    [(False, '06-5'), (False, '28-5')],
-    [(False, '06-5'), (False, '27-5')],
-    [(False, '06-5'), (False, '26-5')],
-    [(False, '06-5'), (False, '18-5')],
-    [(False, '06-5'), (False, '17-5')],
-    [(False, '06-5'), (False, '16-5')],
-    [(False, '06-5'), (False, '08-5')],
-    [(False, '06-5'), (False, '07-5')],
-    [(True, '06-5'), (True, '07-5'), (True, '08-5'), (True, '16-5'), (True, '17-5'), (True, '18-5'), (True, '26-5'), (True, '27-5'), (True, '28-5')],
-    [(False, '27-6'), (False, '28-6')],
-    [(False, '26-6'), (False, '28-6')],
-    [(False, '26-6'), (False, '27-6')],
-    [(False, '18-6'), (False, '28-6')],
-    [(False, '18-6'), (False, '27-6')],
-    [(False, '18-6'), (False, '26-6')],
-    [(False, '17-6'), (False, '28-6')],
-    [(False, '17-6'), (False, '27-6')],
-    [(False, '17-6'), (False, '26-6')],
-    [(False, '17-6'), (False, '18-6')],
-    [(False, '16-6'), (False, '28-6')],
-    [(False, '16-6'), (False, '27-6')],
-    [(False, '16-6'), (False, '26-6')],
-    [(False, '16-6'), (False, '18-6')],
-    [(False, '16-6'), (False, '17-6')],
-    [(False, '08-6'), (False, '28-6')],
-    [(False, '08-6'), (False, '27-6')],
-    [(False, '08-6'), (False, '26-6')],
-    [(False, '08-6'), (False, '18-6')],
-    [(False, '08-6'), (False, '17-6')],
-    [(False, '08-6'), (False, '16-6')],
-    [(False, '07-6'), (False, '28-6')],
-    [(False, '07-6'), (False, '27-6')],
-    [(False, '07-6'), (False, '26-6')],
-    [(False, '07-6'), (False, '18-6')],
-    [(False, '07-6'), (False, '17-6')],
-    [(False, '07-6'), (False, '16-6')],
-    [(False, '07-6'), (False, '08-6')],
-    [(False, '06-6'), (False, '28-6')],
-    [(False, '06-6'), (False, '27-6')],
-    [(False, '06-6'), (False, '26-6')],
-    [(False, '06-6'), (False, '18-6')],
-    [(False, '06-6'), (False, '17-6')],
-    [(False, '06-6'), (False, '16-6')],
-    [(False, '06-6'), (False, '08-6')],
-    [(False, '06-6'), (False, '07-6')],
-    [(True, '06-6'), (True, '07-6'), (True, '08-6'), (True, '16-6'), (True, '17-6'), (True, '18-6'), (True, '26-6'), (True, '27-6'), (True, '28-6')],
-    [(False, '27-7'), (False, '28-7')],
-    [(False, '26-7'), (False, '28-7')],
-    [(False, '26-7'), (False, '27-7')],
-    [(False, '18-7'), (False, '28-7')],
-    [(False, '18-7'), (False, '27-7')],
-    [(False, '18-7'), (False, '26-7')],
-    [(False, '17-7'), (False, '28-7')],
-    [(False, '17-7'), (False, '27-7')],
-    [(False, '17-7'), (False, '26-7')],
-    [(False, '17-7'), (False, '18-7')],
-    [(False, '16-7'), (False, '28-7')],
-    [(False, '16-7'), (False, '27-7')],
-    [(False, '16-7'), (False, '26-7')],
-    [(False, '16-7'), (False, '18-7')],
-    [(False, '16-7'), (False, '17-7')],
-    [(False, '08-7'), (False, '28-7')],
-    [(False, '08-7'), (False, '27-7')],
-    [(False, '08-7'), (False, '26-7')],
-    [(False, '08-7'), (False, '18-7')],
-    [(False, '08-7'), (False, '17-7')],
-    [(False, '08-7'), (False, '16-7')],
-    [(False, '07-7'), (False, '28-7')],
-    [(False, '07-7'), (False, '27-7')],
-    [(False, '07-7'), (False, '26-7')],
-    [(False, '07-7'), (False, '18-7')],
-    [(False, '07-7'), (False, '17-7')],
-    [(False, '07-7'), (False, '16-7')],
-    [(False, '07-7'), (False, '08-7')],
-    [(False, '06-7'), (False, '28-7')],
-    [(False, '06-7'), (False, '27-7')],
-    [(False, '06-7'), (False, '26-7')],
-    [(False, '06-7'), (False, '18-7')],
-    [(False, '06-7'), (False, '17-7')],
-    [(False, '06-7'), (False, '16-7')],
-    [(False, '06-7'), (False, '08-7')],
-    [(False, '06-7'), (False, '07-7')],
-    [(True, '06-7'), (True, '07-7'), (True, '08-7'), (True, '16-7'), (True, '17-7'), (True, '18-7'), (True, '26-7'), (True, '27-7'), (True, '28-7')],
-    [(False, '27-8'), (False, '28-8')],
-    [(False, '26-8'), (False, '28-8')],
-    [(False, '26-8'), (False, '27-8')],
-    [(False, '18-8'), (False, '28-8')],
-    [(False, '18-8'), (False, '27-8')],
-    [(False, '18-8'), (False, '26-8')],
-    [(False, '17-8'), (False, '28-8')],
-    [(False, '17-8'), (False, '27-8')],
-    [(False, '17-8'), (False, '26-8')],
-    [(False, '17-8'), (False, '18-8')],
-    [(False, '16-8'), (False, '28-8')],
-    [(False, '16-8'), (False, '27-8')],
-    [(False, '16-8'), (False, '26-8')],
-    [(False, '16-8'), (False, '18-8')],
-    [(False, '16-8'), (False, '17-8')],
-    [(False, '08-8'), (False, '28-8')],
-    [(False, '08-8'), (False, '27-8')],
-    [(False, '08-8'), (False, '26-8')],
-    [(False, '08-8'), (False, '18-8')],
-    [(False, '08-8'), (False, '17-8')],
-    [(False, '08-8'), (False, '16-8')],
-    [(False, '07-8'), (False, '28-8')],
-    [(False, '07-8'), (False, '27-8')],
-    [(False, '07-8'), (False, '26-8')],
-    [(False, '07-8'), (False, '18-8')],
-    [(False, '07-8'), (False, '17-8')],
-    [(False, '07-8'), (False, '16-8')],
-    [(False, '07-8'), (False, '08-8')],
-    [(False, '06-8'), (False, '28-8')],
-    [(False, '06-8'), (False, '27-8')],
-    [(False, '06-8'), (False, '26-8')],
-    [(False, '06-8'), (False, '18-8')],
-    [(False, '06-8'), (False, '17-8')],
-    [(False, '06-8'), (False, '16-8')],
-    [(False, '06-8'), (False, '08-8')],
-    [(False, '06-8'), (False, '07-8')],
-    [(True, '06-8'), (True, '07-8'), (True, '08-8'), (True, '16-8'), (True, '17-8'), (True, '18-8'), (True, '26-8'), (True, '27-8'), (True, '28-8')],
-    [(False, '27-9'), (False, '28-9')],
-    [(False, '26-9'), (False, '28-9')],
-    [(False, '26-9'), (False, '27-9')],
-    [(False, '18-9'), (False, '28-9')],
-    [(False, '18-9'), (False, '27-9')],
-    [(False, '18-9'), (False, '26-9')],
-    [(False, '17-9'), (False, '28-9')],
-    [(False, '17-9'), (False, '27-9')],
-    [(False, '17-9'), (False, '26-9')],
-    [(False, '17-9'), (False, '18-9')],
-    [(False, '16-9'), (False, '28-9')],
-    [(False, '16-9'), (False, '27-9')],
-    [(False, '16-9'), (False, '26-9')],
-    [(False, '16-9'), (False, '18-9')],
-    [(False, '16-9'), (False, '17-9')],
-    [(False, '08-9'), (False, '28-9')],
-    [(False, '08-9'), (False, '27-9')],
-    [(False, '08-9'), (False, '26-9')],
-    [(False, '08-9'), (False, '18-9')],
-    [(False, '08-9'), (False, '17-9')],
-    [(False, '08-9'), (False, '16-9')],
-    [(False, '07-9'), (False, '28-9')],
-    [(False, '07-9'), (False, '27-9')],
-    [(False, '07-9'), (False, '26-9')],
-    [(False, '07-9'), (False, '18-9')],
-    [(False, '07-9'), (False, '17-9')],
-    [(False, '07-9'), (False, '16-9')],
-    [(False, '07-9'), (False, '08-9')],
-    [(False, '06-9'), (False, '28-9')],
-    [(False, '06-9'), (False, '27-9')],
-    [(False, '06-9'), (False, '26-9')],
-    [(False, '06-9'), (False, '18-9')],
-    [(False, '06-9'), (False, '17-9')],
-    [(False, '06-9'), (False, '16-9')],
-    [(False, '06-9'), (False, '08-9')],
-    [(False, '06-9'), (False, '07-9')],
-    [(True, '06-9'), (True, '07-9'), (True, '08-9'), (True, '16-9'), (True, '17-9'), (True, '18-9'), (True, '26-9'), (True, '27-9'), (True, '28-9')],
-    [(False, '51-1'), (False, '52-1')],
-    [(False, '50-1'), (False, '52-1')],
-    [(False, '50-1'), (False, '51-1')],
-    [(False, '42-1'), (False, '52-1')],
-    [(False, '42-1'), (False, '51-1')],
-    [(False, '42-1'), (False, '50-1')],
-    [(False, '41-1'), (False, '52-1')],
-    [(False, '41-1'), (False, '51-1')],
-    [(False, '41-1'), (False, '50-1')],
-    [(False, '41-1'), (False, '42-1')],
-    [(False, '40-1'), (False, '52-1')],
-    [(False, '40-1'), (False, '51-1')],
-    [(False, '40-1'), (False, '50-1')],
-    [(False, '40-1'), (False, '42-1')],
-    [(False, '40-1'), (False, '41-1')],
-    [(False, '32-1'), (False, '52-1')],
-    [(False, '32-1'), (False, '51-1')],
-    [(False, '32-1'), (False, '50-1')],
-    [(False, '32-1'), (False, '42-1')],
-    [(False, '32-1'), (False, '41-1')],
-    [(False, '32-1'), (False, '40-1')],
-    [(False, '31-1'), (False, '52-1')],
-    [(False, '31-1'), (False, '51-1')],
-    [(False, '31-1'), (False, '50-1')],
-    [(False, '31-1'), (False, '42-1')],
-    [(False, '31-1'), (False, '41-1')],
-    [(False, '31-1'), (False, '40-1')],
-    [(False, '31-1'), (False, '32-1')],
-    [(False, '30-1'), (False, '52-1')],
-    [(False, '30-1'), (False, '51-1')],
-    [(False, '30-1'), (False, '50-1')],
-    [(False, '30-1'), (False, '42-1')],
-    [(False, '30-1'), (False, '41-1')],
-    [(False, '30-1'), (False, '40-1')],
-    [(False, '30-1'), (False, '32-1')],
-    [(False, '30-1'), (False, '31-1')],
-    [(True, '30-1'), (True, '31-1'), (True, '32-1'), (True, '40-1'), (True, '41-1'), (True, '42-1'), (True, '50-1'), (True, '51-1'), (True, '52-1')],
-    [(False, '51-2'), (False, '52-2')],
-    [(False, '50-2'), (False, '52-2')],
-    [(False, '50-2'), (False, '51-2')],
-    [(False, '42-2'), (False, '52-2')],
-    [(False, '42-2'), (False, '51-2')],
-    [(False, '42-2'), (False, '50-2')],
-    [(False, '41-2'), (False, '52-2')],
-    [(False, '41-2'), (False, '51-2')],
-    [(False, '41-2'), (False, '50-2')],
-    [(False, '41-2'), (False, '42-2')],
-    [(False, '40-2'), (False, '52-2')],
-    [(False, '40-2'), (False, '51-2')],
-    [(False, '40-2'), (False, '50-2')],
-    [(False, '40-2'), (False, '42-2')],
-    [(False, '40-2'), (False, '41-2')],
-    [(False, '32-2'), (False, '52-2')],
-    [(False, '32-2'), (False, '51-2')],
-    [(False, '32-2'), (False, '50-2')],
-    [(False, '32-2'), (False, '42-2')],
-    [(False, '32-2'), (False, '41-2')],
-    [(False, '32-2'), (False, '40-2')],
-    [(False, '31-2'), (False, '52-2')],
-    [(False, '31-2'), (False, '51-2')],
-    [(False, '31-2'), (False, '50-2')],
-    [(False, '31-2'), (False, '42-2')],
-    [(False, '31-2'), (False, '41-2')],
-    [(False, '31-2'), (False, '40-2')],
-    [(False, '31-2'), (False, '32-2')],
-    [(False, '30-2'), (False, '52-2')],
-    [(False, '30-2'), (False, '51-2')],
-    [(False, '30-2'), (False, '50-2')],
-    [(False, '30-2'), (False, '42-2')],
-    [(False, '30-2'), (False, '41-2')],
-    [(False, '30-2'), (False, '40-2')],
-    [(False, '30-2'), (False, '32-2')],
-    [(False, '30-2'), (False, '31-2')],
-    [(True, '30-2'), (True, '31-2'), (True, '32-2'), (True, '40-2'), (True, '41-2'), (True, '42-2'), (True, '50-2'), (True, '51-2'), (True, '52-2')],
-    [(False, '51-3'), (False, '52-3')],
-    [(False, '50-3'), (False, '52-3')],
-    [(False, '50-3'), (False, '51-3')],
-    [(False, '42-3'), (False, '52-3')],
-    [(False, '42-3'), (False, '51-3')],
-    [(False, '42-3'), (False, '50-3')],
-    [(False, '41-3'), (False, '52-3')],
-    [(False, '41-3'), (False, '51-3')],
-    [(False, '41-3'), (False, '50-3')],
-    [(False, '41-3'), (False, '42-3')],
-    [(False, '40-3'), (False, '52-3')],
-    [(False, '40-3'), (False, '51-3')],
-    [(False, '40-3'), (False, '50-3')],
-    [(False, '40-3'), (False, '42-3')],
-    [(False, '40-3'), (False, '41-3')],
-    [(False, '32-3'), (False, '52-3')],
-    [(False, '32-3'), (False, '51-3')],
-    [(False, '32-3'), (False, '50-3')],
-    [(False, '32-3'), (False, '42-3')],
-    [(False, '32-3'), (False, '41-3')],
-    [(False, '32-3'), (False, '40-3')],
-    [(False, '31-3'), (False, '52-3')],
-    [(False, '31-3'), (False, '51-3')],
-    [(False, '31-3'), (False, '50-3')],
-    [(False, '31-3'), (False, '42-3')],
-    [(False, '31-3'), (False, '41-3')],
-    [(False, '31-3'), (False, '40-3')],
-    [(False, '31-3'), (False, '32-3')],
-    [(False, '30-3'), (False, '52-3')],
-    [(False, '30-3'), (False, '51-3')],
-    [(False, '30-3'), (False, '50-3')],
-    [(False, '30-3'), (False, '42-3')],
-    [(False, '30-3'), (False, '41-3')],
-    [(False, '30-3'), (False, '40-3')],
-    [(False, '30-3'), (False, '32-3')],
-    [(False, '30-3'), (False, '31-3')],
-    [(True, '30-3'), (True, '31-3'), (True, '32-3'), (True, '40-3'), (True, '41-3'), (True, '42-3'), (True, '50-3'), (True, '51-3'), (True, '52-3')],
-    [(False, '51-4'), (False, '52-4')],
-    [(False, '50-4'), (False, '52-4')],
-    [(False, '50-4'), (False, '51-4')],
-    [(False, '42-4'), (False, '52-4')],
-    [(False, '42-4'), (False, '51-4')],
-    [(False, '42-4'), (False, '50-4')],
-    [(False, '41-4'), (False, '52-4')],
-    [(False, '41-4'), (False, '51-4')],
-    [(False, '41-4'), (False, '50-4')],
-    [(False, '41-4'), (False, '42-4')],
-    [(False, '40-4'), (False, '52-4')],
-    [(False, '40-4'), (False, '51-4')],
-    [(False, '40-4'), (False, '50-4')],
-    [(False, '40-4'), (False, '42-4')],
-    [(False, '40-4'), (False, '41-4')],
-    [(False, '32-4'), (False, '52-4')],
-    [(False, '32-4'), (False, '51-4')],
-    [(False, '32-4'), (False, '50-4')],
-    [(False, '32-4'), (False, '42-4')],
-    [(False, '32-4'), (False, '41-4')],
-    [(False, '32-4'), (False, '40-4')],
-    [(False, '31-4'), (False, '52-4')],
-    [(False, '31-4'), (False, '51-4')],
-    [(False, '31-4'), (False, '50-4')],
-    [(False, '31-4'), (False, '42-4')],
-    [(False, '31-4'), (False, '41-4')],
-    [(False, '31-4'), (False, '40-4')],
-    [(False, '31-4'), (False, '32-4')],
-    [(False, '30-4'), (False, '52-4')],
-    [(False, '30-4'), (False, '51-4')],
-    [(False, '30-4'), (False, '50-4')],
-    [(False, '30-4'), (False, '42-4')],
-    [(False, '30-4'), (False, '41-4')],
-    [(False, '30-4'), (False, '40-4')],
-    [(False, '30-4'), (False, '32-4')],
-    [(False, '30-4'), (False, '31-4')],
-    [(True, '30-4'), (True, '31-4'), (True, '32-4'), (True, '40-4'), (True, '41-4'), (True, '42-4'), (True, '50-4'), (True, '51-4'), (True, '52-4')],
-    [(False, '51-5'), (False, '52-5')],
-    [(False, '50-5'), (False, '52-5')],
-    [(False, '50-5'), (False, '51-5')],
-    [(False, '42-5'), (False, '52-5')],
-    [(False, '42-5'), (False, '51-5')],
-    [(False, '42-5'), (False, '50-5')],
-    [(False, '41-5'), (False, '52-5')],
-    [(False, '41-5'), (False, '51-5')],
-    [(False, '41-5'), (False, '50-5')],
-    [(False, '41-5'), (False, '42-5')],
-    [(False, '40-5'), (False, '52-5')],
-    [(False, '40-5'), (False, '51-5')],
-    [(False, '40-5'), (False, '50-5')],
-    [(False, '40-5'), (False, '42-5')],
-    [(False, '40-5'), (False, '41-5')],
-    [(False, '32-5'), (False, '52-5')],
-    [(False, '32-5'), (False, '51-5')],
-    [(False, '32-5'), (False, '50-5')],
-    [(False, '32-5'), (False, '42-5')],
-    [(False, '32-5'), (False, '41-5')],
-    [(False, '32-5'), (False, '40-5')],
-    [(False, '31-5'), (False, '52-5')],
-    [(False, '31-5'), (False, '51-5')],
-    [(False, '31-5'), (False, '50-5')],
-    [(False, '31-5'), (False, '42-5')],
-    [(False, '31-5'), (False, '41-5')],
-    [(False, '31-5'), (False, '40-5')],
-    [(False, '31-5'), (False, '32-5')],
-    [(False, '30-5'), (False, '52-5')],
-    [(False, '30-5'), (False, '51-5')],
-    [(False, '30-5'), (False, '50-5')],
-    [(False, '30-5'), (False, '42-5')],
-    [(False, '30-5'), (False, '41-5')],
-    [(False, '30-5'), (False, '40-5')],
-    [(False, '30-5'), (False, '32-5')],
-    [(False, '30-5'), (False, '31-5')],
-    [(True, '30-5'), (True, '31-5'), (True, '32-5'), (True, '40-5'), (True, '41-5'), (True, '42-5'), (True, '50-5'), (True, '51-5'), (True, '52-5')],
-    [(False, '51-6'), (False, '52-6')],
-    [(False, '50-6'), (False, '52-6')],
-    [(False, '50-6'), (False, '51-6')],
-    [(False, '42-6'), (False, '52-6')],
-    [(False, '42-6'), (False, '51-6')],
-    [(False, '42-6'), (False, '50-6')],
-    [(False, '41-6'), (False, '52-6')],
-    [(False, '41-6'), (False, '51-6')],
-    [(False, '41-6'), (False, '50-6')],
-    [(False, '41-6'), (False, '42-6')],
-    [(False, '40-6'), (False, '52-6')],
-    [(False, '40-6'), (False, '51-6')],
-    [(False, '40-6'), (False, '50-6')],
-    [(False, '40-6'), (False, '42-6')],
-    [(False, '40-6'), (False, '41-6')],
-    [(False, '32-6'), (False, '52-6')],
-    [(False, '32-6'), (False, '51-6')],
-    [(False, '32-6'), (False, '50-6')],
-    [(False, '32-6'), (False, '42-6')],
-    [(False, '32-6'), (False, '41-6')],
-    [(False, '32-6'), (False, '40-6')],
-    [(False, '31-6'), (False, '52-6')],
-    [(False, '31-6'), (False, '51-6')],
-    [(False, '31-6'), (False, '50-6')],
-    [(False, '31-6'), (False, '42-6')],
-    [(False, '31-6'), (False, '41-6')],
-    [(False, '31-6'), (False, '40-6')],
-    [(False, '31-6'), (False, '32-6')],
-    [(False, '30-6'), (False, '52-6')],
-    [(False, '30-6'), (False, '51-6')],
-    [(False, '30-6'), (False, '50-6')],
-    [(False, '30-6'), (False, '42-6')],
-    [(False, '30-6'), (False, '41-6')],
-    [(False, '30-6'), (False, '40-6')],
-    [(False, '30-6'), (False, '32-6')],
-    [(False, '30-6'), (False, '31-6')],
-    [(True, '30-6'), (True, '31-6'), (True, '32-6'), (True, '40-6'), (True, '41-6'), (True, '42-6'), (True, '50-6'), (True, '51-6'), (True, '52-6')],
-    [(False, '51-7'), (False, '52-7')],
-    [(False, '50-7'), (False, '52-7')],
-    [(False, '50-7'), (False, '51-7')],
-    [(False, '42-7'), (False, '52-7')],
-    [(False, '42-7'), (False, '51-7')],
-    [(False, '42-7'), (False, '50-7')],
-    [(False, '41-7'), (False, '52-7')],
-    [(False, '41-7'), (False, '51-7')],
-    [(False, '41-7'), (False, '50-7')],
-    [(False, '41-7'), (False, '42-7')],
-    [(False, '40-7'), (False, '52-7')],
-    [(False, '40-7'), (False, '51-7')],
-    [(False, '40-7'), (False, '50-7')],
-    [(False, '40-7'), (False, '42-7')],
-    [(False, '40-7'), (False, '41-7')],
-    [(False, '32-7'), (False, '52-7')],
-    [(False, '32-7'), (False, '51-7')],
-    [(False, '32-7'), (False, '50-7')],
-    [(False, '32-7'), (False, '42-7')],
-    [(False, '32-7'), (False, '41-7')],
-    [(False, '32-7'), (False, '40-7')],
-    [(False, '31-7'), (False, '52-7')],
-    [(False, '31-7'), (False, '51-7')],
-    [(False, '31-7'), (False, '50-7')],
-    [(False, '31-7'), (False, '42-7')],
-    [(False, '31-7'), (False, '41-7')],
-    [(False, '31-7'), (False, '40-7')],
-    [(False, '31-7'), (False, '32-7')],
-    [(False, '30-7'), (False, '52-7')],
-    [(False, '30-7'), (False, '51-7')],
-    [(False, '30-7'), (False, '50-7')],
-    [(False, '30-7'), (False, '42-7')],
-    [(False, '30-7'), (False, '41-7')],
-    [(False, '30-7'), (False, '40-7')],
-    [(False, '30-7'), (False, '32-7')],
-    [(False, '30-7'), (False, '31-7')],
-    [(True, '30-7'), (True, '31-7'), (True, '32-7'), (True, '40-7'), (True, '41-7'), (True, '42-7'), (True, '50-7'), (True, '51-7'), (True, '52-7')],
-    [(False, '51-8'), (False, '52-8')],
-    [(False, '50-8'), (False, '52-8')],
-    [(False, '50-8'), (False, '51-8')],
-    [(False, '42-8'), (False, '52-8')],
-    [(False, '42-8'), (False, '51-8')],
-    [(False, '42-8'), (False, '50-8')],
-    [(False, '41-8'), (False, '52-8')],
-    [(False, '41-8'), (False, '51-8')],
-    [(False, '41-8'), (False, '50-8')],
-    [(False, '41-8'), (False, '42-8')],
-    [(False, '40-8'), (False, '52-8')],
-    [(False, '40-8'), (False, '51-8')],
-    [(False, '40-8'), (False, '50-8')],
-    [(False, '40-8'), (False, '42-8')],
-    [(False, '40-8'), (False, '41-8')],
-    [(False, '32-8'), (False, '52-8')],
-    [(False, '32-8'), (False, '51-8')],
-    [(False, '32-8'), (False, '50-8')],
-    [(False, '32-8'), (False, '42-8')],
-    [(False, '32-8'), (False, '41-8')],
-    [(False, '32-8'), (False, '40-8')],
-    [(False, '31-8'), (False, '52-8')],
-    [(False, '31-8'), (False, '51-8')],
-    [(False, '31-8'), (False, '50-8')],
-    [(False, '31-8'), (False, '42-8')],
-    [(False, '31-8'), (False, '41-8')],
-    [(False, '31-8'), (False, '40-8')],
-    [(False, '31-8'), (False, '32-8')],
-    [(False, '30-8'), (False, '52-8')],
-    [(False, '30-8'), (False, '51-8')],
-    [(False, '30-8'), (False, '50-8')],
-    [(False, '30-8'), (False, '42-8')],
-    [(False, '30-8'), (False, '41-8')],
-    [(False, '30-8'), (False, '40-8')],
-    [(False, '30-8'), (False, '32-8')],
-    [(False, '30-8'), (False, '31-8')],
-    [(True, '30-8'), (True, '31-8'), (True, '32-8'), (True, '40-8'), (True, '41-8'), (True, '42-8'), (True, '50-8'), (True, '51-8'), (True, '52-8')],
-    [(False, '51-9'), (False, '52-9')],
-    [(False, '50-9'), (False, '52-9')],
-    [(False, '50-9'), (False, '51-9')],
-    [(False, '42-9'), (False, '52-9')],
-    [(False, '42-9'), (False, '51-9')],
-    [(False, '42-9'), (False, '50-9')],
-    [(False, '41-9'), (False, '52-9')],
-    [(False, '41-9'), (False, '51-9')],
-    [(False, '41-9'), (False, '50-9')],
-    [(False, '41-9'), (False, '42-9')],
-    [(False, '40-9'), (False, '52-9')],
-    [(False, '40-9'), (False, '51-9')],
-    [(False, '40-9'), (False, '50-9')],
-    [(False, '40-9'), (False, '42-9')],
-    [(False, '40-9'), (False, '41-9')],
-    [(False, '32-9'), (False, '52-9')],
-    [(False, '32-9'), (False, '51-9')],
-    [(False, '32-9'), (False, '50-9')],
-    [(False, '32-9'), (False, '42-9')],
-    [(False, '32-9'), (False, '41-9')],
-    [(False, '32-9'), (False, '40-9')],
-    [(False, '31-9'), (False, '52-9')],
-    [(False, '31-9'), (False, '51-9')],
-    [(False, '31-9'), (False, '50-9')],
-    [(False, '31-9'), (False, '42-9')],
-    [(False, '31-9'), (False, '41-9')],
-    [(False, '31-9'), (False, '40-9')],
-    [(False, '31-9'), (False, '32-9')],
-    [(False, '30-9'), (False, '52-9')],
-    [(False, '30-9'), (False, '51-9')],
-    [(False, '30-9'), (False, '50-9')],
-    [(False, '30-9'), (False, '42-9')],
-    [(False, '30-9'), (False, '41-9')],
-    [(False, '30-9'), (False, '40-9')],
-    [(False, '30-9'), (False, '32-9')],
-    [(False, '30-9'), (False, '31-9')],
-    [(True, '30-9'), (True, '31-9'), (True, '32-9'), (True, '40-9'), (True, '41-9'), (True, '42-9'), (True, '50-9'), (True, '51-9'), (True, '52-9')],
-    [(False, '54-1'), (False, '55-1')],
-    [(False, '53-1'), (False, '55-1')],
-    [(False, '53-1'), (False, '54-1')],
-    [(False, '45-1'), (False, '55-1')],
-    [(False, '45-1'), (False, '54-1')],
-    [(False, '45-1'), (False, '53-1')],
-    [(False, '44-1'), (False, '55-1')],
-    [(False, '44-1'), (False, '54-1')],
-    [(False, '44-1'), (False, '53-1')],
-    [(False, '44-1'), (False, '45-1')],
-    [(False, '43-1'), (False, '55-1')],
-    [(False, '43-1'), (False, '54-1')],
-    [(False, '43-1'), (False, '53-1')],
-    [(False, '43-1'), (False, '45-1')],
-    [(False, '43-1'), (False, '44-1')],
-    [(False, '35-1'), (False, '55-1')],
-    [(False, '35-1'), (False, '54-1')],
-    [(False, '35-1'), (False, '53-1')],
-    [(False, '35-1'), (False, '45-1')],
-    [(False, '35-1'), (False, '44-1')],
-    [(False, '35-1'), (False, '43-1')],
-    [(False, '34-1'), (False, '55-1')],
-    [(False, '34-1'), (False, '54-1')],
-    [(False, '34-1'), (False, '53-1')],
-    [(False, '34-1'), (False, '45-1')],
-    [(False, '34-1'), (False, '44-1')],
-    [(False, '34-1'), (False, '43-1')],
-    [(False, '34-1'), (False, '35-1')],
-    [(False, '33-1'), (False, '55-1')],
-    [(False, '33-1'), (False, '54-1')],
-    [(False, '33-1'), (False, '53-1')],
-    [(False, '33-1'), (False, '45-1')],
-    [(False, '33-1'), (False, '44-1')],
-    [(False, '33-1'), (False, '43-1')],
-    [(False, '33-1'), (False, '35-1')],
-    [(False, '33-1'), (False, '34-1')],
-    [(True, '33-1'), (True, '34-1'), (True, '35-1'), (True, '43-1'), (True, '44-1'), (True, '45-1'), (True, '53-1'), (True, '54-1'), (True, '55-1')],
-    [(False, '54-2'), (False, '55-2')],
-    [(False, '53-2'), (False, '55-2')],
-    [(False, '53-2'), (False, '54-2')],
-    [(False, '45-2'), (False, '55-2')],
-    [(False, '45-2'), (False, '54-2')],
-    [(False, '45-2'), (False, '53-2')],
-    [(False, '44-2'), (False, '55-2')],
-    [(False, '44-2'), (False, '54-2')],
-    [(False, '44-2'), (False, '53-2')],
-    [(False, '44-2'), (False, '45-2')],
-    [(False, '43-2'), (False, '55-2')],
-    [(False, '43-2'), (False, '54-2')],
-    [(False, '43-2'), (False, '53-2')],
-    [(False, '43-2'), (False, '45-2')],
-    [(False, '43-2'), (False, '44-2')],
-    [(False, '35-2'), (False, '55-2')],
-    [(False, '35-2'), (False, '54-2')],
-    [(False, '35-2'), (False, '53-2')],
-    [(False, '35-2'), (False, '45-2')],
-    [(False, '35-2'), (False, '44-2')],
-    [(False, '35-2'), (False, '43-2')],
-    [(False, '34-2'), (False, '55-2')],
-    [(False, '34-2'), (False, '54-2')],
-    [(False, '34-2'), (False, '53-2')],
-    [(False, '34-2'), (False, '45-2')],
-    [(False, '34-2'), (False, '44-2')],
-    [(False, '34-2'), (False, '43-2')],
-    [(False, '34-2'), (False, '35-2')],
-    [(False, '33-2'), (False, '55-2')],
-    [(False, '33-2'), (False, '54-2')],
-    [(False, '33-2'), (False, '53-2')],
-    [(False, '33-2'), (False, '45-2')],
-    [(False, '33-2'), (False, '44-2')],
-    [(False, '33-2'), (False, '43-2')],
-    [(False, '33-2'), (False, '35-2')],
-    [(False, '33-2'), (False, '34-2')],
-    [(True, '33-2'), (True, '34-2'), (True, '35-2'), (True, '43-2'), (True, '44-2'), (True, '45-2'), (True, '53-2'), (True, '54-2'), (True, '55-2')],
-    [(False, '54-3'), (False, '55-3')],
-    [(False, '53-3'), (False, '55-3')],
-    [(False, '53-3'), (False, '54-3')],
-    [(False, '45-3'), (False, '55-3')],
-    [(False, '45-3'), (False, '54-3')],
-    [(False, '45-3'), (False, '53-3')],
-    [(False, '44-3'), (False, '55-3')],
-    [(False, '44-3'), (False, '54-3')],
-    [(False, '44-3'), (False, '53-3')],
-    [(False, '44-3'), (False, '45-3')],
-    [(False, '43-3'), (False, '55-3')],
-    [(False, '43-3'), (False, '54-3')],
-    [(False, '43-3'), (False, '53-3')],
-    [(False, '43-3'), (False, '45-3')],
-    [(False, '43-3'), (False, '44-3')],
-    [(False, '35-3'), (False, '55-3')],
-    [(False, '35-3'), (False, '54-3')],
-    [(False, '35-3'), (False, '53-3')],
-    [(False, '35-3'), (False, '45-3')],
-    [(False, '35-3'), (False, '44-3')],
-    [(False, '35-3'), (False, '43-3')],
-    [(False, '34-3'), (False, '55-3')],
-    [(False, '34-3'), (False, '54-3')],
-    [(False, '34-3'), (False, '53-3')],
-    [(False, '34-3'), (False, '45-3')],
-    [(False, '34-3'), (False, '44-3')],
-    [(False, '34-3'), (False, '43-3')],
-    [(False, '34-3'), (False, '35-3')],
-    [(False, '33-3'), (False, '55-3')],
-    [(False, '33-3'), (False, '54-3')],
-    [(False, '33-3'), (False, '53-3')],
-    [(False, '33-3'), (False, '45-3')],
-    [(False, '33-3'), (False, '44-3')],
-    [(False, '33-3'), (False, '43-3')],
-    [(False, '33-3'), (False, '35-3')],
-    [(False, '33-3'), (False, '34-3')],
-    [(True, '33-3'), (True, '34-3'), (True, '35-3'), (True, '43-3'), (True, '44-3'), (True, '45-3'), (True, '53-3'), (True, '54-3'), (True, '55-3')],
-    [(False, '54-4'), (False, '55-4')],
-    [(False, '53-4'), (False, '55-4')],
-    [(False, '53-4'), (False, '54-4')],
-    [(False, '45-4'), (False, '55-4')],
-    [(False, '45-4'), (False, '54-4')],
-    [(False, '45-4'), (False, '53-4')],
-    [(False, '44-4'), (False, '55-4')],
-    [(False, '44-4'), (False, '54-4')],
-    [(False, '44-4'), (False, '53-4')],
-    [(False, '44-4'), (False, '45-4')],
-    [(False, '43-4'), (False, '55-4')],
-    [(False, '43-4'), (False, '54-4')],
-    [(False, '43-4'), (False, '53-4')],
-    [(False, '43-4'), (False, '45-4')],
-    [(False, '43-4'), (False, '44-4')],
-    [(False, '35-4'), (False, '55-4')],
-    [(False, '35-4'), (False, '54-4')],
-    [(False, '35-4'), (False, '53-4')],
-    [(False, '35-4'), (False, '45-4')],
-    [(False, '35-4'), (False, '44-4')],
-    [(False, '35-4'), (False, '43-4')],
-    [(False, '34-4'), (False, '55-4')],
-    [(False, '34-4'), (False, '54-4')],
-    [(False, '34-4'), (False, '53-4')],
-    [(False, '34-4'), (False, '45-4')],
-    [(False, '34-4'), (False, '44-4')],
-    [(False, '34-4'), (False, '43-4')],
-    [(False, '34-4'), (False, '35-4')],
-    [(False, '33-4'), (False, '55-4')],
-    [(False, '33-4'), (False, '54-4')],
-    [(False, '33-4'), (False, '53-4')],
-    [(False, '33-4'), (False, '45-4')],
-    [(False, '33-4'), (False, '44-4')],
-    [(False, '33-4'), (False, '43-4')],
-    [(False, '33-4'), (False, '35-4')],
-    [(False, '33-4'), (False, '34-4')],
-    [(True, '33-4'), (True, '34-4'), (True, '35-4'), (True, '43-4'), (True, '44-4'), (True, '45-4'), (True, '53-4'), (True, '54-4'), (True, '55-4')],
-    [(False, '54-5'), (False, '55-5')],
-    [(False, '53-5'), (False, '55-5')],
-    [(False, '53-5'), (False, '54-5')],
-    [(False, '45-5'), (False, '55-5')],
-    [(False, '45-5'), (False, '54-5')],
-    [(False, '45-5'), (False, '53-5')],
-    [(False, '44-5'), (False, '55-5')],
-    [(False, '44-5'), (False, '54-5')],
-    [(False, '44-5'), (False, '53-5')],
-    [(False, '44-5'), (False, '45-5')],
-    [(False, '43-5'), (False, '55-5')],
-    [(False, '43-5'), (False, '54-5')],
-    [(False, '43-5'), (False, '53-5')],
-    [(False, '43-5'), (False, '45-5')],
-    [(False, '43-5'), (False, '44-5')],
-    [(False, '35-5'), (False, '55-5')],
-    [(False, '35-5'), (False, '54-5')],
-    [(False, '35-5'), (False, '53-5')],
-    [(False, '35-5'), (False, '45-5')],
-    [(False, '35-5'), (False, '44-5')],
-    [(False, '35-5'), (False, '43-5')],
-    [(False, '34-5'), (False, '55-5')],
-    [(False, '34-5'), (False, '54-5')],
-    [(False, '34-5'), (False, '53-5')],
-    [(False, '34-5'), (False, '45-5')],
-    [(False, '34-5'), (False, '44-5')],
-    [(False, '34-5'), (False, '43-5')],
-    [(False, '34-5'), (False, '35-5')],
-    [(False, '33-5'), (False, '55-5')],
-    [(False, '33-5'), (False, '54-5')],
-    [(False, '33-5'), (False, '53-5')],
-    [(False, '33-5'), (False, '45-5')],
-    [(False, '33-5'), (False, '44-5')],
-    [(False, '33-5'), (False, '43-5')],
-    [(False, '33-5'), (False, '35-5')],
-    [(False, '33-5'), (False, '34-5')],
-    [(True, '33-5'), (True, '34-5'), (True, '35-5'), (True, '43-5'), (True, '44-5'), (True, '45-5'), (True, '53-5'), (True, '54-5'), (True, '55-5')],
-    [(False, '54-6'), (False, '55-6')],
-    [(False, '53-6'), (False, '55-6')],
-    [(False, '53-6'), (False, '54-6')],
-    [(False, '45-6'), (False, '55-6')],
-    [(False, '45-6'), (False, '54-6')],
-    [(False, '45-6'), (False, '53-6')],
-    [(False, '44-6'), (False, '55-6')],
-    [(False, '44-6'), (False, '54-6')],
-    [(False, '44-6'), (False, '53-6')],
-    [(False, '44-6'), (False, '45-6')],
-    [(False, '43-6'), (False, '55-6')],
-    [(False, '43-6'), (False, '54-6')],
-    [(False, '43-6'), (False, '53-6')],
-    [(False, '43-6'), (False, '45-6')],
-    [(False, '43-6'), (False, '44-6')],
-    [(False, '35-6'), (False, '55-6')],
-    [(False, '35-6'), (False, '54-6')],
-    [(False, '35-6'), (False, '53-6')],
-    [(False, '35-6'), (False, '45-6')],
-    [(False, '35-6'), (False, '44-6')],
-    [(False, '35-6'), (False, '43-6')],
-    [(False, '34-6'), (False, '55-6')],
-    [(False, '34-6'), (False, '54-6')],
-    [(False, '34-6'), (False, '53-6')],
-    [(False, '34-6'), (False, '45-6')],
-    [(False, '34-6'), (False, '44-6')],
-    [(False, '34-6'), (False, '43-6')],
-    [(False, '34-6'), (False, '35-6')],
-    [(False, '33-6'), (False, '55-6')],
-    [(False, '33-6'), (False, '54-6')],
-    [(False, '33-6'), (False, '53-6')],
-    [(False, '33-6'), (False, '45-6')],
-    [(False, '33-6'), (False, '44-6')],
-    [(False, '33-6'), (False, '43-6')],
-    [(False, '33-6'), (False, '35-6')],
-    [(False, '33-6'), (False, '34-6')],
-    [(True, '33-6'), (True, '34-6'), (True, '35-6'), (True, '43-6'), (True, '44-6'), (True, '45-6'), (True, '53-6'), (True, '54-6'), (True, '55-6')],
-    [(False, '54-7'), (False, '55-7')],
-    [(False, '53-7'), (False, '55-7')],
-    [(False, '53-7'), (False, '54-7')],
-    [(False, '45-7'), (False, '55-7')],
-    [(False, '45-7'), (False, '54-7')],
-    [(False, '45-7'), (False, '53-7')],
-    [(False, '44-7'), (False, '55-7')],
-    [(False, '44-7'), (False, '54-7')],
-    [(False, '44-7'), (False, '53-7')],
-    [(False, '44-7'), (False, '45-7')],
-    [(False, '43-7'), (False, '55-7')],
-    [(False, '43-7'), (False, '54-7')],
-    [(False, '43-7'), (False, '53-7')],
-    [(False, '43-7'), (False, '45-7')],
-    [(False, '43-7'), (False, '44-7')],
-    [(False, '35-7'), (False, '55-7')],
-    [(False, '35-7'), (False, '54-7')],
-    [(False, '35-7'), (False, '53-7')],
-    [(False, '35-7'), (False, '45-7')],
-    [(False, '35-7'), (False, '44-7')],
-    [(False, '35-7'), (False, '43-7')],
-    [(False, '34-7'), (False, '55-7')],
-    [(False, '34-7'), (False, '54-7')],
-    [(False, '34-7'), (False, '53-7')],
-    [(False, '34-7'), (False, '45-7')],
-    [(False, '34-7'), (False, '44-7')],
-    [(False, '34-7'), (False, '43-7')],
-    [(False, '34-7'), (False, '35-7')],
-    [(False, '33-7'), (False, '55-7')],
-    [(False, '33-7'), (False, '54-7')],
-    [(False, '33-7'), (False, '53-7')],
-    [(False, '33-7'), (False, '45-7')],
-    [(False, '33-7'), (False, '44-7')],
-    [(False, '33-7'), (False, '43-7')],
-    [(False, '33-7'), (False, '35-7')],
-    [(False, '33-7'), (False, '34-7')],
-    [(True, '33-7'), (True, '34-7'), (True, '35-7'), (True, '43-7'), (True, '44-7'), (True, '45-7'), (True, '53-7'), (True, '54-7'), (True, '55-7')],
-    [(False, '54-8'), (False, '55-8')],
-    [(False, '53-8'), (False, '55-8')],
-    [(False, '53-8'), (False, '54-8')],
-    [(False, '45-8'), (False, '55-8')],
-    [(False, '45-8'), (False, '54-8')],
-    [(False, '45-8'), (False, '53-8')],
-    [(False, '44-8'), (False, '55-8')],
-    [(False, '44-8'), (False, '54-8')],
-    [(False, '44-8'), (False, '53-8')],
-    [(False, '44-8'), (False, '45-8')],
-    [(False, '43-8'), (False, '55-8')],
-    [(False, '43-8'), (False, '54-8')],
-    [(False, '43-8'), (False, '53-8')],
-    [(False, '43-8'), (False, '45-8')],
-    [(False, '43-8'), (False, '44-8')],
-    [(False, '35-8'), (False, '55-8')],
-    [(False, '35-8'), (False, '54-8')],
-    [(False, '35-8'), (False, '53-8')],
-    [(False, '35-8'), (False, '45-8')],
-    [(False, '35-8'), (False, '44-8')],
-    [(False, '35-8'), (False, '43-8')],
-    [(False, '34-8'), (False, '55-8')],
-    [(False, '34-8'), (False, '54-8')],
-    [(False, '34-8'), (False, '53-8')],
-    [(False, '34-8'), (False, '45-8')],
-    [(False, '34-8'), (False, '44-8')],
-    [(False, '34-8'), (False, '43-8')],
-    [(False, '34-8'), (False, '35-8')],
-    [(False, '33-8'), (False, '55-8')],
-    [(False, '33-8'), (False, '54-8')],
-    [(False, '33-8'), (False, '53-8')],
-    [(False, '33-8'), (False, '45-8')],
-    [(False, '33-8'), (False, '44-8')],
-    [(False, '33-8'), (False, '43-8')],
-    [(False, '33-8'), (False, '35-8')],
-    [(False, '33-8'), (False, '34-8')],
-    [(True, '33-8'), (True, '34-8'), (True, '35-8'), (True, '43-8'), (True, '44-8'), (True, '45-8'), (True, '53-8'), (True, '54-8'), (True, '55-8')],
-    [(False, '54-9'), (False, '55-9')],
-    [(False, '53-9'), (False, '55-9')],
-    [(False, '53-9'), (False, '54-9')],
-    [(False, '45-9'), (False, '55-9')],
-    [(False, '45-9'), (False, '54-9')],
-    [(False, '45-9'), (False, '53-9')],
-    [(False, '44-9'), (False, '55-9')],
-    [(False, '44-9'), (False, '54-9')],
-    [(False, '44-9'), (False, '53-9')],
-    [(False, '44-9'), (False, '45-9')],
-    [(False, '43-9'), (False, '55-9')],
-    [(False, '43-9'), (False, '54-9')],
-    [(False, '43-9'), (False, '53-9')],
-    [(False, '43-9'), (False, '45-9')],
-    [(False, '43-9'), (False, '44-9')],
-    [(False, '35-9'), (False, '55-9')],
-    [(False, '35-9'), (False, '54-9')],
-    [(False, '35-9'), (False, '53-9')],
-    [(False, '35-9'), (False, '45-9')],
-    [(False, '35-9'), (False, '44-9')],
-    [(False, '35-9'), (False, '43-9')],
-    [(False, '34-9'), (False, '55-9')],
-    [(False, '34-9'), (False, '54-9')],
-    [(False, '34-9'), (False, '53-9')],
-    [(False, '34-9'), (False, '45-9')],
-    [(False, '34-9'), (False, '44-9')],
-    [(False, '34-9'), (False, '43-9')],
-    [(False, '34-9'), (False, '35-9')],
-    [(False, '33-9'), (False, '55-9')],
-    [(False, '33-9'), (False, '54-9')],
-    [(False, '33-9'), (False, '53-9')],
-    [(False, '33-9'), (False, '45-9')],
-    [(False, '33-9'), (False, '44-9')],
-    [(False, '33-9'), (False, '43-9')],
-    [(False, '33-9'), (False, '35-9')],
-    [(False, '33-9'), (False, '34-9')],
-    [(True, '33-9'), (True, '34-9'), (True, '35-9'), (True, '43-9'), (True, '44-9'), (True, '45-9'), (True, '53-9'), (True, '54-9'), (True, '55-9')],
-    [(False, '57-1'), (False, '58-1')],
-    [(False, '56-1'), (False, '58-1')],
-    [(False, '56-1'), (False, '57-1')],
-    [(False, '48-1'), (False, '58-1')],
-    [(False, '48-1'), (False, '57-1')],
-    [(False, '48-1'), (False, '56-1')],
-    [(False, '47-1'), (False, '58-1')],
-    [(False, '47-1'), (False, '57-1')],
-    [(False, '47-1'), (False, '56-1')],
-    [(False, '47-1'), (False, '48-1')],
-    [(False, '46-1'), (False, '58-1')],
-    [(False, '46-1'), (False, '57-1')],
-    [(False, '46-1'), (False, '56-1')],
-    [(False, '46-1'), (False, '48-1')],
-    [(False, '46-1'), (False, '47-1')],
-    [(False, '38-1'), (False, '58-1')],
-    [(False, '38-1'), (False, '57-1')],
-    [(False, '38-1'), (False, '56-1')],
-    [(False, '38-1'), (False, '48-1')],
-    [(False, '38-1'), (False, '47-1')],
-    [(False, '38-1'), (False, '46-1')],
-    [(False, '37-1'), (False, '58-1')],
-    [(False, '37-1'), (False, '57-1')],
-    [(False, '37-1'), (False, '56-1')],
-    [(False, '37-1'), (False, '48-1')],
-    [(False, '37-1'), (False, '47-1')],
-    [(False, '37-1'), (False, '46-1')],
-    [(False, '37-1'), (False, '38-1')],
-    [(False, '36-1'), (False, '58-1')],
-    [(False, '36-1'), (False, '57-1')],
-    [(False, '36-1'), (False, '56-1')],
-    [(False, '36-1'), (False, '48-1')],
-    [(False, '36-1'), (False, '47-1')],
-    [(False, '36-1'), (False, '46-1')],
-    [(False, '36-1'), (False, '38-1')],
-    [(False, '36-1'), (False, '37-1')],
-    [(True, '36-1'), (True, '37-1'), (True, '38-1'), (True, '46-1'), (True, '47-1'), (True, '48-1'), (True, '56-1'), (True, '57-1'), (True, '58-1')],
-    [(False, '57-2'), (False, '58-2')],
-    [(False, '56-2'), (False, '58-2')],
-    [(False, '56-2'), (False, '57-2')],
-    [(False, '48-2'), (False, '58-2')],
-    [(False, '48-2'), (False, '57-2')],
-    [(False, '48-2'), (False, '56-2')],
-    [(False, '47-2'), (False, '58-2')],
-    [(False, '47-2'), (False, '57-2')],
-    [(False, '47-2'), (False, '56-2')],
-    [(False, '47-2'), (False, '48-2')],
-    [(False, '46-2'), (False, '58-2')],
-    [(False, '46-2'), (False, '57-2')],
-    [(False, '46-2'), (False, '56-2')],
-    [(False, '46-2'), (False, '48-2')],
-    [(False, '46-2'), (False, '47-2')],
-    [(False, '38-2'), (False, '58-2')],
-    [(False, '38-2'), (False, '57-2')],
-    [(False, '38-2'), (False, '56-2')],
-    [(False, '38-2'), (False, '48-2')],
-    [(False, '38-2'), (False, '47-2')],
-    [(False, '38-2'), (False, '46-2')],
-    [(False, '37-2'), (False, '58-2')],
-    [(False, '37-2'), (False, '57-2')],
-    [(False, '37-2'), (False, '56-2')],
-    [(False, '37-2'), (False, '48-2')],
-    [(False, '37-2'), (False, '47-2')],
-    [(False, '37-2'), (False, '46-2')],
-    [(False, '37-2'), (False, '38-2')],
-    [(False, '36-2'), (False, '58-2')],
-    [(False, '36-2'), (False, '57-2')],
-    [(False, '36-2'), (False, '56-2')],
-    [(False, '36-2'), (False, '48-2')],
-    [(False, '36-2'), (False, '47-2')],
-    [(False, '36-2'), (False, '46-2')],
-    [(False, '36-2'), (False, '38-2')],
-    [(False, '36-2'), (False, '37-2')],
-    [(True, '36-2'), (True, '37-2'), (True, '38-2'), (True, '46-2'), (True, '47-2'), (True, '48-2'), (True, '56-2'), (True, '57-2'), (True, '58-2')],
-    [(False, '57-3'), (False, '58-3')],
-    [(False, '56-3'), (False, '58-3')],
-    [(False, '56-3'), (False, '57-3')],
-    [(False, '48-3'), (False, '58-3')],
-    [(False, '48-3'), (False, '57-3')],
-    [(False, '48-3'), (False, '56-3')],
-    [(False, '47-3'), (False, '58-3')],
-    [(False, '47-3'), (False, '57-3')],
-    [(False, '47-3'), (False, '56-3')],
-    [(False, '47-3'), (False, '48-3')],
-    [(False, '46-3'), (False, '58-3')],
-    [(False, '46-3'), (False, '57-3')],
-    [(False, '46-3'), (False, '56-3')],
-    [(False, '46-3'), (False, '48-3')],
-    [(False, '46-3'), (False, '47-3')],
-    [(False, '38-3'), (False, '58-3')],
-    [(False, '38-3'), (False, '57-3')],
-    [(False, '38-3'), (False, '56-3')],
-    [(False, '38-3'), (False, '48-3')],
-    [(False, '38-3'), (False, '47-3')],
-    [(False, '38-3'), (False, '46-3')],
-    [(False, '37-3'), (False, '58-3')],
-    [(False, '37-3'), (False, '57-3')],
-    [(False, '37-3'), (False, '56-3')],
-    [(False, '37-3'), (False, '48-3')],
-    [(False, '37-3'), (False, '47-3')],
-    [(False, '37-3'), (False, '46-3')],
-    [(False, '37-3'), (False, '38-3')],
-    [(False, '36-3'), (False, '58-3')],
-    [(False, '36-3'), (False, '57-3')],
-    [(False, '36-3'), (False, '56-3')],
-    [(False, '36-3'), (False, '48-3')],
-    [(False, '36-3'), (False, '47-3')],
-    [(False, '36-3'), (False, '46-3')],
-    [(False, '36-3'), (False, '38-3')],
-    [(False, '36-3'), (False, '37-3')],
-    [(True, '36-3'), (True, '37-3'), (True, '38-3'), (True, '46-3'), (True, '47-3'), (True, '48-3'), (True, '56-3'), (True, '57-3'), (True, '58-3')],
-    [(False, '57-4'), (False, '58-4')],
-    [(False, '56-4'), (False, '58-4')],
-    [(False, '56-4'), (False, '57-4')],
-    [(False, '48-4'), (False, '58-4')],
-    [(False, '48-4'), (False, '57-4')],
-    [(False, '48-4'), (False, '56-4')],
-    [(False, '47-4'), (False, '58-4')],
-    [(False, '47-4'), (False, '57-4')],
-    [(False, '47-4'), (False, '56-4')],
-    [(False, '47-4'), (False, '48-4')],
-    [(False, '46-4'), (False, '58-4')],
-    [(False, '46-4'), (False, '57-4')],
-    [(False, '46-4'), (False, '56-4')],
-    [(False, '46-4'), (False, '48-4')],
-    [(False, '46-4'), (False, '47-4')],
-    [(False, '38-4'), (False, '58-4')],
-    [(False, '38-4'), (False, '57-4')],
-    [(False, '38-4'), (False, '56-4')],
-    [(False, '38-4'), (False, '48-4')],
-    [(False, '38-4'), (False, '47-4')],
-    [(False, '38-4'), (False, '46-4')],
-    [(False, '37-4'), (False, '58-4')],
-    [(False, '37-4'), (False, '57-4')],
-    [(False, '37-4'), (False, '56-4')],
-    [(False, '37-4'), (False, '48-4')],
-    [(False, '37-4'), (False, '47-4')],
-    [(False, '37-4'), (False, '46-4')],
-    [(False, '37-4'), (False, '38-4')],
-    [(False, '36-4'), (False, '58-4')],
-    [(False, '36-4'), (False, '57-4')],
-    [(False, '36-4'), (False, '56-4')],
-    [(False, '36-4'), (False, '48-4')],
-    [(False, '36-4'), (False, '47-4')],
-    [(False, '36-4'), (False, '46-4')],
-    [(False, '36-4'), (False, '38-4')],
-    [(False, '36-4'), (False, '37-4')],
-    [(True, '36-4'), (True, '37-4'), (True, '38-4'), (True, '46-4'), (True, '47-4'), (True, '48-4'), (True, '56-4'), (True, '57-4'), (True, '58-4')],
-    [(False, '57-5'), (False, '58-5')],
-    [(False, '56-5'), (False, '58-5')],
-    [(False, '56-5'), (False, '57-5')],
-    [(False, '48-5'), (False, '58-5')],
-    [(False, '48-5'), (False, '57-5')],
-    [(False, '48-5'), (False, '56-5')],
-    [(False, '47-5'), (False, '58-5')],
-    [(False, '47-5'), (False, '57-5')],
-    [(False, '47-5'), (False, '56-5')],
-    [(False, '47-5'), (False, '48-5')],
-    [(False, '46-5'), (False, '58-5')],
-    [(False, '46-5'), (False, '57-5')],
-    [(False, '46-5'), (False, '56-5')],
-    [(False, '46-5'), (False, '48-5')],
-    [(False, '46-5'), (False, '47-5')],
-    [(False, '38-5'), (False, '58-5')],
-    [(False, '38-5'), (False, '57-5')],
-    [(False, '38-5'), (False, '56-5')],
-    [(False, '38-5'), (False, '48-5')],
-    [(False, '38-5'), (False, '47-5')],
-    [(False, '38-5'), (False, '46-5')],
-    [(False, '37-5'), (False, '58-5')],
-    [(False, '37-5'), (False, '57-5')],
-    [(False, '37-5'), (False, '56-5')],
-    [(False, '37-5'), (False, '48-5')],
-    [(False, '37-5'), (False, '47-5')],
-    [(False, '37-5'), (False, '46-5')],
-    [(False, '37-5'), (False, '38-5')],
-    [(False, '36-5'), (False, '58-5')],
-    [(False, '36-5'), (False, '57-5')],
-    [(False, '36-5'), (False, '56-5')],
-    [(False, '36-5'), (False, '48-5')],
-    [(False, '36-5'), (False, '47-5')],
-    [(False, '36-5'), (False, '46-5')],
-    [(False, '36-5'), (False, '38-5')],
-    [(False, '36-5'), (False, '37-5')],
-    [(True, '36-5'), (True, '37-5'), (True, '38-5'), (True, '46-5'), (True, '47-5'), (True, '48-5'), (True, '56-5'), (True, '57-5'), (True, '58-5')],
-    [(False, '57-6'), (False, '58-6')],
-    [(False, '56-6'), (False, '58-6')],
-    [(False, '56-6'), (False, '57-6')],
-    [(False, '48-6'), (False, '58-6')],
-    [(False, '48-6'), (False, '57-6')],
-    [(False, '48-6'), (False, '56-6')],
-    [(False, '47-6'), (False, '58-6')],
-    [(False, '47-6'), (False, '57-6')],
-    [(False, '47-6'), (False, '56-6')],
-    [(False, '47-6'), (False, '48-6')],
-    [(False, '46-6'), (False, '58-6')],
-    [(False, '46-6'), (False, '57-6')],
-    [(False, '46-6'), (False, '56-6')],
-    [(False, '46-6'), (False, '48-6')],
-    [(False, '46-6'), (False, '47-6')],
-    [(False, '38-6'), (False, '58-6')],
-    [(False, '38-6'), (False, '57-6')],
-    [(False, '38-6'), (False, '56-6')],
-    [(False, '38-6'), (False, '48-6')],
-    [(False, '38-6'), (False, '47-6')],
-    [(False, '38-6'), (False, '46-6')],
-    [(False, '37-6'), (False, '58-6')],
-    [(False, '37-6'), (False, '57-6')],
-    [(False, '37-6'), (False, '56-6')],
-    [(False, '37-6'), (False, '48-6')],
-    [(False, '37-6'), (False, '47-6')],
-    [(False, '37-6'), (False, '46-6')],
-    [(False, '37-6'), (False, '38-6')],
-    [(False, '36-6'), (False, '58-6')],
-    [(False, '36-6'), (False, '57-6')],
-    [(False, '36-6'), (False, '56-6')],
-    [(False, '36-6'), (False, '48-6')],
-    [(False, '36-6'), (False, '47-6')],
-    [(False, '36-6'), (False, '46-6')],
-    [(False, '36-6'), (False, '38-6')],
-    [(False, '36-6'), (False, '37-6')],
-    [(True, '36-6'), (True, '37-6'), (True, '38-6'), (True, '46-6'), (True, '47-6'), (True, '48-6'), (True, '56-6'), (True, '57-6'), (True, '58-6')],
-    [(False, '57-7'), (False, '58-7')],
-    [(False, '56-7'), (False, '58-7')],
-    [(False, '56-7'), (False, '57-7')],
-    [(False, '48-7'), (False, '58-7')],
-    [(False, '48-7'), (False, '57-7')],
-    [(False, '48-7'), (False, '56-7')],
-    [(False, '47-7'), (False, '58-7')],
-    [(False, '47-7'), (False, '57-7')],
-    [(False, '47-7'), (False, '56-7')],
-    [(False, '47-7'), (False, '48-7')],
-    [(False, '46-7'), (False, '58-7')],
-    [(False, '46-7'), (False, '57-7')],
-    [(False, '46-7'), (False, '56-7')],
-    [(False, '46-7'), (False, '48-7')],
-    [(False, '46-7'), (False, '47-7')],
-    [(False, '38-7'), (False, '58-7')],
-    [(False, '38-7'), (False, '57-7')],
-    [(False, '38-7'), (False, '56-7')],
-    [(False, '38-7'), (False, '48-7')],
-    [(False, '38-7'), (False, '47-7')],
-    [(False, '38-7'), (False, '46-7')],
-    [(False, '37-7'), (False, '58-7')],
-    [(False, '37-7'), (False, '57-7')],
-    [(False, '37-7'), (False, '56-7')],
-    [(False, '37-7'), (False, '48-7')],
-    [(False, '37-7'), (False, '47-7')],
-    [(False, '37-7'), (False, '46-7')],
-    [(False, '37-7'), (False, '38-7')],
-    [(False, '36-7'), (False, '58-7')],
-    [(False, '36-7'), (False, '57-7')],
-    [(False, '36-7'), (False, '56-7')],
-    [(False, '36-7'), (False, '48-7')],
-    [(False, '36-7'), (False, '47-7')],
-    [(False, '36-7'), (False, '46-7')],
-    [(False, '36-7'), (False, '38-7')],
-    [(False, '36-7'), (False, '37-7')],
-    [(True, '36-7'), (True, '37-7'), (True, '38-7'), (True, '46-7'), (True, '47-7'), (True, '48-7'), (True, '56-7'), (True, '57-7'), (True, '58-7')],
-    [(False, '57-8'), (False, '58-8')],
-    [(False, '56-8'), (False, '58-8')],
-    [(False, '56-8'), (False, '57-8')],
-    [(False, '48-8'), (False, '58-8')],
-    [(False, '48-8'), (False, '57-8')],
-    [(False, '48-8'), (False, '56-8')],
-    [(False, '47-8'), (False, '58-8')],
-    [(False, '47-8'), (False, '57-8')],
-    [(False, '47-8'), (False, '56-8')],
-    [(False, '47-8'), (False, '48-8')],
-    [(False, '46-8'), (False, '58-8')],
-    [(False, '46-8'), (False, '57-8')],
-    [(False, '46-8'), (False, '56-8')],
-    [(False, '46-8'), (False, '48-8')],
-    [(False, '46-8'), (False, '47-8')],
-    [(False, '38-8'), (False, '58-8')],
-    [(False, '38-8'), (False, '57-8')],
-    [(False, '38-8'), (False, '56-8')],
-    [(False, '38-8'), (False, '48-8')],
-    [(False, '38-8'), (False, '47-8')],
-    [(False, '38-8'), (False, '46-8')],
-    [(False, '37-8'), (False, '58-8')],
-    [(False, '37-8'), (False, '57-8')],
-    [(False, '37-8'), (False, '56-8')],
-    [(False, '37-8'), (False, '48-8')],
-    [(False, '37-8'), (False, '47-8')],
-    [(False, '37-8'), (False, '46-8')],
-    [(False, '37-8'), (False, '38-8')],
-    [(False, '36-8'), (False, '58-8')],
-    [(False, '36-8'), (False, '57-8')],
-    [(False, '36-8'), (False, '56-8')],
-    [(False, '36-8'), (False, '48-8')],
-    [(False, '36-8'), (False, '47-8')],
-    [(False, '36-8'), (False, '46-8')],
-    [(False, '36-8'), (False, '38-8')],
-    [(False, '36-8'), (False, '37-8')],
-    [(True, '36-8'), (True, '37-8'), (True, '38-8'), (True, '46-8'), (True, '47-8'), (True, '48-8'), (True, '56-8'), (True, '57-8'), (True, '58-8')],
-    [(False, '57-9'), (False, '58-9')],
-    [(False, '56-9'), (False, '58-9')],
-    [(False, '56-9'), (False, '57-9')],
-    [(False, '48-9'), (False, '58-9')],
-    [(False, '48-9'), (False, '57-9')],
-    [(False, '48-9'), (False, '56-9')],
-    [(False, '47-9'), (False, '58-9')],
-    [(False, '47-9'), (False, '57-9')],
-    [(False, '47-9'), (False, '56-9')],
-    [(False, '47-9'), (False, '48-9')],
-    [(False, '46-9'), (False, '58-9')],
-    [(False, '46-9'), (False, '57-9')],
-    [(False, '46-9'), (False, '56-9')],
-    [(False, '46-9'), (False, '48-9')],
-    [(False, '46-9'), (False, '47-9')],
-    [(False, '38-9'), (False, '58-9')],
-    [(False, '38-9'), (False, '57-9')],
-    [(False, '38-9'), (False, '56-9')],
-    [(False, '38-9'), (False, '48-9')],
-    [(False, '38-9'), (False, '47-9')],
-    [(False, '38-9'), (False, '46-9')],
-    [(False, '37-9'), (False, '58-9')],
-    [(False, '37-9'), (False, '57-9')],
-    [(False, '37-9'), (False, '56-9')],
-    [(False, '37-9'), (False, '48-9')],
-    [(False, '37-9'), (False, '47-9')],
-    [(False, '37-9'), (False, '46-9')],
-    [(False, '37-9'), (False, '38-9')],
-    [(False, '36-9'), (False, '58-9')],
-    [(False, '36-9'), (False, '57-9')],
-    [(False, '36-9'), (False, '56-9')],
-    [(False, '36-9'), (False, '48-9')],
-    [(False, '36-9'), (False, '47-9')],
-    [(False, '36-9'), (False, '46-9')],
-    [(False, '36-9'), (False, '38-9')],
-    [(False, '36-9'), (False, '37-9')],
-    [(True, '36-9'), (True, '37-9'), (True, '38-9'), (True, '46-9'), (True, '47-9'), (True, '48-9'), (True, '56-9'), (True, '57-9'), (True, '58-9')],
-    [(False, '81-1'), (False, '82-1')],
-    [(False, '80-1'), (False, '82-1')],
-    [(False, '80-1'), (False, '81-1')],
-    [(False, '72-1'), (False, '82-1')],
-    [(False, '72-1'), (False, '81-1')],
-    [(False, '72-1'), (False, '80-1')],
-    [(False, '71-1'), (False, '82-1')],
-    [(False, '71-1'), (False, '81-1')],
-    [(False, '71-1'), (False, '80-1')],
-    [(False, '71-1'), (False, '72-1')],
-    [(False, '70-1'), (False, '82-1')],
-    [(False, '70-1'), (False, '81-1')],
-    [(False, '70-1'), (False, '80-1')],
-    [(False, '70-1'), (False, '72-1')],
-    [(False, '70-1'), (False, '71-1')],
-    [(False, '62-1'), (False, '82-1')],
-    [(False, '62-1'), (False, '81-1')],
-    [(False, '62-1'), (False, '80-1')],
-    [(False, '62-1'), (False, '72-1')],
-    [(False, '62-1'), (False, '71-1')],
-    [(False, '62-1'), (False, '70-1')],
-    [(False, '61-1'), (False, '82-1')],
-    [(False, '61-1'), (False, '81-1')],
-    [(False, '61-1'), (False, '80-1')],
-    [(False, '61-1'), (False, '72-1')],
-    [(False, '61-1'), (False, '71-1')],
-    [(False, '61-1'), (False, '70-1')],
-    [(False, '61-1'), (False, '62-1')],
-    [(False, '60-1'), (False, '82-1')],
-    [(False, '60-1'), (False, '81-1')],
-    [(False, '60-1'), (False, '80-1')],
-    [(False, '60-1'), (False, '72-1')],
-    [(False, '60-1'), (False, '71-1')],
-    [(False, '60-1'), (False, '70-1')],
-    [(False, '60-1'), (False, '62-1')],
-    [(False, '60-1'), (False, '61-1')],
-    [(True, '60-1'), (True, '61-1'), (True, '62-1'), (True, '70-1'), (True, '71-1'), (True, '72-1'), (True, '80-1'), (True, '81-1'), (True, '82-1')],
-    [(False, '81-2'), (False, '82-2')],
-    [(False, '80-2'), (False, '82-2')],
-    [(False, '80-2'), (False, '81-2')],
-    [(False, '72-2'), (False, '82-2')],
-    [(False, '72-2'), (False, '81-2')],
-    [(False, '72-2'), (False, '80-2')],
-    [(False, '71-2'), (False, '82-2')],
-    [(False, '71-2'), (False, '81-2')],
-    [(False, '71-2'), (False, '80-2')],
-    [(False, '71-2'), (False, '72-2')],
-    [(False, '70-2'), (False, '82-2')],
-    [(False, '70-2'), (False, '81-2')],
-    [(False, '70-2'), (False, '80-2')],
-    [(False, '70-2'), (False, '72-2')],
-    [(False, '70-2'), (False, '71-2')],
-    [(False, '62-2'), (False, '82-2')],
-    [(False, '62-2'), (False, '81-2')],
-    [(False, '62-2'), (False, '80-2')],
-    [(False, '62-2'), (False, '72-2')],
-    [(False, '62-2'), (False, '71-2')],
-    [(False, '62-2'), (False, '70-2')],
-    [(False, '61-2'), (False, '82-2')],
-    [(False, '61-2'), (False, '81-2')],
-    [(False, '61-2'), (False, '80-2')],
-    [(False, '61-2'), (False, '72-2')],
-    [(False, '61-2'), (False, '71-2')],
-    [(False, '61-2'), (False, '70-2')],
-    [(False, '61-2'), (False, '62-2')],
-    [(False, '60-2'), (False, '82-2')],
-    [(False, '60-2'), (False, '81-2')],
-    [(False, '60-2'), (False, '80-2')],
-    [(False, '60-2'), (False, '72-2')],
-    [(False, '60-2'), (False, '71-2')],
-    [(False, '60-2'), (False, '70-2')],
-    [(False, '60-2'), (False, '62-2')],
-    [(False, '60-2'), (False, '61-2')],
-    [(True, '60-2'), (True, '61-2'), (True, '62-2'), (True, '70-2'), (True, '71-2'), (True, '72-2'), (True, '80-2'), (True, '81-2'), (True, '82-2')],
-    [(False, '81-3'), (False, '82-3')],
-    [(False, '80-3'), (False, '82-3')],
-    [(False, '80-3'), (False, '81-3')],
-    [(False, '72-3'), (False, '82-3')],
-    [(False, '72-3'), (False, '81-3')],
-    [(False, '72-3'), (False, '80-3')],
-    [(False, '71-3'), (False, '82-3')],
-    [(False, '71-3'), (False, '81-3')],
-    [(False, '71-3'), (False, '80-3')],
-    [(False, '71-3'), (False, '72-3')],
-    [(False, '70-3'), (False, '82-3')],
-    [(False, '70-3'), (False, '81-3')],
-    [(False, '70-3'), (False, '80-3')],
-    [(False, '70-3'), (False, '72-3')],
-    [(False, '70-3'), (False, '71-3')],
-    [(False, '62-3'), (False, '82-3')],
-    [(False, '62-3'), (False, '81-3')],
-    [(False, '62-3'), (False, '80-3')],
-    [(False, '62-3'), (False, '72-3')],
-    [(False, '62-3'), (False, '71-3')],
-    [(False, '62-3'), (False, '70-3')],
-    [(False, '61-3'), (False, '82-3')],
-    [(False, '61-3'), (False, '81-3')],
-    [(False, '61-3'), (False, '80-3')],
-    [(False, '61-3'), (False, '72-3')],
-    [(False, '61-3'), (False, '71-3')],
-    [(False, '61-3'), (False, '70-3')],
-    [(False, '61-3'), (False, '62-3')],
-    [(False, '60-3'), (False, '82-3')],
-    [(False, '60-3'), (False, '81-3')],
-    [(False, '60-3'), (False, '80-3')],
-    [(False, '60-3'), (False, '72-3')],
-    [(False, '60-3'), (False, '71-3')],
-    [(False, '60-3'), (False, '70-3')],
-    [(False, '60-3'), (False, '62-3')],
-    [(False, '60-3'), (False, '61-3')],
-    [(True, '60-3'), (True, '61-3'), (True, '62-3'), (True, '70-3'), (True, '71-3'), (True, '72-3'), (True, '80-3'), (True, '81-3'), (True, '82-3')],
-    [(False, '81-4'), (False, '82-4')],
-    [(False, '80-4'), (False, '82-4')],
-    [(False, '80-4'), (False, '81-4')],
-    [(False, '72-4'), (False, '82-4')],
-    [(False, '72-4'), (False, '81-4')],
-    [(False, '72-4'), (False, '80-4')],
-    [(False, '71-4'), (False, '82-4')],
-    [(False, '71-4'), (False, '81-4')],
-    [(False, '71-4'), (False, '80-4')],
-    [(False, '71-4'), (False, '72-4')],
-    [(False, '70-4'), (False, '82-4')],
-    [(False, '70-4'), (False, '81-4')],
-    [(False, '70-4'), (False, '80-4')],
-    [(False, '70-4'), (False, '72-4')],
-    [(False, '70-4'), (False, '71-4')],
-    [(False, '62-4'), (False, '82-4')],
-    [(False, '62-4'), (False, '81-4')],
-    [(False, '62-4'), (False, '80-4')],
-    [(False, '62-4'), (False, '72-4')],
-    [(False, '62-4'), (False, '71-4')],
-    [(False, '62-4'), (False, '70-4')],
-    [(False, '61-4'), (False, '82-4')],
-    [(False, '61-4'), (False, '81-4')],
-    [(False, '61-4'), (False, '80-4')],
-    [(False, '61-4'), (False, '72-4')],
-    [(False, '61-4'), (False, '71-4')],
-    [(False, '61-4'), (False, '70-4')],
-    [(False, '61-4'), (False, '62-4')],
-    [(False, '60-4'), (False, '82-4')],
-    [(False, '60-4'), (False, '81-4')],
-    [(False, '60-4'), (False, '80-4')],
-    [(False, '60-4'), (False, '72-4')],
-    [(False, '60-4'), (False, '71-4')],
-    [(False, '60-4'), (False, '70-4')],
-    [(False, '60-4'), (False, '62-4')],
-    [(False, '60-4'), (False, '61-4')],
-    [(True, '60-4'), (True, '61-4'), (True, '62-4'), (True, '70-4'), (True, '71-4'), (True, '72-4'), (True, '80-4'), (True, '81-4'), (True, '82-4')],
-    [(False, '81-5'), (False, '82-5')],
-    [(False, '80-5'), (False, '82-5')],
-    [(False, '80-5'), (False, '81-5')],
-    [(False, '72-5'), (False, '82-5')],
-    [(False, '72-5'), (False, '81-5')],
-    [(False, '72-5'), (False, '80-5')],
-    [(False, '71-5'), (False, '82-5')],
-    [(False, '71-5'), (False, '81-5')],
-    [(False, '71-5'), (False, '80-5')],
-    [(False, '71-5'), (False, '72-5')],
-    [(False, '70-5'), (False, '82-5')],
-    [(False, '70-5'), (False, '81-5')],
-    [(False, '70-5'), (False, '80-5')],
-    [(False, '70-5'), (False, '72-5')],
-    [(False, '70-5'), (False, '71-5')],
-    [(False, '62-5'), (False, '82-5')],
-    [(False, '62-5'), (False, '81-5')],
-    [(False, '62-5'), (False, '80-5')],
-    [(False, '62-5'), (False, '72-5')],
-    [(False, '62-5'), (False, '71-5')],
-    [(False, '62-5'), (False, '70-5')],
-    [(False, '61-5'), (False, '82-5')],
-    [(False, '61-5'), (False, '81-5')],
-    [(False, '61-5'), (False, '80-5')],
-    [(False, '61-5'), (False, '72-5')],
-    [(False, '61-5'), (False, '71-5')],
-    [(False, '61-5'), (False, '70-5')],
-    [(False, '61-5'), (False, '62-5')],
-    [(False, '60-5'), (False, '82-5')],
-    [(False, '60-5'), (False, '81-5')],
-    [(False, '60-5'), (False, '80-5')],
-    [(False, '60-5'), (False, '72-5')],
-    [(False, '60-5'), (False, '71-5')],
-    [(False, '60-5'), (False, '70-5')],
-    [(False, '60-5'), (False, '62-5')],
-    [(False, '60-5'), (False, '61-5')],
-    [(True, '60-5'), (True, '61-5'), (True, '62-5'), (True, '70-5'), (True, '71-5'), (True, '72-5'), (True, '80-5'), (True, '81-5'), (True, '82-5')],
-    [(False, '81-6'), (False, '82-6')],
-    [(False, '80-6'), (False, '82-6')],
-    [(False, '80-6'), (False, '81-6')],
-    [(False, '72-6'), (False, '82-6')],
-    [(False, '72-6'), (False, '81-6')],
-    [(False, '72-6'), (False, '80-6')],
-    [(False, '71-6'), (False, '82-6')],
-    [(False, '71-6'), (False, '81-6')],
-    [(False, '71-6'), (False, '80-6')],
-    [(False, '71-6'), (False, '72-6')],
-    [(False, '70-6'), (False, '82-6')],
-    [(False, '70-6'), (False, '81-6')],
-    [(False, '70-6'), (False, '80-6')],
-    [(False, '70-6'), (False, '72-6')],
-    [(False, '70-6'), (False, '71-6')],
-    [(False, '62-6'), (False, '82-6')],
-    [(False, '62-6'), (False, '81-6')],
-    [(False, '62-6'), (False, '80-6')],
-    [(False, '62-6'), (False, '72-6')],
-    [(False, '62-6'), (False, '71-6')],
-    [(False, '62-6'), (False, '70-6')],
-    [(False, '61-6'), (False, '82-6')],
-    [(False, '61-6'), (False, '81-6')],
-    [(False, '61-6'), (False, '80-6')],
-    [(False, '61-6'), (False, '72-6')],
-    [(False, '61-6'), (False, '71-6')],
-    [(False, '61-6'), (False, '70-6')],
-    [(False, '61-6'), (False, '62-6')],
-    [(False, '60-6'), (False, '82-6')],
-    [(False, '60-6'), (False, '81-6')],
-    [(False, '60-6'), (False, '80-6')],
-    [(False, '60-6'), (False, '72-6')],
-    [(False, '60-6'), (False, '71-6')],
-    [(False, '60-6'), (False, '70-6')],
-    [(False, '60-6'), (False, '62-6')],
-    [(False, '60-6'), (False, '61-6')],
-    [(True, '60-6'), (True, '61-6'), (True, '62-6'), (True, '70-6'), (True, '71-6'), (True, '72-6'), (True, '80-6'), (True, '81-6'), (True, '82-6')],
-    [(False, '81-7'), (False, '82-7')],
-    [(False, '80-7'), (False, '82-7')],
-    [(False, '80-7'), (False, '81-7')],
-    [(False, '72-7'), (False, '82-7')],
-    [(False, '72-7'), (False, '81-7')],
-    [(False, '72-7'), (False, '80-7')],
-    [(False, '71-7'), (False, '82-7')],
-    [(False, '71-7'), (False, '81-7')],
-    [(False, '71-7'), (False, '80-7')],
-    [(False, '71-7'), (False, '72-7')],
-    [(False, '70-7'), (False, '82-7')],
-    [(False, '70-7'), (False, '81-7')],
-    [(False, '70-7'), (False, '80-7')],
-    [(False, '70-7'), (False, '72-7')],
-    [(False, '70-7'), (False, '71-7')],
-    [(False, '62-7'), (False, '82-7')],
-    [(False, '62-7'), (False, '81-7')],
-    [(False, '62-7'), (False, '80-7')],
-    [(False, '62-7'), (False, '72-7')],
-    [(False, '62-7'), (False, '71-7')],
-    [(False, '62-7'), (False, '70-7')],
-    [(False, '61-7'), (False, '82-7')],
-    [(False, '61-7'), (False, '81-7')],
-    [(False, '61-7'), (False, '80-7')],
-    [(False, '61-7'), (False, '72-7')],
-    [(False, '61-7'), (False, '71-7')],
-    [(False, '61-7'), (False, '70-7')],
-    [(False, '61-7'), (False, '62-7')],
-    [(False, '60-7'), (False, '82-7')],
-    [(False, '60-7'), (False, '81-7')],
-    [(False, '60-7'), (False, '80-7')],
-    [(False, '60-7'), (False, '72-7')],
-    [(False, '60-7'), (False, '71-7')],
-    [(False, '60-7'), (False, '70-7')],
-    [(False, '60-7'), (False, '62-7')],
-    [(False, '60-7'), (False, '61-7')],
-    [(True, '60-7'), (True, '61-7'), (True, '62-7'), (True, '70-7'), (True, '71-7'), (True, '72-7'), (True, '80-7'), (True, '81-7'), (True, '82-7')],
-    [(False, '81-8'), (False, '82-8')],
-    [(False, '80-8'), (False, '82-8')],
-    [(False, '80-8'), (False, '81-8')],
-    [(False, '72-8'), (False, '82-8')],
-    [(False, '72-8'), (False, '81-8')],
-    [(False, '72-8'), (False, '80-8')],
-    [(False, '71-8'), (False, '82-8')],
-    [(False, '71-8'), (False, '81-8')],
-    [(False, '71-8'), (False, '80-8')],
-    [(False, '71-8'), (False, '72-8')],
-    [(False, '70-8'), (False, '82-8')],
-    [(False, '70-8'), (False, '81-8')],
-    [(False, '70-8'), (False, '80-8')],
-    [(False, '70-8'), (False, '72-8')],
-    [(False, '70-8'), (False, '71-8')],
-    [(False, '62-8'), (False, '82-8')],
-    [(False, '62-8'), (False, '81-8')],
-    [(False, '62-8'), (False, '80-8')],
-    [(False, '62-8'), (False, '72-8')],
-    [(False, '62-8'), (False, '71-8')],
-    [(False, '62-8'), (False, '70-8')],
-    [(False, '61-8'), (False, '82-8')],
-    [(False, '61-8'), (False, '81-8')],
-    [(False, '61-8'), (False, '80-8')],
-    [(False, '61-8'), (False, '72-8')],
-    [(False, '61-8'), (False, '71-8')],
-    [(False, '61-8'), (False, '70-8')],
-    [(False, '61-8'), (False, '62-8')],
-    [(False, '60-8'), (False, '82-8')],
-    [(False, '60-8'), (False, '81-8')],
-    [(False, '60-8'), (False, '80-8')],
-    [(False, '60-8'), (False, '72-8')],
-    [(False, '60-8'), (False, '71-8')],
-    [(False, '60-8'), (False, '70-8')],
-    [(False, '60-8'), (False, '62-8')],
-    [(False, '60-8'), (False, '61-8')],
-    [(True, '60-8'), (True, '61-8'), (True, '62-8'), (True, '70-8'), (True, '71-8'), (True, '72-8'), (True, '80-8'), (True, '81-8'), (True, '82-8')],
-    [(False, '81-9'), (False, '82-9')],
-    [(False, '80-9'), (False, '82-9')],
-    [(False, '80-9'), (False, '81-9')],
-    [(False, '72-9'), (False, '82-9')],
-    [(False, '72-9'), (False, '81-9')],
-    [(False, '72-9'), (False, '80-9')],
-    [(False, '71-9'), (False, '82-9')],
-    [(False, '71-9'), (False, '81-9')],
-    [(False, '71-9'), (False, '80-9')],
-    [(False, '71-9'), (False, '72-9')],
-    [(False, '70-9'), (False, '82-9')],
-    [(False, '70-9'), (False, '81-9')],
-    [(False, '70-9'), (False, '80-9')],
-    [(False, '70-9'), (False, '72-9')],
-    [(False, '70-9'), (False, '71-9')],
-    [(False, '62-9'), (False, '82-9')],
-    [(False, '62-9'), (False, '81-9')],
-    [(False, '62-9'), (False, '80-9')],
-    [(False, '62-9'), (False, '72-9')],
-    [(False, '62-9'), (False, '71-9')],
-    [(False, '62-9'), (False, '70-9')],
-    [(False, '61-9'), (False, '82-9')],
-    [(False, '61-9'), (False, '81-9')],
-    [(False, '61-9'), (False, '80-9')],
-    [(False, '61-9'), (False, '72-9')],
-    [(False, '61-9'), (False, '71-9')],
-    [(False, '61-9'), (False, '70-9')],
-    [(False, '61-9'), (False, '62-9')],
-    [(False, '60-9'), (False, '82-9')],
-    [(False, '60-9'), (False, '81-9')],
-    [(False, '60-9'), (False, '80-9')],
-    [(False, '60-9'), (False, '72-9')],
-    [(False, '60-9'), (False, '71-9')],
-    [(False, '60-9'), (False, '70-9')],
-    [(False, '60-9'), (False, '62-9')],
-    [(False, '60-9'), (False, '61-9')],
-    [(True, '60-9'), (True, '61-9'), (True, '62-9'), (True, '70-9'), (True, '71-9'), (True, '72-9'), (True, '80-9'), (True, '81-9'), (True, '82-9')],
-    [(False, '84-1'), (False, '85-1')],
-    [(False, '83-1'), (False, '85-1')],
-    [(False, '83-1'), (False, '84-1')],
-    [(False, '75-1'), (False, '85-1')],
-    [(False, '75-1'), (False, '84-1')],
-    [(False, '75-1'), (False, '83-1')],
-    [(False, '74-1'), (False, '85-1')],
-    [(False, '74-1'), (False, '84-1')],
-    [(False, '74-1'), (False, '83-1')],
-    [(False, '74-1'), (False, '75-1')],
-    [(False, '73-1'), (False, '85-1')],
-    [(False, '73-1'), (False, '84-1')],
-    [(False, '73-1'), (False, '83-1')],
-    [(False, '73-1'), (False, '75-1')],
-    [(False, '73-1'), (False, '74-1')],
-    [(False, '65-1'), (False, '85-1')],
-    [(False, '65-1'), (False, '84-1')],
-    [(False, '65-1'), (False, '83-1')],
-    [(False, '65-1'), (False, '75-1')],
-    [(False, '65-1'), (False, '74-1')],
-    [(False, '65-1'), (False, '73-1')],
-    [(False, '64-1'), (False, '85-1')],
-    [(False, '64-1'), (False, '84-1')],
-    [(False, '64-1'), (False, '83-1')],
-    [(False, '64-1'), (False, '75-1')],
-    [(False, '64-1'), (False, '74-1')],
-    [(False, '64-1'), (False, '73-1')],
-    [(False, '64-1'), (False, '65-1')],
-    [(False, '63-1'), (False, '85-1')],
-    [(False, '63-1'), (False, '84-1')],
-    [(False, '63-1'), (False, '83-1')],
-    [(False, '63-1'), (False, '75-1')],
-    [(False, '63-1'), (False, '74-1')],
-    [(False, '63-1'), (False, '73-1')],
-    [(False, '63-1'), (False, '65-1')],
-    [(False, '63-1'), (False, '64-1')],
-    [(True, '63-1'), (True, '64-1'), (True, '65-1'), (True, '73-1'), (True, '74-1'), (True, '75-1'), (True, '83-1'), (True, '84-1'), (True, '85-1')],
-    [(False, '84-2'), (False, '85-2')],
-    [(False, '83-2'), (False, '85-2')],
-    [(False, '83-2'), (False, '84-2')],
-    [(False, '75-2'), (False, '85-2')],
-    [(False, '75-2'), (False, '84-2')],
-    [(False, '75-2'), (False, '83-2')],
-    [(False, '74-2'), (False, '85-2')],
-    [(False, '74-2'), (False, '84-2')],
-    [(False, '74-2'), (False, '83-2')],
-    [(False, '74-2'), (False, '75-2')],
-    [(False, '73-2'), (False, '85-2')],
-    [(False, '73-2'), (False, '84-2')],
-    [(False, '73-2'), (False, '83-2')],
-    [(False, '73-2'), (False, '75-2')],
-    [(False, '73-2'), (False, '74-2')],
-    [(False, '65-2'), (False, '85-2')],
-    [(False, '65-2'), (False, '84-2')],
-    [(False, '65-2'), (False, '83-2')],
-    [(False, '65-2'), (False, '75-2')],
-    [(False, '65-2'), (False, '74-2')],
-    [(False, '65-2'), (False, '73-2')],
-    [(False, '64-2'), (False, '85-2')],
-    [(False, '64-2'), (False, '84-2')],
-    [(False, '64-2'), (False, '83-2')],
-    [(False, '64-2'), (False, '75-2')],
-    [(False, '64-2'), (False, '74-2')],
-    [(False, '64-2'), (False, '73-2')],
-    [(False, '64-2'), (False, '65-2')],
-    [(False, '63-2'), (False, '85-2')],
-    [(False, '63-2'), (False, '84-2')],
-    [(False, '63-2'), (False, '83-2')],
-    [(False, '63-2'), (False, '75-2')],
-    [(False, '63-2'), (False, '74-2')],
-    [(False, '63-2'), (False, '73-2')],
-    [(False, '63-2'), (False, '65-2')],
-    [(False, '63-2'), (False, '64-2')],
-    [(True, '63-2'), (True, '64-2'), (True, '65-2'), (True, '73-2'), (True, '74-2'), (True, '75-2'), (True, '83-2'), (True, '84-2'), (True, '85-2')],
-    [(False, '84-3'), (False, '85-3')],
-    [(False, '83-3'), (False, '85-3')],
-    [(False, '83-3'), (False, '84-3')],
-    [(False, '75-3'), (False, '85-3')],
-    [(False, '75-3'), (False, '84-3')],
-    [(False, '75-3'), (False, '83-3')],
-    [(False, '74-3'), (False, '85-3')],
-    [(False, '74-3'), (False, '84-3')],
-    [(False, '74-3'), (False, '83-3')],
-    [(False, '74-3'), (False, '75-3')],
-    [(False, '73-3'), (False, '85-3')],
-    [(False, '73-3'), (False, '84-3')],
-    [(False, '73-3'), (False, '83-3')],
-    [(False, '73-3'), (False, '75-3')],
-    [(False, '73-3'), (False, '74-3')],
-    [(False, '65-3'), (False, '85-3')],
-    [(False, '65-3'), (False, '84-3')],
-    [(False, '65-3'), (False, '83-3')],
-    [(False, '65-3'), (False, '75-3')],
-    [(False, '65-3'), (False, '74-3')],
-    [(False, '65-3'), (False, '73-3')],
-    [(False, '64-3'), (False, '85-3')],
-    [(False, '64-3'), (False, '84-3')],
-    [(False, '64-3'), (False, '83-3')],
-    [(False, '64-3'), (False, '75-3')],
-    [(False, '64-3'), (False, '74-3')],
-    [(False, '64-3'), (False, '73-3')],
-    [(False, '64-3'), (False, '65-3')],
-    [(False, '63-3'), (False, '85-3')],
-    [(False, '63-3'), (False, '84-3')],
-    [(False, '63-3'), (False, '83-3')],
-    [(False, '63-3'), (False, '75-3')],
-    [(False, '63-3'), (False, '74-3')],
-    [(False, '63-3'), (False, '73-3')],
-    [(False, '63-3'), (False, '65-3')],
-    [(False, '63-3'), (False, '64-3')],
-    [(True, '63-3'), (True, '64-3'), (True, '65-3'), (True, '73-3'), (True, '74-3'), (True, '75-3'), (True, '83-3'), (True, '84-3'), (True, '85-3')],
-    [(False, '84-4'), (False, '85-4')],
-    [(False, '83-4'), (False, '85-4')],
-    [(False, '83-4'), (False, '84-4')],
-    [(False, '75-4'), (False, '85-4')],
-    [(False, '75-4'), (False, '84-4')],
-    [(False, '75-4'), (False, '83-4')],
-    [(False, '74-4'), (False, '85-4')],
-    [(False, '74-4'), (False, '84-4')],
-    [(False, '74-4'), (False, '83-4')],
-    [(False, '74-4'), (False, '75-4')],
-    [(False, '73-4'), (False, '85-4')],
-    [(False, '73-4'), (False, '84-4')],
-    [(False, '73-4'), (False, '83-4')],
-    [(False, '73-4'), (False, '75-4')],
-    [(False, '73-4'), (False, '74-4')],
-    [(False, '65-4'), (False, '85-4')],
-    [(False, '65-4'), (False, '84-4')],
-    [(False, '65-4'), (False, '83-4')],
-    [(False, '65-4'), (False, '75-4')],
-    [(False, '65-4'), (False, '74-4')],
-    [(False, '65-4'), (False, '73-4')],
-    [(False, '64-4'), (False, '85-4')],
-    [(False, '64-4'), (False, '84-4')],
-    [(False, '64-4'), (False, '83-4')],
-    [(False, '64-4'), (False, '75-4')],
-    [(False, '64-4'), (False, '74-4')],
-    [(False, '64-4'), (False, '73-4')],
-    [(False, '64-4'), (False, '65-4')],
-    [(False, '63-4'), (False, '85-4')],
-    [(False, '63-4'), (False, '84-4')],
-    [(False, '63-4'), (False, '83-4')],
-    [(False, '63-4'), (False, '75-4')],
-    [(False, '63-4'), (False, '74-4')],
-    [(False, '63-4'), (False, '73-4')],
-    [(False, '63-4'), (False, '65-4')],
-    [(False, '63-4'), (False, '64-4')],
-    [(True, '63-4'), (True, '64-4'), (True, '65-4'), (True, '73-4'), (True, '74-4'), (True, '75-4'), (True, '83-4'), (True, '84-4'), (True, '85-4')],
-    [(False, '84-5'), (False, '85-5')],
-    [(False, '83-5'), (False, '85-5')],
-    [(False, '83-5'), (False, '84-5')],
-    [(False, '75-5'), (False, '85-5')],
-    [(False, '75-5'), (False, '84-5')],
-    [(False, '75-5'), (False, '83-5')],
-    [(False, '74-5'), (False, '85-5')],
-    [(False, '74-5'), (False, '84-5')],
-    [(False, '74-5'), (False, '83-5')],
-    [(False, '74-5'), (False, '75-5')],
-    [(False, '73-5'), (False, '85-5')],
-    [(False, '73-5'), (False, '84-5')],
-    [(False, '73-5'), (False, '83-5')],
-    [(False, '73-5'), (False, '75-5')],
-    [(False, '73-5'), (False, '74-5')],
-    [(False, '65-5'), (False, '85-5')],
-    [(False, '65-5'), (False, '84-5')],
-    [(False, '65-5'), (False, '83-5')],
-    [(False, '65-5'), (False, '75-5')],
-    [(False, '65-5'), (False, '74-5')],
-    [(False, '65-5'), (False, '73-5')],
-    [(False, '64-5'), (False, '85-5')],
-    [(False, '64-5'), (False, '84-5')],
-    [(False, '64-5'), (False, '83-5')],
-    [(False, '64-5'), (False, '75-5')],
-    [(False, '64-5'), (False, '74-5')],
-    [(False, '64-5'), (False, '73-5')],
-    [(False, '64-5'), (False, '65-5')],
-    [(False, '63-5'), (False, '85-5')],
-    [(False, '63-5'), (False, '84-5')],
-    [(False, '63-5'), (False, '83-5')],
-    [(False, '63-5'), (False, '75-5')],
-    [(False, '63-5'), (False, '74-5')],
-    [(False, '63-5'), (False, '73-5')],
-    [(False, '63-5'), (False, '65-5')],
-    [(False, '63-5'), (False, '64-5')],
-    [(True, '63-5'), (True, '64-5'), (True, '65-5'), (True, '73-5'), (True, '74-5'), (True, '75-5'), (True, '83-5'), (True, '84-5'), (True, '85-5')],
-    [(False, '84-6'), (False, '85-6')],
-    [(False, '83-6'), (False, '85-6')],
-    [(False, '83-6'), (False, '84-6')],
-    [(False, '75-6'), (False, '85-6')],
-    [(False, '75-6'), (False, '84-6')],
-    [(False, '75-6'), (False, '83-6')],
-    [(False, '74-6'), (False, '85-6')],
-    [(False, '74-6'), (False, '84-6')],
-    [(False, '74-6'), (False, '83-6')],
-    [(False, '74-6'), (False, '75-6')],
-    [(False, '73-6'), (False, '85-6')],
-    [(False, '73-6'), (False, '84-6')],
-    [(False, '73-6'), (False, '83-6')],
-    [(False, '73-6'), (False, '75-6')],
-    [(False, '73-6'), (False, '74-6')],
-    [(False, '65-6'), (False, '85-6')],
-    [(False, '65-6'), (False, '84-6')],
-    [(False, '65-6'), (False, '83-6')],
-    [(False, '65-6'), (False, '75-6')],
-    [(False, '65-6'), (False, '74-6')],
-    [(False, '65-6'), (False, '73-6')],
-    [(False, '64-6'), (False, '85-6')],
-    [(False, '64-6'), (False, '84-6')],
-    [(False, '64-6'), (False, '83-6')],
-    [(False, '64-6'), (False, '75-6')],
-    [(False, '64-6'), (False, '74-6')],
-    [(False, '64-6'), (False, '73-6')],
-    [(False, '64-6'), (False, '65-6')],
-    [(False, '63-6'), (False, '85-6')],
-    [(False, '63-6'), (False, '84-6')],
-    [(False, '63-6'), (False, '83-6')],
-    [(False, '63-6'), (False, '75-6')],
-    [(False, '63-6'), (False, '74-6')],
-    [(False, '63-6'), (False, '73-6')],
-    [(False, '63-6'), (False, '65-6')],
-    [(False, '63-6'), (False, '64-6')],
-    [(True, '63-6'), (True, '64-6'), (True, '65-6'), (True, '73-6'), (True, '74-6'), (True, '75-6'), (True, '83-6'), (True, '84-6'), (True, '85-6')],
-    [(False, '84-7'), (False, '85-7')],
-    [(False, '83-7'), (False, '85-7')],
-    [(False, '83-7'), (False, '84-7')],
-    [(False, '75-7'), (False, '85-7')],
-    [(False, '75-7'), (False, '84-7')],
-    [(False, '75-7'), (False, '83-7')],
-    [(False, '74-7'), (False, '85-7')],
-    [(False, '74-7'), (False, '84-7')],
-    [(False, '74-7'), (False, '83-7')],
-    [(False, '74-7'), (False, '75-7')],
-    [(False, '73-7'), (False, '85-7')],
-    [(False, '73-7'), (False, '84-7')],
-    [(False, '73-7'), (False, '83-7')],
-    [(False, '73-7'), (False, '75-7')],
-    [(False, '73-7'), (False, '74-7')],
-    [(False, '65-7'), (False, '85-7')],
-    [(False, '65-7'), (False, '84-7')],
-    [(False, '65-7'), (False, '83-7')],
-    [(False, '65-7'), (False, '75-7')],
-    [(False, '65-7'), (False, '74-7')],
-    [(False, '65-7'), (False, '73-7')],
-    [(False, '64-7'), (False, '85-7')],
-    [(False, '64-7'), (False, '84-7')],
-    [(False, '64-7'), (False, '83-7')],
-    [(False, '64-7'), (False, '75-7')],
-    [(False, '64-7'), (False, '74-7')],
-    [(False, '64-7'), (False, '73-7')],
-    [(False, '64-7'), (False, '65-7')],
-    [(False, '63-7'), (False, '85-7')],
-    [(False, '63-7'), (False, '84-7')],
-    [(False, '63-7'), (False, '83-7')],
-    [(False, '63-7'), (False, '75-7')],
-    [(False, '63-7'), (False, '74-7')],
-    [(False, '63-7'), (False, '73-7')],
-    [(False, '63-7'), (False, '65-7')],
-    [(False, '63-7'), (False, '64-7')],
-    [(True, '63-7'), (True, '64-7'), (True, '65-7'), (True, '73-7'), (True, '74-7'), (True, '75-7'), (True, '83-7'), (True, '84-7'), (True, '85-7')],
-    [(False, '84-8'), (False, '85-8')],
-    [(False, '83-8'), (False, '85-8')],
-    [(False, '83-8'), (False, '84-8')],
-    [(False, '75-8'), (False, '85-8')],
-    [(False, '75-8'), (False, '84-8')],
-    [(False, '75-8'), (False, '83-8')],
-    [(False, '74-8'), (False, '85-8')],
-    [(False, '74-8'), (False, '84-8')],
-    [(False, '74-8'), (False, '83-8')],
-    [(False, '74-8'), (False, '75-8')],
-    [(False, '73-8'), (False, '85-8')],
-    [(False, '73-8'), (False, '84-8')],
-    [(False, '73-8'), (False, '83-8')],
-    [(False, '73-8'), (False, '75-8')],
-    [(False, '73-8'), (False, '74-8')],
-    [(False, '65-8'), (False, '85-8')],
-    [(False, '65-8'), (False, '84-8')],
-    [(False, '65-8'), (False, '83-8')],
-    [(False, '65-8'), (False, '75-8')],
-    [(False, '65-8'), (False, '74-8')],
-    [(False, '65-8'), (False, '73-8')],
-    [(False, '64-8'), (False, '85-8')],
-    [(False, '64-8'), (False, '84-8')],
-    [(False, '64-8'), (False, '83-8')],
-    [(False, '64-8'), (False, '75-8')],
-    [(False, '64-8'), (False, '74-8')],
-    [(False, '64-8'), (False, '73-8')],
-    [(False, '64-8'), (False, '65-8')],
-    [(False, '63-8'), (False, '85-8')],
-    [(False, '63-8'), (False, '84-8')],
-    [(False, '63-8'), (False, '83-8')],
-    [(False, '63-8'), (False, '75-8')],
-    [(False, '63-8'), (False, '74-8')],
-    [(False, '63-8'), (False, '73-8')],
-    [(False, '63-8'), (False, '65-8')],
-    [(False, '63-8'), (False, '64-8')],
-    [(True, '63-8'), (True, '64-8'), (True, '65-8'), (True, '73-8'), (True, '74-8'), (True, '75-8'), (True, '83-8'), (True, '84-8'), (True, '85-8')],
-    [(False, '84-9'), (False, '85-9')],
-    [(False, '83-9'), (False, '85-9')],
-    [(False, '83-9'), (False, '84-9')],
-    [(False, '75-9'), (False, '85-9')],
-    [(False, '75-9'), (False, '84-9')],
-    [(False, '75-9'), (False, '83-9')],
-    [(False, '74-9'), (False, '85-9')],
-    [(False, '74-9'), (False, '84-9')],
-    [(False, '74-9'), (False, '83-9')],
-    [(False, '74-9'), (False, '75-9')],
-    [(False, '73-9'), (False, '85-9')],
-    [(False, '73-9'), (False, '84-9')],
-    [(False, '73-9'), (False, '83-9')],
-    [(False, '73-9'), (False, '75-9')],
-    [(False, '73-9'), (False, '74-9')],
-    [(False, '65-9'), (False, '85-9')],
-    [(False, '65-9'), (False, '84-9')],
-    [(False, '65-9'), (False, '83-9')],
-    [(False, '65-9'), (False, '75-9')],
-    [(False, '65-9'), (False, '74-9')],
-    [(False, '65-9'), (False, '73-9')],
-    [(False, '64-9'), (False, '85-9')],
-    [(False, '64-9'), (False, '84-9')],
-    [(False, '64-9'), (False, '83-9')],
-    [(False, '64-9'), (False, '75-9')],
-    [(False, '64-9'), (False, '74-9')],
-    [(False, '64-9'), (False, '73-9')],
-    [(False, '64-9'), (False, '65-9')],
-    [(False, '63-9'), (False, '85-9')],
-    [(False, '63-9'), (False, '84-9')],
-    [(False, '63-9'), (False, '83-9')],
-    [(False, '63-9'), (False, '75-9')],
-    [(False, '63-9'), (False, '74-9')],
-    [(False, '63-9'), (False, '73-9')],
-    [(False, '63-9'), (False, '65-9')],
-    [(False, '63-9'), (False, '64-9')],
-    [(True, '63-9'), (True, '64-9'), (True, '65-9'), (True, '73-9'), (True, '74-9'), (True, '75-9'), (True, '83-9'), (True, '84-9'), (True, '85-9')],
-    [(False, '87-1'), (False, '88-1')],
-    [(False, '86-1'), (False, '88-1')],
-    [(False, '86-1'), (False, '87-1')],
-    [(False, '78-1'), (False, '88-1')],
-    [(False, '78-1'), (False, '87-1')],
-    [(False, '78-1'), (False, '86-1')],
-    [(False, '77-1'), (False, '88-1')],
-    [(False, '77-1'), (False, '87-1')],
-    [(False, '77-1'), (False, '86-1')],
-    [(False, '77-1'), (False, '78-1')],
-    [(False, '76-1'), (False, '88-1')],
-    [(False, '76-1'), (False, '87-1')],
-    [(False, '76-1'), (False, '86-1')],
-    [(False, '76-1'), (False, '78-1')],
-    [(False, '76-1'), (False, '77-1')],
-    [(False, '68-1'), (False, '88-1')],
-    [(False, '68-1'), (False, '87-1')],
-    [(False, '68-1'), (False, '86-1')],
-    [(False, '68-1'), (False, '78-1')],
-    [(False, '68-1'), (False, '77-1')],
-    [(False, '68-1'), (False, '76-1')],
-    [(False, '67-1'), (False, '88-1')],
-    [(False, '67-1'), (False, '87-1')],
-    [(False, '67-1'), (False, '86-1')],
-    [(False, '67-1'), (False, '78-1')],
-    [(False, '67-1'), (False, '77-1')],
-    [(False, '67-1'), (False, '76-1')],
-    [(False, '67-1'), (False, '68-1')],
-    [(False, '66-1'), (False, '88-1')],
-    [(False, '66-1'), (False, '87-1')],
-    [(False, '66-1'), (False, '86-1')],
-    [(False, '66-1'), (False, '78-1')],
-    [(False, '66-1'), (False, '77-1')],
-    [(False, '66-1'), (False, '76-1')],
-    [(False, '66-1'), (False, '68-1')],
-    [(False, '66-1'), (False, '67-1')],
-    [(True, '66-1'), (True, '67-1'), (True, '68-1'), (True, '76-1'), (True, '77-1'), (True, '78-1'), (True, '86-1'), (True, '87-1'), (True, '88-1')],
-    [(False, '87-2'), (False, '88-2')],
-    [(False, '86-2'), (False, '88-2')],
-    [(False, '86-2'), (False, '87-2')],
-    [(False, '78-2'), (False, '88-2')],
-    [(False, '78-2'), (False, '87-2')],
-    [(False, '78-2'), (False, '86-2')],
-    [(False, '77-2'), (False, '88-2')],
-    [(False, '77-2'), (False, '87-2')],
-    [(False, '77-2'), (False, '86-2')],
-    [(False, '77-2'), (False, '78-2')],
-    [(False, '76-2'), (False, '88-2')],
-    [(False, '76-2'), (False, '87-2')],
-    [(False, '76-2'), (False, '86-2')],
-    [(False, '76-2'), (False, '78-2')],
-    [(False, '76-2'), (False, '77-2')],
-    [(False, '68-2'), (False, '88-2')],
-    [(False, '68-2'), (False, '87-2')],
-    [(False, '68-2'), (False, '86-2')],
-    [(False, '68-2'), (False, '78-2')],
-    [(False, '68-2'), (False, '77-2')],
-    [(False, '68-2'), (False, '76-2')],
-    [(False, '67-2'), (False, '88-2')],
-    [(False, '67-2'), (False, '87-2')],
-    [(False, '67-2'), (False, '86-2')],
-    [(False, '67-2'), (False, '78-2')],
-    [(False, '67-2'), (False, '77-2')],
-    [(False, '67-2'), (False, '76-2')],
-    [(False, '67-2'), (False, '68-2')],
-    [(False, '66-2'), (False, '88-2')],
-    [(False, '66-2'), (False, '87-2')],
-    [(False, '66-2'), (False, '86-2')],
-    [(False, '66-2'), (False, '78-2')],
-    [(False, '66-2'), (False, '77-2')],
-    [(False, '66-2'), (False, '76-2')],
-    [(False, '66-2'), (False, '68-2')],
-    [(False, '66-2'), (False, '67-2')],
-    [(True, '66-2'), (True, '67-2'), (True, '68-2'), (True, '76-2'), (True, '77-2'), (True, '78-2'), (True, '86-2'), (True, '87-2'), (True, '88-2')],
-    [(False, '87-3'), (False, '88-3')],
-    [(False, '86-3'), (False, '88-3')],
-    [(False, '86-3'), (False, '87-3')],
-    [(False, '78-3'), (False, '88-3')],
-    [(False, '78-3'), (False, '87-3')],
-    [(False, '78-3'), (False, '86-3')],
-    [(False, '77-3'), (False, '88-3')],
-    [(False, '77-3'), (False, '87-3')],
-    [(False, '77-3'), (False, '86-3')],
-    [(False, '77-3'), (False, '78-3')],
-    [(False, '76-3'), (False, '88-3')],
-    [(False, '76-3'), (False, '87-3')],
-    [(False, '76-3'), (False, '86-3')],
-    [(False, '76-3'), (False, '78-3')],
-    [(False, '76-3'), (False, '77-3')],
-    [(False, '68-3'), (False, '88-3')],
-    [(False, '68-3'), (False, '87-3')],
-    [(False, '68-3'), (False, '86-3')],
-    [(False, '68-3'), (False, '78-3')],
-    [(False, '68-3'), (False, '77-3')],
-    [(False, '68-3'), (False, '76-3')],
-    [(False, '67-3'), (False, '88-3')],
-    [(False, '67-3'), (False, '87-3')],
-    [(False, '67-3'), (False, '86-3')],
-    [(False, '67-3'), (False, '78-3')],
-    [(False, '67-3'), (False, '77-3')],
-    [(False, '67-3'), (False, '76-3')],
-    [(False, '67-3'), (False, '68-3')],
-    [(False, '66-3'), (False, '88-3')],
-    [(False, '66-3'), (False, '87-3')],
-    [(False, '66-3'), (False, '86-3')],
-    [(False, '66-3'), (False, '78-3')],
-    [(False, '66-3'), (False, '77-3')],
-    [(False, '66-3'), (False, '76-3')],
-    [(False, '66-3'), (False, '68-3')],
-    [(False, '66-3'), (False, '67-3')],
-    [(True, '66-3'), (True, '67-3'), (True, '68-3'), (True, '76-3'), (True, '77-3'), (True, '78-3'), (True, '86-3'), (True, '87-3'), (True, '88-3')],
-    [(False, '87-4'), (False, '88-4')],
-    [(False, '86-4'), (False, '88-4')],
-    [(False, '86-4'), (False, '87-4')],
-    [(False, '78-4'), (False, '88-4')],
-    [(False, '78-4'), (False, '87-4')],
-    [(False, '78-4'), (False, '86-4')],
-    [(False, '77-4'), (False, '88-4')],
-    [(False, '77-4'), (False, '87-4')],
-    [(False, '77-4'), (False, '86-4')],
-    [(False, '77-4'), (False, '78-4')],
-    [(False, '76-4'), (False, '88-4')],
-    [(False, '76-4'), (False, '87-4')],
-    [(False, '76-4'), (False, '86-4')],
-    [(False, '76-4'), (False, '78-4')],
-    [(False, '76-4'), (False, '77-4')],
-    [(False, '68-4'), (False, '88-4')],
-    [(False, '68-4'), (False, '87-4')],
-    [(False, '68-4'), (False, '86-4')],
-    [(False, '68-4'), (False, '78-4')],
-    [(False, '68-4'), (False, '77-4')],
-    [(False, '68-4'), (False, '76-4')],
-    [(False, '67-4'), (False, '88-4')],
-    [(False, '67-4'), (False, '87-4')],
-    [(False, '67-4'), (False, '86-4')],
-    [(False, '67-4'), (False, '78-4')],
-    [(False, '67-4'), (False, '77-4')],
-    [(False, '67-4'), (False, '76-4')],
-    [(False, '67-4'), (False, '68-4')],
-    [(False, '66-4'), (False, '88-4')],
-    [(False, '66-4'), (False, '87-4')],
-    [(False, '66-4'), (False, '86-4')],
-    [(False, '66-4'), (False, '78-4')],
-    [(False, '66-4'), (False, '77-4')],
-    [(False, '66-4'), (False, '76-4')],
-    [(False, '66-4'), (False, '68-4')],
-    [(False, '66-4'), (False, '67-4')],
-    [(True, '66-4'), (True, '67-4'), (True, '68-4'), (True, '76-4'), (True, '77-4'), (True, '78-4'), (True, '86-4'), (True, '87-4'), (True, '88-4')],
-    [(False, '87-5'), (False, '88-5')],
-    [(False, '86-5'), (False, '88-5')],
-    [(False, '86-5'), (False, '87-5')],
-    [(False, '78-5'), (False, '88-5')],
-    [(False, '78-5'), (False, '87-5')],
-    [(False, '78-5'), (False, '86-5')],
-    [(False, '77-5'), (False, '88-5')],
-    [(False, '77-5'), (False, '87-5')],
-    [(False, '77-5'), (False, '86-5')],
-    [(False, '77-5'), (False, '78-5')],
-    [(False, '76-5'), (False, '88-5')],
-    [(False, '76-5'), (False, '87-5')],
-    [(False, '76-5'), (False, '86-5')],
-    [(False, '76-5'), (False, '78-5')],
-    [(False, '76-5'), (False, '77-5')],
-    [(False, '68-5'), (False, '88-5')],
-    [(False, '68-5'), (False, '87-5')],
-    [(False, '68-5'), (False, '86-5')],
-    [(False, '68-5'), (False, '78-5')],
-    [(False, '68-5'), (False, '77-5')],
-    [(False, '68-5'), (False, '76-5')],
-    [(False, '67-5'), (False, '88-5')],
-    [(False, '67-5'), (False, '87-5')],
-    [(False, '67-5'), (False, '86-5')],
-    [(False, '67-5'), (False, '78-5')],
-    [(False, '67-5'), (False, '77-5')],
-    [(False, '67-5'), (False, '76-5')],
-    [(False, '67-5'), (False, '68-5')],
-    [(False, '66-5'), (False, '88-5')],
-    [(False, '66-5'), (False, '87-5')],
-    [(False, '66-5'), (False, '86-5')],
-    [(False, '66-5'), (False, '78-5')],
-    [(False, '66-5'), (False, '77-5')],
-    [(False, '66-5'), (False, '76-5')],
-    [(False, '66-5'), (False, '68-5')],
-    [(False, '66-5'), (False, '67-5')],
-    [(True, '66-5'), (True, '67-5'), (True, '68-5'), (True, '76-5'), (True, '77-5'), (True, '78-5'), (True, '86-5'), (True, '87-5'), (True, '88-5')],
-    [(False, '87-6'), (False, '88-6')],
-    [(False, '86-6'), (False, '88-6')],
-    [(False, '86-6'), (False, '87-6')],
-    [(False, '78-6'), (False, '88-6')],
-    [(False, '78-6'), (False, '87-6')],
-    [(False, '78-6'), (False, '86-6')],
-    [(False, '77-6'), (False, '88-6')],
-    [(False, '77-6'), (False, '87-6')],
-    [(False, '77-6'), (False, '86-6')],
-    [(False, '77-6'), (False, '78-6')],
-    [(False, '76-6'), (False, '88-6')],
-    [(False, '76-6'), (False, '87-6')],
-    [(False, '76-6'), (False, '86-6')],
-    [(False, '76-6'), (False, '78-6')],
-    [(False, '76-6'), (False, '77-6')],
-    [(False, '68-6'), (False, '88-6')],
-    [(False, '68-6'), (False, '87-6')],
-    [(False, '68-6'), (False, '86-6')],
-    [(False, '68-6'), (False, '78-6')],
-    [(False, '68-6'), (False, '77-6')],
-    [(False, '68-6'), (False, '76-6')],
-    [(False, '67-6'), (False, '88-6')],
-    [(False, '67-6'), (False, '87-6')],
-    [(False, '67-6'), (False, '86-6')],
-    [(False, '67-6'), (False, '78-6')],
-    [(False, '67-6'), (False, '77-6')],
-    [(False, '67-6'), (False, '76-6')],
-    [(False, '67-6'), (False, '68-6')],
-    [(False, '66-6'), (False, '88-6')],
-    [(False, '66-6'), (False, '87-6')],
-    [(False, '66-6'), (False, '86-6')],
-    [(False, '66-6'), (False, '78-6')],
-    [(False, '66-6'), (False, '77-6')],
-    [(False, '66-6'), (False, '76-6')],
-    [(False, '66-6'), (False, '68-6')],
-    [(False, '66-6'), (False, '67-6')],
-    [(True, '66-6'), (True, '67-6'), (True, '68-6'), (True, '76-6'), (True, '77-6'), (True, '78-6'), (True, '86-6'), (True, '87-6'), (True, '88-6')],
-    [(False, '87-7'), (False, '88-7')],
-    [(False, '86-7'), (False, '88-7')],
-    [(False, '86-7'), (False, '87-7')],
-    [(False, '78-7'), (False, '88-7')],
-    [(False, '78-7'), (False, '87-7')],
-    [(False, '78-7'), (False, '86-7')],
-    [(False, '77-7'), (False, '88-7')],
-    [(False, '77-7'), (False, '87-7')],
-    [(False, '77-7'), (False, '86-7')],
-    [(False, '77-7'), (False, '78-7')],
-    [(False, '76-7'), (False, '88-7')],
-    [(False, '76-7'), (False, '87-7')],
-    [(False, '76-7'), (False, '86-7')],
-    [(False, '76-7'), (False, '78-7')],
-    [(False, '76-7'), (False, '77-7')],
-    [(False, '68-7'), (False, '88-7')],
-    [(False, '68-7'), (False, '87-7')],
-    [(False, '68-7'), (False, '86-7')],
-    [(False, '68-7'), (False, '78-7')],
-    [(False, '68-7'), (False, '77-7')],
-    [(False, '68-7'), (False, '76-7')],
-    [(False, '67-7'), (False, '88-7')],
-    [(False, '67-7'), (False, '87-7')],
-    [(False, '67-7'), (False, '86-7')],
-    [(False, '67-7'), (False, '78-7')],
-    [(False, '67-7'), (False, '77-7')],
-    [(False, '67-7'), (False, '76-7')],
-    [(False, '67-7'), (False, '68-7')],
-    [(False, '66-7'), (False, '88-7')],
-    [(False, '66-7'), (False, '87-7')],
-    [(False, '66-7'), (False, '86-7')],
-    [(False, '66-7'), (False, '78-7')],
-    [(False, '66-7'), (False, '77-7')],
-    [(False, '66-7'), (False, '76-7')],
-    [(False, '66-7'), (False, '68-7')],
-    [(False, '66-7'), (False, '67-7')],
-    [(True, '66-7'), (True, '67-7'), (True, '68-7'), (True, '76-7'), (True, '77-7'), (True, '78-7'), (True, '86-7'), (True, '87-7'), (True, '88-7')],
-    [(False, '87-8'), (False, '88-8')],
-    [(False, '86-8'), (False, '88-8')],
-    [(False, '86-8'), (False, '87-8')],
-    [(False, '78-8'), (False, '88-8')],
-    [(False, '78-8'), (False, '87-8')],
-    [(False, '78-8'), (False, '86-8')],
-    [(False, '77-8'), (False, '88-8')],
-    [(False, '77-8'), (False, '87-8')],
-    [(False, '77-8'), (False, '86-8')],
-    [(False, '77-8'), (False, '78-8')],
-    [(False, '76-8'), (False, '88-8')],
-    [(False, '76-8'), (False, '87-8')],
-    [(False, '76-8'), (False, '86-8')],
-    [(False, '76-8'), (False, '78-8')],
-    [(False, '76-8'), (False, '77-8')],
-    [(False, '68-8'), (False, '88-8')],
-    [(False, '68-8'), (False, '87-8')],
-    [(False, '68-8'), (False, '86-8')],
-    [(False, '68-8'), (False, '78-8')],
-    [(False, '68-8'), (False, '77-8')],
-    [(False, '68-8'), (False, '76-8')],
-    [(False, '67-8'), (False, '88-8')],
-    [(False, '67-8'), (False, '87-8')],
-    [(False, '67-8'), (False, '86-8')],
-    [(False, '67-8'), (False, '78-8')],
-    [(False, '67-8'), (False, '77-8')],
-    [(False, '67-8'), (False, '76-8')],
-    [(False, '67-8'), (False, '68-8')],
-    [(False, '66-8'), (False, '88-8')],
-    [(False, '66-8'), (False, '87-8')],
-    [(False, '66-8'), (False, '86-8')],
-    [(False, '66-8'), (False, '78-8')],
-    [(False, '66-8'), (False, '77-8')],
-    [(False, '66-8'), (False, '76-8')],
-    [(False, '66-8'), (False, '68-8')],
-    [(False, '66-8'), (False, '67-8')],
-    [(True, '66-8'), (True, '67-8'), (True, '68-8'), (True, '76-8'), (True, '77-8'), (True, '78-8'), (True, '86-8'), (True, '87-8'), (True, '88-8')],
-    [(False, '87-9'), (False, '88-9')],
-    [(False, '86-9'), (False, '88-9')],
-    [(False, '86-9'), (False, '87-9')],
-    [(False, '78-9'), (False, '88-9')],
-    [(False, '78-9'), (False, '87-9')],
-    [(False, '78-9'), (False, '86-9')],
-    [(False, '77-9'), (False, '88-9')],
-    [(False, '77-9'), (False, '87-9')],
-    [(False, '77-9'), (False, '86-9')],
-    [(False, '77-9'), (False, '78-9')],
-    [(False, '76-9'), (False, '88-9')],
-    [(False, '76-9'), (False, '87-9')],
-    [(False, '76-9'), (False, '86-9')],
-    [(False, '76-9'), (False, '78-9')],
-    [(False, '76-9'), (False, '77-9')],
-    [(False, '68-9'), (False, '88-9')],
-    [(False, '68-9'), (False, '87-9')],
-    [(False, '68-9'), (False, '86-9')],
-    [(False, '68-9'), (False, '78-9')],
-    [(False, '68-9'), (False, '77-9')],
-    [(False, '68-9'), (False, '76-9')],
-    [(False, '67-9'), (False, '88-9')],
-    [(False, '67-9'), (False, '87-9')],
-    [(False, '67-9'), (False, '86-9')],
-    [(False, '67-9'), (False, '78-9')],
-    [(False, '67-9'), (False, '77-9')],
-    [(False, '67-9'), (False, '76-9')],
-    [(False, '67-9'), (False, '68-9')],
-    [(False, '66-9'), (False, '88-9')],
-    [(False, '66-9'), (False, '87-9')],
-    [(False, '66-9'), (False, '86-9')],
-    [(False, '66-9'), (False, '78-9')],
-    [(False, '66-9'), (False, '77-9')],
-    [(False, '66-9'), (False, '76-9')],
-    [(False, '66-9'), (False, '68-9')],
-    [(False, '66-9'), (False, '67-9')],
-    [(True, '66-9'), (True, '67-9'), (True, '68-9'), (True, '76-9'), (True, '77-9'), (True, '78-9'), (True, '86-9'), (True, '87-9'), (True, '88-9')]
+    [-8, -9],
+    [-7, -9],
+    [-7, -8],
+    [-6, -9],
+    [-6, -8],
+    [-6, -7],
+    [-5, -9],
+    [-5, -8],
+    [-5, -7],
+    [-5, -6],
+    [-4, -9],
+    [-4, -8],
+    [-4, -7],
+    [-4, -6],
+    [-4, -5],
+    [-3, -9],
+    [-3, -8],
+    [-3, -7],
+    [-3, -6],
+    [-3, -5],
+    [-3, -4],
+    [-2, -9],
+    [-2, -8],
+    [-2, -7],
+    [-2, -6],
+    [-2, -5],
+    [-2, -4],
+    [-2, -3],
+    [-1, -9],
+    [-1, -8],
+    [-1, -7],
+    [-1, -6],
+    [-1, -5],
+    [-1, -4],
+    [-1, -3],
+    [-1, -2],
+    [1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [-17, -18],
+    [-16, -18],
+    [-16, -17],
+    [-15, -18],
+    [-15, -17],
+    [-15, -16],
+    [-14, -18],
+    [-14, -17],
+    [-14, -16],
+    [-14, -15],
+    [-13, -18],
+    [-13, -17],
+    [-13, -16],
+    [-13, -15],
+    [-13, -14],
+    [-12, -18],
+    [-12, -17],
+    [-12, -16],
+    [-12, -15],
+    [-12, -14],
+    [-12, -13],
+    [-11, -18],
+    [-11, -17],
+    [-11, -16],
+    [-11, -15],
+    [-11, -14],
+    [-11, -13],
+    [-11, -12],
+    [-10, -18],
+    [-10, -17],
+    [-10, -16],
+    [-10, -15],
+    [-10, -14],
+    [-10, -13],
+    [-10, -12],
+    [-10, -11],
+    [10, 11, 12, 13, 14, 15, 16, 17, 18],
+    [-26, -27],
+    [-25, -27],
+    [-25, -26],
+    [-24, -27],
+    [-24, -26],
+    [-24, -25],
+    [-23, -27],
+    [-23, -26],
+    [-23, -25],
+    [-23, -24],
+    [-22, -27],
+    [-22, -26],
+    [-22, -25],
+    [-22, -24],
+    [-22, -23],
+    [-21, -27],
+    [-21, -26],
+    [-21, -25],
+    [-21, -24],
+    [-21, -23],
+    [-21, -22],
+    [-20, -27],
+    [-20, -26],
+    [-20, -25],
+    [-20, -24],
+    [-20, -23],
+    [-20, -22],
+    [-20, -21],
+    [-19, -27],
+    [-19, -26],
+    [-19, -25],
+    [-19, -24],
+    [-19, -23],
+    [-19, -22],
+    [-19, -21],
+    [-19, -20],
+    [19, 20, 21, 22, 23, 24, 25, 26, 27],
+    [-35, -36],
+    [-34, -36],
+    [-34, -35],
+    [-33, -36],
+    [-33, -35],
+    [-33, -34],
+    [-32, -36],
+    [-32, -35],
+    [-32, -34],
+    [-32, -33],
+    [-31, -36],
+    [-31, -35],
+    [-31, -34],
+    [-31, -33],
+    [-31, -32],
+    [-30, -36],
+    [-30, -35],
+    [-30, -34],
+    [-30, -33],
+    [-30, -32],
+    [-30, -31],
+    [-29, -36],
+    [-29, -35],
+    [-29, -34],
+    [-29, -33],
+    [-29, -32],
+    [-29, -31],
+    [-29, -30],
+    [-28, -36],
+    [-28, -35],
+    [-28, -34],
+    [-28, -33],
+    [-28, -32],
+    [-28, -31],
+    [-28, -30],
+    [-28, -29],
+    [28, 29, 30, 31, 32, 33, 34, 35, 36],
+    [-44, -45],
+    [-43, -45],
+    [-43, -44],
+    [-42, -45],
+    [-42, -44],
+    [-42, -43],
+    [-41, -45],
+    [-41, -44],
+    [-41, -43],
+    [-41, -42],
+    [-40, -45],
+    [-40, -44],
+    [-40, -43],
+    [-40, -42],
+    [-40, -41],
+    [-39, -45],
+    [-39, -44],
+    [-39, -43],
+    [-39, -42],
+    [-39, -41],
+    [-39, -40],
+    [-38, -45],
+    [-38, -44],
+    [-38, -43],
+    [-38, -42],
+    [-38, -41],
+    [-38, -40],
+    [-38, -39],
+    [-37, -45],
+    [-37, -44],
+    [-37, -43],
+    [-37, -42],
+    [-37, -41],
+    [-37, -40],
+    [-37, -39],
+    [-37, -38],
+    [37, 38, 39, 40, 41, 42, 43, 44, 45],
+    [-53, -54],
+    [-52, -54],
+    [-52, -53],
+    [-51, -54],
+    [-51, -53],
+    [-51, -52],
+    [-50, -54],
+    [-50, -53],
+    [-50, -52],
+    [-50, -51],
+    [-49, -54],
+    [-49, -53],
+    [-49, -52],
+    [-49, -51],
+    [-49, -50],
+    [-48, -54],
+    [-48, -53],
+    [-48, -52],
+    [-48, -51],
+    [-48, -50],
+    [-48, -49],
+    [-47, -54],
+    [-47, -53],
+    [-47, -52],
+    [-47, -51],
+    [-47, -50],
+    [-47, -49],
+    [-47, -48],
+    [-46, -54],
+    [-46, -53],
+    [-46, -52],
+    [-46, -51],
+    [-46, -50],
+    [-46, -49],
+    [-46, -48],
+    [-46, -47],
+    [46, 47, 48, 49, 50, 51, 52, 53, 54],
+    [-62, -63],
+    [-61, -63],
+    [-61, -62],
+    [-60, -63],
+    [-60, -62],
+    [-60, -61],
+    [-59, -63],
+    [-59, -62],
+    [-59, -61],
+    [-59, -60],
+    [-58, -63],
+    [-58, -62],
+    [-58, -61],
+    [-58, -60],
+    [-58, -59],
+    [-57, -63],
+    [-57, -62],
+    [-57, -61],
+    [-57, -60],
+    [-57, -59],
+    [-57, -58],
+    [-56, -63],
+    [-56, -62],
+    [-56, -61],
+    [-56, -60],
+    [-56, -59],
+    [-56, -58],
+    [-56, -57],
+    [-55, -63],
+    [-55, -62],
+    [-55, -61],
+    [-55, -60],
+    [-55, -59],
+    [-55, -58],
+    [-55, -57],
+    [-55, -56],
+    [55, 56, 57, 58, 59, 60, 61, 62, 63],
+    [-71, -72],
+    [-70, -72],
+    [-70, -71],
+    [-69, -72],
+    [-69, -71],
+    [-69, -70],
+    [-68, -72],
+    [-68, -71],
+    [-68, -70],
+    [-68, -69],
+    [-67, -72],
+    [-67, -71],
+    [-67, -70],
+    [-67, -69],
+    [-67, -68],
+    [-66, -72],
+    [-66, -71],
+    [-66, -70],
+    [-66, -69],
+    [-66, -68],
+    [-66, -67],
+    [-65, -72],
+    [-65, -71],
+    [-65, -70],
+    [-65, -69],
+    [-65, -68],
+    [-65, -67],
+    [-65, -66],
+    [-64, -72],
+    [-64, -71],
+    [-64, -70],
+    [-64, -69],
+    [-64, -68],
+    [-64, -67],
+    [-64, -66],
+    [-64, -65],
+    [64, 65, 66, 67, 68, 69, 70, 71, 72],
+    [-80, -81],
+    [-79, -81],
+    [-79, -80],
+    [-78, -81],
+    [-78, -80],
+    [-78, -79],
+    [-77, -81],
+    [-77, -80],
+    [-77, -79],
+    [-77, -78],
+    [-76, -81],
+    [-76, -80],
+    [-76, -79],
+    [-76, -78],
+    [-76, -77],
+    [-75, -81],
+    [-75, -80],
+    [-75, -79],
+    [-75, -78],
+    [-75, -77],
+    [-75, -76],
+    [-74, -81],
+    [-74, -80],
+    [-74, -79],
+    [-74, -78],
+    [-74, -77],
+    [-74, -76],
+    [-74, -75],
+    [-73, -81],
+    [-73, -80],
+    [-73, -79],
+    [-73, -78],
+    [-73, -77],
+    [-73, -76],
+    [-73, -75],
+    [-73, -74],
+    [73, 74, 75, 76, 77, 78, 79, 80, 81],
+    [-89, -90],
+    [-88, -90],
+    [-88, -89],
+    [-87, -90],
+    [-87, -89],
+    [-87, -88],
+    [-86, -90],
+    [-86, -89],
+    [-86, -88],
+    [-86, -87],
+    [-85, -90],
+    [-85, -89],
+    [-85, -88],
+    [-85, -87],
+    [-85, -86],
+    [-84, -90],
+    [-84, -89],
+    [-84, -88],
+    [-84, -87],
+    [-84, -86],
+    [-84, -85],
+    [-83, -90],
+    [-83, -89],
+    [-83, -88],
+    [-83, -87],
+    [-83, -86],
+    [-83, -85],
+    [-83, -84],
+    [-82, -90],
+    [-82, -89],
+    [-82, -88],
+    [-82, -87],
+    [-82, -86],
+    [-82, -85],
+    [-82, -84],
+    [-82, -83],
+    [82, 83, 84, 85, 86, 87, 88, 89, 90],
+    [-98, -99],
+    [-97, -99],
+    [-97, -98],
+    [-96, -99],
+    [-96, -98],
+    [-96, -97],
+    [-95, -99],
+    [-95, -98],
+    [-95, -97],
+    [-95, -96],
+    [-94, -99],
+    [-94, -98],
+    [-94, -97],
+    [-94, -96],
+    [-94, -95],
+    [-93, -99],
+    [-93, -98],
+    [-93, -97],
+    [-93, -96],
+    [-93, -95],
+    [-93, -94],
+    [-92, -99],
+    [-92, -98],
+    [-92, -97],
+    [-92, -96],
+    [-92, -95],
+    [-92, -94],
+    [-92, -93],
+    [-91, -99],
+    [-91, -98],
+    [-91, -97],
+    [-91, -96],
+    [-91, -95],
+    [-91, -94],
+    [-91, -93],
+    [-91, -92],
+    [91, 92, 93, 94, 95, 96, 97, 98, 99],
+    [-107, -108],
+    [-106, -108],
+    [-106, -107],
+    [-105, -108],
+    [-105, -107],
+    [-105, -106],
+    [-104, -108],
+    [-104, -107],
+    [-104, -106],
+    [-104, -105],
+    [-103, -108],
+    [-103, -107],
+    [-103, -106],
+    [-103, -105],
+    [-103, -104],
+    [-102, -108],
+    [-102, -107],
+    [-102, -106],
+    [-102, -105],
+    [-102, -104],
+    [-102, -103],
+    [-101, -108],
+    [-101, -107],
+    [-101, -106],
+    [-101, -105],
+    [-101, -104],
+    [-101, -103],
+    [-101, -102],
+    [-100, -108],
+    [-100, -107],
+    [-100, -106],
+    [-100, -105],
+    [-100, -104],
+    [-100, -103],
+    [-100, -102],
+    [-100, -101],
+    [100, 101, 102, 103, 104, 105, 106, 107, 108],
+    [-116, -117],
+    [-115, -117],
+    [-115, -116],
+    [-114, -117],
+    [-114, -116],
+    [-114, -115],
+    [-113, -117],
+    [-113, -116],
+    [-113, -115],
+    [-113, -114],
+    [-112, -117],
+    [-112, -116],
+    [-112, -115],
+    [-112, -114],
+    [-112, -113],
+    [-111, -117],
+    [-111, -116],
+    [-111, -115],
+    [-111, -114],
+    [-111, -113],
+    [-111, -112],
+    [-110, -117],
+    [-110, -116],
+    [-110, -115],
+    [-110, -114],
+    [-110, -113],
+    [-110, -112],
+    [-110, -111],
+    [-109, -117],
+    [-109, -116],
+    [-109, -115],
+    [-109, -114],
+    [-109, -113],
+    [-109, -112],
+    [-109, -111],
+    [-109, -110],
+    [109, 110, 111, 112, 113, 114, 115, 116, 117],
+    [-125, -126],
+    [-124, -126],
+    [-124, -125],
+    [-123, -126],
+    [-123, -125],
+    [-123, -124],
+    [-122, -126],
+    [-122, -125],
+    [-122, -124],
+    [-122, -123],
+    [-121, -126],
+    [-121, -125],
+    [-121, -124],
+    [-121, -123],
+    [-121, -122],
+    [-120, -126],
+    [-120, -125],
+    [-120, -124],
+    [-120, -123],
+    [-120, -122],
+    [-120, -121],
+    [-119, -126],
+    [-119, -125],
+    [-119, -124],
+    [-119, -123],
+    [-119, -122],
+    [-119, -121],
+    [-119, -120],
+    [-118, -126],
+    [-118, -125],
+    [-118, -124],
+    [-118, -123],
+    [-118, -122],
+    [-118, -121],
+    [-118, -120],
+    [-118, -119],
+    [118, 119, 120, 121, 122, 123, 124, 125, 126],
+    [-134, -135],
+    [-133, -135],
+    [-133, -134],
+    [-132, -135],
+    [-132, -134],
+    [-132, -133],
+    [-131, -135],
+    [-131, -134],
+    [-131, -133],
+    [-131, -132],
+    [-130, -135],
+    [-130, -134],
+    [-130, -133],
+    [-130, -132],
+    [-130, -131],
+    [-129, -135],
+    [-129, -134],
+    [-129, -133],
+    [-129, -132],
+    [-129, -131],
+    [-129, -130],
+    [-128, -135],
+    [-128, -134],
+    [-128, -133],
+    [-128, -132],
+    [-128, -131],
+    [-128, -130],
+    [-128, -129],
+    [-127, -135],
+    [-127, -134],
+    [-127, -133],
+    [-127, -132],
+    [-127, -131],
+    [-127, -130],
+    [-127, -129],
+    [-127, -128],
+    [127, 128, 129, 130, 131, 132, 133, 134, 135],
+    [-143, -144],
+    [-142, -144],
+    [-142, -143],
+    [-141, -144],
+    [-141, -143],
+    [-141, -142],
+    [-140, -144],
+    [-140, -143],
+    [-140, -142],
+    [-140, -141],
+    [-139, -144],
+    [-139, -143],
+    [-139, -142],
+    [-139, -141],
+    [-139, -140],
+    [-138, -144],
+    [-138, -143],
+    [-138, -142],
+    [-138, -141],
+    [-138, -140],
+    [-138, -139],
+    [-137, -144],
+    [-137, -143],
+    [-137, -142],
+    [-137, -141],
+    [-137, -140],
+    [-137, -139],
+    [-137, -138],
+    [-136, -144],
+    [-136, -143],
+    [-136, -142],
+    [-136, -141],
+    [-136, -140],
+    [-136, -139],
+    [-136, -138],
+    [-136, -137],
+    [136, 137, 138, 139, 140, 141, 142, 143, 144],
+    [-152, -153],
+    [-151, -153],
+    [-151, -152],
+    [-150, -153],
+    [-150, -152],
+    [-150, -151],
+    [-149, -153],
+    [-149, -152],
+    [-149, -151],
+    [-149, -150],
+    [-148, -153],
+    [-148, -152],
+    [-148, -151],
+    [-148, -150],
+    [-148, -149],
+    [-147, -153],
+    [-147, -152],
+    [-147, -151],
+    [-147, -150],
+    [-147, -149],
+    [-147, -148],
+    [-146, -153],
+    [-146, -152],
+    [-146, -151],
+    [-146, -150],
+    [-146, -149],
+    [-146, -148],
+    [-146, -147],
+    [-145, -153],
+    [-145, -152],
+    [-145, -151],
+    [-145, -150],
+    [-145, -149],
+    [-145, -148],
+    [-145, -147],
+    [-145, -146],
+    [145, 146, 147, 148, 149, 150, 151, 152, 153],
+    [-161, -162],
+    [-160, -162],
+    [-160, -161],
+    [-159, -162],
+    [-159, -161],
+    [-159, -160],
+    [-158, -162],
+    [-158, -161],
+    [-158, -160],
+    [-158, -159],
+    [-157, -162],
+    [-157, -161],
+    [-157, -160],
+    [-157, -159],
+    [-157, -158],
+    [-156, -162],
+    [-156, -161],
+    [-156, -160],
+    [-156, -159],
+    [-156, -158],
+    [-156, -157],
+    [-155, -162],
+    [-155, -161],
+    [-155, -160],
+    [-155, -159],
+    [-155, -158],
+    [-155, -157],
+    [-155, -156],
+    [-154, -162],
+    [-154, -161],
+    [-154, -160],
+    [-154, -159],
+    [-154, -158],
+    [-154, -157],
+    [-154, -156],
+    [-154, -155],
+    [154, 155, 156, 157, 158, 159, 160, 161, 162],
+    [-170, -171],
+    [-169, -171],
+    [-169, -170],
+    [-168, -171],
+    [-168, -170],
+    [-168, -169],
+    [-167, -171],
+    [-167, -170],
+    [-167, -169],
+    [-167, -168],
+    [-166, -171],
+    [-166, -170],
+    [-166, -169],
+    [-166, -168],
+    [-166, -167],
+    [-165, -171],
+    [-165, -170],
+    [-165, -169],
+    [-165, -168],
+    [-165, -167],
+    [-165, -166],
+    [-164, -171],
+    [-164, -170],
+    [-164, -169],
+    [-164, -168],
+    [-164, -167],
+    [-164, -166],
+    [-164, -165],
+    [-163, -171],
+    [-163, -170],
+    [-163, -169],
+    [-163, -168],
+    [-163, -167],
+    [-163, -166],
+    [-163, -165],
+    [-163, -164],
+    [163, 164, 165, 166, 167, 168, 169, 170, 171],
+    [-179, -180],
+    [-178, -180],
+    [-178, -179],
+    [-177, -180],
+    [-177, -179],
+    [-177, -178],
+    [-176, -180],
+    [-176, -179],
+    [-176, -178],
+    [-176, -177],
+    [-175, -180],
+    [-175, -179],
+    [-175, -178],
+    [-175, -177],
+    [-175, -176],
+    [-174, -180],
+    [-174, -179],
+    [-174, -178],
+    [-174, -177],
+    [-174, -176],
+    [-174, -175],
+    [-173, -180],
+    [-173, -179],
+    [-173, -178],
+    [-173, -177],
+    [-173, -176],
+    [-173, -175],
+    [-173, -174],
+    [-172, -180],
+    [-172, -179],
+    [-172, -178],
+    [-172, -177],
+    [-172, -176],
+    [-172, -175],
+    [-172, -174],
+    [-172, -173],
+    [172, 173, 174, 175, 176, 177, 178, 179, 180],
+    [-188, -189],
+    [-187, -189],
+    [-187, -188],
+    [-186, -189],
+    [-186, -188],
+    [-186, -187],
+    [-185, -189],
+    [-185, -188],
+    [-185, -187],
+    [-185, -186],
+    [-184, -189],
+    [-184, -188],
+    [-184, -187],
+    [-184, -186],
+    [-184, -185],
+    [-183, -189],
+    [-183, -188],
+    [-183, -187],
+    [-183, -186],
+    [-183, -185],
+    [-183, -184],
+    [-182, -189],
+    [-182, -188],
+    [-182, -187],
+    [-182, -186],
+    [-182, -185],
+    [-182, -184],
+    [-182, -183],
+    [-181, -189],
+    [-181, -188],
+    [-181, -187],
+    [-181, -186],
+    [-181, -185],
+    [-181, -184],
+    [-181, -183],
+    [-181, -182],
+    [181, 182, 183, 184, 185, 186, 187, 188, 189],
+    [-197, -198],
+    [-196, -198],
+    [-196, -197],
+    [-195, -198],
+    [-195, -197],
+    [-195, -196],
+    [-194, -198],
+    [-194, -197],
+    [-194, -196],
+    [-194, -195],
+    [-193, -198],
+    [-193, -197],
+    [-193, -196],
+    [-193, -195],
+    [-193, -194],
+    [-192, -198],
+    [-192, -197],
+    [-192, -196],
+    [-192, -195],
+    [-192, -194],
+    [-192, -193],
+    [-191, -198],
+    [-191, -197],
+    [-191, -196],
+    [-191, -195],
+    [-191, -194],
+    [-191, -193],
+    [-191, -192],
+    [-190, -198],
+    [-190, -197],
+    [-190, -196],
+    [-190, -195],
+    [-190, -194],
+    [-190, -193],
+    [-190, -192],
+    [-190, -191],
+    [190, 191, 192, 193, 194, 195, 196, 197, 198],
+    [-206, -207],
+    [-205, -207],
+    [-205, -206],
+    [-204, -207],
+    [-204, -206],
+    [-204, -205],
+    [-203, -207],
+    [-203, -206],
+    [-203, -205],
+    [-203, -204],
+    [-202, -207],
+    [-202, -206],
+    [-202, -205],
+    [-202, -204],
+    [-202, -203],
+    [-201, -207],
+    [-201, -206],
+    [-201, -205],
+    [-201, -204],
+    [-201, -203],
+    [-201, -202],
+    [-200, -207],
+    [-200, -206],
+    [-200, -205],
+    [-200, -204],
+    [-200, -203],
+    [-200, -202],
+    [-200, -201],
+    [-199, -207],
+    [-199, -206],
+    [-199, -205],
+    [-199, -204],
+    [-199, -203],
+    [-199, -202],
+    [-199, -201],
+    [-199, -200],
+    [199, 200, 201, 202, 203, 204, 205, 206, 207],
+    [-215, -216],
+    [-214, -216],
+    [-214, -215],
+    [-213, -216],
+    [-213, -215],
+    [-213, -214],
+    [-212, -216],
+    [-212, -215],
+    [-212, -214],
+    [-212, -213],
+    [-211, -216],
+    [-211, -215],
+    [-211, -214],
+    [-211, -213],
+    [-211, -212],
+    [-210, -216],
+    [-210, -215],
+    [-210, -214],
+    [-210, -213],
+    [-210, -212],
+    [-210, -211],
+    [-209, -216],
+    [-209, -215],
+    [-209, -214],
+    [-209, -213],
+    [-209, -212],
+    [-209, -211],
+    [-209, -210],
+    [-208, -216],
+    [-208, -215],
+    [-208, -214],
+    [-208, -213],
+    [-208, -212],
+    [-208, -211],
+    [-208, -210],
+    [-208, -209],
+    [208, 209, 210, 211, 212, 213, 214, 215, 216],
+    [-224, -225],
+    [-223, -225],
+    [-223, -224],
+    [-222, -225],
+    [-222, -224],
+    [-222, -223],
+    [-221, -225],
+    [-221, -224],
+    [-221, -223],
+    [-221, -222],
+    [-220, -225],
+    [-220, -224],
+    [-220, -223],
+    [-220, -222],
+    [-220, -221],
+    [-219, -225],
+    [-219, -224],
+    [-219, -223],
+    [-219, -222],
+    [-219, -221],
+    [-219, -220],
+    [-218, -225],
+    [-218, -224],
+    [-218, -223],
+    [-218, -222],
+    [-218, -221],
+    [-218, -220],
+    [-218, -219],
+    [-217, -225],
+    [-217, -224],
+    [-217, -223],
+    [-217, -222],
+    [-217, -221],
+    [-217, -220],
+    [-217, -219],
+    [-217, -218],
+    [217, 218, 219, 220, 221, 222, 223, 224, 225],
+    [-233, -234],
+    [-232, -234],
+    [-232, -233],
+    [-231, -234],
+    [-231, -233],
+    [-231, -232],
+    [-230, -234],
+    [-230, -233],
+    [-230, -232],
+    [-230, -231],
+    [-229, -234],
+    [-229, -233],
+    [-229, -232],
+    [-229, -231],
+    [-229, -230],
+    [-228, -234],
+    [-228, -233],
+    [-228, -232],
+    [-228, -231],
+    [-228, -230],
+    [-228, -229],
+    [-227, -234],
+    [-227, -233],
+    [-227, -232],
+    [-227, -231],
+    [-227, -230],
+    [-227, -229],
+    [-227, -228],
+    [-226, -234],
+    [-226, -233],
+    [-226, -232],
+    [-226, -231],
+    [-226, -230],
+    [-226, -229],
+    [-226, -228],
+    [-226, -227],
+    [226, 227, 228, 229, 230, 231, 232, 233, 234],
+    [-242, -243],
+    [-241, -243],
+    [-241, -242],
+    [-240, -243],
+    [-240, -242],
+    [-240, -241],
+    [-239, -243],
+    [-239, -242],
+    [-239, -241],
+    [-239, -240],
+    [-238, -243],
+    [-238, -242],
+    [-238, -241],
+    [-238, -240],
+    [-238, -239],
+    [-237, -243],
+    [-237, -242],
+    [-237, -241],
+    [-237, -240],
+    [-237, -239],
+    [-237, -238],
+    [-236, -243],
+    [-236, -242],
+    [-236, -241],
+    [-236, -240],
+    [-236, -239],
+    [-236, -238],
+    [-236, -237],
+    [-235, -243],
+    [-235, -242],
+    [-235, -241],
+    [-235, -240],
+    [-235, -239],
+    [-235, -238],
+    [-235, -237],
+    [-235, -236],
+    [235, 236, 237, 238, 239, 240, 241, 242, 243],
+    [-251, -252],
+    [-250, -252],
+    [-250, -251],
+    [-249, -252],
+    [-249, -251],
+    [-249, -250],
+    [-248, -252],
+    [-248, -251],
+    [-248, -250],
+    [-248, -249],
+    [-247, -252],
+    [-247, -251],
+    [-247, -250],
+    [-247, -249],
+    [-247, -248],
+    [-246, -252],
+    [-246, -251],
+    [-246, -250],
+    [-246, -249],
+    [-246, -248],
+    [-246, -247],
+    [-245, -252],
+    [-245, -251],
+    [-245, -250],
+    [-245, -249],
+    [-245, -248],
+    [-245, -247],
+    [-245, -246],
+    [-244, -252],
+    [-244, -251],
+    [-244, -250],
+    [-244, -249],
+    [-244, -248],
+    [-244, -247],
+    [-244, -246],
+    [-244, -245],
+    [244, 245, 246, 247, 248, 249, 250, 251, 252],
+    [-260, -261],
+    [-259, -261],
+    [-259, -260],
+    [-258, -261],
+    [-258, -260],
+    [-258, -259],
+    [-257, -261],
+    [-257, -260],
+    [-257, -259],
+    [-257, -258],
+    [-256, -261],
+    [-256, -260],
+    [-256, -259],
+    [-256, -258],
+    [-256, -257],
+    [-255, -261],
+    [-255, -260],
+    [-255, -259],
+    [-255, -258],
+    [-255, -257],
+    [-255, -256],
+    [-254, -261],
+    [-254, -260],
+    [-254, -259],
+    [-254, -258],
+    [-254, -257],
+    [-254, -256],
+    [-254, -255],
+    [-253, -261],
+    [-253, -260],
+    [-253, -259],
+    [-253, -258],
+    [-253, -257],
+    [-253, -256],
+    [-253, -255],
+    [-253, -254],
+    [253, 254, 255, 256, 257, 258, 259, 260, 261],
+    [-269, -270],
+    [-268, -270],
+    [-268, -269],
+    [-267, -270],
+    [-267, -269],
+    [-267, -268],
+    [-266, -270],
+    [-266, -269],
+    [-266, -268],
+    [-266, -267],
+    [-265, -270],
+    [-265, -269],
+    [-265, -268],
+    [-265, -267],
+    [-265, -266],
+    [-264, -270],
+    [-264, -269],
+    [-264, -268],
+    [-264, -267],
+    [-264, -266],
+    [-264, -265],
+    [-263, -270],
+    [-263, -269],
+    [-263, -268],
+    [-263, -267],
+    [-263, -266],
+    [-263, -265],
+    [-263, -264],
+    [-262, -270],
+    [-262, -269],
+    [-262, -268],
+    [-262, -267],
+    [-262, -266],
+    [-262, -265],
+    [-262, -264],
+    [-262, -263],
+    [262, 263, 264, 265, 266, 267, 268, 269, 270],
+    [-278, -279],
+    [-277, -279],
+    [-277, -278],
+    [-276, -279],
+    [-276, -278],
+    [-276, -277],
+    [-275, -279],
+    [-275, -278],
+    [-275, -277],
+    [-275, -276],
+    [-274, -279],
+    [-274, -278],
+    [-274, -277],
+    [-274, -276],
+    [-274, -275],
+    [-273, -279],
+    [-273, -278],
+    [-273, -277],
+    [-273, -276],
+    [-273, -275],
+    [-273, -274],
+    [-272, -279],
+    [-272, -278],
+    [-272, -277],
+    [-272, -276],
+    [-272, -275],
+    [-272, -274],
+    [-272, -273],
+    [-271, -279],
+    [-271, -278],
+    [-271, -277],
+    [-271, -276],
+    [-271, -275],
+    [-271, -274],
+    [-271, -273],
+    [-271, -272],
+    [271, 272, 273, 274, 275, 276, 277, 278, 279],
+    [-287, -288],
+    [-286, -288],
+    [-286, -287],
+    [-285, -288],
+    [-285, -287],
+    [-285, -286],
+    [-284, -288],
+    [-284, -287],
+    [-284, -286],
+    [-284, -285],
+    [-283, -288],
+    [-283, -287],
+    [-283, -286],
+    [-283, -285],
+    [-283, -284],
+    [-282, -288],
+    [-282, -287],
+    [-282, -286],
+    [-282, -285],
+    [-282, -284],
+    [-282, -283],
+    [-281, -288],
+    [-281, -287],
+    [-281, -286],
+    [-281, -285],
+    [-281, -284],
+    [-281, -283],
+    [-281, -282],
+    [-280, -288],
+    [-280, -287],
+    [-280, -286],
+    [-280, -285],
+    [-280, -284],
+    [-280, -283],
+    [-280, -282],
+    [-280, -281],
+    [280, 281, 282, 283, 284, 285, 286, 287, 288],
+    [-296, -297],
+    [-295, -297],
+    [-295, -296],
+    [-294, -297],
+    [-294, -296],
+    [-294, -295],
+    [-293, -297],
+    [-293, -296],
+    [-293, -295],
+    [-293, -294],
+    [-292, -297],
+    [-292, -296],
+    [-292, -295],
+    [-292, -294],
+    [-292, -293],
+    [-291, -297],
+    [-291, -296],
+    [-291, -295],
+    [-291, -294],
+    [-291, -293],
+    [-291, -292],
+    [-290, -297],
+    [-290, -296],
+    [-290, -295],
+    [-290, -294],
+    [-290, -293],
+    [-290, -292],
+    [-290, -291],
+    [-289, -297],
+    [-289, -296],
+    [-289, -295],
+    [-289, -294],
+    [-289, -293],
+    [-289, -292],
+    [-289, -291],
+    [-289, -290],
+    [289, 290, 291, 292, 293, 294, 295, 296, 297],
+    [-305, -306],
+    [-304, -306],
+    [-304, -305],
+    [-303, -306],
+    [-303, -305],
+    [-303, -304],
+    [-302, -306],
+    [-302, -305],
+    [-302, -304],
+    [-302, -303],
+    [-301, -306],
+    [-301, -305],
+    [-301, -304],
+    [-301, -303],
+    [-301, -302],
+    [-300, -306],
+    [-300, -305],
+    [-300, -304],
+    [-300, -303],
+    [-300, -302],
+    [-300, -301],
+    [-299, -306],
+    [-299, -305],
+    [-299, -304],
+    [-299, -303],
+    [-299, -302],
+    [-299, -301],
+    [-299, -300],
+    [-298, -306],
+    [-298, -305],
+    [-298, -304],
+    [-298, -303],
+    [-298, -302],
+    [-298, -301],
+    [-298, -300],
+    [-298, -299],
+    [298, 299, 300, 301, 302, 303, 304, 305, 306],
+    [-314, -315],
+    [-313, -315],
+    [-313, -314],
+    [-312, -315],
+    [-312, -314],
+    [-312, -313],
+    [-311, -315],
+    [-311, -314],
+    [-311, -313],
+    [-311, -312],
+    [-310, -315],
+    [-310, -314],
+    [-310, -313],
+    [-310, -312],
+    [-310, -311],
+    [-309, -315],
+    [-309, -314],
+    [-309, -313],
+    [-309, -312],
+    [-309, -311],
+    [-309, -310],
+    [-308, -315],
+    [-308, -314],
+    [-308, -313],
+    [-308, -312],
+    [-308, -311],
+    [-308, -310],
+    [-308, -309],
+    [-307, -315],
+    [-307, -314],
+    [-307, -313],
+    [-307, -312],
+    [-307, -311],
+    [-307, -310],
+    [-307, -309],
+    [-307, -308],
+    [307, 308, 309, 310, 311, 312, 313, 314, 315],
+    [-323, -324],
+    [-322, -324],
+    [-322, -323],
+    [-321, -324],
+    [-321, -323],
+    [-321, -322],
+    [-320, -324],
+    [-320, -323],
+    [-320, -322],
+    [-320, -321],
+    [-319, -324],
+    [-319, -323],
+    [-319, -322],
+    [-319, -321],
+    [-319, -320],
+    [-318, -324],
+    [-318, -323],
+    [-318, -322],
+    [-318, -321],
+    [-318, -320],
+    [-318, -319],
+    [-317, -324],
+    [-317, -323],
+    [-317, -322],
+    [-317, -321],
+    [-317, -320],
+    [-317, -319],
+    [-317, -318],
+    [-316, -324],
+    [-316, -323],
+    [-316, -322],
+    [-316, -321],
+    [-316, -320],
+    [-316, -319],
+    [-316, -318],
+    [-316, -317],
+    [316, 317, 318, 319, 320, 321, 322, 323, 324],
+    [-332, -333],
+    [-331, -333],
+    [-331, -332],
+    [-330, -333],
+    [-330, -332],
+    [-330, -331],
+    [-329, -333],
+    [-329, -332],
+    [-329, -331],
+    [-329, -330],
+    [-328, -333],
+    [-328, -332],
+    [-328, -331],
+    [-328, -330],
+    [-328, -329],
+    [-327, -333],
+    [-327, -332],
+    [-327, -331],
+    [-327, -330],
+    [-327, -329],
+    [-327, -328],
+    [-326, -333],
+    [-326, -332],
+    [-326, -331],
+    [-326, -330],
+    [-326, -329],
+    [-326, -328],
+    [-326, -327],
+    [-325, -333],
+    [-325, -332],
+    [-325, -331],
+    [-325, -330],
+    [-325, -329],
+    [-325, -328],
+    [-325, -327],
+    [-325, -326],
+    [325, 326, 327, 328, 329, 330, 331, 332, 333],
+    [-341, -342],
+    [-340, -342],
+    [-340, -341],
+    [-339, -342],
+    [-339, -341],
+    [-339, -340],
+    [-338, -342],
+    [-338, -341],
+    [-338, -340],
+    [-338, -339],
+    [-337, -342],
+    [-337, -341],
+    [-337, -340],
+    [-337, -339],
+    [-337, -338],
+    [-336, -342],
+    [-336, -341],
+    [-336, -340],
+    [-336, -339],
+    [-336, -338],
+    [-336, -337],
+    [-335, -342],
+    [-335, -341],
+    [-335, -340],
+    [-335, -339],
+    [-335, -338],
+    [-335, -337],
+    [-335, -336],
+    [-334, -342],
+    [-334, -341],
+    [-334, -340],
+    [-334, -339],
+    [-334, -338],
+    [-334, -337],
+    [-334, -336],
+    [-334, -335],
+    [334, 335, 336, 337, 338, 339, 340, 341, 342],
+    [-350, -351],
+    [-349, -351],
+    [-349, -350],
+    [-348, -351],
+    [-348, -350],
+    [-348, -349],
+    [-347, -351],
+    [-347, -350],
+    [-347, -349],
+    [-347, -348],
+    [-346, -351],
+    [-346, -350],
+    [-346, -349],
+    [-346, -348],
+    [-346, -347],
+    [-345, -351],
+    [-345, -350],
+    [-345, -349],
+    [-345, -348],
+    [-345, -347],
+    [-345, -346],
+    [-344, -351],
+    [-344, -350],
+    [-344, -349],
+    [-344, -348],
+    [-344, -347],
+    [-344, -346],
+    [-344, -345],
+    [-343, -351],
+    [-343, -350],
+    [-343, -349],
+    [-343, -348],
+    [-343, -347],
+    [-343, -346],
+    [-343, -345],
+    [-343, -344],
+    [343, 344, 345, 346, 347, 348, 349, 350, 351],
+    [-359, -360],
+    [-358, -360],
+    [-358, -359],
+    [-357, -360],
+    [-357, -359],
+    [-357, -358],
+    [-356, -360],
+    [-356, -359],
+    [-356, -358],
+    [-356, -357],
+    [-355, -360],
+    [-355, -359],
+    [-355, -358],
+    [-355, -357],
+    [-355, -356],
+    [-354, -360],
+    [-354, -359],
+    [-354, -358],
+    [-354, -357],
+    [-354, -356],
+    [-354, -355],
+    [-353, -360],
+    [-353, -359],
+    [-353, -358],
+    [-353, -357],
+    [-353, -356],
+    [-353, -355],
+    [-353, -354],
+    [-352, -360],
+    [-352, -359],
+    [-352, -358],
+    [-352, -357],
+    [-352, -356],
+    [-352, -355],
+    [-352, -354],
+    [-352, -353],
+    [352, 353, 354, 355, 356, 357, 358, 359, 360],
+    [-368, -369],
+    [-367, -369],
+    [-367, -368],
+    [-366, -369],
+    [-366, -368],
+    [-366, -367],
+    [-365, -369],
+    [-365, -368],
+    [-365, -367],
+    [-365, -366],
+    [-364, -369],
+    [-364, -368],
+    [-364, -367],
+    [-364, -366],
+    [-364, -365],
+    [-363, -369],
+    [-363, -368],
+    [-363, -367],
+    [-363, -366],
+    [-363, -365],
+    [-363, -364],
+    [-362, -369],
+    [-362, -368],
+    [-362, -367],
+    [-362, -366],
+    [-362, -365],
+    [-362, -364],
+    [-362, -363],
+    [-361, -369],
+    [-361, -368],
+    [-361, -367],
+    [-361, -366],
+    [-361, -365],
+    [-361, -364],
+    [-361, -363],
+    [-361, -362],
+    [361, 362, 363, 364, 365, 366, 367, 368, 369],
+    [-377, -378],
+    [-376, -378],
+    [-376, -377],
+    [-375, -378],
+    [-375, -377],
+    [-375, -376],
+    [-374, -378],
+    [-374, -377],
+    [-374, -376],
+    [-374, -375],
+    [-373, -378],
+    [-373, -377],
+    [-373, -376],
+    [-373, -375],
+    [-373, -374],
+    [-372, -378],
+    [-372, -377],
+    [-372, -376],
+    [-372, -375],
+    [-372, -374],
+    [-372, -373],
+    [-371, -378],
+    [-371, -377],
+    [-371, -376],
+    [-371, -375],
+    [-371, -374],
+    [-371, -373],
+    [-371, -372],
+    [-370, -378],
+    [-370, -377],
+    [-370, -376],
+    [-370, -375],
+    [-370, -374],
+    [-370, -373],
+    [-370, -372],
+    [-370, -371],
+    [370, 371, 372, 373, 374, 375, 376, 377, 378],
+    [-386, -387],
+    [-385, -387],
+    [-385, -386],
+    [-384, -387],
+    [-384, -386],
+    [-384, -385],
+    [-383, -387],
+    [-383, -386],
+    [-383, -385],
+    [-383, -384],
+    [-382, -387],
+    [-382, -386],
+    [-382, -385],
+    [-382, -384],
+    [-382, -383],
+    [-381, -387],
+    [-381, -386],
+    [-381, -385],
+    [-381, -384],
+    [-381, -383],
+    [-381, -382],
+    [-380, -387],
+    [-380, -386],
+    [-380, -385],
+    [-380, -384],
+    [-380, -383],
+    [-380, -382],
+    [-380, -381],
+    [-379, -387],
+    [-379, -386],
+    [-379, -385],
+    [-379, -384],
+    [-379, -383],
+    [-379, -382],
+    [-379, -381],
+    [-379, -380],
+    [379, 380, 381, 382, 383, 384, 385, 386, 387],
+    [-395, -396],
+    [-394, -396],
+    [-394, -395],
+    [-393, -396],
+    [-393, -395],
+    [-393, -394],
+    [-392, -396],
+    [-392, -395],
+    [-392, -394],
+    [-392, -393],
+    [-391, -396],
+    [-391, -395],
+    [-391, -394],
+    [-391, -393],
+    [-391, -392],
+    [-390, -396],
+    [-390, -395],
+    [-390, -394],
+    [-390, -393],
+    [-390, -392],
+    [-390, -391],
+    [-389, -396],
+    [-389, -395],
+    [-389, -394],
+    [-389, -393],
+    [-389, -392],
+    [-389, -391],
+    [-389, -390],
+    [-388, -396],
+    [-388, -395],
+    [-388, -394],
+    [-388, -393],
+    [-388, -392],
+    [-388, -391],
+    [-388, -390],
+    [-388, -389],
+    [388, 389, 390, 391, 392, 393, 394, 395, 396],
+    [-404, -405],
+    [-403, -405],
+    [-403, -404],
+    [-402, -405],
+    [-402, -404],
+    [-402, -403],
+    [-401, -405],
+    [-401, -404],
+    [-401, -403],
+    [-401, -402],
+    [-400, -405],
+    [-400, -404],
+    [-400, -403],
+    [-400, -402],
+    [-400, -401],
+    [-399, -405],
+    [-399, -404],
+    [-399, -403],
+    [-399, -402],
+    [-399, -401],
+    [-399, -400],
+    [-398, -405],
+    [-398, -404],
+    [-398, -403],
+    [-398, -402],
+    [-398, -401],
+    [-398, -400],
+    [-398, -399],
+    [-397, -405],
+    [-397, -404],
+    [-397, -403],
+    [-397, -402],
+    [-397, -401],
+    [-397, -400],
+    [-397, -399],
+    [-397, -398],
+    [397, 398, 399, 400, 401, 402, 403, 404, 405],
+    [-413, -414],
+    [-412, -414],
+    [-412, -413],
+    [-411, -414],
+    [-411, -413],
+    [-411, -412],
+    [-410, -414],
+    [-410, -413],
+    [-410, -412],
+    [-410, -411],
+    [-409, -414],
+    [-409, -413],
+    [-409, -412],
+    [-409, -411],
+    [-409, -410],
+    [-408, -414],
+    [-408, -413],
+    [-408, -412],
+    [-408, -411],
+    [-408, -410],
+    [-408, -409],
+    [-407, -414],
+    [-407, -413],
+    [-407, -412],
+    [-407, -411],
+    [-407, -410],
+    [-407, -409],
+    [-407, -408],
+    [-406, -414],
+    [-406, -413],
+    [-406, -412],
+    [-406, -411],
+    [-406, -410],
+    [-406, -409],
+    [-406, -408],
+    [-406, -407],
+    [406, 407, 408, 409, 410, 411, 412, 413, 414],
+    [-422, -423],
+    [-421, -423],
+    [-421, -422],
+    [-420, -423],
+    [-420, -422],
+    [-420, -421],
+    [-419, -423],
+    [-419, -422],
+    [-419, -421],
+    [-419, -420],
+    [-418, -423],
+    [-418, -422],
+    [-418, -421],
+    [-418, -420],
+    [-418, -419],
+    [-417, -423],
+    [-417, -422],
+    [-417, -421],
+    [-417, -420],
+    [-417, -419],
+    [-417, -418],
+    [-416, -423],
+    [-416, -422],
+    [-416, -421],
+    [-416, -420],
+    [-416, -419],
+    [-416, -418],
+    [-416, -417],
+    [-415, -423],
+    [-415, -422],
+    [-415, -421],
+    [-415, -420],
+    [-415, -419],
+    [-415, -418],
+    [-415, -417],
+    [-415, -416],
+    [415, 416, 417, 418, 419, 420, 421, 422, 423],
+    [-431, -432],
+    [-430, -432],
+    [-430, -431],
+    [-429, -432],
+    [-429, -431],
+    [-429, -430],
+    [-428, -432],
+    [-428, -431],
+    [-428, -430],
+    [-428, -429],
+    [-427, -432],
+    [-427, -431],
+    [-427, -430],
+    [-427, -429],
+    [-427, -428],
+    [-426, -432],
+    [-426, -431],
+    [-426, -430],
+    [-426, -429],
+    [-426, -428],
+    [-426, -427],
+    [-425, -432],
+    [-425, -431],
+    [-425, -430],
+    [-425, -429],
+    [-425, -428],
+    [-425, -427],
+    [-425, -426],
+    [-424, -432],
+    [-424, -431],
+    [-424, -430],
+    [-424, -429],
+    [-424, -428],
+    [-424, -427],
+    [-424, -426],
+    [-424, -425],
+    [424, 425, 426, 427, 428, 429, 430, 431, 432],
+    [-440, -441],
+    [-439, -441],
+    [-439, -440],
+    [-438, -441],
+    [-438, -440],
+    [-438, -439],
+    [-437, -441],
+    [-437, -440],
+    [-437, -439],
+    [-437, -438],
+    [-436, -441],
+    [-436, -440],
+    [-436, -439],
+    [-436, -438],
+    [-436, -437],
+    [-435, -441],
+    [-435, -440],
+    [-435, -439],
+    [-435, -438],
+    [-435, -437],
+    [-435, -436],
+    [-434, -441],
+    [-434, -440],
+    [-434, -439],
+    [-434, -438],
+    [-434, -437],
+    [-434, -436],
+    [-434, -435],
+    [-433, -441],
+    [-433, -440],
+    [-433, -439],
+    [-433, -438],
+    [-433, -437],
+    [-433, -436],
+    [-433, -435],
+    [-433, -434],
+    [433, 434, 435, 436, 437, 438, 439, 440, 441],
+    [-449, -450],
+    [-448, -450],
+    [-448, -449],
+    [-447, -450],
+    [-447, -449],
+    [-447, -448],
+    [-446, -450],
+    [-446, -449],
+    [-446, -448],
+    [-446, -447],
+    [-445, -450],
+    [-445, -449],
+    [-445, -448],
+    [-445, -447],
+    [-445, -446],
+    [-444, -450],
+    [-444, -449],
+    [-444, -448],
+    [-444, -447],
+    [-444, -446],
+    [-444, -445],
+    [-443, -450],
+    [-443, -449],
+    [-443, -448],
+    [-443, -447],
+    [-443, -446],
+    [-443, -445],
+    [-443, -444],
+    [-442, -450],
+    [-442, -449],
+    [-442, -448],
+    [-442, -447],
+    [-442, -446],
+    [-442, -445],
+    [-442, -444],
+    [-442, -443],
+    [442, 443, 444, 445, 446, 447, 448, 449, 450],
+    [-458, -459],
+    [-457, -459],
+    [-457, -458],
+    [-456, -459],
+    [-456, -458],
+    [-456, -457],
+    [-455, -459],
+    [-455, -458],
+    [-455, -457],
+    [-455, -456],
+    [-454, -459],
+    [-454, -458],
+    [-454, -457],
+    [-454, -456],
+    [-454, -455],
+    [-453, -459],
+    [-453, -458],
+    [-453, -457],
+    [-453, -456],
+    [-453, -455],
+    [-453, -454],
+    [-452, -459],
+    [-452, -458],
+    [-452, -457],
+    [-452, -456],
+    [-452, -455],
+    [-452, -454],
+    [-452, -453],
+    [-451, -459],
+    [-451, -458],
+    [-451, -457],
+    [-451, -456],
+    [-451, -455],
+    [-451, -454],
+    [-451, -453],
+    [-451, -452],
+    [451, 452, 453, 454, 455, 456, 457, 458, 459],
+    [-467, -468],
+    [-466, -468],
+    [-466, -467],
+    [-465, -468],
+    [-465, -467],
+    [-465, -466],
+    [-464, -468],
+    [-464, -467],
+    [-464, -466],
+    [-464, -465],
+    [-463, -468],
+    [-463, -467],
+    [-463, -466],
+    [-463, -465],
+    [-463, -464],
+    [-462, -468],
+    [-462, -467],
+    [-462, -466],
+    [-462, -465],
+    [-462, -464],
+    [-462, -463],
+    [-461, -468],
+    [-461, -467],
+    [-461, -466],
+    [-461, -465],
+    [-461, -464],
+    [-461, -463],
+    [-461, -462],
+    [-460, -468],
+    [-460, -467],
+    [-460, -466],
+    [-460, -465],
+    [-460, -464],
+    [-460, -463],
+    [-460, -462],
+    [-460, -461],
+    [460, 461, 462, 463, 464, 465, 466, 467, 468],
+    [-476, -477],
+    [-475, -477],
+    [-475, -476],
+    [-474, -477],
+    [-474, -476],
+    [-474, -475],
+    [-473, -477],
+    [-473, -476],
+    [-473, -475],
+    [-473, -474],
+    [-472, -477],
+    [-472, -476],
+    [-472, -475],
+    [-472, -474],
+    [-472, -473],
+    [-471, -477],
+    [-471, -476],
+    [-471, -475],
+    [-471, -474],
+    [-471, -473],
+    [-471, -472],
+    [-470, -477],
+    [-470, -476],
+    [-470, -475],
+    [-470, -474],
+    [-470, -473],
+    [-470, -472],
+    [-470, -471],
+    [-469, -477],
+    [-469, -476],
+    [-469, -475],
+    [-469, -474],
+    [-469, -473],
+    [-469, -472],
+    [-469, -471],
+    [-469, -470],
+    [469, 470, 471, 472, 473, 474, 475, 476, 477],
+    [-485, -486],
+    [-484, -486],
+    [-484, -485],
+    [-483, -486],
+    [-483, -485],
+    [-483, -484],
+    [-482, -486],
+    [-482, -485],
+    [-482, -484],
+    [-482, -483],
+    [-481, -486],
+    [-481, -485],
+    [-481, -484],
+    [-481, -483],
+    [-481, -482],
+    [-480, -486],
+    [-480, -485],
+    [-480, -484],
+    [-480, -483],
+    [-480, -482],
+    [-480, -481],
+    [-479, -486],
+    [-479, -485],
+    [-479, -484],
+    [-479, -483],
+    [-479, -482],
+    [-479, -481],
+    [-479, -480],
+    [-478, -486],
+    [-478, -485],
+    [-478, -484],
+    [-478, -483],
+    [-478, -482],
+    [-478, -481],
+    [-478, -480],
+    [-478, -479],
+    [478, 479, 480, 481, 482, 483, 484, 485, 486],
+    [-494, -495],
+    [-493, -495],
+    [-493, -494],
+    [-492, -495],
+    [-492, -494],
+    [-492, -493],
+    [-491, -495],
+    [-491, -494],
+    [-491, -493],
+    [-491, -492],
+    [-490, -495],
+    [-490, -494],
+    [-490, -493],
+    [-490, -492],
+    [-490, -491],
+    [-489, -495],
+    [-489, -494],
+    [-489, -493],
+    [-489, -492],
+    [-489, -491],
+    [-489, -490],
+    [-488, -495],
+    [-488, -494],
+    [-488, -493],
+    [-488, -492],
+    [-488, -491],
+    [-488, -490],
+    [-488, -489],
+    [-487, -495],
+    [-487, -494],
+    [-487, -493],
+    [-487, -492],
+    [-487, -491],
+    [-487, -490],
+    [-487, -489],
+    [-487, -488],
+    [487, 488, 489, 490, 491, 492, 493, 494, 495],
+    [-503, -504],
+    [-502, -504],
+    [-502, -503],
+    [-501, -504],
+    [-501, -503],
+    [-501, -502],
+    [-500, -504],
+    [-500, -503],
+    [-500, -502],
+    [-500, -501],
+    [-499, -504],
+    [-499, -503],
+    [-499, -502],
+    [-499, -501],
+    [-499, -500],
+    [-498, -504],
+    [-498, -503],
+    [-498, -502],
+    [-498, -501],
+    [-498, -500],
+    [-498, -499],
+    [-497, -504],
+    [-497, -503],
+    [-497, -502],
+    [-497, -501],
+    [-497, -500],
+    [-497, -499],
+    [-497, -498],
+    [-496, -504],
+    [-496, -503],
+    [-496, -502],
+    [-496, -501],
+    [-496, -500],
+    [-496, -499],
+    [-496, -498],
+    [-496, -497],
+    [496, 497, 498, 499, 500, 501, 502, 503, 504],
+    [-512, -513],
+    [-511, -513],
+    [-511, -512],
+    [-510, -513],
+    [-510, -512],
+    [-510, -511],
+    [-509, -513],
+    [-509, -512],
+    [-509, -511],
+    [-509, -510],
+    [-508, -513],
+    [-508, -512],
+    [-508, -511],
+    [-508, -510],
+    [-508, -509],
+    [-507, -513],
+    [-507, -512],
+    [-507, -511],
+    [-507, -510],
+    [-507, -509],
+    [-507, -508],
+    [-506, -513],
+    [-506, -512],
+    [-506, -511],
+    [-506, -510],
+    [-506, -509],
+    [-506, -508],
+    [-506, -507],
+    [-505, -513],
+    [-505, -512],
+    [-505, -511],
+    [-505, -510],
+    [-505, -509],
+    [-505, -508],
+    [-505, -507],
+    [-505, -506],
+    [505, 506, 507, 508, 509, 510, 511, 512, 513],
+    [-521, -522],
+    [-520, -522],
+    [-520, -521],
+    [-519, -522],
+    [-519, -521],
+    [-519, -520],
+    [-518, -522],
+    [-518, -521],
+    [-518, -520],
+    [-518, -519],
+    [-517, -522],
+    [-517, -521],
+    [-517, -520],
+    [-517, -519],
+    [-517, -518],
+    [-516, -522],
+    [-516, -521],
+    [-516, -520],
+    [-516, -519],
+    [-516, -518],
+    [-516, -517],
+    [-515, -522],
+    [-515, -521],
+    [-515, -520],
+    [-515, -519],
+    [-515, -518],
+    [-515, -517],
+    [-515, -516],
+    [-514, -522],
+    [-514, -521],
+    [-514, -520],
+    [-514, -519],
+    [-514, -518],
+    [-514, -517],
+    [-514, -516],
+    [-514, -515],
+    [514, 515, 516, 517, 518, 519, 520, 521, 522],
+    [-530, -531],
+    [-529, -531],
+    [-529, -530],
+    [-528, -531],
+    [-528, -530],
+    [-528, -529],
+    [-527, -531],
+    [-527, -530],
+    [-527, -529],
+    [-527, -528],
+    [-526, -531],
+    [-526, -530],
+    [-526, -529],
+    [-526, -528],
+    [-526, -527],
+    [-525, -531],
+    [-525, -530],
+    [-525, -529],
+    [-525, -528],
+    [-525, -527],
+    [-525, -526],
+    [-524, -531],
+    [-524, -530],
+    [-524, -529],
+    [-524, -528],
+    [-524, -527],
+    [-524, -526],
+    [-524, -525],
+    [-523, -531],
+    [-523, -530],
+    [-523, -529],
+    [-523, -528],
+    [-523, -527],
+    [-523, -526],
+    [-523, -525],
+    [-523, -524],
+    [523, 524, 525, 526, 527, 528, 529, 530, 531],
+    [-539, -540],
+    [-538, -540],
+    [-538, -539],
+    [-537, -540],
+    [-537, -539],
+    [-537, -538],
+    [-536, -540],
+    [-536, -539],
+    [-536, -538],
+    [-536, -537],
+    [-535, -540],
+    [-535, -539],
+    [-535, -538],
+    [-535, -537],
+    [-535, -536],
+    [-534, -540],
+    [-534, -539],
+    [-534, -538],
+    [-534, -537],
+    [-534, -536],
+    [-534, -535],
+    [-533, -540],
+    [-533, -539],
+    [-533, -538],
+    [-533, -537],
+    [-533, -536],
+    [-533, -535],
+    [-533, -534],
+    [-532, -540],
+    [-532, -539],
+    [-532, -538],
+    [-532, -537],
+    [-532, -536],
+    [-532, -535],
+    [-532, -534],
+    [-532, -533],
+    [532, 533, 534, 535, 536, 537, 538, 539, 540],
+    [-548, -549],
+    [-547, -549],
+    [-547, -548],
+    [-546, -549],
+    [-546, -548],
+    [-546, -547],
+    [-545, -549],
+    [-545, -548],
+    [-545, -547],
+    [-545, -546],
+    [-544, -549],
+    [-544, -548],
+    [-544, -547],
+    [-544, -546],
+    [-544, -545],
+    [-543, -549],
+    [-543, -548],
+    [-543, -547],
+    [-543, -546],
+    [-543, -545],
+    [-543, -544],
+    [-542, -549],
+    [-542, -548],
+    [-542, -547],
+    [-542, -546],
+    [-542, -545],
+    [-542, -544],
+    [-542, -543],
+    [-541, -549],
+    [-541, -548],
+    [-541, -547],
+    [-541, -546],
+    [-541, -545],
+    [-541, -544],
+    [-541, -543],
+    [-541, -542],
+    [541, 542, 543, 544, 545, 546, 547, 548, 549],
+    [-557, -558],
+    [-556, -558],
+    [-556, -557],
+    [-555, -558],
+    [-555, -557],
+    [-555, -556],
+    [-554, -558],
+    [-554, -557],
+    [-554, -556],
+    [-554, -555],
+    [-553, -558],
+    [-553, -557],
+    [-553, -556],
+    [-553, -555],
+    [-553, -554],
+    [-552, -558],
+    [-552, -557],
+    [-552, -556],
+    [-552, -555],
+    [-552, -554],
+    [-552, -553],
+    [-551, -558],
+    [-551, -557],
+    [-551, -556],
+    [-551, -555],
+    [-551, -554],
+    [-551, -553],
+    [-551, -552],
+    [-550, -558],
+    [-550, -557],
+    [-550, -556],
+    [-550, -555],
+    [-550, -554],
+    [-550, -553],
+    [-550, -552],
+    [-550, -551],
+    [550, 551, 552, 553, 554, 555, 556, 557, 558],
+    [-566, -567],
+    [-565, -567],
+    [-565, -566],
+    [-564, -567],
+    [-564, -566],
+    [-564, -565],
+    [-563, -567],
+    [-563, -566],
+    [-563, -565],
+    [-563, -564],
+    [-562, -567],
+    [-562, -566],
+    [-562, -565],
+    [-562, -564],
+    [-562, -563],
+    [-561, -567],
+    [-561, -566],
+    [-561, -565],
+    [-561, -564],
+    [-561, -563],
+    [-561, -562],
+    [-560, -567],
+    [-560, -566],
+    [-560, -565],
+    [-560, -564],
+    [-560, -563],
+    [-560, -562],
+    [-560, -561],
+    [-559, -567],
+    [-559, -566],
+    [-559, -565],
+    [-559, -564],
+    [-559, -563],
+    [-559, -562],
+    [-559, -561],
+    [-559, -560],
+    [559, 560, 561, 562, 563, 564, 565, 566, 567],
+    [-575, -576],
+    [-574, -576],
+    [-574, -575],
+    [-573, -576],
+    [-573, -575],
+    [-573, -574],
+    [-572, -576],
+    [-572, -575],
+    [-572, -574],
+    [-572, -573],
+    [-571, -576],
+    [-571, -575],
+    [-571, -574],
+    [-571, -573],
+    [-571, -572],
+    [-570, -576],
+    [-570, -575],
+    [-570, -574],
+    [-570, -573],
+    [-570, -572],
+    [-570, -571],
+    [-569, -576],
+    [-569, -575],
+    [-569, -574],
+    [-569, -573],
+    [-569, -572],
+    [-569, -571],
+    [-569, -570],
+    [-568, -576],
+    [-568, -575],
+    [-568, -574],
+    [-568, -573],
+    [-568, -572],
+    [-568, -571],
+    [-568, -570],
+    [-568, -569],
+    [568, 569, 570, 571, 572, 573, 574, 575, 576],
+    [-584, -585],
+    [-583, -585],
+    [-583, -584],
+    [-582, -585],
+    [-582, -584],
+    [-582, -583],
+    [-581, -585],
+    [-581, -584],
+    [-581, -583],
+    [-581, -582],
+    [-580, -585],
+    [-580, -584],
+    [-580, -583],
+    [-580, -582],
+    [-580, -581],
+    [-579, -585],
+    [-579, -584],
+    [-579, -583],
+    [-579, -582],
+    [-579, -581],
+    [-579, -580],
+    [-578, -585],
+    [-578, -584],
+    [-578, -583],
+    [-578, -582],
+    [-578, -581],
+    [-578, -580],
+    [-578, -579],
+    [-577, -585],
+    [-577, -584],
+    [-577, -583],
+    [-577, -582],
+    [-577, -581],
+    [-577, -580],
+    [-577, -579],
+    [-577, -578],
+    [577, 578, 579, 580, 581, 582, 583, 584, 585],
+    [-593, -594],
+    [-592, -594],
+    [-592, -593],
+    [-591, -594],
+    [-591, -593],
+    [-591, -592],
+    [-590, -594],
+    [-590, -593],
+    [-590, -592],
+    [-590, -591],
+    [-589, -594],
+    [-589, -593],
+    [-589, -592],
+    [-589, -591],
+    [-589, -590],
+    [-588, -594],
+    [-588, -593],
+    [-588, -592],
+    [-588, -591],
+    [-588, -590],
+    [-588, -589],
+    [-587, -594],
+    [-587, -593],
+    [-587, -592],
+    [-587, -591],
+    [-587, -590],
+    [-587, -589],
+    [-587, -588],
+    [-586, -594],
+    [-586, -593],
+    [-586, -592],
+    [-586, -591],
+    [-586, -590],
+    [-586, -589],
+    [-586, -588],
+    [-586, -587],
+    [586, 587, 588, 589, 590, 591, 592, 593, 594],
+    [-602, -603],
+    [-601, -603],
+    [-601, -602],
+    [-600, -603],
+    [-600, -602],
+    [-600, -601],
+    [-599, -603],
+    [-599, -602],
+    [-599, -601],
+    [-599, -600],
+    [-598, -603],
+    [-598, -602],
+    [-598, -601],
+    [-598, -600],
+    [-598, -599],
+    [-597, -603],
+    [-597, -602],
+    [-597, -601],
+    [-597, -600],
+    [-597, -599],
+    [-597, -598],
+    [-596, -603],
+    [-596, -602],
+    [-596, -601],
+    [-596, -600],
+    [-596, -599],
+    [-596, -598],
+    [-596, -597],
+    [-595, -603],
+    [-595, -602],
+    [-595, -601],
+    [-595, -600],
+    [-595, -599],
+    [-595, -598],
+    [-595, -597],
+    [-595, -596],
+    [595, 596, 597, 598, 599, 600, 601, 602, 603],
+    [-611, -612],
+    [-610, -612],
+    [-610, -611],
+    [-609, -612],
+    [-609, -611],
+    [-609, -610],
+    [-608, -612],
+    [-608, -611],
+    [-608, -610],
+    [-608, -609],
+    [-607, -612],
+    [-607, -611],
+    [-607, -610],
+    [-607, -609],
+    [-607, -608],
+    [-606, -612],
+    [-606, -611],
+    [-606, -610],
+    [-606, -609],
+    [-606, -608],
+    [-606, -607],
+    [-605, -612],
+    [-605, -611],
+    [-605, -610],
+    [-605, -609],
+    [-605, -608],
+    [-605, -607],
+    [-605, -606],
+    [-604, -612],
+    [-604, -611],
+    [-604, -610],
+    [-604, -609],
+    [-604, -608],
+    [-604, -607],
+    [-604, -606],
+    [-604, -605],
+    [604, 605, 606, 607, 608, 609, 610, 611, 612],
+    [-620, -621],
+    [-619, -621],
+    [-619, -620],
+    [-618, -621],
+    [-618, -620],
+    [-618, -619],
+    [-617, -621],
+    [-617, -620],
+    [-617, -619],
+    [-617, -618],
+    [-616, -621],
+    [-616, -620],
+    [-616, -619],
+    [-616, -618],
+    [-616, -617],
+    [-615, -621],
+    [-615, -620],
+    [-615, -619],
+    [-615, -618],
+    [-615, -617],
+    [-615, -616],
+    [-614, -621],
+    [-614, -620],
+    [-614, -619],
+    [-614, -618],
+    [-614, -617],
+    [-614, -616],
+    [-614, -615],
+    [-613, -621],
+    [-613, -620],
+    [-613, -619],
+    [-613, -618],
+    [-613, -617],
+    [-613, -616],
+    [-613, -615],
+    [-613, -614],
+    [613, 614, 615, 616, 617, 618, 619, 620, 621],
+    [-629, -630],
+    [-628, -630],
+    [-628, -629],
+    [-627, -630],
+    [-627, -629],
+    [-627, -628],
+    [-626, -630],
+    [-626, -629],
+    [-626, -628],
+    [-626, -627],
+    [-625, -630],
+    [-625, -629],
+    [-625, -628],
+    [-625, -627],
+    [-625, -626],
+    [-624, -630],
+    [-624, -629],
+    [-624, -628],
+    [-624, -627],
+    [-624, -626],
+    [-624, -625],
+    [-623, -630],
+    [-623, -629],
+    [-623, -628],
+    [-623, -627],
+    [-623, -626],
+    [-623, -625],
+    [-623, -624],
+    [-622, -630],
+    [-622, -629],
+    [-622, -628],
+    [-622, -627],
+    [-622, -626],
+    [-622, -625],
+    [-622, -624],
+    [-622, -623],
+    [622, 623, 624, 625, 626, 627, 628, 629, 630],
+    [-638, -639],
+    [-637, -639],
+    [-637, -638],
+    [-636, -639],
+    [-636, -638],
+    [-636, -637],
+    [-635, -639],
+    [-635, -638],
+    [-635, -637],
+    [-635, -636],
+    [-634, -639],
+    [-634, -638],
+    [-634, -637],
+    [-634, -636],
+    [-634, -635],
+    [-633, -639],
+    [-633, -638],
+    [-633, -637],
+    [-633, -636],
+    [-633, -635],
+    [-633, -634],
+    [-632, -639],
+    [-632, -638],
+    [-632, -637],
+    [-632, -636],
+    [-632, -635],
+    [-632, -634],
+    [-632, -633],
+    [-631, -639],
+    [-631, -638],
+    [-631, -637],
+    [-631, -636],
+    [-631, -635],
+    [-631, -634],
+    [-631, -633],
+    [-631, -632],
+    [631, 632, 633, 634, 635, 636, 637, 638, 639],
+    [-647, -648],
+    [-646, -648],
+    [-646, -647],
+    [-645, -648],
+    [-645, -647],
+    [-645, -646],
+    [-644, -648],
+    [-644, -647],
+    [-644, -646],
+    [-644, -645],
+    [-643, -648],
+    [-643, -647],
+    [-643, -646],
+    [-643, -645],
+    [-643, -644],
+    [-642, -648],
+    [-642, -647],
+    [-642, -646],
+    [-642, -645],
+    [-642, -644],
+    [-642, -643],
+    [-641, -648],
+    [-641, -647],
+    [-641, -646],
+    [-641, -645],
+    [-641, -644],
+    [-641, -643],
+    [-641, -642],
+    [-640, -648],
+    [-640, -647],
+    [-640, -646],
+    [-640, -645],
+    [-640, -644],
+    [-640, -643],
+    [-640, -642],
+    [-640, -641],
+    [640, 641, 642, 643, 644, 645, 646, 647, 648],
+    [-656, -657],
+    [-655, -657],
+    [-655, -656],
+    [-654, -657],
+    [-654, -656],
+    [-654, -655],
+    [-653, -657],
+    [-653, -656],
+    [-653, -655],
+    [-653, -654],
+    [-652, -657],
+    [-652, -656],
+    [-652, -655],
+    [-652, -654],
+    [-652, -653],
+    [-651, -657],
+    [-651, -656],
+    [-651, -655],
+    [-651, -654],
+    [-651, -653],
+    [-651, -652],
+    [-650, -657],
+    [-650, -656],
+    [-650, -655],
+    [-650, -654],
+    [-650, -653],
+    [-650, -652],
+    [-650, -651],
+    [-649, -657],
+    [-649, -656],
+    [-649, -655],
+    [-649, -654],
+    [-649, -653],
+    [-649, -652],
+    [-649, -651],
+    [-649, -650],
+    [649, 650, 651, 652, 653, 654, 655, 656, 657],
+    [-665, -666],
+    [-664, -666],
+    [-664, -665],
+    [-663, -666],
+    [-663, -665],
+    [-663, -664],
+    [-662, -666],
+    [-662, -665],
+    [-662, -664],
+    [-662, -663],
+    [-661, -666],
+    [-661, -665],
+    [-661, -664],
+    [-661, -663],
+    [-661, -662],
+    [-660, -666],
+    [-660, -665],
+    [-660, -664],
+    [-660, -663],
+    [-660, -662],
+    [-660, -661],
+    [-659, -666],
+    [-659, -665],
+    [-659, -664],
+    [-659, -663],
+    [-659, -662],
+    [-659, -661],
+    [-659, -660],
+    [-658, -666],
+    [-658, -665],
+    [-658, -664],
+    [-658, -663],
+    [-658, -662],
+    [-658, -661],
+    [-658, -660],
+    [-658, -659],
+    [658, 659, 660, 661, 662, 663, 664, 665, 666],
+    [-674, -675],
+    [-673, -675],
+    [-673, -674],
+    [-672, -675],
+    [-672, -674],
+    [-672, -673],
+    [-671, -675],
+    [-671, -674],
+    [-671, -673],
+    [-671, -672],
+    [-670, -675],
+    [-670, -674],
+    [-670, -673],
+    [-670, -672],
+    [-670, -671],
+    [-669, -675],
+    [-669, -674],
+    [-669, -673],
+    [-669, -672],
+    [-669, -671],
+    [-669, -670],
+    [-668, -675],
+    [-668, -674],
+    [-668, -673],
+    [-668, -672],
+    [-668, -671],
+    [-668, -670],
+    [-668, -669],
+    [-667, -675],
+    [-667, -674],
+    [-667, -673],
+    [-667, -672],
+    [-667, -671],
+    [-667, -670],
+    [-667, -669],
+    [-667, -668],
+    [667, 668, 669, 670, 671, 672, 673, 674, 675],
+    [-683, -684],
+    [-682, -684],
+    [-682, -683],
+    [-681, -684],
+    [-681, -683],
+    [-681, -682],
+    [-680, -684],
+    [-680, -683],
+    [-680, -682],
+    [-680, -681],
+    [-679, -684],
+    [-679, -683],
+    [-679, -682],
+    [-679, -681],
+    [-679, -680],
+    [-678, -684],
+    [-678, -683],
+    [-678, -682],
+    [-678, -681],
+    [-678, -680],
+    [-678, -679],
+    [-677, -684],
+    [-677, -683],
+    [-677, -682],
+    [-677, -681],
+    [-677, -680],
+    [-677, -679],
+    [-677, -678],
+    [-676, -684],
+    [-676, -683],
+    [-676, -682],
+    [-676, -681],
+    [-676, -680],
+    [-676, -679],
+    [-676, -678],
+    [-676, -677],
+    [676, 677, 678, 679, 680, 681, 682, 683, 684],
+    [-692, -693],
+    [-691, -693],
+    [-691, -692],
+    [-690, -693],
+    [-690, -692],
+    [-690, -691],
+    [-689, -693],
+    [-689, -692],
+    [-689, -691],
+    [-689, -690],
+    [-688, -693],
+    [-688, -692],
+    [-688, -691],
+    [-688, -690],
+    [-688, -689],
+    [-687, -693],
+    [-687, -692],
+    [-687, -691],
+    [-687, -690],
+    [-687, -689],
+    [-687, -688],
+    [-686, -693],
+    [-686, -692],
+    [-686, -691],
+    [-686, -690],
+    [-686, -689],
+    [-686, -688],
+    [-686, -687],
+    [-685, -693],
+    [-685, -692],
+    [-685, -691],
+    [-685, -690],
+    [-685, -689],
+    [-685, -688],
+    [-685, -687],
+    [-685, -686],
+    [685, 686, 687, 688, 689, 690, 691, 692, 693],
+    [-701, -702],
+    [-700, -702],
+    [-700, -701],
+    [-699, -702],
+    [-699, -701],
+    [-699, -700],
+    [-698, -702],
+    [-698, -701],
+    [-698, -700],
+    [-698, -699],
+    [-697, -702],
+    [-697, -701],
+    [-697, -700],
+    [-697, -699],
+    [-697, -698],
+    [-696, -702],
+    [-696, -701],
+    [-696, -700],
+    [-696, -699],
+    [-696, -698],
+    [-696, -697],
+    [-695, -702],
+    [-695, -701],
+    [-695, -700],
+    [-695, -699],
+    [-695, -698],
+    [-695, -697],
+    [-695, -696],
+    [-694, -702],
+    [-694, -701],
+    [-694, -700],
+    [-694, -699],
+    [-694, -698],
+    [-694, -697],
+    [-694, -696],
+    [-694, -695],
+    [694, 695, 696, 697, 698, 699, 700, 701, 702],
+    [-710, -711],
+    [-709, -711],
+    [-709, -710],
+    [-708, -711],
+    [-708, -710],
+    [-708, -709],
+    [-707, -711],
+    [-707, -710],
+    [-707, -709],
+    [-707, -708],
+    [-706, -711],
+    [-706, -710],
+    [-706, -709],
+    [-706, -708],
+    [-706, -707],
+    [-705, -711],
+    [-705, -710],
+    [-705, -709],
+    [-705, -708],
+    [-705, -707],
+    [-705, -706],
+    [-704, -711],
+    [-704, -710],
+    [-704, -709],
+    [-704, -708],
+    [-704, -707],
+    [-704, -706],
+    [-704, -705],
+    [-703, -711],
+    [-703, -710],
+    [-703, -709],
+    [-703, -708],
+    [-703, -707],
+    [-703, -706],
+    [-703, -705],
+    [-703, -704],
+    [703, 704, 705, 706, 707, 708, 709, 710, 711],
+    [-719, -720],
+    [-718, -720],
+    [-718, -719],
+    [-717, -720],
+    [-717, -719],
+    [-717, -718],
+    [-716, -720],
+    [-716, -719],
+    [-716, -718],
+    [-716, -717],
+    [-715, -720],
+    [-715, -719],
+    [-715, -718],
+    [-715, -717],
+    [-715, -716],
+    [-714, -720],
+    [-714, -719],
+    [-714, -718],
+    [-714, -717],
+    [-714, -716],
+    [-714, -715],
+    [-713, -720],
+    [-713, -719],
+    [-713, -718],
+    [-713, -717],
+    [-713, -716],
+    [-713, -715],
+    [-713, -714],
+    [-712, -720],
+    [-712, -719],
+    [-712, -718],
+    [-712, -717],
+    [-712, -716],
+    [-712, -715],
+    [-712, -714],
+    [-712, -713],
+    [712, 713, 714, 715, 716, 717, 718, 719, 720],
+    [-728, -729],
+    [-727, -729],
+    [-727, -728],
+    [-726, -729],
+    [-726, -728],
+    [-726, -727],
+    [-725, -729],
+    [-725, -728],
+    [-725, -727],
+    [-725, -726],
+    [-724, -729],
+    [-724, -728],
+    [-724, -727],
+    [-724, -726],
+    [-724, -725],
+    [-723, -729],
+    [-723, -728],
+    [-723, -727],
+    [-723, -726],
+    [-723, -725],
+    [-723, -724],
+    [-722, -729],
+    [-722, -728],
+    [-722, -727],
+    [-722, -726],
+    [-722, -725],
+    [-722, -724],
+    [-722, -723],
+    [-721, -729],
+    [-721, -728],
+    [-721, -727],
+    [-721, -726],
+    [-721, -725],
+    [-721, -724],
+    [-721, -723],
+    [-721, -722],
+    [721, 722, 723, 724, 725, 726, 727, 728, 729],
+    [-46, -73],
+    [-46, -64],
+    [-46, -55],
+    [-37, -73],
+    [-37, -64],
+    [-37, -55],
+    [-28, -73],
+    [-28, -64],
+    [-28, -55],
+    [-19, -73],
+    [-19, -64],
+    [-19, -55],
+    [-19, -46],
+    [-19, -37],
+    [-19, -28],
+    [-10, -73],
+    [-10, -64],
+    [-10, -55],
+    [-10, -46],
+    [-10, -37],
+    [-10, -28],
+    [-1, -73],
+    [-1, -64],
+    [-1, -55],
+    [-1, -46],
+    [-1, -37],
+    [-1, -28],
+    [1, 10, 19, 28, 37, 46, 55, 64, 73],
+    [-127, -154],
+    [-127, -145],
+    [-127, -136],
+    [-118, -154],
+    [-118, -145],
+    [-118, -136],
+    [-109, -154],
+    [-109, -145],
+    [-109, -136],
+    [-100, -154],
+    [-100, -145],
+    [-100, -136],
+    [-100, -127],
+    [-100, -118],
+    [-100, -109],
+    [-91, -154],
+    [-91, -145],
+    [-91, -136],
+    [-91, -127],
+    [-91, -118],
+    [-91, -109],
+    [-82, -154],
+    [-82, -145],
+    [-82, -136],
+    [-82, -127],
+    [-82, -118],
+    [-82, -109],
+    [82, 91, 100, 109, 118, 127, 136, 145, 154],
+    [-208, -235],
+    [-208, -226],
+    [-208, -217],
+    [-199, -235],
+    [-199, -226],
+    [-199, -217],
+    [-190, -235],
+    [-190, -226],
+    [-190, -217],
+    [-181, -235],
+    [-181, -226],
+    [-181, -217],
+    [-181, -208],
+    [-181, -199],
+    [-181, -190],
+    [-172, -235],
+    [-172, -226],
+    [-172, -217],
+    [-172, -208],
+    [-172, -199],
+    [-172, -190],
+    [-163, -235],
+    [-163, -226],
+    [-163, -217],
+    [-163, -208],
+    [-163, -199],
+    [-163, -190],
+    [163, 172, 181, 190, 199, 208, 217, 226, 235],
+    [-289, -316],
+    [-289, -307],
+    [-289, -298],
+    [-280, -316],
+    [-280, -307],
+    [-280, -298],
+    [-271, -316],
+    [-271, -307],
+    [-271, -298],
+    [-262, -316],
+    [-262, -307],
+    [-262, -298],
+    [-262, -289],
+    [-262, -280],
+    [-262, -271],
+    [-253, -316],
+    [-253, -307],
+    [-253, -298],
+    [-253, -289],
+    [-253, -280],
+    [-253, -271],
+    [-244, -316],
+    [-244, -307],
+    [-244, -298],
+    [-244, -289],
+    [-244, -280],
+    [-244, -271],
+    [244, 253, 262, 271, 280, 289, 298, 307, 316],
+    [-370, -397],
+    [-370, -388],
+    [-370, -379],
+    [-361, -397],
+    [-361, -388],
+    [-361, -379],
+    [-352, -397],
+    [-352, -388],
+    [-352, -379],
+    [-343, -397],
+    [-343, -388],
+    [-343, -379],
+    [-343, -370],
+    [-343, -361],
+    [-343, -352],
+    [-334, -397],
+    [-334, -388],
+    [-334, -379],
+    [-334, -370],
+    [-334, -361],
+    [-334, -352],
+    [-325, -397],
+    [-325, -388],
+    [-325, -379],
+    [-325, -370],
+    [-325, -361],
+    [-325, -352],
+    [325, 334, 343, 352, 361, 370, 379, 388, 397],
+    [-451, -478],
+    [-451, -469],
+    [-451, -460],
+    [-442, -478],
+    [-442, -469],
+    [-442, -460],
+    [-433, -478],
+    [-433, -469],
+    [-433, -460],
+    [-424, -478],
+    [-424, -469],
+    [-424, -460],
+    [-424, -451],
+    [-424, -442],
+    [-424, -433],
+    [-415, -478],
+    [-415, -469],
+    [-415, -460],
+    [-415, -451],
+    [-415, -442],
+    [-415, -433],
+    [-406, -478],
+    [-406, -469],
+    [-406, -460],
+    [-406, -451],
+    [-406, -442],
+    [-406, -433],
+    [406, 415, 424, 433, 442, 451, 460, 469, 478],
+    [-532, -559],
+    [-532, -550],
+    [-532, -541],
+    [-523, -559],
+    [-523, -550],
+    [-523, -541],
+    [-514, -559],
+    [-514, -550],
+    [-514, -541],
+    [-505, -559],
+    [-505, -550],
+    [-505, -541],
+    [-505, -532],
+    [-505, -523],
+    [-505, -514],
+    [-496, -559],
+    [-496, -550],
+    [-496, -541],
+    [-496, -532],
+    [-496, -523],
+    [-496, -514],
+    [-487, -559],
+    [-487, -550],
+    [-487, -541],
+    [-487, -532],
+    [-487, -523],
+    [-487, -514],
+    [487, 496, 505, 514, 523, 532, 541, 550, 559],
+    [-613, -640],
+    [-613, -631],
+    [-613, -622],
+    [-604, -640],
+    [-604, -631],
+    [-604, -622],
+    [-595, -640],
+    [-595, -631],
+    [-595, -622],
+    [-586, -640],
+    [-586, -631],
+    [-586, -622],
+    [-586, -613],
+    [-586, -604],
+    [-586, -595],
+    [-577, -640],
+    [-577, -631],
+    [-577, -622],
+    [-577, -613],
+    [-577, -604],
+    [-577, -595],
+    [-568, -640],
+    [-568, -631],
+    [-568, -622],
+    [-568, -613],
+    [-568, -604],
+    [-568, -595],
+    [568, 577, 586, 595, 604, 613, 622, 631, 640],
+    [-694, -721],
+    [-694, -712],
+    [-694, -703],
+    [-685, -721],
+    [-685, -712],
+    [-685, -703],
+    [-676, -721],
+    [-676, -712],
+    [-676, -703],
+    [-667, -721],
+    [-667, -712],
+    [-667, -703],
+    [-667, -694],
+    [-667, -685],
+    [-667, -676],
+    [-658, -721],
+    [-658, -712],
+    [-658, -703],
+    [-658, -694],
+    [-658, -685],
+    [-658, -676],
+    [-649, -721],
+    [-649, -712],
+    [-649, -703],
+    [-649, -694],
+    [-649, -685],
+    [-649, -676],
+    [649, 658, 667, 676, 685, 694, 703, 712, 721],
+    [-47, -74],
+    [-47, -65],
+    [-47, -56],
+    [-38, -74],
+    [-38, -65],
+    [-38, -56],
+    [-29, -74],
+    [-29, -65],
+    [-29, -56],
+    [-20, -74],
+    [-20, -65],
+    [-20, -56],
+    [-20, -47],
+    [-20, -38],
+    [-20, -29],
+    [-11, -74],
+    [-11, -65],
+    [-11, -56],
+    [-11, -47],
+    [-11, -38],
+    [-11, -29],
+    [-2, -74],
+    [-2, -65],
+    [-2, -56],
+    [-2, -47],
+    [-2, -38],
+    [-2, -29],
+    [2, 11, 20, 29, 38, 47, 56, 65, 74],
+    [-128, -155],
+    [-128, -146],
+    [-128, -137],
+    [-119, -155],
+    [-119, -146],
+    [-119, -137],
+    [-110, -155],
+    [-110, -146],
+    [-110, -137],
+    [-101, -155],
+    [-101, -146],
+    [-101, -137],
+    [-101, -128],
+    [-101, -119],
+    [-101, -110],
+    [-92, -155],
+    [-92, -146],
+    [-92, -137],
+    [-92, -128],
+    [-92, -119],
+    [-92, -110],
+    [-83, -155],
+    [-83, -146],
+    [-83, -137],
+    [-83, -128],
+    [-83, -119],
+    [-83, -110],
+    [83, 92, 101, 110, 119, 128, 137, 146, 155],
+    [-209, -236],
+    [-209, -227],
+    [-209, -218],
+    [-200, -236],
+    [-200, -227],
+    [-200, -218],
+    [-191, -236],
+    [-191, -227],
+    [-191, -218],
+    [-182, -236],
+    [-182, -227],
+    [-182, -218],
+    [-182, -209],
+    [-182, -200],
+    [-182, -191],
+    [-173, -236],
+    [-173, -227],
+    [-173, -218],
+    [-173, -209],
+    [-173, -200],
+    [-173, -191],
+    [-164, -236],
+    [-164, -227],
+    [-164, -218],
+    [-164, -209],
+    [-164, -200],
+    [-164, -191],
+    [164, 173, 182, 191, 200, 209, 218, 227, 236],
+    [-290, -317],
+    [-290, -308],
+    [-290, -299],
+    [-281, -317],
+    [-281, -308],
+    [-281, -299],
+    [-272, -317],
+    [-272, -308],
+    [-272, -299],
+    [-263, -317],
+    [-263, -308],
+    [-263, -299],
+    [-263, -290],
+    [-263, -281],
+    [-263, -272],
+    [-254, -317],
+    [-254, -308],
+    [-254, -299],
+    [-254, -290],
+    [-254, -281],
+    [-254, -272],
+    [-245, -317],
+    [-245, -308],
+    [-245, -299],
+    [-245, -290],
+    [-245, -281],
+    [-245, -272],
+    [245, 254, 263, 272, 281, 290, 299, 308, 317],
+    [-371, -398],
+    [-371, -389],
+    [-371, -380],
+    [-362, -398],
+    [-362, -389],
+    [-362, -380],
+    [-353, -398],
+    [-353, -389],
+    [-353, -380],
+    [-344, -398],
+    [-344, -389],
+    [-344, -380],
+    [-344, -371],
+    [-344, -362],
+    [-344, -353],
+    [-335, -398],
+    [-335, -389],
+    [-335, -380],
+    [-335, -371],
+    [-335, -362],
+    [-335, -353],
+    [-326, -398],
+    [-326, -389],
+    [-326, -380],
+    [-326, -371],
+    [-326, -362],
+    [-326, -353],
+    [326, 335, 344, 353, 362, 371, 380, 389, 398],
+    [-452, -479],
+    [-452, -470],
+    [-452, -461],
+    [-443, -479],
+    [-443, -470],
+    [-443, -461],
+    [-434, -479],
+    [-434, -470],
+    [-434, -461],
+    [-425, -479],
+    [-425, -470],
+    [-425, -461],
+    [-425, -452],
+    [-425, -443],
+    [-425, -434],
+    [-416, -479],
+    [-416, -470],
+    [-416, -461],
+    [-416, -452],
+    [-416, -443],
+    [-416, -434],
+    [-407, -479],
+    [-407, -470],
+    [-407, -461],
+    [-407, -452],
+    [-407, -443],
+    [-407, -434],
+    [407, 416, 425, 434, 443, 452, 461, 470, 479],
+    [-533, -560],
+    [-533, -551],
+    [-533, -542],
+    [-524, -560],
+    [-524, -551],
+    [-524, -542],
+    [-515, -560],
+    [-515, -551],
+    [-515, -542],
+    [-506, -560],
+    [-506, -551],
+    [-506, -542],
+    [-506, -533],
+    [-506, -524],
+    [-506, -515],
+    [-497, -560],
+    [-497, -551],
+    [-497, -542],
+    [-497, -533],
+    [-497, -524],
+    [-497, -515],
+    [-488, -560],
+    [-488, -551],
+    [-488, -542],
+    [-488, -533],
+    [-488, -524],
+    [-488, -515],
+    [488, 497, 506, 515, 524, 533, 542, 551, 560],
+    [-614, -641],
+    [-614, -632],
+    [-614, -623],
+    [-605, -641],
+    [-605, -632],
+    [-605, -623],
+    [-596, -641],
+    [-596, -632],
+    [-596, -623],
+    [-587, -641],
+    [-587, -632],
+    [-587, -623],
+    [-587, -614],
+    [-587, -605],
+    [-587, -596],
+    [-578, -641],
+    [-578, -632],
+    [-578, -623],
+    [-578, -614],
+    [-578, -605],
+    [-578, -596],
+    [-569, -641],
+    [-569, -632],
+    [-569, -623],
+    [-569, -614],
+    [-569, -605],
+    [-569, -596],
+    [569, 578, 587, 596, 605, 614, 623, 632, 641],
+    [-695, -722],
+    [-695, -713],
+    [-695, -704],
+    [-686, -722],
+    [-686, -713],
+    [-686, -704],
+    [-677, -722],
+    [-677, -713],
+    [-677, -704],
+    [-668, -722],
+    [-668, -713],
+    [-668, -704],
+    [-668, -695],
+    [-668, -686],
+    [-668, -677],
+    [-659, -722],
+    [-659, -713],
+    [-659, -704],
+    [-659, -695],
+    [-659, -686],
+    [-659, -677],
+    [-650, -722],
+    [-650, -713],
+    [-650, -704],
+    [-650, -695],
+    [-650, -686],
+    [-650, -677],
+    [650, 659, 668, 677, 686, 695, 704, 713, 722],
+    [-48, -75],
+    [-48, -66],
+    [-48, -57],
+    [-39, -75],
+    [-39, -66],
+    [-39, -57],
+    [-30, -75],
+    [-30, -66],
+    [-30, -57],
+    [-21, -75],
+    [-21, -66],
+    [-21, -57],
+    [-21, -48],
+    [-21, -39],
+    [-21, -30],
+    [-12, -75],
+    [-12, -66],
+    [-12, -57],
+    [-12, -48],
+    [-12, -39],
+    [-12, -30],
+    [-3, -75],
+    [-3, -66],
+    [-3, -57],
+    [-3, -48],
+    [-3, -39],
+    [-3, -30],
+    [3, 12, 21, 30, 39, 48, 57, 66, 75],
+    [-129, -156],
+    [-129, -147],
+    [-129, -138],
+    [-120, -156],
+    [-120, -147],
+    [-120, -138],
+    [-111, -156],
+    [-111, -147],
+    [-111, -138],
+    [-102, -156],
+    [-102, -147],
+    [-102, -138],
+    [-102, -129],
+    [-102, -120],
+    [-102, -111],
+    [-93, -156],
+    [-93, -147],
+    [-93, -138],
+    [-93, -129],
+    [-93, -120],
+    [-93, -111],
+    [-84, -156],
+    [-84, -147],
+    [-84, -138],
+    [-84, -129],
+    [-84, -120],
+    [-84, -111],
+    [84, 93, 102, 111, 120, 129, 138, 147, 156],
+    [-210, -237],
+    [-210, -228],
+    [-210, -219],
+    [-201, -237],
+    [-201, -228],
+    [-201, -219],
+    [-192, -237],
+    [-192, -228],
+    [-192, -219],
+    [-183, -237],
+    [-183, -228],
+    [-183, -219],
+    [-183, -210],
+    [-183, -201],
+    [-183, -192],
+    [-174, -237],
+    [-174, -228],
+    [-174, -219],
+    [-174, -210],
+    [-174, -201],
+    [-174, -192],
+    [-165, -237],
+    [-165, -228],
+    [-165, -219],
+    [-165, -210],
+    [-165, -201],
+    [-165, -192],
+    [165, 174, 183, 192, 201, 210, 219, 228, 237],
+    [-291, -318],
+    [-291, -309],
+    [-291, -300],
+    [-282, -318],
+    [-282, -309],
+    [-282, -300],
+    [-273, -318],
+    [-273, -309],
+    [-273, -300],
+    [-264, -318],
+    [-264, -309],
+    [-264, -300],
+    [-264, -291],
+    [-264, -282],
+    [-264, -273],
+    [-255, -318],
+    [-255, -309],
+    [-255, -300],
+    [-255, -291],
+    [-255, -282],
+    [-255, -273],
+    [-246, -318],
+    [-246, -309],
+    [-246, -300],
+    [-246, -291],
+    [-246, -282],
+    [-246, -273],
+    [246, 255, 264, 273, 282, 291, 300, 309, 318],
+    [-372, -399],
+    [-372, -390],
+    [-372, -381],
+    [-363, -399],
+    [-363, -390],
+    [-363, -381],
+    [-354, -399],
+    [-354, -390],
+    [-354, -381],
+    [-345, -399],
+    [-345, -390],
+    [-345, -381],
+    [-345, -372],
+    [-345, -363],
+    [-345, -354],
+    [-336, -399],
+    [-336, -390],
+    [-336, -381],
+    [-336, -372],
+    [-336, -363],
+    [-336, -354],
+    [-327, -399],
+    [-327, -390],
+    [-327, -381],
+    [-327, -372],
+    [-327, -363],
+    [-327, -354],
+    [327, 336, 345, 354, 363, 372, 381, 390, 399],
+    [-453, -480],
+    [-453, -471],
+    [-453, -462],
+    [-444, -480],
+    [-444, -471],
+    [-444, -462],
+    [-435, -480],
+    [-435, -471],
+    [-435, -462],
+    [-426, -480],
+    [-426, -471],
+    [-426, -462],
+    [-426, -453],
+    [-426, -444],
+    [-426, -435],
+    [-417, -480],
+    [-417, -471],
+    [-417, -462],
+    [-417, -453],
+    [-417, -444],
+    [-417, -435],
+    [-408, -480],
+    [-408, -471],
+    [-408, -462],
+    [-408, -453],
+    [-408, -444],
+    [-408, -435],
+    [408, 417, 426, 435, 444, 453, 462, 471, 480],
+    [-534, -561],
+    [-534, -552],
+    [-534, -543],
+    [-525, -561],
+    [-525, -552],
+    [-525, -543],
+    [-516, -561],
+    [-516, -552],
+    [-516, -543],
+    [-507, -561],
+    [-507, -552],
+    [-507, -543],
+    [-507, -534],
+    [-507, -525],
+    [-507, -516],
+    [-498, -561],
+    [-498, -552],
+    [-498, -543],
+    [-498, -534],
+    [-498, -525],
+    [-498, -516],
+    [-489, -561],
+    [-489, -552],
+    [-489, -543],
+    [-489, -534],
+    [-489, -525],
+    [-489, -516],
+    [489, 498, 507, 516, 525, 534, 543, 552, 561],
+    [-615, -642],
+    [-615, -633],
+    [-615, -624],
+    [-606, -642],
+    [-606, -633],
+    [-606, -624],
+    [-597, -642],
+    [-597, -633],
+    [-597, -624],
+    [-588, -642],
+    [-588, -633],
+    [-588, -624],
+    [-588, -615],
+    [-588, -606],
+    [-588, -597],
+    [-579, -642],
+    [-579, -633],
+    [-579, -624],
+    [-579, -615],
+    [-579, -606],
+    [-579, -597],
+    [-570, -642],
+    [-570, -633],
+    [-570, -624],
+    [-570, -615],
+    [-570, -606],
+    [-570, -597],
+    [570, 579, 588, 597, 606, 615, 624, 633, 642],
+    [-696, -723],
+    [-696, -714],
+    [-696, -705],
+    [-687, -723],
+    [-687, -714],
+    [-687, -705],
+    [-678, -723],
+    [-678, -714],
+    [-678, -705],
+    [-669, -723],
+    [-669, -714],
+    [-669, -705],
+    [-669, -696],
+    [-669, -687],
+    [-669, -678],
+    [-660, -723],
+    [-660, -714],
+    [-660, -705],
+    [-660, -696],
+    [-660, -687],
+    [-660, -678],
+    [-651, -723],
+    [-651, -714],
+    [-651, -705],
+    [-651, -696],
+    [-651, -687],
+    [-651, -678],
+    [651, 660, 669, 678, 687, 696, 705, 714, 723],
+    [-49, -76],
+    [-49, -67],
+    [-49, -58],
+    [-40, -76],
+    [-40, -67],
+    [-40, -58],
+    [-31, -76],
+    [-31, -67],
+    [-31, -58],
+    [-22, -76],
+    [-22, -67],
+    [-22, -58],
+    [-22, -49],
+    [-22, -40],
+    [-22, -31],
+    [-13, -76],
+    [-13, -67],
+    [-13, -58],
+    [-13, -49],
+    [-13, -40],
+    [-13, -31],
+    [-4, -76],
+    [-4, -67],
+    [-4, -58],
+    [-4, -49],
+    [-4, -40],
+    [-4, -31],
+    [4, 13, 22, 31, 40, 49, 58, 67, 76],
+    [-130, -157],
+    [-130, -148],
+    [-130, -139],
+    [-121, -157],
+    [-121, -148],
+    [-121, -139],
+    [-112, -157],
+    [-112, -148],
+    [-112, -139],
+    [-103, -157],
+    [-103, -148],
+    [-103, -139],
+    [-103, -130],
+    [-103, -121],
+    [-103, -112],
+    [-94, -157],
+    [-94, -148],
+    [-94, -139],
+    [-94, -130],
+    [-94, -121],
+    [-94, -112],
+    [-85, -157],
+    [-85, -148],
+    [-85, -139],
+    [-85, -130],
+    [-85, -121],
+    [-85, -112],
+    [85, 94, 103, 112, 121, 130, 139, 148, 157],
+    [-211, -238],
+    [-211, -229],
+    [-211, -220],
+    [-202, -238],
+    [-202, -229],
+    [-202, -220],
+    [-193, -238],
+    [-193, -229],
+    [-193, -220],
+    [-184, -238],
+    [-184, -229],
+    [-184, -220],
+    [-184, -211],
+    [-184, -202],
+    [-184, -193],
+    [-175, -238],
+    [-175, -229],
+    [-175, -220],
+    [-175, -211],
+    [-175, -202],
+    [-175, -193],
+    [-166, -238],
+    [-166, -229],
+    [-166, -220],
+    [-166, -211],
+    [-166, -202],
+    [-166, -193],
+    [166, 175, 184, 193, 202, 211, 220, 229, 238],
+    [-292, -319],
+    [-292, -310],
+    [-292, -301],
+    [-283, -319],
+    [-283, -310],
+    [-283, -301],
+    [-274, -319],
+    [-274, -310],
+    [-274, -301],
+    [-265, -319],
+    [-265, -310],
+    [-265, -301],
+    [-265, -292],
+    [-265, -283],
+    [-265, -274],
+    [-256, -319],
+    [-256, -310],
+    [-256, -301],
+    [-256, -292],
+    [-256, -283],
+    [-256, -274],
+    [-247, -319],
+    [-247, -310],
+    [-247, -301],
+    [-247, -292],
+    [-247, -283],
+    [-247, -274],
+    [247, 256, 265, 274, 283, 292, 301, 310, 319],
+    [-373, -400],
+    [-373, -391],
+    [-373, -382],
+    [-364, -400],
+    [-364, -391],
+    [-364, -382],
+    [-355, -400],
+    [-355, -391],
+    [-355, -382],
+    [-346, -400],
+    [-346, -391],
+    [-346, -382],
+    [-346, -373],
+    [-346, -364],
+    [-346, -355],
+    [-337, -400],
+    [-337, -391],
+    [-337, -382],
+    [-337, -373],
+    [-337, -364],
+    [-337, -355],
+    [-328, -400],
+    [-328, -391],
+    [-328, -382],
+    [-328, -373],
+    [-328, -364],
+    [-328, -355],
+    [328, 337, 346, 355, 364, 373, 382, 391, 400],
+    [-454, -481],
+    [-454, -472],
+    [-454, -463],
+    [-445, -481],
+    [-445, -472],
+    [-445, -463],
+    [-436, -481],
+    [-436, -472],
+    [-436, -463],
+    [-427, -481],
+    [-427, -472],
+    [-427, -463],
+    [-427, -454],
+    [-427, -445],
+    [-427, -436],
+    [-418, -481],
+    [-418, -472],
+    [-418, -463],
+    [-418, -454],
+    [-418, -445],
+    [-418, -436],
+    [-409, -481],
+    [-409, -472],
+    [-409, -463],
+    [-409, -454],
+    [-409, -445],
+    [-409, -436],
+    [409, 418, 427, 436, 445, 454, 463, 472, 481],
+    [-535, -562],
+    [-535, -553],
+    [-535, -544],
+    [-526, -562],
+    [-526, -553],
+    [-526, -544],
+    [-517, -562],
+    [-517, -553],
+    [-517, -544],
+    [-508, -562],
+    [-508, -553],
+    [-508, -544],
+    [-508, -535],
+    [-508, -526],
+    [-508, -517],
+    [-499, -562],
+    [-499, -553],
+    [-499, -544],
+    [-499, -535],
+    [-499, -526],
+    [-499, -517],
+    [-490, -562],
+    [-490, -553],
+    [-490, -544],
+    [-490, -535],
+    [-490, -526],
+    [-490, -517],
+    [490, 499, 508, 517, 526, 535, 544, 553, 562],
+    [-616, -643],
+    [-616, -634],
+    [-616, -625],
+    [-607, -643],
+    [-607, -634],
+    [-607, -625],
+    [-598, -643],
+    [-598, -634],
+    [-598, -625],
+    [-589, -643],
+    [-589, -634],
+    [-589, -625],
+    [-589, -616],
+    [-589, -607],
+    [-589, -598],
+    [-580, -643],
+    [-580, -634],
+    [-580, -625],
+    [-580, -616],
+    [-580, -607],
+    [-580, -598],
+    [-571, -643],
+    [-571, -634],
+    [-571, -625],
+    [-571, -616],
+    [-571, -607],
+    [-571, -598],
+    [571, 580, 589, 598, 607, 616, 625, 634, 643],
+    [-697, -724],
+    [-697, -715],
+    [-697, -706],
+    [-688, -724],
+    [-688, -715],
+    [-688, -706],
+    [-679, -724],
+    [-679, -715],
+    [-679, -706],
+    [-670, -724],
+    [-670, -715],
+    [-670, -706],
+    [-670, -697],
+    [-670, -688],
+    [-670, -679],
+    [-661, -724],
+    [-661, -715],
+    [-661, -706],
+    [-661, -697],
+    [-661, -688],
+    [-661, -679],
+    [-652, -724],
+    [-652, -715],
+    [-652, -706],
+    [-652, -697],
+    [-652, -688],
+    [-652, -679],
+    [652, 661, 670, 679, 688, 697, 706, 715, 724],
+    [-50, -77],
+    [-50, -68],
+    [-50, -59],
+    [-41, -77],
+    [-41, -68],
+    [-41, -59],
+    [-32, -77],
+    [-32, -68],
+    [-32, -59],
+    [-23, -77],
+    [-23, -68],
+    [-23, -59],
+    [-23, -50],
+    [-23, -41],
+    [-23, -32],
+    [-14, -77],
+    [-14, -68],
+    [-14, -59],
+    [-14, -50],
+    [-14, -41],
+    [-14, -32],
+    [-5, -77],
+    [-5, -68],
+    [-5, -59],
+    [-5, -50],
+    [-5, -41],
+    [-5, -32],
+    [5, 14, 23, 32, 41, 50, 59, 68, 77],
+    [-131, -158],
+    [-131, -149],
+    [-131, -140],
+    [-122, -158],
+    [-122, -149],
+    [-122, -140],
+    [-113, -158],
+    [-113, -149],
+    [-113, -140],
+    [-104, -158],
+    [-104, -149],
+    [-104, -140],
+    [-104, -131],
+    [-104, -122],
+    [-104, -113],
+    [-95, -158],
+    [-95, -149],
+    [-95, -140],
+    [-95, -131],
+    [-95, -122],
+    [-95, -113],
+    [-86, -158],
+    [-86, -149],
+    [-86, -140],
+    [-86, -131],
+    [-86, -122],
+    [-86, -113],
+    [86, 95, 104, 113, 122, 131, 140, 149, 158],
+    [-212, -239],
+    [-212, -230],
+    [-212, -221],
+    [-203, -239],
+    [-203, -230],
+    [-203, -221],
+    [-194, -239],
+    [-194, -230],
+    [-194, -221],
+    [-185, -239],
+    [-185, -230],
+    [-185, -221],
+    [-185, -212],
+    [-185, -203],
+    [-185, -194],
+    [-176, -239],
+    [-176, -230],
+    [-176, -221],
+    [-176, -212],
+    [-176, -203],
+    [-176, -194],
+    [-167, -239],
+    [-167, -230],
+    [-167, -221],
+    [-167, -212],
+    [-167, -203],
+    [-167, -194],
+    [167, 176, 185, 194, 203, 212, 221, 230, 239],
+    [-293, -320],
+    [-293, -311],
+    [-293, -302],
+    [-284, -320],
+    [-284, -311],
+    [-284, -302],
+    [-275, -320],
+    [-275, -311],
+    [-275, -302],
+    [-266, -320],
+    [-266, -311],
+    [-266, -302],
+    [-266, -293],
+    [-266, -284],
+    [-266, -275],
+    [-257, -320],
+    [-257, -311],
+    [-257, -302],
+    [-257, -293],
+    [-257, -284],
+    [-257, -275],
+    [-248, -320],
+    [-248, -311],
+    [-248, -302],
+    [-248, -293],
+    [-248, -284],
+    [-248, -275],
+    [248, 257, 266, 275, 284, 293, 302, 311, 320],
+    [-374, -401],
+    [-374, -392],
+    [-374, -383],
+    [-365, -401],
+    [-365, -392],
+    [-365, -383],
+    [-356, -401],
+    [-356, -392],
+    [-356, -383],
+    [-347, -401],
+    [-347, -392],
+    [-347, -383],
+    [-347, -374],
+    [-347, -365],
+    [-347, -356],
+    [-338, -401],
+    [-338, -392],
+    [-338, -383],
+    [-338, -374],
+    [-338, -365],
+    [-338, -356],
+    [-329, -401],
+    [-329, -392],
+    [-329, -383],
+    [-329, -374],
+    [-329, -365],
+    [-329, -356],
+    [329, 338, 347, 356, 365, 374, 383, 392, 401],
+    [-455, -482],
+    [-455, -473],
+    [-455, -464],
+    [-446, -482],
+    [-446, -473],
+    [-446, -464],
+    [-437, -482],
+    [-437, -473],
+    [-437, -464],
+    [-428, -482],
+    [-428, -473],
+    [-428, -464],
+    [-428, -455],
+    [-428, -446],
+    [-428, -437],
+    [-419, -482],
+    [-419, -473],
+    [-419, -464],
+    [-419, -455],
+    [-419, -446],
+    [-419, -437],
+    [-410, -482],
+    [-410, -473],
+    [-410, -464],
+    [-410, -455],
+    [-410, -446],
+    [-410, -437],
+    [410, 419, 428, 437, 446, 455, 464, 473, 482],
+    [-536, -563],
+    [-536, -554],
+    [-536, -545],
+    [-527, -563],
+    [-527, -554],
+    [-527, -545],
+    [-518, -563],
+    [-518, -554],
+    [-518, -545],
+    [-509, -563],
+    [-509, -554],
+    [-509, -545],
+    [-509, -536],
+    [-509, -527],
+    [-509, -518],
+    [-500, -563],
+    [-500, -554],
+    [-500, -545],
+    [-500, -536],
+    [-500, -527],
+    [-500, -518],
+    [-491, -563],
+    [-491, -554],
+    [-491, -545],
+    [-491, -536],
+    [-491, -527],
+    [-491, -518],
+    [491, 500, 509, 518, 527, 536, 545, 554, 563],
+    [-617, -644],
+    [-617, -635],
+    [-617, -626],
+    [-608, -644],
+    [-608, -635],
+    [-608, -626],
+    [-599, -644],
+    [-599, -635],
+    [-599, -626],
+    [-590, -644],
+    [-590, -635],
+    [-590, -626],
+    [-590, -617],
+    [-590, -608],
+    [-590, -599],
+    [-581, -644],
+    [-581, -635],
+    [-581, -626],
+    [-581, -617],
+    [-581, -608],
+    [-581, -599],
+    [-572, -644],
+    [-572, -635],
+    [-572, -626],
+    [-572, -617],
+    [-572, -608],
+    [-572, -599],
+    [572, 581, 590, 599, 608, 617, 626, 635, 644],
+    [-698, -725],
+    [-698, -716],
+    [-698, -707],
+    [-689, -725],
+    [-689, -716],
+    [-689, -707],
+    [-680, -725],
+    [-680, -716],
+    [-680, -707],
+    [-671, -725],
+    [-671, -716],
+    [-671, -707],
+    [-671, -698],
+    [-671, -689],
+    [-671, -680],
+    [-662, -725],
+    [-662, -716],
+    [-662, -707],
+    [-662, -698],
+    [-662, -689],
+    [-662, -680],
+    [-653, -725],
+    [-653, -716],
+    [-653, -707],
+    [-653, -698],
+    [-653, -689],
+    [-653, -680],
+    [653, 662, 671, 680, 689, 698, 707, 716, 725],
+    [-51, -78],
+    [-51, -69],
+    [-51, -60],
+    [-42, -78],
+    [-42, -69],
+    [-42, -60],
+    [-33, -78],
+    [-33, -69],
+    [-33, -60],
+    [-24, -78],
+    [-24, -69],
+    [-24, -60],
+    [-24, -51],
+    [-24, -42],
+    [-24, -33],
+    [-15, -78],
+    [-15, -69],
+    [-15, -60],
+    [-15, -51],
+    [-15, -42],
+    [-15, -33],
+    [-6, -78],
+    [-6, -69],
+    [-6, -60],
+    [-6, -51],
+    [-6, -42],
+    [-6, -33],
+    [6, 15, 24, 33, 42, 51, 60, 69, 78],
+    [-132, -159],
+    [-132, -150],
+    [-132, -141],
+    [-123, -159],
+    [-123, -150],
+    [-123, -141],
+    [-114, -159],
+    [-114, -150],
+    [-114, -141],
+    [-105, -159],
+    [-105, -150],
+    [-105, -141],
+    [-105, -132],
+    [-105, -123],
+    [-105, -114],
+    [-96, -159],
+    [-96, -150],
+    [-96, -141],
+    [-96, -132],
+    [-96, -123],
+    [-96, -114],
+    [-87, -159],
+    [-87, -150],
+    [-87, -141],
+    [-87, -132],
+    [-87, -123],
+    [-87, -114],
+    [87, 96, 105, 114, 123, 132, 141, 150, 159],
+    [-213, -240],
+    [-213, -231],
+    [-213, -222],
+    [-204, -240],
+    [-204, -231],
+    [-204, -222],
+    [-195, -240],
+    [-195, -231],
+    [-195, -222],
+    [-186, -240],
+    [-186, -231],
+    [-186, -222],
+    [-186, -213],
+    [-186, -204],
+    [-186, -195],
+    [-177, -240],
+    [-177, -231],
+    [-177, -222],
+    [-177, -213],
+    [-177, -204],
+    [-177, -195],
+    [-168, -240],
+    [-168, -231],
+    [-168, -222],
+    [-168, -213],
+    [-168, -204],
+    [-168, -195],
+    [168, 177, 186, 195, 204, 213, 222, 231, 240],
+    [-294, -321],
+    [-294, -312],
+    [-294, -303],
+    [-285, -321],
+    [-285, -312],
+    [-285, -303],
+    [-276, -321],
+    [-276, -312],
+    [-276, -303],
+    [-267, -321],
+    [-267, -312],
+    [-267, -303],
+    [-267, -294],
+    [-267, -285],
+    [-267, -276],
+    [-258, -321],
+    [-258, -312],
+    [-258, -303],
+    [-258, -294],
+    [-258, -285],
+    [-258, -276],
+    [-249, -321],
+    [-249, -312],
+    [-249, -303],
+    [-249, -294],
+    [-249, -285],
+    [-249, -276],
+    [249, 258, 267, 276, 285, 294, 303, 312, 321],
+    [-375, -402],
+    [-375, -393],
+    [-375, -384],
+    [-366, -402],
+    [-366, -393],
+    [-366, -384],
+    [-357, -402],
+    [-357, -393],
+    [-357, -384],
+    [-348, -402],
+    [-348, -393],
+    [-348, -384],
+    [-348, -375],
+    [-348, -366],
+    [-348, -357],
+    [-339, -402],
+    [-339, -393],
+    [-339, -384],
+    [-339, -375],
+    [-339, -366],
+    [-339, -357],
+    [-330, -402],
+    [-330, -393],
+    [-330, -384],
+    [-330, -375],
+    [-330, -366],
+    [-330, -357],
+    [330, 339, 348, 357, 366, 375, 384, 393, 402],
+    [-456, -483],
+    [-456, -474],
+    [-456, -465],
+    [-447, -483],
+    [-447, -474],
+    [-447, -465],
+    [-438, -483],
+    [-438, -474],
+    [-438, -465],
+    [-429, -483],
+    [-429, -474],
+    [-429, -465],
+    [-429, -456],
+    [-429, -447],
+    [-429, -438],
+    [-420, -483],
+    [-420, -474],
+    [-420, -465],
+    [-420, -456],
+    [-420, -447],
+    [-420, -438],
+    [-411, -483],
+    [-411, -474],
+    [-411, -465],
+    [-411, -456],
+    [-411, -447],
+    [-411, -438],
+    [411, 420, 429, 438, 447, 456, 465, 474, 483],
+    [-537, -564],
+    [-537, -555],
+    [-537, -546],
+    [-528, -564],
+    [-528, -555],
+    [-528, -546],
+    [-519, -564],
+    [-519, -555],
+    [-519, -546],
+    [-510, -564],
+    [-510, -555],
+    [-510, -546],
+    [-510, -537],
+    [-510, -528],
+    [-510, -519],
+    [-501, -564],
+    [-501, -555],
+    [-501, -546],
+    [-501, -537],
+    [-501, -528],
+    [-501, -519],
+    [-492, -564],
+    [-492, -555],
+    [-492, -546],
+    [-492, -537],
+    [-492, -528],
+    [-492, -519],
+    [492, 501, 510, 519, 528, 537, 546, 555, 564],
+    [-618, -645],
+    [-618, -636],
+    [-618, -627],
+    [-609, -645],
+    [-609, -636],
+    [-609, -627],
+    [-600, -645],
+    [-600, -636],
+    [-600, -627],
+    [-591, -645],
+    [-591, -636],
+    [-591, -627],
+    [-591, -618],
+    [-591, -609],
+    [-591, -600],
+    [-582, -645],
+    [-582, -636],
+    [-582, -627],
+    [-582, -618],
+    [-582, -609],
+    [-582, -600],
+    [-573, -645],
+    [-573, -636],
+    [-573, -627],
+    [-573, -618],
+    [-573, -609],
+    [-573, -600],
+    [573, 582, 591, 600, 609, 618, 627, 636, 645],
+    [-699, -726],
+    [-699, -717],
+    [-699, -708],
+    [-690, -726],
+    [-690, -717],
+    [-690, -708],
+    [-681, -726],
+    [-681, -717],
+    [-681, -708],
+    [-672, -726],
+    [-672, -717],
+    [-672, -708],
+    [-672, -699],
+    [-672, -690],
+    [-672, -681],
+    [-663, -726],
+    [-663, -717],
+    [-663, -708],
+    [-663, -699],
+    [-663, -690],
+    [-663, -681],
+    [-654, -726],
+    [-654, -717],
+    [-654, -708],
+    [-654, -699],
+    [-654, -690],
+    [-654, -681],
+    [654, 663, 672, 681, 690, 699, 708, 717, 726],
+    [-52, -79],
+    [-52, -70],
+    [-52, -61],
+    [-43, -79],
+    [-43, -70],
+    [-43, -61],
+    [-34, -79],
+    [-34, -70],
+    [-34, -61],
+    [-25, -79],
+    [-25, -70],
+    [-25, -61],
+    [-25, -52],
+    [-25, -43],
+    [-25, -34],
+    [-16, -79],
+    [-16, -70],
+    [-16, -61],
+    [-16, -52],
+    [-16, -43],
+    [-16, -34],
+    [-7, -79],
+    [-7, -70],
+    [-7, -61],
+    [-7, -52],
+    [-7, -43],
+    [-7, -34],
+    [7, 16, 25, 34, 43, 52, 61, 70, 79],
+    [-133, -160],
+    [-133, -151],
+    [-133, -142],
+    [-124, -160],
+    [-124, -151],
+    [-124, -142],
+    [-115, -160],
+    [-115, -151],
+    [-115, -142],
+    [-106, -160],
+    [-106, -151],
+    [-106, -142],
+    [-106, -133],
+    [-106, -124],
+    [-106, -115],
+    [-97, -160],
+    [-97, -151],
+    [-97, -142],
+    [-97, -133],
+    [-97, -124],
+    [-97, -115],
+    [-88, -160],
+    [-88, -151],
+    [-88, -142],
+    [-88, -133],
+    [-88, -124],
+    [-88, -115],
+    [88, 97, 106, 115, 124, 133, 142, 151, 160],
+    [-214, -241],
+    [-214, -232],
+    [-214, -223],
+    [-205, -241],
+    [-205, -232],
+    [-205, -223],
+    [-196, -241],
+    [-196, -232],
+    [-196, -223],
+    [-187, -241],
+    [-187, -232],
+    [-187, -223],
+    [-187, -214],
+    [-187, -205],
+    [-187, -196],
+    [-178, -241],
+    [-178, -232],
+    [-178, -223],
+    [-178, -214],
+    [-178, -205],
+    [-178, -196],
+    [-169, -241],
+    [-169, -232],
+    [-169, -223],
+    [-169, -214],
+    [-169, -205],
+    [-169, -196],
+    [169, 178, 187, 196, 205, 214, 223, 232, 241],
+    [-295, -322],
+    [-295, -313],
+    [-295, -304],
+    [-286, -322],
+    [-286, -313],
+    [-286, -304],
+    [-277, -322],
+    [-277, -313],
+    [-277, -304],
+    [-268, -322],
+    [-268, -313],
+    [-268, -304],
+    [-268, -295],
+    [-268, -286],
+    [-268, -277],
+    [-259, -322],
+    [-259, -313],
+    [-259, -304],
+    [-259, -295],
+    [-259, -286],
+    [-259, -277],
+    [-250, -322],
+    [-250, -313],
+    [-250, -304],
+    [-250, -295],
+    [-250, -286],
+    [-250, -277],
+    [250, 259, 268, 277, 286, 295, 304, 313, 322],
+    [-376, -403],
+    [-376, -394],
+    [-376, -385],
+    [-367, -403],
+    [-367, -394],
+    [-367, -385],
+    [-358, -403],
+    [-358, -394],
+    [-358, -385],
+    [-349, -403],
+    [-349, -394],
+    [-349, -385],
+    [-349, -376],
+    [-349, -367],
+    [-349, -358],
+    [-340, -403],
+    [-340, -394],
+    [-340, -385],
+    [-340, -376],
+    [-340, -367],
+    [-340, -358],
+    [-331, -403],
+    [-331, -394],
+    [-331, -385],
+    [-331, -376],
+    [-331, -367],
+    [-331, -358],
+    [331, 340, 349, 358, 367, 376, 385, 394, 403],
+    [-457, -484],
+    [-457, -475],
+    [-457, -466],
+    [-448, -484],
+    [-448, -475],
+    [-448, -466],
+    [-439, -484],
+    [-439, -475],
+    [-439, -466],
+    [-430, -484],
+    [-430, -475],
+    [-430, -466],
+    [-430, -457],
+    [-430, -448],
+    [-430, -439],
+    [-421, -484],
+    [-421, -475],
+    [-421, -466],
+    [-421, -457],
+    [-421, -448],
+    [-421, -439],
+    [-412, -484],
+    [-412, -475],
+    [-412, -466],
+    [-412, -457],
+    [-412, -448],
+    [-412, -439],
+    [412, 421, 430, 439, 448, 457, 466, 475, 484],
+    [-538, -565],
+    [-538, -556],
+    [-538, -547],
+    [-529, -565],
+    [-529, -556],
+    [-529, -547],
+    [-520, -565],
+    [-520, -556],
+    [-520, -547],
+    [-511, -565],
+    [-511, -556],
+    [-511, -547],
+    [-511, -538],
+    [-511, -529],
+    [-511, -520],
+    [-502, -565],
+    [-502, -556],
+    [-502, -547],
+    [-502, -538],
+    [-502, -529],
+    [-502, -520],
+    [-493, -565],
+    [-493, -556],
+    [-493, -547],
+    [-493, -538],
+    [-493, -529],
+    [-493, -520],
+    [493, 502, 511, 520, 529, 538, 547, 556, 565],
+    [-619, -646],
+    [-619, -637],
+    [-619, -628],
+    [-610, -646],
+    [-610, -637],
+    [-610, -628],
+    [-601, -646],
+    [-601, -637],
+    [-601, -628],
+    [-592, -646],
+    [-592, -637],
+    [-592, -628],
+    [-592, -619],
+    [-592, -610],
+    [-592, -601],
+    [-583, -646],
+    [-583, -637],
+    [-583, -628],
+    [-583, -619],
+    [-583, -610],
+    [-583, -601],
+    [-574, -646],
+    [-574, -637],
+    [-574, -628],
+    [-574, -619],
+    [-574, -610],
+    [-574, -601],
+    [574, 583, 592, 601, 610, 619, 628, 637, 646],
+    [-700, -727],
+    [-700, -718],
+    [-700, -709],
+    [-691, -727],
+    [-691, -718],
+    [-691, -709],
+    [-682, -727],
+    [-682, -718],
+    [-682, -709],
+    [-673, -727],
+    [-673, -718],
+    [-673, -709],
+    [-673, -700],
+    [-673, -691],
+    [-673, -682],
+    [-664, -727],
+    [-664, -718],
+    [-664, -709],
+    [-664, -700],
+    [-664, -691],
+    [-664, -682],
+    [-655, -727],
+    [-655, -718],
+    [-655, -709],
+    [-655, -700],
+    [-655, -691],
+    [-655, -682],
+    [655, 664, 673, 682, 691, 700, 709, 718, 727],
+    [-53, -80],
+    [-53, -71],
+    [-53, -62],
+    [-44, -80],
+    [-44, -71],
+    [-44, -62],
+    [-35, -80],
+    [-35, -71],
+    [-35, -62],
+    [-26, -80],
+    [-26, -71],
+    [-26, -62],
+    [-26, -53],
+    [-26, -44],
+    [-26, -35],
+    [-17, -80],
+    [-17, -71],
+    [-17, -62],
+    [-17, -53],
+    [-17, -44],
+    [-17, -35],
+    [-8, -80],
+    [-8, -71],
+    [-8, -62],
+    [-8, -53],
+    [-8, -44],
+    [-8, -35],
+    [8, 17, 26, 35, 44, 53, 62, 71, 80],
+    [-134, -161],
+    [-134, -152],
+    [-134, -143],
+    [-125, -161],
+    [-125, -152],
+    [-125, -143],
+    [-116, -161],
+    [-116, -152],
+    [-116, -143],
+    [-107, -161],
+    [-107, -152],
+    [-107, -143],
+    [-107, -134],
+    [-107, -125],
+    [-107, -116],
+    [-98, -161],
+    [-98, -152],
+    [-98, -143],
+    [-98, -134],
+    [-98, -125],
+    [-98, -116],
+    [-89, -161],
+    [-89, -152],
+    [-89, -143],
+    [-89, -134],
+    [-89, -125],
+    [-89, -116],
+    [89, 98, 107, 116, 125, 134, 143, 152, 161],
+    [-215, -242],
+    [-215, -233],
+    [-215, -224],
+    [-206, -242],
+    [-206, -233],
+    [-206, -224],
+    [-197, -242],
+    [-197, -233],
+    [-197, -224],
+    [-188, -242],
+    [-188, -233],
+    [-188, -224],
+    [-188, -215],
+    [-188, -206],
+    [-188, -197],
+    [-179, -242],
+    [-179, -233],
+    [-179, -224],
+    [-179, -215],
+    [-179, -206],
+    [-179, -197],
+    [-170, -242],
+    [-170, -233],
+    [-170, -224],
+    [-170, -215],
+    [-170, -206],
+    [-170, -197],
+    [170, 179, 188, 197, 206, 215, 224, 233, 242],
+    [-296, -323],
+    [-296, -314],
+    [-296, -305],
+    [-287, -323],
+    [-287, -314],
+    [-287, -305],
+    [-278, -323],
+    [-278, -314],
+    [-278, -305],
+    [-269, -323],
+    [-269, -314],
+    [-269, -305],
+    [-269, -296],
+    [-269, -287],
+    [-269, -278],
+    [-260, -323],
+    [-260, -314],
+    [-260, -305],
+    [-260, -296],
+    [-260, -287],
+    [-260, -278],
+    [-251, -323],
+    [-251, -314],
+    [-251, -305],
+    [-251, -296],
+    [-251, -287],
+    [-251, -278],
+    [251, 260, 269, 278, 287, 296, 305, 314, 323],
+    [-377, -404],
+    [-377, -395],
+    [-377, -386],
+    [-368, -404],
+    [-368, -395],
+    [-368, -386],
+    [-359, -404],
+    [-359, -395],
+    [-359, -386],
+    [-350, -404],
+    [-350, -395],
+    [-350, -386],
+    [-350, -377],
+    [-350, -368],
+    [-350, -359],
+    [-341, -404],
+    [-341, -395],
+    [-341, -386],
+    [-341, -377],
+    [-341, -368],
+    [-341, -359],
+    [-332, -404],
+    [-332, -395],
+    [-332, -386],
+    [-332, -377],
+    [-332, -368],
+    [-332, -359],
+    [332, 341, 350, 359, 368, 377, 386, 395, 404],
+    [-458, -485],
+    [-458, -476],
+    [-458, -467],
+    [-449, -485],
+    [-449, -476],
+    [-449, -467],
+    [-440, -485],
+    [-440, -476],
+    [-440, -467],
+    [-431, -485],
+    [-431, -476],
+    [-431, -467],
+    [-431, -458],
+    [-431, -449],
+    [-431, -440],
+    [-422, -485],
+    [-422, -476],
+    [-422, -467],
+    [-422, -458],
+    [-422, -449],
+    [-422, -440],
+    [-413, -485],
+    [-413, -476],
+    [-413, -467],
+    [-413, -458],
+    [-413, -449],
+    [-413, -440],
+    [413, 422, 431, 440, 449, 458, 467, 476, 485],
+    [-539, -566],
+    [-539, -557],
+    [-539, -548],
+    [-530, -566],
+    [-530, -557],
+    [-530, -548],
+    [-521, -566],
+    [-521, -557],
+    [-521, -548],
+    [-512, -566],
+    [-512, -557],
+    [-512, -548],
+    [-512, -539],
+    [-512, -530],
+    [-512, -521],
+    [-503, -566],
+    [-503, -557],
+    [-503, -548],
+    [-503, -539],
+    [-503, -530],
+    [-503, -521],
+    [-494, -566],
+    [-494, -557],
+    [-494, -548],
+    [-494, -539],
+    [-494, -530],
+    [-494, -521],
+    [494, 503, 512, 521, 530, 539, 548, 557, 566],
+    [-620, -647],
+    [-620, -638],
+    [-620, -629],
+    [-611, -647],
+    [-611, -638],
+    [-611, -629],
+    [-602, -647],
+    [-602, -638],
+    [-602, -629],
+    [-593, -647],
+    [-593, -638],
+    [-593, -629],
+    [-593, -620],
+    [-593, -611],
+    [-593, -602],
+    [-584, -647],
+    [-584, -638],
+    [-584, -629],
+    [-584, -620],
+    [-584, -611],
+    [-584, -602],
+    [-575, -647],
+    [-575, -638],
+    [-575, -629],
+    [-575, -620],
+    [-575, -611],
+    [-575, -602],
+    [575, 584, 593, 602, 611, 620, 629, 638, 647],
+    [-701, -728],
+    [-701, -719],
+    [-701, -710],
+    [-692, -728],
+    [-692, -719],
+    [-692, -710],
+    [-683, -728],
+    [-683, -719],
+    [-683, -710],
+    [-674, -728],
+    [-674, -719],
+    [-674, -710],
+    [-674, -701],
+    [-674, -692],
+    [-674, -683],
+    [-665, -728],
+    [-665, -719],
+    [-665, -710],
+    [-665, -701],
+    [-665, -692],
+    [-665, -683],
+    [-656, -728],
+    [-656, -719],
+    [-656, -710],
+    [-656, -701],
+    [-656, -692],
+    [-656, -683],
+    [656, 665, 674, 683, 692, 701, 710, 719, 728],
+    [-54, -81],
+    [-54, -72],
+    [-54, -63],
+    [-45, -81],
+    [-45, -72],
+    [-45, -63],
+    [-36, -81],
+    [-36, -72],
+    [-36, -63],
+    [-27, -81],
+    [-27, -72],
+    [-27, -63],
+    [-27, -54],
+    [-27, -45],
+    [-27, -36],
+    [-18, -81],
+    [-18, -72],
+    [-18, -63],
+    [-18, -54],
+    [-18, -45],
+    [-18, -36],
+    [-9, -81],
+    [-9, -72],
+    [-9, -63],
+    [-9, -54],
+    [-9, -45],
+    [-9, -36],
+    [9, 18, 27, 36, 45, 54, 63, 72, 81],
+    [-135, -162],
+    [-135, -153],
+    [-135, -144],
+    [-126, -162],
+    [-126, -153],
+    [-126, -144],
+    [-117, -162],
+    [-117, -153],
+    [-117, -144],
+    [-108, -162],
+    [-108, -153],
+    [-108, -144],
+    [-108, -135],
+    [-108, -126],
+    [-108, -117],
+    [-99, -162],
+    [-99, -153],
+    [-99, -144],
+    [-99, -135],
+    [-99, -126],
+    [-99, -117],
+    [-90, -162],
+    [-90, -153],
+    [-90, -144],
+    [-90, -135],
+    [-90, -126],
+    [-90, -117],
+    [90, 99, 108, 117, 126, 135, 144, 153, 162],
+    [-216, -243],
+    [-216, -234],
+    [-216, -225],
+    [-207, -243],
+    [-207, -234],
+    [-207, -225],
+    [-198, -243],
+    [-198, -234],
+    [-198, -225],
+    [-189, -243],
+    [-189, -234],
+    [-189, -225],
+    [-189, -216],
+    [-189, -207],
+    [-189, -198],
+    [-180, -243],
+    [-180, -234],
+    [-180, -225],
+    [-180, -216],
+    [-180, -207],
+    [-180, -198],
+    [-171, -243],
+    [-171, -234],
+    [-171, -225],
+    [-171, -216],
+    [-171, -207],
+    [-171, -198],
+    [171, 180, 189, 198, 207, 216, 225, 234, 243],
+    [-297, -324],
+    [-297, -315],
+    [-297, -306],
+    [-288, -324],
+    [-288, -315],
+    [-288, -306],
+    [-279, -324],
+    [-279, -315],
+    [-279, -306],
+    [-270, -324],
+    [-270, -315],
+    [-270, -306],
+    [-270, -297],
+    [-270, -288],
+    [-270, -279],
+    [-261, -324],
+    [-261, -315],
+    [-261, -306],
+    [-261, -297],
+    [-261, -288],
+    [-261, -279],
+    [-252, -324],
+    [-252, -315],
+    [-252, -306],
+    [-252, -297],
+    [-252, -288],
+    [-252, -279],
+    [252, 261, 270, 279, 288, 297, 306, 315, 324],
+    [-378, -405],
+    [-378, -396],
+    [-378, -387],
+    [-369, -405],
+    [-369, -396],
+    [-369, -387],
+    [-360, -405],
+    [-360, -396],
+    [-360, -387],
+    [-351, -405],
+    [-351, -396],
+    [-351, -387],
+    [-351, -378],
+    [-351, -369],
+    [-351, -360],
+    [-342, -405],
+    [-342, -396],
+    [-342, -387],
+    [-342, -378],
+    [-342, -369],
+    [-342, -360],
+    [-333, -405],
+    [-333, -396],
+    [-333, -387],
+    [-333, -378],
+    [-333, -369],
+    [-333, -360],
+    [333, 342, 351, 360, 369, 378, 387, 396, 405],
+    [-459, -486],
+    [-459, -477],
+    [-459, -468],
+    [-450, -486],
+    [-450, -477],
+    [-450, -468],
+    [-441, -486],
+    [-441, -477],
+    [-441, -468],
+    [-432, -486],
+    [-432, -477],
+    [-432, -468],
+    [-432, -459],
+    [-432, -450],
+    [-432, -441],
+    [-423, -486],
+    [-423, -477],
+    [-423, -468],
+    [-423, -459],
+    [-423, -450],
+    [-423, -441],
+    [-414, -486],
+    [-414, -477],
+    [-414, -468],
+    [-414, -459],
+    [-414, -450],
+    [-414, -441],
+    [414, 423, 432, 441, 450, 459, 468, 477, 486],
+    [-540, -567],
+    [-540, -558],
+    [-540, -549],
+    [-531, -567],
+    [-531, -558],
+    [-531, -549],
+    [-522, -567],
+    [-522, -558],
+    [-522, -549],
+    [-513, -567],
+    [-513, -558],
+    [-513, -549],
+    [-513, -540],
+    [-513, -531],
+    [-513, -522],
+    [-504, -567],
+    [-504, -558],
+    [-504, -549],
+    [-504, -540],
+    [-504, -531],
+    [-504, -522],
+    [-495, -567],
+    [-495, -558],
+    [-495, -549],
+    [-495, -540],
+    [-495, -531],
+    [-495, -522],
+    [495, 504, 513, 522, 531, 540, 549, 558, 567],
+    [-621, -648],
+    [-621, -639],
+    [-621, -630],
+    [-612, -648],
+    [-612, -639],
+    [-612, -630],
+    [-603, -648],
+    [-603, -639],
+    [-603, -630],
+    [-594, -648],
+    [-594, -639],
+    [-594, -630],
+    [-594, -621],
+    [-594, -612],
+    [-594, -603],
+    [-585, -648],
+    [-585, -639],
+    [-585, -630],
+    [-585, -621],
+    [-585, -612],
+    [-585, -603],
+    [-576, -648],
+    [-576, -639],
+    [-576, -630],
+    [-576, -621],
+    [-576, -612],
+    [-576, -603],
+    [576, 585, 594, 603, 612, 621, 630, 639, 648],
+    [-702, -729],
+    [-702, -720],
+    [-702, -711],
+    [-693, -729],
+    [-693, -720],
+    [-693, -711],
+    [-684, -729],
+    [-684, -720],
+    [-684, -711],
+    [-675, -729],
+    [-675, -720],
+    [-675, -711],
+    [-675, -702],
+    [-675, -693],
+    [-675, -684],
+    [-666, -729],
+    [-666, -720],
+    [-666, -711],
+    [-666, -702],
+    [-666, -693],
+    [-666, -684],
+    [-657, -729],
+    [-657, -720],
+    [-657, -711],
+    [-657, -702],
+    [-657, -693],
+    [-657, -684],
+    [657, 666, 675, 684, 693, 702, 711, 720, 729],
+    [-406, -649],
+    [-406, -568],
+    [-406, -487],
+    [-325, -649],
+    [-325, -568],
+    [-325, -487],
+    [-244, -649],
+    [-244, -568],
+    [-244, -487],
+    [-163, -649],
+    [-163, -568],
+    [-163, -487],
+    [-163, -406],
+    [-163, -325],
+    [-163, -244],
+    [-82, -649],
+    [-82, -568],
+    [-82, -487],
+    [-82, -406],
+    [-82, -325],
+    [-82, -244],
+    [-1, -649],
+    [-1, -568],
+    [-1, -487],
+    [-1, -406],
+    [-1, -325],
+    [-1, -244],
+    [1, 82, 163, 244, 325, 406, 487, 568, 649],
+    [-415, -658],
+    [-415, -577],
+    [-415, -496],
+    [-334, -658],
+    [-334, -577],
+    [-334, -496],
+    [-253, -658],
+    [-253, -577],
+    [-253, -496],
+    [-172, -658],
+    [-172, -577],
+    [-172, -496],
+    [-172, -415],
+    [-172, -334],
+    [-172, -253],
+    [-91, -658],
+    [-91, -577],
+    [-91, -496],
+    [-91, -415],
+    [-91, -334],
+    [-91, -253],
+    [-10, -658],
+    [-10, -577],
+    [-10, -496],
+    [-10, -415],
+    [-10, -334],
+    [-10, -253],
+    [10, 91, 172, 253, 334, 415, 496, 577, 658],
+    [-424, -667],
+    [-424, -586],
+    [-424, -505],
+    [-343, -667],
+    [-343, -586],
+    [-343, -505],
+    [-262, -667],
+    [-262, -586],
+    [-262, -505],
+    [-181, -667],
+    [-181, -586],
+    [-181, -505],
+    [-181, -424],
+    [-181, -343],
+    [-181, -262],
+    [-100, -667],
+    [-100, -586],
+    [-100, -505],
+    [-100, -424],
+    [-100, -343],
+    [-100, -262],
+    [-19, -667],
+    [-19, -586],
+    [-19, -505],
+    [-19, -424],
+    [-19, -343],
+    [-19, -262],
+    [19, 100, 181, 262, 343, 424, 505, 586, 667],
+    [-433, -676],
+    [-433, -595],
+    [-433, -514],
+    [-352, -676],
+    [-352, -595],
+    [-352, -514],
+    [-271, -676],
+    [-271, -595],
+    [-271, -514],
+    [-190, -676],
+    [-190, -595],
+    [-190, -514],
+    [-190, -433],
+    [-190, -352],
+    [-190, -271],
+    [-109, -676],
+    [-109, -595],
+    [-109, -514],
+    [-109, -433],
+    [-109, -352],
+    [-109, -271],
+    [-28, -676],
+    [-28, -595],
+    [-28, -514],
+    [-28, -433],
+    [-28, -352],
+    [-28, -271],
+    [28, 109, 190, 271, 352, 433, 514, 595, 676],
+    [-442, -685],
+    [-442, -604],
+    [-442, -523],
+    [-361, -685],
+    [-361, -604],
+    [-361, -523],
+    [-280, -685],
+    [-280, -604],
+    [-280, -523],
+    [-199, -685],
+    [-199, -604],
+    [-199, -523],
+    [-199, -442],
+    [-199, -361],
+    [-199, -280],
+    [-118, -685],
+    [-118, -604],
+    [-118, -523],
+    [-118, -442],
+    [-118, -361],
+    [-118, -280],
+    [-37, -685],
+    [-37, -604],
+    [-37, -523],
+    [-37, -442],
+    [-37, -361],
+    [-37, -280],
+    [37, 118, 199, 280, 361, 442, 523, 604, 685],
+    [-451, -694],
+    [-451, -613],
+    [-451, -532],
+    [-370, -694],
+    [-370, -613],
+    [-370, -532],
+    [-289, -694],
+    [-289, -613],
+    [-289, -532],
+    [-208, -694],
+    [-208, -613],
+    [-208, -532],
+    [-208, -451],
+    [-208, -370],
+    [-208, -289],
+    [-127, -694],
+    [-127, -613],
+    [-127, -532],
+    [-127, -451],
+    [-127, -370],
+    [-127, -289],
+    [-46, -694],
+    [-46, -613],
+    [-46, -532],
+    [-46, -451],
+    [-46, -370],
+    [-46, -289],
+    [46, 127, 208, 289, 370, 451, 532, 613, 694],
+    [-460, -703],
+    [-460, -622],
+    [-460, -541],
+    [-379, -703],
+    [-379, -622],
+    [-379, -541],
+    [-298, -703],
+    [-298, -622],
+    [-298, -541],
+    [-217, -703],
+    [-217, -622],
+    [-217, -541],
+    [-217, -460],
+    [-217, -379],
+    [-217, -298],
+    [-136, -703],
+    [-136, -622],
+    [-136, -541],
+    [-136, -460],
+    [-136, -379],
+    [-136, -298],
+    [-55, -703],
+    [-55, -622],
+    [-55, -541],
+    [-55, -460],
+    [-55, -379],
+    [-55, -298],
+    [55, 136, 217, 298, 379, 460, 541, 622, 703],
+    [-469, -712],
+    [-469, -631],
+    [-469, -550],
+    [-388, -712],
+    [-388, -631],
+    [-388, -550],
+    [-307, -712],
+    [-307, -631],
+    [-307, -550],
+    [-226, -712],
+    [-226, -631],
+    [-226, -550],
+    [-226, -469],
+    [-226, -388],
+    [-226, -307],
+    [-145, -712],
+    [-145, -631],
+    [-145, -550],
+    [-145, -469],
+    [-145, -388],
+    [-145, -307],
+    [-64, -712],
+    [-64, -631],
+    [-64, -550],
+    [-64, -469],
+    [-64, -388],
+    [-64, -307],
+    [64, 145, 226, 307, 388, 469, 550, 631, 712],
+    [-478, -721],
+    [-478, -640],
+    [-478, -559],
+    [-397, -721],
+    [-397, -640],
+    [-397, -559],
+    [-316, -721],
+    [-316, -640],
+    [-316, -559],
+    [-235, -721],
+    [-235, -640],
+    [-235, -559],
+    [-235, -478],
+    [-235, -397],
+    [-235, -316],
+    [-154, -721],
+    [-154, -640],
+    [-154, -559],
+    [-154, -478],
+    [-154, -397],
+    [-154, -316],
+    [-73, -721],
+    [-73, -640],
+    [-73, -559],
+    [-73, -478],
+    [-73, -397],
+    [-73, -316],
+    [73, 154, 235, 316, 397, 478, 559, 640, 721],
+    [-407, -650],
+    [-407, -569],
+    [-407, -488],
+    [-326, -650],
+    [-326, -569],
+    [-326, -488],
+    [-245, -650],
+    [-245, -569],
+    [-245, -488],
+    [-164, -650],
+    [-164, -569],
+    [-164, -488],
+    [-164, -407],
+    [-164, -326],
+    [-164, -245],
+    [-83, -650],
+    [-83, -569],
+    [-83, -488],
+    [-83, -407],
+    [-83, -326],
+    [-83, -245],
+    [-2, -650],
+    [-2, -569],
+    [-2, -488],
+    [-2, -407],
+    [-2, -326],
+    [-2, -245],
+    [2, 83, 164, 245, 326, 407, 488, 569, 650],
+    [-416, -659],
+    [-416, -578],
+    [-416, -497],
+    [-335, -659],
+    [-335, -578],
+    [-335, -497],
+    [-254, -659],
+    [-254, -578],
+    [-254, -497],
+    [-173, -659],
+    [-173, -578],
+    [-173, -497],
+    [-173, -416],
+    [-173, -335],
+    [-173, -254],
+    [-92, -659],
+    [-92, -578],
+    [-92, -497],
+    [-92, -416],
+    [-92, -335],
+    [-92, -254],
+    [-11, -659],
+    [-11, -578],
+    [-11, -497],
+    [-11, -416],
+    [-11, -335],
+    [-11, -254],
+    [11, 92, 173, 254, 335, 416, 497, 578, 659],
+    [-425, -668],
+    [-425, -587],
+    [-425, -506],
+    [-344, -668],
+    [-344, -587],
+    [-344, -506],
+    [-263, -668],
+    [-263, -587],
+    [-263, -506],
+    [-182, -668],
+    [-182, -587],
+    [-182, -506],
+    [-182, -425],
+    [-182, -344],
+    [-182, -263],
+    [-101, -668],
+    [-101, -587],
+    [-101, -506],
+    [-101, -425],
+    [-101, -344],
+    [-101, -263],
+    [-20, -668],
+    [-20, -587],
+    [-20, -506],
+    [-20, -425],
+    [-20, -344],
+    [-20, -263],
+    [20, 101, 182, 263, 344, 425, 506, 587, 668],
+    [-434, -677],
+    [-434, -596],
+    [-434, -515],
+    [-353, -677],
+    [-353, -596],
+    [-353, -515],
+    [-272, -677],
+    [-272, -596],
+    [-272, -515],
+    [-191, -677],
+    [-191, -596],
+    [-191, -515],
+    [-191, -434],
+    [-191, -353],
+    [-191, -272],
+    [-110, -677],
+    [-110, -596],
+    [-110, -515],
+    [-110, -434],
+    [-110, -353],
+    [-110, -272],
+    [-29, -677],
+    [-29, -596],
+    [-29, -515],
+    [-29, -434],
+    [-29, -353],
+    [-29, -272],
+    [29, 110, 191, 272, 353, 434, 515, 596, 677],
+    [-443, -686],
+    [-443, -605],
+    [-443, -524],
+    [-362, -686],
+    [-362, -605],
+    [-362, -524],
+    [-281, -686],
+    [-281, -605],
+    [-281, -524],
+    [-200, -686],
+    [-200, -605],
+    [-200, -524],
+    [-200, -443],
+    [-200, -362],
+    [-200, -281],
+    [-119, -686],
+    [-119, -605],
+    [-119, -524],
+    [-119, -443],
+    [-119, -362],
+    [-119, -281],
+    [-38, -686],
+    [-38, -605],
+    [-38, -524],
+    [-38, -443],
+    [-38, -362],
+    [-38, -281],
+    [38, 119, 200, 281, 362, 443, 524, 605, 686],
+    [-452, -695],
+    [-452, -614],
+    [-452, -533],
+    [-371, -695],
+    [-371, -614],
+    [-371, -533],
+    [-290, -695],
+    [-290, -614],
+    [-290, -533],
+    [-209, -695],
+    [-209, -614],
+    [-209, -533],
+    [-209, -452],
+    [-209, -371],
+    [-209, -290],
+    [-128, -695],
+    [-128, -614],
+    [-128, -533],
+    [-128, -452],
+    [-128, -371],
+    [-128, -290],
+    [-47, -695],
+    [-47, -614],
+    [-47, -533],
+    [-47, -452],
+    [-47, -371],
+    [-47, -290],
+    [47, 128, 209, 290, 371, 452, 533, 614, 695],
+    [-461, -704],
+    [-461, -623],
+    [-461, -542],
+    [-380, -704],
+    [-380, -623],
+    [-380, -542],
+    [-299, -704],
+    [-299, -623],
+    [-299, -542],
+    [-218, -704],
+    [-218, -623],
+    [-218, -542],
+    [-218, -461],
+    [-218, -380],
+    [-218, -299],
+    [-137, -704],
+    [-137, -623],
+    [-137, -542],
+    [-137, -461],
+    [-137, -380],
+    [-137, -299],
+    [-56, -704],
+    [-56, -623],
+    [-56, -542],
+    [-56, -461],
+    [-56, -380],
+    [-56, -299],
+    [56, 137, 218, 299, 380, 461, 542, 623, 704],
+    [-470, -713],
+    [-470, -632],
+    [-470, -551],
+    [-389, -713],
+    [-389, -632],
+    [-389, -551],
+    [-308, -713],
+    [-308, -632],
+    [-308, -551],
+    [-227, -713],
+    [-227, -632],
+    [-227, -551],
+    [-227, -470],
+    [-227, -389],
+    [-227, -308],
+    [-146, -713],
+    [-146, -632],
+    [-146, -551],
+    [-146, -470],
+    [-146, -389],
+    [-146, -308],
+    [-65, -713],
+    [-65, -632],
+    [-65, -551],
+    [-65, -470],
+    [-65, -389],
+    [-65, -308],
+    [65, 146, 227, 308, 389, 470, 551, 632, 713],
+    [-479, -722],
+    [-479, -641],
+    [-479, -560],
+    [-398, -722],
+    [-398, -641],
+    [-398, -560],
+    [-317, -722],
+    [-317, -641],
+    [-317, -560],
+    [-236, -722],
+    [-236, -641],
+    [-236, -560],
+    [-236, -479],
+    [-236, -398],
+    [-236, -317],
+    [-155, -722],
+    [-155, -641],
+    [-155, -560],
+    [-155, -479],
+    [-155, -398],
+    [-155, -317],
+    [-74, -722],
+    [-74, -641],
+    [-74, -560],
+    [-74, -479],
+    [-74, -398],
+    [-74, -317],
+    [74, 155, 236, 317, 398, 479, 560, 641, 722],
+    [-408, -651],
+    [-408, -570],
+    [-408, -489],
+    [-327, -651],
+    [-327, -570],
+    [-327, -489],
+    [-246, -651],
+    [-246, -570],
+    [-246, -489],
+    [-165, -651],
+    [-165, -570],
+    [-165, -489],
+    [-165, -408],
+    [-165, -327],
+    [-165, -246],
+    [-84, -651],
+    [-84, -570],
+    [-84, -489],
+    [-84, -408],
+    [-84, -327],
+    [-84, -246],
+    [-3, -651],
+    [-3, -570],
+    [-3, -489],
+    [-3, -408],
+    [-3, -327],
+    [-3, -246],
+    [3, 84, 165, 246, 327, 408, 489, 570, 651],
+    [-417, -660],
+    [-417, -579],
+    [-417, -498],
+    [-336, -660],
+    [-336, -579],
+    [-336, -498],
+    [-255, -660],
+    [-255, -579],
+    [-255, -498],
+    [-174, -660],
+    [-174, -579],
+    [-174, -498],
+    [-174, -417],
+    [-174, -336],
+    [-174, -255],
+    [-93, -660],
+    [-93, -579],
+    [-93, -498],
+    [-93, -417],
+    [-93, -336],
+    [-93, -255],
+    [-12, -660],
+    [-12, -579],
+    [-12, -498],
+    [-12, -417],
+    [-12, -336],
+    [-12, -255],
+    [12, 93, 174, 255, 336, 417, 498, 579, 660],
+    [-426, -669],
+    [-426, -588],
+    [-426, -507],
+    [-345, -669],
+    [-345, -588],
+    [-345, -507],
+    [-264, -669],
+    [-264, -588],
+    [-264, -507],
+    [-183, -669],
+    [-183, -588],
+    [-183, -507],
+    [-183, -426],
+    [-183, -345],
+    [-183, -264],
+    [-102, -669],
+    [-102, -588],
+    [-102, -507],
+    [-102, -426],
+    [-102, -345],
+    [-102, -264],
+    [-21, -669],
+    [-21, -588],
+    [-21, -507],
+    [-21, -426],
+    [-21, -345],
+    [-21, -264],
+    [21, 102, 183, 264, 345, 426, 507, 588, 669],
+    [-435, -678],
+    [-435, -597],
+    [-435, -516],
+    [-354, -678],
+    [-354, -597],
+    [-354, -516],
+    [-273, -678],
+    [-273, -597],
+    [-273, -516],
+    [-192, -678],
+    [-192, -597],
+    [-192, -516],
+    [-192, -435],
+    [-192, -354],
+    [-192, -273],
+    [-111, -678],
+    [-111, -597],
+    [-111, -516],
+    [-111, -435],
+    [-111, -354],
+    [-111, -273],
+    [-30, -678],
+    [-30, -597],
+    [-30, -516],
+    [-30, -435],
+    [-30, -354],
+    [-30, -273],
+    [30, 111, 192, 273, 354, 435, 516, 597, 678],
+    [-444, -687],
+    [-444, -606],
+    [-444, -525],
+    [-363, -687],
+    [-363, -606],
+    [-363, -525],
+    [-282, -687],
+    [-282, -606],
+    [-282, -525],
+    [-201, -687],
+    [-201, -606],
+    [-201, -525],
+    [-201, -444],
+    [-201, -363],
+    [-201, -282],
+    [-120, -687],
+    [-120, -606],
+    [-120, -525],
+    [-120, -444],
+    [-120, -363],
+    [-120, -282],
+    [-39, -687],
+    [-39, -606],
+    [-39, -525],
+    [-39, -444],
+    [-39, -363],
+    [-39, -282],
+    [39, 120, 201, 282, 363, 444, 525, 606, 687],
+    [-453, -696],
+    [-453, -615],
+    [-453, -534],
+    [-372, -696],
+    [-372, -615],
+    [-372, -534],
+    [-291, -696],
+    [-291, -615],
+    [-291, -534],
+    [-210, -696],
+    [-210, -615],
+    [-210, -534],
+    [-210, -453],
+    [-210, -372],
+    [-210, -291],
+    [-129, -696],
+    [-129, -615],
+    [-129, -534],
+    [-129, -453],
+    [-129, -372],
+    [-129, -291],
+    [-48, -696],
+    [-48, -615],
+    [-48, -534],
+    [-48, -453],
+    [-48, -372],
+    [-48, -291],
+    [48, 129, 210, 291, 372, 453, 534, 615, 696],
+    [-462, -705],
+    [-462, -624],
+    [-462, -543],
+    [-381, -705],
+    [-381, -624],
+    [-381, -543],
+    [-300, -705],
+    [-300, -624],
+    [-300, -543],
+    [-219, -705],
+    [-219, -624],
+    [-219, -543],
+    [-219, -462],
+    [-219, -381],
+    [-219, -300],
+    [-138, -705],
+    [-138, -624],
+    [-138, -543],
+    [-138, -462],
+    [-138, -381],
+    [-138, -300],
+    [-57, -705],
+    [-57, -624],
+    [-57, -543],
+    [-57, -462],
+    [-57, -381],
+    [-57, -300],
+    [57, 138, 219, 300, 381, 462, 543, 624, 705],
+    [-471, -714],
+    [-471, -633],
+    [-471, -552],
+    [-390, -714],
+    [-390, -633],
+    [-390, -552],
+    [-309, -714],
+    [-309, -633],
+    [-309, -552],
+    [-228, -714],
+    [-228, -633],
+    [-228, -552],
+    [-228, -471],
+    [-228, -390],
+    [-228, -309],
+    [-147, -714],
+    [-147, -633],
+    [-147, -552],
+    [-147, -471],
+    [-147, -390],
+    [-147, -309],
+    [-66, -714],
+    [-66, -633],
+    [-66, -552],
+    [-66, -471],
+    [-66, -390],
+    [-66, -309],
+    [66, 147, 228, 309, 390, 471, 552, 633, 714],
+    [-480, -723],
+    [-480, -642],
+    [-480, -561],
+    [-399, -723],
+    [-399, -642],
+    [-399, -561],
+    [-318, -723],
+    [-318, -642],
+    [-318, -561],
+    [-237, -723],
+    [-237, -642],
+    [-237, -561],
+    [-237, -480],
+    [-237, -399],
+    [-237, -318],
+    [-156, -723],
+    [-156, -642],
+    [-156, -561],
+    [-156, -480],
+    [-156, -399],
+    [-156, -318],
+    [-75, -723],
+    [-75, -642],
+    [-75, -561],
+    [-75, -480],
+    [-75, -399],
+    [-75, -318],
+    [75, 156, 237, 318, 399, 480, 561, 642, 723],
+    [-409, -652],
+    [-409, -571],
+    [-409, -490],
+    [-328, -652],
+    [-328, -571],
+    [-328, -490],
+    [-247, -652],
+    [-247, -571],
+    [-247, -490],
+    [-166, -652],
+    [-166, -571],
+    [-166, -490],
+    [-166, -409],
+    [-166, -328],
+    [-166, -247],
+    [-85, -652],
+    [-85, -571],
+    [-85, -490],
+    [-85, -409],
+    [-85, -328],
+    [-85, -247],
+    [-4, -652],
+    [-4, -571],
+    [-4, -490],
+    [-4, -409],
+    [-4, -328],
+    [-4, -247],
+    [4, 85, 166, 247, 328, 409, 490, 571, 652],
+    [-418, -661],
+    [-418, -580],
+    [-418, -499],
+    [-337, -661],
+    [-337, -580],
+    [-337, -499],
+    [-256, -661],
+    [-256, -580],
+    [-256, -499],
+    [-175, -661],
+    [-175, -580],
+    [-175, -499],
+    [-175, -418],
+    [-175, -337],
+    [-175, -256],
+    [-94, -661],
+    [-94, -580],
+    [-94, -499],
+    [-94, -418],
+    [-94, -337],
+    [-94, -256],
+    [-13, -661],
+    [-13, -580],
+    [-13, -499],
+    [-13, -418],
+    [-13, -337],
+    [-13, -256],
+    [13, 94, 175, 256, 337, 418, 499, 580, 661],
+    [-427, -670],
+    [-427, -589],
+    [-427, -508],
+    [-346, -670],
+    [-346, -589],
+    [-346, -508],
+    [-265, -670],
+    [-265, -589],
+    [-265, -508],
+    [-184, -670],
+    [-184, -589],
+    [-184, -508],
+    [-184, -427],
+    [-184, -346],
+    [-184, -265],
+    [-103, -670],
+    [-103, -589],
+    [-103, -508],
+    [-103, -427],
+    [-103, -346],
+    [-103, -265],
+    [-22, -670],
+    [-22, -589],
+    [-22, -508],
+    [-22, -427],
+    [-22, -346],
+    [-22, -265],
+    [22, 103, 184, 265, 346, 427, 508, 589, 670],
+    [-436, -679],
+    [-436, -598],
+    [-436, -517],
+    [-355, -679],
+    [-355, -598],
+    [-355, -517],
+    [-274, -679],
+    [-274, -598],
+    [-274, -517],
+    [-193, -679],
+    [-193, -598],
+    [-193, -517],
+    [-193, -436],
+    [-193, -355],
+    [-193, -274],
+    [-112, -679],
+    [-112, -598],
+    [-112, -517],
+    [-112, -436],
+    [-112, -355],
+    [-112, -274],
+    [-31, -679],
+    [-31, -598],
+    [-31, -517],
+    [-31, -436],
+    [-31, -355],
+    [-31, -274],
+    [31, 112, 193, 274, 355, 436, 517, 598, 679],
+    [-445, -688],
+    [-445, -607],
+    [-445, -526],
+    [-364, -688],
+    [-364, -607],
+    [-364, -526],
+    [-283, -688],
+    [-283, -607],
+    [-283, -526],
+    [-202, -688],
+    [-202, -607],
+    [-202, -526],
+    [-202, -445],
+    [-202, -364],
+    [-202, -283],
+    [-121, -688],
+    [-121, -607],
+    [-121, -526],
+    [-121, -445],
+    [-121, -364],
+    [-121, -283],
+    [-40, -688],
+    [-40, -607],
+    [-40, -526],
+    [-40, -445],
+    [-40, -364],
+    [-40, -283],
+    [40, 121, 202, 283, 364, 445, 526, 607, 688],
+    [-454, -697],
+    [-454, -616],
+    [-454, -535],
+    [-373, -697],
+    [-373, -616],
+    [-373, -535],
+    [-292, -697],
+    [-292, -616],
+    [-292, -535],
+    [-211, -697],
+    [-211, -616],
+    [-211, -535],
+    [-211, -454],
+    [-211, -373],
+    [-211, -292],
+    [-130, -697],
+    [-130, -616],
+    [-130, -535],
+    [-130, -454],
+    [-130, -373],
+    [-130, -292],
+    [-49, -697],
+    [-49, -616],
+    [-49, -535],
+    [-49, -454],
+    [-49, -373],
+    [-49, -292],
+    [49, 130, 211, 292, 373, 454, 535, 616, 697],
+    [-463, -706],
+    [-463, -625],
+    [-463, -544],
+    [-382, -706],
+    [-382, -625],
+    [-382, -544],
+    [-301, -706],
+    [-301, -625],
+    [-301, -544],
+    [-220, -706],
+    [-220, -625],
+    [-220, -544],
+    [-220, -463],
+    [-220, -382],
+    [-220, -301],
+    [-139, -706],
+    [-139, -625],
+    [-139, -544],
+    [-139, -463],
+    [-139, -382],
+    [-139, -301],
+    [-58, -706],
+    [-58, -625],
+    [-58, -544],
+    [-58, -463],
+    [-58, -382],
+    [-58, -301],
+    [58, 139, 220, 301, 382, 463, 544, 625, 706],
+    [-472, -715],
+    [-472, -634],
+    [-472, -553],
+    [-391, -715],
+    [-391, -634],
+    [-391, -553],
+    [-310, -715],
+    [-310, -634],
+    [-310, -553],
+    [-229, -715],
+    [-229, -634],
+    [-229, -553],
+    [-229, -472],
+    [-229, -391],
+    [-229, -310],
+    [-148, -715],
+    [-148, -634],
+    [-148, -553],
+    [-148, -472],
+    [-148, -391],
+    [-148, -310],
+    [-67, -715],
+    [-67, -634],
+    [-67, -553],
+    [-67, -472],
+    [-67, -391],
+    [-67, -310],
+    [67, 148, 229, 310, 391, 472, 553, 634, 715],
+    [-481, -724],
+    [-481, -643],
+    [-481, -562],
+    [-400, -724],
+    [-400, -643],
+    [-400, -562],
+    [-319, -724],
+    [-319, -643],
+    [-319, -562],
+    [-238, -724],
+    [-238, -643],
+    [-238, -562],
+    [-238, -481],
+    [-238, -400],
+    [-238, -319],
+    [-157, -724],
+    [-157, -643],
+    [-157, -562],
+    [-157, -481],
+    [-157, -400],
+    [-157, -319],
+    [-76, -724],
+    [-76, -643],
+    [-76, -562],
+    [-76, -481],
+    [-76, -400],
+    [-76, -319],
+    [76, 157, 238, 319, 400, 481, 562, 643, 724],
+    [-410, -653],
+    [-410, -572],
+    [-410, -491],
+    [-329, -653],
+    [-329, -572],
+    [-329, -491],
+    [-248, -653],
+    [-248, -572],
+    [-248, -491],
+    [-167, -653],
+    [-167, -572],
+    [-167, -491],
+    [-167, -410],
+    [-167, -329],
+    [-167, -248],
+    [-86, -653],
+    [-86, -572],
+    [-86, -491],
+    [-86, -410],
+    [-86, -329],
+    [-86, -248],
+    [-5, -653],
+    [-5, -572],
+    [-5, -491],
+    [-5, -410],
+    [-5, -329],
+    [-5, -248],
+    [5, 86, 167, 248, 329, 410, 491, 572, 653],
+    [-419, -662],
+    [-419, -581],
+    [-419, -500],
+    [-338, -662],
+    [-338, -581],
+    [-338, -500],
+    [-257, -662],
+    [-257, -581],
+    [-257, -500],
+    [-176, -662],
+    [-176, -581],
+    [-176, -500],
+    [-176, -419],
+    [-176, -338],
+    [-176, -257],
+    [-95, -662],
+    [-95, -581],
+    [-95, -500],
+    [-95, -419],
+    [-95, -338],
+    [-95, -257],
+    [-14, -662],
+    [-14, -581],
+    [-14, -500],
+    [-14, -419],
+    [-14, -338],
+    [-14, -257],
+    [14, 95, 176, 257, 338, 419, 500, 581, 662],
+    [-428, -671],
+    [-428, -590],
+    [-428, -509],
+    [-347, -671],
+    [-347, -590],
+    [-347, -509],
+    [-266, -671],
+    [-266, -590],
+    [-266, -509],
+    [-185, -671],
+    [-185, -590],
+    [-185, -509],
+    [-185, -428],
+    [-185, -347],
+    [-185, -266],
+    [-104, -671],
+    [-104, -590],
+    [-104, -509],
+    [-104, -428],
+    [-104, -347],
+    [-104, -266],
+    [-23, -671],
+    [-23, -590],
+    [-23, -509],
+    [-23, -428],
+    [-23, -347],
+    [-23, -266],
+    [23, 104, 185, 266, 347, 428, 509, 590, 671],
+    [-437, -680],
+    [-437, -599],
+    [-437, -518],
+    [-356, -680],
+    [-356, -599],
+    [-356, -518],
+    [-275, -680],
+    [-275, -599],
+    [-275, -518],
+    [-194, -680],
+    [-194, -599],
+    [-194, -518],
+    [-194, -437],
+    [-194, -356],
+    [-194, -275],
+    [-113, -680],
+    [-113, -599],
+    [-113, -518],
+    [-113, -437],
+    [-113, -356],
+    [-113, -275],
+    [-32, -680],
+    [-32, -599],
+    [-32, -518],
+    [-32, -437],
+    [-32, -356],
+    [-32, -275],
+    [32, 113, 194, 275, 356, 437, 518, 599, 680],
+    [-446, -689],
+    [-446, -608],
+    [-446, -527],
+    [-365, -689],
+    [-365, -608],
+    [-365, -527],
+    [-284, -689],
+    [-284, -608],
+    [-284, -527],
+    [-203, -689],
+    [-203, -608],
+    [-203, -527],
+    [-203, -446],
+    [-203, -365],
+    [-203, -284],
+    [-122, -689],
+    [-122, -608],
+    [-122, -527],
+    [-122, -446],
+    [-122, -365],
+    [-122, -284],
+    [-41, -689],
+    [-41, -608],
+    [-41, -527],
+    [-41, -446],
+    [-41, -365],
+    [-41, -284],
+    [41, 122, 203, 284, 365, 446, 527, 608, 689],
+    [-455, -698],
+    [-455, -617],
+    [-455, -536],
+    [-374, -698],
+    [-374, -617],
+    [-374, -536],
+    [-293, -698],
+    [-293, -617],
+    [-293, -536],
+    [-212, -698],
+    [-212, -617],
+    [-212, -536],
+    [-212, -455],
+    [-212, -374],
+    [-212, -293],
+    [-131, -698],
+    [-131, -617],
+    [-131, -536],
+    [-131, -455],
+    [-131, -374],
+    [-131, -293],
+    [-50, -698],
+    [-50, -617],
+    [-50, -536],
+    [-50, -455],
+    [-50, -374],
+    [-50, -293],
+    [50, 131, 212, 293, 374, 455, 536, 617, 698],
+    [-464, -707],
+    [-464, -626],
+    [-464, -545],
+    [-383, -707],
+    [-383, -626],
+    [-383, -545],
+    [-302, -707],
+    [-302, -626],
+    [-302, -545],
+    [-221, -707],
+    [-221, -626],
+    [-221, -545],
+    [-221, -464],
+    [-221, -383],
+    [-221, -302],
+    [-140, -707],
+    [-140, -626],
+    [-140, -545],
+    [-140, -464],
+    [-140, -383],
+    [-140, -302],
+    [-59, -707],
+    [-59, -626],
+    [-59, -545],
+    [-59, -464],
+    [-59, -383],
+    [-59, -302],
+    [59, 140, 221, 302, 383, 464, 545, 626, 707],
+    [-473, -716],
+    [-473, -635],
+    [-473, -554],
+    [-392, -716],
+    [-392, -635],
+    [-392, -554],
+    [-311, -716],
+    [-311, -635],
+    [-311, -554],
+    [-230, -716],
+    [-230, -635],
+    [-230, -554],
+    [-230, -473],
+    [-230, -392],
+    [-230, -311],
+    [-149, -716],
+    [-149, -635],
+    [-149, -554],
+    [-149, -473],
+    [-149, -392],
+    [-149, -311],
+    [-68, -716],
+    [-68, -635],
+    [-68, -554],
+    [-68, -473],
+    [-68, -392],
+    [-68, -311],
+    [68, 149, 230, 311, 392, 473, 554, 635, 716],
+    [-482, -725],
+    [-482, -644],
+    [-482, -563],
+    [-401, -725],
+    [-401, -644],
+    [-401, -563],
+    [-320, -725],
+    [-320, -644],
+    [-320, -563],
+    [-239, -725],
+    [-239, -644],
+    [-239, -563],
+    [-239, -482],
+    [-239, -401],
+    [-239, -320],
+    [-158, -725],
+    [-158, -644],
+    [-158, -563],
+    [-158, -482],
+    [-158, -401],
+    [-158, -320],
+    [-77, -725],
+    [-77, -644],
+    [-77, -563],
+    [-77, -482],
+    [-77, -401],
+    [-77, -320],
+    [77, 158, 239, 320, 401, 482, 563, 644, 725],
+    [-411, -654],
+    [-411, -573],
+    [-411, -492],
+    [-330, -654],
+    [-330, -573],
+    [-330, -492],
+    [-249, -654],
+    [-249, -573],
+    [-249, -492],
+    [-168, -654],
+    [-168, -573],
+    [-168, -492],
+    [-168, -411],
+    [-168, -330],
+    [-168, -249],
+    [-87, -654],
+    [-87, -573],
+    [-87, -492],
+    [-87, -411],
+    [-87, -330],
+    [-87, -249],
+    [-6, -654],
+    [-6, -573],
+    [-6, -492],
+    [-6, -411],
+    [-6, -330],
+    [-6, -249],
+    [6, 87, 168, 249, 330, 411, 492, 573, 654],
+    [-420, -663],
+    [-420, -582],
+    [-420, -501],
+    [-339, -663],
+    [-339, -582],
+    [-339, -501],
+    [-258, -663],
+    [-258, -582],
+    [-258, -501],
+    [-177, -663],
+    [-177, -582],
+    [-177, -501],
+    [-177, -420],
+    [-177, -339],
+    [-177, -258],
+    [-96, -663],
+    [-96, -582],
+    [-96, -501],
+    [-96, -420],
+    [-96, -339],
+    [-96, -258],
+    [-15, -663],
+    [-15, -582],
+    [-15, -501],
+    [-15, -420],
+    [-15, -339],
+    [-15, -258],
+    [15, 96, 177, 258, 339, 420, 501, 582, 663],
+    [-429, -672],
+    [-429, -591],
+    [-429, -510],
+    [-348, -672],
+    [-348, -591],
+    [-348, -510],
+    [-267, -672],
+    [-267, -591],
+    [-267, -510],
+    [-186, -672],
+    [-186, -591],
+    [-186, -510],
+    [-186, -429],
+    [-186, -348],
+    [-186, -267],
+    [-105, -672],
+    [-105, -591],
+    [-105, -510],
+    [-105, -429],
+    [-105, -348],
+    [-105, -267],
+    [-24, -672],
+    [-24, -591],
+    [-24, -510],
+    [-24, -429],
+    [-24, -348],
+    [-24, -267],
+    [24, 105, 186, 267, 348, 429, 510, 591, 672],
+    [-438, -681],
+    [-438, -600],
+    [-438, -519],
+    [-357, -681],
+    [-357, -600],
+    [-357, -519],
+    [-276, -681],
+    [-276, -600],
+    [-276, -519],
+    [-195, -681],
+    [-195, -600],
+    [-195, -519],
+    [-195, -438],
+    [-195, -357],
+    [-195, -276],
+    [-114, -681],
+    [-114, -600],
+    [-114, -519],
+    [-114, -438],
+    [-114, -357],
+    [-114, -276],
+    [-33, -681],
+    [-33, -600],
+    [-33, -519],
+    [-33, -438],
+    [-33, -357],
+    [-33, -276],
+    [33, 114, 195, 276, 357, 438, 519, 600, 681],
+    [-447, -690],
+    [-447, -609],
+    [-447, -528],
+    [-366, -690],
+    [-366, -609],
+    [-366, -528],
+    [-285, -690],
+    [-285, -609],
+    [-285, -528],
+    [-204, -690],
+    [-204, -609],
+    [-204, -528],
+    [-204, -447],
+    [-204, -366],
+    [-204, -285],
+    [-123, -690],
+    [-123, -609],
+    [-123, -528],
+    [-123, -447],
+    [-123, -366],
+    [-123, -285],
+    [-42, -690],
+    [-42, -609],
+    [-42, -528],
+    [-42, -447],
+    [-42, -366],
+    [-42, -285],
+    [42, 123, 204, 285, 366, 447, 528, 609, 690],
+    [-456, -699],
+    [-456, -618],
+    [-456, -537],
+    [-375, -699],
+    [-375, -618],
+    [-375, -537],
+    [-294, -699],
+    [-294, -618],
+    [-294, -537],
+    [-213, -699],
+    [-213, -618],
+    [-213, -537],
+    [-213, -456],
+    [-213, -375],
+    [-213, -294],
+    [-132, -699],
+    [-132, -618],
+    [-132, -537],
+    [-132, -456],
+    [-132, -375],
+    [-132, -294],
+    [-51, -699],
+    [-51, -618],
+    [-51, -537],
+    [-51, -456],
+    [-51, -375],
+    [-51, -294],
+    [51, 132, 213, 294, 375, 456, 537, 618, 699],
+    [-465, -708],
+    [-465, -627],
+    [-465, -546],
+    [-384, -708],
+    [-384, -627],
+    [-384, -546],
+    [-303, -708],
+    [-303, -627],
+    [-303, -546],
+    [-222, -708],
+    [-222, -627],
+    [-222, -546],
+    [-222, -465],
+    [-222, -384],
+    [-222, -303],
+    [-141, -708],
+    [-141, -627],
+    [-141, -546],
+    [-141, -465],
+    [-141, -384],
+    [-141, -303],
+    [-60, -708],
+    [-60, -627],
+    [-60, -546],
+    [-60, -465],
+    [-60, -384],
+    [-60, -303],
+    [60, 141, 222, 303, 384, 465, 546, 627, 708],
+    [-474, -717],
+    [-474, -636],
+    [-474, -555],
+    [-393, -717],
+    [-393, -636],
+    [-393, -555],
+    [-312, -717],
+    [-312, -636],
+    [-312, -555],
+    [-231, -717],
+    [-231, -636],
+    [-231, -555],
+    [-231, -474],
+    [-231, -393],
+    [-231, -312],
+    [-150, -717],
+    [-150, -636],
+    [-150, -555],
+    [-150, -474],
+    [-150, -393],
+    [-150, -312],
+    [-69, -717],
+    [-69, -636],
+    [-69, -555],
+    [-69, -474],
+    [-69, -393],
+    [-69, -312],
+    [69, 150, 231, 312, 393, 474, 555, 636, 717],
+    [-483, -726],
+    [-483, -645],
+    [-483, -564],
+    [-402, -726],
+    [-402, -645],
+    [-402, -564],
+    [-321, -726],
+    [-321, -645],
+    [-321, -564],
+    [-240, -726],
+    [-240, -645],
+    [-240, -564],
+    [-240, -483],
+    [-240, -402],
+    [-240, -321],
+    [-159, -726],
+    [-159, -645],
+    [-159, -564],
+    [-159, -483],
+    [-159, -402],
+    [-159, -321],
+    [-78, -726],
+    [-78, -645],
+    [-78, -564],
+    [-78, -483],
+    [-78, -402],
+    [-78, -321],
+    [78, 159, 240, 321, 402, 483, 564, 645, 726],
+    [-412, -655],
+    [-412, -574],
+    [-412, -493],
+    [-331, -655],
+    [-331, -574],
+    [-331, -493],
+    [-250, -655],
+    [-250, -574],
+    [-250, -493],
+    [-169, -655],
+    [-169, -574],
+    [-169, -493],
+    [-169, -412],
+    [-169, -331],
+    [-169, -250],
+    [-88, -655],
+    [-88, -574],
+    [-88, -493],
+    [-88, -412],
+    [-88, -331],
+    [-88, -250],
+    [-7, -655],
+    [-7, -574],
+    [-7, -493],
+    [-7, -412],
+    [-7, -331],
+    [-7, -250],
+    [7, 88, 169, 250, 331, 412, 493, 574, 655],
+    [-421, -664],
+    [-421, -583],
+    [-421, -502],
+    [-340, -664],
+    [-340, -583],
+    [-340, -502],
+    [-259, -664],
+    [-259, -583],
+    [-259, -502],
+    [-178, -664],
+    [-178, -583],
+    [-178, -502],
+    [-178, -421],
+    [-178, -340],
+    [-178, -259],
+    [-97, -664],
+    [-97, -583],
+    [-97, -502],
+    [-97, -421],
+    [-97, -340],
+    [-97, -259],
+    [-16, -664],
+    [-16, -583],
+    [-16, -502],
+    [-16, -421],
+    [-16, -340],
+    [-16, -259],
+    [16, 97, 178, 259, 340, 421, 502, 583, 664],
+    [-430, -673],
+    [-430, -592],
+    [-430, -511],
+    [-349, -673],
+    [-349, -592],
+    [-349, -511],
+    [-268, -673],
+    [-268, -592],
+    [-268, -511],
+    [-187, -673],
+    [-187, -592],
+    [-187, -511],
+    [-187, -430],
+    [-187, -349],
+    [-187, -268],
+    [-106, -673],
+    [-106, -592],
+    [-106, -511],
+    [-106, -430],
+    [-106, -349],
+    [-106, -268],
+    [-25, -673],
+    [-25, -592],
+    [-25, -511],
+    [-25, -430],
+    [-25, -349],
+    [-25, -268],
+    [25, 106, 187, 268, 349, 430, 511, 592, 673],
+    [-439, -682],
+    [-439, -601],
+    [-439, -520],
+    [-358, -682],
+    [-358, -601],
+    [-358, -520],
+    [-277, -682],
+    [-277, -601],
+    [-277, -520],
+    [-196, -682],
+    [-196, -601],
+    [-196, -520],
+    [-196, -439],
+    [-196, -358],
+    [-196, -277],
+    [-115, -682],
+    [-115, -601],
+    [-115, -520],
+    [-115, -439],
+    [-115, -358],
+    [-115, -277],
+    [-34, -682],
+    [-34, -601],
+    [-34, -520],
+    [-34, -439],
+    [-34, -358],
+    [-34, -277],
+    [34, 115, 196, 277, 358, 439, 520, 601, 682],
+    [-448, -691],
+    [-448, -610],
+    [-448, -529],
+    [-367, -691],
+    [-367, -610],
+    [-367, -529],
+    [-286, -691],
+    [-286, -610],
+    [-286, -529],
+    [-205, -691],
+    [-205, -610],
+    [-205, -529],
+    [-205, -448],
+    [-205, -367],
+    [-205, -286],
+    [-124, -691],
+    [-124, -610],
+    [-124, -529],
+    [-124, -448],
+    [-124, -367],
+    [-124, -286],
+    [-43, -691],
+    [-43, -610],
+    [-43, -529],
+    [-43, -448],
+    [-43, -367],
+    [-43, -286],
+    [43, 124, 205, 286, 367, 448, 529, 610, 691],
+    [-457, -700],
+    [-457, -619],
+    [-457, -538],
+    [-376, -700],
+    [-376, -619],
+    [-376, -538],
+    [-295, -700],
+    [-295, -619],
+    [-295, -538],
+    [-214, -700],
+    [-214, -619],
+    [-214, -538],
+    [-214, -457],
+    [-214, -376],
+    [-214, -295],
+    [-133, -700],
+    [-133, -619],
+    [-133, -538],
+    [-133, -457],
+    [-133, -376],
+    [-133, -295],
+    [-52, -700],
+    [-52, -619],
+    [-52, -538],
+    [-52, -457],
+    [-52, -376],
+    [-52, -295],
+    [52, 133, 214, 295, 376, 457, 538, 619, 700],
+    [-466, -709],
+    [-466, -628],
+    [-466, -547],
+    [-385, -709],
+    [-385, -628],
+    [-385, -547],
+    [-304, -709],
+    [-304, -628],
+    [-304, -547],
+    [-223, -709],
+    [-223, -628],
+    [-223, -547],
+    [-223, -466],
+    [-223, -385],
+    [-223, -304],
+    [-142, -709],
+    [-142, -628],
+    [-142, -547],
+    [-142, -466],
+    [-142, -385],
+    [-142, -304],
+    [-61, -709],
+    [-61, -628],
+    [-61, -547],
+    [-61, -466],
+    [-61, -385],
+    [-61, -304],
+    [61, 142, 223, 304, 385, 466, 547, 628, 709],
+    [-475, -718],
+    [-475, -637],
+    [-475, -556],
+    [-394, -718],
+    [-394, -637],
+    [-394, -556],
+    [-313, -718],
+    [-313, -637],
+    [-313, -556],
+    [-232, -718],
+    [-232, -637],
+    [-232, -556],
+    [-232, -475],
+    [-232, -394],
+    [-232, -313],
+    [-151, -718],
+    [-151, -637],
+    [-151, -556],
+    [-151, -475],
+    [-151, -394],
+    [-151, -313],
+    [-70, -718],
+    [-70, -637],
+    [-70, -556],
+    [-70, -475],
+    [-70, -394],
+    [-70, -313],
+    [70, 151, 232, 313, 394, 475, 556, 637, 718],
+    [-484, -727],
+    [-484, -646],
+    [-484, -565],
+    [-403, -727],
+    [-403, -646],
+    [-403, -565],
+    [-322, -727],
+    [-322, -646],
+    [-322, -565],
+    [-241, -727],
+    [-241, -646],
+    [-241, -565],
+    [-241, -484],
+    [-241, -403],
+    [-241, -322],
+    [-160, -727],
+    [-160, -646],
+    [-160, -565],
+    [-160, -484],
+    [-160, -403],
+    [-160, -322],
+    [-79, -727],
+    [-79, -646],
+    [-79, -565],
+    [-79, -484],
+    [-79, -403],
+    [-79, -322],
+    [79, 160, 241, 322, 403, 484, 565, 646, 727],
+    [-413, -656],
+    [-413, -575],
+    [-413, -494],
+    [-332, -656],
+    [-332, -575],
+    [-332, -494],
+    [-251, -656],
+    [-251, -575],
+    [-251, -494],
+    [-170, -656],
+    [-170, -575],
+    [-170, -494],
+    [-170, -413],
+    [-170, -332],
+    [-170, -251],
+    [-89, -656],
+    [-89, -575],
+    [-89, -494],
+    [-89, -413],
+    [-89, -332],
+    [-89, -251],
+    [-8, -656],
+    [-8, -575],
+    [-8, -494],
+    [-8, -413],
+    [-8, -332],
+    [-8, -251],
+    [8, 89, 170, 251, 332, 413, 494, 575, 656],
+    [-422, -665],
+    [-422, -584],
+    [-422, -503],
+    [-341, -665],
+    [-341, -584],
+    [-341, -503],
+    [-260, -665],
+    [-260, -584],
+    [-260, -503],
+    [-179, -665],
+    [-179, -584],
+    [-179, -503],
+    [-179, -422],
+    [-179, -341],
+    [-179, -260],
+    [-98, -665],
+    [-98, -584],
+    [-98, -503],
+    [-98, -422],
+    [-98, -341],
+    [-98, -260],
+    [-17, -665],
+    [-17, -584],
+    [-17, -503],
+    [-17, -422],
+    [-17, -341],
+    [-17, -260],
+    [17, 98, 179, 260, 341, 422, 503, 584, 665],
+    [-431, -674],
+    [-431, -593],
+    [-431, -512],
+    [-350, -674],
+    [-350, -593],
+    [-350, -512],
+    [-269, -674],
+    [-269, -593],
+    [-269, -512],
+    [-188, -674],
+    [-188, -593],
+    [-188, -512],
+    [-188, -431],
+    [-188, -350],
+    [-188, -269],
+    [-107, -674],
+    [-107, -593],
+    [-107, -512],
+    [-107, -431],
+    [-107, -350],
+    [-107, -269],
+    [-26, -674],
+    [-26, -593],
+    [-26, -512],
+    [-26, -431],
+    [-26, -350],
+    [-26, -269],
+    [26, 107, 188, 269, 350, 431, 512, 593, 674],
+    [-440, -683],
+    [-440, -602],
+    [-440, -521],
+    [-359, -683],
+    [-359, -602],
+    [-359, -521],
+    [-278, -683],
+    [-278, -602],
+    [-278, -521],
+    [-197, -683],
+    [-197, -602],
+    [-197, -521],
+    [-197, -440],
+    [-197, -359],
+    [-197, -278],
+    [-116, -683],
+    [-116, -602],
+    [-116, -521],
+    [-116, -440],
+    [-116, -359],
+    [-116, -278],
+    [-35, -683],
+    [-35, -602],
+    [-35, -521],
+    [-35, -440],
+    [-35, -359],
+    [-35, -278],
+    [35, 116, 197, 278, 359, 440, 521, 602, 683],
+    [-449, -692],
+    [-449, -611],
+    [-449, -530],
+    [-368, -692],
+    [-368, -611],
+    [-368, -530],
+    [-287, -692],
+    [-287, -611],
+    [-287, -530],
+    [-206, -692],
+    [-206, -611],
+    [-206, -530],
+    [-206, -449],
+    [-206, -368],
+    [-206, -287],
+    [-125, -692],
+    [-125, -611],
+    [-125, -530],
+    [-125, -449],
+    [-125, -368],
+    [-125, -287],
+    [-44, -692],
+    [-44, -611],
+    [-44, -530],
+    [-44, -449],
+    [-44, -368],
+    [-44, -287],
+    [44, 125, 206, 287, 368, 449, 530, 611, 692],
+    [-458, -701],
+    [-458, -620],
+    [-458, -539],
+    [-377, -701],
+    [-377, -620],
+    [-377, -539],
+    [-296, -701],
+    [-296, -620],
+    [-296, -539],
+    [-215, -701],
+    [-215, -620],
+    [-215, -539],
+    [-215, -458],
+    [-215, -377],
+    [-215, -296],
+    [-134, -701],
+    [-134, -620],
+    [-134, -539],
+    [-134, -458],
+    [-134, -377],
+    [-134, -296],
+    [-53, -701],
+    [-53, -620],
+    [-53, -539],
+    [-53, -458],
+    [-53, -377],
+    [-53, -296],
+    [53, 134, 215, 296, 377, 458, 539, 620, 701],
+    [-467, -710],
+    [-467, -629],
+    [-467, -548],
+    [-386, -710],
+    [-386, -629],
+    [-386, -548],
+    [-305, -710],
+    [-305, -629],
+    [-305, -548],
+    [-224, -710],
+    [-224, -629],
+    [-224, -548],
+    [-224, -467],
+    [-224, -386],
+    [-224, -305],
+    [-143, -710],
+    [-143, -629],
+    [-143, -548],
+    [-143, -467],
+    [-143, -386],
+    [-143, -305],
+    [-62, -710],
+    [-62, -629],
+    [-62, -548],
+    [-62, -467],
+    [-62, -386],
+    [-62, -305],
+    [62, 143, 224, 305, 386, 467, 548, 629, 710],
+    [-476, -719],
+    [-476, -638],
+    [-476, -557],
+    [-395, -719],
+    [-395, -638],
+    [-395, -557],
+    [-314, -719],
+    [-314, -638],
+    [-314, -557],
+    [-233, -719],
+    [-233, -638],
+    [-233, -557],
+    [-233, -476],
+    [-233, -395],
+    [-233, -314],
+    [-152, -719],
+    [-152, -638],
+    [-152, -557],
+    [-152, -476],
+    [-152, -395],
+    [-152, -314],
+    [-71, -719],
+    [-71, -638],
+    [-71, -557],
+    [-71, -476],
+    [-71, -395],
+    [-71, -314],
+    [71, 152, 233, 314, 395, 476, 557, 638, 719],
+    [-485, -728],
+    [-485, -647],
+    [-485, -566],
+    [-404, -728],
+    [-404, -647],
+    [-404, -566],
+    [-323, -728],
+    [-323, -647],
+    [-323, -566],
+    [-242, -728],
+    [-242, -647],
+    [-242, -566],
+    [-242, -485],
+    [-242, -404],
+    [-242, -323],
+    [-161, -728],
+    [-161, -647],
+    [-161, -566],
+    [-161, -485],
+    [-161, -404],
+    [-161, -323],
+    [-80, -728],
+    [-80, -647],
+    [-80, -566],
+    [-80, -485],
+    [-80, -404],
+    [-80, -323],
+    [80, 161, 242, 323, 404, 485, 566, 647, 728],
+    [-414, -657],
+    [-414, -576],
+    [-414, -495],
+    [-333, -657],
+    [-333, -576],
+    [-333, -495],
+    [-252, -657],
+    [-252, -576],
+    [-252, -495],
+    [-171, -657],
+    [-171, -576],
+    [-171, -495],
+    [-171, -414],
+    [-171, -333],
+    [-171, -252],
+    [-90, -657],
+    [-90, -576],
+    [-90, -495],
+    [-90, -414],
+    [-90, -333],
+    [-90, -252],
+    [-9, -657],
+    [-9, -576],
+    [-9, -495],
+    [-9, -414],
+    [-9, -333],
+    [-9, -252],
+    [9, 90, 171, 252, 333, 414, 495, 576, 657],
+    [-423, -666],
+    [-423, -585],
+    [-423, -504],
+    [-342, -666],
+    [-342, -585],
+    [-342, -504],
+    [-261, -666],
+    [-261, -585],
+    [-261, -504],
+    [-180, -666],
+    [-180, -585],
+    [-180, -504],
+    [-180, -423],
+    [-180, -342],
+    [-180, -261],
+    [-99, -666],
+    [-99, -585],
+    [-99, -504],
+    [-99, -423],
+    [-99, -342],
+    [-99, -261],
+    [-18, -666],
+    [-18, -585],
+    [-18, -504],
+    [-18, -423],
+    [-18, -342],
+    [-18, -261],
+    [18, 99, 180, 261, 342, 423, 504, 585, 666],
+    [-432, -675],
+    [-432, -594],
+    [-432, -513],
+    [-351, -675],
+    [-351, -594],
+    [-351, -513],
+    [-270, -675],
+    [-270, -594],
+    [-270, -513],
+    [-189, -675],
+    [-189, -594],
+    [-189, -513],
+    [-189, -432],
+    [-189, -351],
+    [-189, -270],
+    [-108, -675],
+    [-108, -594],
+    [-108, -513],
+    [-108, -432],
+    [-108, -351],
+    [-108, -270],
+    [-27, -675],
+    [-27, -594],
+    [-27, -513],
+    [-27, -432],
+    [-27, -351],
+    [-27, -270],
+    [27, 108, 189, 270, 351, 432, 513, 594, 675],
+    [-441, -684],
+    [-441, -603],
+    [-441, -522],
+    [-360, -684],
+    [-360, -603],
+    [-360, -522],
+    [-279, -684],
+    [-279, -603],
+    [-279, -522],
+    [-198, -684],
+    [-198, -603],
+    [-198, -522],
+    [-198, -441],
+    [-198, -360],
+    [-198, -279],
+    [-117, -684],
+    [-117, -603],
+    [-117, -522],
+    [-117, -441],
+    [-117, -360],
+    [-117, -279],
+    [-36, -684],
+    [-36, -603],
+    [-36, -522],
+    [-36, -441],
+    [-36, -360],
+    [-36, -279],
+    [36, 117, 198, 279, 360, 441, 522, 603, 684],
+    [-450, -693],
+    [-450, -612],
+    [-450, -531],
+    [-369, -693],
+    [-369, -612],
+    [-369, -531],
+    [-288, -693],
+    [-288, -612],
+    [-288, -531],
+    [-207, -693],
+    [-207, -612],
+    [-207, -531],
+    [-207, -450],
+    [-207, -369],
+    [-207, -288],
+    [-126, -693],
+    [-126, -612],
+    [-126, -531],
+    [-126, -450],
+    [-126, -369],
+    [-126, -288],
+    [-45, -693],
+    [-45, -612],
+    [-45, -531],
+    [-45, -450],
+    [-45, -369],
+    [-45, -288],
+    [45, 126, 207, 288, 369, 450, 531, 612, 693],
+    [-459, -702],
+    [-459, -621],
+    [-459, -540],
+    [-378, -702],
+    [-378, -621],
+    [-378, -540],
+    [-297, -702],
+    [-297, -621],
+    [-297, -540],
+    [-216, -702],
+    [-216, -621],
+    [-216, -540],
+    [-216, -459],
+    [-216, -378],
+    [-216, -297],
+    [-135, -702],
+    [-135, -621],
+    [-135, -540],
+    [-135, -459],
+    [-135, -378],
+    [-135, -297],
+    [-54, -702],
+    [-54, -621],
+    [-54, -540],
+    [-54, -459],
+    [-54, -378],
+    [-54, -297],
+    [54, 135, 216, 297, 378, 459, 540, 621, 702],
+    [-468, -711],
+    [-468, -630],
+    [-468, -549],
+    [-387, -711],
+    [-387, -630],
+    [-387, -549],
+    [-306, -711],
+    [-306, -630],
+    [-306, -549],
+    [-225, -711],
+    [-225, -630],
+    [-225, -549],
+    [-225, -468],
+    [-225, -387],
+    [-225, -306],
+    [-144, -711],
+    [-144, -630],
+    [-144, -549],
+    [-144, -468],
+    [-144, -387],
+    [-144, -306],
+    [-63, -711],
+    [-63, -630],
+    [-63, -549],
+    [-63, -468],
+    [-63, -387],
+    [-63, -306],
+    [63, 144, 225, 306, 387, 468, 549, 630, 711],
+    [-477, -720],
+    [-477, -639],
+    [-477, -558],
+    [-396, -720],
+    [-396, -639],
+    [-396, -558],
+    [-315, -720],
+    [-315, -639],
+    [-315, -558],
+    [-234, -720],
+    [-234, -639],
+    [-234, -558],
+    [-234, -477],
+    [-234, -396],
+    [-234, -315],
+    [-153, -720],
+    [-153, -639],
+    [-153, -558],
+    [-153, -477],
+    [-153, -396],
+    [-153, -315],
+    [-72, -720],
+    [-72, -639],
+    [-72, -558],
+    [-72, -477],
+    [-72, -396],
+    [-72, -315],
+    [72, 153, 234, 315, 396, 477, 558, 639, 720],
+    [-486, -729],
+    [-486, -648],
+    [-486, -567],
+    [-405, -729],
+    [-405, -648],
+    [-405, -567],
+    [-324, -729],
+    [-324, -648],
+    [-324, -567],
+    [-243, -729],
+    [-243, -648],
+    [-243, -567],
+    [-243, -486],
+    [-243, -405],
+    [-243, -324],
+    [-162, -729],
+    [-162, -648],
+    [-162, -567],
+    [-162, -486],
+    [-162, -405],
+    [-162, -324],
+    [-81, -729],
+    [-81, -648],
+    [-81, -567],
+    [-81, -486],
+    [-81, -405],
+    [-81, -324],
+    [81, 162, 243, 324, 405, 486, 567, 648, 729],
+    [-172, -181],
+    [-163, -181],
+    [-163, -172],
+    [-100, -181],
+    [-100, -172],
+    [-100, -163],
+    [-91, -181],
+    [-91, -172],
+    [-91, -163],
+    [-91, -100],
+    [-82, -181],
+    [-82, -172],
+    [-82, -163],
+    [-82, -100],
+    [-82, -91],
+    [-19, -181],
+    [-19, -172],
+    [-19, -163],
+    [-19, -100],
+    [-19, -91],
+    [-19, -82],
+    [-10, -181],
+    [-10, -172],
+    [-10, -163],
+    [-10, -100],
+    [-10, -91],
+    [-10, -82],
+    [-10, -19],
+    [-1, -181],
+    [-1, -172],
+    [-1, -163],
+    [-1, -100],
+    [-1, -91],
+    [-1, -82],
+    [-1, -19],
+    [-1, -10],
+    [1, 10, 19, 82, 91, 100, 163, 172, 181],
+    [-173, -182],
+    [-164, -182],
+    [-164, -173],
+    [-101, -182],
+    [-101, -173],
+    [-101, -164],
+    [-92, -182],
+    [-92, -173],
+    [-92, -164],
+    [-92, -101],
+    [-83, -182],
+    [-83, -173],
+    [-83, -164],
+    [-83, -101],
+    [-83, -92],
+    [-20, -182],
+    [-20, -173],
+    [-20, -164],
+    [-20, -101],
+    [-20, -92],
+    [-20, -83],
+    [-11, -182],
+    [-11, -173],
+    [-11, -164],
+    [-11, -101],
+    [-11, -92],
+    [-11, -83],
+    [-11, -20],
+    [-2, -182],
+    [-2, -173],
+    [-2, -164],
+    [-2, -101],
+    [-2, -92],
+    [-2, -83],
+    [-2, -20],
+    [-2, -11],
+    [2, 11, 20, 83, 92, 101, 164, 173, 182],
+    [-174, -183],
+    [-165, -183],
+    [-165, -174],
+    [-102, -183],
+    [-102, -174],
+    [-102, -165],
+    [-93, -183],
+    [-93, -174],
+    [-93, -165],
+    [-93, -102],
+    [-84, -183],
+    [-84, -174],
+    [-84, -165],
+    [-84, -102],
+    [-84, -93],
+    [-21, -183],
+    [-21, -174],
+    [-21, -165],
+    [-21, -102],
+    [-21, -93],
+    [-21, -84],
+    [-12, -183],
+    [-12, -174],
+    [-12, -165],
+    [-12, -102],
+    [-12, -93],
+    [-12, -84],
+    [-12, -21],
+    [-3, -183],
+    [-3, -174],
+    [-3, -165],
+    [-3, -102],
+    [-3, -93],
+    [-3, -84],
+    [-3, -21],
+    [-3, -12],
+    [3, 12, 21, 84, 93, 102, 165, 174, 183],
+    [-175, -184],
+    [-166, -184],
+    [-166, -175],
+    [-103, -184],
+    [-103, -175],
+    [-103, -166],
+    [-94, -184],
+    [-94, -175],
+    [-94, -166],
+    [-94, -103],
+    [-85, -184],
+    [-85, -175],
+    [-85, -166],
+    [-85, -103],
+    [-85, -94],
+    [-22, -184],
+    [-22, -175],
+    [-22, -166],
+    [-22, -103],
+    [-22, -94],
+    [-22, -85],
+    [-13, -184],
+    [-13, -175],
+    [-13, -166],
+    [-13, -103],
+    [-13, -94],
+    [-13, -85],
+    [-13, -22],
+    [-4, -184],
+    [-4, -175],
+    [-4, -166],
+    [-4, -103],
+    [-4, -94],
+    [-4, -85],
+    [-4, -22],
+    [-4, -13],
+    [4, 13, 22, 85, 94, 103, 166, 175, 184],
+    [-176, -185],
+    [-167, -185],
+    [-167, -176],
+    [-104, -185],
+    [-104, -176],
+    [-104, -167],
+    [-95, -185],
+    [-95, -176],
+    [-95, -167],
+    [-95, -104],
+    [-86, -185],
+    [-86, -176],
+    [-86, -167],
+    [-86, -104],
+    [-86, -95],
+    [-23, -185],
+    [-23, -176],
+    [-23, -167],
+    [-23, -104],
+    [-23, -95],
+    [-23, -86],
+    [-14, -185],
+    [-14, -176],
+    [-14, -167],
+    [-14, -104],
+    [-14, -95],
+    [-14, -86],
+    [-14, -23],
+    [-5, -185],
+    [-5, -176],
+    [-5, -167],
+    [-5, -104],
+    [-5, -95],
+    [-5, -86],
+    [-5, -23],
+    [-5, -14],
+    [5, 14, 23, 86, 95, 104, 167, 176, 185],
+    [-177, -186],
+    [-168, -186],
+    [-168, -177],
+    [-105, -186],
+    [-105, -177],
+    [-105, -168],
+    [-96, -186],
+    [-96, -177],
+    [-96, -168],
+    [-96, -105],
+    [-87, -186],
+    [-87, -177],
+    [-87, -168],
+    [-87, -105],
+    [-87, -96],
+    [-24, -186],
+    [-24, -177],
+    [-24, -168],
+    [-24, -105],
+    [-24, -96],
+    [-24, -87],
+    [-15, -186],
+    [-15, -177],
+    [-15, -168],
+    [-15, -105],
+    [-15, -96],
+    [-15, -87],
+    [-15, -24],
+    [-6, -186],
+    [-6, -177],
+    [-6, -168],
+    [-6, -105],
+    [-6, -96],
+    [-6, -87],
+    [-6, -24],
+    [-6, -15],
+    [6, 15, 24, 87, 96, 105, 168, 177, 186],
+    [-178, -187],
+    [-169, -187],
+    [-169, -178],
+    [-106, -187],
+    [-106, -178],
+    [-106, -169],
+    [-97, -187],
+    [-97, -178],
+    [-97, -169],
+    [-97, -106],
+    [-88, -187],
+    [-88, -178],
+    [-88, -169],
+    [-88, -106],
+    [-88, -97],
+    [-25, -187],
+    [-25, -178],
+    [-25, -169],
+    [-25, -106],
+    [-25, -97],
+    [-25, -88],
+    [-16, -187],
+    [-16, -178],
+    [-16, -169],
+    [-16, -106],
+    [-16, -97],
+    [-16, -88],
+    [-16, -25],
+    [-7, -187],
+    [-7, -178],
+    [-7, -169],
+    [-7, -106],
+    [-7, -97],
+    [-7, -88],
+    [-7, -25],
+    [-7, -16],
+    [7, 16, 25, 88, 97, 106, 169, 178, 187],
+    [-179, -188],
+    [-170, -188],
+    [-170, -179],
+    [-107, -188],
+    [-107, -179],
+    [-107, -170],
+    [-98, -188],
+    [-98, -179],
+    [-98, -170],
+    [-98, -107],
+    [-89, -188],
+    [-89, -179],
+    [-89, -170],
+    [-89, -107],
+    [-89, -98],
+    [-26, -188],
+    [-26, -179],
+    [-26, -170],
+    [-26, -107],
+    [-26, -98],
+    [-26, -89],
+    [-17, -188],
+    [-17, -179],
+    [-17, -170],
+    [-17, -107],
+    [-17, -98],
+    [-17, -89],
+    [-17, -26],
+    [-8, -188],
+    [-8, -179],
+    [-8, -170],
+    [-8, -107],
+    [-8, -98],
+    [-8, -89],
+    [-8, -26],
+    [-8, -17],
+    [8, 17, 26, 89, 98, 107, 170, 179, 188],
+    [-180, -189],
+    [-171, -189],
+    [-171, -180],
+    [-108, -189],
+    [-108, -180],
+    [-108, -171],
+    [-99, -189],
+    [-99, -180],
+    [-99, -171],
+    [-99, -108],
+    [-90, -189],
+    [-90, -180],
+    [-90, -171],
+    [-90, -108],
+    [-90, -99],
+    [-27, -189],
+    [-27, -180],
+    [-27, -171],
+    [-27, -108],
+    [-27, -99],
+    [-27, -90],
+    [-18, -189],
+    [-18, -180],
+    [-18, -171],
+    [-18, -108],
+    [-18, -99],
+    [-18, -90],
+    [-18, -27],
+    [-9, -189],
+    [-9, -180],
+    [-9, -171],
+    [-9, -108],
+    [-9, -99],
+    [-9, -90],
+    [-9, -27],
+    [-9, -18],
+    [9, 18, 27, 90, 99, 108, 171, 180, 189],
+    [-199, -208],
+    [-190, -208],
+    [-190, -199],
+    [-127, -208],
+    [-127, -199],
+    [-127, -190],
+    [-118, -208],
+    [-118, -199],
+    [-118, -190],
+    [-118, -127],
+    [-109, -208],
+    [-109, -199],
+    [-109, -190],
+    [-109, -127],
+    [-109, -118],
+    [-46, -208],
+    [-46, -199],
+    [-46, -190],
+    [-46, -127],
+    [-46, -118],
+    [-46, -109],
+    [-37, -208],
+    [-37, -199],
+    [-37, -190],
+    [-37, -127],
+    [-37, -118],
+    [-37, -109],
+    [-37, -46],
+    [-28, -208],
+    [-28, -199],
+    [-28, -190],
+    [-28, -127],
+    [-28, -118],
+    [-28, -109],
+    [-28, -46],
+    [-28, -37],
+    [28, 37, 46, 109, 118, 127, 190, 199, 208],
+    [-200, -209],
+    [-191, -209],
+    [-191, -200],
+    [-128, -209],
+    [-128, -200],
+    [-128, -191],
+    [-119, -209],
+    [-119, -200],
+    [-119, -191],
+    [-119, -128],
+    [-110, -209],
+    [-110, -200],
+    [-110, -191],
+    [-110, -128],
+    [-110, -119],
+    [-47, -209],
+    [-47, -200],
+    [-47, -191],
+    [-47, -128],
+    [-47, -119],
+    [-47, -110],
+    [-38, -209],
+    [-38, -200],
+    [-38, -191],
+    [-38, -128],
+    [-38, -119],
+    [-38, -110],
+    [-38, -47],
+    [-29, -209],
+    [-29, -200],
+    [-29, -191],
+    [-29, -128],
+    [-29, -119],
+    [-29, -110],
+    [-29, -47],
+    [-29, -38],
+    [29, 38, 47, 110, 119, 128, 191, 200, 209],
+    [-201, -210],
+    [-192, -210],
+    [-192, -201],
+    [-129, -210],
+    [-129, -201],
+    [-129, -192],
+    [-120, -210],
+    [-120, -201],
+    [-120, -192],
+    [-120, -129],
+    [-111, -210],
+    [-111, -201],
+    [-111, -192],
+    [-111, -129],
+    [-111, -120],
+    [-48, -210],
+    [-48, -201],
+    [-48, -192],
+    [-48, -129],
+    [-48, -120],
+    [-48, -111],
+    [-39, -210],
+    [-39, -201],
+    [-39, -192],
+    [-39, -129],
+    [-39, -120],
+    [-39, -111],
+    [-39, -48],
+    [-30, -210],
+    [-30, -201],
+    [-30, -192],
+    [-30, -129],
+    [-30, -120],
+    [-30, -111],
+    [-30, -48],
+    [-30, -39],
+    [30, 39, 48, 111, 120, 129, 192, 201, 210],
+    [-202, -211],
+    [-193, -211],
+    [-193, -202],
+    [-130, -211],
+    [-130, -202],
+    [-130, -193],
+    [-121, -211],
+    [-121, -202],
+    [-121, -193],
+    [-121, -130],
+    [-112, -211],
+    [-112, -202],
+    [-112, -193],
+    [-112, -130],
+    [-112, -121],
+    [-49, -211],
+    [-49, -202],
+    [-49, -193],
+    [-49, -130],
+    [-49, -121],
+    [-49, -112],
+    [-40, -211],
+    [-40, -202],
+    [-40, -193],
+    [-40, -130],
+    [-40, -121],
+    [-40, -112],
+    [-40, -49],
+    [-31, -211],
+    [-31, -202],
+    [-31, -193],
+    [-31, -130],
+    [-31, -121],
+    [-31, -112],
+    [-31, -49],
+    [-31, -40],
+    [31, 40, 49, 112, 121, 130, 193, 202, 211],
+    [-203, -212],
+    [-194, -212],
+    [-194, -203],
+    [-131, -212],
+    [-131, -203],
+    [-131, -194],
+    [-122, -212],
+    [-122, -203],
+    [-122, -194],
+    [-122, -131],
+    [-113, -212],
+    [-113, -203],
+    [-113, -194],
+    [-113, -131],
+    [-113, -122],
+    [-50, -212],
+    [-50, -203],
+    [-50, -194],
+    [-50, -131],
+    [-50, -122],
+    [-50, -113],
+    [-41, -212],
+    [-41, -203],
+    [-41, -194],
+    [-41, -131],
+    [-41, -122],
+    [-41, -113],
+    [-41, -50],
+    [-32, -212],
+    [-32, -203],
+    [-32, -194],
+    [-32, -131],
+    [-32, -122],
+    [-32, -113],
+    [-32, -50],
+    [-32, -41],
+    [32, 41, 50, 113, 122, 131, 194, 203, 212],
+    [-204, -213],
+    [-195, -213],
+    [-195, -204],
+    [-132, -213],
+    [-132, -204],
+    [-132, -195],
+    [-123, -213],
+    [-123, -204],
+    [-123, -195],
+    [-123, -132],
+    [-114, -213],
+    [-114, -204],
+    [-114, -195],
+    [-114, -132],
+    [-114, -123],
+    [-51, -213],
+    [-51, -204],
+    [-51, -195],
+    [-51, -132],
+    [-51, -123],
+    [-51, -114],
+    [-42, -213],
+    [-42, -204],
+    [-42, -195],
+    [-42, -132],
+    [-42, -123],
+    [-42, -114],
+    [-42, -51],
+    [-33, -213],
+    [-33, -204],
+    [-33, -195],
+    [-33, -132],
+    [-33, -123],
+    [-33, -114],
+    [-33, -51],
+    [-33, -42],
+    [33, 42, 51, 114, 123, 132, 195, 204, 213],
+    [-205, -214],
+    [-196, -214],
+    [-196, -205],
+    [-133, -214],
+    [-133, -205],
+    [-133, -196],
+    [-124, -214],
+    [-124, -205],
+    [-124, -196],
+    [-124, -133],
+    [-115, -214],
+    [-115, -205],
+    [-115, -196],
+    [-115, -133],
+    [-115, -124],
+    [-52, -214],
+    [-52, -205],
+    [-52, -196],
+    [-52, -133],
+    [-52, -124],
+    [-52, -115],
+    [-43, -214],
+    [-43, -205],
+    [-43, -196],
+    [-43, -133],
+    [-43, -124],
+    [-43, -115],
+    [-43, -52],
+    [-34, -214],
+    [-34, -205],
+    [-34, -196],
+    [-34, -133],
+    [-34, -124],
+    [-34, -115],
+    [-34, -52],
+    [-34, -43],
+    [34, 43, 52, 115, 124, 133, 196, 205, 214],
+    [-206, -215],
+    [-197, -215],
+    [-197, -206],
+    [-134, -215],
+    [-134, -206],
+    [-134, -197],
+    [-125, -215],
+    [-125, -206],
+    [-125, -197],
+    [-125, -134],
+    [-116, -215],
+    [-116, -206],
+    [-116, -197],
+    [-116, -134],
+    [-116, -125],
+    [-53, -215],
+    [-53, -206],
+    [-53, -197],
+    [-53, -134],
+    [-53, -125],
+    [-53, -116],
+    [-44, -215],
+    [-44, -206],
+    [-44, -197],
+    [-44, -134],
+    [-44, -125],
+    [-44, -116],
+    [-44, -53],
+    [-35, -215],
+    [-35, -206],
+    [-35, -197],
+    [-35, -134],
+    [-35, -125],
+    [-35, -116],
+    [-35, -53],
+    [-35, -44],
+    [35, 44, 53, 116, 125, 134, 197, 206, 215],
+    [-207, -216],
+    [-198, -216],
+    [-198, -207],
+    [-135, -216],
+    [-135, -207],
+    [-135, -198],
+    [-126, -216],
+    [-126, -207],
+    [-126, -198],
+    [-126, -135],
+    [-117, -216],
+    [-117, -207],
+    [-117, -198],
+    [-117, -135],
+    [-117, -126],
+    [-54, -216],
+    [-54, -207],
+    [-54, -198],
+    [-54, -135],
+    [-54, -126],
+    [-54, -117],
+    [-45, -216],
+    [-45, -207],
+    [-45, -198],
+    [-45, -135],
+    [-45, -126],
+    [-45, -117],
+    [-45, -54],
+    [-36, -216],
+    [-36, -207],
+    [-36, -198],
+    [-36, -135],
+    [-36, -126],
+    [-36, -117],
+    [-36, -54],
+    [-36, -45],
+    [36, 45, 54, 117, 126, 135, 198, 207, 216],
+    [-226, -235],
+    [-217, -235],
+    [-217, -226],
+    [-154, -235],
+    [-154, -226],
+    [-154, -217],
+    [-145, -235],
+    [-145, -226],
+    [-145, -217],
+    [-145, -154],
+    [-136, -235],
+    [-136, -226],
+    [-136, -217],
+    [-136, -154],
+    [-136, -145],
+    [-73, -235],
+    [-73, -226],
+    [-73, -217],
+    [-73, -154],
+    [-73, -145],
+    [-73, -136],
+    [-64, -235],
+    [-64, -226],
+    [-64, -217],
+    [-64, -154],
+    [-64, -145],
+    [-64, -136],
+    [-64, -73],
+    [-55, -235],
+    [-55, -226],
+    [-55, -217],
+    [-55, -154],
+    [-55, -145],
+    [-55, -136],
+    [-55, -73],
+    [-55, -64],
+    [55, 64, 73, 136, 145, 154, 217, 226, 235],
+    [-227, -236],
+    [-218, -236],
+    [-218, -227],
+    [-155, -236],
+    [-155, -227],
+    [-155, -218],
+    [-146, -236],
+    [-146, -227],
+    [-146, -218],
+    [-146, -155],
+    [-137, -236],
+    [-137, -227],
+    [-137, -218],
+    [-137, -155],
+    [-137, -146],
+    [-74, -236],
+    [-74, -227],
+    [-74, -218],
+    [-74, -155],
+    [-74, -146],
+    [-74, -137],
+    [-65, -236],
+    [-65, -227],
+    [-65, -218],
+    [-65, -155],
+    [-65, -146],
+    [-65, -137],
+    [-65, -74],
+    [-56, -236],
+    [-56, -227],
+    [-56, -218],
+    [-56, -155],
+    [-56, -146],
+    [-56, -137],
+    [-56, -74],
+    [-56, -65],
+    [56, 65, 74, 137, 146, 155, 218, 227, 236],
+    [-228, -237],
+    [-219, -237],
+    [-219, -228],
+    [-156, -237],
+    [-156, -228],
+    [-156, -219],
+    [-147, -237],
+    [-147, -228],
+    [-147, -219],
+    [-147, -156],
+    [-138, -237],
+    [-138, -228],
+    [-138, -219],
+    [-138, -156],
+    [-138, -147],
+    [-75, -237],
+    [-75, -228],
+    [-75, -219],
+    [-75, -156],
+    [-75, -147],
+    [-75, -138],
+    [-66, -237],
+    [-66, -228],
+    [-66, -219],
+    [-66, -156],
+    [-66, -147],
+    [-66, -138],
+    [-66, -75],
+    [-57, -237],
+    [-57, -228],
+    [-57, -219],
+    [-57, -156],
+    [-57, -147],
+    [-57, -138],
+    [-57, -75],
+    [-57, -66],
+    [57, 66, 75, 138, 147, 156, 219, 228, 237],
+    [-229, -238],
+    [-220, -238],
+    [-220, -229],
+    [-157, -238],
+    [-157, -229],
+    [-157, -220],
+    [-148, -238],
+    [-148, -229],
+    [-148, -220],
+    [-148, -157],
+    [-139, -238],
+    [-139, -229],
+    [-139, -220],
+    [-139, -157],
+    [-139, -148],
+    [-76, -238],
+    [-76, -229],
+    [-76, -220],
+    [-76, -157],
+    [-76, -148],
+    [-76, -139],
+    [-67, -238],
+    [-67, -229],
+    [-67, -220],
+    [-67, -157],
+    [-67, -148],
+    [-67, -139],
+    [-67, -76],
+    [-58, -238],
+    [-58, -229],
+    [-58, -220],
+    [-58, -157],
+    [-58, -148],
+    [-58, -139],
+    [-58, -76],
+    [-58, -67],
+    [58, 67, 76, 139, 148, 157, 220, 229, 238],
+    [-230, -239],
+    [-221, -239],
+    [-221, -230],
+    [-158, -239],
+    [-158, -230],
+    [-158, -221],
+    [-149, -239],
+    [-149, -230],
+    [-149, -221],
+    [-149, -158],
+    [-140, -239],
+    [-140, -230],
+    [-140, -221],
+    [-140, -158],
+    [-140, -149],
+    [-77, -239],
+    [-77, -230],
+    [-77, -221],
+    [-77, -158],
+    [-77, -149],
+    [-77, -140],
+    [-68, -239],
+    [-68, -230],
+    [-68, -221],
+    [-68, -158],
+    [-68, -149],
+    [-68, -140],
+    [-68, -77],
+    [-59, -239],
+    [-59, -230],
+    [-59, -221],
+    [-59, -158],
+    [-59, -149],
+    [-59, -140],
+    [-59, -77],
+    [-59, -68],
+    [59, 68, 77, 140, 149, 158, 221, 230, 239],
+    [-231, -240],
+    [-222, -240],
+    [-222, -231],
+    [-159, -240],
+    [-159, -231],
+    [-159, -222],
+    [-150, -240],
+    [-150, -231],
+    [-150, -222],
+    [-150, -159],
+    [-141, -240],
+    [-141, -231],
+    [-141, -222],
+    [-141, -159],
+    [-141, -150],
+    [-78, -240],
+    [-78, -231],
+    [-78, -222],
+    [-78, -159],
+    [-78, -150],
+    [-78, -141],
+    [-69, -240],
+    [-69, -231],
+    [-69, -222],
+    [-69, -159],
+    [-69, -150],
+    [-69, -141],
+    [-69, -78],
+    [-60, -240],
+    [-60, -231],
+    [-60, -222],
+    [-60, -159],
+    [-60, -150],
+    [-60, -141],
+    [-60, -78],
+    [-60, -69],
+    [60, 69, 78, 141, 150, 159, 222, 231, 240],
+    [-232, -241],
+    [-223, -241],
+    [-223, -232],
+    [-160, -241],
+    [-160, -232],
+    [-160, -223],
+    [-151, -241],
+    [-151, -232],
+    [-151, -223],
+    [-151, -160],
+    [-142, -241],
+    [-142, -232],
+    [-142, -223],
+    [-142, -160],
+    [-142, -151],
+    [-79, -241],
+    [-79, -232],
+    [-79, -223],
+    [-79, -160],
+    [-79, -151],
+    [-79, -142],
+    [-70, -241],
+    [-70, -232],
+    [-70, -223],
+    [-70, -160],
+    [-70, -151],
+    [-70, -142],
+    [-70, -79],
+    [-61, -241],
+    [-61, -232],
+    [-61, -223],
+    [-61, -160],
+    [-61, -151],
+    [-61, -142],
+    [-61, -79],
+    [-61, -70],
+    [61, 70, 79, 142, 151, 160, 223, 232, 241],
+    [-233, -242],
+    [-224, -242],
+    [-224, -233],
+    [-161, -242],
+    [-161, -233],
+    [-161, -224],
+    [-152, -242],
+    [-152, -233],
+    [-152, -224],
+    [-152, -161],
+    [-143, -242],
+    [-143, -233],
+    [-143, -224],
+    [-143, -161],
+    [-143, -152],
+    [-80, -242],
+    [-80, -233],
+    [-80, -224],
+    [-80, -161],
+    [-80, -152],
+    [-80, -143],
+    [-71, -242],
+    [-71, -233],
+    [-71, -224],
+    [-71, -161],
+    [-71, -152],
+    [-71, -143],
+    [-71, -80],
+    [-62, -242],
+    [-62, -233],
+    [-62, -224],
+    [-62, -161],
+    [-62, -152],
+    [-62, -143],
+    [-62, -80],
+    [-62, -71],
+    [62, 71, 80, 143, 152, 161, 224, 233, 242],
+    [-234, -243],
+    [-225, -243],
+    [-225, -234],
+    [-162, -243],
+    [-162, -234],
+    [-162, -225],
+    [-153, -243],
+    [-153, -234],
+    [-153, -225],
+    [-153, -162],
+    [-144, -243],
+    [-144, -234],
+    [-144, -225],
+    [-144, -162],
+    [-144, -153],
+    [-81, -243],
+    [-81, -234],
+    [-81, -225],
+    [-81, -162],
+    [-81, -153],
+    [-81, -144],
+    [-72, -243],
+    [-72, -234],
+    [-72, -225],
+    [-72, -162],
+    [-72, -153],
+    [-72, -144],
+    [-72, -81],
+    [-63, -243],
+    [-63, -234],
+    [-63, -225],
+    [-63, -162],
+    [-63, -153],
+    [-63, -144],
+    [-63, -81],
+    [-63, -72],
+    [63, 72, 81, 144, 153, 162, 225, 234, 243],
+    [-415, -424],
+    [-406, -424],
+    [-406, -415],
+    [-343, -424],
+    [-343, -415],
+    [-343, -406],
+    [-334, -424],
+    [-334, -415],
+    [-334, -406],
+    [-334, -343],
+    [-325, -424],
+    [-325, -415],
+    [-325, -406],
+    [-325, -343],
+    [-325, -334],
+    [-262, -424],
+    [-262, -415],
+    [-262, -406],
+    [-262, -343],
+    [-262, -334],
+    [-262, -325],
+    [-253, -424],
+    [-253, -415],
+    [-253, -406],
+    [-253, -343],
+    [-253, -334],
+    [-253, -325],
+    [-253, -262],
+    [-244, -424],
+    [-244, -415],
+    [-244, -406],
+    [-244, -343],
+    [-244, -334],
+    [-244, -325],
+    [-244, -262],
+    [-244, -253],
+    [244, 253, 262, 325, 334, 343, 406, 415, 424],
+    [-416, -425],
+    [-407, -425],
+    [-407, -416],
+    [-344, -425],
+    [-344, -416],
+    [-344, -407],
+    [-335, -425],
+    [-335, -416],
+    [-335, -407],
+    [-335, -344],
+    [-326, -425],
+    [-326, -416],
+    [-326, -407],
+    [-326, -344],
+    [-326, -335],
+    [-263, -425],
+    [-263, -416],
+    [-263, -407],
+    [-263, -344],
+    [-263, -335],
+    [-263, -326],
+    [-254, -425],
+    [-254, -416],
+    [-254, -407],
+    [-254, -344],
+    [-254, -335],
+    [-254, -326],
+    [-254, -263],
+    [-245, -425],
+    [-245, -416],
+    [-245, -407],
+    [-245, -344],
+    [-245, -335],
+    [-245, -326],
+    [-245, -263],
+    [-245, -254],
+    [245, 254, 263, 326, 335, 344, 407, 416, 425],
+    [-417, -426],
+    [-408, -426],
+    [-408, -417],
+    [-345, -426],
+    [-345, -417],
+    [-345, -408],
+    [-336, -426],
+    [-336, -417],
+    [-336, -408],
+    [-336, -345],
+    [-327, -426],
+    [-327, -417],
+    [-327, -408],
+    [-327, -345],
+    [-327, -336],
+    [-264, -426],
+    [-264, -417],
+    [-264, -408],
+    [-264, -345],
+    [-264, -336],
+    [-264, -327],
+    [-255, -426],
+    [-255, -417],
+    [-255, -408],
+    [-255, -345],
+    [-255, -336],
+    [-255, -327],
+    [-255, -264],
+    [-246, -426],
+    [-246, -417],
+    [-246, -408],
+    [-246, -345],
+    [-246, -336],
+    [-246, -327],
+    [-246, -264],
+    [-246, -255],
+    [246, 255, 264, 327, 336, 345, 408, 417, 426],
+    [-418, -427],
+    [-409, -427],
+    [-409, -418],
+    [-346, -427],
+    [-346, -418],
+    [-346, -409],
+    [-337, -427],
+    [-337, -418],
+    [-337, -409],
+    [-337, -346],
+    [-328, -427],
+    [-328, -418],
+    [-328, -409],
+    [-328, -346],
+    [-328, -337],
+    [-265, -427],
+    [-265, -418],
+    [-265, -409],
+    [-265, -346],
+    [-265, -337],
+    [-265, -328],
+    [-256, -427],
+    [-256, -418],
+    [-256, -409],
+    [-256, -346],
+    [-256, -337],
+    [-256, -328],
+    [-256, -265],
+    [-247, -427],
+    [-247, -418],
+    [-247, -409],
+    [-247, -346],
+    [-247, -337],
+    [-247, -328],
+    [-247, -265],
+    [-247, -256],
+    [247, 256, 265, 328, 337, 346, 409, 418, 427],
+    [-419, -428],
+    [-410, -428],
+    [-410, -419],
+    [-347, -428],
+    [-347, -419],
+    [-347, -410],
+    [-338, -428],
+    [-338, -419],
+    [-338, -410],
+    [-338, -347],
+    [-329, -428],
+    [-329, -419],
+    [-329, -410],
+    [-329, -347],
+    [-329, -338],
+    [-266, -428],
+    [-266, -419],
+    [-266, -410],
+    [-266, -347],
+    [-266, -338],
+    [-266, -329],
+    [-257, -428],
+    [-257, -419],
+    [-257, -410],
+    [-257, -347],
+    [-257, -338],
+    [-257, -329],
+    [-257, -266],
+    [-248, -428],
+    [-248, -419],
+    [-248, -410],
+    [-248, -347],
+    [-248, -338],
+    [-248, -329],
+    [-248, -266],
+    [-248, -257],
+    [248, 257, 266, 329, 338, 347, 410, 419, 428],
+    [-420, -429],
+    [-411, -429],
+    [-411, -420],
+    [-348, -429],
+    [-348, -420],
+    [-348, -411],
+    [-339, -429],
+    [-339, -420],
+    [-339, -411],
+    [-339, -348],
+    [-330, -429],
+    [-330, -420],
+    [-330, -411],
+    [-330, -348],
+    [-330, -339],
+    [-267, -429],
+    [-267, -420],
+    [-267, -411],
+    [-267, -348],
+    [-267, -339],
+    [-267, -330],
+    [-258, -429],
+    [-258, -420],
+    [-258, -411],
+    [-258, -348],
+    [-258, -339],
+    [-258, -330],
+    [-258, -267],
+    [-249, -429],
+    [-249, -420],
+    [-249, -411],
+    [-249, -348],
+    [-249, -339],
+    [-249, -330],
+    [-249, -267],
+    [-249, -258],
+    [249, 258, 267, 330, 339, 348, 411, 420, 429],
+    [-421, -430],
+    [-412, -430],
+    [-412, -421],
+    [-349, -430],
+    [-349, -421],
+    [-349, -412],
+    [-340, -430],
+    [-340, -421],
+    [-340, -412],
+    [-340, -349],
+    [-331, -430],
+    [-331, -421],
+    [-331, -412],
+    [-331, -349],
+    [-331, -340],
+    [-268, -430],
+    [-268, -421],
+    [-268, -412],
+    [-268, -349],
+    [-268, -340],
+    [-268, -331],
+    [-259, -430],
+    [-259, -421],
+    [-259, -412],
+    [-259, -349],
+    [-259, -340],
+    [-259, -331],
+    [-259, -268],
+    [-250, -430],
+    [-250, -421],
+    [-250, -412],
+    [-250, -349],
+    [-250, -340],
+    [-250, -331],
+    [-250, -268],
+    [-250, -259],
+    [250, 259, 268, 331, 340, 349, 412, 421, 430],
+    [-422, -431],
+    [-413, -431],
+    [-413, -422],
+    [-350, -431],
+    [-350, -422],
+    [-350, -413],
+    [-341, -431],
+    [-341, -422],
+    [-341, -413],
+    [-341, -350],
+    [-332, -431],
+    [-332, -422],
+    [-332, -413],
+    [-332, -350],
+    [-332, -341],
+    [-269, -431],
+    [-269, -422],
+    [-269, -413],
+    [-269, -350],
+    [-269, -341],
+    [-269, -332],
+    [-260, -431],
+    [-260, -422],
+    [-260, -413],
+    [-260, -350],
+    [-260, -341],
+    [-260, -332],
+    [-260, -269],
+    [-251, -431],
+    [-251, -422],
+    [-251, -413],
+    [-251, -350],
+    [-251, -341],
+    [-251, -332],
+    [-251, -269],
+    [-251, -260],
+    [251, 260, 269, 332, 341, 350, 413, 422, 431],
+    [-423, -432],
+    [-414, -432],
+    [-414, -423],
+    [-351, -432],
+    [-351, -423],
+    [-351, -414],
+    [-342, -432],
+    [-342, -423],
+    [-342, -414],
+    [-342, -351],
+    [-333, -432],
+    [-333, -423],
+    [-333, -414],
+    [-333, -351],
+    [-333, -342],
+    [-270, -432],
+    [-270, -423],
+    [-270, -414],
+    [-270, -351],
+    [-270, -342],
+    [-270, -333],
+    [-261, -432],
+    [-261, -423],
+    [-261, -414],
+    [-261, -351],
+    [-261, -342],
+    [-261, -333],
+    [-261, -270],
+    [-252, -432],
+    [-252, -423],
+    [-252, -414],
+    [-252, -351],
+    [-252, -342],
+    [-252, -333],
+    [-252, -270],
+    [-252, -261],
+    [252, 261, 270, 333, 342, 351, 414, 423, 432],
+    [-442, -451],
+    [-433, -451],
+    [-433, -442],
+    [-370, -451],
+    [-370, -442],
+    [-370, -433],
+    [-361, -451],
+    [-361, -442],
+    [-361, -433],
+    [-361, -370],
+    [-352, -451],
+    [-352, -442],
+    [-352, -433],
+    [-352, -370],
+    [-352, -361],
+    [-289, -451],
+    [-289, -442],
+    [-289, -433],
+    [-289, -370],
+    [-289, -361],
+    [-289, -352],
+    [-280, -451],
+    [-280, -442],
+    [-280, -433],
+    [-280, -370],
+    [-280, -361],
+    [-280, -352],
+    [-280, -289],
+    [-271, -451],
+    [-271, -442],
+    [-271, -433],
+    [-271, -370],
+    [-271, -361],
+    [-271, -352],
+    [-271, -289],
+    [-271, -280],
+    [271, 280, 289, 352, 361, 370, 433, 442, 451],
+    [-443, -452],
+    [-434, -452],
+    [-434, -443],
+    [-371, -452],
+    [-371, -443],
+    [-371, -434],
+    [-362, -452],
+    [-362, -443],
+    [-362, -434],
+    [-362, -371],
+    [-353, -452],
+    [-353, -443],
+    [-353, -434],
+    [-353, -371],
+    [-353, -362],
+    [-290, -452],
+    [-290, -443],
+    [-290, -434],
+    [-290, -371],
+    [-290, -362],
+    [-290, -353],
+    [-281, -452],
+    [-281, -443],
+    [-281, -434],
+    [-281, -371],
+    [-281, -362],
+    [-281, -353],
+    [-281, -290],
+    [-272, -452],
+    [-272, -443],
+    [-272, -434],
+    [-272, -371],
+    [-272, -362],
+    [-272, -353],
+    [-272, -290],
+    [-272, -281],
+    [272, 281, 290, 353, 362, 371, 434, 443, 452],
+    [-444, -453],
+    [-435, -453],
+    [-435, -444],
+    [-372, -453],
+    [-372, -444],
+    [-372, -435],
+    [-363, -453],
+    [-363, -444],
+    [-363, -435],
+    [-363, -372],
+    [-354, -453],
+    [-354, -444],
+    [-354, -435],
+    [-354, -372],
+    [-354, -363],
+    [-291, -453],
+    [-291, -444],
+    [-291, -435],
+    [-291, -372],
+    [-291, -363],
+    [-291, -354],
+    [-282, -453],
+    [-282, -444],
+    [-282, -435],
+    [-282, -372],
+    [-282, -363],
+    [-282, -354],
+    [-282, -291],
+    [-273, -453],
+    [-273, -444],
+    [-273, -435],
+    [-273, -372],
+    [-273, -363],
+    [-273, -354],
+    [-273, -291],
+    [-273, -282],
+    [273, 282, 291, 354, 363, 372, 435, 444, 453],
+    [-445, -454],
+    [-436, -454],
+    [-436, -445],
+    [-373, -454],
+    [-373, -445],
+    [-373, -436],
+    [-364, -454],
+    [-364, -445],
+    [-364, -436],
+    [-364, -373],
+    [-355, -454],
+    [-355, -445],
+    [-355, -436],
+    [-355, -373],
+    [-355, -364],
+    [-292, -454],
+    [-292, -445],
+    [-292, -436],
+    [-292, -373],
+    [-292, -364],
+    [-292, -355],
+    [-283, -454],
+    [-283, -445],
+    [-283, -436],
+    [-283, -373],
+    [-283, -364],
+    [-283, -355],
+    [-283, -292],
+    [-274, -454],
+    [-274, -445],
+    [-274, -436],
+    [-274, -373],
+    [-274, -364],
+    [-274, -355],
+    [-274, -292],
+    [-274, -283],
+    [274, 283, 292, 355, 364, 373, 436, 445, 454],
+    [-446, -455],
+    [-437, -455],
+    [-437, -446],
+    [-374, -455],
+    [-374, -446],
+    [-374, -437],
+    [-365, -455],
+    [-365, -446],
+    [-365, -437],
+    [-365, -374],
+    [-356, -455],
+    [-356, -446],
+    [-356, -437],
+    [-356, -374],
+    [-356, -365],
+    [-293, -455],
+    [-293, -446],
+    [-293, -437],
+    [-293, -374],
+    [-293, -365],
+    [-293, -356],
+    [-284, -455],
+    [-284, -446],
+    [-284, -437],
+    [-284, -374],
+    [-284, -365],
+    [-284, -356],
+    [-284, -293],
+    [-275, -455],
+    [-275, -446],
+    [-275, -437],
+    [-275, -374],
+    [-275, -365],
+    [-275, -356],
+    [-275, -293],
+    [-275, -284],
+    [275, 284, 293, 356, 365, 374, 437, 446, 455],
+    [-447, -456],
+    [-438, -456],
+    [-438, -447],
+    [-375, -456],
+    [-375, -447],
+    [-375, -438],
+    [-366, -456],
+    [-366, -447],
+    [-366, -438],
+    [-366, -375],
+    [-357, -456],
+    [-357, -447],
+    [-357, -438],
+    [-357, -375],
+    [-357, -366],
+    [-294, -456],
+    [-294, -447],
+    [-294, -438],
+    [-294, -375],
+    [-294, -366],
+    [-294, -357],
+    [-285, -456],
+    [-285, -447],
+    [-285, -438],
+    [-285, -375],
+    [-285, -366],
+    [-285, -357],
+    [-285, -294],
+    [-276, -456],
+    [-276, -447],
+    [-276, -438],
+    [-276, -375],
+    [-276, -366],
+    [-276, -357],
+    [-276, -294],
+    [-276, -285],
+    [276, 285, 294, 357, 366, 375, 438, 447, 456],
+    [-448, -457],
+    [-439, -457],
+    [-439, -448],
+    [-376, -457],
+    [-376, -448],
+    [-376, -439],
+    [-367, -457],
+    [-367, -448],
+    [-367, -439],
+    [-367, -376],
+    [-358, -457],
+    [-358, -448],
+    [-358, -439],
+    [-358, -376],
+    [-358, -367],
+    [-295, -457],
+    [-295, -448],
+    [-295, -439],
+    [-295, -376],
+    [-295, -367],
+    [-295, -358],
+    [-286, -457],
+    [-286, -448],
+    [-286, -439],
+    [-286, -376],
+    [-286, -367],
+    [-286, -358],
+    [-286, -295],
+    [-277, -457],
+    [-277, -448],
+    [-277, -439],
+    [-277, -376],
+    [-277, -367],
+    [-277, -358],
+    [-277, -295],
+    [-277, -286],
+    [277, 286, 295, 358, 367, 376, 439, 448, 457],
+    [-449, -458],
+    [-440, -458],
+    [-440, -449],
+    [-377, -458],
+    [-377, -449],
+    [-377, -440],
+    [-368, -458],
+    [-368, -449],
+    [-368, -440],
+    [-368, -377],
+    [-359, -458],
+    [-359, -449],
+    [-359, -440],
+    [-359, -377],
+    [-359, -368],
+    [-296, -458],
+    [-296, -449],
+    [-296, -440],
+    [-296, -377],
+    [-296, -368],
+    [-296, -359],
+    [-287, -458],
+    [-287, -449],
+    [-287, -440],
+    [-287, -377],
+    [-287, -368],
+    [-287, -359],
+    [-287, -296],
+    [-278, -458],
+    [-278, -449],
+    [-278, -440],
+    [-278, -377],
+    [-278, -368],
+    [-278, -359],
+    [-278, -296],
+    [-278, -287],
+    [278, 287, 296, 359, 368, 377, 440, 449, 458],
+    [-450, -459],
+    [-441, -459],
+    [-441, -450],
+    [-378, -459],
+    [-378, -450],
+    [-378, -441],
+    [-369, -459],
+    [-369, -450],
+    [-369, -441],
+    [-369, -378],
+    [-360, -459],
+    [-360, -450],
+    [-360, -441],
+    [-360, -378],
+    [-360, -369],
+    [-297, -459],
+    [-297, -450],
+    [-297, -441],
+    [-297, -378],
+    [-297, -369],
+    [-297, -360],
+    [-288, -459],
+    [-288, -450],
+    [-288, -441],
+    [-288, -378],
+    [-288, -369],
+    [-288, -360],
+    [-288, -297],
+    [-279, -459],
+    [-279, -450],
+    [-279, -441],
+    [-279, -378],
+    [-279, -369],
+    [-279, -360],
+    [-279, -297],
+    [-279, -288],
+    [279, 288, 297, 360, 369, 378, 441, 450, 459],
+    [-469, -478],
+    [-460, -478],
+    [-460, -469],
+    [-397, -478],
+    [-397, -469],
+    [-397, -460],
+    [-388, -478],
+    [-388, -469],
+    [-388, -460],
+    [-388, -397],
+    [-379, -478],
+    [-379, -469],
+    [-379, -460],
+    [-379, -397],
+    [-379, -388],
+    [-316, -478],
+    [-316, -469],
+    [-316, -460],
+    [-316, -397],
+    [-316, -388],
+    [-316, -379],
+    [-307, -478],
+    [-307, -469],
+    [-307, -460],
+    [-307, -397],
+    [-307, -388],
+    [-307, -379],
+    [-307, -316],
+    [-298, -478],
+    [-298, -469],
+    [-298, -460],
+    [-298, -397],
+    [-298, -388],
+    [-298, -379],
+    [-298, -316],
+    [-298, -307],
+    [298, 307, 316, 379, 388, 397, 460, 469, 478],
+    [-470, -479],
+    [-461, -479],
+    [-461, -470],
+    [-398, -479],
+    [-398, -470],
+    [-398, -461],
+    [-389, -479],
+    [-389, -470],
+    [-389, -461],
+    [-389, -398],
+    [-380, -479],
+    [-380, -470],
+    [-380, -461],
+    [-380, -398],
+    [-380, -389],
+    [-317, -479],
+    [-317, -470],
+    [-317, -461],
+    [-317, -398],
+    [-317, -389],
+    [-317, -380],
+    [-308, -479],
+    [-308, -470],
+    [-308, -461],
+    [-308, -398],
+    [-308, -389],
+    [-308, -380],
+    [-308, -317],
+    [-299, -479],
+    [-299, -470],
+    [-299, -461],
+    [-299, -398],
+    [-299, -389],
+    [-299, -380],
+    [-299, -317],
+    [-299, -308],
+    [299, 308, 317, 380, 389, 398, 461, 470, 479],
+    [-471, -480],
+    [-462, -480],
+    [-462, -471],
+    [-399, -480],
+    [-399, -471],
+    [-399, -462],
+    [-390, -480],
+    [-390, -471],
+    [-390, -462],
+    [-390, -399],
+    [-381, -480],
+    [-381, -471],
+    [-381, -462],
+    [-381, -399],
+    [-381, -390],
+    [-318, -480],
+    [-318, -471],
+    [-318, -462],
+    [-318, -399],
+    [-318, -390],
+    [-318, -381],
+    [-309, -480],
+    [-309, -471],
+    [-309, -462],
+    [-309, -399],
+    [-309, -390],
+    [-309, -381],
+    [-309, -318],
+    [-300, -480],
+    [-300, -471],
+    [-300, -462],
+    [-300, -399],
+    [-300, -390],
+    [-300, -381],
+    [-300, -318],
+    [-300, -309],
+    [300, 309, 318, 381, 390, 399, 462, 471, 480],
+    [-472, -481],
+    [-463, -481],
+    [-463, -472],
+    [-400, -481],
+    [-400, -472],
+    [-400, -463],
+    [-391, -481],
+    [-391, -472],
+    [-391, -463],
+    [-391, -400],
+    [-382, -481],
+    [-382, -472],
+    [-382, -463],
+    [-382, -400],
+    [-382, -391],
+    [-319, -481],
+    [-319, -472],
+    [-319, -463],
+    [-319, -400],
+    [-319, -391],
+    [-319, -382],
+    [-310, -481],
+    [-310, -472],
+    [-310, -463],
+    [-310, -400],
+    [-310, -391],
+    [-310, -382],
+    [-310, -319],
+    [-301, -481],
+    [-301, -472],
+    [-301, -463],
+    [-301, -400],
+    [-301, -391],
+    [-301, -382],
+    [-301, -319],
+    [-301, -310],
+    [301, 310, 319, 382, 391, 400, 463, 472, 481],
+    [-473, -482],
+    [-464, -482],
+    [-464, -473],
+    [-401, -482],
+    [-401, -473],
+    [-401, -464],
+    [-392, -482],
+    [-392, -473],
+    [-392, -464],
+    [-392, -401],
+    [-383, -482],
+    [-383, -473],
+    [-383, -464],
+    [-383, -401],
+    [-383, -392],
+    [-320, -482],
+    [-320, -473],
+    [-320, -464],
+    [-320, -401],
+    [-320, -392],
+    [-320, -383],
+    [-311, -482],
+    [-311, -473],
+    [-311, -464],
+    [-311, -401],
+    [-311, -392],
+    [-311, -383],
+    [-311, -320],
+    [-302, -482],
+    [-302, -473],
+    [-302, -464],
+    [-302, -401],
+    [-302, -392],
+    [-302, -383],
+    [-302, -320],
+    [-302, -311],
+    [302, 311, 320, 383, 392, 401, 464, 473, 482],
+    [-474, -483],
+    [-465, -483],
+    [-465, -474],
+    [-402, -483],
+    [-402, -474],
+    [-402, -465],
+    [-393, -483],
+    [-393, -474],
+    [-393, -465],
+    [-393, -402],
+    [-384, -483],
+    [-384, -474],
+    [-384, -465],
+    [-384, -402],
+    [-384, -393],
+    [-321, -483],
+    [-321, -474],
+    [-321, -465],
+    [-321, -402],
+    [-321, -393],
+    [-321, -384],
+    [-312, -483],
+    [-312, -474],
+    [-312, -465],
+    [-312, -402],
+    [-312, -393],
+    [-312, -384],
+    [-312, -321],
+    [-303, -483],
+    [-303, -474],
+    [-303, -465],
+    [-303, -402],
+    [-303, -393],
+    [-303, -384],
+    [-303, -321],
+    [-303, -312],
+    [303, 312, 321, 384, 393, 402, 465, 474, 483],
+    [-475, -484],
+    [-466, -484],
+    [-466, -475],
+    [-403, -484],
+    [-403, -475],
+    [-403, -466],
+    [-394, -484],
+    [-394, -475],
+    [-394, -466],
+    [-394, -403],
+    [-385, -484],
+    [-385, -475],
+    [-385, -466],
+    [-385, -403],
+    [-385, -394],
+    [-322, -484],
+    [-322, -475],
+    [-322, -466],
+    [-322, -403],
+    [-322, -394],
+    [-322, -385],
+    [-313, -484],
+    [-313, -475],
+    [-313, -466],
+    [-313, -403],
+    [-313, -394],
+    [-313, -385],
+    [-313, -322],
+    [-304, -484],
+    [-304, -475],
+    [-304, -466],
+    [-304, -403],
+    [-304, -394],
+    [-304, -385],
+    [-304, -322],
+    [-304, -313],
+    [304, 313, 322, 385, 394, 403, 466, 475, 484],
+    [-476, -485],
+    [-467, -485],
+    [-467, -476],
+    [-404, -485],
+    [-404, -476],
+    [-404, -467],
+    [-395, -485],
+    [-395, -476],
+    [-395, -467],
+    [-395, -404],
+    [-386, -485],
+    [-386, -476],
+    [-386, -467],
+    [-386, -404],
+    [-386, -395],
+    [-323, -485],
+    [-323, -476],
+    [-323, -467],
+    [-323, -404],
+    [-323, -395],
+    [-323, -386],
+    [-314, -485],
+    [-314, -476],
+    [-314, -467],
+    [-314, -404],
+    [-314, -395],
+    [-314, -386],
+    [-314, -323],
+    [-305, -485],
+    [-305, -476],
+    [-305, -467],
+    [-305, -404],
+    [-305, -395],
+    [-305, -386],
+    [-305, -323],
+    [-305, -314],
+    [305, 314, 323, 386, 395, 404, 467, 476, 485],
+    [-477, -486],
+    [-468, -486],
+    [-468, -477],
+    [-405, -486],
+    [-405, -477],
+    [-405, -468],
+    [-396, -486],
+    [-396, -477],
+    [-396, -468],
+    [-396, -405],
+    [-387, -486],
+    [-387, -477],
+    [-387, -468],
+    [-387, -405],
+    [-387, -396],
+    [-324, -486],
+    [-324, -477],
+    [-324, -468],
+    [-324, -405],
+    [-324, -396],
+    [-324, -387],
+    [-315, -486],
+    [-315, -477],
+    [-315, -468],
+    [-315, -405],
+    [-315, -396],
+    [-315, -387],
+    [-315, -324],
+    [-306, -486],
+    [-306, -477],
+    [-306, -468],
+    [-306, -405],
+    [-306, -396],
+    [-306, -387],
+    [-306, -324],
+    [-306, -315],
+    [306, 315, 324, 387, 396, 405, 468, 477, 486],
+    [-658, -667],
+    [-649, -667],
+    [-649, -658],
+    [-586, -667],
+    [-586, -658],
+    [-586, -649],
+    [-577, -667],
+    [-577, -658],
+    [-577, -649],
+    [-577, -586],
+    [-568, -667],
+    [-568, -658],
+    [-568, -649],
+    [-568, -586],
+    [-568, -577],
+    [-505, -667],
+    [-505, -658],
+    [-505, -649],
+    [-505, -586],
+    [-505, -577],
+    [-505, -568],
+    [-496, -667],
+    [-496, -658],
+    [-496, -649],
+    [-496, -586],
+    [-496, -577],
+    [-496, -568],
+    [-496, -505],
+    [-487, -667],
+    [-487, -658],
+    [-487, -649],
+    [-487, -586],
+    [-487, -577],
+    [-487, -568],
+    [-487, -505],
+    [-487, -496],
+    [487, 496, 505, 568, 577, 586, 649, 658, 667],
+    [-659, -668],
+    [-650, -668],
+    [-650, -659],
+    [-587, -668],
+    [-587, -659],
+    [-587, -650],
+    [-578, -668],
+    [-578, -659],
+    [-578, -650],
+    [-578, -587],
+    [-569, -668],
+    [-569, -659],
+    [-569, -650],
+    [-569, -587],
+    [-569, -578],
+    [-506, -668],
+    [-506, -659],
+    [-506, -650],
+    [-506, -587],
+    [-506, -578],
+    [-506, -569],
+    [-497, -668],
+    [-497, -659],
+    [-497, -650],
+    [-497, -587],
+    [-497, -578],
+    [-497, -569],
+    [-497, -506],
+    [-488, -668],
+    [-488, -659],
+    [-488, -650],
+    [-488, -587],
+    [-488, -578],
+    [-488, -569],
+    [-488, -506],
+    [-488, -497],
+    [488, 497, 506, 569, 578, 587, 650, 659, 668],
+    [-660, -669],
+    [-651, -669],
+    [-651, -660],
+    [-588, -669],
+    [-588, -660],
+    [-588, -651],
+    [-579, -669],
+    [-579, -660],
+    [-579, -651],
+    [-579, -588],
+    [-570, -669],
+    [-570, -660],
+    [-570, -651],
+    [-570, -588],
+    [-570, -579],
+    [-507, -669],
+    [-507, -660],
+    [-507, -651],
+    [-507, -588],
+    [-507, -579],
+    [-507, -570],
+    [-498, -669],
+    [-498, -660],
+    [-498, -651],
+    [-498, -588],
+    [-498, -579],
+    [-498, -570],
+    [-498, -507],
+    [-489, -669],
+    [-489, -660],
+    [-489, -651],
+    [-489, -588],
+    [-489, -579],
+    [-489, -570],
+    [-489, -507],
+    [-489, -498],
+    [489, 498, 507, 570, 579, 588, 651, 660, 669],
+    [-661, -670],
+    [-652, -670],
+    [-652, -661],
+    [-589, -670],
+    [-589, -661],
+    [-589, -652],
+    [-580, -670],
+    [-580, -661],
+    [-580, -652],
+    [-580, -589],
+    [-571, -670],
+    [-571, -661],
+    [-571, -652],
+    [-571, -589],
+    [-571, -580],
+    [-508, -670],
+    [-508, -661],
+    [-508, -652],
+    [-508, -589],
+    [-508, -580],
+    [-508, -571],
+    [-499, -670],
+    [-499, -661],
+    [-499, -652],
+    [-499, -589],
+    [-499, -580],
+    [-499, -571],
+    [-499, -508],
+    [-490, -670],
+    [-490, -661],
+    [-490, -652],
+    [-490, -589],
+    [-490, -580],
+    [-490, -571],
+    [-490, -508],
+    [-490, -499],
+    [490, 499, 508, 571, 580, 589, 652, 661, 670],
+    [-662, -671],
+    [-653, -671],
+    [-653, -662],
+    [-590, -671],
+    [-590, -662],
+    [-590, -653],
+    [-581, -671],
+    [-581, -662],
+    [-581, -653],
+    [-581, -590],
+    [-572, -671],
+    [-572, -662],
+    [-572, -653],
+    [-572, -590],
+    [-572, -581],
+    [-509, -671],
+    [-509, -662],
+    [-509, -653],
+    [-509, -590],
+    [-509, -581],
+    [-509, -572],
+    [-500, -671],
+    [-500, -662],
+    [-500, -653],
+    [-500, -590],
+    [-500, -581],
+    [-500, -572],
+    [-500, -509],
+    [-491, -671],
+    [-491, -662],
+    [-491, -653],
+    [-491, -590],
+    [-491, -581],
+    [-491, -572],
+    [-491, -509],
+    [-491, -500],
+    [491, 500, 509, 572, 581, 590, 653, 662, 671],
+    [-663, -672],
+    [-654, -672],
+    [-654, -663],
+    [-591, -672],
+    [-591, -663],
+    [-591, -654],
+    [-582, -672],
+    [-582, -663],
+    [-582, -654],
+    [-582, -591],
+    [-573, -672],
+    [-573, -663],
+    [-573, -654],
+    [-573, -591],
+    [-573, -582],
+    [-510, -672],
+    [-510, -663],
+    [-510, -654],
+    [-510, -591],
+    [-510, -582],
+    [-510, -573],
+    [-501, -672],
+    [-501, -663],
+    [-501, -654],
+    [-501, -591],
+    [-501, -582],
+    [-501, -573],
+    [-501, -510],
+    [-492, -672],
+    [-492, -663],
+    [-492, -654],
+    [-492, -591],
+    [-492, -582],
+    [-492, -573],
+    [-492, -510],
+    [-492, -501],
+    [492, 501, 510, 573, 582, 591, 654, 663, 672],
+    [-664, -673],
+    [-655, -673],
+    [-655, -664],
+    [-592, -673],
+    [-592, -664],
+    [-592, -655],
+    [-583, -673],
+    [-583, -664],
+    [-583, -655],
+    [-583, -592],
+    [-574, -673],
+    [-574, -664],
+    [-574, -655],
+    [-574, -592],
+    [-574, -583],
+    [-511, -673],
+    [-511, -664],
+    [-511, -655],
+    [-511, -592],
+    [-511, -583],
+    [-511, -574],
+    [-502, -673],
+    [-502, -664],
+    [-502, -655],
+    [-502, -592],
+    [-502, -583],
+    [-502, -574],
+    [-502, -511],
+    [-493, -673],
+    [-493, -664],
+    [-493, -655],
+    [-493, -592],
+    [-493, -583],
+    [-493, -574],
+    [-493, -511],
+    [-493, -502],
+    [493, 502, 511, 574, 583, 592, 655, 664, 673],
+    [-665, -674],
+    [-656, -674],
+    [-656, -665],
+    [-593, -674],
+    [-593, -665],
+    [-593, -656],
+    [-584, -674],
+    [-584, -665],
+    [-584, -656],
+    [-584, -593],
+    [-575, -674],
+    [-575, -665],
+    [-575, -656],
+    [-575, -593],
+    [-575, -584],
+    [-512, -674],
+    [-512, -665],
+    [-512, -656],
+    [-512, -593],
+    [-512, -584],
+    [-512, -575],
+    [-503, -674],
+    [-503, -665],
+    [-503, -656],
+    [-503, -593],
+    [-503, -584],
+    [-503, -575],
+    [-503, -512],
+    [-494, -674],
+    [-494, -665],
+    [-494, -656],
+    [-494, -593],
+    [-494, -584],
+    [-494, -575],
+    [-494, -512],
+    [-494, -503],
+    [494, 503, 512, 575, 584, 593, 656, 665, 674],
+    [-666, -675],
+    [-657, -675],
+    [-657, -666],
+    [-594, -675],
+    [-594, -666],
+    [-594, -657],
+    [-585, -675],
+    [-585, -666],
+    [-585, -657],
+    [-585, -594],
+    [-576, -675],
+    [-576, -666],
+    [-576, -657],
+    [-576, -594],
+    [-576, -585],
+    [-513, -675],
+    [-513, -666],
+    [-513, -657],
+    [-513, -594],
+    [-513, -585],
+    [-513, -576],
+    [-504, -675],
+    [-504, -666],
+    [-504, -657],
+    [-504, -594],
+    [-504, -585],
+    [-504, -576],
+    [-504, -513],
+    [-495, -675],
+    [-495, -666],
+    [-495, -657],
+    [-495, -594],
+    [-495, -585],
+    [-495, -576],
+    [-495, -513],
+    [-495, -504],
+    [495, 504, 513, 576, 585, 594, 657, 666, 675],
+    [-685, -694],
+    [-676, -694],
+    [-676, -685],
+    [-613, -694],
+    [-613, -685],
+    [-613, -676],
+    [-604, -694],
+    [-604, -685],
+    [-604, -676],
+    [-604, -613],
+    [-595, -694],
+    [-595, -685],
+    [-595, -676],
+    [-595, -613],
+    [-595, -604],
+    [-532, -694],
+    [-532, -685],
+    [-532, -676],
+    [-532, -613],
+    [-532, -604],
+    [-532, -595],
+    [-523, -694],
+    [-523, -685],
+    [-523, -676],
+    [-523, -613],
+    [-523, -604],
+    [-523, -595],
+    [-523, -532],
+    [-514, -694],
+    [-514, -685],
+    [-514, -676],
+    [-514, -613],
+    [-514, -604],
+    [-514, -595],
+    [-514, -532],
+    [-514, -523],
+    [514, 523, 532, 595, 604, 613, 676, 685, 694],
+    [-686, -695],
+    [-677, -695],
+    [-677, -686],
+    [-614, -695],
+    [-614, -686],
+    [-614, -677],
+    [-605, -695],
+    [-605, -686],
+    [-605, -677],
+    [-605, -614],
+    [-596, -695],
+    [-596, -686],
+    [-596, -677],
+    [-596, -614],
+    [-596, -605],
+    [-533, -695],
+    [-533, -686],
+    [-533, -677],
+    [-533, -614],
+    [-533, -605],
+    [-533, -596],
+    [-524, -695],
+    [-524, -686],
+    [-524, -677],
+    [-524, -614],
+    [-524, -605],
+    [-524, -596],
+    [-524, -533],
+    [-515, -695],
+    [-515, -686],
+    [-515, -677],
+    [-515, -614],
+    [-515, -605],
+    [-515, -596],
+    [-515, -533],
+    [-515, -524],
+    [515, 524, 533, 596, 605, 614, 677, 686, 695],
+    [-687, -696],
+    [-678, -696],
+    [-678, -687],
+    [-615, -696],
+    [-615, -687],
+    [-615, -678],
+    [-606, -696],
+    [-606, -687],
+    [-606, -678],
+    [-606, -615],
+    [-597, -696],
+    [-597, -687],
+    [-597, -678],
+    [-597, -615],
+    [-597, -606],
+    [-534, -696],
+    [-534, -687],
+    [-534, -678],
+    [-534, -615],
+    [-534, -606],
+    [-534, -597],
+    [-525, -696],
+    [-525, -687],
+    [-525, -678],
+    [-525, -615],
+    [-525, -606],
+    [-525, -597],
+    [-525, -534],
+    [-516, -696],
+    [-516, -687],
+    [-516, -678],
+    [-516, -615],
+    [-516, -606],
+    [-516, -597],
+    [-516, -534],
+    [-516, -525],
+    [516, 525, 534, 597, 606, 615, 678, 687, 696],
+    [-688, -697],
+    [-679, -697],
+    [-679, -688],
+    [-616, -697],
+    [-616, -688],
+    [-616, -679],
+    [-607, -697],
+    [-607, -688],
+    [-607, -679],
+    [-607, -616],
+    [-598, -697],
+    [-598, -688],
+    [-598, -679],
+    [-598, -616],
+    [-598, -607],
+    [-535, -697],
+    [-535, -688],
+    [-535, -679],
+    [-535, -616],
+    [-535, -607],
+    [-535, -598],
+    [-526, -697],
+    [-526, -688],
+    [-526, -679],
+    [-526, -616],
+    [-526, -607],
+    [-526, -598],
+    [-526, -535],
+    [-517, -697],
+    [-517, -688],
+    [-517, -679],
+    [-517, -616],
+    [-517, -607],
+    [-517, -598],
+    [-517, -535],
+    [-517, -526],
+    [517, 526, 535, 598, 607, 616, 679, 688, 697],
+    [-689, -698],
+    [-680, -698],
+    [-680, -689],
+    [-617, -698],
+    [-617, -689],
+    [-617, -680],
+    [-608, -698],
+    [-608, -689],
+    [-608, -680],
+    [-608, -617],
+    [-599, -698],
+    [-599, -689],
+    [-599, -680],
+    [-599, -617],
+    [-599, -608],
+    [-536, -698],
+    [-536, -689],
+    [-536, -680],
+    [-536, -617],
+    [-536, -608],
+    [-536, -599],
+    [-527, -698],
+    [-527, -689],
+    [-527, -680],
+    [-527, -617],
+    [-527, -608],
+    [-527, -599],
+    [-527, -536],
+    [-518, -698],
+    [-518, -689],
+    [-518, -680],
+    [-518, -617],
+    [-518, -608],
+    [-518, -599],
+    [-518, -536],
+    [-518, -527],
+    [518, 527, 536, 599, 608, 617, 680, 689, 698],
+    [-690, -699],
+    [-681, -699],
+    [-681, -690],
+    [-618, -699],
+    [-618, -690],
+    [-618, -681],
+    [-609, -699],
+    [-609, -690],
+    [-609, -681],
+    [-609, -618],
+    [-600, -699],
+    [-600, -690],
+    [-600, -681],
+    [-600, -618],
+    [-600, -609],
+    [-537, -699],
+    [-537, -690],
+    [-537, -681],
+    [-537, -618],
+    [-537, -609],
+    [-537, -600],
+    [-528, -699],
+    [-528, -690],
+    [-528, -681],
+    [-528, -618],
+    [-528, -609],
+    [-528, -600],
+    [-528, -537],
+    [-519, -699],
+    [-519, -690],
+    [-519, -681],
+    [-519, -618],
+    [-519, -609],
+    [-519, -600],
+    [-519, -537],
+    [-519, -528],
+    [519, 528, 537, 600, 609, 618, 681, 690, 699],
+    [-691, -700],
+    [-682, -700],
+    [-682, -691],
+    [-619, -700],
+    [-619, -691],
+    [-619, -682],
+    [-610, -700],
+    [-610, -691],
+    [-610, -682],
+    [-610, -619],
+    [-601, -700],
+    [-601, -691],
+    [-601, -682],
+    [-601, -619],
+    [-601, -610],
+    [-538, -700],
+    [-538, -691],
+    [-538, -682],
+    [-538, -619],
+    [-538, -610],
+    [-538, -601],
+    [-529, -700],
+    [-529, -691],
+    [-529, -682],
+    [-529, -619],
+    [-529, -610],
+    [-529, -601],
+    [-529, -538],
+    [-520, -700],
+    [-520, -691],
+    [-520, -682],
+    [-520, -619],
+    [-520, -610],
+    [-520, -601],
+    [-520, -538],
+    [-520, -529],
+    [520, 529, 538, 601, 610, 619, 682, 691, 700],
+    [-692, -701],
+    [-683, -701],
+    [-683, -692],
+    [-620, -701],
+    [-620, -692],
+    [-620, -683],
+    [-611, -701],
+    [-611, -692],
+    [-611, -683],
+    [-611, -620],
+    [-602, -701],
+    [-602, -692],
+    [-602, -683],
+    [-602, -620],
+    [-602, -611],
+    [-539, -701],
+    [-539, -692],
+    [-539, -683],
+    [-539, -620],
+    [-539, -611],
+    [-539, -602],
+    [-530, -701],
+    [-530, -692],
+    [-530, -683],
+    [-530, -620],
+    [-530, -611],
+    [-530, -602],
+    [-530, -539],
+    [-521, -701],
+    [-521, -692],
+    [-521, -683],
+    [-521, -620],
+    [-521, -611],
+    [-521, -602],
+    [-521, -539],
+    [-521, -530],
+    [521, 530, 539, 602, 611, 620, 683, 692, 701],
+    [-693, -702],
+    [-684, -702],
+    [-684, -693],
+    [-621, -702],
+    [-621, -693],
+    [-621, -684],
+    [-612, -702],
+    [-612, -693],
+    [-612, -684],
+    [-612, -621],
+    [-603, -702],
+    [-603, -693],
+    [-603, -684],
+    [-603, -621],
+    [-603, -612],
+    [-540, -702],
+    [-540, -693],
+    [-540, -684],
+    [-540, -621],
+    [-540, -612],
+    [-540, -603],
+    [-531, -702],
+    [-531, -693],
+    [-531, -684],
+    [-531, -621],
+    [-531, -612],
+    [-531, -603],
+    [-531, -540],
+    [-522, -702],
+    [-522, -693],
+    [-522, -684],
+    [-522, -621],
+    [-522, -612],
+    [-522, -603],
+    [-522, -540],
+    [-522, -531],
+    [522, 531, 540, 603, 612, 621, 684, 693, 702],
+    [-712, -721],
+    [-703, -721],
+    [-703, -712],
+    [-640, -721],
+    [-640, -712],
+    [-640, -703],
+    [-631, -721],
+    [-631, -712],
+    [-631, -703],
+    [-631, -640],
+    [-622, -721],
+    [-622, -712],
+    [-622, -703],
+    [-622, -640],
+    [-622, -631],
+    [-559, -721],
+    [-559, -712],
+    [-559, -703],
+    [-559, -640],
+    [-559, -631],
+    [-559, -622],
+    [-550, -721],
+    [-550, -712],
+    [-550, -703],
+    [-550, -640],
+    [-550, -631],
+    [-550, -622],
+    [-550, -559],
+    [-541, -721],
+    [-541, -712],
+    [-541, -703],
+    [-541, -640],
+    [-541, -631],
+    [-541, -622],
+    [-541, -559],
+    [-541, -550],
+    [541, 550, 559, 622, 631, 640, 703, 712, 721],
+    [-713, -722],
+    [-704, -722],
+    [-704, -713],
+    [-641, -722],
+    [-641, -713],
+    [-641, -704],
+    [-632, -722],
+    [-632, -713],
+    [-632, -704],
+    [-632, -641],
+    [-623, -722],
+    [-623, -713],
+    [-623, -704],
+    [-623, -641],
+    [-623, -632],
+    [-560, -722],
+    [-560, -713],
+    [-560, -704],
+    [-560, -641],
+    [-560, -632],
+    [-560, -623],
+    [-551, -722],
+    [-551, -713],
+    [-551, -704],
+    [-551, -641],
+    [-551, -632],
+    [-551, -623],
+    [-551, -560],
+    [-542, -722],
+    [-542, -713],
+    [-542, -704],
+    [-542, -641],
+    [-542, -632],
+    [-542, -623],
+    [-542, -560],
+    [-542, -551],
+    [542, 551, 560, 623, 632, 641, 704, 713, 722],
+    [-714, -723],
+    [-705, -723],
+    [-705, -714],
+    [-642, -723],
+    [-642, -714],
+    [-642, -705],
+    [-633, -723],
+    [-633, -714],
+    [-633, -705],
+    [-633, -642],
+    [-624, -723],
+    [-624, -714],
+    [-624, -705],
+    [-624, -642],
+    [-624, -633],
+    [-561, -723],
+    [-561, -714],
+    [-561, -705],
+    [-561, -642],
+    [-561, -633],
+    [-561, -624],
+    [-552, -723],
+    [-552, -714],
+    [-552, -705],
+    [-552, -642],
+    [-552, -633],
+    [-552, -624],
+    [-552, -561],
+    [-543, -723],
+    [-543, -714],
+    [-543, -705],
+    [-543, -642],
+    [-543, -633],
+    [-543, -624],
+    [-543, -561],
+    [-543, -552],
+    [543, 552, 561, 624, 633, 642, 705, 714, 723],
+    [-715, -724],
+    [-706, -724],
+    [-706, -715],
+    [-643, -724],
+    [-643, -715],
+    [-643, -706],
+    [-634, -724],
+    [-634, -715],
+    [-634, -706],
+    [-634, -643],
+    [-625, -724],
+    [-625, -715],
+    [-625, -706],
+    [-625, -643],
+    [-625, -634],
+    [-562, -724],
+    [-562, -715],
+    [-562, -706],
+    [-562, -643],
+    [-562, -634],
+    [-562, -625],
+    [-553, -724],
+    [-553, -715],
+    [-553, -706],
+    [-553, -643],
+    [-553, -634],
+    [-553, -625],
+    [-553, -562],
+    [-544, -724],
+    [-544, -715],
+    [-544, -706],
+    [-544, -643],
+    [-544, -634],
+    [-544, -625],
+    [-544, -562],
+    [-544, -553],
+    [544, 553, 562, 625, 634, 643, 706, 715, 724],
+    [-716, -725],
+    [-707, -725],
+    [-707, -716],
+    [-644, -725],
+    [-644, -716],
+    [-644, -707],
+    [-635, -725],
+    [-635, -716],
+    [-635, -707],
+    [-635, -644],
+    [-626, -725],
+    [-626, -716],
+    [-626, -707],
+    [-626, -644],
+    [-626, -635],
+    [-563, -725],
+    [-563, -716],
+    [-563, -707],
+    [-563, -644],
+    [-563, -635],
+    [-563, -626],
+    [-554, -725],
+    [-554, -716],
+    [-554, -707],
+    [-554, -644],
+    [-554, -635],
+    [-554, -626],
+    [-554, -563],
+    [-545, -725],
+    [-545, -716],
+    [-545, -707],
+    [-545, -644],
+    [-545, -635],
+    [-545, -626],
+    [-545, -563],
+    [-545, -554],
+    [545, 554, 563, 626, 635, 644, 707, 716, 725],
+    [-717, -726],
+    [-708, -726],
+    [-708, -717],
+    [-645, -726],
+    [-645, -717],
+    [-645, -708],
+    [-636, -726],
+    [-636, -717],
+    [-636, -708],
+    [-636, -645],
+    [-627, -726],
+    [-627, -717],
+    [-627, -708],
+    [-627, -645],
+    [-627, -636],
+    [-564, -726],
+    [-564, -717],
+    [-564, -708],
+    [-564, -645],
+    [-564, -636],
+    [-564, -627],
+    [-555, -726],
+    [-555, -717],
+    [-555, -708],
+    [-555, -645],
+    [-555, -636],
+    [-555, -627],
+    [-555, -564],
+    [-546, -726],
+    [-546, -717],
+    [-546, -708],
+    [-546, -645],
+    [-546, -636],
+    [-546, -627],
+    [-546, -564],
+    [-546, -555],
+    [546, 555, 564, 627, 636, 645, 708, 717, 726],
+    [-718, -727],
+    [-709, -727],
+    [-709, -718],
+    [-646, -727],
+    [-646, -718],
+    [-646, -709],
+    [-637, -727],
+    [-637, -718],
+    [-637, -709],
+    [-637, -646],
+    [-628, -727],
+    [-628, -718],
+    [-628, -709],
+    [-628, -646],
+    [-628, -637],
+    [-565, -727],
+    [-565, -718],
+    [-565, -709],
+    [-565, -646],
+    [-565, -637],
+    [-565, -628],
+    [-556, -727],
+    [-556, -718],
+    [-556, -709],
+    [-556, -646],
+    [-556, -637],
+    [-556, -628],
+    [-556, -565],
+    [-547, -727],
+    [-547, -718],
+    [-547, -709],
+    [-547, -646],
+    [-547, -637],
+    [-547, -628],
+    [-547, -565],
+    [-547, -556],
+    [547, 556, 565, 628, 637, 646, 709, 718, 727],
+    [-719, -728],
+    [-710, -728],
+    [-710, -719],
+    [-647, -728],
+    [-647, -719],
+    [-647, -710],
+    [-638, -728],
+    [-638, -719],
+    [-638, -710],
+    [-638, -647],
+    [-629, -728],
+    [-629, -719],
+    [-629, -710],
+    [-629, -647],
+    [-629, -638],
+    [-566, -728],
+    [-566, -719],
+    [-566, -710],
+    [-566, -647],
+    [-566, -638],
+    [-566, -629],
+    [-557, -728],
+    [-557, -719],
+    [-557, -710],
+    [-557, -647],
+    [-557, -638],
+    [-557, -629],
+    [-557, -566],
+    [-548, -728],
+    [-548, -719],
+    [-548, -710],
+    [-548, -647],
+    [-548, -638],
+    [-548, -629],
+    [-548, -566],
+    [-548, -557],
+    [548, 557, 566, 629, 638, 647, 710, 719, 728],
+    [-720, -729],
+    [-711, -729],
+    [-711, -720],
+    [-648, -729],
+    [-648, -720],
+    [-648, -711],
+    [-639, -729],
+    [-639, -720],
+    [-639, -711],
+    [-639, -648],
+    [-630, -729],
+    [-630, -720],
+    [-630, -711],
+    [-630, -648],
+    [-630, -639],
+    [-567, -729],
+    [-567, -720],
+    [-567, -711],
+    [-567, -648],
+    [-567, -639],
+    [-567, -630],
+    [-558, -729],
+    [-558, -720],
+    [-558, -711],
+    [-558, -648],
+    [-558, -639],
+    [-558, -630],
+    [-558, -567],
+    [-549, -729],
+    [-549, -720],
+    [-549, -711],
+    [-549, -648],
+    [-549, -639],
+    [-549, -630],
+    [-549, -567],
+    [-549, -558],
+    [549, 558, 567, 630, 639, 648, 711, 720, 729]
 ]
\ No newline at end of file
@@ -0,0 +1,114 @@
+#generator of sudokus with exactly one solution. A random full sudoku is found by solving a few random fields,
+#afterwards clues are removed in random order as long as the sudoku keeps exactly one solution
+
+import multiprocessing
+import random
+
+import sudokuSolver
+
+
+def generatePuzzle(clues : int = None, symmetric : bool = True, seed = None, boxSize : int = 3, engine : str = "dlx") -> list:
+    """generates a sudoku with exactly one solution
+
+    Args:
+        clues int : is the number of set fields to reach or None to remove as many as possible. If no more field can be
+        removed without a second solution, the sudoku has more set fields
+        symmetric bool : if True, the set fields are symmetric to the center (a field and its rotation by 180 degrees are removed together)
+        seed int : is the seed of the random generator or None for a random one
+        boxSize int : is the block-size
+        engine str : is the engine of the uniqueness checks (see sudokuSolver.countSolutions)
+
+    Returns:
+        list(list(int)) : is the sudoku (see sudokuSolver.solveSudoku)
+    """
+    generator = random.Random(seed)
+    size = boxSize * boxSize
+    solution = __randomSolution__(generator, boxSize)
+    sudoku = [row.copy() for row in solution]
+    remaining = size * size
+    target = clues if clues is not None else 0
+
+    #fields removed together in random order
+    if symmetric:
+        groups = [sorted({field, size * size - 1 - field}) for field in range(0, (size * size + 1) // 2)]
+    else:
+        groups = [[field] for field in range(0, size * size)]
+    generator.shuffle(groups)
+
+    for group in groups:
+        if remaining - len(group) < target:
+            continue
+        for field in group:
+            sudoku[field // size][field % size] = 0
+        if sudokuSolver.hasUniqueSolution(sudoku, engine):
+            remaining -= len(group)
+            if remaining == target:
+                break
+        else:
+            for field in group:
+                sudoku[field // size][field % size] = solution[field // size][field % size]
+    return sudoku
+
+def generatePuzzles(count : int, clues : int = None, symmetric : bool = True, seed = None, boxSize : int = 3,
+                    engine : str = "dlx", workers : int = None):
+    """generates many sudokus with exactly one solution (see generatePuzzle). Each sudoku gets its own seed
+    from seed, so the sudokus are the same for any number of workers
+
+    Args:
+        count int : is the number of sudokus
+        clues int : is the number of set fields to reach (see generatePuzzle)
+        symmetric bool : if True, the set fields are symmetric to the center
+        seed int : is the seed of the random generator or None for a random one
+        boxSize int : is the block-size
+        engine str : is the engine of the uniqueness checks (see sudokuSolver.countSolutions)
+        workers int : is the number of processes generating in parallel or None to generate in this process
+
+    Yields:
+        list(list(int)) : is each sudoku
+    """
+    generator = random.Random(seed)
+    tasks = ((clues, symmetric, generator.getrandbits(64), boxSize, engine) for _ in range(0, count))
+    if workers is None or workers <= 1:
+        for task in tasks:
+            yield generatePuzzle(*task)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(__generatePuzzleTask__, tasks, chunksize=16)
+
+def __generatePuzzleTask__(task : tuple) -> list:
+    """calls generatePuzzle in a worker process
+
+    Args:
+        task tuple : are the arguments of generatePuzzle
+
+    Returns:
+        list(list(int)) : is the sudoku
+    """
+    return generatePuzzle(*task)
+
+def __randomSolution__(generator : random.Random, boxSize : int) -> list:
+    """gets a random solved sudoku by solving a sudoku with a few random fields set,
+    the numbers are relabeled randomly, so the order in which the engine tries numbers does not matter
+
+    Args:
+        generator random.Random : is the random generator
+        boxSize int : is the block-size
+
+    Returns:
+        list(list(int)) : is the solved sudoku
+    """
+    size = boxSize * boxSize
+    while True:
+        sudoku = [[0] * size for _ in range(0, size)]
+        for field in generator.sample(range(0, size * size), size + boxSize - 1):
+            row, col = divmod(field, size)
+            used = set(sudoku[row]) | {line[col] for line in sudoku}
+            used |= {sudoku[r][c] for r in range(row - row % boxSize, row - row % boxSize + boxSize) for c in range(col - col % boxSize, col - col % boxSize + boxSize)}
+            possible = [n for n in range(1, size + 1) if n not in used]
+            if len(possible) > 0:
+                sudoku[row][col] = generator.choice(possible)
+        solution = sudokuSolver.solveSudoku(sudoku, "dlx")
+        if len(solution) > 0:
+            relabel = [0] + generator.sample(range(1, size + 1), size)
+            return [[relabel[n] for n in row] for row in solution]
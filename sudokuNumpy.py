@@ -0,0 +1,153 @@
+#batch solver propagating many sudokus at once with numpy. The candidates of all sudokus are kept in one uint-array
+#of shape (N, N, sudokus) of bitmasks, bit n - 1 of entry [row, col, s] is set if field (row, col) of sudoku s can be set to n.
+#The sudokus are the last axis, so each operation runs over contiguous memory. Sudokus with more than 32 numbers use
+#uint64-masks, more than 64 numbers are not supported.
+#numpy is optional, the other engines work without it
+
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import sudokuSolver
+
+
+def solveBatch(sudokus, engine : str = "bitmask") -> tuple:
+    """solve many sudokus of the same size by eliminating naked and hidden singles in all of them at once,
+    only the sudokus which can not be solved by that are solved one by one with sudokuSolver.solveSudoku
+
+    Args:
+        sudokus list(list(list(int))) : are the sudokus (see sudokuSolver.solveSudoku) or an int array of shape (sudokus, N, N)
+        engine str : is the engine of sudokuSolver.solveSudoku for the remaining sudokus
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray) : is an int array of shape (sudokus, N, N) with the solutions (all 0 if a sudoku
+        is not solveable) and a boolean array of shape (sudokus,) which is True for the solved sudokus
+    """
+    if numpy is None:
+        raise ImportError("solveBatch needs numpy")
+    grids = numpy.asarray(sudokus, dtype=numpy.int64)
+    if grids.size == 0 and grids.ndim < 3:
+        #no sudokus given
+        grids = grids.reshape(0, 9, 9)
+    if grids.ndim != 3 or grids.shape[1] != grids.shape[2] or math.isqrt(grids.shape[1]) ** 2 != grids.shape[1]:
+        raise ValueError("sudokus are not an array of shape (sudokus, N, N), N being a square number")
+    size = grids.shape[1]
+    if size > 64:
+        raise ValueError("candidates of " + str(size) + " numbers do not fit into 64-bit masks")
+    if ((grids < 0) | (grids > size)).any():
+        raise ValueError("field is not between 0 and " + str(size))
+
+    #set fields have only their number as candidate, unset fields all numbers
+    #the masks need a bit per number
+    dtype = numpy.uint32 if size <= 32 else numpy.uint64
+    allNumbers = (1 << size) - 1
+    candidates = numpy.where(grids > 0, numpy.left_shift(dtype(1), (numpy.maximum(grids, 1) - 1).astype(dtype)), dtype(allNumbers))
+    candidates = numpy.ascontiguousarray(candidates.transpose(1, 2, 0))
+
+    failed = numpy.zeros(len(grids), dtype=bool)
+    active = numpy.ones(len(grids), dtype=bool)
+    while active.any():
+        #only sudokus which changed in the last round are propagated again
+        indices = numpy.flatnonzero(active)
+        before = candidates[:, :, indices]
+        subset, contradiction = __propagate__(before, allNumbers)
+        changed = (subset != before).any(axis=(0, 1))
+        candidates[:, :, indices] = subset
+        failed[indices] |= contradiction
+        active[indices] = changed & ~contradiction
+
+    numbers = __numbers__(candidates.transpose(2, 0, 1))
+    solved = ~failed & (numbers > 0).all(axis=(1, 2))
+    solutions = numpy.where(solved[:, None, None], numbers, 0)
+
+    #search the stalled sudokus starting from the numbers found by propagation
+    for index in numpy.flatnonzero(~failed & ~solved):
+        solution = sudokuSolver.solveSudoku(numbers[index].tolist(), engine)
+        if len(solution) > 0:
+            solutions[index] = solution
+            solved[index] = True
+    return solutions, solved
+
+def __popcount__(masks):
+    """counts the set bits of each mask
+
+    Args:
+        masks numpy.ndarray : is an uint32- or uint64-array
+
+    Returns:
+        numpy.ndarray : is an array of the same shape with the numbers of set bits
+    """
+    if hasattr(numpy, "bitwise_count"):
+        return numpy.bitwise_count(masks)
+    masks = masks.astype(numpy.uint64)
+    masks = masks - ((masks >> numpy.uint64(1)) & numpy.uint64(0x5555555555555555))
+    masks = (masks & numpy.uint64(0x3333333333333333)) + ((masks >> numpy.uint64(2)) & numpy.uint64(0x3333333333333333))
+    masks = (masks + (masks >> numpy.uint64(4))) & numpy.uint64(0x0F0F0F0F0F0F0F0F)
+    return (masks * numpy.uint64(0x0101010101010101)) >> numpy.uint64(56)
+
+def __numbers__(candidates):
+    """gets the numbers of the fields with a single candidate
+
+    Args:
+        candidates numpy.ndarray : are the candidates of the sudokus (see solveBatch)
+
+    Returns:
+        numpy.ndarray : is an int array of the same shape with the number of each field with one candidate and 0 else
+    """
+    numbers = numpy.zeros(candidates.shape, dtype=numpy.int64)
+    for n in range(1, candidates.shape[1] + 1):
+        numbers[candidates == (1 << (n - 1))] = n
+    return numbers
+
+def __propagate__(candidates, allNumbers : int) -> tuple:
+    """one round of eliminating naked singles (a field with one candidate removes it from its row, collum and block)
+    and hidden singles (a number with one possible field in a row, collum or block is set there)
+
+    Args:
+        candidates numpy.ndarray : are the candidates of the sudokus (see solveBatch)
+        allNumbers int : is the mask of all numbers
+
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray) : are the new candidates and a boolean array which is True for the sudokus
+        with a contradiction
+    """
+    size, sudokus = candidates.shape[0], candidates.shape[2]
+    boxSize = math.isqrt(size)
+    #view of the fields as (block-row, row in block, block-collum, collum in block, sudokus)
+    blockShape = (boxSize, boxSize, boxSize, boxSize, sudokus)
+
+    #naked singles, the counts are computed once and used for the check of empty fields too
+    counts = __popcount__(candidates)
+    contradiction = (counts == 0).any(axis=(0, 1))
+    isSingle = counts == 1
+    singles = candidates * isSingle
+    rowUsed = numpy.bitwise_or.reduce(singles, axis=1)
+    colUsed = numpy.bitwise_or.reduce(singles, axis=0)
+    blockUsed = numpy.bitwise_or.reduce(numpy.bitwise_or.reduce(singles.reshape(blockShape), axis=3), axis=1)
+    #a number set twice in a row, collum or block is a contradiction, then its singles have fewer numbers than fields
+    singleCount = isSingle.sum(axis=(0, 1))
+    contradiction |= __popcount__(rowUsed).sum(axis=0) != singleCount
+    contradiction |= __popcount__(colUsed).sum(axis=0) != singleCount
+    contradiction |= __popcount__(blockUsed).sum(axis=(0, 1)) != singleCount
+    used = (rowUsed[:, None, :] | colUsed[None, :, :]).reshape(blockShape) | blockUsed[:, None, :, None, :]
+    candidates = (candidates & ~used.reshape(size, size, sudokus)) | singles
+
+    #hidden singles, the numbers possible only once in a row, collum or block
+    blocks = candidates.reshape(blockShape).transpose(0, 2, 1, 3, 4).reshape(size, size, sudokus)
+    hidden = list()
+    for units in (candidates, candidates.transpose(1, 0, 2), blocks):
+        once = numpy.zeros((size, sudokus), dtype=candidates.dtype)
+        twice = numpy.zeros((size, sudokus), dtype=candidates.dtype)
+        for index in range(0, size):
+            twice |= once & units[:, index]
+            once |= units[:, index]
+        contradiction |= (once != allNumbers).any(axis=0)
+        hidden.append(once & ~twice)
+    found = (hidden[0][:, None, :] | hidden[1][None, :, :]).reshape(blockShape) | hidden[2].reshape(boxSize, 1, boxSize, 1, sudokus)
+    found = candidates & found.reshape(size, size, sudokus)
+    contradiction |= ((found & (found - 1)) != 0).any(axis=(0, 1))
+    candidates = found | candidates * (found == 0)
+    return candidates, contradiction
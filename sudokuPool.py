@@ -0,0 +1,260 @@
+#pool of worker processes solving sudokus in parallel. The workers are started once and get the general
+#sudoku-cnf once at their start, afterwards only chunks of sudokus and their solutions are sent
+
+import array
+import itertools
+import multiprocessing
+import multiprocessing.connection
+
+import sudokuSolver
+
+
+class SolverPool:
+    """pool of worker processes for solving many sudokus, use it as context-manager or call close() when done.
+    A chunk of a crashed worker is sent to a new worker again, after maxRetries crashes its sudokus are retried one by one
+    """
+
+    def __init__(self, workers : int = None, chunkSize : int = 64, maxRetries : int = 2, prefetch : int = 2):
+        """starts the worker processes
+
+        Args:
+            workers int : is the number of worker processes or None for one per cpu
+            chunkSize int : is the number of sudokus sent to a worker at once
+            maxRetries int : is how often a chunk is sent again after its worker crashed
+            prefetch int : is the number of chunks sent to a worker before it finished the previous one
+        """
+        self.workers = workers if workers is not None else multiprocessing.cpu_count()
+        self.chunkSize = chunkSize
+        self.maxRetries = maxRetries
+        self.prefetch = prefetch
+        self.__packedCnf__ = __packCnf__(sudokuSolver.__getGeneralCnf__())
+        #tuples (process, connection) of the running workers
+        self.__processes__ = [self.__startWorker__() for _ in range(0, self.workers)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __startWorker__(self) -> tuple:
+        """starts a worker process
+
+        Returns:
+            tuple(multiprocessing.Process, multiprocessing.connection.Connection) : is the process and the connection to it
+        """
+        connection, childConnection = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=__workerMain__, args=(childConnection, self.__packedCnf__), daemon=True)
+        process.start()
+        childConnection.close()
+        return (process, connection)
+
+    def __restart__(self) -> None:
+        """terminates all workers and starts new ones, so no old solutions are received anymore
+
+        Returns:
+            None
+        """
+        for process, connection in self.__processes__:
+            process.terminate()
+            process.join()
+            connection.close()
+        self.__processes__ = [self.__startWorker__() for _ in range(0, self.workers)]
+
+    def close(self) -> None:
+        """stops all workers
+
+        Returns:
+            None
+        """
+        for process, connection in self.__processes__:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process, connection in self.__processes__:
+            process.join()
+            connection.close()
+        self.__processes__ = list()
+
+    def solve(self, sudokus, engine : str = "cnf", ordered : bool = True):
+        """solves the sudokus in the workers. The sudokus are read and the solutions are yielded lazily
+
+        Args:
+            sudokus iterable(list(list(int))) : are the sudokus to solve (see sudokuSolver.solveSudoku)
+            engine str : is the engine to use (see sudokuSolver.solveSudoku)
+            ordered bool : if True, the solutions are yielded in the order of the sudokus, else as soon as they are solved
+
+        Yields:
+            list(list(int)) : is each solution (or an empty list, see sudokuSolver.solveSudoku) if ordered is True,
+            tuple(int, list(list(int))) : else the index of each sudoku together with its solution
+        """
+        iterator = iter(sudokus)
+        exhausted = False
+        #chunks not yielded yet by the index of their first sudoku as lists [sudokus, retries, solutions]
+        chunks = dict()
+        #indices of the chunks waiting to be sent to a worker
+        unsent = list()
+        #indices of the chunks sent to each worker
+        assigned = [list() for _ in self.__processes__]
+        nextIndex = 0
+        yieldIndex = 0
+        #not more chunks than this are read and not yielded, so memory stays bounded even if one chunk is slow
+        maxChunks = self.workers * self.prefetch * 4
+
+        try:
+            while True:
+                #read in new chunks for the free places of the workers
+                freePlaces = sum(self.prefetch - len(chunkIndices) for chunkIndices in assigned)
+                while not exhausted and len(unsent) < freePlaces and len(chunks) < maxChunks:
+                    chunk = list(itertools.islice(iterator, self.chunkSize))
+                    if len(chunk) == 0:
+                        exhausted = True
+                        break
+                    chunks[nextIndex] = [chunk, 0, None]
+                    unsent.append(nextIndex)
+                    nextIndex += len(chunk)
+
+                #send chunks to the workers
+                for worker in range(0, len(self.__processes__)):
+                    while len(unsent) > 0 and len(assigned[worker]) < self.prefetch:
+                        start = unsent.pop(0)
+                        assigned[worker].append(start)
+                        try:
+                            self.__processes__[worker][1].send((start, chunks[start][0], engine))
+                        except OSError:
+                            #worker crashed, its chunks are requeued when its sentinel is ready
+                            break
+
+                if not any(assigned):
+                    if exhausted and len(unsent) == 0:
+                        return
+                    continue
+
+                #receive solutions and watch for crashed workers
+                connections = {self.__processes__[worker][1]: worker for worker in range(0, len(self.__processes__))}
+                sentinels = {self.__processes__[worker][0].sentinel: worker for worker in range(0, len(self.__processes__))}
+                readyList = multiprocessing.connection.wait(list(connections) + list(sentinels))
+                #receive solutions before replacing crashed workers, which closes their connections
+                readyList.sort(key=lambda ready: ready not in connections)
+                for ready in readyList:
+                    if ready in connections:
+                        worker = connections[ready]
+                        try:
+                            start, solutions, error = ready.recv()
+                        except (EOFError, OSError):
+                            #worker crashed, handled by its sentinel
+                            continue
+                        assigned[worker].remove(start)
+                        if error is not None:
+                            #solveSudoku raised an exception, which is not a crash of the worker
+                            raise error
+                        chunks[start][2] = solutions
+                        if not ordered:
+                            del chunks[start]
+                            for offset, solution in enumerate(solutions):
+                                yield (start + offset, solution)
+                    elif not self.__processes__[sentinels[ready]][0].is_alive():
+                        self.__replaceCrashedWorker__(sentinels[ready], assigned, chunks, unsent)
+
+                #yield solutions in order
+                while ordered and yieldIndex in chunks and chunks[yieldIndex][2] is not None:
+                    solutions = chunks.pop(yieldIndex)[2]
+                    yieldIndex += len(solutions)
+                    for solution in solutions:
+                        yield solution
+        finally:
+            if any(assigned):
+                #solving got stopped, the workers must not send the remaining solutions to the next call
+                self.__restart__()
+
+    def __replaceCrashedWorker__(self, worker : int, assigned : list, chunks : dict, unsent : list) -> None:
+        """starts a new worker for a crashed one and requeues the chunks which were sent to it
+
+        Args:
+            worker int : is the index of the crashed worker
+            assigned list(list(int)) : are the indices of the chunks sent to each worker
+            chunks dict(int, list) : are the chunks not yielded yet (see solve)
+            unsent list(int) : are the indices of the chunks waiting to be sent
+
+        Returns:
+            None
+        """
+        process, connection = self.__processes__[worker]
+        process.join()
+        connection.close()
+        self.__processes__[worker] = self.__startWorker__()
+
+        for start in assigned[worker]:
+            chunk = chunks[start]
+            chunk[1] += 1
+            if chunk[1] <= self.maxRetries:
+                unsent.insert(0, start)
+            elif len(chunk[0]) > 1:
+                #retry each sudoku on its own to find the one crashing the workers
+                del chunks[start]
+                for offset, sudoku in enumerate(chunk[0]):
+                    chunks[start + offset] = [[sudoku], 0, None]
+                    unsent.insert(offset, start + offset)
+            else:
+                raise RuntimeError("sudoku " + str(start) + " crashed " + str(chunk[1]) + " workers")
+        assigned[worker] = list()
+
+def __packCnf__(cnf : list) -> bytes:
+    """packs a cnf into a compact form for sending it to the workers
+
+    Args:
+        cnf list(list(int)) : is the cnf
+
+    Returns:
+        bytes : are the literals as 32-bit integers, each clause is terminated by 0
+    """
+    packed = array.array("i")
+    for clause in cnf:
+        packed.extend(clause)
+        packed.append(0)
+    return packed.tobytes()
+
+def __unpackCnf__(packed : bytes) -> list:
+    """inverse of __packCnf__
+
+    Args:
+        packed bytes : is the packed cnf
+
+    Returns:
+        list(list(int)) : is the cnf
+    """
+    literals = array.array("i")
+    literals.frombytes(packed)
+    cnf = list()
+    clause = list()
+    for lit in literals:
+        if lit == 0:
+            cnf.append(clause)
+            clause = list()
+        else:
+            clause.append(lit)
+    return cnf
+
+def __workerMain__(connection, packedCnf : bytes) -> None:
+    """main function of a worker process, solves the chunks it receives until it receives None.
+    It sends back the index of the first sudoku of each chunk with the solutions and None or with None and the exception of solveSudoku
+
+    Args:
+        connection multiprocessing.connection.Connection : is the connection to the pool
+        packedCnf bytes : is the general sudoku-cnf packed by __packCnf__
+
+    Returns:
+        None
+    """
+    sudokuSolver.sudokuGeneral = __unpackCnf__(packedCnf)
+    while True:
+        task = connection.recv()
+        if task is None:
+            return
+        start, sudokus, engine = task
+        try:
+            connection.send((start, [sudokuSolver.solveSudoku(sudoku, engine) for sudoku in sudokus], None))
+        except Exception as error:
+            #the exception is raised by SolverPool.solve, the worker keeps running
+            connection.send((start, None, error))
@@ -1,147 +1,191 @@
-#import is optional but speeds up sudokuSolver
-try:
-    import sudokuGeneralCnf
-    from sudokuGeneralCnf import *
-except:
-    pass
+import math
+import time
 
+import sudokuBitmask
+import sudokuDlx
 
-def solveSudoku(sudoku : list) -> list:
+#general sudoku-cnf, it is loaded on the first solve by __getGeneralCnf__
+sudokuGeneral = None
+
+
+def solveSudoku(sudoku : list, engine : str = "cnf", verify : bool = False, tieBreak : str = "first", stats = None, hooks = None,
+                timeout : float = None, maxNodes : int = None, cancel = None) -> list:
     """solve sudoku with tree-like testing of possible states.
 
     Args:
-        sudoku list(list(int)) : is a 2-dimensional array containing 9 lists with 9 integers, representing each sudoku-field. If an int is 0, field is not set 
+        sudoku list(list(int)) : is a 2-dimensional array containing N lists with N integers, representing each sudoku-field. N is the square of the block-size, e.g. 9, 16 or 25. If an int is 0, field is not set.
+        The N * N fields in row-major order (e.g. bytes or a memoryview of sudokuDataset) are accepted too
+        engine str : is "cnf" to solve the general sudoku-cnf, "bitmask" to use the faster engine of sudokuBitmask, "dlx" to use the dancing links of sudokuDlx
+            or "external" to use an installed SAT-solver (see sudokuExternal, solved with "cnf" if none is installed)
+        verify bool : if True, the solution of the cnf-engine is checked with isValidSolution at the end
+        tieBreak str : is how the cnf-engine chooses between fields with equally few possible numbers: "first" takes the first one in row-major order, "degree" the one with the most unset fields in its row, collum and block
+        stats SolveStats : gets the statistics of the cnf-engine added or is None to not collect them
+        hooks SearchHooks : are callbacks called by the search of the cnf-engine or None
+        timeout float : is the wall-clock time in seconds after which the cnf-engine gives up or None. It is also given to
+            the "external" engine, which kills the SAT-solver then (by default after sudokuExternal.__DEFAULT_TIMEOUT__)
+        maxNodes int : is the number of assumptions after which the cnf-engine gives up or None
+        cancel threading.Event : is a token (any object with is_set()) which makes the cnf-engine give up as soon as it is set,
+            e.g. by another thread or an asyncio-task, or None. The limits are checked after the setup of the search and before
+            each assumption. The first solve of a block-size in a process also builds the watched sudoku-cnf (about a second
+            for 25x25), which is not interrupted, so the cnf-engine can give up that much later than timeout or cancel
 
     Returns:
-        list(list(int)) : returns a solved sudoku game or an empty list (if its not solveable)
+        list(list(int)) : returns a solved sudoku game, an empty list (if its not solveable) or None if the cnf-engine gave up
+        because of timeout, maxNodes or cancel (the reason is stored in stats.gaveUp) or the SAT-solver of the external engine timed out
     """
+    sudoku = __toRows__(sudoku)
+    if (stats is not None or hooks is not None or maxNodes is not None or cancel is not None) and engine != "cnf":
+        raise ValueError("statistics, hooks, maxNodes and cancel are only supported by the cnf-engine")
+    if timeout is not None and engine not in ("cnf", "external"):
+        raise ValueError("timeout is only supported by the cnf-engine and the external engine")
+    if engine == "bitmask":
+        return sudokuBitmask.solveSudokuBitmask(sudoku)
+    elif engine == "dlx":
+        return sudokuDlx.solveSudokuDlx(sudoku)
+    elif engine == "external":
+        import sudokuExternal
+        if timeout is None:
+            return sudokuExternal.solveSudokuExternal(sudoku)
+        try:
+            return sudokuExternal.solveSudokuExternal(sudoku, timeout=timeout)
+        except TimeoutError:
+            return None
+    elif engine != "cnf":
+        raise ValueError("unknown engine: " + str(engine))
+    if tieBreak not in ("first", "degree"):
+        raise ValueError("unknown tieBreak: " + str(tieBreak))
+    result = list()
+    search = __searchCnf__(sudoku, tieBreak, stats, hooks, timeout, maxNodes, cancel)
+    for solution in search:
+        search.close()
+        if solution is None:
+            return None
+        size = len(sudoku)
+        result = [solution[row * size: row * size + size] for row in range(0, size)]
+        break
+    if verify and result != [] and not isValidSolution(sudoku, result):
+        raise RuntimeError("solution does not solve the sudoku: " + str(result))
+    return result
 
-    def isInSolvedState(cnf : list) -> bool:
-        """checks if sudoku-cnf is solved
+def solveWithStats(sudoku : list, verify : bool = False, tieBreak : str = "first", timeout : float = None, maxNodes : int = None, cancel = None) -> tuple:
+    """solve sudoku with the cnf-engine and collect statistics of the search
 
-        Args:
-            cnf list(list(tuple(bool, str))) : is given cnf
+    Args:
+        sudoku list(list(int)) : is the sudoku (see solveSudoku)
+        verify bool : if True, the solution is checked with isValidSolution at the end
+        tieBreak str : is how fields with equally few possible numbers are chosen (see solveSudoku)
+        timeout float : is the wall-clock time in seconds after which the search gives up or None
+        maxNodes int : is the number of assumptions after which the search gives up or None
+        cancel threading.Event : is a token which makes the search give up as soon as it is set or None (see solveSudoku)
 
-        Returns:
-            bool : is True if in solved form or False if its not in solved form
-        """
+    Returns:
+        tuple(list(list(int)), SolveStats) : is the solution (see solveSudoku, None if the search gave up) and the statistics
+        (of the search so far if it gave up)
+    """
+    stats = SolveStats()
+    return (solveSudoku(sudoku, "cnf", verify, tieBreak, stats, timeout=timeout, maxNodes=maxNodes, cancel=cancel), stats)
 
-        if len(cnf) == 729: #is number of all unitclauses possible in a solved state
-            #check if all of the contained clauses are unit-clauses
-            for cl in cnf:
-                if len(cl) != 1:
-                    return False
+def countSolutions(sudoku : list, limit : int = 2, engine : str = "cnf") -> int:
+    """counts the solutions of a sudoku, the search continues after each solution and stops as soon as limit is reached
 
-            #check if each field is only set and only once
-            onlyOneOfEachFieldSet = False
-            for row in range(0,9):
-                for col in range(0,9):
-                    for n in range(1, 10):
-                        if [(False, str(row) + str(col) + "-" + str(n))] not in cnf and [(True, str(row) + str(col) + "-" + str(n))] not in cnf:
-                            return False
-                        elif [(True, str(row) + str(col) + "-" + str(n))] in cnf and onlyOneOfEachFieldSet:
-                            return False
-                        elif [(True, str(row) + str(col) + "-" + str(n))] in cnf and not onlyOneOfEachFieldSet:
-                            onlyOneOfEachFieldSet = True
-                    if not onlyOneOfEachFieldSet:
-                        return False
-                    onlyOneOfEachFieldSet = False
-            
-            #since it derived from general sudoku-cnf, it must be a solved sudoku
-            return True 
-        else:
-            return False
+    Args:
+        sudoku list(list(int)) : is the sudoku (see solveSudoku)
+        limit int : is the number of solutions after which counting stops or None to count all
+        engine str : is the engine to use (see solveSudoku)
 
-    def getUnallocatetField(cnf : list) -> tuple:
-        """gets the unallocated field with the least possible numbers remaining
+    Returns:
+        int : is the number of solutions, at most limit
+    """
+    sudoku = __toRows__(sudoku)
+    if engine == "cnf":
+        search = __searchCnf__(sudoku)
+    elif engine == "bitmask":
+        search = sudokuBitmask.__searchBitmask__(sudoku)
+    elif engine == "dlx":
+        search = sudokuDlx.__searchDlx__(sudoku)
+    else:
+        raise ValueError("unknown engine: " + str(engine))
+    count = 0
+    if limit is not None and limit <= 0:
+        return count
+    for _ in search:
+        count += 1
+        if count == limit:
+            search.close()
+            break
+    return count
 
-        Args:
-            cnf list(list(tuple(bool, str))) : given cnf
+def hasUniqueSolution(sudoku : list, engine : str = "cnf") -> bool:
+    """checks if a sudoku has exactly one solution, the search stops at the second solution
 
-        Results:
-            tuple(int, int, list(int)) : returns tuple containing a row-index, a collum-index and a list of possible allocations or None if none was found
-        """
-        tmpResult = None
-
-        for row in range(0,9):
-            for col in range(0,9):
-                if [(True, str(row) + str(col) + "-1")] not in cnf and [(True, str(row) + str(col) + "-2")] not in cnf and [(True, str(row) + str(col) + "-3")] not in cnf and [(True, str(row) + str(col) + "-4")] not in cnf and [(True, str(row) + str(col) + "-5")] not in cnf and [(True, str(row) + str(col) + "-6")] not in cnf and [(True, str(row) + str(col) + "-7")] not in cnf and [(True, str(row) + str(col) + "-8")] not in cnf and [(True, str(row) + str(col) + "-9")] not in cnf:
-                    tmpList = list()
-                    for n in range(1, 10):
-                        if [(False, str(row) + str(col) + "-" + str(n))] not in cnf and n not in tmpList:
-                            tmpList.append(n)
-                    if len(tmpList) == 2:
-                        return (row, col, tmpList)
-                    elif tmpResult is not None and len(tmpList) < len(tmpResult[2]):
-                        tmpResult = (row, col, tmpList)
-                    elif tmpResult is None:
-                        tmpResult = (row, col, tmpList)
-
-        return tmpResult
-
-    #get cnf defining a sudoku-game or construct it
-    try:
-        cnf = sudokuGeneral.copy()
-    except:
-        cnf = __createSudokuCnf__()
-        
-    
-    #read in given sudoku
-    setOfUnitClauses = set()
-    for row in range(0,9):
-        for col in range(0,9):
-            if sudoku[row][col] != 0:
-                setOfUnitClauses.update({(True, str(row) + str(col) + "-" + str(sudoku[row][col]))})
-    cnf = __unitResolutionForSet__(cnf, setOfUnitClauses)
-                
-    #contains still untried clauses and old cnf as tuples
-    stackAddableUnitClauses = list()
-
-    while not isInSolvedState(cnf.copy()):
-        if [] in cnf and len(stackAddableUnitClauses) == 0:
-            #sudoku unsolveable
-            return []
-        elif [] in cnf and len(stackAddableUnitClauses) > 0:
-            #check other configuration -> you made a wrong assumption
-
-            newClause = stackAddableUnitClauses.pop()
-            cnf = __unitResolutionForSet__(newClause[1], {newClause[0]})
-        else:
-            #test further with additional allocation of a field
-            
-            #get good non-set field
-            tmp = getUnallocatetField(cnf)
-            #add to stack and try out allocations
-            for unit in tmp[2][1:]:
-                stackAddableUnitClauses.append(((True, str(tmp[0]) + str(tmp[1]) + "-" + str(unit)), cnf.copy()))
-            cnf = __unitResolutionForSet__(cnf, {(True, str(tmp[0]) + str(tmp[1]) + "-" + str(tmp[2][0]))})
-
-
-    #convert unit-clauses into list-structure and return it
-    result = [
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-        [0, 0, 0,    0, 0, 0,    0, 0, 0 ],
-    ]
-    for clause in cnf:
-        if clause[0][0]:
-            result[int(clause[0][1][0])][int(clause[0][1][1])] = int(clause[0][1][3])
-            
-    return result
+    Args:
+        sudoku list(list(int)) : is the sudoku (see solveSudoku)
+        engine str : is the engine to use (see solveSudoku)
+
+    Returns:
+        bool : is True if the sudoku has exactly one solution
+    """
+    return countSolutions(sudoku, 2, engine) == 1
+
+def solveMany(sudokus, engine : str = "cnf", workers : int = None, ordered : bool = True, chunkSize : int = 64):
+    """solves many sudokus one after another, sharing the prebuilt sudoku-cnf between them.
+    The sudokus are read and the solutions are yielded lazily, so sudokus can be any iterable (e.g. a generator reading a file)
+
+    Args:
+        sudokus iterable(list(list(int))) : are the sudokus to solve (see solveSudoku)
+        engine str : is the engine to use (see solveSudoku)
+        workers int : is the number of processes solving in parallel (see sudokuPool.SolverPool) or None to solve in this process
+        ordered bool : if True, the solutions are yielded in the order of the sudokus, else as soon as they are solved
+        chunkSize int : is the number of sudokus sent to a worker at once
+
+    Yields:
+        list(list(int)) : is each solution (or an empty list, see solveSudoku) if ordered is True,
+        tuple(int, list(list(int))) : else the index of each sudoku together with its solution
+    """
+    if workers is None or workers <= 1:
+        for index, sudoku in enumerate(sudokus):
+            yield solveSudoku(sudoku, engine) if ordered else (index, solveSudoku(sudoku, engine))
+        return
+
+    import sudokuPool
+    with sudokuPool.SolverPool(workers, chunkSize) as pool:
+        yield from pool.solve(sudokus, engine, ordered)
+
+def isValidSolution(sudoku : list, solution : list) -> bool:
+    """checks if solution is a completely and correctly filled sudoku, which keeps the set fields of sudoku
+
+    Args:
+        sudoku list(list(int)) : is the given sudoku (see solveSudoku)
+        solution list(list(int)) : is the solution to check
+
+    Returns:
+        bool : is True if solution solves sudoku and False otherwise
+    """
+    boxSize = __boxSizeOf__(sudoku)
+    size = boxSize * boxSize
+    if len(solution) != size or any(len(row) != size for row in solution):
+        return False
+    numbers = list(range(1, size + 1))
+    for row in range(0, size):
+        for col in range(0, size):
+            if sudoku[row][col] != 0 and sudoku[row][col] != solution[row][col]:
+                return False
+    for index in range(0, size):
+        blockRow = (index // boxSize) * boxSize
+        blockCol = (index % boxSize) * boxSize
+        if sorted(solution[index]) != numbers:
+            return False
+        if sorted(solution[row][index] for row in range(0, size)) != numbers:
+            return False
+        if sorted(solution[blockRow + row][blockCol + col] for row in range(0, boxSize) for col in range(0, boxSize)) != numbers:
+            return False
+    return True
 
 def printSudoku(sudoku : list) -> None:
     """prints a sudoku into the command-console in a readable way
 
     Args:
-        sudoku list(list(int)) : is a list containing 9 lists (each row), which contain 9 integers (each field). If the integers is 0, the field is not set. Each field can be set with an integer from 1 to 9
+        sudoku list(list(int)) : is a list containing N lists (each row), which contain N integers (each field). If the integers is 0, the field is not set. Each field can be set with an integer from 1 to N
 
     Results:
         None
@@ -150,213 +194,854 @@ def printSudoku(sudoku : list) -> None:
         print("Sudoku was unsolveable")
         return
     
+    boxSize = __boxSizeOf__(sudoku)
+    size = boxSize * boxSize
+    width = len(str(size))
     tmp = ""
-    for row in range(0,9):
-        tmpList = sudoku[row].__str__()
-        tmpList = tmpList[0: 9] + "   " + tmpList[9: 18] + "   " + tmpList[18:]
-        tmp = tmp + tmpList + "\n"
-        if (row + 1) % 3 == 0:
+    for row in range(0, size):
+        blocks = list()
+        for blockCol in range(0, size, boxSize):
+            blocks.append(", ".join(str(n).rjust(width) for n in sudoku[row][blockCol: blockCol + boxSize]))
+        tmp = tmp + "[" + ",    ".join(blocks) + "]\n"
+        if (row + 1) % boxSize == 0:
             tmp = tmp + "\n"
 
     print(tmp[:-2])
 
-def __unitResolutionForSet__(cnf : list, units : set) -> list:
-    """makes unitresolution to given cnf for list of unitclauses and for the newly created ones
+class SolveStats:
+    """statistics of solves of the cnf-engine, see solveSudoku and solveWithStats.
+    Collecting them costs only a check per assumption when they are turned off
+
+    Attributes:
+        decisions int : is the number of fields allocated by assumption
+        backtracks int : is the number of assumptions taken back to try the next allocation
+        propagations int : is the number of literals set by unit-propagation
+        clauseVisits int : is the number of clauses visited by unit-propagation
+        maxDepth int : is the largest number of untried allocations on the stack
+        solutions int : is the number of found solutions
+        setupSeconds float : is the time for reading in the sudoku and propagating its set fields
+        searchSeconds float : is the time of the search afterwards
+        propagationSeconds float : is the time of the unit-propagation in both
+        gaveUp str : is why the last search gave up ("timeout", "maxNodes" or "cancelled") or None if it did not
+    """
+
+    def __init__(self):
+        self.decisions = 0
+        self.backtracks = 0
+        self.propagations = 0
+        self.clauseVisits = 0
+        self.maxDepth = 0
+        self.solutions = 0
+        self.setupSeconds = 0.0
+        self.searchSeconds = 0.0
+        self.propagationSeconds = 0.0
+        self.gaveUp = None
+
+    def __repr__(self) -> str:
+        return "SolveStats(" + ", ".join(name + "=" + repr(value) for name, value in vars(self).items()) + ")"
+
+class SearchHooks:
+    """callbacks of the search of the cnf-engine, see solveSudoku. Callbacks which are None are not called,
+    so without hooks the search only pays a check per assumption
+
+    Attributes:
+        onDecision callable(int, int, int) : is called with the row-index, the collum-index and the number of each allocation by assumption
+        onPropagate callable(list(int)) : is called with the literals set by each unit-propagation
+        onConflict callable() : is called when unit-propagation falsified a clause
+        onBacktrack callable(int, int, int) : is called with the row-index, the collum-index and the number of the allocation tried next after taking back an assumption
+        onSolution callable(list(list(int))) : is called with each solution
+    """
+
+    def __init__(self, onDecision = None, onPropagate = None, onConflict = None, onBacktrack = None, onSolution = None):
+        self.onDecision = onDecision
+        self.onPropagate = onPropagate
+        self.onConflict = onConflict
+        self.onBacktrack = onBacktrack
+        self.onSolution = onSolution
+
+def __boxSizeOf__(sudoku : list) -> int:
+    """gets the block-size of a sudoku and checks its shape
 
     Args:
-        cnf list(list(tuple(bool, str))) : is a list of clauses
-        units set(tuple(bool, str)) : contains the unitclauses
+        sudoku list(list(int)) : is a sudoku with N rows of N fields, N must be the square of the block-size
 
     Returns:
-        list(list(tuple(bool, str))): is the new cnf after resolution
+        int : is the block-size, e.g. 3 for a 9x9 sudoku
     """
-    
-    def makeUnitResolution(cnf : list, clauses : set) -> tuple: #returns tuple(list, set) with list as new cnf and set as new set of unit-clauses
-        tmpCnf = cnf.copy()
-        newUnitclauses = set()
-        for cl in cnf:
-            #if clause cl contains one of the unitclauses, remove clause
-            clSet = set(cl)
-            if len(clSet.intersection(clauses)) > 0:
-                tmpCnf.remove(cl)
+    size = len(sudoku)
+    boxSize = math.isqrt(size)
+    if size == 0 or boxSize * boxSize != size:
+        raise ValueError("number of rows is not a square number > 0: " + str(size))
+    for row in sudoku:
+        if len(row) != size:
+            raise ValueError("row has not " + str(size) + " fields: " + str(row))
+        for n in row:
+            if not 0 <= n <= size:
+                raise ValueError("field is not between 0 and " + str(size) + ": " + str(n))
+    return boxSize
+
+def __toRows__(sudoku) -> list:
+    """gets a sudoku as list of rows of ints
+
+    Args:
+        sudoku list(list(int)) : is a sudoku, its N * N fields in row-major order (e.g. bytes or a memoryview of sudokuDataset)
+        or any sequence of rows (e.g. a numpy-array)
+
+    Returns:
+        list(list(int)) : is the sudoku, the given one if it is already a list of lists
+    """
+    if isinstance(sudoku, list) and (len(sudoku) == 0 or isinstance(sudoku[0], list)):
+        return sudoku
+    if len(sudoku) > 0 and not hasattr(sudoku[0], "__len__"):
+        #fields in row-major order
+        size = math.isqrt(len(sudoku))
+        if size * size != len(sudoku):
+            raise ValueError("number of fields is not a square number: " + str(len(sudoku)))
+        return [[int(n) for n in sudoku[row * size: row * size + size]] for row in range(0, size)]
+    return [[int(n) for n in row] for row in sudoku]
+
+def __searchCnf__(sudoku : list, tieBreak : str = "first", stats = None, hooks = None, timeout : float = None, maxNodes : int = None, cancel = None):
+    """searches all solutions of a sudoku with the watched general sudoku-cnf, each solution is found by continuing
+    the search of the previous one like after a wrong assumption
+
+    Args:
+        sudoku list(list(int)) : is the given sudoku (see solveSudoku)
+        tieBreak str : is how fields with equally few possible numbers are chosen (see solveSudoku)
+        stats SolveStats : collects the statistics of the search or is None
+        hooks SearchHooks : are the callbacks of the search or None
+        timeout float : is the wall-clock time in seconds after which the search gives up or None
+        maxNodes int : is the number of assumptions after which the search gives up or None
+        cancel threading.Event : is a token which makes the search give up as soon as it is set or None
+
+    Yields:
+        list(int) : is each solution as N * N fields in row-major order or None if the search gave up, which ends the search
+    """
+    boxSize = __boxSizeOf__(sudoku)
+    size = boxSize * boxSize
+
+    def isInSolvedState(state : __WatchedCnf__) -> bool:
+        """checks if the assignment of the sudoku-cnf is solved
+
+        Args:
+            state __WatchedCnf__ : is the propagated assignment without conflict
+
+        Returns:
+            bool : is True if in solved form or False if its not in solved form
+        """
+        #since propagation of the general sudoku-cnf sets at most one number per field, it is solved if each field is set
+        return state.assignedFields == size * size
+
+    def getUnallocatetField(state : __WatchedCnf__) -> tuple:
+        """gets the unallocated field with the least possible numbers remaining, ties are broken by tieBreak
+
+        Args:
+            state __WatchedCnf__ : is the propagated assignment without conflict
+
+        Results:
+            tuple(int, int, list(int)) : returns tuple containing a row-index, a collum-index and a list of possible allocations or None if none was found
+        """
+        #fields with a single candidate are already set by propagation
+        for count in range(2, size + 1):
+            bucket = state.buckets[count]
+            if bucket != 0:
+                break
+        else:
+            return None
+
+        #first field in row-major order
+        field = (bucket & -bucket).bit_length() - 1
+        if tieBreak == "degree":
+            #field with the most unset fields in its row, collum and block
+            bestDegree = -1
+            while bucket != 0:
+                bit = bucket & -bucket
+                bucket ^= bit
+                candidate = bit.bit_length() - 1
+                degree = sum(1 for peer in state.index.peers[candidate] if state.fields[peer] == 0)
+                if degree > bestDegree:
+                    field = candidate
+                    bestDegree = degree
+
+        row, col = divmod(field, size)
+        firstVar = __variable__(row, col, 1, size)
+        return (row, col, [n for n in range(1, size + 1) if state.values[firstVar + n - 1] != -1])
+
+    #limits of the search, checked after the setup and before each assumption
+    limited = timeout is not None or maxNodes is not None or cancel is not None
+    deadline = None if timeout is None else time.monotonic() + timeout
+    nodes = 0
+    if stats is not None:
+        stats.gaveUp = None
+
+    def interrupted() -> str:
+        """checks the cancel-token and the deadline
+
+        Returns:
+            str : is "cancelled" or "timeout" if the search has to give up or None
+        """
+        if cancel is not None and cancel.is_set():
+            return "cancelled"
+        if deadline is not None and time.monotonic() >= deadline:
+            return "timeout"
+        return None
+
+    def giveUp(reason : str) -> None:
+        """stores why the search gives up and the statistics so far
+
+        Args:
+            reason str : is "cancelled", "timeout" or "maxNodes"
+
+        Returns:
+            None
+        """
+        if stats is not None:
+            stats.gaveUp = reason
+            stats.clauseVisits = visitsBefore + state.clauseVisits
+            stats.searchSeconds += time.perf_counter() - resumed
+
+    #get watched sudoku-cnf, which is shared between the solves
+    #(if the search gets interrupted by an exception, the watch-lists may be inconsistent and are not given back)
+    if stats is not None:
+        start = time.perf_counter()
+        visitsBefore = stats.clauseVisits
+    state = __acquireWatchedCnf__(boxSize)
+    onDecision, onPropagate, onConflict, onBacktrack, onSolution = (None, None, None, None, None) if hooks is None else (
+        hooks.onDecision, hooks.onPropagate, hooks.onConflict, hooks.onBacktrack, hooks.onSolution)
+
+    #propagate of state, which also counts the propagations and calls the hooks if statistics or hooks are used
+    propagate = state.propagate
+    if stats is not None or onPropagate is not None or onConflict is not None:
+        def propagate(head : int) -> bool:
+            """calls state.propagate, counts the set literals and the time and calls the hooks
+
+            Args:
+                head int : is the index of the first literal on the trail which is not propagated yet
+
+            Returns:
+                bool : is False if a clause got falsified (conflict) and True otherwise
+            """
+            before = len(state.trail)
+            if stats is not None:
+                propagateStart = time.perf_counter()
+            result = state.propagate(head)
+            if stats is not None:
+                stats.propagationSeconds += time.perf_counter() - propagateStart
+                stats.propagations += len(state.trail) - before
+            if onPropagate is not None:
+                onPropagate(state.trail[before:])
+            if not result and onConflict is not None:
+                onConflict()
+            return result
+
+    try:
+        #the first solve of a block-size builds the watched sudoku-cnf, which can not be interrupted, the limits are checked afterwards
+        reason = interrupted() if limited else None
+        if reason is None:
+            #read in unit-clauses of the general sudoku-cnf and given sudoku
+            conflict = False
+            for lit in state.index.unitClauses:
+                conflict = conflict or not state.enqueue(lit)
+            for row in range(0, size):
+                for col in range(0, size):
+                    if sudoku[row][col] != 0:
+                        conflict = conflict or not state.enqueue(__variable__(row, col, sudoku[row][col], size))
+            conflict = conflict or not propagate(0)
+            reason = interrupted() if limited else None
+
+        #contains still untried unit-clauses and the length of the trail before they are tried as tuples
+        stackAddableUnitClauses = list()
+        if stats is not None:
+            resumed = time.perf_counter()
+            stats.setupSeconds += resumed - start
+        if reason is not None:
+            giveUp(reason)
+            yield None
+            __releaseWatchedCnf__(state)
+            return
+
+        while True:
+            if conflict and len(stackAddableUnitClauses) == 0:
+                #no more solutions
+                break
+            elif conflict and len(stackAddableUnitClauses) > 0:
+                #check other configuration -> you made a wrong assumption (or search for the next solution)
+
+                newClause = stackAddableUnitClauses.pop()
+                if stats is not None:
+                    stats.backtracks += 1
+                if onBacktrack is not None:
+                    onBacktrack(*__fieldOfVariable__(newClause[0], size))
+                state.undo(newClause[1])
+                state.enqueue(newClause[0])
+                conflict = not propagate(newClause[1])
+            elif isInSolvedState(state):
+                if stats is not None:
+                    stats.solutions += 1
+                    stats.clauseVisits = visitsBefore + state.clauseVisits
+                    stats.searchSeconds += time.perf_counter() - resumed
+                if onSolution is not None:
+                    onSolution([state.fields[row * size: row * size + size] for row in range(0, size)])
+                yield state.fields.copy()
+                if stats is not None:
+                    resumed = time.perf_counter()
+                #continue the search like after a wrong assumption
+                conflict = True
+            else:
+                #test further with additional allocation of a field
+                if limited:
+                    reason = interrupted()
+                    if reason is None and maxNodes is not None and nodes >= maxNodes:
+                        reason = "maxNodes"
+                    if reason is not None:
+                        giveUp(reason)
+                        yield None
+                        __releaseWatchedCnf__(state)
+                        return
+                    nodes += 1
+
+                #get good non-set field
+                tmp = getUnallocatetField(state)
+                #add to stack and try out allocations
+                level = len(state.trail)
+                for unit in tmp[2][1:]:
+                    stackAddableUnitClauses.append((__variable__(tmp[0], tmp[1], unit, size), level))
+                if stats is not None:
+                    stats.decisions += 1
+                    stats.maxDepth = max(stats.maxDepth, len(stackAddableUnitClauses))
+                if onDecision is not None:
+                    onDecision(tmp[0], tmp[1], tmp[2][0])
+                state.enqueue(__variable__(tmp[0], tmp[1], tmp[2][0], size))
+                conflict = not propagate(level)
+    except GeneratorExit:
+        __releaseWatchedCnf__(state)
+        raise
+    if stats is not None:
+        stats.clauseVisits = visitsBefore + state.clauseVisits
+        stats.searchSeconds += time.perf_counter() - resumed
+    __releaseWatchedCnf__(state)
+
+def __variable__(row : int, col : int, n : int, size : int = 9) -> int:
+    """gets the cnf-variable which is true if field (row, col) is set to n
+
+    Args:
+        row int : is the row-index of the field (0 to size - 1)
+        col int : is the collum-index of the field (0 to size - 1)
+        n int : is the number of the field (1 to size)
+        size int : is the number of rows of the sudoku
+
+    Returns:
+        int : is the variable size * size * row + size * col + n (from 1 to size³, e.g. 81 * row + 9 * col + n), its negation -var is the negated literal
+    """
+    return size * size * row + size * col + n
+
+def __fieldOfVariable__(var : int, size : int = 9) -> tuple:
+    """inverse of __variable__
+
+    Args:
+        var int : is a positive cnf-variable up to size³
+        size int : is the number of rows of the sudoku
+
+    Returns:
+        tuple(int, int, int) : is the row-index, the collum-index and the number belonging to var
+    """
+    row, rest = divmod(var - 1, size * size)
+    col, n = divmod(rest, size)
+    return (row, col, n + 1)
+
+def __buildOccurrences__(cnf : list, numberOfVariables : int) -> list:
+    """builds an index from each literal to the clauses containing it
+
+    Args:
+        cnf list(list(int)) : is a list of clauses
+        numberOfVariables int : is the highest variable used in cnf
+
+    Returns:
+        list(list(int)) : contains for each literal (negative literals index from the end) the indices of the clauses containing it
+    """
+    occurrences = [list() for _ in range(2 * numberOfVariables + 1)]
+    for index, clause in enumerate(cnf):
+        for lit in clause:
+            occurrences[lit].append(index)
+    return occurrences
+
+def __buildWatches__(cnf : list, numberOfVariables : int) -> tuple:
+    """prepares a cnf for __WatchedCnf__.propagate by watching the first two literals of each clause
+
+    Args:
+        cnf list(list(int)) : is a list of clauses with at least two literals each
+        numberOfVariables int : is the highest variable used in cnf
+
+    Returns:
+        tuple(list(list(int)), list(list(int))) : is a copy of the clauses and the watch-lists, which contain for each literal the indices of the clauses watching it
+    """
+    clauses = [clause.copy() for clause in cnf]
+    watches = [list() for _ in range(2 * numberOfVariables + 1)]
+    for index, clause in enumerate(clauses):
+        watches[clause[0]].append(index)
+        watches[clause[1]].append(index)
+    return (clauses, watches)
+
+class __GeneralCnfIndex__:
+    """index of the general sudoku-cnf of one block-size, it is built only once and shared by all solves (see __getGeneralCnfIndex__)
+
+    Attributes:
+        boxSize int : is the block-size
+        size int : is the number of rows, collums and numbers
+        numberOfVariables int : is the highest variable of the cnf, variables above size³ are auxiliary variables of the encoding
+        cnf list(list(int)) : is the general sudoku-cnf
+        occurrences list(list(int)) : are the clauses containing each literal (see __buildOccurrences__)
+        implications list(list(int)) : are the literals implied by each falsified literal through a binary clause
+        longClauses list(list(int)) : are the clauses with more than two literals
+        unitClauses list(int) : are the literals of the unit-clauses (only the cnf of block-size 1 has one), they are set by the search before the sudoku
+        fieldOfVariable list(int) : is the field-index in row-major order of each variable or -1 for auxiliary variables
+        numberOfVariable list(int) : is the number of each variable
+        fieldBit list(int) : is 1 << field for each field-index
+        peers list(list(int)) : are the indices of the other fields in the row, collum and block of each field
+    """
+
+    def __init__(self, boxSize : int, cnf : list):
+        """indexes cnf
+
+        Args:
+            boxSize int : is the block-size
+            cnf list(list(int)) : is the general sudoku-cnf of that block-size
+        """
+        self.boxSize = boxSize
+        self.size = size = boxSize * boxSize
+        self.cnf = cnf
+        self.numberOfVariables = max(max(abs(lit) for lit in clause) for clause in cnf)
+        self.occurrences = __buildOccurrences__(cnf, self.numberOfVariables)
+        self.implications = [list() for _ in self.occurrences]
+        for var in range(1, self.numberOfVariables + 1):
+            for lit in (var, -var):
+                for index in self.occurrences[lit]:
+                    if len(cnf[index]) == 2:
+                        self.implications[lit].append(cnf[index][1] if cnf[index][0] == lit else cnf[index][0])
+        self.longClauses = [clause for clause in cnf if len(clause) > 2]
+        self.unitClauses = [clause[0] for clause in cnf if len(clause) == 1]
+
+        self.fieldOfVariable = [-1] * (self.numberOfVariables + 1)
+        self.numberOfVariable = [0] * (self.numberOfVariables + 1)
+        for var in range(1, size * size * size + 1):
+            row, col, n = __fieldOfVariable__(var, size)
+            self.fieldOfVariable[var] = row * size + col
+            self.numberOfVariable[var] = n
+        self.fieldBit = [1 << field for field in range(0, size * size)]
+        self.peers = [
+            [peer for peer in range(0, size * size) if peer != field and (peer // size == field // size or peer % size == field % size
+                or (peer // (size * boxSize) == field // (size * boxSize) and (peer % size) // boxSize == (field % size) // boxSize))]
+            for field in range(0, size * size)
+        ]
+
+class __WatchedCnf__:
+    """the general sudoku-cnf with two watched literals per clause with more than two literals (see __buildWatches__)
+    and an assignment of its literals. The binary clauses are propagated with the shared __GeneralCnfIndex__.
+    The clauses and watch-lists are reused by later solves, since the watch-lists stay valid when literals are taken back
+
+    Attributes:
+        index __GeneralCnfIndex__ : is the index of the general sudoku-cnf
+        values list(int) : is the assignment indexed by literal (negative literals index from the end): 1 if the literal is true, -1 if it is false and 0 if it is unassigned
+        trail list(int) : are the set literals in the order they were set
+        fields list(int) : is the number set for each field in row-major order or 0 if the field is not set
+        assignedFields int : is the number of set fields
+        candidates list(int) : is the number of not falsified numbers of each field
+        buckets list(int) : contains for each number of candidates a bitmask of the unset fields (bit i is field i) with that many candidates
+        clauseVisits int : is the number of clauses visited by propagate since the last reset
+    """
+
+    def __init__(self, index : __GeneralCnfIndex__):
+        """builds the watch-lists for the clauses with more than two literals
+
+        Args:
+            index __GeneralCnfIndex__ : is the index of the general sudoku-cnf
+        """
+        self.index = index
+        self.implications = index.implications
+        self.fieldOfVariable = index.fieldOfVariable
+        self.numberOfVariable = index.numberOfVariable
+        self.fieldBit = index.fieldBit
+        self.clauses, self.watches = __buildWatches__(index.longClauses, index.numberOfVariables)
+        self.reset()
+
+    def reset(self) -> None:
+        """takes back all set literals
+
+        Returns:
+            None
+        """
+        size = self.index.size
+        self.values = [0] * (2 * self.index.numberOfVariables + 1)
+        self.trail = list()
+        self.fields = [0] * (size * size)
+        self.assignedFields = 0
+        self.candidates = [size] * (size * size)
+        self.buckets = [0] * (size + 1)
+        self.buckets[size] = (1 << (size * size)) - 1
+        self.clauseVisits = 0
+
+    def enqueue(self, lit : int) -> bool:
+        """sets a literal to true without propagating it
+
+        Args:
+            lit int : is the literal to set, it is appended to the trail if it was unassigned
+
+        Returns:
+            bool : is False if lit is already false (conflict) and True otherwise
+        """
+        value = self.values[lit]
+        if value == 0:
+            self.assign(lit)
+        return value != -1
+
+    def assign(self, lit : int) -> None:
+        """sets an unassigned literal to true and appends it to the trail
+
+        Args:
+            lit int : is the literal to set
+
+        Returns:
+            None
+        """
+        self.values[lit] = 1
+        self.values[-lit] = -1
+        self.trail.append(lit)
+        if self.fieldOfVariable[lit if lit > 0 else -lit] < 0:
+            #auxiliary variable
+            return
+        if lit > 0:
+            field = self.fieldOfVariable[lit]
+            self.fields[field] = self.numberOfVariable[lit]
+            self.assignedFields += 1
+            self.buckets[self.candidates[field]] ^= self.fieldBit[field]
+        else:
+            field = self.fieldOfVariable[-lit]
+            count = self.candidates[field]
+            self.candidates[field] = count - 1
+            if self.fields[field] == 0:
+                self.buckets[count] ^= self.fieldBit[field]
+                self.buckets[count - 1] |= self.fieldBit[field]
+
+    def undo(self, length : int) -> None:
+        """takes back all literals set after the trail had the given length
+
+        Args:
+            length int : is the length of the trail to go back to
+
+        Returns:
+            None
+        """
+        values = self.values
+        trail = self.trail
+        fields = self.fields
+        candidates = self.candidates
+        buckets = self.buckets
+        fieldOfVariable = self.fieldOfVariable
+        fieldBit = self.fieldBit
+        while len(trail) > length:
+            lit = trail.pop()
+            values[lit] = 0
+            values[-lit] = 0
+            if fieldOfVariable[lit if lit > 0 else -lit] < 0:
+                #auxiliary variable
                 continue
-            
-            #if clause contains one of the negated unit-clauses, update clause
-            tmpCl = cl.copy()
-            appendNewClause = False
-            for clause in clauses:
-                if (not clause[0], clause[1]) in cl:
-                    tmpCl.remove((not clause[0], clause[1]))
-                    appendNewClause = True
-            if appendNewClause:
-                tmpCnf.remove(cl)        
-                tmpCnf.append(tmpCl)
-                appendNewClause = False
-                
-                if len(tmpCl) == 1 and tmpCl[0] not in newUnitclauses:
-                    newUnitclauses.update({(tmpCl[0])})
-                
-                
-        #add unitclauses to cnf if neccesary
-        for clause in clauses:
-            if [clause] not in tmpCnf:
-                tmpCnf.append([clause])
+            if lit > 0:
+                field = fieldOfVariable[lit]
+                fields[field] = 0
+                self.assignedFields -= 1
+                buckets[candidates[field]] |= fieldBit[field]
+            else:
+                field = fieldOfVariable[-lit]
+                count = candidates[field]
+                candidates[field] = count + 1
+                if fields[field] == 0:
+                    buckets[count] ^= fieldBit[field]
+                    buckets[count + 1] |= fieldBit[field]
+
+    def propagate(self, head : int) -> bool:
+        """makes unitresolution for the literals set from trail[head] onwards.
+        For a falsified literal, the binary clauses containing it are found with the shared occurrence-index
+        and only the longer clauses watching it are visited.
+        The first two literals of each longer clause are its watched ones and are swapped around in place
+
+        Args:
+            head int : is the index of the first literal on the trail which is not propagated yet
+
+        Returns:
+            bool : is False if a clause got falsified (conflict) and True otherwise
+        """
+        clauses = self.clauses
+        watches = self.watches
+        implications = self.implications
+        values = self.values
+        trail = self.trail
+        assign = self.assign
 
-        return (tmpCnf, newUnitclauses)
+        while head < len(trail):
+            falseLit = -trail[head]
+            head += 1
+
+            #binary clauses with falseLit imply their other literal
+            for other in implications[falseLit]:
+                value = values[other]
+                if value == 0:
+                    assign(other)
+                elif value == -1:
+                    return False
+
+            #longer clauses watching falseLit
+            watching = watches[falseLit]
+            #counted once per literal, so counting does not slow down the loop over the clauses
+            self.clauseVisits += len(implications[falseLit]) + len(watching)
+            i = 0
+            j = 0
+            while i < len(watching):
+                index = watching[i]
+                i += 1
+                clause = clauses[index]
+                if clause[0] == falseLit:
+                    clause[0] = clause[1]
+                    clause[1] = falseLit
+                other = clause[0]
+                if values[other] == 1:
+                    #clause is satisfied, keep watching
+                    watching[j] = index
+                    j += 1
+                    continue
+
+                #look for a new literal to watch
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if values[lit] != -1:
+                        clause[1] = lit
+                        clause[k] = falseLit
+                        watches[lit].append(index)
+                        break
+                else:
+                    watching[j] = index
+                    j += 1
+                    if values[other] == -1:
+                        #every literal is false
+                        while i < len(watching):
+                            watching[j] = watching[i]
+                            i += 1
+                            j += 1
+                        del watching[j:]
+                        return False
+                    #clause became a unit-clause
+                    assign(other)
+            del watching[j:]
+
+        return True
+
+#watched sudoku-cnfs by block-size, which are not used by a running solve, see __acquireWatchedCnf__
+__watchedCnfPool__ = dict()
+
+#index of the general sudoku-cnf by block-size, see __getGeneralCnfIndex__
+__generalCnfIndices__ = dict()
+
+def __getGeneralCnf__() -> list:
+    """gets the general sudoku-cnf, it is imported from sudokuGeneralCnf only once on the first call, so importing
+    sudokuSolver stays fast. If sudokuGeneralCnf is missing, it is constructed with __createSudokuCnf__
+
+    Returns:
+        list(list(int)) : is the general sudoku-cnf, which must not be changed
+    """
+    global sudokuGeneral
+    if sudokuGeneral is None:
+        try:
+            import sudokuGeneralCnf
+            sudokuGeneral = sudokuGeneralCnf.sudokuGeneral
+        except ImportError:
+            sudokuGeneral = __createSudokuCnf__()
+    return sudokuGeneral
+
+def __getGeneralCnfIndex__(boxSize : int = 3) -> __GeneralCnfIndex__:
+    """gets the index of the general sudoku-cnf, it is built only once per block-size and shared by all solves
+
+    Args:
+        boxSize int : is the block-size
+
+    Returns:
+        __GeneralCnfIndex__ : is the index
+    """
+    index = __generalCnfIndices__.get(boxSize)
+    if index is None:
+        cnf = __getGeneralCnf__() if boxSize == 3 else __createSudokuCnf__(boxSize)
+        index = __generalCnfIndices__.setdefault(boxSize, __GeneralCnfIndex__(boxSize, cnf))
+    return index
+
+def __acquireWatchedCnf__(boxSize : int = 3) -> __WatchedCnf__:
+    """gets the watched general sudoku-cnf for one solve.
+    It is built only once and reused by later solves, since the watch-lists stay valid for an empty assignment
+
+    Args:
+        boxSize int : is the block-size
+
+    Returns:
+        __WatchedCnf__ : is the watched sudoku-cnf with an empty assignment, which needs to be given back with __releaseWatchedCnf__
+    """
+    try:
+        return __watchedCnfPool__.setdefault(boxSize, list()).pop()
+    except IndexError:
+        return __WatchedCnf__(__getGeneralCnfIndex__(boxSize))
+
+def __releaseWatchedCnf__(watchedCnf : __WatchedCnf__) -> None:
+    """gives back the watched sudoku-cnf of __acquireWatchedCnf__ after the solve is finished
+
+    Args:
+        watchedCnf __WatchedCnf__ : is the watched sudoku-cnf, its assignment is taken back
+
+    Returns:
+        None
+    """
+    watchedCnf.reset()
+    __watchedCnfPool__[watchedCnf.index.boxSize].append(watchedCnf)
+
+def __unitResolutionForSet__(cnf : list, units : set) -> list:
+    """makes unitresolution to given cnf for list of unitclauses and for the newly created ones.
+    solveSudoku uses __WatchedCnf__ instead, this is the reference implementation working on the plain cnf.
+    Each unitclause only touches the clauses containing it or its negation (see __buildOccurrences__)
+
+    Args:
+        cnf list(list(int)) : is a list of clauses
+        units set(int) : contains the unitclauses
+
+    Returns:
+        list(list(int)): is the new cnf after resolution
+    """
+    numberOfVariables = max((abs(lit) for clause in cnf for lit in clause), default=0)
+    numberOfVariables = max([numberOfVariables] + [abs(unit) for unit in units])
+    occurrences = __buildOccurrences__(cnf, numberOfVariables)
+    tmpCnf = [cl.copy() for cl in cnf]
+    removed = [False] * len(tmpCnf)
 
     #make resolution
-    newClauses = units
+    newClauses = list(units)
+    setUnits = set()
     while len(newClauses) > 0:
-        res = makeUnitResolution(cnf, newClauses)
-        newClauses = res[1]
-        cnf = res[0].copy()
-
-    #remove duplicates
-    tmpCnf = list()
-    for cl in cnf:
-        if cl not in tmpCnf:
-            tmpCnf.append(cl.copy())
-    return tmpCnf
+        unit = newClauses.pop()
+        if unit in setUnits:
+            continue
+        setUnits.add(unit)
+
+        #if clause contains the unitclause, remove clause
+        for index in occurrences[unit]:
+            removed[index] = True
+
+        #if clause contains the negated unit-clause, update clause
+        for index in occurrences[-unit]:
+            if not removed[index]:
+                tmpCnf[index].remove(-unit)
+                if len(tmpCnf[index]) == 1:
+                    newClauses.append(tmpCnf[index][0])
+
+    #add unitclauses and remove duplicates
+    result = list()
+    seen = set()
+    for cl in [cl for index, cl in enumerate(tmpCnf) if not removed[index]] + [[unit] for unit in setUnits]:
+        if tuple(cl) not in seen:
+            seen.add(tuple(cl))
+            result.append(cl)
+    if any(-unit in setUnits for unit in setUnits) and [] not in result:
+        #contradicting unitclauses
+        result.append([])
+    return result
   
-# a small cnf, which can be used to construct the full cnf for the solver in __createSudokuCnf__(is needed when sudokuGeneralCnf-Import failes)
-__generalCNF__ = [
-    [(False, 'h'), (False, 'i')],
-    [(False, 'g'), (False, 'i')],
-    [(False, 'g'), (False, 'h')],
-    [(False, 'f'), (False, 'i')],
-    [(False, 'f'), (False, 'h')],
-    [(False, 'f'), (False, 'g')],
-    [(False, 'e'), (False, 'i')],
-    [(False, 'e'), (False, 'h')],
-    [(False, 'e'), (False, 'g')],
-    [(False, 'e'), (False, 'f')],
-    [(False, 'd'), (False, 'i')],
-    [(False, 'd'), (False, 'h')],
-    [(False, 'd'), (False, 'g')],
-    [(False, 'd'), (False, 'f')],
-    [(False, 'd'), (False, 'e')],
-    [(False, 'c'), (False, 'i')],
-    [(False, 'c'), (False, 'h')],
-    [(False, 'c'), (False, 'g')],
-    [(False, 'c'), (False, 'f')],
-    [(False, 'c'), (False, 'e')],
-    [(False, 'c'), (False, 'd')],
-    [(False, 'b'), (False, 'i')],
-    [(False, 'b'), (False, 'h')],
-    [(False, 'b'), (False, 'g')],
-    [(False, 'b'), (False, 'f')],
-    [(False, 'b'), (False, 'e')],
-    [(False, 'b'), (False, 'd')],
-    [(False, 'b'), (False, 'c')],
-    [(False, 'a'), (False, 'i')],
-    [(False, 'a'), (False, 'h')],
-    [(False, 'a'), (False, 'g')],
-    [(False, 'a'), (False, 'f')],
-    [(False, 'a'), (False, 'e')],
-    [(False, 'a'), (False, 'd')],
-    [(False, 'a'), (False, 'c')],
-    [(False, 'a'), (False, 'b')],
-    [(True, 'a'), (True, 'b'), (True, 'c'), (True, 'd'), (True, 'e'), (True, 'f'), (True, 'g'), (True, 'h'), (True, 'i')]
-]
-
-def __createSudokuCnf__() -> list:
+def __exactlyOneCnf__(variables : list, encoding : str, nextVariable : int) -> tuple:
+    """creates clauses forcing exactly one of the variables to be true
+
+    Args:
+        variables list(int) : are the variables
+        encoding str : is "pairwise" for a binary clause per pair of variables (k² / 2 clauses) or "sequential" for a
+            sequential counter with auxiliary variables (3k clauses), which propagates the same but stays small for many variables
+        nextVariable int : is the first unused variable for the auxiliary variables
+
+    Returns:
+        tuple(list(list(int)), int) : are the clauses and the next unused variable
+    """
+    k = len(variables)
+    clauses = list()
+    if encoding == "pairwise":
+        for a in range(k - 2, -1, -1):
+            for b in range(k - 1, a, -1):
+                clauses.append([-variables[a], -variables[b]])
+    elif encoding == "sequential":
+        #auxiliary variable s[i] is true if one of variables[0..i] is true
+        s = list(range(nextVariable, nextVariable + k - 1))
+        nextVariable += k - 1
+        clauses.append([-variables[0], s[0]])
+        for i in range(1, k - 1):
+            clauses.append([-variables[i], s[i]])
+            clauses.append([-s[i - 1], s[i]])
+            clauses.append([-variables[i], -s[i - 1]])
+        clauses.append([-variables[k - 1], -s[k - 2]])
+    else:
+        raise ValueError("unknown encoding: " + str(encoding))
+    clauses.append(list(variables))
+    return (clauses, nextVariable)
+
+def __createSudokuCnf__(boxSize : int = 3, encoding : str = None) -> list:
     """creates a general cnf defining sudoku
 
+        Args:
+            boxSize int : is the block-size, the sudoku has boxSize² rows
+            encoding str : is the encoding of "at most one" (see __exactlyOneCnf__), by default "pairwise" up to 9 rows and "sequential" above
+
         Returns:
-            list(list(tuple(bool, str))): is the constructed cnf
+            list(list(int)): is the constructed cnf
     """
+    size = boxSize * boxSize
+    if encoding is None:
+        encoding = "pairwise" if size <= 9 else "sequential"
     result = list()
+    nextVariable = size * size * size + 1
+
+    def addGroup(variables : list) -> None:
+        """adds the clauses forcing exactly one of the variables to be true
+
+        Args:
+            variables list(int) : are the variables
+
+        Returns:
+            None
+        """
+        nonlocal nextVariable
+        clauses, nextVariable = __exactlyOneCnf__(variables, encoding, nextVariable)
+        result.extend(clauses)
     
     #each field can be set and needs to be set
-    for row in range(0,9):
-        for col in range(0,9):
-            renameDict = {
-                'a' : str(row) + str(col) + "-1",
-                'b' : str(row) + str(col) + "-2",
-                'c' : str(row) + str(col) + "-3",
-                'd' : str(row) + str(col) + "-4",
-                'e' : str(row) + str(col) + "-5",
-                'f' : str(row) + str(col) + "-6",
-                'g' : str(row) + str(col) + "-7",
-                'h' : str(row) + str(col) + "-8",
-                'i' : str(row) + str(col) + "-9",
-            }
-            tmpClause = list()
-            for clause in __generalCNF__:
-                for literal in clause:
-                    tmpClause.append((literal[0], renameDict[literal[1]]))
-                result.append(tmpClause)
-                tmpClause = list()
+    for row in range(0, size):
+        for col in range(0, size):
+            addGroup([__variable__(row, col, n, size) for n in range(1, size + 1)])
                 
     #each row can only contain each number once
-    for row in range(0,9):
-        for n in range(1,10):
-            renameDict = {
-                'a' : str(row) + "0-" + str(n),
-                'b' : str(row) + "1-" + str(n),
-                'c' : str(row) + "2-" + str(n),
-                'd' : str(row) + "3-" + str(n),
-                'e' : str(row) + "4-" + str(n),
-                'f' : str(row) + "5-" + str(n),
-                'g' : str(row) + "6-" + str(n),
-                'h' : str(row) + "7-" + str(n),
-                'i' : str(row) + "8-" + str(n),
-            }
-            tmpClause = list()
-            for clause in __generalCNF__:
-                for literal in clause:
-                    tmpClause.append((literal[0], renameDict[literal[1]]))
-                result.append(tmpClause)
-                tmpClause = list()
+    for row in range(0, size):
+        for n in range(1, size + 1):
+            addGroup([__variable__(row, col, n, size) for col in range(0, size)])
                 
     #each collum can only contain each number once
-    for col in range(0,9):
-        for n in range(1,10):
-            renameDict = {
-                'a' : "0" + str(col) + "-" + str(n),
-                'b' : "1" + str(col) + "-" + str(n),
-                'c' : "2" + str(col) + "-" + str(n),
-                'd' : "3" + str(col) + "-" + str(n),
-                'e' : "4" + str(col) + "-" + str(n),
-                'f' : "5" + str(col) + "-" + str(n),
-                'g' : "6" + str(col) + "-" + str(n),
-                'h' : "7" + str(col) + "-" + str(n),
-                'i' : "8" + str(col) + "-" + str(n),
-            }
-            tmpClause = list()
-            for clause in __generalCNF__:
-                for literal in clause:
-                    tmpClause.append((literal[0], renameDict[literal[1]]))
-                result.append(tmpClause)
-                tmpClause = list()
+    for col in range(0, size):
+        for n in range(1, size + 1):
+            addGroup([__variable__(row, col, n, size) for row in range(0, size)])
     
     #each block can only contain each number once
-    blocks = [
-        {'a': '00', 'b': '01', 'c': '02', 'd': '10', 'e': '11', 'f': '12', 'g': '20', 'h': '21', 'i': '22'},
-        {'a': '03', 'b': '04', 'c': '05', 'd': '13', 'e': '14', 'f': '15', 'g': '23', 'h': '24', 'i': '25'},
-        {'a': '06', 'b': '07', 'c': '08', 'd': '16', 'e': '17', 'f': '18', 'g': '26', 'h': '27', 'i': '28'},
-        
-        {'a': '30', 'b': '31', 'c': '32', 'd': '40', 'e': '41', 'f': '42', 'g': '50', 'h': '51', 'i': '52'},
-        {'a': '33', 'b': '34', 'c': '35', 'd': '43', 'e': '44', 'f': '45', 'g': '53', 'h': '54', 'i': '55'},
-        {'a': '36', 'b': '37', 'c': '38', 'd': '46', 'e': '47', 'f': '48', 'g': '56', 'h': '57', 'i': '58'},
-        
-        {'a': '60', 'b': '61', 'c': '62', 'd': '70', 'e': '71', 'f': '72', 'g': '80', 'h': '81', 'i': '82'},
-        {'a': '63', 'b': '64', 'c': '65', 'd': '73', 'e': '74', 'f': '75', 'g': '83', 'h': '84', 'i': '85'},
-        {'a': '66', 'b': '67', 'c': '68', 'd': '76', 'e': '77', 'f': '78', 'g': '86', 'h': '87', 'i': '88'}
-    ]
-    for block in blocks:
-        for n in range(1, 10):
-            tmpClause = list()
-            for clause in __generalCNF__:
-                for literal in clause:
-                    tmpClause.append((literal[0], block[literal[1]] + "-" + str(n)))
-                result.append(tmpClause)
-                tmpClause = list()
+    for blockRow in range(0, size, boxSize):
+        for blockCol in range(0, size, boxSize):
+            for n in range(1, size + 1):
+                addGroup([__variable__(blockRow + row, blockCol + col, n, size) for row in range(0, boxSize) for col in range(0, boxSize)])
     
-    #remove duplicates:
+    #remove duplicates (pairs of fields in the same row and block):
     tmp = list()
+    seen = set()
     for clause in result:
-        if clause not in tmp:
+        if tuple(clause) not in seen:
+            seen.add(tuple(clause))
             tmp.append(clause)
     
     return tmp
+
+if __name__ == '__main__':
+    #command-line interface, see sudokuCli
+    import sys
+    import sudokuCli
+    sys.exit(sudokuCli.main())
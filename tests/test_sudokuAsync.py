@@ -0,0 +1,86 @@
+#tests of sudokuAsync: shared solves of the same sudoku, cancelling a solve and the order of solveManyAsync
+
+import asyncio
+import os
+import random
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudokuAsync
+import sudokuSolver
+
+__DEMO__ = [[int(n) for n in "005300000800000020070010500400005300010070006003200080060500009004000030000009700"[row * 9: row * 9 + 9]] for row in range(0, 9)]
+__INKALA__ = [[int(n) for n in "800000000003600000070090200050007000000045700000100030001000068008500010090000400"[row * 9: row * 9 + 9]] for row in range(0, 9)]
+__UNSOLVEABLE__ = [[int(n) for n in "005300000800000020070010500400005300010070006003200080060500009004000030000009701"[row * 9: row * 9 + 9]] for row in range(0, 9)]
+
+
+def __hardSudoku__() -> list:
+    """gets a 25x25 sudoku, whose search takes long: 35% of the fields of a solution chosen at random
+
+    Returns:
+        list(list(int)) : is the sudoku
+    """
+    generator = random.Random(0)
+    solution = sudokuSolver.solveSudoku([[0] * 25 for _ in range(0, 25)])
+    return [[n if generator.random() < 0.35 else 0 for n in row] for row in solution]
+
+class AsyncSolverPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = sudokuAsync.AsyncSolverPool(workers=1, maxPending=1)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def testSameSudokusShareOneSolve(self):
+        submitted = list()
+        submit = self.pool.__executor__.submit
+
+        def countingSubmit(*args):
+            submitted.append(args)
+            return submit(*args)
+
+        self.pool.__executor__.submit = countingSubmit
+
+        async def solveAll():
+            return await asyncio.gather(*[self.pool.solve(__INKALA__) for _ in range(0, 8)])
+
+        solutions = asyncio.run(solveAll())
+        self.assertEqual(len(submitted), 1)
+        self.assertEqual(solutions, [sudokuSolver.solveSudoku(__INKALA__)] * 8)
+        self.assertEqual(self.pool.__pending__, dict())
+
+    def testCancelFreesTheSlot(self):
+        async def cancelAndSolve():
+            task = asyncio.ensure_future(self.pool.solve(__hardSudoku__()))
+            #wait until the worker searches
+            while len(self.pool.__freeSlots__) > 0:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(2)
+            self.assertFalse(task.done())
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            start = time.monotonic()
+            solution = await asyncio.wait_for(self.pool.solve(__DEMO__), 30)
+            return solution, time.monotonic() - start
+
+        solution, seconds = asyncio.run(cancelAndSolve())
+        self.assertEqual(solution, sudokuSolver.solveSudoku(__DEMO__))
+        self.assertLess(seconds, 30)
+        self.assertEqual(self.pool.__freeSlots__, [0])
+
+    def testSolveManyKeepsOrder(self):
+        pool = sudokuAsync.AsyncSolverPool(workers=2, maxPending=3)
+        try:
+            sudokus = [__INKALA__, __DEMO__, __UNSOLVEABLE__, __DEMO__, __INKALA__, __UNSOLVEABLE__, __DEMO__]
+            solutions = asyncio.run(sudokuAsync.solveManyAsync(sudokus, pool=pool))
+            self.assertEqual(solutions, [sudokuSolver.solveSudoku(sudoku) for sudoku in sudokus])
+        finally:
+            pool.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+#tests of the canonical form of sudokuCache: sudokus transformed by the symmetries of sudokus hit the cached solution and
+#get a valid solution back, the LRU-eviction and the on-disk stores
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudokuCache
+import sudokuSolver
+
+__SUDOKUS__ = [
+    "005300000800000020070010500400005300010070006003200080060500009004000030000009700",
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+]
+__UNSOLVEABLE__ = "005300000800000020070010500400005300010070006003200080060500009004000030000009701"
+
+
+def __toSudoku__(line : str) -> list:
+    return [[int(line[row * 9 + col]) for col in range(0, 9)] for row in range(0, 9)]
+
+def __transform__(sudoku : list, generator : random.Random, boxSize : int = 3) -> list:
+    """applies a random symmetry: permutes the bands, the stacks, the rows of each band and the collums of each stack,
+    relabels the numbers and transposes
+
+    Args:
+        sudoku list(list(int)) : is the sudoku
+        generator random.Random : is the random generator
+        boxSize int : is the block-size
+
+    Returns:
+        list(list(int)) : is the transformed sudoku
+    """
+    size = boxSize * boxSize
+
+    def lineOrder() -> list:
+        bands = generator.sample(range(0, boxSize), boxSize)
+        return [band * boxSize + line for band in bands for line in generator.sample(range(0, boxSize), boxSize)]
+
+    rowOrder = lineOrder()
+    colOrder = lineOrder()
+    relabel = [0] + generator.sample(range(1, size + 1), size)
+    transformed = [[relabel[sudoku[row][col]] for col in colOrder] for row in rowOrder]
+    if generator.random() < 0.5:
+        transformed = [list(col) for col in zip(*transformed)]
+    return transformed
+
+class CanonicalFormTest(unittest.TestCase):
+
+    def testTransformedSudokusHitTheCache(self):
+        generator = random.Random(1)
+        for line in __SUDOKUS__:
+            sudoku = __toSudoku__(line)
+            cache = sudokuCache.SolutionCache()
+            self.assertEqual(cache.solve(sudoku), sudokuSolver.solveSudoku(sudoku))
+            for _ in range(0, 30):
+                transformed = __transform__(sudoku, generator)
+                self.assertEqual(sudokuCache.__canonicalForm__(transformed, 3)[0], sudokuCache.__canonicalForm__(sudoku, 3)[0])
+                self.assertTrue(sudokuSolver.isValidSolution(transformed, cache.solve(transformed)))
+            self.assertEqual((cache.hits, cache.misses), (30, 1))
+
+    def testFromCanonicalFormIsInverse(self):
+        generator = random.Random(2)
+        for line in __SUDOKUS__:
+            sudoku = __transform__(__toSudoku__(line), generator)
+            key, transform = sudokuCache.__canonicalForm__(sudoku, 3)
+            self.assertEqual(sudokuCache.__fromCanonicalForm__([sudokuCache.__DIGITS__.index(n) for n in key], transform), sudoku)
+
+    def testUnsetNumbersAreRelabeled(self):
+        #8 and 9 are not set, the solution of the canonical sudoku gives them labels, which must be mapped back
+        generator = random.Random(3)
+        sudoku = [[n if n < 8 else 0 for n in row] for row in __toSudoku__(__SUDOKUS__[0])]
+        cache = sudokuCache.SolutionCache()
+        for _ in range(0, 10):
+            transformed = __transform__(sudoku, generator)
+            self.assertTrue(sudokuSolver.isValidSolution(transformed, cache.solve(transformed)))
+        self.assertEqual(cache.misses, 1)
+
+    def testUnsolveableSudokusAreCached(self):
+        cache = sudokuCache.SolutionCache()
+        sudoku = __toSudoku__(__UNSOLVEABLE__)
+        self.assertEqual(cache.solve(sudoku), [])
+        self.assertEqual(cache.solve(__transform__(sudoku, random.Random(4))), [])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+class SolutionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testLeastRecentlyUsedIsEvicted(self):
+        cache = sudokuCache.SolutionCache(maxSize=2)
+        first, second, third = [__toSudoku__(line) for line in __SUDOKUS__]
+        cache.solve(first)
+        cache.solve(second)
+        cache.solve(first)
+        cache.solve(third)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        #second was evicted, first was used more recently
+        cache.solve(first)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        cache.solve(second)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def testStoresPersist(self):
+        for store in (sudokuCache.SqliteStore, sudokuCache.DbmStore):
+            path = os.path.join(self.directory, store.__name__)
+            sudoku = __toSudoku__(__SUDOKUS__[1])
+            cache = sudokuCache.SolutionCache(store=store(path))
+            solution = cache.solve(sudoku)
+            cache.solve(__toSudoku__(__UNSOLVEABLE__))
+            cache.close()
+
+            cache = sudokuCache.SolutionCache(store=store(path))
+            self.assertNotEqual(cache.solve(__transform__(sudoku, random.Random(5))), [])
+            self.assertEqual(cache.solve(sudoku), solution)
+            self.assertEqual(cache.solve(__toSudoku__(__UNSOLVEABLE__)), [])
+            self.assertEqual((cache.hits, cache.misses), (3, 0), store.__name__)
+            cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
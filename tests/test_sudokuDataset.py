@@ -0,0 +1,85 @@
+#tests of sudokuDataset: writing and reading both packings, broken files and solving a file in workers
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudokuCli
+import sudokuDataset
+import sudokuSolver
+
+__CORPORA__ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpora")
+
+
+def __readSudokus__(name : str, count : int) -> list:
+    sudokus = list()
+    with open(os.path.join(__CORPORA__, name)) as corpus:
+        for line in corpus:
+            sudoku = sudokuCli.__parseLine__(line.strip())
+            if sudoku is not None:
+                sudokus.append(sudoku)
+    return sudokus[:count]
+
+class DatasetTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sudokus = __readSudokus__("easy.txt", 40) + __readSudokus__("unsolveable.txt", 5) + __readSudokus__("hard.txt", 5)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def writeDataset(self, name : str, sudokus : list, packing : str) -> str:
+        path = os.path.join(self.directory, name)
+        with sudokuDataset.DatasetWriter(path, 3, packing) as writer:
+            for sudoku in sudokus:
+                writer.write(sudoku)
+        return path
+
+    def testRoundTrip(self):
+        for packing, recordSize in (("bytes", 81), ("nibbles", 41)):
+            path = self.writeDataset(packing, self.sudokus, packing)
+            self.assertEqual(os.path.getsize(path), 16 + len(self.sudokus) * recordSize)
+            with sudokuDataset.DatasetReader(path) as reader:
+                self.assertEqual((reader.boxSize, reader.packing, len(reader)), (3, packing, len(self.sudokus)))
+                self.assertEqual([sudokuSolver.__toRows__(sudoku) for sudoku in reader], self.sudokus)
+                self.assertEqual(sudokuSolver.__toRows__(reader[-1]), self.sudokus[-1])
+                with self.assertRaises(IndexError):
+                    reader[len(self.sudokus)]
+                sudokus = reader.asNumpy()
+                self.assertEqual(sudokus.shape, (len(self.sudokus), 9, 9))
+                self.assertEqual(sudokus.tolist(), self.sudokus)
+
+    def testBrokenFiles(self):
+        path = self.writeDataset("sudokus", self.sudokus, "nibbles")
+        with open(path, "rb") as file:
+            data = file.read()
+        for name, broken in (("truncated", data[:-1]), ("magic", b"SUDX" + data[4:]), ("header", data[:10])):
+            brokenPath = os.path.join(self.directory, name)
+            with open(brokenPath, "wb") as file:
+                file.write(broken)
+            with self.assertRaises(ValueError):
+                sudokuDataset.DatasetReader(brokenPath)
+
+    def testSolveDataset(self):
+        solutions = [sudokuSolver.solveSudoku(sudoku) for sudoku in self.sudokus]
+        for packing in ("bytes", "nibbles"):
+            inputPath = self.writeDataset(packing, self.sudokus, packing)
+            for workers in (None, 2):
+                outputPath = os.path.join(self.directory, "solutions")
+                solved = sudokuDataset.solveDataset(inputPath, outputPath, workers=workers, chunkSize=8)
+                self.assertEqual(solved, sum(1 for solution in solutions if len(solution) > 0))
+                with sudokuDataset.DatasetReader(outputPath) as reader:
+                    self.assertEqual(reader.packing, packing)
+                    expected = [solution if len(solution) > 0 else [[0] * 9 for _ in range(0, 9)] for solution in solutions]
+                    self.assertEqual([sudokuSolver.__toRows__(solution) for solution in reader], expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+#tests of sudokuDlx: the pooled exact-cover matrix is restored after each search and the counts of the engines agree
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudokuCli
+import sudokuDlx
+import sudokuSolver
+
+__CORPUS__ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpora", "multiple.txt")
+__INKALA__ = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+
+def __readSudokus__(count : int) -> list:
+    sudokus = list()
+    with open(__CORPUS__) as corpus:
+        for line in corpus:
+            sudoku = sudokuCli.__parseLine__(line.strip())
+            if sudoku is not None:
+                sudokus.append(sudoku)
+    return sudokus[:count]
+
+class ExactCoverMatrixTest(unittest.TestCase):
+
+    def assertMatrixRestored(self, boxSize : int) -> None:
+        fresh = vars(sudokuDlx.__ExactCoverMatrix__(boxSize))
+        self.assertGreater(len(sudokuDlx.__matrixPool__[boxSize]), 0)
+        for matrix in sudokuDlx.__matrixPool__[boxSize]:
+            self.assertEqual(vars(matrix), fresh)
+
+    def testMatrixIsRestoredAfterClosedSearch(self):
+        empty = [[0] * 4 for _ in range(0, 4)]
+        self.assertEqual(sudokuSolver.countSolutions(empty, limit=1, engine="dlx"), 1)
+        self.assertMatrixRestored(2)
+        sudoku = sudokuCli.__parseLine__(__INKALA__)
+        self.assertEqual(sudokuSolver.countSolutions(sudoku, limit=1, engine="dlx"), 1)
+        self.assertMatrixRestored(3)
+        self.assertEqual(sudokuSolver.solveSudoku(sudoku, "dlx"), sudokuSolver.solveSudoku(sudoku))
+
+    def testMatrixIsRestoredAfterExhaustedSearch(self):
+        empty = [[0] * 4 for _ in range(0, 4)]
+        self.assertEqual(sudokuSolver.countSolutions(empty, limit=None, engine="dlx"), 288)
+        self.assertMatrixRestored(2)
+        self.assertEqual(sudokuSolver.countSolutions(empty, limit=None, engine="dlx"), 288)
+
+    def testCountsAgreeWithOtherEngines(self):
+        empty = [[0] * 4 for _ in range(0, 4)]
+        for engine in ("cnf", "bitmask"):
+            self.assertEqual(sudokuSolver.countSolutions(empty, limit=None, engine=engine), 288)
+        for sudoku in __readSudokus__(10):
+            counts = [sudokuSolver.countSolutions(sudoku, limit=None, engine=engine) for engine in ("dlx", "bitmask", "cnf")]
+            self.assertEqual(len(set(counts)), 1, counts)
+            self.assertGreater(counts[0], 1)
+        self.assertMatrixRestored(3)
+
+if __name__ == '__main__':
+    unittest.main()
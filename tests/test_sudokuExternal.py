@@ -0,0 +1,112 @@
+#tests of sudokuExternal with stub SAT-solvers, which are written into a temporary directory put on PATH.
+#The stub reads the DIMACS-cnf from stdin, solves the sudoku of its unit-clauses with the dlx-engine and writes the model
+#in the format of the SAT-competition
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+__REPOSITORY__ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, __REPOSITORY__)
+
+import sudokuExternal
+import sudokuSolver
+
+__STUB__ = """import sys
+sys.path.insert(0, {repository!r})
+import sudokuSolver
+
+size = None
+numberOfVariables = 0
+units = list()
+for line in sys.stdin:
+    words = line.split()
+    if words[:3] == ["c", "sudoku", "with"]:
+        size = int(words[4].rstrip(":")) ** 2
+    elif len(words) > 0 and words[0] == "p":
+        numberOfVariables = int(words[2])
+    elif len(words) == 2:
+        units.append(int(words[0]))
+
+sudoku = [[0] * size for _ in range(0, size)]
+for unit in units:
+    row, col, n = sudokuSolver.__fieldOfVariable__(unit, size)
+    sudoku[row][col] = n
+solution = sudokuSolver.solveSudoku(sudoku, "dlx")
+if len(solution) == 0:
+    print("s UNSATISFIABLE")
+    sys.exit(20)
+true = {{sudokuSolver.__variable__(row, col, solution[row][col], size) for row in range(0, size) for col in range(0, size)}}
+print("s SATISFIABLE")
+print("v " + " ".join(str(var if var in true else -var) for var in range(1, numberOfVariables + 1)) + " 0")
+sys.exit(10)
+"""
+
+__HANGING__ = """import sys
+import time
+sys.stdin.read()
+time.sleep(60)
+"""
+
+__SUDOKU__ = "005300000800000020070010500400005300010070006003200080060500009004000030000009700"
+__UNSOLVEABLE__ = "005300000800000020070010500400005300010070006003200080060500009004000030000009701"
+
+
+def __toSudoku__(line : str) -> list:
+    return [[int(line[row * 9 + col]) for col in range(0, 9)] for row in range(0, 9)]
+
+class ExternalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.environ.get("PATH")
+        #only the stubs are found on PATH, not a SAT-solver installed on the machine
+        os.environ["PATH"] = self.directory
+
+    def tearDown(self):
+        if self.path is None:
+            del os.environ["PATH"]
+        else:
+            os.environ["PATH"] = self.path
+        shutil.rmtree(self.directory)
+
+    def writeStub(self, name : str, source : str) -> None:
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as file:
+            file.write("#!" + sys.executable + "\n" + source)
+        os.chmod(path, 0o755)
+
+    def testSatisfiable(self):
+        self.writeStub("kissat", __STUB__.format(repository=__REPOSITORY__))
+        sudoku = __toSudoku__(__SUDOKU__)
+        self.assertEqual(sudokuExternal.findSatSolver(), os.path.join(self.directory, "kissat"))
+        solution = sudokuExternal.solveSudokuExternal(sudoku)
+        self.assertTrue(sudokuSolver.isValidSolution(sudoku, solution))
+        self.assertEqual(sudokuSolver.solveSudoku(sudoku, "external"), solution)
+
+    def testUnsatisfiable(self):
+        self.writeStub("kissat", __STUB__.format(repository=__REPOSITORY__))
+        self.assertEqual(sudokuExternal.solveSudokuExternal(__toSudoku__(__UNSOLVEABLE__)), [])
+
+    def testTimeout(self):
+        self.writeStub("kissat", __HANGING__)
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            sudokuExternal.solveSudokuExternal(__toSudoku__(__SUDOKU__), timeout=0.5)
+        self.assertLess(time.monotonic() - start, 10)
+        #solveSudoku gives the timeout to the SAT-solver and returns None like a cnf-engine giving up
+        self.assertIsNone(sudokuSolver.solveSudoku(__toSudoku__(__SUDOKU__), "external", timeout=0.5))
+        self.assertIsNotNone(sudokuExternal.__DEFAULT_TIMEOUT__)
+
+    def testFallback(self):
+        sudoku = __toSudoku__(__SUDOKU__)
+        self.assertIsNone(sudokuExternal.findSatSolver())
+        self.assertEqual(sudokuExternal.solveSudokuExternal(sudoku), sudokuSolver.solveSudoku(sudoku))
+        with self.assertRaises(FileNotFoundError):
+            sudokuExternal.solveSudokuExternal(sudoku, solver="kissat")
+
+if __name__ == '__main__':
+    unittest.main()
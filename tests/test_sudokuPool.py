@@ -0,0 +1,59 @@
+#tests of sudokuPool: killed workers, stopping solve early and exceptions of solveSudoku in the workers
+
+import os
+import signal
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudokuCli
+import sudokuPool
+import sudokuSolver
+
+__CORPUS__ = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpora", "easy.txt")
+
+
+def __readSudokus__(count : int) -> list:
+    sudokus = list()
+    with open(__CORPUS__) as corpus:
+        for line in corpus:
+            sudoku = sudokuCli.__parseLine__(line.strip())
+            if sudoku is not None:
+                sudokus.append(sudoku)
+    return sudokus[:count]
+
+class SolverPoolTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sudokus = __readSudokus__(120)
+        cls.solutions = [sudokuSolver.solveSudoku(sudoku) for sudoku in cls.sudokus]
+
+    def testKilledWorkersAreReplaced(self):
+        with sudokuPool.SolverPool(workers=3, chunkSize=4) as pool:
+            solutions = list()
+            for solution in pool.solve(self.sudokus):
+                if len(solutions) == 0:
+                    #kill two workers while they still have chunks assigned
+                    for process, _ in pool.__processes__[:2]:
+                        os.kill(process.pid, signal.SIGKILL)
+                solutions.append(solution)
+            self.assertEqual(solutions, self.solutions)
+
+    def testClosedSolveKeepsPoolUseable(self):
+        with sudokuPool.SolverPool(workers=2, chunkSize=4) as pool:
+            generator = pool.solve(self.sudokus)
+            self.assertEqual([next(generator) for _ in range(0, 5)], self.solutions[:5])
+            generator.close()
+            self.assertEqual(list(pool.solve(self.sudokus)), self.solutions)
+            self.assertEqual(dict(pool.solve(self.sudokus[:10], ordered=False)), dict(enumerate(self.solutions[:10])))
+
+    def testExceptionIsRaised(self):
+        with sudokuPool.SolverPool(workers=2, chunkSize=4) as pool:
+            with self.assertRaises(ValueError):
+                list(pool.solve(self.sudokus[:8], engine="unknown"))
+            self.assertEqual(list(pool.solve(self.sudokus[:8])), self.solutions[:8])
+
+if __name__ == '__main__':
+    unittest.main()
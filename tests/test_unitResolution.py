@@ -0,0 +1,42 @@
+#randomized cross-check of the unit-propagation of __WatchedCnf__ with the reference implementation __unitResolutionForSet__
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sudokuSolver
+
+
+class UnitResolutionTest(unittest.TestCase):
+
+    def testWatchedCnfAgreesWithReference(self):
+        generator = random.Random(2)
+        boxSize = 3
+        size = boxSize * boxSize
+        cnf = sudokuSolver.__getGeneralCnfIndex__(boxSize).cnf
+        for case in range(0, 200):
+            #random set fields, some of them contradict each other
+            units = set()
+            for _ in range(0, generator.randint(0, 15)):
+                units.add(sudokuSolver.__variable__(generator.randrange(size), generator.randrange(size), generator.randint(1, size), size))
+
+            reference = sudokuSolver.__unitResolutionForSet__(cnf, units)
+            referenceConflict = [] in reference
+            referenceUnits = {clause[0] for clause in reference if len(clause) == 1 and abs(clause[0]) <= size * size * size}
+
+            state = sudokuSolver.__acquireWatchedCnf__(boxSize)
+            try:
+                conflict = not all([state.enqueue(unit) for unit in units]) or not state.propagate(0)
+                watchedUnits = {lit for lit in state.trail if abs(lit) <= size * size * size}
+            finally:
+                sudokuSolver.__releaseWatchedCnf__(state)
+
+            self.assertEqual(conflict, referenceConflict, "case " + str(case))
+            if not conflict:
+                self.assertEqual(watchedUnits, referenceUnits, "case " + str(case))
+
+if __name__ == '__main__':
+    unittest.main()